@@ -1,70 +0,0 @@
-productos_mercado = {
-    "CLIGHT LIMO ROSA VITC+D 16X20X7,5G":{"ean": "7622201682026", "cod_dia": "139870", "cod_maso": "211288627", "cod_coope": "290249", "cod_lib": "485693"},
-    "CLIGHT ANANA 2022 16X20X7G":{"ean": "7622201702625", "cod_dia": "274279", "cod_maso": "205713645", "cod_coope": "293968", "cod_lib": "497220"},
-    "CLIGHT LIMONADA 2022 16X20X8G":{"ean": "7622201702656", "cod_dia": "274273", "cod_maso": "205713578", "cod_coope": "293975", "cod_lib": "497204"},
-    "CLIGHT NAR MANGO 2022 16X20X7G":{"ean": "7622201702687", "cod_dia": "274275", "cod_maso": "205713648", "cod_coope": "293974", "cod_lib": "497227"},
-    "CLIGHT NAR DURA 2022 16X20X7.5G":{"ean": "7622201702717", "cod_dia": "274274", "cod_maso": "205713650", "cod_coope": "293969", "cod_lib": "497188"},
-    "CLIGHT MAN VER 2022 16X20X7.5G":{"ean": "7622201703059", "cod_dia": "274277", "cod_maso": "205713654", "cod_coope": "", "cod_lib": "497189"},
-    "CLIGHT MANZ DELI 2022 16X20X7G":{"ean": "7622201703080", "cod_dia": "274216", "cod_maso": "205713641", "cod_coope": "284852", "cod_lib": "497228"},
-    "CLIGHT LIMO MARACUYA 16X20X7,5G":{"ean": "7622201733834", "cod_dia": "", "cod_maso": "102940397", "cod_coope": "", "cod_lib": "512082"},
-    "CLIGHT NARANJA 2022 16X20X8G":{"ean": "7622201703110", "cod_dia": "274217", "cod_maso": "205713576", "cod_coope": "293972", "cod_lib": "497205"},
-    "CLIGHT NAR DUL 2022 16X20X7.5G":{"ean": "7622201703141", "cod_dia": "274215", "cod_maso": "205713643", "cod_coope": "293971", "cod_lib": "497259"},
-    "CLIGHT POM ROSA 2022 16X20X8G":{"ean": "7622201703172", "cod_dia": "282436", "cod_maso": "205713577", "cod_coope": "284377", "cod_lib": "497206"},
-    "CLIGHT PERA 2022 16X20X7G":{"ean": "7622201703202", "cod_dia": "", "cod_maso": "205713652", "cod_coope": "", "cod_lib": "497208"},
-    "CLIGHT MANDARINA 2022 16X20X8G":{"ean": "7622201704148", "cod_dia": "274276", "cod_maso": "214180657", "cod_coope": "284862", "cod_lib": "497260"},
-    "CLIGHT LIMONADA ARANDANOS 16X20X8G":{"ean": "7622202236846", "cod_dia": "305575", "cod_maso": "103880452", "cod_coope": "", "cod_lib": "534034"},
-    "TANG FRUTILLA 12X20X15G":{"ean": "7622201746490", "cod_dia": "181248", "cod_maso": "214180673", "cod_coope": "", "cod_lib": "497170"},
-    "TANG NARANJA 12X20X15G":{"ean": "7622201705961", "cod_dia": "274179", "cod_maso": "214180674", "cod_coope": "294290", "cod_lib": "497171"},
-    "TANG MANZANA 12X20X15G":{"ean": "7622201705992", "cod_dia": "274181", "cod_maso": "214180676", "cod_coope": "284869", "cod_lib": "497172"},
-    "TANG NAR DULCE 12X20X15G":{"ean": "7622201735340", "cod_dia": "274180", "cod_maso": "214180677", "cod_coope": "294291", "cod_lib": "497173"},
-    "TANG NAR MANGO 12X20X15G":{"ean": "7622201735371", "cod_dia": "274182", "cod_maso": "214180678", "cod_coope": "284371", "cod_lib": "497174"},
-    "TANG LIMO DULCE 12X20X15G":{"ean": "7622201735685", "cod_dia": "274212", "cod_maso": "214180680", "cod_coope": "284372", "cod_lib": "497256"},
-    "TANG MULTIFRUTA 12X20X15G":{"ean": "7622201735715", "cod_dia": "274183", "cod_maso": "214180681", "cod_coope": "294293", "cod_lib": "497175"},
-    "TANG POM ROSA 12X20X15G":{"ean": "7622201735746", "cod_dia": "274211", "cod_maso": "214180682", "cod_coope": "294294", "cod_lib": "497176"},
-    "TANG NAR BANANA 12X20X15G":{"ean": "7622201735777", "cod_dia": "274184", "cod_maso": "214180685", "cod_coope": "294295", "cod_lib": "497177"},
-    "TANG NAR DURAZ 12X20X15G":{"ean": "7622201745707", "cod_dia": "", "cod_maso": "214180687", "cod_coope": "294296", "cod_lib": "497178"},
-    "TANG PERA 12X20X15G":{"ean": "7622201745738", "cod_dia": "", "cod_maso": "214180647", "cod_coope": "", "cod_lib": "497179"},
-    "TANG DURAZNO 12X20X15G":{"ean": "7622201745936", "cod_dia": "", "cod_maso": "214180688", "cod_coope": "", "cod_lib": "497257"},
-    "TANG MIX NAR LIM 12X20X15G":{"ean": "7622201746018", "cod_dia": "", "cod_maso": "213889542", "cod_coope": "", "cod_lib": "497180"},
-    "TANG UVA 12X20X15G":{"ean": "7622201746117", "cod_dia": "274214", "cod_maso": "214180648", "cod_coope": "", "cod_lib": "497182"},
-    "TANG ANANA 12X20X15G":{"ean": "7622201745967", "cod_dia": "274213", "cod_maso": "214180649", "cod_coope": "294302", "cod_lib": "497183"},
-    "TANG MANDARINA 12X20X15G":{"ean": "7622201733865", "cod_dia": "305576", "cod_maso": "103910385", "cod_coope": "315170", "cod_lib": "534033"},
-    "VERAO NARANJA 2022 16X20X7G":{"ean": "7622201717414", "cod_dia": "203847", "cod_maso": "214180659", "cod_coope": "", "cod_lib": "497142"},
-    "VERAO MANZANA 2022 16X20X7G":{"ean": "7622201717445", "cod_dia": "203850", "cod_maso": "214180660", "cod_coope": "", "cod_lib": "497274"},
-    "VERAO NARANJA DURAZNO 2022 16X20X7G":{"ean": "7622201717476", "cod_dia": "203849", "cod_maso": "214180661", "cod_coope": "", "cod_lib": "497275"},
-    "VERAO ANANA 2022 16X20X7G":{"ean": "7622201717506", "cod_dia": "203848", "cod_maso": "16541255", "cod_coope": "", "cod_lib": "497276"},
-    "ANILLOS CLASICOS 24X170G":{"ean": "7622201808884", "cod_dia": "274903", "cod_maso": "205576785", "cod_coope": "283896", "cod_lib": "473105"},
-    "ANILLOS CLASICOS 24X300G":{"ean": "7622201504007", "cod_dia": "", "cod_maso": "210779659", "cod_coope": "290099", "cod_lib": "486020"},
-    "BOCA DE DAMA 20X170G":{"ean": "7622201808860", "cod_dia": "274904", "cod_maso": "205576784", "cod_coope": "283897", "cod_lib": "473106"},
-    "DUQUESA TOONIX 36 PQ. X 115 GR":{"ean": "7622300742645", "cod_dia": "73265", "cod_maso": "3061867", "cod_coope": "186498", "cod_lib": "271938"},
-    "DUQUESA 12X345G ":{"ean": "7622202218729", "cod_dia": "3909", "cod_maso": "103825314", "cod_coope": "312520", "cod_lib": "528089"},
-    "DUQUESA PETIT 24X4x63G ":{"ean": "7622202220531", "cod_dia": "", "cod_maso": "", "cod_coope": "", "cod_lib": "0"},
-    "EXPRESS CLASICAS 45X103G":{"ean": "7622201388461", "cod_dia": "73911", "cod_maso": "102530372", "cod_coope": "", "cod_lib": "512163"},
-    "EXPRESS CLASICAS 15X309G":{"ean": "7622201388485", "cod_dia": "79047", "cod_maso": "102530381", "cod_coope": "", "cod_lib": "509622"},
-    "MELBA 12X360G TRIPACK":{"ean": "7794600004539", "cod_dia": "52289", "cod_maso": "208796339", "cod_coope": "100652", "cod_lib": "154091"},
-    "MELBA ANGRY BIRDS 36X120G":{"ean": "7622300829728", "cod_dia": "73264", "cod_maso": "3061740", "cod_coope": "219280", "cod_lib": "331887"},
-    "MELBA PETIT 24X4X65,5G ":{"ean": "7622202220517", "cod_dia": "", "cod_maso": "", "cod_coope": "", "cod_lib": "0"},
-    "GALLETA MILKA VAI 36X124G":{"ean": "7622202210051", "cod_dia": "", "cod_maso": "", "cod_coope": "", "cod_lib": "539857"},
-    "GALLETA MILKA CHOCO 36X124G":{"ean": "7622202210075", "cod_dia": "25357", "cod_maso": "0", "cod_coope": "316315", "cod_lib": "539858"},
-    "MINI OREO 54X50G ":{"ean": "7622201761288", "cod_dia": "175320", "cod_maso": "102535145", "cod_coope": "226274", "cod_lib": "527592"},
-    "MINI OREO WE 12X150G":{"ean": "7622202219337", "cod_dia": "", "cod_maso": "103705354", "cod_coope": "312234", "cod_lib": "528440"},
-    "OREO GOLDEN QI 12X354G":{"ean": "7622201806538", "cod_dia": "175319", "cod_maso": "205576609", "cod_coope": "284284", "cod_lib": "473556"},
-    "OREO GOLDEN QI 36X118G":{"ean": "7622201806552", "cod_dia": "283177", "cod_maso": "205576780", "cod_coope": "288807", "cod_lib": "473555"},
-    "OREO REGULAR 42X182,5G":{"ean": "7622201735821", "cod_dia": "271631", "cod_maso": "214300230", "cod_coope": "290492", "cod_lib": "503404"},
-    "OREO REG SINGLE 36X118G":{"ean": "7622201735296", "cod_dia": "271629", "cod_maso": "214300229", "cod_coope": "290324", "cod_lib": "503403"},
-    "OREO MILKSHAKE FRU 36X118G L13":{"ean": "7622202049057", "cod_dia": "", "cod_maso": "214300237", "cod_coope": "313958", "cod_lib": "533058"},
-    "OREO REG TRIPACK 12X354G":{"ean": "7622201735258", "cod_dia": "271630", "cod_maso": "214300231", "cod_coope": "290325", "cod_lib": "503405"},
-    "PEPITOS REG SINGLE 60X119G":{"ean": "7622201735906", "cod_dia": "271628", "cod_maso": "214300238", "cod_coope": "290331", "cod_lib": "503406"},
-    "TERRA CCC 24X144G ":{"ean": "7622201385279", "cod_dia": "276517", "cod_maso": "102530388", "cod_coope": "285272", "cod_lib": "507326"},
-    "TERRABUSI SCONS 36X160G":{"ean": "7622201491611", "cod_dia": "276518", "cod_maso": "207046866", "cod_coope": "", "cod_lib": "476897"},
-    "GALLETA TERRABUSI VAINILLA 60X120G":{"ean": "7622202220555", "cod_dia": "304513", "cod_maso": "103825313", "cod_coope": "", "cod_lib": "529175"},
-    "GALLETA TERRABUSI MIEL 60X120G":{"ean": "7622202220579", "cod_dia": "304512", "cod_maso": "103825312", "cod_coope": "", "cod_lib": "529176"},
-    "MINI PEPITOS 54X50G":{"ean": "7622201740399", "cod_dia": "176893", "cod_maso": "214300240", "cod_coope": "267151", "cod_lib": "507763"},
-    "PEPITOS REG TRIPACK 20X357G":{"ean": "7622201735883", "cod_dia": "271632", "cod_maso": "214300239", "cod_coope": "290330", "cod_lib": "505125"},
-    "LINCOLN CLASICAS 2023 PN 60X153G":{"ean": "7622201386719", "cod_dia": "", "cod_maso": "103705353", "cod_coope": "", "cod_lib": "529333"},
-    "LINCOLN CLASICAS 2023 60X153G":{"ean": "7622201745523", "cod_dia": "169935", "cod_maso": "", "cod_coope": "", "cod_lib": "0"},
-    "LINCOLN CLASICA TRIPACK 2023 20X459":{"ean": "7622201745547", "cod_dia": "170177", "cod_maso": "214300243", "cod_coope": "219298", "cod_lib": "507787"},
-    "LINCOLN CHOCO 60X153G":{"ean": "7622300742676", "cod_dia": "27042", "cod_maso": "3040904", "cod_coope": "186094", "cod_lib": "271825"},
-    "LINCOLN COCO 60X153G":{"ean": "7622300742713", "cod_dia": "131020", "cod_maso": "102985267", "cod_coope": "", "cod_lib": "271829"},
-    "VARIEDAD NUEVO MIX 2023 16X590G":{"ean": "7622201745585", "cod_dia": "284655", "cod_maso": "214300244", "cod_coope": "290328", "cod_lib": "503407"},
-}
\ No newline at end of file
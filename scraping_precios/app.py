@@ -1,7 +1,11 @@
 
+import os
 import streamlit as st
+import pandas as pd
 from datetime import datetime
 
+import metricas
+
 # ----------------------------
 # Config
 # ----------------------------
@@ -24,6 +28,15 @@ def _fmt_dt(dt):
     except Exception:
         return str(dt)
 
+def _etiqueta_metricas(ruta):
+    """'20261018-101500_dinamicas_coto.json' -> '18/10 10:15 · dinamicas · coto'"""
+    fecha, _, resto = os.path.basename(ruta)[:-len(".json")].partition("_")
+    try:
+        fecha = datetime.strptime(fecha, "%Y%m%d-%H%M%S").strftime("%d/%m %H:%M")
+    except ValueError:
+        pass
+    return " · ".join([fecha] + resto.split("_"))
+
 last_run_at = st.session_state.get("last_run_at", None)
 last_run_ok = st.session_state.get("last_run_ok", True)
 skus_count = st.session_state.get("skus_count", "—")
@@ -144,6 +157,33 @@ with st.sidebar:
     st.caption(f"Versión: {APP_VERSION}")
     st.caption(f"Última corrida: {_fmt_dt(last_run_at)}")
 
+    # Métricas de requests de las últimas corridas (JSON que deja cada corrida, ver metricas.py)
+    st.divider()
+    st.subheader("📡 Requests")
+    archivos = metricas.recientes()[:20]
+    if not archivos:
+        st.caption("Todavía no hay corridas con métricas guardadas.")
+    else:
+        por_etiqueta = {_etiqueta_metricas(ruta): ruta for ruta in archivos}
+        elegida = st.selectbox("Corrida", list(por_etiqueta), label_visibility="collapsed")
+        try:
+            doc = metricas.leer(por_etiqueta[elegida])
+        except (OSError, ValueError):
+            doc = None
+        if not doc or not doc.get("filas"):
+            st.caption("Sin requests registrados en esa corrida.")
+        else:
+            tabla = pd.DataFrame(doc["filas"])
+            tabla["status"] = tabla["status"].map(lambda d: " ".join(f"{k}×{v}" for k, v in d.items()))
+            tabla = tabla.rename(columns={
+                "cadena": "Cadena", "tipo": "Endpoint", "requests": "N", "p50_ms": "p50", "p95_ms": "p95",
+                "p99_ms": "p99", "error_pct": "Error %", "kb": "KB", "reintentos": "Reint.", "status": "Status",
+            })
+            st.dataframe(tabla, hide_index=True, use_container_width=True)
+            total = int(tabla["N"].sum())
+            duracion = f" en {doc['segundos']:.1f}s" if doc.get("segundos") else ""
+            st.caption(f"{doc['pagina']} · {doc['cadena']}: {total} requests{duracion} · latencias en ms")
+
 # ----------------------------
 # Hero Section
 # ----------------------------
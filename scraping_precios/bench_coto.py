@@ -0,0 +1,185 @@
+# bench_coto.py
+# Benchmark del parseo de respuestas Endeca de Coto: find_key_recursive por clave (antes)
+# vs. IndiceEndeca de una pasada (ahora), sobre respuestas grabadas.
+#
+#   python bench_coto.py grabar [--n 30] [--sucursal 200] [--dir DIR]   # baja búsqueda + detalle de n EANs
+#   python bench_coto.py medir [--dir DIR] [--repeticiones 20]
+#
+# Las respuestas se guardan como JSON tal cual vienen (busqueda_<ean>.json / detalle_<ean>.json).
+
+import argparse
+import glob
+import json
+import os
+import time
+
+import coto
+from resolucion import CACHE_DIR
+
+DIR_DEFAULT = os.path.join(CACHE_DIR, "coto_respuestas")
+
+
+# --------------------------------------------
+# Parseo anterior (una recorrida completa por clave y por record)
+# --------------------------------------------
+def find_key_recursive(obj, key):
+    if isinstance(obj, dict):
+        if key in obj:
+            return obj[key]
+        for v in obj.values():
+            r = find_key_recursive(v, key)
+            if r is not None:
+                return r
+    elif isinstance(obj, list):
+        for it in obj:
+            r = find_key_recursive(it, key)
+            if r is not None:
+                return r
+    return None
+
+
+def iter_records(node):
+    if isinstance(node, dict):
+        if any(k in node for k in coto.CLAVES_RECORD):
+            yield node
+        for v in node.values():
+            yield from iter_records(v)
+    elif isinstance(node, list):
+        for it in node:
+            yield from iter_records(it)
+
+
+def busqueda_antes(data, ean):
+    for rec in iter_records(data):
+        e = coto.coerce_first(find_key_recursive(rec, "product.eanPrincipal"))
+        if str(e) == str(ean):
+            rid = coto.coerce_first(find_key_recursive(rec, "record.id"))
+            name = coto.coerce_first(find_key_recursive(rec, "product.displayName")) \
+                or coto.coerce_first(find_key_recursive(rec, "record.title"))
+            return rid, name
+    return None, None
+
+
+def detalle_antes(data):
+    out = {k: coto.coerce_first(find_key_recursive(data, k))
+           for k in ("product.eanPrincipal", "product.displayName", "product.dtoDescuentos")}
+    out["precio"] = next(
+        (p for p in (coto.coerce_first(find_key_recursive(data, k)) for k in coto.CLAVES_PRECIO) if p is not None),
+        None,
+    )
+    return out
+
+
+# --------------------------------------------
+# Parseo actual (IndiceEndeca)
+# --------------------------------------------
+def busqueda_ahora(data, ean):
+    idx = coto.IndiceEndeca(data, ean=ean)
+    rec = idx.record_por_ean(ean)
+    if rec is None:
+        return None, None
+    return idx.valor("record.id", rec), idx.valor("product.displayName", rec) or idx.valor("record.title", rec)
+
+
+def detalle_ahora(data):
+    idx = coto.IndiceEndeca(data, hasta=coto.CLAVES_DETALLE + ("product.dtoDescuentos",))
+    out = {k: idx.valor(k) for k in ("product.eanPrincipal", "product.displayName", "product.dtoDescuentos")}
+    out["precio"] = idx.precio(lambda v: v)
+    return out
+
+
+# --------------------------------------------
+# Comandos
+# --------------------------------------------
+def grabar(directorio: str, n: int, sucursal: str):
+    import requests
+    from corrida import cargar_catalogo
+
+    productos = cargar_catalogo("coto")
+
+    os.makedirs(directorio, exist_ok=True)
+    session = requests.Session()
+    session.headers.update(coto.HEADERS_COTO)
+    cliente = coto.CotoClient(session, sucursal)
+
+    eans = [str((m or {}).get("ean") or "").strip() for m in productos.values()]
+    eans = [e for e in eans if e][:n]
+    for ean in eans:
+        params = {"Dy": "1", "Ntt": ean, "Ntk": "product.eanPrincipal", "idSucursal": sucursal, "format": "json"}
+        r = cliente.get(f"{coto.BASE}/sitios/cdigi/categoria", params=params)
+        if r.status_code != 200:
+            print(f"{ean}: búsqueda HTTP {r.status_code}")
+            continue
+        data = r.json()
+        with open(os.path.join(directorio, f"busqueda_{ean}.json"), "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+
+        rid, _ = busqueda_ahora(data, ean)
+        if not rid:
+            continue
+        r2 = cliente.get(f"{coto.BASE}/sitios/cdigi/productos/_/R-{rid}", params={"Dy": "1", "idSucursal": sucursal, "format": "json"})
+        if r2.status_code == 200:
+            with open(os.path.join(directorio, f"detalle_{ean}.json"), "w", encoding="utf-8") as f:
+                json.dump(r2.json(), f, ensure_ascii=False)
+    print(f"{len(eans)} EANs grabados en {directorio} · {cliente.resumen()}")
+
+
+def _tiempo(fn, casos, repeticiones):
+    t0 = time.perf_counter()
+    for _ in range(repeticiones):
+        for caso in casos:
+            fn(*caso)
+    return (time.perf_counter() - t0) / max(1, repeticiones * len(casos))
+
+
+def medir(directorio: str, repeticiones: int):
+    busquedas, detalles = [], []
+    for path in sorted(glob.glob(os.path.join(directorio, "*.json"))):
+        nombre = os.path.basename(path)
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        ean = nombre.rsplit("_", 1)[-1][:-len(".json")]
+        if nombre.startswith("busqueda_"):
+            busquedas.append((data, ean))
+        elif nombre.startswith("detalle_"):
+            detalles.append((data,))
+
+    if not busquedas and not detalles:
+        print(f"No hay respuestas grabadas en {directorio} (usar: python bench_coto.py grabar)")
+        return
+
+    # Mismo resultado con los dos parseos
+    distintos = sum(busqueda_antes(*c) != busqueda_ahora(*c) for c in busquedas)
+    distintos += sum(detalle_antes(*c) != detalle_ahora(*c) for c in detalles)
+
+    print(f"{len(busquedas)} búsquedas · {len(detalles)} detalles · {repeticiones} repeticiones · diferencias: {distintos}")
+    for tipo, casos, antes, ahora in (
+        ("búsqueda", busquedas, busqueda_antes, busqueda_ahora),
+        ("detalle", detalles, detalle_antes, detalle_ahora),
+    ):
+        if not casos:
+            continue
+        t_antes = _tiempo(antes, casos, repeticiones)
+        t_ahora = _tiempo(ahora, casos, repeticiones)
+        print(
+            f"{tipo:9s} antes {t_antes * 1e3:8.3f} ms/doc · ahora {t_ahora * 1e3:8.3f} ms/doc"
+            f" · x{t_antes / max(t_ahora, 1e-12):.1f}"
+        )
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Benchmark del parseo de respuestas de Coto")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    g = sub.add_parser("grabar")
+    g.add_argument("--dir", default=DIR_DEFAULT)
+    g.add_argument("--n", type=int, default=30)
+    g.add_argument("--sucursal", default="200")
+    m = sub.add_parser("medir")
+    m.add_argument("--dir", default=DIR_DEFAULT)
+    m.add_argument("--repeticiones", type=int, default=20)
+    args = ap.parse_args()
+
+    if args.cmd == "grabar":
+        grabar(args.dir, args.n, args.sucursal)
+    else:
+        medir(args.dir, args.repeticiones)
@@ -0,0 +1,117 @@
+# bench_inicio.py
+# Tiempo de arranque de cada página: un proceso nuevo por medición que corre la página con
+# AppTest (primera corrida = abrirla en frío, segunda = un rerun) sin tocar ningún botón.
+# "catálogo" es la parte de la primera corrida que se va en los productos: carga + vistas de
+# catalogo.py o, en una copia anterior al catálogo único, el import de los listado_*.py
+# (-X importtime).
+#
+#   python bench_inicio.py [--repeticiones 5]                 # con el snapshot del catálogo
+#   python bench_inicio.py --sin-snapshot                     # catálogo desde catalogo.json
+#   python bench_inicio.py --raiz /tmp/antes --sin-pyc        # otra copia de la app (ej. un commit anterior)
+#
+# --sin-pyc borra los __pycache__ de la app antes de cada proceso (primer arranque tras un deploy).
+
+import argparse
+import glob
+import json
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+
+# Módulos de productos de antes del catálogo único
+RE_LISTADOS = re.compile(r"listado_\w+|productos_streamlit|consolidado_comparativos")
+
+MEDIR = """
+import json, sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+t1 = time.perf_counter()
+en_vistas = [0.0]
+try:
+    import catalogo
+except ImportError:
+    catalogo = None
+else:
+    vista = catalogo.Catalogo.vista
+
+    def _vista(self, nombre):
+        t = time.perf_counter()
+        try:
+            return vista(self, nombre)
+        finally:
+            en_vistas[0] += time.perf_counter() - t
+
+    catalogo.Catalogo.vista = _vista
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+at.run()
+t2 = time.perf_counter()
+cat = en_vistas[0] + (catalogo._catalogo.carga[1] / 1000 if catalogo and catalogo._catalogo else 0.0)
+at.run()
+t3 = time.perf_counter()
+print(json.dumps({"primera": t2 - t1, "rerun": t3 - t2, "catalogo": cat, "errores": len(at.exception)}))
+"""
+
+
+def _listados_importados(importtime: str) -> float:
+    """Segundos (self) de importar los listados, del stderr de python -X importtime."""
+    total = 0
+    for linea in importtime.splitlines():
+        partes = linea.split("|")
+        if linea.startswith("import time:") and len(partes) == 3 and RE_LISTADOS.fullmatch(partes[2].strip()):
+            total += int(partes[0].split(":")[1])
+    return total / 1e6
+
+
+def medir_pagina(raiz: str, pagina: str, env: dict, sin_pyc: bool) -> dict:
+    if sin_pyc:
+        for d in glob.glob(os.path.join(raiz, "**", "__pycache__"), recursive=True):
+            shutil.rmtree(d, ignore_errors=True)
+    t0 = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", MEDIR, pagina],
+        cwd=raiz, env=env, capture_output=True, text=True, check=True,
+    )
+    medida = json.loads(out.stdout.strip().splitlines()[-1])
+    medida["proceso"] = time.perf_counter() - t0
+    medida["catalogo"] += _listados_importados(out.stderr)
+    return medida
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Tiempo de arranque de cada página")
+    ap.add_argument("--raiz", default=RAIZ, help="Carpeta de la app (la que tiene pages/)")
+    ap.add_argument("--repeticiones", type=int, default=5)
+    ap.add_argument("--sin-snapshot", action="store_true", help="Leer el catálogo de catalogo.json")
+    ap.add_argument("--sin-pyc", action="store_true", help="Borrar los __pycache__ de la app antes de cada medición")
+    args = ap.parse_args(argv)
+
+    raiz = os.path.abspath(args.raiz)
+    env = dict(os.environ, PYTHONPATH=raiz)
+    if args.sin_snapshot:
+        env["SCRAPING_PRECIOS_CATALOGO_SNAPSHOT"] = "0"
+
+    paginas = sorted(glob.glob(os.path.join(raiz, "pages", "*.py")))
+    # una corrida descartada: deja compilado el snapshot / los .pyc que correspondan
+    medir_pagina(raiz, paginas[0], env, args.sin_pyc)
+
+    print(f"{'página':20s} {'catálogo':>9s} {'1ra corrida':>12s} {'rerun':>7s} {'proceso':>8s}   (mediana de {args.repeticiones}, ms)")
+    for pagina in paginas:
+        medidas = [medir_pagina(raiz, pagina, env, args.sin_pyc) for _ in range(args.repeticiones)]
+        med = {k: 1000 * statistics.median(m[k] for m in medidas) for k in ("catalogo", "primera", "rerun", "proceso")}
+        errores = max(m["errores"] for m in medidas)
+        aviso = f"  ⚠️ {errores} excepciones" if errores else ""
+        nombre = os.path.basename(pagina)
+        print(
+            f"{nombre:20s} {med['catalogo']:9.1f} {med['primera']:12.0f} {med['rerun']:7.0f} {med['proceso']:8.0f}{aviso}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
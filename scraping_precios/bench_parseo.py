@@ -0,0 +1,404 @@
+# bench_parseo.py
+# Micro-benchmark de los helpers de parseo que corren por fila (miles de veces por escaneo),
+# sobre payloads armados con la forma de las respuestas reales: búsquedas VTEX con varios items
+# y referenceId, commertialOffer con teasers, respuestas Endeca de Coto (búsqueda y detalle),
+# dtoDescuentos, datos de promo de Cooperativa y precios en los formatos que devuelven las tiendas.
+#
+#   python bench_parseo.py                         # mide y compara contra la base del repo
+#   python bench_parseo.py --guardar               # mide y reemplaza la base (commitearla con el cambio)
+#   python bench_parseo.py --solo cast_price,coto  # solo los helpers que contienen esos textos
+#
+# Cada helper se mide como timeit: el mínimo de --repeticiones pasadas sobre todos sus casos,
+# con el GC apagado. Para comparar entre máquinas o días se guarda también el tiempo relativo a
+# una carga de referencia de Python puro, medida alternada con cada helper. Si un helper queda
+# más de --umbral (25%) más lento que la base (confirmado midiéndolo otra vez), devuelve otra
+# cosa que en la base o no está en la base, sale con código 1; sin archivo de base, con código 2.
+# La base (bench_parseo_base.json) va en el repo, al lado de este archivo.
+# find_key_recursive / iter_records ya no están en las páginas: su trabajo lo hace coto.IndiceEndeca.
+
+import argparse
+import gc
+import hashlib
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+import coto
+import dinamicas
+import mercado
+import relevamiento
+from corrida import format_ar_price_no_thousands
+
+BASE_DEFAULT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_parseo_base.json")
+UMBRAL = 0.25
+OBJETIVO_S = 0.05  # duración mínima de cada pasada medida
+CONFIRMAR = 2      # mediciones extra: de un helper que pasó el umbral, y al guardar la base (mediana)
+
+# Payloads deterministas: cada helper arma sus casos desde la misma semilla (con o sin --solo)
+SEMILLA = 22
+_rnd = random.Random(SEMILLA)
+
+
+# --------------------------------------------
+# Payloads
+# --------------------------------------------
+def _ean() -> str:
+    return "779" + "".join(str(_rnd.randint(0, 9)) for _ in range(10))
+
+
+TEASERS = (
+    "PROMO-2do al 70% Max 8 unidades SURTIDO NACIONAL",
+    "PROMO-3x2 en Gaseosas Max 12 unidades",
+    "Tarjeta Carrefour 15% de descuento",
+    "PROMO-2da al 50% LLEVANDO 2 Reg 1234",
+    "Precio especial online",
+)
+
+
+def _commertial_offer(teasers: int) -> dict:
+    precio = round(_rnd.uniform(300, 9000), 2)
+    return {
+        "DeliverySlaSamplesPerRegion": {"0": {"DeliverySlaPerTypes": [], "Region": None}},
+        "Installments": [{"Value": precio, "InterestRate": 0.0, "TotalValuePlusInterestRate": precio,
+                          "NumberOfInstallments": 1, "PaymentSystemName": "Visa", "Name": "Visa à vista"}
+                         for _ in range(4)],
+        "DiscountHighLight": [],
+        "Teasers": [],
+        "PromotionTeasers": [{"Name": _rnd.choice(TEASERS), "Conditions": {"MinimumQuantity": 0, "Parameters": []},
+                              "Effects": {"Parameters": [{"Name": "PercentualDiscount", "Value": "70"}]}}
+                             for _ in range(teasers)],
+        "Price": precio,
+        "ListPrice": round(precio * _rnd.choice((1, 1, 1.25)), 2),
+        "PriceWithoutDiscount": precio,
+        "RewardValue": 0,
+        "PriceValidUntil": "2027-10-18T00:00:00Z",
+        "AvailableQuantity": 10000,
+        "IsAvailable": True,
+        "Tax": 0,
+    }
+
+
+def _item_vtex(ean: str, ean_en_referencia: bool) -> dict:
+    return {
+        "itemId": str(_rnd.randint(10000, 999999)),
+        "name": "Producto de prueba 500 g",
+        "nameComplete": "Producto de prueba 500 g",
+        "ean": "" if ean_en_referencia else ean,
+        "referenceId": [{"Key": "RefId", "Value": ean if ean_en_referencia else str(_rnd.randint(1000, 99999))}],
+        "measurementUnit": "un",
+        "unitMultiplier": 1.0,
+        "images": [{"imageId": str(i), "imageUrl": f"https://x.vteximg.com.br/arquivos/ids/{i}.jpg"} for i in range(3)],
+        "sellers": [{"sellerId": "1", "sellerName": "Tienda", "sellerDefault": True,
+                     "commertialOffer": _commertial_offer(_rnd.choice((0, 0, 1, 2)))}],
+    }
+
+
+def casos_items() -> list:
+    """(items, ean): el EAN en el primer item, en el último, solo en referenceId o en ninguno."""
+    casos = []
+    for i in range(60):
+        ean = _ean()
+        n = _rnd.choice((1, 1, 1, 2, 3, 6))
+        items = [_item_vtex(_ean(), False) for _ in range(n)]
+        donde = i % 4
+        if donde == 0:
+            items[0] = _item_vtex(ean, False)
+        elif donde == 1:
+            items[-1] = _item_vtex(ean, False)
+        elif donde == 2:
+            items[-1] = _item_vtex(ean, True)
+        casos.append((items, ean))
+    return casos
+
+
+def casos_offers() -> list:
+    return [(_commertial_offer(t),) for t in (0, 1, 1, 2, 3) * 12]
+
+
+def casos_precios() -> list:
+    """Precios como vienen de Coto / VTEX / la Coope: float, int, '1.795,00', '$1126.72c/u', vacíos."""
+    valores = []
+    for _ in range(40):
+        p = round(_rnd.uniform(50, 250000), 2)
+        entero, dec = f"{p:.2f}".split(".")
+        miles = f"{int(entero):,}".replace(",", ".")
+        valores += [
+            p, int(p), f"{p:.2f}", f"{miles},{dec}", f"${p:.2f}c/u", f"{entero},{dec}", f" {p:.2f} ",
+        ]
+    valores += [None, "", "sin precio", "c\\u002fu"]
+    return [(v,) for v in valores]
+
+
+def casos_formato() -> list:
+    return [(v,) for v in [None] + [round(_rnd.uniform(10, 500000), _rnd.choice((0, 2))) for _ in range(200)]]
+
+
+DESCUENTOS = ("70% 2da", "2x1", "35% Dto", "3x2 Surtido", "", "Precio Exclusivo Online")
+
+
+def _dto(n: int, vacio_primero: bool) -> list:
+    promos = [{"textoDescuento": "" if (vacio_primero and i == 0) else _rnd.choice(DESCUENTOS),
+               "fechaInicio": "2026-10-01", "fechaFin": "2026-10-31", "tipo": "%", "idPromocion": _rnd.randint(1, 9999)}
+              for i in range(n)]
+    return [json.dumps(promos)]
+
+
+def casos_dto() -> list:
+    casos = [(_dto(_rnd.randint(1, 4), i % 3 == 0),) for i in range(60)]
+    casos += [(None,), ([],), (["[]"],), (["no es json"],), ('{"textoDescuento": "2x1"}',)]
+    return casos
+
+
+def casos_textos() -> list:
+    textos = [
+        "Llevando 3 unidades 3x2 en toda la línea", "2da al 70% Reg 1234 SURTIDO", "2do al 50% Max 8 unidades",
+        "PROMO 4 x 2 en cervezas", "35% off en la segunda unidad", "Precio especial online",
+        "2DA AL 80% NACIONAL LLEVANDO 2", "", "Combinable con Tarjeta Carrefour 15%", "Oferta semanal",
+    ]
+    return [(t,) for t in textos * 6]
+
+
+def casos_coope() -> list:
+    casos = []
+    for _ in range(60):
+        precio = round(_rnd.uniform(100, 9000), 2)
+        tipo = _rnd.randint(0, 5)
+        datos = {
+            "cod_interno": str(_rnd.randint(1000, 99999)),
+            "descripcion": "Producto de prueba x 500 g",
+            "precio": str(precio),
+            "precio_anterior": str(round(precio * 1.3, 2)) if tipo == 2 else "",
+            "existe_promo": "0" if tipo == 0 else _rnd.choice(("1", "true", "S")),
+            "cantidad_promo": str(_rnd.choice((2, 3, 4))) if tipo == 1 else "",
+            "descuento_porcentaje_promo": "" if tipo != 1 else str(round(100 / _rnd.choice((2, 3, 4)), 2)),
+            "descripcion_promo": ("LLEVANDO 2 la 2da al 70%", "3x2 en toda la línea", "25% de descuento", "")[tipo % 4],
+            "precio_promo": str(round(precio * 0.8, 2)) if tipo == 5 else "",
+        }
+        casos.append((datos,))
+    return casos + [(None,), ({},)]
+
+
+def _atributos(ean: str, extra: int) -> dict:
+    precio = round(_rnd.uniform(300, 9000), 2)
+    attrs = {f"product.attr{i}": [f"valor {i}"] for i in range(extra)}
+    attrs.update({
+        "record.id": [f"sku{_rnd.randint(10000000, 99999999)}"],
+        "product.repositoryId": [f"prod{_rnd.randint(10000000, 99999999)}"],
+        "product.displayName": ["Producto de prueba x 500 gr"],
+        "product.eanPrincipal": [ean],
+        "product.brand": ["MARCA"],
+        "sku.activePrice": [f"{precio:.6f}"],
+        "sku.referencePrice": [f"{precio * 2:.2f}"],
+        "product.dtoDescuentos": _dto(_rnd.randint(0, 2), False),
+        "sku.quantity": ["1"],
+    })
+    return attrs
+
+
+def _endeca(records: list) -> dict:
+    """Forma de una respuesta Endeca de Coto: navegación, breadcrumbs y los records anidados."""
+    return {
+        "@type": "ContentSlotMain",
+        "canonicalLink": {"path": "/sitios/cdigi/categoria"},
+        "contents": [{
+            "@type": "OneColumnPage",
+            "Main": [
+                {"@type": "Breadcrumbs", "refinementCrumbs": [{"label": f"crumb {i}", "count": i} for i in range(5)]},
+                {"@type": "GuidedNavigation", "navigation": [
+                    {"name": f"dim{i}", "refinements": [{"label": f"r{j}", "count": j, "properties": {"DGraph.Spec": f"{i}:{j}"}}
+                                                        for j in range(8)]} for i in range(6)]},
+                {"@type": "ResultsList", "totalNumRecs": len(records), "records": [
+                    {"attributes": {k: v for k, v in r.items() if not k.startswith("sku.")},
+                     "records": [{"attributes": r, "numRecords": 1}], "numRecords": 1} for r in records]},
+            ],
+        }],
+    }
+
+
+def casos_coto_busqueda() -> list:
+    """(data, ean): búsquedas por EAN con 1 a 24 records; el buscado en cualquier posición o ausente."""
+    casos = []
+    for i in range(24):
+        eans = [_ean() for _ in range(_rnd.choice((1, 1, 4, 12, 24)))]
+        ean = _rnd.choice(eans) if i % 6 else _ean()
+        casos.append((_endeca([_atributos(e, 30) for e in eans]), ean))
+    return casos
+
+
+def casos_coto_detalle() -> list:
+    return [(_endeca([_atributos(_ean(), 60)]),) for _ in range(24)]
+
+
+# --------------------------------------------
+# Helpers medidos
+# --------------------------------------------
+def coto_busqueda(data, ean):
+    idx = coto.IndiceEndeca(data, ean=ean)
+    rec = idx.record_por_ean(ean)
+    if rec is None:
+        return None, None
+    return idx.valor("record.id", rec), idx.valor("product.displayName", rec) or idx.valor("record.title", rec)
+
+
+def coto_detalle(data):
+    idx = coto.IndiceEndeca(data, hasta=coto.CLAVES_DETALLE + ("product.dtoDescuentos",))
+    return idx.valor("product.eanPrincipal"), idx.valor("product.displayName"), idx.precio(dinamicas.cast_price)
+
+
+# (nombre, función, casos)
+HELPERS = [
+    ("dinamicas.cast_price", dinamicas.cast_price, casos_precios),
+    ("mercado.cast_price", mercado.cast_price, casos_precios),
+    ("relevamiento.cast_price", relevamiento.cast_price, casos_precios),
+    ("coto.IndiceEndeca búsqueda (find_key_recursive / iter_records)", coto_busqueda, casos_coto_busqueda),
+    ("coto.IndiceEndeca detalle (find_key_recursive)", coto_detalle, casos_coto_detalle),
+    ("dinamicas.extract_texto_descuento_from_dto_descuentos", dinamicas.extract_texto_descuento_from_dto_descuentos, casos_dto),
+    ("dinamicas.simplify_offer_text", dinamicas.simplify_offer_text, casos_textos),
+    ("dinamicas.extract_oferta", dinamicas.extract_oferta, casos_coope),
+    ("dinamicas._extract_teaser_text", dinamicas._extract_teaser_text, casos_offers),
+    ("dinamicas.pick_item_by_ean", dinamicas.pick_item_by_ean, casos_items),
+    ("mercado.pick_item_by_ean", mercado.pick_item_by_ean, casos_items),
+    ("corrida.format_ar_price_no_thousands", format_ar_price_no_thousands, casos_formato),
+]
+
+
+def _referencia(n):
+    """Carga fija de Python puro (strings, dicts, floats): la vara para normalizar entre máquinas."""
+    d = {}
+    for i in range(n):
+        s = f"{i * 1.5:.2f}".replace(".", ",")
+        d[s] = float(s.replace(",", ".")) + len(d)
+    return len(d)
+
+
+# --------------------------------------------
+# Medición
+# --------------------------------------------
+def _pasada(fn, casos, vueltas) -> float:
+    t0 = time.perf_counter()
+    for _ in range(vueltas):
+        for caso in casos:
+            fn(*caso)
+    return time.perf_counter() - t0
+
+
+def _vueltas(fn, casos) -> int:
+    """Vueltas sobre los casos para que una pasada dure al menos OBJETIVO_S."""
+    vueltas = 1
+    while _pasada(fn, casos, vueltas) < OBJETIVO_S / 5:
+        vueltas *= 2
+    return max(1, int(vueltas * OBJETIVO_S / max(_pasada(fn, casos, vueltas), 1e-9)))
+
+
+def medir_helper(fn, casos, repeticiones: int) -> tuple:
+    """
+    (ns por llamada, ns de la referencia): mínimo de `repeticiones` pasadas de cada uno, alternando
+    helper y referencia para que los dos caigan en la misma ventana de ruido de la máquina.
+    """
+    vueltas = _vueltas(fn, casos)
+    ref = [(100,)]
+    vueltas_ref = _vueltas(_referencia, ref)
+    gc_activo = gc.isenabled()
+    gc.disable()
+    try:
+        t_fn, t_ref = [], []
+        for _ in range(repeticiones):
+            t_fn.append(_pasada(fn, casos, vueltas))
+            t_ref.append(_pasada(_referencia, ref, vueltas_ref))
+    finally:
+        if gc_activo:
+            gc.enable()
+    return 1e9 * min(t_fn) / (vueltas * len(casos)), 1e9 * min(t_ref) / vueltas_ref
+
+
+def huella(fn, casos) -> str:
+    """sha1 de los resultados: si cambia, el helper ya no devuelve lo mismo que en la base."""
+    h = hashlib.sha1()
+    for caso in casos:
+        h.update(repr(fn(*caso)).encode("utf-8"))
+    return h.hexdigest()[:12]
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Micro-benchmark de los helpers de parseo")
+    ap.add_argument("--repeticiones", type=int, default=9)
+    ap.add_argument("--solo", help="Lista separada por comas: mide los helpers cuyo nombre contiene alguno")
+    ap.add_argument("--base", default=BASE_DEFAULT, help="Base contra la que comparar")
+    ap.add_argument("--guardar", nargs="?", const=BASE_DEFAULT, help="Guardar los resultados como base (por defecto, --base)")
+    ap.add_argument("--umbral", type=float, default=UMBRAL, help="Regresión tolerada, relativa a la base (0.25 = 25%%)")
+    args = ap.parse_args(argv)
+
+    base = {}
+    if not args.guardar:
+        if not os.path.exists(args.base):
+            print(f"✖ No hay base en {args.base}: generarla con --guardar", file=sys.stderr)
+            return 2
+        with open(args.base, encoding="utf-8") as f:
+            base = json.load(f)["helpers"]
+    filtros = [s.strip() for s in (args.solo or "").split(",") if s.strip()]
+
+    print(f"mínimo de {args.repeticiones} · umbral {args.umbral:.0%}"
+          + (f" · base {args.base}" if base else " · sin base"))
+    print(f"{'helper':62s} {'casos':>5s} {'ns/llamada':>11s} {'relativo':>9s}{'   vs base' if base else ''}")
+
+    resultados, problemas = {}, []
+    for nombre, fn, armar in HELPERS:
+        if filtros and not any(f in nombre for f in filtros):
+            continue
+        _rnd.seed(SEMILLA)
+        casos = armar()
+        ns, ref_ns = medir_helper(fn, casos, args.repeticiones)
+        if args.guardar:
+            # La base queda con la mediana de varias mediciones: una referencia lenta justo en la
+            # única medición dejaría una base demasiado rápida y falsas regresiones después
+            medidas = [(ns, ref_ns)] + [medir_helper(fn, casos, args.repeticiones) for _ in range(CONFIRMAR)]
+            ns, ref_ns = sorted(medidas, key=lambda m: m[0] / m[1])[len(medidas) // 2]
+        previo = base.get(nombre)
+        for _ in range(CONFIRMAR):
+            if not previo or (ns / ref_ns) / previo["relativo"] - 1 <= args.umbral:
+                break
+            # Pasado el umbral: se vuelve a medir y queda la mejor (el ruido no se repite, una regresión sí)
+            otra = medir_helper(fn, casos, args.repeticiones)
+            if otra[0] / otra[1] < ns / ref_ns:
+                ns, ref_ns = otra
+        resultados[nombre] = {"casos": len(casos), "ns": round(ns, 1), "relativo": round(ns / ref_ns, 5),
+                              "referencia_ns": round(ref_ns, 1),
+                              "huella": huella(fn, casos)}
+        linea = f"{nombre:62s} {len(casos):5d} {ns:11.0f} {ns / ref_ns:9.4f}"
+        if base and not previo:
+            linea += "  ← SIN BASE"
+            problemas.append(f"{nombre}: no está en la base (volver a guardarla con --guardar)")
+        if previo:
+            cambio = (ns / ref_ns) / previo["relativo"] - 1
+            linea += f"   {100 * cambio:+6.1f}%"
+            if cambio > args.umbral:
+                linea += "  ← REGRESIÓN"
+                problemas.append(f"{nombre}: {100 * cambio:+.1f}% más lento que la base")
+            if previo.get("huella") and previo["huella"] != resultados[nombre]["huella"]:
+                linea += "  ← RESULTADO DISTINTO"
+                problemas.append(f"{nombre}: devuelve otra cosa que en la base")
+        print(linea)
+
+    if args.guardar:
+        doc = {
+            "fecha": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "helpers": resultados,
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(args.guardar)), exist_ok=True)
+        with open(args.guardar, "w", encoding="utf-8") as f:
+            json.dump(doc, f, ensure_ascii=False, indent=2)
+        print(f"Base guardada en {args.guardar}")
+
+    if problemas:
+        print("\n✖ " + "\n✖ ".join(problemas), file=sys.stderr)
+        print(f"✖ {len(problemas)} helper(s) fuera de la base (umbral {args.umbral:.0%})", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+# bench_replay.py
+# Benchmark de punta a punta de cada página y cadena contra respuestas grabadas (grabacion.py),
+# sin depender de la carga de las tiendas: wall time, filas por segundo, requests y memoria pico.
+#
+#   python bench_replay.py grabar [--pagina dinamicas] [--cadena coto,jumbo] [--dir DIR]   # contra las tiendas en vivo
+#   python bench_replay.py medir [--escala 1] [--repeticiones 3] [--guardar base.json]     # replay local
+#   python bench_replay.py medir --base base.json                                          # compara contra una base
+#
+# Cada escaneo corre en un proceso nuevo, con cache HTTP, resolución de identificadores e
+# historial vacíos (carpeta temporal) y Opciones(completo, forzar_descarga): siempre se
+# piden las mismas requests. --escala multiplica las latencias grabadas (0 = solo CPU).
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import catalogo
+import motor
+from corrida import CADENAS, Opciones
+from resolucion import CACHE_DIR
+
+# Memoria pico del proceso: solo donde existe resource (Linux / macOS)
+try:
+    import resource
+except ImportError:
+    resource = None
+
+DIR_DEFAULT = os.path.join(CACHE_DIR, "grabaciones")
+PAGINAS = ("relevamiento", "dinamicas", "mercado")
+# (página, cadena): Mercado releva todas las cadenas juntas
+ESCANEOS = [(p, c) for p in ("relevamiento", "dinamicas") for c in CADENAS] + [("mercado", "todas")]
+
+
+def archivo(carpeta: str, pagina: str, cadena: str) -> str:
+    return os.path.join(carpeta, f"{pagina}_{cadena}.jsonl.gz")
+
+
+def _rss_mb() -> float:
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 / (1024 if sys.platform == "darwin" else 1)  # macOS: bytes; Linux: KB
+
+
+# --------------------------------------------
+# Un escaneo (dentro del proceso hijo)
+# --------------------------------------------
+def escaneo(modo: str, pagina: str, cadena: str, ruta: str, escala: float, concurrencia: int) -> dict:
+    import grabacion
+    import run
+
+    op = Opciones(concurrencia=concurrencia, completo=True, forzar_descarga=True, guardar_historial=False)
+    cadenas = None if cadena == "todas" else [cadena]
+    rss0 = _rss_mb()
+    t0 = time.perf_counter()
+    if modo == "grabar":
+        with grabacion.grabar(ruta) as g:
+            corridas = run.ejecutar(pagina, cadenas, op)
+        extra = {"grabadas": g.n}
+    else:
+        with grabacion.replay([ruta], escala) as r:
+            corridas = run.ejecutar(pagina, cadenas, op)
+        extra = {"faltantes": r.faltantes, "sin_grabar": sorted(r.sin_grabar, key=r.sin_grabar.get)[-5:]}
+    segundos = time.perf_counter() - t0
+    rss = _rss_mb()
+    return {
+        "filas": sum(len(c.filas) for c in corridas),
+        "requests": sum(f["requests"] for c in corridas for f in c.metricas),
+        "segundos": segundos,
+        "rss_mb": rss,
+        "rss_delta_mb": None if rss is None else rss - rss0,
+        **extra,
+    }
+
+
+def correr(modo: str, pagina: str, cadena: str, ruta: str, escala: float = 1.0,
+           concurrencia: int = motor.DEFAULT_CONCURRENCIA) -> dict:
+    """Corre escaneo() en un proceso nuevo con cache / historial vacíos."""
+    with tempfile.TemporaryDirectory(prefix="bench_replay_") as tmp:
+        env = dict(
+            os.environ,
+            SCRAPING_PRECIOS_CACHE=os.path.join(tmp, "cache"),
+            SCRAPING_PRECIOS_HISTORIAL=os.path.join(tmp, "historial.sqlite"),
+            SCRAPING_PRECIOS_METRICAS=os.path.join(tmp, "metricas"),
+            # el snapshot compilado del catálogo de siempre (no recompilarlo en cada proceso)
+            SCRAPING_PRECIOS_CATALOGO_SNAPSHOT=os.environ.get("SCRAPING_PRECIOS_CATALOGO_SNAPSHOT", catalogo.SNAPSHOT),
+            PYTHONPATH=os.pathsep.join([os.path.dirname(os.path.abspath(__file__)), os.environ.get("PYTHONPATH", "")]),
+        )
+        out = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "_escaneo", modo, pagina, cadena, ruta, str(escala), str(concurrencia)],
+            env=env, capture_output=True, text=True,
+        )
+    if out.returncode != 0:
+        raise RuntimeError(f"{pagina}/{cadena} falló:\n{out.stderr[-2000:]}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+# --------------------------------------------
+# CLI
+# --------------------------------------------
+def _elegidos(args) -> list:
+    paginas = PAGINAS if args.pagina == "todas" else (args.pagina,)
+    cadenas = None if args.cadena == "todas" else {c.strip() for c in args.cadena.split(",")}
+    return [(p, c) for p, c in ESCANEOS if p in paginas and (cadenas is None or c in cadenas or c == "todas")]
+
+
+def grabar(args) -> int:
+    os.makedirs(args.dir, exist_ok=True)
+    for pagina, cadena in _elegidos(args):
+        ruta = archivo(args.dir, pagina, cadena)
+        m = correr("grabar", pagina, cadena, ruta, concurrencia=args.concurrencia)
+        print(f"{pagina:13s} {cadena:14s} {m['grabadas']:6d} requests · {m['filas']} filas · {m['segundos']:.1f}s → {ruta}")
+    return 0
+
+
+def medir(args) -> int:
+    base = {}
+    if args.base:
+        with open(args.base, encoding="utf-8") as f:
+            base = json.load(f)["escaneos"]
+
+    print(
+        f"{'página':13s} {'cadena':14s} {'filas':>6s} {'requests':>8s} {'wall s':>7s} {'filas/s':>8s}"
+        f" {'RSS MB':>7s} {'faltan':>6s}{'   vs base' if base else ''}   (mediana de {args.repeticiones}, escala {args.escala})"
+    )
+    resultados = {}
+    for pagina, cadena in _elegidos(args):
+        ruta = archivo(args.dir, pagina, cadena)
+        if not os.path.exists(ruta):
+            print(f"{pagina:13s} {cadena:14s} (sin grabación: python bench_replay.py grabar --pagina {pagina})")
+            continue
+        medidas = [correr("replay", pagina, cadena, ruta, args.escala, args.concurrencia) for _ in range(args.repeticiones)]
+        segundos = statistics.median(m["segundos"] for m in medidas)
+        m = medidas[0]
+        rss = max((x["rss_mb"] for x in medidas if x["rss_mb"] is not None), default=None)
+        clave = f"{pagina}/{cadena}"
+        resultados[clave] = {
+            "filas": m["filas"], "requests": m["requests"], "segundos": round(segundos, 3),
+            "filas_por_s": round(m["filas"] / segundos, 1) if segundos else None,
+            "rss_mb": None if rss is None else round(rss, 1), "faltantes": m["faltantes"],
+        }
+        comparacion = ""
+        if clave in base and base[clave]["segundos"]:
+            comparacion = f"   {100 * (segundos / base[clave]['segundos'] - 1):+6.1f}%"
+        print(
+            f"{pagina:13s} {cadena:14s} {m['filas']:6d} {m['requests']:8d} {segundos:7.2f}"
+            f" {resultados[clave]['filas_por_s'] or 0:8.0f} {rss or 0:7.0f} {m['faltantes']:6d}{comparacion}"
+        )
+        if m["faltantes"]:
+            print(f"{'':28s}sin grabar, ej.: {m['sin_grabar'][-1]}")
+
+    if args.guardar:
+        doc = {
+            "fecha": datetime.now().isoformat(timespec="seconds"),
+            "escala": args.escala,
+            "repeticiones": args.repeticiones,
+            "concurrencia": args.concurrencia,
+            "escaneos": resultados,
+        }
+        with open(args.guardar, "w", encoding="utf-8") as f:
+            json.dump(doc, f, ensure_ascii=False, indent=2)
+        print(f"Base guardada en {args.guardar}")
+    return 0
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["_escaneo"]:
+        # Proceso hijo de correr(): un escaneo y su resultado como JSON en la última línea
+        modo, pagina, cadena, ruta, escala, concurrencia = argv[1:7]
+        print(json.dumps(escaneo(modo, pagina, cadena, ruta, float(escala), int(concurrencia))))
+        return 0
+
+    ap = argparse.ArgumentParser(description="Benchmark de escaneos contra respuestas grabadas")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    for nombre in ("grabar", "medir"):
+        p = sub.add_parser(nombre)
+        p.add_argument("--dir", default=DIR_DEFAULT, help="Carpeta de las grabaciones")
+        p.add_argument("--pagina", choices=PAGINAS + ("todas",), default="todas")
+        p.add_argument("--cadena", default="todas", help=f"Lista separada por comas o 'todas' ({', '.join(CADENAS)})")
+        p.add_argument("--concurrencia", type=int, default=motor.DEFAULT_CONCURRENCIA)
+        if nombre == "medir":
+            p.add_argument("--escala", type=float, default=1.0, help="Multiplica las latencias grabadas (0 = sin esperas)")
+            p.add_argument("--repeticiones", type=int, default=3)
+            p.add_argument("--guardar", help="Guardar los resultados como base (JSON)")
+            p.add_argument("--base", help="Comparar contra una base guardada con --guardar")
+    args = ap.parse_args(argv)
+    return grabar(args) if args.cmd == "grabar" else medir(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,326 @@
+# cache_http.py
+# Cache HTTP en disco, a nivel transporte, compartido por todas las páginas.
+#
+# Los documentos de catálogo (catalog_system/pub/products/search y variations) se piden
+# igual desde Relevamiento, Dinámicas y Mercado, y de nuevo en cada rerun de Streamlit.
+# AdaptadorCache (un HTTPAdapter) guarda las respuestas 200/206 de esos GET en un sqlite:
+#   - clave: (host, path, params normalizados, cookie vtex_segment)
+#   - vence según el TTL de la cadena (TTL_POR_HOST); vencida, se revalida con
+#     If-None-Match / If-Modified-Since si el server mandó ETag / Last-Modified (304 = sigue)
+#   - tamaño acotado: al pasar MAX_BYTES se borran las menos usadas
+# Con la descarga forzada (descarga(True), la abre cada relevar()) no se lee el cache (se descarga
+# todo) pero se sigue guardando. Es del thread de la corrida y sus workers, no del cache compartido.
+#
+# Lo que sale a la red (cacheable o no) se informa al control de concurrencia del host
+# (concurrencia.py: status, latencia, Retry-After) y espera si el host está en pausa. Los fallos
+# transitorios de requests idempotentes se reintentan con backoff, dentro del presupuesto de la
+# corrida (reintentos.py), y cada request queda en las métricas de la corrida (metricas.py).
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+import concurrencia
+import metricas
+import reintentos
+from resolucion import CACHE_DIR
+
+HTTP_PATH = os.path.join(CACHE_DIR, "http.sqlite")
+
+# Solo endpoints de catálogo: idempotentes y los mismos en todas las páginas
+CACHEABLES = (
+    "/api/catalog_system/pub/products/search",
+    "/api/catalog_system/pub/products/variations/",
+)
+
+# Vida de una respuesta por cadena (segundos). Traen precios: alcanza para "la misma mañana".
+TTL_DEFAULT = 2 * 3600
+TTL_POR_HOST = {
+    "www.carrefour.com.ar": 2 * 3600,
+    "diaonline.supermercadosdia.com.ar": 2 * 3600,
+    "www.masonline.com.ar": 2 * 3600,
+    "www.jumbo.com.ar": 3600,  # promos que cambian durante el día
+    "www.vea.com.ar": 3600,
+    "www.hiperlibertad.com.ar": 3 * 3600,
+}
+
+MAX_BYTES = 256 * 1024 * 1024
+
+# SCRAPING_PRECIOS_SIN_CACHE_HTTP=1 arranca con el cache ignorado (misma opción que el checkbox)
+BYPASS_ENV = bool(os.environ.get("SCRAPING_PRECIOS_SIN_CACHE_HTTP"))
+
+_SEGMENT_RE = re.compile(r"(?:^|;\s*)vtex_segment=([^;]*)")
+
+_local = threading.local()
+
+
+def cacheable(method: str, url: str) -> bool:
+    return method == "GET" and any(p in urlsplit(url).path for p in CACHEABLES)
+
+
+def clave(url: str, cookie: str = "") -> str:
+    """(host, path, params ordenados por nombre, vtex_segment) -> hash."""
+    u = urlsplit(url)
+    # Orden estable por nombre: los fq repetidos conservan su orden relativo
+    params = sorted(parse_qsl(u.query, keep_blank_values=True), key=lambda kv: kv[0])
+    m = _SEGMENT_RE.search(cookie or "")
+    partes = (u.netloc.lower(), u.path, urlencode(params), m.group(1) if m else "")
+    return hashlib.sha1("\x1f".join(partes).encode("utf-8")).hexdigest()
+
+
+class CacheHTTP:
+    def __init__(self, path: str = HTTP_PATH, max_bytes: int = MAX_BYTES, ttls: dict = None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = dict(TTL_POR_HOST if ttls is None else ttls)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidados = 0
+        self.desalojados = 0
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS respuestas ("
+            " clave TEXT PRIMARY KEY, host TEXT, url TEXT, ts REAL, usado REAL, tam INTEGER,"
+            " status INTEGER, headers TEXT, cuerpo BLOB, etag TEXT, last_modified TEXT)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS respuestas_usado ON respuestas (usado)")
+        self._total = self._db.execute("SELECT COALESCE(SUM(tam), 0) FROM respuestas").fetchone()[0]
+
+    def ttl(self, host: str) -> float:
+        return self.ttls.get(host, TTL_DEFAULT)
+
+    # --------------------------------------------
+    # Lectura / escritura
+    # --------------------------------------------
+    def get(self, k: str):
+        """Entrada cacheada (dict) o None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT host, ts, status, headers, cuerpo, etag, last_modified FROM respuestas WHERE clave = ?", (k,)
+            ).fetchone()
+        if row is None:
+            return None
+        host, ts, status, headers, cuerpo, etag, last_modified = row
+        return {
+            "host": host, "ts": ts, "status": status, "headers": json.loads(headers), "cuerpo": cuerpo,
+            "etag": etag, "last_modified": last_modified,
+        }
+
+    def fresca(self, ent: dict) -> bool:
+        return time.time() - ent["ts"] <= self.ttl(ent["host"])
+
+    def tocar(self, k: str, renovar: bool = False):
+        """Marca uso (LRU); renovar=True además reinicia el TTL (después de un 304)."""
+        ahora = time.time()
+        with self._lock:
+            if renovar:
+                self._db.execute("UPDATE respuestas SET usado = ?, ts = ? WHERE clave = ?", (ahora, ahora, k))
+            else:
+                self._db.execute("UPDATE respuestas SET usado = ? WHERE clave = ?", (ahora, k))
+
+    def put(self, k: str, url: str, resp: Response):
+        cuerpo = resp.content
+        headers = {h: v for h, v in resp.headers.items() if h.lower() not in ("content-encoding", "transfer-encoding", "content-length")}
+        ahora = time.time()
+        with self._lock:
+            viejo = self._db.execute("SELECT tam FROM respuestas WHERE clave = ?", (k,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO respuestas VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (k, urlsplit(url).netloc, url, ahora, ahora, len(cuerpo), resp.status_code, json.dumps(headers),
+                 cuerpo, resp.headers.get("ETag"), resp.headers.get("Last-Modified")),
+            )
+            self._total += len(cuerpo) - (viejo[0] if viejo else 0)
+            if self._total > self.max_bytes:
+                self._desalojar()
+
+    def _desalojar(self):
+        """Borra las entradas menos usadas hasta bajar al 90% de max_bytes (con el lock tomado)."""
+        objetivo = self.max_bytes * 0.9
+        filas = self._db.execute("SELECT clave, tam FROM respuestas ORDER BY usado").fetchall()
+        borrar = []
+        for k, tam in filas:
+            if self._total <= objetivo:
+                break
+            borrar.append((k,))
+            self._total -= tam
+        self._db.executemany("DELETE FROM respuestas WHERE clave = ?", borrar)
+        self.desalojados += len(borrar)
+
+    def limpiar(self):
+        with self._lock:
+            self._db.execute("DELETE FROM respuestas")
+            self._total = 0
+
+    def contar(self, campo: str):
+        with self._lock:
+            setattr(self, campo, getattr(self, campo) + 1)
+
+    # --------------------------------------------
+    # Resumen por corrida
+    # --------------------------------------------
+    def marca(self) -> tuple:
+        with self._lock:
+            return self.hits, self.misses, self.revalidados, self.desalojados
+
+    def resumen(self, desde: tuple = (0, 0, 0, 0), descarga_forzada: bool = False) -> str:
+        hits, misses, revalidados, desalojados = (a - b for a, b in zip(self.marca(), desde))
+        txt = f"Cache HTTP: {hits} hits · {misses} misses · {revalidados} revalidadas (304)"
+        if desalojados:
+            txt += f" · {desalojados} desalojadas"
+        if descarga_forzada:
+            txt += " · ignorado (descarga forzada)"
+        return txt
+
+
+class AdaptadorCache(HTTPAdapter):
+    """HTTPAdapter que sirve los GET de catálogo desde CacheHTTP."""
+
+    def __init__(self, cache: "CacheHTTP" = None, **kw):
+        self.cache = cache
+        super().__init__(**kw)
+
+    def _desde_cache(self, request, ent: dict) -> Response:
+        r = Response()
+        r.status_code = ent["status"]
+        r.headers = CaseInsensitiveDict(ent["headers"])
+        r._content = ent["cuerpo"]
+        r.encoding = None
+        r.url = request.url
+        r.request = request
+        r.reason = "OK"
+        r.connection = self
+        r.from_cache = True
+        return r
+
+    def _a_la_red(self, request, **kw):
+        """
+        super().send(), informando cada intento a la ventana de concurrencia del host,
+        reintentando los fallos transitorios de requests idempotentes (ver reintentos.py) y
+        registrando el resultado en las métricas de la corrida (metricas.py).
+        """
+        import motor  # motor importa este módulo: acá ya está cargado
+
+        host = urlsplit(request.url).netloc
+        ventana = concurrencia.compartido().ventana(host)
+        presupuesto = reintentos.actual()
+        registro = metricas.actual()
+        puede = presupuesto is not None and reintentos.reintentable(request.method, request.url)
+        if presupuesto is not None:
+            presupuesto.request(host)
+        intento = 1
+        while True:
+            if ventana.pausa():
+                ventana.esperar(motor.chequear_cancelacion)
+            enviado = time.time()
+            resp, error = None, None
+            try:
+                resp = super().send(request, **kw)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+                ventana.respuesta(enviado, time.time() - enviado)
+                status = None
+            else:
+                status = resp.status_code
+                ventana.respuesta(enviado, time.time() - enviado, status, resp.headers.get("Retry-After"))
+
+            reintentar = (
+                reintentos.transitorio(status) and puede and intento < reintentos.MAX_INTENTOS
+                and presupuesto.gastar(host)
+            )
+            if not reintentar:
+                if reintentos.transitorio(status) or status in concurrencia.ERRORES:
+                    reintentos.fallo(status)
+                elif intento > 1:
+                    presupuesto.recuperada(host)
+                if registro is not None:
+                    # latencia del último intento, hasta tener el cuerpo (requests lo lee igual)
+                    n_bytes = len(resp.content) if resp is not None and not kw.get("stream") else 0
+                    registro.request(request.url, time.time() - enviado, n_bytes, status, intento - 1)
+                if error is not None:
+                    raise error
+                return resp
+            if resp is not None:
+                resp.close()
+            reintentos.dormir(reintentos.espera(intento), motor.chequear_cancelacion)
+            intento += 1
+
+    def send(self, request, **kw):
+        cache = self.cache or compartido()
+        if not cacheable(request.method, request.url):
+            return self._a_la_red(request, **kw)
+
+        k = clave(request.url, request.headers.get("Cookie", ""))
+        ent = None if forzada() else cache.get(k)
+        if ent is not None and cache.fresca(ent):
+            cache.tocar(k)
+            cache.contar("hits")
+            return self._desde_cache(request, ent)
+
+        if ent is not None:
+            if ent["etag"]:
+                request.headers["If-None-Match"] = ent["etag"]
+            if ent["last_modified"]:
+                request.headers["If-Modified-Since"] = ent["last_modified"]
+
+        resp = self._a_la_red(request, **kw)
+        if ent is not None and resp.status_code == 304:
+            cache.tocar(k, renovar=True)
+            cache.contar("revalidados")
+            return self._desde_cache(request, ent)
+
+        cache.contar("misses")
+        # 206: VTEX responde así las búsquedas paginadas con _from/_to
+        if resp.status_code in (200, 206):
+            cache.put(k, request.url, resp)
+        return resp
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def compartido() -> CacheHTTP:
+    """Instancia compartida por todas las páginas (sobrevive a los reruns de Streamlit)."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = CacheHTTP()
+        return _cache
+
+
+@contextmanager
+def descarga(forzar: bool = BYPASS_ENV):
+    """Las requests de este thread (y de los workers de run_jobs) ignoran el cache si `forzar`."""
+    anterior = getattr(_local, "forzar", None)
+    _local.forzar = bool(forzar)
+    try:
+        yield
+    finally:
+        _local.forzar = anterior
+
+
+def forzada() -> bool:
+    """Descarga forzada de la corrida de este thread (fuera de una corrida: SCRAPING_PRECIOS_SIN_CACHE_HTTP)."""
+    forzar = getattr(_local, "forzar", None)
+    return BYPASS_ENV if forzar is None else forzar
+
+
+def fijar(forzar: bool):
+    """Para los workers del motor: heredan la descarga forzada del thread que los lanzó."""
+    _local.forzar = forzar
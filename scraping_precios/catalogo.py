@@ -0,0 +1,416 @@
+# catalogo.py
+# Catálogo único de productos (catalogo.json), indexado por EAN y por el código de cada cadena.
+#
+# Reemplaza a los listado_*.py / productos_streamlit.py / consolidado_comparativos.py: los mismos
+# datos de cada EAN (empresa, categoría, marca, códigos, PSP) estaban copiados en cada listado,
+# y las claves repetidas de esos dicts pisaban productos sin avisar.
+#
+#   - productos: {ean: {"nombre", "empresa", "categoría", "subcategoría", "marca", "psp",
+#                       "cod_dia", "cod_maso", "cod_coope", "cod_lib", "cod_coto"}}
+#   - listas: qué productos releva cada página / cadena y en qué orden
+#       {lista: [ean | [ean, nombre en esa lista]]}
+#   - vista(lista) arma el {"Nombre": {...}} de siempre que consume relevar(); las claves son las de
+#     los listados de antes, tal cual (espacios finales incluidos)
+#
+# Snapshot compilado (SNAPSHOT, en el cache): la tabla de productos en columnas (empresa, categoría,
+# marca, ... como códigos de categoría sobre sus valores únicos), los índices por código y cada vista
+# ya armada y serializada por separado. cargar() lo usa si coincide con catalogo.json (tamaño +
+# mtime, o sha256 si solo cambió el mtime) y si no lo recompila solo; las páginas deserializan
+# únicamente las vistas que usan.
+#
+#   python catalogo.py validar     # duplicados, EAN malformados, códigos repetidos
+#   python catalogo.py compilar    # (re)genera el snapshot y compara tiempos de carga
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import re
+import threading
+import time
+from array import array
+from collections import Counter
+
+from resolucion import CACHE_DIR
+
+RUTA = os.environ.get("SCRAPING_PRECIOS_CATALOGO") or os.path.join(os.path.dirname(os.path.abspath(__file__)), "catalogo.json")
+
+# SCRAPING_PRECIOS_CATALOGO_SNAPSHOT=0 lee siempre el JSON
+SNAPSHOT = os.environ.get("SCRAPING_PRECIOS_CATALOGO_SNAPSHOT", os.path.join(CACHE_DIR, "catalogo.snapshot"))
+if SNAPSHOT in ("", "0"):
+    SNAPSHOT = None
+SNAPSHOT_VERSION = 2
+
+CAMPOS = ("empresa", "categoría", "subcategoría", "marca", "psp")
+CODIGOS = ("cod_dia", "cod_maso", "cod_coope", "cod_lib", "cod_coto")
+
+# Códigos cargados como "no existe en la cadena": en el catálogo quedan vacíos
+SIN_CODIGO = ("", "0", "NO", "NO_ENCONTRADO", "NO ENCONTRADO", "NO_ENCONTRADO,")
+
+# Nombres de módulo de antes -> lista del catálogo (cargar_catalogo("listado_coto") sigue andando)
+LEGADO = {
+    "listado_carrefour": "carrefour",
+    "listado_cencosud": "cencosud",
+    "listado_chango": "chango",
+    "listado_coto": "coto",
+    "listado_dia": "dia",
+    "listado_cooperativa": "cooperativa",
+    "listado_libertad": "libertad",
+    "productos_streamlit": "relevamiento",
+    "consolidado_comparativos": "mercado",
+}
+
+RE_EAN = re.compile(r"\d{8,14}")
+
+
+def digito_verificador_ok(ean: str) -> bool:
+    """GTIN-8/12/13/14: el último dígito es el verificador (módulo 10, pesos 3-1 desde la derecha)."""
+    if len(ean) not in (8, 12, 13, 14) or not ean.isdigit():
+        return False
+    cuerpo = [int(c) for c in reversed(ean[:-1])]
+    suma = sum(d * (3 if i % 2 == 0 else 1) for i, d in enumerate(cuerpo))
+    return (10 - suma % 10) % 10 == int(ean[-1])
+
+
+def problema_ean(ean: str):
+    """None si el EAN es válido; si no, el motivo. Los de 8-14 dígitos se guardan igual (con aviso)."""
+    if not RE_EAN.fullmatch(ean):
+        return "malformado"
+    if not digito_verificador_ok(ean):
+        return "largo o dígito verificador inválido"
+    return None
+
+
+def _codigo(valor) -> str:
+    s = str(valor if valor is not None else "").strip()
+    return "" if s.upper() in SIN_CODIGO else s
+
+
+class Catalogo:
+    """Productos por EAN + índices por código de cadena + listas ordenadas."""
+
+    def __init__(self, productos: dict = None, listas: dict = None):
+        self._productos = productos or {}
+        self._listas = listas or {}
+        self._tabla = None  # snapshot: productos + listas todavía en columnas
+        self.carga = ("vacío", 0.0)  # (origen, ms) de cargar()
+        self._indexar()
+
+    @classmethod
+    def cargar(cls, ruta: str = RUTA, snapshot: str = SNAPSHOT) -> "Catalogo":
+        """Desde el snapshot compilado si está al día con `ruta`; si no, del JSON (y recompila el snapshot)."""
+        t0 = time.perf_counter()
+        if snapshot:
+            cat, origen = cls._cargar_compilado(ruta, snapshot)
+        else:
+            with open(ruta, encoding="utf-8") as f:
+                datos = json.load(f)
+            cat, origen = cls(datos.get("productos"), datos.get("listas")), "json"
+        cat.carga = (origen, 1000 * (time.perf_counter() - t0))
+        return cat
+
+    @classmethod
+    def _cargar_compilado(cls, ruta: str, snapshot: str):
+        snap = _abrir_snapshot(snapshot)
+        with open(ruta, "rb") as f:
+            st = os.fstat(f.fileno())
+            fuente = {"ruta": os.path.abspath(ruta), "tamaño": st.st_size, "mtime_ns": st.st_mtime_ns}
+            if snap is not None and all(snap["fuente"].get(k) == v for k, v in fuente.items()):
+                return cls._de_snapshot(snap), "snapshot"
+            crudo = f.read()
+
+        fuente["sha256"] = hashlib.sha256(crudo).hexdigest()
+        if snap is not None and snap["fuente"].get("sha256") == fuente["sha256"]:
+            cat, origen = cls._de_snapshot(snap), "snapshot (re-firmado)"  # mismo contenido, otro mtime
+        else:
+            datos = json.loads(crudo)
+            snap = _compilar(cls(datos.get("productos"), datos.get("listas")))
+            cat, origen = cls._de_snapshot(snap), "json (snapshot recompilado)"
+        snap["fuente"] = fuente
+        try:
+            _guardar_snapshot(snap, snapshot)
+        except OSError:
+            origen += " · no se pudo guardar el snapshot"
+        return cat, origen
+
+    @classmethod
+    def _de_snapshot(cls, snap: dict) -> "Catalogo":
+        cat = cls()
+        cat._tabla = snap["tabla"]
+        cat._por_codigo = snap["por_codigo"]
+        cat._repetidos = snap["repetidos"]
+        cat._vistas = dict(snap["vistas"])
+        return cat
+
+    # Del snapshot, la tabla de productos se arma recién cuando algo la pide (validar, ...)
+    @property
+    def productos(self) -> dict:
+        if self._tabla is not None:
+            self._desempaquetar()
+        return self._productos
+
+    @property
+    def listas(self) -> dict:
+        if self._tabla is not None:
+            self._desempaquetar()
+        return self._listas
+
+    def _desempaquetar(self):
+        self._productos, self._listas = _de_columnas(pickle.loads(self._tabla))
+        self._tabla = None
+
+    def _indexar(self):
+        self._vistas = {}  # lista -> vista ya armada (o su pickle, si viene del snapshot)
+        self._por_codigo = {campo: {} for campo in CODIGOS}
+        self._repetidos = []  # (campo, código, ean ya indexado, ean repetido)
+        for ean, prod in self.productos.items():
+            for campo in CODIGOS:
+                cod = prod.get(campo)
+                if not cod:
+                    continue
+                previo = self._por_codigo[campo].setdefault(cod, ean)
+                if previo != ean:
+                    self._repetidos.append((campo, cod, previo, ean))
+
+    # --------------------------------------------
+    # Consultas (O(1))
+    # --------------------------------------------
+    def por_ean(self, ean: str):
+        return self.productos.get(str(ean or "").strip())
+
+    def por_codigo(self, campo: str, codigo: str):
+        """Producto por código de cadena: por_codigo("cod_dia", "139870")."""
+        ean = self._por_codigo[campo].get(_codigo(codigo))
+        return None if ean is None else dict(self.productos[ean], ean=ean)
+
+    def ean_de(self, campo: str, codigo: str):
+        return self._por_codigo[campo].get(_codigo(codigo))
+
+    def lista(self, nombre: str) -> str:
+        """Nombre de lista (acepta los módulos de antes: listado_coto, productos_streamlit, ...)."""
+        return LEGADO.get(nombre, nombre)
+
+    def tiene(self, nombre: str) -> bool:
+        # Del snapshot, _vistas ya tiene una entrada por lista (sin desempaquetar la tabla)
+        return self.lista(nombre) in (self._vistas if self._tabla is not None else self.listas)
+
+    def vista(self, nombre: str) -> dict:
+        """
+        {"Nombre": {"ean": ..., "empresa": ..., "cod_dia": ..., ...}} de una lista, en su orden.
+        Un nombre repetido se queda con el último EAN, como las claves repetidas de los listados de
+        antes; los EAN que pisa ya no se pierden: siguen en la vista como "Nombre (EAN)".
+        Se arma (o se deserializa del snapshot) una vez por lista; cada llamada devuelve su propio dict.
+        """
+        lista = self.lista(nombre)
+        vista = self._vistas.get(lista)
+        if vista is None:
+            vista = self._vistas[lista] = self._armar_vista(lista)
+        elif isinstance(vista, bytes):
+            vista = self._vistas[lista] = pickle.loads(vista)
+        return dict(vista)
+
+    def _armar_vista(self, lista: str) -> dict:
+        out = {}
+        for entrada in self.listas[lista]:
+            ean, nombre_lista = (entrada, None) if isinstance(entrada, str) else entrada
+            prod = self.productos[ean]
+            clave = nombre_lista or prod["nombre"]
+            meta = {k: prod[k] for k in CAMPOS + CODIGOS if prod.get(k) not in (None, "")}
+            meta["ean"] = ean
+            pisado = out.get(clave)
+            out[clave] = meta  # mismo lugar, último EAN (como un dict literal)
+            if pisado is not None:
+                out[f"{clave} ({pisado['ean']})"] = pisado
+        return out
+
+    # --------------------------------------------
+    # Validación
+    # --------------------------------------------
+    def validar(self) -> list:
+        """
+        [(nivel, problema, detalle)]: "error" rompe una vista; "aviso" conviene revisarlo. Un código de
+        cadena compartido por dos EAN (mismo SKU con EAN nuevo, o un error de carga) es aviso: cada fila
+        releva con su código y por_codigo() devuelve el primer EAN.
+        """
+        problemas = []
+        for ean in self.productos:
+            motivo = problema_ean(ean)
+            if motivo:
+                problemas.append(("error" if motivo == "malformado" else "aviso", f"EAN {motivo}", ean))
+        for campo, cod, previo, ean in self._repetidos:
+            problemas.append(("aviso", f"{campo} repetido", f"{cod}: {previo} y {ean}"))
+        for lista, entradas in self.listas.items():
+            vistos = set()
+            nombres = Counter()
+            for entrada in entradas:
+                ean, nombre_lista = (entrada, None) if isinstance(entrada, str) else entrada
+                if ean not in self.productos:
+                    problemas.append(("error", "EAN sin producto", f"{lista}: {ean}"))
+                    continue
+                if ean in vistos:
+                    problemas.append(("error", "EAN repetido en la lista", f"{lista}: {ean}"))
+                vistos.add(ean)
+                nombres[nombre_lista or self.productos[ean]["nombre"]] += 1
+            for nombre, n in nombres.items():
+                if n > 1:
+                    problemas.append(("aviso", "nombre repetido en la lista", f"{lista}: {nombre} (x{n})"))
+        return problemas
+
+    def guardar(self, ruta: str = RUTA):
+        """Un producto / entrada por línea (diffs legibles)."""
+        def _linea(clave, valor):
+            return f"    {json.dumps(clave, ensure_ascii=False)}: {json.dumps(valor, ensure_ascii=False)}"
+
+        partes = ["{", '  "productos": {']
+        partes.append(",\n".join(_linea(ean, prod) for ean, prod in sorted(self.productos.items())))
+        partes += ["  },", '  "listas": {']
+        listas = []
+        for lista, entradas in self.listas.items():
+            cuerpo = ",\n".join(f"      {json.dumps(e, ensure_ascii=False)}" for e in entradas)
+            listas.append(f"    {json.dumps(lista)}: [\n{cuerpo}\n    ]")
+        partes.append(",\n".join(listas))
+        partes += ["  }", "}"]
+        tmp = f"{ruta}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("\n".join(partes) + "\n")
+        os.replace(tmp, ruta)
+
+
+# --------------------------------------------
+# Snapshot compilado
+# --------------------------------------------
+def _a_columnas(productos: dict, listas: dict) -> dict:
+    """
+    Tabla en columnas: las de pocos valores (empresa, categoría, marca, el orden de claves de cada
+    producto) como array de códigos + valores únicos; nombre y códigos de cadena, listas planas;
+    cada lista, un array de posiciones + los nombres propios de esa lista.
+    """
+    eans = list(productos)
+    pos = {ean: i for i, ean in enumerate(eans)}
+    categorias = {}
+    for campo in ("claves",) + CAMPOS:
+        codigos = {None: 0}
+        valores = [tuple(p) if campo == "claves" else p.get(campo) for p in productos.values()]
+        col = [codigos.setdefault(v, len(codigos)) for v in valores]
+        tipo = "H" if len(codigos) <= 0xFFFF else "I"
+        categorias[campo] = (list(codigos), tipo, array(tipo, col).tobytes())
+    columnas = {campo: [p.get(campo) for p in productos.values()] for campo in ("nombre",) + CODIGOS}
+    por_lista = {}
+    for lista, entradas in listas.items():
+        indices, nombres = array("I"), {}
+        for j, entrada in enumerate(entradas):
+            ean, nombre_lista = (entrada, None) if isinstance(entrada, str) else entrada
+            indices.append(pos[ean])
+            if nombre_lista is not None:
+                nombres[j] = nombre_lista
+        por_lista[lista] = (indices.tobytes(), nombres)
+    return {"eans": eans, "categorias": categorias, "columnas": columnas, "listas": por_lista}
+
+
+def _de_columnas(tabla: dict):
+    """(productos, listas) de _a_columnas; los valores de cada categoría quedan compartidos."""
+    eans = tabla["eans"]
+    cols = dict(tabla["columnas"])
+    for campo, (valores, tipo, crudo) in tabla["categorias"].items():
+        cols[campo] = [valores[c] for c in array(tipo, crudo)]
+    claves = cols.pop("claves")
+    productos = {ean: {k: cols[k][i] for k in claves[i]} for i, ean in enumerate(eans)}
+    listas = {}
+    for lista, (crudo, nombres) in tabla["listas"].items():
+        listas[lista] = [[eans[i], nombres[j]] if j in nombres else eans[i] for j, i in enumerate(array("I", crudo))]
+    return productos, listas
+
+
+def _compilar(cat: Catalogo) -> dict:
+    productos, listas = _de_columnas(_a_columnas(cat.productos, cat.listas))
+    compacto = Catalogo(productos, listas)  # strings compartidos: cada vista serializa una vez cada valor
+    return {
+        "version": SNAPSHOT_VERSION,
+        "fuente": {},
+        "tabla": pickle.dumps(_a_columnas(productos, listas), protocol=pickle.HIGHEST_PROTOCOL),
+        "por_codigo": compacto._por_codigo,
+        "repetidos": compacto._repetidos,
+        "vistas": {
+            lista: pickle.dumps(compacto.vista(lista), protocol=pickle.HIGHEST_PROTOCOL) for lista in listas
+        },
+    }
+
+
+def _abrir_snapshot(ruta: str):
+    """El snapshot de esta versión, o None (no existe, está corrupto o es de otra versión)."""
+    try:
+        with open(ruta, "rb") as f:
+            snap = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+    if not isinstance(snap, dict) or snap.get("version") != SNAPSHOT_VERSION:
+        return None
+    return snap
+
+
+def _guardar_snapshot(snap: dict, ruta: str):
+    os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+    tmp = f"{ruta}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(snap, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, ruta)
+
+
+_catalogo = None
+_catalogo_lock = threading.Lock()
+
+
+def compartido() -> Catalogo:
+    """Instancia compartida por todas las páginas (sobrevive a los reruns de Streamlit)."""
+    global _catalogo
+    with _catalogo_lock:
+        if _catalogo is None:
+            _catalogo = Catalogo.cargar()
+        return _catalogo
+
+
+def _imprimir(problemas) -> int:
+    for nivel, problema, detalle in problemas:
+        print(f"[{nivel}] {problema}: {detalle}")
+    errores = sum(1 for p in problemas if p[0] == "error")
+    print(f"{errores} errores · {len(problemas) - errores} avisos")
+    return errores
+
+
+def _medir(ruta: str, snapshot: str, repeticiones: int):
+    """Recompila el snapshot y compara la carga desde JSON vs. snapshot (con y sin armar las vistas)."""
+    if os.path.exists(snapshot):
+        os.remove(snapshot)
+    cat = Catalogo.cargar(ruta, snapshot)
+    print(f"{cat.carga[0]}: {cat.carga[1]:.1f} ms · {os.path.getsize(snapshot) / 1024:.0f} KB -> {snapshot}")
+
+    def _ms(fn):
+        tiempos = []
+        for _ in range(repeticiones):
+            t0 = time.perf_counter()
+            fn()
+            tiempos.append(1000 * (time.perf_counter() - t0))
+        return sorted(tiempos)[len(tiempos) // 2]
+
+    listas = list(cat.listas)
+    for origen, snap in (("json", None), ("snapshot", snapshot)):
+        solo = _ms(lambda: Catalogo.cargar(ruta, snap))
+        una = _ms(lambda: Catalogo.cargar(ruta, snap).vista("relevamiento"))
+        todas = _ms(lambda: [Catalogo.cargar(ruta, snap).vista(lista) for lista in listas])
+        print(f"{origen:9s} cargar {solo:6.1f} ms · + vista relevamiento {una:6.1f} ms · + {len(listas)} vistas {todas:6.1f} ms")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Catálogo único de productos")
+    ap.add_argument("--ruta", default=RUTA)
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("validar")
+    c = sub.add_parser("compilar")
+    c.add_argument("--snapshot", default=SNAPSHOT or os.path.join(CACHE_DIR, "catalogo.snapshot"))
+    c.add_argument("--repeticiones", type=int, default=9)
+    args = ap.parse_args()
+
+    if args.cmd == "validar":
+        raise SystemExit(1 if _imprimir(Catalogo.cargar(args.ruta).validar()) else 0)
+    _medir(args.ruta, args.snapshot, args.repeticiones)
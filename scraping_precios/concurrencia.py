@@ -0,0 +1,227 @@
+# concurrencia.py
+# Ventana de concurrencia adaptativa (AIMD) por host, compartida por todas las corridas.
+#
+# Coto devuelve 403 bajo carga y los VTEX frenan a los clientes agresivos: con un límite fijo
+# o se deja velocidad sin usar o se termina bloqueado. AdaptadorCache (cache_http) informa cada
+# request que sale a la red (los hits de cache no cuentan) y cada host ajusta su ventana:
+#   - respuesta sana (2xx/3xx/4xx que no sea 403/429) con latencia normal: suma aditiva,
+#     ventana += 1 / ventana (≈ +1 por cada ventana completa de respuestas), hasta el techo
+#   - latencia > FACTOR_LATENCIA x la de base del host (y > LATENCIA_SANA_S): no crece
+#   - 403 / 429 / 5xx / timeout / error de conexión: la ventana se divide por 2 (piso 1), una
+#     vez por ronda: lo que ya estaba en vuelo cuando se recortó no vuelve a recortar
+#   - Retry-After (segundos o fecha HTTP): el host queda en pausa hasta entonces (máx. MAX_PAUSA_S)
+# run_jobs (motor) despacha a cada host hasta `limite` jobs en vuelo y nada mientras está en
+# pausa; las requests sueltas (loops secuenciales) esperan la pausa en el adaptador.
+# La ventana aprendida se reusa en la próxima corrida; un host sin uso por OLVIDO_S vuelve
+# a arrancar desde la concurrencia inicial de la corrida.
+
+import logging
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+
+log = logging.getLogger(__name__)
+
+MINIMO = 1
+INICIAL = 8
+TECHO = 32
+FACTOR_LATENCIA = 3.0
+LATENCIA_SANA_S = 1.0  # por debajo, nunca se considera lenta (los lotes VTEX tardan más que una búsqueda)
+ALFA_EWMA = 0.2
+MAX_PAUSA_S = 120.0
+OLVIDO_S = 600.0
+MAX_EVENTOS = 200
+
+ERRORES = (403, 429)
+
+
+def segundos_retry_after(valor) -> float:
+    """Retry-After en segundos ("120" o fecha HTTP); None si no viene o no se entiende."""
+    valor = str(valor or "").strip()
+    if not valor:
+        return None
+    if valor.isdigit():
+        return float(valor)
+    try:
+        return parsedate_to_datetime(valor).timestamp() - time.time()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class Ventana:
+    """Concurrencia de un host: sube de a poco mientras responde bien, se parte al medio si frena."""
+
+    def __init__(self, control: "Control", host: str, inicial: int = INICIAL, techo: int = TECHO):
+        self.control = control
+        self.host = host
+        self.techo = max(MINIMO, int(techo))
+        self.inicial = min(max(MINIMO, int(inicial)), self.techo)
+        self.valor = float(self.inicial)
+        self.pausa_hasta = 0.0
+        self.latencia = None  # EWMA (s)
+        self.base = None      # latencia de referencia: sigue a la EWMA, bajando rápido y subiendo lento
+        self.ultimo_recorte = 0.0
+        self.usado = time.time()
+        self.ok = 0
+        self.errores = 0
+        self.recortes = 0
+        self.pausas = 0
+        self.despachada = False  # la usó run_jobs (si no, solo requests sueltas: no se muestra)
+        self._lock = threading.Lock()
+
+    @property
+    def limite(self) -> int:
+        """Jobs en vuelo permitidos ahora."""
+        return max(MINIMO, int(self.valor))
+
+    def pausa(self) -> float:
+        """Segundos que faltan de la pausa por Retry-After (0 si no hay)."""
+        return max(0.0, self.pausa_hasta - time.time())
+
+    def preparar(self, inicial: int, techo: int):
+        """Al arrancar una corrida: después de OLVIDO_S sin uso, la ventana vuelve a `inicial`."""
+        with self._lock:
+            self.techo = max(MINIMO, int(techo))
+            if not self.despachada or time.time() - self.usado > OLVIDO_S:
+                self.inicial = min(max(MINIMO, int(inicial)), self.techo)
+                self.valor = float(self.inicial)
+                self.latencia = self.base = None
+            self.valor = min(self.valor, float(self.techo))
+            self.despachada = True
+            self.usado = time.time()
+
+    def esperar(self, chequeo=None):
+        """Duerme hasta que termine la pausa; chequeo() (cancelación) entre tramos."""
+        while True:
+            falta = self.pausa()
+            if falta <= 0:
+                return
+            if chequeo is not None:
+                chequeo()
+            time.sleep(min(falta, 0.25))
+
+    def respuesta(self, enviado: float, segundos: float, status: int = None, retry_after=None):
+        """
+        Resultado de una request que salió a la red. status None = timeout / error de conexión.
+        `enviado` (time.time() al salir) evita recortar dos veces por la misma ronda.
+        """
+        ahora = time.time()
+        evento = None
+        with self._lock:
+            self.usado = ahora
+            pausa = segundos_retry_after(retry_after) if retry_after else None
+            if pausa and pausa > 0:
+                pausa = min(pausa, MAX_PAUSA_S)
+                if ahora + pausa > self.pausa_hasta:
+                    self.pausa_hasta = ahora + pausa
+                    self.pausas += 1
+                    evento = f"{status}: pausa {pausa:.0f}s (Retry-After)"
+
+            if status is None or status in ERRORES or status >= 500:
+                self.errores += 1
+                if enviado >= self.ultimo_recorte:
+                    antes = self.valor
+                    self.valor = max(float(MINIMO), self.valor / 2)
+                    self.ultimo_recorte = ahora
+                    self.recortes += 1
+                    motivo = "timeout / error de conexión" if status is None else str(status)
+                    evento = f"{motivo}: ventana {antes:.1f} → {self.valor:.1f}" + (f" · {evento}" if evento else "")
+            else:
+                self.ok += 1
+                self.latencia = segundos if self.latencia is None else ALFA_EWMA * segundos + (1 - ALFA_EWMA) * self.latencia
+                if self.base is None or self.latencia < self.base:
+                    self.base = self.latencia
+                else:
+                    self.base += 0.01 * (self.latencia - self.base)
+                if self.latencia <= max(LATENCIA_SANA_S, FACTOR_LATENCIA * self.base):
+                    self.valor = min(float(self.techo), self.valor + 1 / self.valor)
+        if evento:
+            self.control._evento(self.host, evento)
+
+    def resumen(self) -> str:
+        pausa = self.pausa()
+        txt = f"{self.host}: ventana {self.limite}"
+        if self.latencia is not None:
+            txt += f" · {1000 * self.latencia:.0f} ms"
+        if pausa:
+            txt += f" · en pausa {pausa:.0f}s"
+        return txt
+
+
+class Control:
+    """Ventanas por host del proceso (compartidas entre páginas, sesiones y trabajos)."""
+
+    def __init__(self):
+        self._ventanas = {}
+        self._eventos = deque(maxlen=MAX_EVENTOS)  # (n, ts, host, texto)
+        self._n_eventos = 0
+        self._lock = threading.Lock()
+
+    def ventana(self, host: str) -> Ventana:
+        with self._lock:
+            v = self._ventanas.get(host)
+            if v is None:
+                v = self._ventanas[host] = Ventana(self, host)
+            return v
+
+    def activas(self, segundos: float = 5.0) -> list:
+        """Ventanas con tráfico en los últimos `segundos` (para mostrar el avance)."""
+        desde = time.time() - segundos
+        with self._lock:
+            return [v for v in self._ventanas.values() if v.despachada and v.usado >= desde]
+
+    def _evento(self, host: str, texto: str):
+        log.warning("%s %s", host, texto)
+        with self._lock:
+            self._n_eventos += 1
+            self._eventos.append((self._n_eventos, time.time(), host, texto))
+
+    # --------------------------------------------
+    # Resumen por corrida
+    # --------------------------------------------
+    def marca(self) -> dict:
+        with self._lock:
+            ventanas = {
+                h: (v.valor, v.ok, v.errores, v.recortes, v.pausas) for h, v in self._ventanas.items() if v.despachada
+            }
+            return {"ventanas": ventanas, "eventos": self._n_eventos}
+
+    def eventos(self, desde: dict = None) -> list:
+        """["HH:MM:SS host texto"] desde la marca (recortes y pausas)."""
+        n = (desde or {}).get("eventos", 0)
+        with self._lock:
+            eventos = [e for e in self._eventos if e[0] > n]
+        return [f"{time.strftime('%H:%M:%S', time.localtime(ts))} {host} {texto}" for _i, ts, host, texto in eventos]
+
+    def resumen(self, desde: dict = None, hosts=None) -> str:
+        """Ventana de cada host usado desde la marca: inicial → actual, recortes y pausas."""
+        previas = (desde or {}).get("ventanas", {})
+        partes = []
+        with self._lock:
+            ventanas = [v for h, v in self._ventanas.items() if v.despachada and (hosts is None or h in hosts)]
+        for v in ventanas:
+            valor0, ok0, err0, rec0, pau0 = previas.get(v.host, (float(v.inicial), 0, 0, 0, 0))
+            if v.ok + v.errores == ok0 + err0:
+                continue
+            txt = f"{v.host} {max(MINIMO, int(valor0))}→{v.limite}"
+            if v.recortes > rec0:
+                txt += f" ({v.recortes - rec0} recortes"
+                txt += f", {v.pausas - pau0} pausas)" if v.pausas > pau0 else ")"
+            elif v.pausas > pau0:
+                txt += f" ({v.pausas - pau0} pausas)"
+            partes.append(txt)
+        return ("Concurrencia: " + " · ".join(partes)) if partes else ""
+
+
+_control = None
+_control_lock = threading.Lock()
+
+
+def compartido() -> Control:
+    """Instancia compartida por todas las páginas (sobrevive a los reruns de Streamlit)."""
+    global _control
+    with _control_lock:
+        if _control is None:
+            _control = Control()
+        return _control
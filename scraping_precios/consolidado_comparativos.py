@@ -1,30 +0,0 @@
-productos = {
-  "MONDELEZ OREO D.R. 118GR 3U 354G PQ AGR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201735258", "cod_dia": "271630", "cod_coope": "290325", "psp": "2500"},
-  "BAGLEY SONRISAS FRAM DL RELLE 108GR PACK X3 U 324 G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SONRISAS", "ean": "7790040133471", "cod_dia": "272210", "cod_coope": "282668", "psp": "2500"},
-  "MONDELEZ OREO D.R. 118GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201735296", "cod_dia": "271629", "cod_coope": "290324", "psp": "2500"},
-  "BAGLEY SONRISAS DR 108 GRS PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SONRISAS", "ean": "7790040133488", "cod_dia": "275784", "cod_coope": "NO ENCONTRADO",},
-  "MONDELEZ TERRABUSI MELBA DUL.RELLE. 120 GRPAQUETE": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELBA", "ean": "7622300829728", "cod_dia": "73264", "cod_coope": "219280", "psp": "2500"},
-  "LIA MACUCAS GALL DUL RELL 110GR PAQ SPL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MACUCAS", "ean": "7790040145337", "cod_dia": "272217", "cod_coope": "313301", "psp": "2500"},
-  "TERRABUSI LINCOLN CLASICA. D.S. 3U 153GR PQ AGR 459G": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201745547", "cod_dia": "170177", "cod_coope": "219298", "psp": "2500"},
-  "ARCOR MANA VAIN DUL.SEC. 136GR PAQ 3U 408G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040137844", "cod_dia": "12760", "cod_coope": "291904", "psp": "2500"},
-  "MONDELEZ CEREALITA CLASICA INT 212GR PAQ 3U 636G": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201745905", "cod_dia": "147685", "cod_coope": "296346", "psp": "2500"},
-  "ARCOR HOGARENAS SALVADO CEREAL 200 G.C/U PAQ.X 3 UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040132955", "cod_dia": "271959", "cod_coope": "282355", "psp": "2500"},
-  "MONDELEZ CEREALITA CLASICAS INTEG 212GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201736033", "cod_dia": "147689", "cod_coope": "296345", "psp": "2500"},
-  "ARCOR HOGARENAS SALVADO CEREAL 200 GRS. PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040132962", "cod_dia": "307603", "cod_coope": "282354", "psp": "2500"},
-  "TERRABUSI ALFAJOR 50 GRPAQ. X6 U.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "7622300742584", "cod_dia":"NO ENCONTRADO", "cod_coope": "186009", "psp": "2500"},
-  "TOFI ALFAJOR NEGRO 46 GRPAQ.X6 U.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TOFI", "ean": "7790040117143", "cod_dia":"NO ENCONTRADO", "cod_coope":"NO ENCONTRADO",},
-  "SHOT BLOQUE TAB.SOLIDA 35 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SHOT", "ean": "77914217", "cod_dia": "110388", "cod_coope": "232463", "psp": "2500"},
-  "COFLER BLOCK C/MANI TAB.SOLIDA 38 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "77953124", "cod_dia":"NO ENCONTRADO", "cod_coope":"NO ENCONTRADO",},
-  "MILKA ALMENDRA TABLETA RELLENA 55 GR PAQ.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210745620", "cod_dia": "249905", "cod_coope": "271351", "psp": "2500"},
-  "COFLER C/LECHE Y ALMENDRAS TAB.SOLIDA 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580033507", "cod_dia":"NO ENCONTRADO", "cod_coope": "243774", "psp": "2500"},
-  "MILKA CHOCO PAUSE OBLEA BAN.CHO.C/LEC.RELL.45 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "MILKA CHOCO PAUSE", "ean": "7622201492717", "cod_dia":"278032", "cod_coope": "257094", "psp": "2500"},
-  "COFLER GRAFFITI OBLEA BAN.RELLENA C/CHO. 45 GRPAQ.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GRAFFITI", "ean": "7790580111755", "cod_dia":"NO ENCONTRADO", "cod_coope": "266486", "psp": "2500"},
-  "MILKA OREO BOMBON 19G BOLSA 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "MILKA", "ean": "77971630", "cod_dia": "272322", "cod_coope": "282560", "psp": "2500"},
-  "BON O BON BOMBON REGULAR 15 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "77958921", "cod_dia": "17930", "cod_coope": "243966", "psp": "2500"},
-  "TANG POLVO REG NARANJA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201705961", "cod_dia": "274179", "cod_coope": "294290", "psp": "2500"},
-  "ARCOR POLVO NARANJA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143237", "cod_dia": "305566", "cod_coope": "314372", "psp": "2500"},
-  "CLIGHT POLVO S/A NARANJA VIT CY D SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703110", "cod_dia": "274217", "cod_coope": "293972", "psp": "2500"},
-  "BC LA CAMPAGNOLA SIN AZU NARANJA SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580132774", "cod_dia": "305694", "cod_coope": "286544", "psp": "2500"},
-  "BELDENT MENTA S/AZ. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969071", "cod_dia": "269580", "cod_coope": "282568", "psp": "2500"},
-  "TOP LINE S/AZUCAR SEVEN 14 GR XPLO.MINT 7 TABL.PAQ": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77931764", "cod_dia":"NO ENCONTRADO", "cod_coope": "228534", "psp": "2500"},
-}
@@ -0,0 +1,273 @@
+# corrida.py
+# Piezas comunes de los relevamientos sin interfaz (relevamiento.py, dinamicas.py, mercado.py).
+#
+# La lógica de cada cadena vive en esos módulos; las páginas de Streamlit y run.py (CLI)
+# solo arman las Opciones, llaman a relevar() y muestran la Corrida que vuelve:
+#   - filas en el orden del catálogo y sus columnas
+#   - notas: resúmenes de la corrida (emoji, texto) → st.caption en la app, stderr en la CLI
+#   - avisos, traza de requests (debug) y filas reusadas del historial
+
+import importlib
+import json
+import os
+import threading
+import time
+import unicodedata
+from datetime import datetime
+
+import pandas as pd
+
+import cache_http
+import catalogo
+import concurrencia
+import historial
+import metricas
+import motor
+import reintentos
+import vtex
+
+# Claves de cadena para la CLI y los despachos de cada módulo
+CADENAS = ("carrefour", "dia", "changomas", "coto", "jumbo", "vea", "cooperativa", "hiperlibertad")
+
+ALIAS = {
+    "chango": "changomas",
+    "masonline": "changomas",
+    "coope": "cooperativa",
+    "cooperativaobrera": "cooperativa",
+    "hiper": "hiperlibertad",
+    "libertad": "hiperlibertad",
+}
+
+# Columna que marca las filas tomadas del historial (refresco incremental): cuándo se observó el
+# precio. Vacía en las relevadas en esta corrida; solo aparece si la corrida reusó alguna fila.
+OBSERVADO = "Observado"
+
+
+def clave_cadena(nombre: str) -> str:
+    """'Día' / 'ChangoMás' / 'hiper' -> 'dia' / 'changomas' / 'hiperlibertad'."""
+    s = unicodedata.normalize("NFKD", str(nombre or "")).encode("ascii", "ignore").decode()
+    s = s.lower().replace(" ", "").replace("_", "").replace("-", "")
+    s = ALIAS.get(s, s)
+    if s not in CADENAS:
+        raise ValueError(f"Cadena desconocida: {nombre!r} (opciones: {', '.join(CADENAS)})")
+    return s
+
+
+def format_ar_price_no_thousands(value):
+    """1795.0 -> '1795,00' (sin separador de miles)."""
+    if value is None:
+        return None
+    return f"{float(value):,.2f}".replace(",", "X").replace(".", ",").replace("X", "")
+
+
+def cargar_catalogo(nombre: str) -> dict:
+    """
+    Catálogo {"Nombre": {"ean": ..., ...}}: una lista del catálogo único (coto, relevamiento, ...;
+    también los nombres de módulo de antes), un archivo .json con ese formato o un módulo con `productos`.
+    """
+    if nombre.endswith(".json") or os.path.sep in nombre:
+        with open(nombre, encoding="utf-8") as f:
+            return json.load(f)
+    cat = catalogo.compartido()
+    if cat.tiene(nombre):
+        return cat.vista(nombre)
+    return importlib.import_module(nombre).productos
+
+
+class Opciones:
+    """Parámetros de una corrida (los mismos que el sidebar / los inputs de cada pestaña)."""
+
+    def __init__(
+        self,
+        concurrencia: int = motor.DEFAULT_CONCURRENCIA,
+        lotes: dict = None,
+        completo: bool = False,
+        forzar_descarga: bool = cache_http.BYPASS_ENV,
+        guardar_historial: bool = True,
+        sucursal: str = "200",
+        sc: str = "1",
+        vtex_segment: str = None,
+        try_4x2: bool = True,
+        debug: bool = False,
+        memos: dict = None,
+    ):
+        self.concurrencia = concurrencia
+        self.lotes = dict(lotes or {})
+        self.completo = completo
+        self.forzar_descarga = forzar_descarga
+        self.guardar_historial = guardar_historial
+        self.sucursal = str(sucursal or "200").strip()
+        self.sc = str(sc or "1").strip()
+        self.vtex_segment = vtex_segment
+        self.try_4x2 = try_4x2
+        self.debug = debug
+        # Memos entre corridas (en la app: st.session_state, con su botón de limpiar)
+        self.memos = memos if memos is not None else {}
+
+    def clave(self) -> tuple:
+        """Lo que cambia el resultado de la corrida (sin los memos): dos corridas con la misma clave son la misma."""
+        return (
+            self.concurrencia, tuple(sorted(self.lotes.items())), self.completo, self.forzar_descarga,
+            self.guardar_historial, self.sucursal, self.sc, self.vtex_segment, self.try_4x2, self.debug,
+        )
+
+    def lote(self, cadena: str) -> int:
+        return int(self.lotes.get(cadena) or vtex.LOTE_DEFAULT[cadena])
+
+    def memo(self, nombre: str) -> dict:
+        return self.memos.setdefault(nombre, {})
+
+
+class Corrida:
+    """Resultado de relevar una cadena (o el mercado) con lo necesario para mostrarlo."""
+
+    def __init__(self, pagina: str, cadena: str, columnas, op: Opciones):
+        self.pagina = pagina
+        self.cadena = cadena
+        self.columnas = list(columnas)
+        self.op = op
+        self.filas = []
+        self.notas = []      # (emoji, texto)
+        self.avisos = []
+        self.reusados = []   # filas tomadas del historial (refresco incremental)
+        self.urls = []       # Coto: detalle consultado por EAN (debug)
+        self.traza = []      # requests hechos (debug)
+        self.detalle = {}    # extras de la cadena (preflight de Coto, columnas de cadenas en Mercado, ...)
+        self.segundos = 0.0
+        self._tabla = None   # (clave de las filas, tabla tipada) de tabla()
+        self._lock = threading.Lock()
+        self._t0 = time.perf_counter()
+
+        # Cache HTTP de catálogo compartido; la marca resume solo esta corrida (la descarga forzada
+        # es de la corrida: la abre relevar() con cache_http.descarga())
+        self._cache_web = cache_http.compartido()
+        self._marca_http = self._cache_web.marca()
+        # Ventanas AIMD por host: la marca resume cómo se movieron durante esta corrida
+        self._control = concurrencia.compartido()
+        self._marca_ventanas = self._control.marca()
+        # Presupuesto de reintentos y métricas de requests de la corrida (los abre relevar())
+        self._reintentos = reintentos.actual()
+        self._metricas = metricas.actual()
+        self.metricas = []   # resumen por (cadena, tipo de endpoint): metricas.Registro.resumen()
+
+    def nota(self, emoji: str, texto: str):
+        self.notas.append((emoji, texto))
+
+    def log(self, texto: str):
+        """Traza de requests; solo se junta con debug (los fetchers corren en threads del motor)."""
+        if self.op.debug:
+            with self._lock:
+                self.traza.append(texto)
+
+    def tiempo(self, n: int):
+        """⏱️ + 🎚️ + 🔁 + 📡 + 🌐: se llama al terminar las requests de la cadena."""
+        self.segundos = time.perf_counter() - self._t0
+        self.nota("⏱️", f"{self.cadena}: {n} productos en {self.segundos:.1f}s (concurrencia inicial {self.op.concurrencia})")
+        ventanas = self._control.resumen(self._marca_ventanas)
+        if ventanas:
+            self.nota("🎚️", ventanas)
+        for evento in self._control.eventos(self._marca_ventanas):
+            self.log(f"[concurrencia] {evento}")
+        resumen = self._reintentos.resumen() if self._reintentos is not None else ""
+        if resumen:
+            self.nota("🔁", resumen)
+        if self._metricas is not None and self._metricas.requests:
+            self.metricas = self._metricas.resumen()
+            self.nota("📡", self._metricas.nota())
+            self._guardar_metricas()
+        self.nota("🌐", self._cache_web.resumen(self._marca_http, self.op.forzar_descarga))
+
+    def _guardar_metricas(self):
+        """JSON del resumen de requests en metricas.METRICAS_DIR (lo lee la barra lateral de app.py)."""
+        if not self.op.guardar_historial:
+            return
+        try:
+            metricas.guardar(metricas.documento(self.pagina, self.cadena, self.metricas, self.segundos))
+        except OSError as e:
+            self.avisos.append(f"⚠️ No se pudieron guardar las métricas de requests: {e}")
+
+    def df(self) -> pd.DataFrame:
+        return pd.DataFrame(self.filas, columns=self.columnas)
+
+    def tabla(self) -> pd.DataFrame:
+        """Relevamiento / Dinámicas: las filas con el esquema tipado de resultados.py (se arma una vez)."""
+        import resultados
+
+        clave = (id(self.filas), len(self.filas))
+        if self._tabla is None or self._tabla[0] != clave:
+            self._tabla = (clave, resultados.tabla(self.filas, self.columnas, self.cadena))
+        return self._tabla[1]
+
+    def vista(self) -> pd.DataFrame:
+        """La tabla tipada con el formato de la página (lo que se muestra y se descarga)."""
+        import resultados
+
+        return resultados.vista(self.tabla(), self.columnas)
+
+    # --------------------------------------------
+    # Historial
+    # --------------------------------------------
+    def guardar_historial(self, cadena: str, filas, lista: str, oferta: str = None, ubicacion: str = ""):
+        """Guarda lo relevado en el historial de precios (una transacción por corrida)."""
+        if not self.op.guardar_historial:
+            return
+        hist = historial.compartido()
+        hist.registrar(
+            self.pagina,
+            (
+                historial.observacion(
+                    cadena,
+                    f.get("EAN"),
+                    lista=f.get(lista),
+                    oferta=f.get(oferta) if oferta else None,
+                    ubicacion=ubicacion,
+                    estado=f.get("estado"),
+                )
+                for f in filas
+            ),
+        )
+        self.nota("🗄️", hist.resumen())
+
+    def separar_incremental(self, cadena: str, items, ubicacion: str = "", ean_de=None) -> dict:
+        """
+        Separa los (nombre, datos) del catálogo en pendientes (a relevar) y reusables del
+        historial. Devuelve un plan para combinar_incremental().
+        """
+        ean_de = ean_de or (lambda nombre, datos: (datos or {}).get("ean"))
+        items = list(items)
+        refresco = historial.Refresco(historial.compartido(), self.pagina, completo=self.op.completo)
+        reusados = {}
+        for i, item in enumerate(items):
+            obs = refresco.reusar(cadena, str(ean_de(*item) or "").strip(), ubicacion)
+            if obs is not None:
+                reusados[i] = obs
+        pendientes = [it for i, it in enumerate(items) if i not in reusados]
+        return {"items": items, "pendientes": pendientes, "reusados": reusados, "refresco": refresco}
+
+    def combinar_incremental(self, plan: dict, nuevas: list, fila_base, lista: str) -> list:
+        """
+        Vuelve a armar las filas en el orden original: relevadas + reusadas (fila_base con el último
+        precio). Si hubo reusadas, la columna OBSERVADO dice de cuándo es cada una.
+        """
+        import resultados
+
+        marcar = bool(plan["reusados"])
+        if marcar and OBSERVADO not in self.columnas:
+            self.columnas.append(OBSERVADO)
+        nuevas = iter(nuevas)
+        filas = []
+        for i, item in enumerate(plan["items"]):
+            obs = plan["reusados"].get(i)
+            if obs is None:
+                fila = next(nuevas)
+                if marcar:
+                    fila[OBSERVADO] = ""
+                filas.append(fila)
+                continue
+            fila = fila_base(*item)
+            fila.update(resultados.celdas(obs["precio_lista"], columna=lista))
+            fila[OBSERVADO] = datetime.fromtimestamp(obs["ts"]).strftime("%Y-%m-%d %H:%M")
+            filas.append(fila)
+            self.reusados.append({"EAN": fila.get("EAN"), "Nombre": item[0], lista: fila[lista], OBSERVADO: fila[OBSERVADO]})
+        self.nota("♻️", plan["refresco"].resumen())
+        return filas
@@ -0,0 +1,266 @@
+# coto.py
+# Cliente HTTP de Coto Digital con bootstrap de cookies compartido.
+#
+# Coto responde 403 sin las cookies que setea la home. En vez de pedir la home antes
+# de cada producto, el cliente la pide una vez por corrida (por sucursal), guarda el
+# cookie jar en disco con vencimiento y solo vuelve a hacer bootstrap si las cookies
+# vencieron o si una request devuelve 403.
+
+import json
+import os
+import tempfile
+import threading
+import time
+
+import requests
+
+import reintentos
+from resolucion import CACHE_DIR
+
+BASE = "https://www.cotodigital.com.ar"
+
+HEADERS_COTO = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+    "Accept": "application/json,text/plain,*/*",
+    "Accept-Language": "es-AR,es;q=0.9,en;q=0.8",
+    "Connection": "keep-alive",
+    "DNT": "1",
+    "Referer": BASE + "/",
+    "Origin": BASE,
+}
+
+# Claves que leen las páginas de las respuestas Endeca (búsqueda y detalle)
+CLAVES_RECORD = ("record.id", "product.repositoryId", "product.displayName", "product.eanPrincipal")
+CLAVES_PRECIO = ("sku.activePrice", "activePrice", "sku.price", "sku.listPrice", "price", "listPrice")
+CLAVES = CLAVES_RECORD + CLAVES_PRECIO + ("record.title", "product.dtoDescuentos")
+# Con estas el detalle de un producto ya está resuelto (IndiceEndeca(..., hasta=CLAVES_DETALLE))
+CLAVES_DETALLE = ("product.eanPrincipal", "product.displayName", "sku.activePrice")
+
+# Vida máxima del jar aunque las cookies no traigan expires
+COOKIES_TTL = 6 * 3600
+
+
+def jar_path(sucursal: str) -> str:
+    return os.path.join(CACHE_DIR, f"coto_cookies_{str(sucursal or '').strip() or 'default'}.json")
+
+
+def coerce_first(x):
+    return (x[0] if isinstance(x, list) and x else x)
+
+
+class _Corte(Exception):
+    pass
+
+
+class IndiceEndeca:
+    """
+    Recorre una respuesta Endeca una sola vez y junta las CLAVES en un índice:
+    - documento: primera aparición de cada clave en todo el JSON
+    - records: un dict por record (nodo con alguna de CLAVES_RECORD), en orden de aparición,
+      con la primera aparición de cada clave dentro de su subárbol
+    Mismo resultado que find_key_recursive(data, k) / iter_records(data), sin re-recorrer
+    el payload por cada clave y por cada record.
+
+    El recorrido corta apenas tiene lo pedido y solo se completa si después hace falta más:
+    - hasta: claves del documento con las que alcanza (detalle de un producto)
+    - ean: record buscado (búsqueda por EAN); corta al cerrar el record que lo contiene
+    """
+
+    def __init__(self, data, claves=CLAVES, hasta=None, ean=None):
+        self.claves = frozenset(claves)
+        self._data = data
+        self._hasta = frozenset(hasta) if hasta else None
+        self._ean = str(ean) if ean is not None else None
+        self._completo = False
+        self._recorrer()
+
+    def _recorrer(self):
+        documento = {}
+        records = []
+        claves = self.claves
+        n_claves = len(claves)
+        hasta = self._hasta
+        faltan = len(hasta) if hasta else -1
+        ean = self._ean
+        revisados = 0
+
+        def visitar(node, abiertos):
+            nonlocal faltan, revisados
+            if isinstance(node, dict):
+                rec = None
+                for k in CLAVES_RECORD:
+                    if k in node:
+                        rec = {}
+                        records.append(rec)
+                        abiertos = abiertos + (rec,)
+                        break
+                # Se itera el lado más chico: dicts de atributos grandes vs. nodos de 2-3 claves
+                presentes = claves.intersection(node) if len(node) > n_claves else [k for k in node if k in claves]
+                for k in presentes:
+                    v = node[k]
+                    if v is None:
+                        continue
+                    for idx in abiertos:
+                        if k not in idx:
+                            idx[k] = v
+                            if idx is documento and hasta is not None and k in hasta:
+                                faltan -= 1
+                                if not faltan:
+                                    raise _Corte
+                for v in node.values():
+                    if isinstance(v, (dict, list)):
+                        visitar(v, abiertos)
+                # Record de primer nivel cerrado: todos los anteriores ya están completos
+                if rec is not None and ean is not None and len(abiertos) == 2:
+                    for r in records[revisados:]:
+                        if str(coerce_first(r.get("product.eanPrincipal"))) == ean:
+                            raise _Corte
+                    revisados = len(records)
+            else:
+                for v in node:
+                    if isinstance(v, (dict, list)):
+                        visitar(v, abiertos)
+
+        try:
+            visitar(self._data, (documento,))
+            self._completo = True
+        except _Corte:
+            pass
+        self.documento = documento
+        self._records = records
+
+    def _completar(self):
+        if not self._completo:
+            self._hasta = None
+            self._ean = None
+            self._recorrer()
+
+    @property
+    def records(self) -> list:
+        self._completar()
+        return self._records
+
+    def valor(self, clave: str, rec: dict = None):
+        """Primer valor (coerce_first) de la clave en el record o en todo el documento."""
+        if rec is not None:
+            return coerce_first(rec.get(clave))
+        if clave not in self.documento:
+            self._completar()
+        return coerce_first(self.documento.get(clave))
+
+    def record_por_ean(self, ean: str):
+        """Primer record cuyo product.eanPrincipal es `ean` (o None)."""
+        for rec in self._records:
+            if str(coerce_first(rec.get("product.eanPrincipal"))) == str(ean):
+                return rec
+        if self._completo:
+            return None
+        self._completar()
+        return self.record_por_ean(ean)
+
+    def precio(self, cast):
+        """sku.activePrice y, si no castea, los fallbacks de CLAVES_PRECIO en orden."""
+        for k in CLAVES_PRECIO:
+            p = cast(self.valor(k))
+            if p is not None:
+                return p
+        return None
+
+
+class CotoClient:
+    """
+    get(url, **kw) como session.get, con cookies de Coto garantizadas:
+    - primero intenta el jar en disco (si no venció)
+    - si no hay, bootstrap (GET a la home) una sola vez, aunque lo pidan varios threads
+    - ante un 403, re-bootstrap y reintenta una vez (el 403 recuperado no es un fallo de la corrida)
+    """
+
+    def __init__(self, session: requests.Session, sucursal: str = "200", timeout=(4, 18), ttl: float = COOKIES_TTL):
+        self.session = session
+        self.sucursal = str(sucursal or "").strip()
+        self.timeout = timeout
+        self.ttl = ttl
+        self.path = jar_path(self.sucursal)
+
+        self._lock = threading.Lock()
+        self._generacion = 0
+        self._expira = 0.0
+        self.bootstraps = 0
+        self.desde_disco = False
+        self.reintentos_403 = 0
+
+        self._cargar_jar()
+
+    # --------------------------------------------
+    # Cookie jar en disco
+    # --------------------------------------------
+    def _cargar_jar(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        expira = float(data.get("expira") or 0)
+        if expira <= time.time():
+            return
+        for c in data.get("cookies") or []:
+            self.session.cookies.set(c["name"], c["value"], domain=c.get("domain", ""), path=c.get("path", "/"))
+        self._expira = expira
+        self.desde_disco = True
+
+    def _guardar_jar(self):
+        ahora = time.time()
+        cookies = []
+        expira = ahora + self.ttl
+        for c in self.session.cookies:
+            if "cotodigital" not in (c.domain or ""):
+                continue
+            cookies.append({"name": c.name, "value": c.value, "domain": c.domain, "path": c.path})
+            if c.expires:
+                expira = min(expira, float(c.expires))
+        self._expira = expira
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"expira": expira, "cookies": cookies}, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+    # --------------------------------------------
+    # Bootstrap
+    # --------------------------------------------
+    def _bootstrap(self, generacion_vista: int):
+        with self._lock:
+            # Otro thread ya lo hizo mientras esperábamos
+            if self._generacion != generacion_vista and self._expira > time.time():
+                return
+            try:
+                self.session.get(BASE + "/", headers=HEADERS_COTO, timeout=self.timeout)
+            except requests.RequestException:
+                pass
+            self.bootstraps += 1
+            self._generacion += 1
+            self._guardar_jar()
+
+    def get(self, url: str, **kw):
+        kw.setdefault("timeout", self.timeout)
+        gen = self._generacion
+        if self._expira <= time.time():
+            self._bootstrap(gen)
+            gen = self._generacion
+
+        # El 403 se recupera acá (re-bootstrap): solo cuenta como fallo si el reintento también falla
+        with reintentos.recuperable(403):
+            r = self.session.get(url, **kw)
+        if r.status_code == 403:
+            with self._lock:
+                self.reintentos_403 += 1
+            self._bootstrap(gen)
+            r = self.session.get(url, **kw)
+        return r
+
+    def resumen(self) -> str:
+        origen = "cookies de disco" if self.desde_disco else "sin cookies previas"
+        return f"Coto: {self.bootstraps} bootstrap(s) ({origen}) · {self.reintentos_403} reintentos por 403"
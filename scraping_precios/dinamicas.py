@@ -0,0 +1,1861 @@
+# dinamicas.py
+# Dinámicas comerciales por cadena (página 2_Dinamicas): ListPrice + Oferta, sin Streamlit.
+#
+#   corrida = dinamicas.relevar("coto", op=Opciones(sucursal="200"))
+#   corrida.df()  # Empresa, Categoría, Subcategoría, Marca, Nombre, EAN, ListPrice, Oferta
+#
+# Cada cadena lee su lista del catálogo (catalogo.py: carrefour, coto, ...) salvo que se pase otra
+# catálogo. Las ofertas dependen de la corrida (checkout, promos), así que se releva todo.
+
+import json
+import re
+from urllib.parse import urljoin
+
+import requests
+
+import cache_http
+import coto
+import metricas
+import motor
+import reintentos
+import resolucion
+import vtex
+from corrida import Corrida, Opciones, cargar_catalogo, clave_cadena
+from resultados import REVISAR, SIN_PRECIO, celdas
+
+PAGINA = "Dinámicas"
+COLUMNAS = ["Empresa", "Categoría", "Subcategoría", "Marca", "Nombre", "EAN", "ListPrice", "Oferta"]
+
+# Listado por cadena: {"Nombre": {"empresa", "categoría", "subcategoría", "marca", "ean", ...}}
+CATALOGOS = {
+    "carrefour": "carrefour",
+    "dia": "dia",
+    "changomas": "chango",
+    "coto": "coto",
+    "jumbo": "cencosud",
+    "vea": "cencosud",
+    "cooperativa": "cooperativa",
+    "hiperlibertad": "libertad",
+}
+
+
+# ============================================
+# Utilidades comunes
+# ============================================
+def celdas_lista(precio=None, estado: str = None) -> dict:
+    """ListPrice (float o NaN) con su estado / motivo, como lo lee resultados.tabla()."""
+    return celdas(precio, estado, columna="ListPrice")
+
+
+def fila_base(nombre: str, datos: dict, oferta="", precio=None, estado: str = None) -> dict:
+    """Fila con los metadatos del listado y los valores por defecto de ListPrice / Oferta."""
+    datos = datos or {}
+    return {
+        "Empresa": str(datos.get("empresa") or "").strip(),
+        "Categoría": str(datos.get("categoría") or "").strip(),
+        "Subcategoría": str(datos.get("subcategoría") or "").strip(),
+        "Marca": str(datos.get("marca") or "").strip(),
+        "Nombre": nombre,
+        "EAN": str(datos.get("ean") or "").strip(),
+        **celdas_lista(precio, estado),
+        "Oferta": oferta,
+    }
+
+
+def _progreso(on_progress, total: int):
+    """
+    Devuelve tick() que avisa done/total a on_progress (si hay). Cada tick también corta
+    la corrida si se canceló (los loops secuenciales no pasan por motor.run_jobs).
+    """
+    estado = {"done": 0}
+
+    def tick():
+        motor.chequear_cancelacion()
+        estado["done"] += 1
+        if on_progress is not None:
+            on_progress(estado["done"], total)
+
+    return tick
+
+
+def _safe_float(x, default=0.0) -> float:
+    try:
+        if x is None:
+            return float(default)
+        return float(x)
+    except Exception:
+        return float(default)
+
+
+def _safe_int(x, default=0):
+    try:
+        return int(x)
+    except Exception:
+        return default
+
+
+def pick_item_by_ean(items: list, ean: str):
+    """Selecciona item que matchee por item.ean o por referenceId.Value; fallback: primero."""
+    ean = str(ean).strip()
+    for it in items or []:
+        if str(it.get("ean") or "").strip() == ean:
+            return it
+        for ref in (it.get("referenceId") or []):
+            if str(ref.get("Value") or "").strip() == ean:
+                return it
+    return items[0] if items else None
+
+
+# ============================================
+# 🛒 Carrefour (por EAN) — ListPrice + Oferta
+# ============================================
+COOKIE_SEGMENT_CARR = (
+    "eyJjYW1wYWlnbnMiOm51bGwsImNoYW5uZWwiOiIxIiwicHJpY2VUYWJsZXMiOm51bGwsInJlZ2lvbklkIjpudWxsLCJ1dG1fY2FtcGFpZ24iOm51bGws"
+    "InV0bV9zb3VyY2UiOm51bGwsInV0bWlfY2FtcGFpZ24iOm51bGwsImN1cnJlbmN5Q29kZSI6IkFSUyIsImN1cnJlbmN5U3ltYm9sIjoiJCIsImNvdW50"
+    "cnlDb2RlIjoiQVJHIiwiY3VsdHVyZUluZm8iOiJlcy1BUiIsImFkbWluX2N1dHR1cmVJbmZvIjoiZXMtQVIiLCJjaGFubmVsUHJpdmFjeSI6InB1YmxpYyJ9"
+)
+HEADERS_CARR = {
+    "User-Agent": "Mozilla/5.0",
+    "Cookie": f"vtex_segment={COOKIE_SEGMENT_CARR}",
+    "Accept": "application/json,text/plain,*/*",
+}
+
+
+def _has_tarjeta_carrefour(commertial_offer: dict) -> bool:
+    """Detecta promo 'Tarjeta Carrefour 15%' (case-insensitive)."""
+    teasers = commertial_offer.get("PromotionTeasers") or []
+    for t in teasers:
+        name = (t or {}).get("Name") or ""
+        if "tarjeta carrefour" in name.lower():
+            return True
+    return False
+
+
+def _extract_teaser_text(commertial_offer: dict) -> str:
+    """
+    'PROMO-2do al 70% Max 8 unidades ...' -> '2do al 70%'
+    """
+    teasers = commertial_offer.get("PromotionTeasers") or []
+    if not teasers:
+        return ""
+
+    raw = str((teasers[0] or {}).get("Name") or "").strip()
+    raw_l = raw.lower()
+
+    promo_key = "promo-"
+    max_key = " max"
+
+    i = raw_l.find(promo_key)
+    if i >= 0:
+        start = i + len(promo_key)
+        j = raw_l.find(max_key, start)
+        if j > start:
+            return raw[start:j].strip()
+
+    return raw
+
+
+def buscar_carrefour(session: requests.Session, ean: str):
+    url = f"https://www.carrefour.com.ar/api/catalog_system/pub/products/search?fq=alternateIds_Ean:{ean}"
+    r = session.get(url, headers=HEADERS_CARR, timeout=12)
+    return r.json()
+
+
+def _carrefour(productos: dict, op: Opciones, on_progress=None) -> Corrida:
+    corrida = Corrida(PAGINA, "Carrefour", COLUMNAS, op)
+    s_carr = motor.build_session(op.concurrencia)
+    lote_carr = vtex.VtexBatchLookup(
+        s_carr,
+        "https://www.carrefour.com.ar",
+        single=lambda e: buscar_carrefour(s_carr, e),
+        headers=HEADERS_CARR,
+        batch_size=op.lote("Carrefour"),
+        timeout=12,
+    ).prefetch((d.get("ean") for d in productos.values()), op.concurrencia)
+
+    resultados = []
+    tick = _progreso(on_progress, len(productos))
+
+    for nombre_base, datos in productos.items():
+        row_base = fila_base(nombre_base, datos, "Revisar", estado=REVISAR)
+        ean = row_base["EAN"]
+        tick()
+
+        try:
+            if not ean:
+                resultados.append(row_base)
+                continue
+
+            data = lote_carr.lookup(ean)
+
+            if not data:
+                resultados.append(row_base)
+                continue
+
+            prod = data[0]
+            item_sel = pick_item_by_ean(prod.get("items") or [], ean)
+
+            if not item_sel or not item_sel.get("sellers"):
+                resultados.append(row_base)
+                continue
+
+            offer = item_sel["sellers"][0].get("commertialOffer", {})
+
+            # 🚨 REGLA PRIORITARIA: Tarjeta Carrefour
+            if _has_tarjeta_carrefour(offer):
+                resultados.append({
+                    **row_base,
+                    "Nombre": prod.get("productName") or nombre_base,
+                    **celdas_lista(estado=SIN_PRECIO),
+                    "Oferta": "Sin Precio",
+                })
+                continue
+
+            list_price = _safe_float(offer.get("ListPrice"), 0)
+            price = _safe_float(offer.get("Price"), 0)
+
+            # Lógica de Oferta: el precio (float) o el texto del teaser
+            if price > 0 and list_price > 0 and price != list_price:
+                oferta = price
+            else:
+                oferta = _extract_teaser_text(offer)
+
+            if list_price <= 0 and not oferta:
+                resultados.append(row_base)
+                continue
+
+            resultados.append({
+                **row_base,
+                "Nombre": prod.get("productName") or nombre_base,
+                **(celdas_lista(list_price) if list_price > 0 else celdas_lista(estado=REVISAR)),
+                "Oferta": oferta if oferta else "",
+            })
+
+        except Exception:
+            resultados.append(row_base)
+
+    corrida.filas = resultados
+    corrida.tiempo(len(productos))
+    corrida.nota("📦", lote_carr.resumen())
+    corrida.guardar_historial("Carrefour", resultados, lista="ListPrice", oferta="Oferta")
+    return corrida
+
+
+# ============================================
+# 🟥 Día (VTEX) — ListPrice + Oferta (Price vs PromotionTeasers)
+# ============================================
+HEADERS_DIA = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept": "application/json,text/plain,*/*",
+}
+
+
+def _get_offer_teasers(commertial_offer: dict) -> str:
+    """Devuelve los nombres de PromotionTeasers (si existen) en un string."""
+    teasers = commertial_offer.get("PromotionTeasers") or []
+    names = []
+    for t in teasers:
+        n = (t or {}).get("Name")
+        if n:
+            names.append(str(n).strip())
+    return " | ".join(names)
+
+
+def buscar_dia(session: requests.Session, cod_dia: str):
+    url = (
+        "https://diaonline.supermercadosdia.com.ar/"
+        f"api/catalog_system/pub/products/search?fq=skuId:{cod_dia}"
+    )
+    r = session.get(url, headers=HEADERS_DIA, timeout=12)
+    r.raise_for_status()
+    return r.json()
+
+
+def _dia(productos: dict, op: Opciones, on_progress=None) -> Corrida:
+    corrida = Corrida(PAGINA, "Día", COLUMNAS, op)
+    s_dia = motor.build_session(op.concurrencia)
+    lote_dia = vtex.VtexBatchLookup(
+        s_dia,
+        "https://diaonline.supermercadosdia.com.ar",
+        single=lambda cod: buscar_dia(s_dia, cod),
+        headers=HEADERS_DIA,
+        field="skuId",
+        batch_size=op.lote("Día"),
+        timeout=12,
+    ).prefetch((d.get("cod_dia") for d in productos.values()), op.concurrencia)
+
+    resultados = []
+    tick = _progreso(on_progress, len(productos))
+
+    for nombre, datos in productos.items():
+        cod_dia = str(datos.get("cod_dia") or "").strip()
+
+        # Base row (fallback ante fallas)
+        row = fila_base(nombre, datos, "Revisar", precio=0)
+        tick()
+
+        try:
+            if not cod_dia:
+                resultados.append(row)
+                continue
+
+            # VTEX search por skuId (cod_dia), en lote; se mapea de vuelta por itemId
+            data = lote_dia.lookup(cod_dia)
+
+            if not data:
+                resultados.append(row)
+                continue
+
+            prod = data[0]
+            items = prod.get("items") or []
+
+            # Elegimos el item cuyo itemId == cod_dia; si no aparece, usamos el primero
+            item_sel = None
+            for it in items:
+                if str(it.get("itemId") or "").strip() == cod_dia:
+                    item_sel = it
+                    break
+            if not item_sel and items:
+                item_sel = items[0]
+
+            if not item_sel:
+                resultados.append(row)
+                continue
+
+            sellers = item_sel.get("sellers") or []
+            if not sellers:
+                resultados.append(row)
+                continue
+
+            # VTEX lo escribe así: "commertialOffer"
+            comm_offer = sellers[0].get("commertialOffer") or {}
+
+            list_price = _safe_float(comm_offer.get("ListPrice", 0), 0)
+            price = _safe_float(comm_offer.get("Price", 0), 0)
+
+            # ListPrice como float, igual que las otras cadenas
+            row.update(celdas_lista(list_price))
+
+            # ✅ LÓGICA DE OFERTA
+            # 1) Si Price != ListPrice → Oferta = Price
+            # 2) Si Price == ListPrice → Oferta = PromotionTeasers[].Name
+            # (si no hay teasers, queda vacío)
+            if price > 0 and list_price > 0 and price != list_price:
+                row["Oferta"] = price
+            else:
+                teasers_txt = _get_offer_teasers(comm_offer)
+                row["Oferta"] = teasers_txt if teasers_txt else ""
+
+            resultados.append(row)
+
+        except Exception:
+            resultados.append(row)
+
+    corrida.filas = resultados
+    corrida.tiempo(len(productos))
+    corrida.nota("📦", lote_dia.resumen())
+    corrida.guardar_historial("Día", resultados, lista="ListPrice", oferta="Oferta")
+    return corrida
+
+
+# ============================================
+# 🟢 ChangoMás (por EAN + Oferta optimizada + Cache checkout por EAN)
+# ============================================
+DEFAULT_SEGMENT_CM = (
+    "eyJjYW1wYWlnbnMiOm51bGwsImNoYW5uZWwiOiIxIiwicHJpY2VUYWJsZXMiOm51bGwsInJlZ2lvbklkIjoidjIuNDdERkY5REI3QkE5NEEyMEI1ODRGRjYzQTA3RUIxQ0EiLCJ1dG1fY2FtcGFpZ24iOm51bGwsInV0bV9zb3VyY2UiOm51bGwsInV0bWlfY2FtcGFpZ24iOm51bGwsImN1cnJlbmN5Q29kZSI6IkFSUyIsImN1cnJlbmN5U3ltYm9sIjoiJCIsImNvdW50cnlDb2RlIjoiQVJHIiwiY3VsdHVyZUluZm8iOiJlcy1BUiIsImNoYW5uZWxQcml2YWN5IjoicHVibGljIn0"
+)
+BASE_CM = "https://www.masonline.com.ar"
+TIMEOUTS_CM = (3, 20)  # (connect, read)
+MEMO_CHANGO = "chango_checkout_cache"  # {(ean, vtex_segment, sc, try_4x2): oferta_str}
+
+
+def compute_percent_off(list_price: float, price: float):
+    """Devuelve % off entero si price < list_price."""
+    try:
+        if list_price > 0 and price > 0 and price < list_price:
+            pct = round((1 - (price / list_price)) * 100)
+            return int(pct) if pct > 0 else None
+    except Exception:
+        pass
+    return None
+
+
+def simplify_offer_text(text: str) -> str:
+    """
+    Resumen:
+    - NxM (3x2, 4x2) -> '3x2'
+    - '2da/2do al XX%' -> '2da al 50%'
+    - fallback -> texto completo
+    """
+    if not text:
+        return ""
+
+    m = re.search(r"\b(\d+\s*x\s*\d+)\b", text, flags=re.IGNORECASE)
+    if m:
+        return m.group(1).replace(" ", "")
+
+    m2 = re.search(r"\b(2da|2do)\b.*?\b(al)\b.*?(\d{1,3}\s*%)", text, flags=re.IGNORECASE)
+    if m2:
+        frag = m2.group(0)
+        frag = re.split(r"\b(Reg|SURTIDO|NACIONAL|Max|LLEVANDO)\b", frag, flags=re.IGNORECASE)[0]
+        return " ".join(frag.split()).strip()
+
+    return text.strip()
+
+
+def vt_search_by_ean_cm(session: requests.Session, ean: str, sc: str, headers: dict, log=None):
+    log = log or (lambda texto: None)
+    url = f"{BASE_CM}/api/catalog_system/pub/products/search"
+
+    # 1) alternateIds_Ean
+    params = {"fq": f"alternateIds_Ean:{ean}", "sc": sc}
+    r = session.get(url, headers=headers, params=params, timeout=TIMEOUTS_CM)
+    log(f"SEARCH altEan: {r.url} | {r.status_code}")
+    r.raise_for_status()
+    data = r.json()
+    if data:
+        return data, r.url
+
+    # 2) fallback ean
+    params = {"fq": f"ean:{ean}", "sc": sc}
+    r = session.get(url, headers=headers, params=params, timeout=TIMEOUTS_CM)
+    log(f"SEARCH ean: {r.url} | {r.status_code}")
+    r.raise_for_status()
+    return r.json(), r.url
+
+
+# --------------------------------------------
+# ✅ Checkout optimizado (1 carrito + updates)
+# --------------------------------------------
+def create_orderform(session: requests.Session, headers: dict, log=None):
+    url = f"{BASE_CM}/api/checkout/pub/orderForm"
+    r = session.post(url, headers=headers, json={}, timeout=TIMEOUTS_CM)
+    if log:
+        log(f"ORDERFORM create: {r.status_code}")
+    r.raise_for_status()
+    return r.json()
+
+
+def add_item_orderform(session: requests.Session, orderform_id: str, sku_id: str, seller_id: str, qty: int, headers: dict,
+                       log=None):
+    url = f"{BASE_CM}/api/checkout/pub/orderForm/{orderform_id}/items"
+    payload = {"orderItems": [{"id": str(sku_id), "quantity": int(qty), "seller": str(seller_id)}]}
+    r = session.post(url, headers=headers, json=payload, timeout=TIMEOUTS_CM)
+    if log:
+        log(f"ORDERFORM add qty={qty}: {r.status_code}")
+    r.raise_for_status()
+    return r.json()
+
+
+def update_item_qty(session: requests.Session, orderform_id: str, index: int, qty: int, headers: dict, log=None):
+    url = f"{BASE_CM}/api/checkout/pub/orderForm/{orderform_id}/items/update"
+    payload = {"orderItems": [{"index": int(index), "quantity": int(qty)}]}
+    r = session.post(url, headers=headers, json=payload, timeout=TIMEOUTS_CM)
+    if log:
+        log(f"ORDERFORM update idx={index} qty={qty}: {r.status_code}")
+    r.raise_for_status()
+    return r.json()
+
+
+def extract_promos(of: dict):
+    rbd = (of.get("ratesAndBenefitsData") or {})
+    ids = rbd.get("rateAndBenefitsIdentifiers") or []
+    names = []
+    for x in ids:
+        if isinstance(x, dict):
+            n = x.get("name") or x.get("id") or x.get("description")
+            if n:
+                names.append(str(n).strip())
+
+    out, seen = [], set()
+    for n in names:
+        if n not in seen:
+            out.append(n)
+            seen.add(n)
+    return out
+
+
+def _probe_checkout(agregar, actualizar, sku_id: str, try_4: bool):
+    """
+    - agregar(qty=2) (detecta 2da al %)
+    - si no hay promo, actualizar(idx, qty=3) (detecta 3x2)
+    - opcional: actualizar(idx, qty=4) (detecta 4x2)
+    """
+    # 1) qty=2
+    of = agregar(2)
+    promos = extract_promos(of)
+    if promos:
+        simp = [simplify_offer_text(p) for p in promos]
+        return " | ".join(dict.fromkeys([s for s in simp if s]))
+
+    # Index del item agregado
+    items = of.get("items") or []
+    idx = 0
+    if items:
+        for i, it in enumerate(items):
+            if str(it.get("id") or "").strip() == str(sku_id):
+                idx = i
+                break
+
+    # 2) qty=3
+    of = actualizar(idx, 3)
+    promos = extract_promos(of)
+    if promos:
+        simp = [simplify_offer_text(p) for p in promos]
+        return " | ".join(dict.fromkeys([s for s in simp if s]))
+
+    # 3) qty=4
+    if try_4:
+        of = actualizar(idx, 4)
+        promos = extract_promos(of)
+        if promos:
+            simp = [simplify_offer_text(p) for p in promos]
+            return " | ".join(dict.fromkeys([s for s in simp if s]))
+
+    return ""
+
+
+def detect_offer_via_checkout_fast(session: requests.Session, sku_id: str, seller_id: str, headers: dict, try_4: bool,
+                                   pool: vtex.OrderFormPool = None, log=None):
+    """
+    Optimización:
+    - con pool: orderForm reutilizado entre productos (sin crear carrito por producto)
+    - sin pool: 1 orderForm por producto
+    """
+    if pool is not None:
+        with pool.carrito() as cart:
+            return _probe_checkout(
+                lambda qty: pool.set_item(cart, sku_id, seller_id, qty),
+                lambda idx, qty: pool.update_qty(cart, idx, qty),
+                sku_id,
+                try_4,
+            )
+
+    of0 = create_orderform(session, headers=headers, log=log)
+    of_id = of0.get("orderFormId")
+    if not of_id:
+        return ""
+    return _probe_checkout(
+        lambda qty: add_item_orderform(session, of_id, sku_id, seller_id, qty=qty, headers=headers, log=log),
+        lambda idx, qty: update_item_qty(session, of_id, index=idx, qty=qty, headers=headers, log=log),
+        sku_id,
+        try_4,
+    )
+
+
+def get_checkout_offer_cached(
+    cache: dict,
+    session: requests.Session,
+    ean: str,
+    sku_id: str,
+    seller_id: str,
+    headers: dict,
+    vtex_segment: str,
+    sc: str,
+    try_4: bool,
+    pool: vtex.OrderFormPool = None,
+    log=None,
+):
+    """Memoiza la oferta de checkout por (EAN, vtex_segment, sc, try_4x2); no cambia la lógica."""
+    key = (str(ean).strip(), str(vtex_segment), str(sc).strip(), bool(try_4))
+
+    if key in cache:
+        return cache[key]
+
+    fallos = reintentos.fallos()
+    oferta = detect_offer_via_checkout_fast(
+        session,
+        sku_id=sku_id,
+        seller_id=seller_id,
+        headers=headers,
+        try_4=try_4,
+        pool=pool,
+        log=log,
+    )
+    # El memo dura toda la sesión: lo que vino de una request fallida no se guarda
+    if reintentos.fallos() == fallos:
+        cache[key] = oferta
+    return oferta
+
+
+def _changomas(productos: dict, op: Opciones, on_progress=None) -> Corrida:
+    corrida = Corrida(PAGINA, "ChangoMás", COLUMNAS, op)
+    vtex_segment = op.vtex_segment or DEFAULT_SEGMENT_CM
+    cache = op.memo(MEMO_CHANGO)
+    s = motor.build_session(op.concurrencia)
+    headers_cm = {
+        "User-Agent": "Mozilla/5.0",
+        "Cookie": f"vtex_segment={vtex_segment}",
+        "Accept": "application/json,text/plain,*/*",
+    }
+
+    resultados = []
+    tick = _progreso(on_progress, len(productos))
+
+    sc = op.sc or "1"
+    lote_cm = vtex.VtexBatchLookup(
+        s,
+        BASE_CM,
+        single=lambda e: vt_search_by_ean_cm(s, e, sc, headers_cm, corrida.log)[0],
+        headers=headers_cm,
+        params={"sc": sc},
+        batch_size=op.lote("ChangoMás"),
+        timeout=TIMEOUTS_CM,
+    ).prefetch((d.get("ean") for d in productos.values()), op.concurrencia)
+
+    # Checkout: carritos reutilizables, uno por request en vuelo (crecen con la ventana del host)
+    pool_cm = vtex.OrderFormPool(s, BASE_CM, headers=headers_cm, timeout=TIMEOUTS_CM)
+    checkout_jobs = []  # (row, job) — se resuelven en paralelo al final
+
+    for nombre_base, datos in productos.items():
+        row = fila_base(nombre_base, datos, estado=SIN_PRECIO)
+        ean = row["EAN"]
+
+        try:
+            if not ean:
+                resultados.append(row)
+                tick()
+                continue
+
+            data = lote_cm.lookup(ean)
+            if not data:
+                resultados.append(row)
+                tick()
+                continue
+
+            prod = data[0]
+            items = prod.get("items") or []
+            item_sel = pick_item_by_ean(items, ean)
+
+            if not item_sel or not item_sel.get("sellers"):
+                resultados.append(row)
+                tick()
+                continue
+
+            # Nombre: preferimos API
+            nombre_api = (prod.get("productName") or "").strip()
+            row["Nombre"] = nombre_api if nombre_api else nombre_base
+
+            seller0 = (item_sel.get("sellers") or [{}])[0]
+            seller_id = str(seller0.get("sellerId") or "1").strip() or "1"
+            co = seller0.get("commertialOffer") or {}
+
+            list_price = float(co.get("ListPrice") or 0)
+            price = float(co.get("Price") or 0)
+
+            # ListPrice (columna pedida)
+            row.update(celdas_lista(list_price) if list_price > 0 else celdas_lista(estado=SIN_PRECIO))
+
+            # 1) Oferta por descuento unitario (% off) si Price < ListPrice
+            pct = compute_percent_off(list_price, price)
+            if pct:
+                row["Oferta"] = f"{pct}% off"
+            else:
+                # 2) Mecánicas vía checkout (optimizado + cacheado): qty=2 -> qty=3 -> opcional qty=4
+                sku_id = str(item_sel.get("itemId") or "").strip()
+                if sku_id:
+                    checkout_jobs.append((row, (
+                        motor.host_of(BASE_CM),
+                        lambda ean=ean, sku_id=sku_id, seller_id=seller_id: get_checkout_offer_cached(
+                            cache,
+                            s,
+                            ean=ean,
+                            sku_id=sku_id,
+                            seller_id=seller_id,
+                            headers=headers_cm,
+                            vtex_segment=vtex_segment,
+                            sc=sc,
+                            try_4=op.try_4x2,
+                            pool=pool_cm,
+                            log=corrida.log,
+                        ),
+                        "",
+                    )))
+
+            corrida.log(f"OK {ean} | sku={item_sel.get('itemId')}")
+
+        except Exception:
+            pass  # dejamos ListPrice = Sin Precio, Oferta vacío
+
+        resultados.append(row)
+        tick()
+
+    ofertas = motor.run_jobs([job for _, job in checkout_jobs], limite_por_host=op.concurrencia)
+    for (row, _), oferta in zip(checkout_jobs, ofertas):
+        row["Oferta"] = oferta or ""
+
+    corrida.filas = resultados
+    corrida.tiempo(len(productos))
+    corrida.nota("📦", lote_cm.resumen())
+    corrida.nota("🛒", pool_cm.resumen())
+    corrida.guardar_historial("ChangoMás", resultados, lista="ListPrice", oferta="Oferta", ubicacion=sc)
+    return corrida
+
+
+# ============================================
+# 🏷️ Coto (ListPrice + Oferta texto)
+# Oferta = textoDescuento dentro de product.dtoDescuentos
+# ============================================
+SEARCH_CATEGORIA = "/sitios/cdigi/categoria"
+DEFAULT_SUCURSAL = "200"
+
+
+def cast_price(val):
+    """Convierte distintos formatos a float. Soporta '1.795,00', '1126.72', '$1126.72c/u', etc."""
+    if val is None:
+        return None
+    if isinstance(val, (int, float)):
+        return float(val)
+
+    s = str(val).strip()
+    if not s:
+        return None
+
+    s = s.replace("c/u", "").replace("c\\u002fu", "")
+    s = re.sub(r"[^\d\.,-]", "", s)  # deja solo dígitos y separadores
+    if not s:
+        return None
+
+    # Caso AR típico: '1.795,00' (miles '.' y decimales ',')
+    if s.count(",") == 1 and s.count(".") >= 1 and s.rfind(",") > s.rfind("."):
+        s = s.replace(".", "").replace(",", ".")
+    # Caso coma decimal sin miles: '649,35'
+    elif s.count(",") == 1 and s.count(".") == 0:
+        s = s.replace(",", ".")
+
+    try:
+        return float(s)
+    except Exception:
+        return None
+
+
+def extract_texto_descuento_from_dto_descuentos(dto_descuentos) -> str:
+    """
+    product.dtoDescuentos suele venir como:
+      ["[{\"textoDescuento\":\"70% 2da\", ...}]"]
+    Devuelve textoDescuento (string) o "" si no encuentra / viene vacío.
+    """
+    if dto_descuentos is None:
+        return ""
+
+    chunks = dto_descuentos if isinstance(dto_descuentos, list) else [dto_descuentos]
+
+    for ch in chunks:
+        if ch is None:
+            continue
+        s = str(ch).strip()
+        if not s:
+            continue
+
+        try:
+            promos = json.loads(s)
+        except Exception:
+            continue
+
+        if isinstance(promos, dict):
+            promos = [promos]
+
+        if isinstance(promos, list):
+            for p in promos:
+                if not isinstance(p, dict):
+                    continue
+                txt = (p.get("textoDescuento") or "").strip()
+                # ✅ pedido: si está vacío, devolver vacío (no "Revisar")
+                if txt != "":
+                    return txt
+
+    return ""
+
+
+def get_record_id_by_ean(cliente: coto.CotoClient, ean: str, sucursal: str):
+    params = {"Dy": "1", "Ntt": ean, "Ntk": "product.eanPrincipal", "idSucursal": sucursal, "format": "json"}
+    r = cliente.get(urljoin(coto.BASE, SEARCH_CATEGORIA), params=params, timeout=20)
+    r.raise_for_status()
+    idx = coto.IndiceEndeca(r.json(), ean=ean)
+
+    rec = idx.record_por_ean(ean)
+    if rec is not None:
+        rid = idx.valor("record.id", rec)
+        name = idx.valor("product.displayName", rec) or idx.valor("record.title", rec)
+        return rid, (str(name) if name else None)
+    return None, None
+
+
+def fetch_detail_by_record_id(cliente: coto.CotoClient, record_id: str, sucursal: str):
+    product_url = f"{coto.BASE}/sitios/cdigi/productos/_/R-{record_id}"
+    detail_url = f"{product_url}?Dy=1&idSucursal={sucursal}&format=json"
+
+    headers = dict(cliente.session.headers)
+    headers["Referer"] = product_url
+    r = cliente.get(detail_url, headers=headers, timeout=20)
+    r.raise_for_status()
+    idx = coto.IndiceEndeca(r.json(), hasta=coto.CLAVES_DETALLE + ("product.dtoDescuentos",))
+
+    ean = idx.valor("product.eanPrincipal")
+    name = idx.valor("product.displayName")
+
+    # ListPrice = sku.activePrice
+    raw_list = idx.valor("sku.activePrice")
+    list_price = cast_price(raw_list)
+
+    # ✅ Oferta = textoDescuento dentro de product.dtoDescuentos (si vacío, "")
+    dto_desc = idx.valor("product.dtoDescuentos")
+    oferta_txt = extract_texto_descuento_from_dto_descuentos(dto_desc)
+
+    return {
+        "ean": ean,
+        "name": name,
+        "list_price": list_price,  # float o None
+        "oferta": oferta_txt,  # string, puede ser ""
+        "detail_url": detail_url,
+    }
+
+
+def scrape_coto_by_items(items, sucursal: str, cliente: coto.CotoClient, corrida: Corrida, on_progress=None):
+    ids_cache = resolucion.cache_identificadores()
+    marca_ids = ids_cache.marca()
+    out = []
+    tick = _progreso(on_progress, len(items))
+
+    for it in items:
+        nombre_ref = str(it.get("nombre_ref", "")).strip()
+        row = fila_base(nombre_ref, it, "Revisar", estado=REVISAR)
+        ean = row["EAN"]
+
+        def _resolver():
+            record_id, name_hint = get_record_id_by_ean(cliente, ean, sucursal)
+            return {"recordId": record_id, "nombre": name_hint} if record_id else None
+
+        def _detalle(ids):
+            det = fetch_detail_by_record_id(cliente, ids["recordId"], sucursal)
+            # record.id que ya no apunta a este EAN (detalle vacío o de otro producto)
+            if not (det.get("ean") or det.get("name")) or (det.get("ean") and str(det.get("ean")) != ean):
+                return None
+            return det, ids.get("nombre")
+
+        try:
+            if ean:
+                res = ids_cache.usar_o_resolver("Coto", ean, sucursal, _resolver, _detalle)
+                if res:
+                    det, name_hint = res
+
+                    row["EAN"] = det.get("ean") or ean
+                    row["Nombre"] = det.get("name") or name_hint or nombre_ref
+
+                    if det.get("list_price") is not None:
+                        row.update(celdas_lista(det["list_price"]))
+
+                    # ✅ Oferta: si viene "", debe quedar ""
+                    if det.get("oferta") is not None:
+                        row["Oferta"] = det.get("oferta")
+
+                    corrida.urls.append({"EAN": row["EAN"], "detail_url": det.get("detail_url")})
+        except Exception:
+            pass
+
+        out.append(row)
+        tick()
+
+    ids_cache.guardar()
+    corrida.nota("🗂️", ids_cache.resumen(marca_ids))
+    corrida.nota("🍪", cliente.resumen())
+    return out
+
+
+def _coto(productos: dict, op: Opciones, on_progress=None) -> Corrida:
+    corrida = Corrida(PAGINA, "Coto", COLUMNAS, op)
+    sucursal = op.sucursal or DEFAULT_SUCURSAL
+
+    items = []
+    for nombre, meta in productos.items():
+        meta = meta or {}
+        items.append({
+            "nombre_ref": nombre,
+            "ean": str(meta.get("ean", "")).strip(),
+            "empresa": meta.get("empresa", ""),
+            "categoría": meta.get("categoría", ""),
+            "subcategoría": meta.get("subcategoría", ""),
+            "marca": meta.get("marca", ""),
+        })
+
+    corrida.detalle["diagnostico"] = {
+        "Total items": len(items),
+        "Items con EAN no vacío": sum(1 for it in items if str(it.get("ean", "")).strip()),
+        "Ejemplo item": items[0] if items else None,
+    }
+
+    if not items:
+        corrida.avisos.append("No hay items válidos en el listado de Coto")
+        return corrida
+
+    # Un cliente para preflight + relevamiento: un solo bootstrap de cookies por corrida
+    cliente = coto.CotoClient(motor.build_session(op.concurrencia, headers=coto.HEADERS_COTO), sucursal, timeout=20)
+
+    # -------------------------
+    # PREFLIGHT (1 EAN)
+    # -------------------------
+    test = next((it for it in items if str(it.get("ean", "")).strip()), None)
+    if not test:
+        corrida.avisos.append("No hay EANs no vacíos para preflight.")
+        return corrida
+
+    preflight = corrida.detalle["preflight"] = {"EAN": test["ean"], "Sucursal": sucursal}
+    try:
+        rid, nh = get_record_id_by_ean(cliente, test["ean"], sucursal)
+        preflight["record_id"] = rid
+        preflight["name_hint"] = nh
+
+        if rid:
+            det = fetch_detail_by_record_id(cliente, rid, sucursal)
+            preflight["Preflight ListPrice"] = det.get("list_price")
+            preflight["Preflight Oferta (textoDescuento)"] = det.get("oferta")
+        else:
+            corrida.avisos.append("Preflight: no se encontró record_id para este EAN.")
+    except Exception as ex:
+        preflight["error"] = f"Preflight error: {type(ex).__name__} -> {ex}"
+        return corrida
+
+    # Relevamiento completo
+    corrida.filas = scrape_coto_by_items(items, sucursal, cliente, corrida, on_progress)
+    corrida.tiempo(len(items))
+    corrida.guardar_historial("Coto", corrida.filas, lista="ListPrice", oferta="Oferta", ubicacion=sucursal)
+    return corrida
+
+
+# ============================================
+# 🟢 Jumbo (Cencosud / VTEX) — ListPrice + Oferta (unit discount OR search-promotions)
+#   ✅ ListPrice = PriceWithoutDiscount (siempre que exista)
+#   ✅ Oferta = "% off" si Price < PriceWithoutDiscount; si no, /_v/search-promotions
+#   ✅ Ignora commertialOffer.ListPrice (viene en escala errónea en algunos SKUs)
+#   ✅ Cachea SOLO checkout/promotions por EAN (no cambia lógica del scraping)
+# ============================================
+# 🔒 Config fija (validada)
+BASE_JUMBO = "https://www.jumbo.com.ar"
+SC_JUMBO = "32"
+SELLER_PROMO = "jumboargentinaj5202martinez"
+VTEX_SEGMENT_JUMBO = (
+    "eyJjYW1wYWlnbnMiOm51bGwsImNoYW5uZWwiOiIzMiIsInByaWNlVGFibGVzIjpudWxsLCJyZWdpb25JZCI6bnVsbCwidXRtX2NhbXBhaWduIjpudWxsLCJ1dG1fc291cmNlIjpudWxsLCJ1dG1pX2NhbXBhaWduIjpudWxsLCJjdXJyZW5jeUNvZGUiOiJBUlMiLCJjdXJyZW5jeVN5bWJvbCI6IiQiLCJjb3VudHJ5Q29kZSI6IkFSRyIsImN1bHR1cmVJbmZvIjoiZXMtQVIiLCJjaGFubmVsUHJpdmFjeSI6InB1YmxpYyJ9"
+)
+TIMEOUTS_JUMBO = (4, 18)
+HEADERS_JUMBO = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept": "application/json,text/plain,*/*",
+    "Cookie": f"vtex_segment={VTEX_SEGMENT_JUMBO}",
+}
+MEMO_JUMBO = "jumbo_promos_cache"  # {ean: oferta_str}
+
+
+def normalize_money(val):
+    """
+    Jumbo: Price y PriceWithoutDiscount vienen en pesos (float).
+    Aun así, dejamos un normalizador defensivo por si algún caso viene en centavos.
+    """
+    if val is None:
+        return None
+    try:
+        v = float(val)
+    except Exception:
+        return None
+    if v <= 0:
+        return None
+
+    # Heurística defensiva: si parece centavos (muy grande e integer), dividir por 100
+    if v > 10000 and float(v).is_integer():
+        return v / 100
+
+    return v
+
+
+def pct_off(price: float, list_price: float):
+    """% off entero si price < list_price."""
+    try:
+        if price and list_price and price > 0 and list_price > 0 and price < list_price:
+            pct = round((1 - (price / list_price)) * 100)
+            return int(pct) if pct > 0 else None
+    except Exception:
+        pass
+    return None
+
+
+def vt_catalog_search_jumbo(session: requests.Session, ean: str, log=None):
+    """Busca producto por EAN en VTEX catalog_system (alternateIds_Ean y fallback ean)."""
+    log = log or (lambda texto: None)
+    url = f"{BASE_JUMBO}/api/catalog_system/pub/products/search"
+
+    # 1) alternateIds_Ean
+    params = {"fq": f"alternateIds_Ean:{ean}", "sc": SC_JUMBO}
+    r = session.get(url, headers=HEADERS_JUMBO, params=params, timeout=TIMEOUTS_JUMBO)
+    log(f"CATALOG altEan: {r.url} | {r.status_code}")
+    r.raise_for_status()
+    data = r.json()
+
+    # 2) fallback ean
+    if not data:
+        params = {"fq": f"ean:{ean}", "sc": SC_JUMBO}
+        r = session.get(url, headers=HEADERS_JUMBO, params=params, timeout=TIMEOUTS_JUMBO)
+        log(f"CATALOG ean: {r.url} | {r.status_code}")
+        r.raise_for_status()
+        data = r.json()
+
+    return data, (r.url if hasattr(r, "url") else None)
+
+
+def vt_search_by_ean_jumbo(session: requests.Session, ean: str, lote: vtex.VtexBatchLookup = None):
+    """Producto + item por EAN; usa el lote si está, si no la búsqueda individual."""
+    if lote is not None:
+        data, used_url = lote.lookup(ean), "lote"
+    else:
+        data, used_url = vt_catalog_search_jumbo(session, ean)
+
+    if not data:
+        return None, None, None
+
+    prod = data[0]
+    # Elegimos item que matchee EAN (ean o referenceId.Value). Si no, el primero.
+    item_sel = pick_item_by_ean(prod.get("items") or [], ean)
+    return prod, item_sel, used_url
+
+
+def promo_headers_jumbo(referer: str = None) -> dict:
+    headers = dict(HEADERS_JUMBO)
+    headers["Content-Type"] = "application/json"
+    headers["Origin"] = BASE_JUMBO
+    headers["Referer"] = referer or (BASE_JUMBO + "/")
+    return headers
+
+
+def fetch_search_promotions(session: requests.Session, sku_id: str, referer: str, log=None):
+    """POST /_v/search-promotions con {seller, skus:[skuId]}"""
+    url = f"{BASE_JUMBO}/_v/search-promotions"
+    headers = promo_headers_jumbo(referer)
+
+    payload = {"seller": SELLER_PROMO, "skus": [str(sku_id)]}
+    r = session.post(url, headers=headers, data=json.dumps(payload), timeout=TIMEOUTS_JUMBO)
+    if log:
+        log(f"PROMOS: {url} | {r.status_code} | sku={sku_id}")
+    r.raise_for_status()
+    return r.json()
+
+
+def parse_promo(resp_json: dict, sku_id: str) -> str:
+    """Extrae code/name desde promotions.*.promotions[skuId]."""
+    sku_id = str(sku_id)
+    promos_root = (resp_json.get("promotions") or {})
+
+    for bucket in promos_root.values():
+        bucket_promos = (bucket.get("promotions") or {})
+        if sku_id in bucket_promos:
+            p = bucket_promos[sku_id] or {}
+            code = (p.get("code") or "").strip()
+            name = (p.get("name") or "").strip()
+
+            if code:
+                return code
+            if name:
+                return name.split("|")[0].strip()
+    return ""
+
+
+def unit_offer(co: dict) -> str:
+    """'% off' si hay descuento unitario (Price < PWD); si no, ''."""
+    pwd = normalize_money(co.get("PriceWithoutDiscount"))
+    price = normalize_money(co.get("Price"))
+    if price is not None and pwd is not None and price > 0 and pwd > 0 and price < pwd:
+        p = pct_off(price, pwd)
+        if p:
+            return f"{p}% off"
+    return ""
+
+
+def get_offer_cached(cache: dict, session: requests.Session, ean: str, sku_id: str, referer: str,
+                     promos: vtex.VtexBatchPromotions = None) -> str:
+    ean_key = str(ean).strip()
+
+    if ean_key in cache:
+        return cache[ean_key]
+
+    fallos = reintentos.fallos()
+    if promos is not None:
+        resp = promos.lookup(sku_id)
+    else:
+        resp = fetch_search_promotions(session, sku_id=sku_id, referer=referer)
+    oferta = parse_promo(resp, sku_id=sku_id)
+
+    if reintentos.fallos() == fallos:
+        cache[ean_key] = oferta
+    return oferta
+
+
+def _jumbo(productos: dict, op: Opciones, on_progress=None) -> Corrida:
+    corrida = Corrida(PAGINA, "Jumbo", COLUMNAS, op)
+    cache = op.memo(MEMO_JUMBO)
+    s = motor.build_session(op.concurrencia)
+    lote_jumbo = vtex.VtexBatchLookup(
+        s,
+        BASE_JUMBO,
+        single=lambda e: vt_catalog_search_jumbo(s, e, corrida.log)[0],
+        headers=HEADERS_JUMBO,
+        params={"sc": SC_JUMBO},
+        batch_size=op.lote("Jumbo"),
+        timeout=TIMEOUTS_JUMBO,
+    ).prefetch((d.get("ean") for d in productos.values()), op.concurrencia)
+
+    # SKUs que van a necesitar search-promotions: sin descuento unitario y sin cache
+    skus_promo = []
+    for datos in productos.values():
+        ean = str(datos.get("ean") or "").strip()
+        if not ean or ean in cache:
+            continue
+        try:
+            prod, item_sel, _ = vt_search_by_ean_jumbo(s, ean, lote=lote_jumbo)
+        except Exception:
+            continue
+        if prod and item_sel and item_sel.get("sellers"):
+            co = (item_sel.get("sellers") or [{}])[0].get("commertialOffer") or {}
+            if not unit_offer(co):
+                skus_promo.append(item_sel.get("itemId"))
+
+    promos_jumbo = vtex.VtexBatchPromotions(
+        s,
+        BASE_JUMBO,
+        SELLER_PROMO,
+        single=lambda sku: fetch_search_promotions(s, sku_id=sku, referer=None, log=corrida.log),
+        headers=promo_headers_jumbo(),
+        batch_size=op.lote("Jumbo"),
+        timeout=TIMEOUTS_JUMBO,
+    ).prefetch(skus_promo, op.concurrencia)
+
+    resultados = []
+    tick = _progreso(on_progress, len(productos))
+
+    for nombre_base, datos in productos.items():
+        # Metadatos del listado
+        row = fila_base(nombre_base, datos, estado=SIN_PRECIO)
+        ean = row["EAN"]
+
+        try:
+            if not ean:
+                resultados.append(row)
+                tick()
+                continue
+
+            prod, item_sel, used_url = vt_search_by_ean_jumbo(s, ean, lote=lote_jumbo)
+            if not prod or not item_sel or not item_sel.get("sellers"):
+                resultados.append(row)
+                tick()
+                continue
+
+            # Nombre: priorizamos API
+            nombre_api = (prod.get("productName") or "").strip()
+            row["Nombre"] = nombre_api if nombre_api else nombre_base
+
+            co = (item_sel.get("sellers") or [{}])[0].get("commertialOffer") or {}
+
+            # ✅ Jumbo: PWD es la fuente oficial del precio regular (ListPrice)
+            pwd = normalize_money(co.get("PriceWithoutDiscount"))
+            price = normalize_money(co.get("Price"))
+
+            list_price_num = pwd if (pwd is not None and pwd > 0) else price
+            row.update(celdas_lista(list_price_num) if list_price_num else celdas_lista(estado=SIN_PRECIO))
+
+            # ✅ Oferta:
+            # A) Si hay descuento unitario (Price < PWD): mostrar % off
+            oferta = unit_offer(co)
+
+            # B) Si no hay descuento unitario: buscar promo externa (search-promotions)
+            if not oferta:
+                sku_id = str(item_sel.get("itemId") or "").strip()
+                link_text = (prod.get("linkText") or "").strip()
+                referer = f"{BASE_JUMBO}/{link_text}/p" if link_text else f"{BASE_JUMBO}/"
+
+                if sku_id:
+                    oferta = get_offer_cached(cache, s, ean=ean, sku_id=sku_id, referer=referer, promos=promos_jumbo)
+
+            row["Oferta"] = oferta
+
+            raw_lp = co.get("ListPrice")
+            corrida.log(
+                f"OK {ean} | sku={item_sel.get('itemId')} | "
+                f"PWD={co.get('PriceWithoutDiscount')} Price={co.get('Price')} rawLP={raw_lp} | "
+                f"ListPrice(out)={row['ListPrice']} Oferta='{row['Oferta']}'"
+            )
+            corrida.log(f"URL: {used_url}")
+
+        except Exception:
+            pass  # dejamos ListPrice = Sin Precio, Oferta vacío
+
+        resultados.append(row)
+        tick()
+
+    corrida.filas = resultados
+    corrida.tiempo(len(productos))
+    corrida.nota("📦", lote_jumbo.resumen())
+    corrida.nota("📦", promos_jumbo.resumen())
+    corrida.guardar_historial("Jumbo", resultados, lista="ListPrice", oferta="Oferta", ubicacion=SC_JUMBO)
+    return corrida
+
+
+# ============================================
+# 🟢 Vea (Cencosud) — Catálogo (VTEX) + Promos (search-promotions)
+# ============================================
+BASE_VEA = "https://www.vea.com.ar"
+SC_VEA = "34"
+
+# vtex_segment (el que ya nos pasaste para Vea)
+VTEX_SEGMENT_VEA = (
+    "eyJjYW1wYWlnbnMiOm51bGwsImNoYW5uZWwiOiIzNCIsInByaWNlVGFibGVzIjpudWxsLCJyZWdpb25JZCI6IlUxY2phblZ0WW05aGNtZGxiblJwYm1GMk56QXdZMjl5Wkc5aVlUY3dNQT09IiwidXRtX2NhbXBhaWduIjpudWxsLCJ1dG1fc291cmNlIjpudWxsLCJ1dG1pX2NhbXBhaWduIjpudWxsLCJjdXJyZW5jeUNvZGUiOiJBUlMiLCJjdXJyZW5jeVN5bWJvbCI6IiQiLCJjb3VudHJ5Q29kZSI6IkFSRyIsImN1bHR1cmVJbmZvIjoiZXMtQVIiLCJhZG1pbl9jdWx0dXJlSW5mbyI6ImVzLUFSIiwiY2hhbm5lbFByaXZhY3kiOiJwdWJsaWMifQ"
+)
+
+# Seller promos (reutilizado)
+SELLER_PROMOS_VEA = "jumboargentinaj5202martinez"
+
+HEADERS_VEA = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept": "application/json,text/plain,*/*",
+    "Cookie": f"vtex_segment={VTEX_SEGMENT_VEA}",
+}
+
+PROMOS_HEADERS_VEA = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept": "application/json,text/plain,*/*",
+    "Content-Type": "application/json",
+}
+
+TIMEOUT_VEA = 12
+
+
+def _extract_offer_from_promotions_json(promos_json: dict, sku_id: str):
+    """
+    Busca la promo para el SKU dentro de:
+    promotions -> generic/sgc/jumbo_prime -> promotions -> {sku_id: {...}}
+    Devuelve texto de oferta (str) o "".
+    """
+    if not isinstance(promos_json, dict):
+        return ""
+
+    promotions = promos_json.get("promotions") or {}
+    if not isinstance(promotions, dict):
+        return ""
+
+    for bucket_name in ("generic", "sgc", "jumbo_prime"):
+        bucket = promotions.get(bucket_name) or {}
+        bpromos = bucket.get("promotions") or {}
+        if isinstance(bpromos, dict) and str(sku_id) in bpromos:
+            p = bpromos.get(str(sku_id)) or {}
+            # Preferimos "code" (ej: "2do al 80%"), si no "name"
+            code = (p.get("code") or "").strip()
+            name = (p.get("name") or "").strip()
+            return code or name or ""
+    return ""
+
+
+def _compute_unit_discount_pct(list_price: float, price: float) -> str:
+    """
+    Si hay descuento unitario (Price < PriceWithoutDiscount), devuelve "35%".
+    Si no, "".
+    """
+    try:
+        if list_price and price and float(list_price) > 0 and float(price) > 0 and float(price) < float(list_price):
+            pct = round((1 - float(price) / float(list_price)) * 100)
+            if pct > 0:
+                return f"{pct}%"
+    except Exception:
+        pass
+    return ""
+
+
+def vt_catalog_search_vea(session: requests.Session, ean: str):
+    url = f"{BASE_VEA}/api/catalog_system/pub/products/search"
+    params = {"fq": f"alternateIds_Ean:{ean}", "sc": SC_VEA}
+    r = session.get(url, headers=HEADERS_VEA, params=params, timeout=TIMEOUT_VEA)
+    r.raise_for_status()
+    return r.json()
+
+
+def fetch_promotions_vea(session: requests.Session, sku_id: str):
+    promos_url = f"{BASE_VEA}/_v/search-promotions"
+    payload = {"seller": SELLER_PROMOS_VEA, "skus": [sku_id]}
+    rp = session.post(promos_url, headers=PROMOS_HEADERS_VEA, json=payload, timeout=TIMEOUT_VEA)
+    rp.raise_for_status()
+    return rp.json()
+
+
+def _offer_prices(item_sel: dict):
+    """(sku_id, price_num, pwd_num) del primer seller."""
+    sku_id = str(item_sel.get("itemId") or "").strip()
+    co = (item_sel.get("sellers") or [{}])[0].get("commertialOffer", {}) or {}
+
+    # ✔️ ListPrice real = PriceWithoutDiscount (según tus ejemplos)
+    price = co.get("Price")
+    pwd = co.get("PriceWithoutDiscount")
+
+    # Normalizamos a float
+    try:
+        price_num = float(price) if price is not None else None
+    except Exception:
+        price_num = None
+    try:
+        pwd_num = float(pwd) if pwd is not None else None
+    except Exception:
+        pwd_num = None
+    return sku_id, price_num, pwd_num
+
+
+def fetch_vea_catalog_and_offer(session: requests.Session, ean: str, lote: vtex.VtexBatchLookup = None,
+                                promos: vtex.VtexBatchPromotions = None):
+    """
+    Devuelve:
+    - nombre_api
+    - sku_id (itemId)
+    - list_price_num (PriceWithoutDiscount)
+    - offer_text (promo code/name o % descuento unitario)
+    """
+    # 1) Catálogo (VTEX) — lote si está, si no búsqueda individual
+    data = lote.lookup(ean) if lote is not None else vt_catalog_search_vea(session, ean)
+
+    if not data:
+        return None, None, None, ""
+
+    prod = data[0]
+    items = prod.get("items") or []
+    item_sel = pick_item_by_ean(items, ean)
+    if not item_sel or not item_sel.get("sellers"):
+        return (prod.get("productName") or None), None, None, ""
+
+    sku_id, price_num, pwd_num = _offer_prices(item_sel)
+
+    # 2) Oferta:
+    #   - Si hay descuento unitario: Oferta = "% descuento"
+    #   - Si no hay descuento unitario: ir a /_v/search-promotions y buscar promo por SKU
+    offer_text = ""
+    unit_pct = _compute_unit_discount_pct(pwd_num or 0.0, price_num or 0.0)
+    if unit_pct:
+        offer_text = unit_pct
+    else:
+        if sku_id:
+            resp = promos.lookup(sku_id) if promos is not None else fetch_promotions_vea(session, sku_id)
+            offer_text = _extract_offer_from_promotions_json(resp, sku_id)
+
+    nombre_api = (prod.get("productName") or "").strip() or None
+    return nombre_api, sku_id, pwd_num, (offer_text or "")
+
+
+def _vea(productos: dict, op: Opciones, on_progress=None) -> Corrida:
+    corrida = Corrida(PAGINA, "Vea", COLUMNAS, op)
+    s = motor.build_session(op.concurrencia)
+    lote_vea = vtex.VtexBatchLookup(
+        s,
+        BASE_VEA,
+        single=lambda e: vt_catalog_search_vea(s, e),
+        headers=HEADERS_VEA,
+        params={"sc": SC_VEA},
+        batch_size=op.lote("Vea"),
+        timeout=TIMEOUT_VEA,
+    ).prefetch((d.get("ean") for d in productos.values()), op.concurrencia)
+
+    # SKUs sin descuento unitario → search-promotions en lote
+    skus_promo = []
+    for datos in productos.values():
+        ean = str(datos.get("ean") or "").strip()
+        if not ean:
+            continue
+        try:
+            data = lote_vea.lookup(ean)
+        except Exception:
+            continue
+        item_sel = pick_item_by_ean((data[0].get("items") or []) if data else [], ean)
+        if item_sel and item_sel.get("sellers"):
+            sku_id, price_num, pwd_num = _offer_prices(item_sel)
+            if sku_id and not _compute_unit_discount_pct(pwd_num or 0.0, price_num or 0.0):
+                skus_promo.append(sku_id)
+
+    promos_vea = vtex.VtexBatchPromotions(
+        s,
+        BASE_VEA,
+        SELLER_PROMOS_VEA,
+        single=lambda sku: fetch_promotions_vea(s, sku),
+        headers=PROMOS_HEADERS_VEA,
+        batch_size=op.lote("Vea"),
+        timeout=TIMEOUT_VEA,
+    ).prefetch(skus_promo, op.concurrencia)
+
+    resultados = []
+    tick = _progreso(on_progress, len(productos))
+
+    for nombre_base, datos in productos.items():
+        # Metadatos del listado
+        row = fila_base(nombre_base, datos, estado=SIN_PRECIO)
+        ean = row["EAN"]
+
+        try:
+            if not ean:
+                resultados.append(row)
+                tick()
+                continue
+
+            nombre_api, sku_id, list_price_num, offer_text = fetch_vea_catalog_and_offer(s, ean, lote=lote_vea, promos=promos_vea)
+
+            # Nombre: prioriza API
+            if nombre_api:
+                row["Nombre"] = nombre_api
+
+            # ListPrice real = PriceWithoutDiscount
+            if list_price_num is not None and float(list_price_num) > 0:
+                row.update(celdas_lista(list_price_num))
+            else:
+                row.update(celdas_lista(estado=SIN_PRECIO))
+
+            # Oferta (puede ser "", "2do al 80%", "35%")
+            row["Oferta"] = offer_text or ""
+
+        except Exception:
+            # Mantenemos "Sin Precio" y Oferta ""
+            pass
+
+        resultados.append(row)
+        tick()
+
+    corrida.filas = resultados
+    corrida.tiempo(len(productos))
+    corrida.nota("📦", lote_vea.resumen())
+    corrida.nota("📦", promos_vea.resumen())
+    corrida.guardar_historial("Vea", resultados, lista="ListPrice", oferta="Oferta", ubicacion=SC_VEA)
+    return corrida
+
+
+# ============================================
+# 🟡 Cooperativa Obrera (ListPrice + Oferta)
+# ============================================
+HEADERS_COOPE = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept": "application/json,text/plain,*/*",
+}
+
+RE_LLEVANDO = re.compile(r"llevando\s+(\d+)", re.I)
+RE_PCT = re.compile(r"(\d+(?:[.,]\d+)?)\s*%", re.I)
+RE_NXM = re.compile(r"\b(\d+)\s*x\s*(\d+)\b", re.I)
+
+
+def _is_no_encontrado(cod: str) -> bool:
+    c = (cod or "").strip().upper().replace(" ", "_")
+    return c in ("NO_ENCONTRADO", "NO", "NO_ENCONTRADO,")
+
+
+def _to_float(x):
+    try:
+        if x in (None, ""):
+            return None
+        return float(str(x))
+    except Exception:
+        return None
+
+
+def extract_oferta(datos: dict) -> str:
+    """
+    Prioridad para 'Oferta':
+    1) Inferir Nx(N-1) (ej: n=3 y pct ~ 100/n => 3x2)
+    2) % off explícito (campo o texto)
+    3) % off implícito por precios (precio vs precio_anterior)
+    4) NxM literal en texto
+    5) Promo por precio (precio_promo distinto) -> 'Precio promo'
+    6) fallback descripcion_promo
+    7) si no hay promo -> ''
+    """
+    if not isinstance(datos, dict):
+        return ""
+
+    existe = datos.get("existe_promo")
+    existe_bool = str(existe).strip().lower() in ("1", "true", "si", "sí", "s")
+    if not existe_bool:
+        return ""
+
+    desc = str(datos.get("descripcion_promo") or "").strip()
+
+    # precios para cálculo
+    precio = _to_float(datos.get("precio"))
+    precio_ant = _to_float(datos.get("precio_anterior"))
+
+    # cantidad_promo (N)
+    n = _to_float(datos.get("cantidad_promo"))
+    if (n is None or n <= 0) and desc:
+        m_n = RE_LLEVANDO.search(desc)
+        if m_n:
+            n = _to_float(m_n.group(1))
+
+    # descuento % (campo o texto)
+    pct = _to_float(datos.get("descuento_porcentaje_promo"))
+    if pct is None and desc:
+        m_pct = RE_PCT.search(desc)
+        if m_pct:
+            pct = _to_float(m_pct.group(1).replace(",", "."))
+
+    # 1) Inferir Nx(N-1)
+    if n and n >= 2 and pct:
+        target = 100.0 / float(n)
+        if abs(float(pct) - target) <= 1.0:  # tolerancia
+            return f"{int(n)}x{int(n)-1}"
+
+    # 2) % off explícito
+    if pct is not None and pct > 0:
+        pct_str = str(int(round(pct))) if abs(pct - round(pct)) < 0.05 else f"{pct:.2f}".rstrip("0").rstrip(".")
+        return f"{pct_str}% off"
+
+    # 3) % off implícito por precios
+    if precio_ant and precio and precio_ant > 0 and precio < precio_ant:
+        pct_calc = (1.0 - (precio / precio_ant)) * 100.0
+        pct_calc_round = int(round(pct_calc))
+        if pct_calc_round > 0:
+            return f"{pct_calc_round}% off"
+
+    # 4) NxM literal en texto
+    if desc:
+        m = RE_NXM.search(desc)
+        if m:
+            return f"{m.group(1)}x{m.group(2)}"
+
+    # 5) promo por precio
+    precio_promo = _to_float(datos.get("precio_promo"))
+    if precio_promo is not None and precio_promo > 0:
+        if (precio is None) or (abs(precio_promo - precio) > 0.001):
+            return "Precio promo"
+
+    # 6) fallback
+    return desc or ""
+
+
+def _cooperativa(productos: dict, op: Opciones, on_progress=None) -> Corrida:
+    corrida = Corrida(PAGINA, "Cooperativa Obrera", COLUMNAS, op)
+    s = motor.build_session(op.concurrencia)
+    resultados = []
+    tick = _progreso(on_progress, len(productos))
+
+    for nombre, meta in productos.items():
+        meta = meta or {}
+        row = fila_base(nombre, meta, estado=REVISAR)
+        tick()
+
+        # ✅ soporta cod_coope o cod_coop
+        cod = str(meta.get("cod_coope", meta.get("cod_coop", ""))).strip()
+
+        if (not cod) or _is_no_encontrado(cod):
+            resultados.append(row)
+            continue
+
+        try:
+            url = "https://api.lacoopeencasa.coop/api/articulo/detalle"
+            params = {"cod_interno": cod, "simple": "false"}
+
+            r = s.get(url, params=params, headers=HEADERS_COOPE, timeout=12)
+            r.raise_for_status()
+
+            ctype = (r.headers.get("content-type", "") or "").lower()
+            j = r.json() if ctype.startswith("application/json") else {}
+
+            datos_node = (j or {}).get("datos") or {}
+
+            lp = _to_float(datos_node.get("precio_anterior"))
+
+            if lp and lp > 0:
+                row.update(celdas_lista(lp))
+            else:
+                row.update(celdas_lista(estado=REVISAR))
+
+            # ✅ Oferta interpretada (3x2, % off, etc.)
+            row["Oferta"] = extract_oferta(datos_node)
+
+        except Exception:
+            pass
+
+        resultados.append(row)
+
+    corrida.filas = resultados
+    corrida.tiempo(len(productos))
+    corrida.guardar_historial("Cooperativa", resultados, lista="ListPrice", oferta="Oferta")
+    return corrida
+
+
+# ============================================
+# 🔴 HiperLibertad (VTEX) — ListPrice + Oferta por EAN (catalog + checkout simulation)
+# ============================================
+BASE_HIPER = "https://www.hiperlibertad.com.ar"
+SC_HIPER = "1"  # política comercial usual (?sc=1)
+
+HEADERS_HIPER = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) PythonRequests/2.x",
+    "Accept": "application/json, text/plain, */*",
+    "Content-Type": "application/json",
+}
+
+TIMEOUT_HIPER = (3, 10)  # (connect, read)
+
+
+def _pct_off(list_price: float, selling_price: float) -> int:
+    """Devuelve % off redondeado (entero)."""
+    try:
+        if list_price <= 0 or selling_price <= 0:
+            return 0
+        if selling_price >= list_price:
+            return 0
+        return int(round((1.0 - (selling_price / list_price)) * 100))
+    except Exception:
+        return 0
+
+
+def _catalog_search_hiper(session: requests.Session, ean: str, sc: str = SC_HIPER):
+    url = f"{BASE_HIPER}/api/catalog_system/pub/products/search"
+    params = {"fq": f"alternateIds_Ean:{ean}", "sc": sc}
+
+    r = session.get(url, headers=HEADERS_HIPER, params=params, timeout=TIMEOUT_HIPER)
+    if r.status_code != 200:
+        return None
+
+    try:
+        return r.json()
+    except Exception:
+        return None
+
+
+def _fetch_catalog_by_ean(session: requests.Session, ean: str, sc: str = SC_HIPER, lote: vtex.VtexBatchLookup = None):
+    """Devuelve (prod, item_sel) o (None, None)."""
+    if not ean:
+        return None, None
+
+    data = lote.lookup(ean) if lote is not None else _catalog_search_hiper(session, ean, sc=sc)
+
+    if not isinstance(data, list) or not data:
+        return None, None
+
+    prod = data[0]
+    items = prod.get("items") or []
+
+    # pick: match item.ean; fallback first
+    item_sel = None
+    for it in items:
+        if str(it.get("ean") or "").strip() == ean:
+            item_sel = it
+            break
+    if not item_sel and items:
+        item_sel = items[0]
+
+    return prod, item_sel
+
+
+def _extract_offer_text_from_sim(sim_json) -> str:
+    """
+    Oferta desde:
+    - messages[]
+    - ratesAndBenefitsData.rateAndBenefitsIdentifiers[].name
+    """
+    if not isinstance(sim_json, dict):
+        return ""
+
+    # 1) messages (lo más directo)
+    msgs = sim_json.get("messages")
+    if isinstance(msgs, list) and msgs:
+        clean = [str(m).strip() for m in msgs if str(m).strip()]
+        if clean:
+            # evitamos textos repetidos
+            uniq = []
+            for x in clean:
+                if x not in uniq:
+                    uniq.append(x)
+            return " | ".join(uniq)
+
+    # 2) rateAndBenefitsIdentifiers
+    rbd = sim_json.get("ratesAndBenefitsData") or {}
+    ids = rbd.get("rateAndBenefitsIdentifiers")
+    if isinstance(ids, list) and ids:
+        names = []
+        for it in ids:
+            if isinstance(it, dict):
+                nm = str(it.get("name") or "").strip()
+                if nm:
+                    names.append(nm)
+        if names:
+            uniq = []
+            for x in names:
+                if x not in uniq:
+                    uniq.append(x)
+            return " | ".join(uniq)
+
+    return ""
+
+
+def _extract_unit_prices_from_sim(sim_json):
+    """
+    En simulation, items vienen en centavos:
+    - items[0].listPrice
+    - items[0].sellingPrice
+    - items[0].price (a veces = listPrice)
+    Devuelve (list_price, selling_price) en ARS (float).
+    """
+    if not isinstance(sim_json, dict):
+        return 0.0, 0.0
+
+    items = sim_json.get("items")
+    if not isinstance(items, list) or not items:
+        return 0.0, 0.0
+
+    it0 = items[0] if isinstance(items[0], dict) else {}
+    lp_cents = _safe_int(it0.get("listPrice"), 0)
+    sp_cents = _safe_int(it0.get("sellingPrice"), 0)
+
+    # pasar a ARS
+    lp = lp_cents / 100.0 if lp_cents else 0.0
+    sp = sp_cents / 100.0 if sp_cents else 0.0
+    return lp, sp
+
+
+def _hiperlibertad(productos: dict, op: Opciones, on_progress=None) -> Corrida:
+    corrida = Corrida(PAGINA, "HiperLibertad", COLUMNAS, op)
+    s = motor.build_session(op.concurrencia)
+    # skuId cacheado → se saltea la búsqueda en catálogo
+    ids_cache = resolucion.cache_identificadores()
+    marca_ids = ids_cache.marca()
+    cacheados = {}
+    for meta in productos.values():
+        ean = str(meta.get("ean", "")).strip()
+        ids = ids_cache.get("HiperLibertad", ean, SC_HIPER) if ean else None
+        if ids and ids.get("skuId"):
+            cacheados[ean] = ids
+
+    lote_hiper = vtex.VtexBatchLookup(
+        s,
+        BASE_HIPER,
+        single=lambda e: _catalog_search_hiper(s, e, sc=SC_HIPER),
+        headers=HEADERS_HIPER,
+        params={"sc": SC_HIPER},
+        batch_size=op.lote("HiperLibertad"),
+        timeout=TIMEOUT_HIPER,
+    ).prefetch((m.get("ean") for m in productos.values() if m.get("ean") not in cacheados), op.concurrencia)
+
+    def _resolver_catalogo(ean: str):
+        prod, item_sel = _fetch_catalog_by_ean(s, ean, sc=SC_HIPER, lote=lote_hiper)
+        if prod and item_sel:
+            ids_cache.put("HiperLibertad", ean, SC_HIPER, **resolucion.ids_vtex(prod, item_sel))
+        return prod, item_sel
+
+    # Catálogo primero (para conocer los SKUs) y después simulación en lote por cantidad
+    catalogo = {}
+    for meta in productos.values():
+        ean = str(meta.get("ean", "")).strip()
+        if ean and ean not in catalogo:
+            if ean in cacheados:
+                ids = cacheados[ean]
+                catalogo[ean] = ({"productName": ids.get("nombre", "")}, {"itemId": ids["skuId"]})
+                continue
+            try:
+                catalogo[ean] = _resolver_catalogo(ean)
+            except Exception:
+                catalogo[ean] = (None, None)
+
+    sim_hiper = vtex.VtexBatchSimulation(
+        s,
+        BASE_HIPER,
+        headers=HEADERS_HIPER,
+        params={"sc": SC_HIPER},
+        seller="1",
+        batch_size=op.lote("HiperLibertad"),
+        timeout=TIMEOUT_HIPER,
+    ).simulate(
+        (str(it.get("itemId") or "").strip() for _, it in catalogo.values() if it),
+        qtys=(1, 2, 3),
+        concurrencia=op.concurrencia,
+    )
+
+    resultados = []
+    tick = _progreso(on_progress, len(productos))
+
+    for nombre, meta in productos.items():
+        row = fila_base(nombre, meta, estado=REVISAR)
+        ean = row["EAN"]
+        tick()
+
+        try:
+            if not ean:
+                resultados.append(row)
+                continue
+
+            prod, item_sel = catalogo.get(ean) or (None, None)
+            if not prod or not item_sel:
+                resultados.append(row)
+                continue
+
+            sku_id = str(item_sel.get("itemId") or "").strip()
+            if not sku_id:
+                resultados.append(row)
+                continue
+
+            # Nombre real si existe
+            row["Nombre"] = str(prod.get("productName") or nombre).strip()
+
+            # 1) checkout qty=1: base prices
+            sim1 = sim_hiper.get(sku_id, 1)
+            if ean in cacheados and not (sim1 or {}).get("items"):
+                # skuId cacheado que el checkout ya no reconoce: invalidar y re-resolver
+                ids_cache.invalidar("HiperLibertad", ean, SC_HIPER)
+                prod, item_sel = _resolver_catalogo(ean)
+                sku_id = str((item_sel or {}).get("itemId") or "").strip()
+                if not prod or not sku_id:
+                    resultados.append(row)
+                    continue
+                row["Nombre"] = str(prod.get("productName") or nombre).strip()
+                sim1 = sim_hiper.get(sku_id, 1)
+            lp1, sp1 = _extract_unit_prices_from_sim(sim1)
+
+            if lp1 > 0:
+                row.update(celdas_lista(lp1))
+
+            # 2) checkout qty=2/3: buscar mensajes de promo
+            sim2 = sim_hiper.get(sku_id, 2)
+            sim3 = sim_hiper.get(sku_id, 3)
+
+            offer_txt = _extract_offer_text_from_sim(sim2) or _extract_offer_text_from_sim(sim3)
+
+            # 3) si no hay mensajes/beneficios, inferir % off por diferencia lp vs sp en qty=1
+            if not offer_txt:
+                pct = _pct_off(lp1, sp1)
+                if pct > 0:
+                    offer_txt = f"{pct}% off"
+
+            row["Oferta"] = offer_txt
+
+        except Exception:
+            # dejar Revisar / vacío
+            pass
+
+        resultados.append(row)
+
+    corrida.filas = resultados
+    corrida.tiempo(len(productos))
+    corrida.nota("📦", lote_hiper.resumen())
+    corrida.nota("📦", sim_hiper.resumen())
+    ids_cache.guardar()
+    corrida.nota("🗂️", ids_cache.resumen(marca_ids))
+    corrida.guardar_historial("HiperLibertad", resultados, lista="ListPrice", oferta="Oferta", ubicacion=SC_HIPER)
+    return corrida
+
+
+# ============================================
+# Entrada
+# ============================================
+_CADENAS = {
+    "carrefour": _carrefour,
+    "dia": _dia,
+    "changomas": _changomas,
+    "coto": _coto,
+    "jumbo": _jumbo,
+    "vea": _vea,
+    "cooperativa": _cooperativa,
+    "hiperlibertad": _hiperlibertad,
+}
+
+
+def relevar(cadena: str, productos: dict = None, op: Opciones = None, on_progress=None) -> Corrida:
+    """Releva las dinámicas de una cadena sobre su listado (CATALOGOS) o el catálogo que se pase."""
+    clave = clave_cadena(cadena)
+    if productos is None:
+        productos = cargar_catalogo(CATALOGOS[clave])
+    op = op or Opciones()
+    with reintentos.presupuesto(), metricas.registro(), cache_http.descarga(op.forzar_descarga):
+        return _CADENAS[clave](productos, op, on_progress)
@@ -0,0 +1,208 @@
+# grabacion.py
+# Grabación y replay de requests HTTP, para medir sin depender de las ocho tiendas en vivo.
+#
+# Las dos piezas reemplazan HTTPAdapter.send (debajo de AdaptadorCache): el cache HTTP, los
+# reintentos, la ventana de concurrencia y las métricas de la app siguen funcionando igual.
+#   - Grabadora: deja pasar cada request a la red y la guarda (request + respuesta + latencia)
+#     en un .jsonl.gz: búsquedas, detalle, simulaciones, orderForm, promociones, detalle de Coope
+#   - Replay: responde desde una o más grabaciones, durmiendo la latencia grabada x escala
+#     (escala 0 = sin esperas: solo CPU). Lo que no está grabado vuelve 404 y se cuenta.
+#
+# Clave de búsqueda: (método, host, path, query ordenada, sha1 del cuerpo). Si una misma clave
+# se grabó varias veces (ej. crear un orderForm), se devuelven en orden y en ronda. Los ids de
+# orderForm (y si un item entra con POST a un carrito nuevo o con PUT a uno reusado) dependen
+# del orden en que corrieron los threads: si la clave exacta no está, se busca con el id
+# reemplazado por "*" y POST / PUT de items como equivalentes.
+#
+#   with grabacion.grabar("grabaciones/dinamicas_coto.jsonl.gz"): ...
+#   with grabacion.replay(["grabaciones/dinamicas_coto.jsonl.gz"], escala=0.5) as r: ...; r.faltantes
+
+import base64
+import gzip
+import hashlib
+import http.client
+import io
+import json
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from types import SimpleNamespace
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from requests.adapters import HTTPAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# Headers de respuesta que usa la app (el resto no se graba)
+HEADERS = ("Content-Type", "ETag", "Last-Modified", "Retry-After", "Cache-Control")
+
+_ORDERFORM_ID = re.compile(r"(/orderForm/)[^/]+")
+
+
+def sha1_cuerpo(request) -> str:
+    body = request.body
+    if not body:
+        return ""
+    return hashlib.sha1(body.encode("utf-8") if isinstance(body, str) else bytes(body)).hexdigest()
+
+
+def clave(method: str, url: str, sha1: str = "", laxa: bool = False) -> str:
+    u = urlsplit(url)
+    method = method.upper()
+    path = u.path
+    if laxa:
+        path = _ORDERFORM_ID.sub(r"\1*", path)
+        if path.endswith("/orderForm/*/items") and method in ("POST", "PUT"):
+            method = "POST|PUT"  # carrito nuevo (POST) o reusado (PUT): los dos lo dejan con ese item
+    query = urlencode(sorted(parse_qsl(u.query, keep_blank_values=True)))
+    return f"{method} {u.netloc}{path}?{query} {sha1}"
+
+
+# --------------------------------------------
+# Grabar
+# --------------------------------------------
+class Grabadora:
+    """Guarda cada request que sale por HTTPAdapter.send (una línea JSON por request)."""
+
+    def __init__(self, ruta: str):
+        self.ruta = ruta
+        self.n = 0
+        self._f = gzip.open(ruta, "wt", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def guardar(self, request, resp, segundos: float):
+        cuerpo = resp.content or b""
+        crudo = getattr(resp.raw, "headers", None)
+        cookies = crudo.getlist("Set-Cookie") if hasattr(crudo, "getlist") else []
+        entrada = {
+            "metodo": request.method,
+            "url": request.url,
+            "cuerpo_sha1": sha1_cuerpo(request),
+            "status": resp.status_code,
+            "headers": {h: resp.headers[h] for h in HEADERS if h in resp.headers},
+            "cookies": cookies,
+            "segundos": round(segundos, 4),
+        }
+        try:
+            entrada["texto"] = cuerpo.decode("utf-8")
+        except UnicodeDecodeError:
+            entrada["base64"] = base64.b64encode(cuerpo).decode("ascii")
+        linea = json.dumps(entrada, ensure_ascii=False)
+        with self._lock:
+            self._f.write(linea + "\n")
+            self.n += 1
+
+    def cerrar(self):
+        with self._lock:
+            self._f.close()
+
+
+@contextmanager
+def grabar(ruta: str):
+    """Todo lo que salga a la red dentro del bloque (cualquier thread) queda en `ruta`."""
+    grabadora = Grabadora(ruta)
+    original = HTTPAdapter.send
+
+    def send(adapter, request, **kw):
+        t0 = time.perf_counter()
+        resp = original(adapter, request, **kw)
+        if not kw.get("stream"):
+            resp.content  # la latencia grabada incluye bajar el cuerpo
+        grabadora.guardar(request, resp, time.perf_counter() - t0)
+        return resp
+
+    HTTPAdapter.send = send
+    try:
+        yield grabadora
+    finally:
+        HTTPAdapter.send = original
+        grabadora.cerrar()
+
+
+# --------------------------------------------
+# Replay
+# --------------------------------------------
+class _Crudo(io.BytesIO):
+    """raw mínimo: requests saca las cookies de raw._original_response.msg."""
+
+    def __init__(self, cookies):
+        super().__init__(b"")
+        msg = http.client.HTTPMessage()
+        for c in cookies:
+            msg.add_header("Set-Cookie", c)
+        self._original_response = SimpleNamespace(msg=msg)
+
+    def release_conn(self):
+        pass
+
+
+class Replay:
+    """Respuestas grabadas por clave exacta y por clave laxa (id de orderForm = *)."""
+
+    def __init__(self, rutas, escala: float = 1.0):
+        self.escala = escala
+        self._exactas = {}
+        self._laxas = {}
+        self.respuestas = 0
+        self.faltantes = 0
+        self.sin_grabar = {}   # clave -> veces (para ver qué falta grabar)
+        self._lock = threading.Lock()
+        for ruta in rutas:
+            with gzip.open(ruta, "rt", encoding="utf-8") as f:
+                for linea in f:
+                    e = json.loads(linea)
+                    for indice, laxa in ((self._exactas, False), (self._laxas, True)):
+                        k = clave(e["metodo"], e["url"], e["cuerpo_sha1"], laxa)
+                        indice.setdefault(k, deque()).append(e)
+
+    def _buscar(self, request):
+        sha1 = sha1_cuerpo(request)
+        with self._lock:
+            for indice, laxa in ((self._exactas, False), (self._laxas, True)):
+                cola = indice.get(clave(request.method, request.url, sha1, laxa))
+                if cola:
+                    e = cola[0]
+                    cola.rotate(-1)
+                    self.respuestas += 1
+                    return e
+            self.faltantes += 1
+            k = clave(request.method, request.url, sha1)
+            self.sin_grabar[k] = self.sin_grabar.get(k, 0) + 1
+        return None
+
+    def responder(self, adapter, request) -> Response:
+        e = self._buscar(request)
+        r = Response()
+        r.url = request.url
+        r.request = request
+        r.connection = adapter
+        if e is None:
+            r.status_code = 404
+            r.reason = "Sin grabar"
+            r._content = b""
+            r.raw = _Crudo([])
+            return r
+        if self.escala > 0:
+            time.sleep(e["segundos"] * self.escala)
+        r.status_code = e["status"]
+        r.reason = http.client.responses.get(e["status"], "")
+        r.headers = CaseInsensitiveDict(e["headers"])
+        r.encoding = get_encoding_from_headers(r.headers)  # como HTTPAdapter.build_response
+        r._content = e["texto"].encode("utf-8") if "texto" in e else base64.b64decode(e["base64"])
+        r.raw = _Crudo(e["cookies"])
+        return r
+
+
+@contextmanager
+def replay(rutas, escala: float = 1.0):
+    """Dentro del bloque nada sale a la red: responde `Replay` (ver .faltantes al terminar)."""
+    r = Replay(rutas, escala)
+    original = HTTPAdapter.send
+    HTTPAdapter.send = lambda adapter, request, **kw: r.responder(adapter, request)
+    try:
+        yield r
+    finally:
+        HTTPAdapter.send = original
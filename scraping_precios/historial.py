@@ -0,0 +1,287 @@
+# historial.py
+# Historial de precios: cada corrida de cada página se guarda como observaciones en un
+# sqlite local (antes solo quedaba el CSV descargado a mano).
+#
+# Observación: (run_id, ts, cadena, ubicación = sucursal / sc, EAN, precio de lista,
+# precio de oferta, texto de oferta, estado). Una corrida se escribe en una sola
+# transacción; el índice (ean, cadena, ts) resuelve "último precio de X en Y".
+#
+# Refresco incremental: con las últimas observaciones de (cadena, EAN) se estima cada
+# cuánto cambia el precio; lo estable dentro de su TTL adaptativo se reusa del historial
+# y solo se releva lo volátil, lo vencido o lo que no tiene historial.
+
+import os
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from collections import Counter
+
+HISTORIAL_PATH = os.environ.get(
+    "SCRAPING_PRECIOS_HISTORIAL",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".datos", "historial.sqlite"),
+)
+
+# Nombres de cadena tal como aparecen en las páginas -> nombre canónico
+CADENAS = {
+    "carrefour": "Carrefour",
+    "dia": "Día",
+    "día": "Día",
+    "changomas": "ChangoMás",
+    "changomás": "ChangoMás",
+    "coto": "Coto",
+    "jumbo": "Jumbo",
+    "vea": "Vea",
+    "cooperativa": "Cooperativa",
+    "cooperativa obrera": "Cooperativa",
+    "hiperlibertad": "HiperLibertad",
+    "libertad": "HiperLibertad",
+}
+
+SIN_DATO = ("", "NO_ENCONTRADO", "NAN", "NONE")
+
+# Refresco incremental (segundos)
+TTL_BASE = 12 * 3600        # una sola observación (o todas del mismo momento)
+TTL_MAX = 3 * 24 * 3600     # nunca se reusa algo más viejo que esto
+VOLATIL = 2 * 24 * 3600     # si cambia más seguido que esto, se releva siempre
+VENTANA = 10                # observaciones que se miran por (cadena, EAN)
+
+_PRECIO_RE = re.compile(r"^\$?\s*(\d{1,3}(?:\.\d{3})+|\d+)(?:[.,](\d+))?$")
+
+
+def cadena_canonica(nombre: str) -> str:
+    n = str(nombre or "").strip()
+    return CADENAS.get(n.lower(), n)
+
+
+def a_numero(valor):
+    """'1795,00' / '1.795,50' / '$ 1795' / 1795.0 -> float; texto que no es un precio -> None."""
+    if valor is None or isinstance(valor, bool):
+        return None
+    if isinstance(valor, (int, float)):
+        return float(valor) if valor == valor else None  # NaN
+    s = str(valor).strip().replace(" ", "")
+    m = _PRECIO_RE.match(s)
+    if not m:
+        return None
+    entero, dec = m.groups()
+    entero = entero.replace(".", "")
+    # '1.795' (un solo grupo de 3 tras el punto) es miles al estilo AR, como lo formatean las páginas
+    return float(f"{entero}.{dec}" if dec else entero)
+
+
+def observacion(cadena: str, ean: str, lista=None, oferta=None, ubicacion: str = "", estado: str = None) -> dict:
+    """
+    Arma una observación a partir de los valores de una fila: precios como float (o texto formateado) y,
+    si la fila lo trae, su estado (resultados.celdas()); si no, el estado se deduce del valor.
+    """
+    precio_lista = a_numero(lista)
+    precio_oferta = a_numero(oferta)
+    texto = "" if oferta is None or precio_oferta is not None else str(oferta).strip()
+    if estado is None:
+        if precio_lista is not None:
+            estado = "ok"
+        elif str(lista if lista is not None else "").strip().upper() in SIN_DATO:
+            estado = "no_encontrado"
+        else:
+            estado = str(lista).strip().lower()  # "revisar", "sin precio", ...
+    return {
+        "cadena": cadena_canonica(cadena),
+        "ubicacion": str(ubicacion or "").strip(),
+        "ean": str(ean or "").strip(),
+        "precio_lista": precio_lista,
+        "precio_oferta": precio_oferta,
+        "oferta": texto,
+        "estado": estado,
+    }
+
+
+class Historial:
+    def __init__(self, path: str = HISTORIAL_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self.ultimo = None  # (run_id, n, segundos) del último registrar()
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS corridas (
+                run_id TEXT PRIMARY KEY, ts REAL, pagina TEXT, n INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS observaciones (
+                run_id TEXT, ts REAL, cadena TEXT, ubicacion TEXT, ean TEXT,
+                precio_lista REAL, precio_oferta REAL, oferta TEXT, estado TEXT
+            );
+            CREATE INDEX IF NOT EXISTS observaciones_ean_cadena_ts ON observaciones (ean, cadena, ts);
+            """
+        )
+
+    # --------------------------------------------
+    # Escritura
+    # --------------------------------------------
+    def registrar(self, pagina: str, observaciones, run_id: str = None) -> str:
+        """Guarda las observaciones de una corrida en una sola transacción. Devuelve el run_id."""
+        t0 = time.perf_counter()
+        run_id = run_id or uuid.uuid4().hex[:12]
+        ts = time.time()
+        filas = [
+            (run_id, ts, o["cadena"], o["ubicacion"], o["ean"], o["precio_lista"], o["precio_oferta"], o["oferta"], o["estado"])
+            for o in observaciones
+            if o.get("ean")
+        ]
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany("INSERT INTO observaciones VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", filas)
+                self._db.execute(
+                    "INSERT OR REPLACE INTO corridas VALUES (?, ?, ?, COALESCE((SELECT n FROM corridas WHERE run_id = ?), 0) + ?)",
+                    (run_id, ts, pagina, run_id, len(filas)),
+                )
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+            self.ultimo = (run_id, len(filas), time.perf_counter() - t0)
+        return run_id
+
+    # --------------------------------------------
+    # Consultas
+    # --------------------------------------------
+    def ultimo_precio(self, cadena: str, ean: str, ubicacion: str = None):
+        """Última observación (dict) de un EAN en una cadena, o None."""
+        sql = "SELECT * FROM observaciones WHERE ean = ? AND cadena = ?"
+        args = [str(ean).strip(), cadena_canonica(cadena)]
+        if ubicacion is not None:
+            sql += " AND ubicacion = ?"
+            args.append(str(ubicacion).strip())
+        sql += " ORDER BY ts DESC LIMIT 1"
+        with self._lock:
+            cur = self._db.execute(sql, args)
+            row = cur.fetchone()
+            cols = [d[0] for d in cur.description]
+        return dict(zip(cols, row)) if row else None
+
+    def serie(self, cadena: str, ean: str, desde: float = 0) -> list:
+        """Observaciones de un EAN en una cadena desde `desde` (ts), en orden cronológico."""
+        with self._lock:
+            cur = self._db.execute(
+                "SELECT * FROM observaciones WHERE ean = ? AND cadena = ? AND ts >= ? ORDER BY ts",
+                (str(ean).strip(), cadena_canonica(cadena), desde),
+            )
+            cols = [d[0] for d in cur.description]
+            return [dict(zip(cols, r)) for r in cur.fetchall()]
+
+    def recientes(self, cadena: str, ean: str, ubicacion: str = None, pagina: str = None, n: int = VENTANA) -> list:
+        """
+        Últimas n observaciones de un EAN en una cadena (la más nueva primero).
+        pagina filtra por la página que las relevó: cada una toma un precio distinto.
+        """
+        sql = (
+            "SELECT o.ts, o.precio_lista, o.precio_oferta, o.oferta, o.estado FROM observaciones o"
+            " JOIN corridas c ON c.run_id = o.run_id WHERE o.ean = ? AND o.cadena = ?"
+        )
+        args = [str(ean).strip(), cadena_canonica(cadena)]
+        if ubicacion is not None:
+            sql += " AND o.ubicacion = ?"
+            args.append(str(ubicacion).strip())
+        if pagina is not None:
+            sql += " AND c.pagina = ?"
+            args.append(pagina)
+        sql += " ORDER BY o.ts DESC LIMIT ?"
+        args.append(n)
+        with self._lock:
+            rows = self._db.execute(sql, args).fetchall()
+        cols = ("ts", "precio_lista", "precio_oferta", "oferta", "estado")
+        return [dict(zip(cols, r)) for r in rows]
+
+    def resumen(self) -> str:
+        if not self.ultimo:
+            return "Historial: sin registros en esta corrida"
+        run_id, n, seg = self.ultimo
+        return f"Historial: {n} observaciones guardadas en {seg * 1e3:.0f} ms (corrida {run_id})"
+
+
+def ttl_adaptativo(obs: list) -> float:
+    """
+    TTL de la última observación según cuánto cambió el precio en las anteriores (obs: la más
+    nueva primero, solo estado "ok"). Estable: crece con el tiempo que lleva sin cambiar.
+    Con cambios: una fracción del intervalo medio entre cambios; 0 si es volátil.
+    """
+    if len(obs) < 2:
+        return TTL_BASE
+    span = obs[0]["ts"] - obs[-1]["ts"]
+    if span <= 0:
+        return TTL_BASE
+    valor = lambda o: (o["precio_lista"], o["precio_oferta"], o["oferta"])
+    cambios = sum(valor(a) != valor(b) for a, b in zip(obs, obs[1:]))
+    if not cambios:
+        return min(TTL_MAX, max(TTL_BASE, span / 2))
+    intervalo = span / cambios
+    if intervalo < VOLATIL:
+        return 0
+    return min(TTL_MAX, intervalo / 4)
+
+
+class Refresco:
+    """
+    Decide por (cadena, EAN) si hace falta relevar o alcanza con la última observación.
+    reusar() devuelve la observación a reusar o None (= relevar); completo=True releva todo.
+    """
+
+    def __init__(self, hist: "Historial", pagina: str, completo: bool = False):
+        self.hist = hist
+        self.pagina = pagina
+        self.completo = completo
+        self._lock = threading.Lock()
+        self.reusados = 0
+        self.relevados = Counter()  # motivo -> cantidad
+
+    def _relevar(self, motivo: str):
+        with self._lock:
+            self.relevados[motivo] += 1
+        return None
+
+    def reusar(self, cadena: str, ean: str, ubicacion: str = None):
+        if self.completo:
+            return self._relevar("refresco completo")
+        ean = str(ean or "").strip()
+        if not ean:
+            return self._relevar("sin EAN")
+        obs = self.hist.recientes(cadena, ean, ubicacion, pagina=self.pagina)
+        if not obs:
+            return self._relevar("sin historial")
+        if obs[0]["estado"] != "ok":
+            return self._relevar("sin precio")
+        ok = [o for o in obs if o["estado"] == "ok"]
+        ttl = ttl_adaptativo(ok)
+        if not ttl:
+            return self._relevar("volátil")
+        if time.time() - obs[0]["ts"] > ttl:
+            return self._relevar("vencido")
+        with self._lock:
+            self.reusados += 1
+        return obs[0]
+
+    def resumen(self) -> str:
+        total = sum(self.relevados.values())
+        if self.completo:
+            return f"Refresco completo: {total} relevados"
+        motivos = " · ".join(f"{n} {m}" for m, n in self.relevados.most_common())
+        return f"Incremental: {total} relevados" + (f" ({motivos})" if motivos else "") + f" · {self.reusados} reusados del historial"
+
+
+_historial = None
+_historial_lock = threading.Lock()
+
+
+def compartido() -> Historial:
+    """Instancia compartida por todas las páginas (sobrevive a los reruns de Streamlit)."""
+    global _historial
+    with _historial_lock:
+        if _historial is None:
+            _historial = Historial()
+        return _historial
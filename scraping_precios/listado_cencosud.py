@@ -1,1490 +0,0 @@
-productos = {
-  "ARCOR POLVO ANANA BAJO AZUCARES SOBRE 18GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580129699",},
-  "ARCOR POLVO ANANA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580141516",},
-  "ARCOR POLVO DURAZNO BAJO AZUCARES SOBRE 18GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580129927",},
-  "ARCOR POLVO DURAZNO SOBRE 15GR P/1 LT": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580142766",},
-  "ARCOR POLVO FRUTILLA BAJO AZUCARES SOBRE 18GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580129910",},
-  "ARCOR POLVO LIMONADA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143527",},
-  "ARCOR POLVO MANZANA BAJO AZUCARES SOBRE 18GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580129286",},
-  "ARCOR POLVO MANZANA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580144142",},
-  "ARCOR POLVO NARA-DURAZNO BAJO AZUCARES SOBRE 18GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580129675",},
-  "ARCOR POLVO NARANJA BAJO AZUCARES SOBRE 18GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580132415",},
-  "ARCOR POLVO NARANJA BANANA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580141509",},
-  "ARCOR POLVO NARANJA DULCE BAJO AZUCARES SOBRE 18GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580129712",},
-  "ARCOR POLVO NARANJA DULCE REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143008",},
-  "ARCOR POLVO NARANJA DURAZNO REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580141943",},
-  "ARCOR POLVO NARANJA MANGO REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143763",},
-  "ARCOR POLVO NARANJA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143237",},
-  "ARCOR POLVO NAR-MANGO BAJO AZUCARES SOBRE 18GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580129729",},
-  "ARCOR POLVO POMELO ROSADO SOBRE REG 15GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580142285",},
-  "ARCOR POLVO REG FRUTILLA ANANA BANANA SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143824",},
-  "ARCOR POLVO REG MULTIFRUTA SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580142490",},
-  "BC LA CAM-PAGNOLA 0% AZU. NARAN.DUL.SOB.9.5 GRP/1 L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580984410",},
-  "BC LA CAMPAGNOLA FRUTILLA LIMON SIN AZU SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129637",},
-  "BC LA CAMPAGNOLA NARANJA DULCE SIN AZU SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129965",},
-  "BC LA CAMPAGNOLA POMELO AMARILLO SIN AZU. SOB .7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129576",},
-  "BC LA CAMPAGNOLA SIN AZU ANANA SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129620",},
-  "BC LA CAMPAGNOLA SIN AZU LIMONADA SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129941",},
-  "BC LA CAMPAGNOLA SIN AZU MANZANA SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129972",},
-  "BC LA CAMPAGNOLA SIN AZU NAR/DUR SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129880",},
-  "BC LA CAMPAGNOLA SIN AZU NARANJA SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580132774",},
-  "BC LA CAMPAGNOLA SIN AZU. MANGO NARANJA SOB .7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129958",},
-  "BC LA CAMPAGNOLA SIN AZU. MIX FRUTAL SOB .7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129385",},
-  "BC LA CAMPAGNOLA SIN AZU. POMELO ROSADO SOB .7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129644",},
-  "BAGLEY AMOR DUL RELL 330GR C/3U PAQUETE AGR 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "AMOR", "ean": "7790040143500",},
-  "BAGLEY AMOR VAINILLA DULCE RELLENA 110GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "AMOR", "ean": "7790040143531",},
-  "BAGLEY SURTIDO DUL.SECA 400GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAGL SURT", "ean": "7790040147720",},
-  "ARCOR CEREAL MIX AVENA Y PASAS DUL.SECA PAQ. 207 G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040135741",},
-  "ARCOR CEREAL MIX DUL.SECA CACAO 150GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040140943",},
-  "ARCOR CEREAL MIX DUL.SECA FRUTILL 150GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040140936",},
-  "ARCOR CEREAL MIX FRUTILLA/CHIA DUL.SECA PAQ. 207 G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040135765",},
-  "ARCOR CEREAL MIX GALL DUL SECA 100GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040140912",},
-  "ARCOR CEREAL MIX GALL DUL SECA 100GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040140929",},
-  "ARCOR CEREAL MIX GALL.CM.AVE/CHOC 207GR 1UN PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040145023",},
-  "ARCOR CEREAL MIXAVE/SEM/CHIPS DUL.SECA 207 GR PAQ.": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040135758",},
-  "BAGLEY CHOCOLINAS BCO DUL SEC 245GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040142985",},
-  "BAGLEY CHOCOLINAS DUL.SECA PAQ.170G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040143227",},
-  "BAGLEY CHOCOLINAS DULCE SECA250 GRS. PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040143234",},
-  "BAGLEY CHOCOLINAS GALLET DUL.SEC PAQUETE 170G 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040148857",},
-  "BAGLEY CHOCOLINAS NEG DUL SEC. 258GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040142992",},
-  "BAGLEY GALL CHOCOLINAS DUL SEC 100GR PAQUE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040143241",},
-  "ARCOR COFLER BLOCK DULCE SECA PAQ. 124 GR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040116955",},
-  "ARCOR COFLER BOB GALL RELL 85GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143807",},
-  "ARCOR COFLER COOKIES DULCE SECA BOLSA 120 GR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040127944",},
-  "ARCOR COFLER GALL BANADA CHC 105.6G PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143739",},
-  "ARCOR COFLER GALL OBLEAS 87GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143821",},
-  "ARCOR COFLER GALL TARTAL.BAN CHC 105.6GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143753",},
-  "ARCOR COFLER GALL. BAN CHC 132.8GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143692",},
-  "ARCOR COFLER GALLET DULCE RELL 85GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143777",},
-  "ARCOR COFLER GALLET DULCE RELL 85GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143784",},
-  "ARCOR COFLER GALLETA DULCE OBLEA 91GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143814",},
-  "BAGLEY COQUITAS DULCE SECA 177GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COQUITAS", "ean": "7790040143258",},
-  "BAGLEY COQUITAS DULCE SECA 260GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COQUITAS", "ean": "7790040143265",},
-  "BAGLEY CRIOLLITAS TOSTADAS DULCE SECA 200 GRPAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CRIOLL", "ean": "7790040102750",},
-  "BAGLEY CRIOLLITAS TOSTADAS DULCES PAQ.195GR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CRIOLL", "ean": "7790040124530",},
-  "ARCOR DIVERSION SURTIDO DU.SE.REL. 400 GRBOLSA": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DIVERSION", "ean": "7790040143364",},
-  "ARCOR FORMIS ANIMALES DULCES SECAS 72 GRS PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139909",},
-  "ARCOR FORMIS C/D.DE LECHE DUL.RELL 72GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139916",},
-  "ARCOR FORMIS FRUTILLA DUL REL 102GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139923",},
-  "ARCOR FORMIS VAI/CHO DUL REL 102GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139930",},
-  "ARCOR FORMIS VAI/CHO DUL REL 102GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139978",},
-  "ARCOR FORMIS VAIN/FRUT DUL.RELL 72GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139893",},
-  "ARCOR MACUCAS CHOC. DUL.RELLE.110 GR PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MACUCAS", "ean": "7790040133495",},
-  "ARCOR MANA CHOC DUL SEC 136GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040137912",},
-  "ARCOR MANA CHOCOLATE DUL.RELLE.152 GR. PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040133242",},
-  "ARCOR MANA FRUTILLA DR 152 GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040133266",},
-  "ARCOR MANA LIMON DUL.RELLE.152 GR. PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040133259",},
-  "ARCOR MANA VAIN ACARAMELADA DS 145GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040151901",},
-  "ARCOR MANA VAIN DUL.SEC 136GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040137837",},
-  "ARCOR MANA VAIN DUL.SEC. 136GR PAQ 3U 408G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040137844",},
-  "ARCOR MANA VAINILLA DUL.RELLE.152 GR. PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040133235",},
-  "BAGLEY MELITAS C/MIEL DUL SEC 159GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELITAS", "ean": "7790040139770",},
-  "BAGLEY MELLIZAS DUCE .RELL. 110GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELLIZAS", "ean": "7790040143548",},
-  "BAGLEY MELLIZAS GALL DUL RELL 330GR 1U PAQ AGR X3": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELLIZAS", "ean": "7790040143555",},
-  "BAGLEY MERENGADAS DUL.REL. 88GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MERENGADA", "ean": "7790040139657",},
-  "BAGLEY MERENGADAS. DUL.REL. 88GR PAQ AGR 3U 264G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MERENGADA", "ean": "7790040139091",},
-  "ARCOR GALLETA OBLEA WF 25GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O ARCOR", "ean": "77940131",},
-  "ARCOR GALLETA OBLEA WF 25GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O ARCOR", "ean": "77975737",},
-  "ARCOR GALLETA TURROKLET OB/WF 25GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O ARCOR", "ean": "77993540",},
-  "BAGLEY CEREALES C/AVENA D.S. 155GR X3U PAQ AGR 465G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O BAGL", "ean": "7790040136915",},
-  "BAGLEY OPERA GALL OBLEAS 220 GRS. PAQ AGR X4": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OPERA", "ean": "7790040932005",},
-  "BAGLEY OPERA OBLEA 55 GRS. PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OPERA", "ean": "7790040007604",},
-  "BAGLEY OPERA OBLEA PAQUETE 55 GR ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OPERA", "ean": "77903501",},
-  "BAGLEY OPERA OBLEAS 220 GRS. PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OPERA", "ean": "7790040008175",},
-  "BAGLEY OPERA OBLEAS CHOCOLATE 68GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OPERA", "ean": "77971708",},
-  "BAGLEY OPERA OBLEAS DUL.RELLE.92 GR PAQUE.ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OPERA", "ean": "77903518",},
-  "BAGLEY OPERA SHREK OBLEAS 55 GRS. PAQUE.ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OPERA", "ean": "7790040932104",},
-  "BAGLEY OPERA SHREK OBLEAS 92 GRS. PAQUE.ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OPERA", "ean": "7790040932203",},
-  "BAGLEY PORTENITAS D.S VAINILLA/CARAME PAQ. 139G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PORTENITAS", "ean": "7790040132689",},
-  "BAGLEY PORTENITAS D.SEC VAIN/CARAME PAQ AGR 417G 3X 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PORTENITAS", "ean": "7790040151192",},
-  "BAGLEY RUMBA GALL DUL.RELL. 110GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "RUMBA", "ean": "7790040143517",},
-  "BAGLEY RUMBA GALLET DUL.RELL. 330GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "RUMBA", "ean": "7790040143524",},
-  "BAGLEY SONRISAS DR 108 GRS PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SONRISAS", "ean": "7790040133488",},
-  "BAGLEY SONRISAS FRAM DL RELLE 108GR PACK X3 U 324 G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SONRISAS", "ean": "7790040133471",},
-  "ARCOR TORTITAS BLACK DUL.SECA 125 GRS. PAQUE.ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TORTITAS", "ean": "7790040676800",},
-  "ARCOR TORTITAS BLACK DUL.SECA 125 GRS. PAQUE.ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TORTITAS", "ean": "7790580538903",},
-  "BAGLEY CRIOLLITAS CRACKERS 100 GR C/U PAQ.X 3 U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040377806",},
-  "BAGLEY CRIOLLITAS ORIGINAL CR. 499G EST FAM 5X 1UN PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040139015",},
-  "BAGLEY CRIOLLITASMAS GRANDES CRACKERS 169 G C/U PAQ.X 3 U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040946200",},
-  "BAGLEY CRIOLLITASORIGINAL CRACKERS 100 GR PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040377707",},
-  "BAGLEY CRIOLLITASSIN SAL CRACKERS 169 G.C/U PAQ.X 3UN.": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040946408",},
-  "BAGLEY CRIOLLITASTOST.LIGHT CRACKERS PAQ.195GR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040124547",},
-  "BAGLEY CEREAL C/SALVADO 169GR 3U PAQ AGR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "FAM", "ean": "7790040136243",},
-  "BAGLEY SALVADO 169 GR PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "FAM", "ean": "7790040136250",},
-  "ARCOR HOGARENAS 7 SEMILLAS CEREAL 189GR PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040136069",},
-  "ARCOR HOGARENAS SALVADO CEREAL 200 G.C/U PAQ.X 3 UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040132955",},
-  "ARCOR HOGARENAS SALVADO CEREAL 200 GRS. PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040132962",},
-  "ARCOR HOGARENAS. MIX CEREALES CEREAL 185 GR PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040136090",},
-  "BAGLEY KESITAS GALL SNACKS QUESO 250GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "KESITAS", "ean": "7790040144033",},
-  "BAGLEY KESITAS HORNEADAS SNACKS 125 GR CAJA": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "KESITAS", "ean": "7790040173200",},
-  "BAGLEY REX KESITAS SNACKS 75 GRBOLSA ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "KESITAS", "ean": "7790040003606",},
-  "BAGLEY CEREALES MAIZ 189GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O BAGL", "ean": "7790040136236",},
-  "BAGLEY REX ORIGINAL SNACK 225GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "REX", "ean": "7790040144125",},
-  "BAGLEY REX ORIGINAL SNACKS 125 GR CAJA": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "REX", "ean": "7790040719804",},
-  "BAGLEY REX ORIGINAL SNACKS BOL 75 GRARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "REX", "ean": "7790040003569",},
-  "ARCOR SALADIX CALABRESA SNACKS 100 GRS. CAJA ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790580716806",},
-  "ARCOR SALADIX CHIPS FUEGO 60GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790040133846",},
-  "ARCOR SALADIX DUO QUE.Y JAM.SNACKS 80 GR. CAJA ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790040374607",},
-  "ARCOR SALADIX JAMON SNACKS 100 GRS. CAJA ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790580716707",},
-  "ARCOR SALADIX PIZZA SNACKS 100 GRS. CAJA": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790580697303",},
-  "SALADIX HORNEADO SN PICANTE 30GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790040147782",},
-  "SALADIX SALADIX SN PICANTE 100GR CAJA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790040141254",},
-  "SALADIX XTRA PICANTE SNACKS CAJA 100 GRS 1U ARCOR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790040147775",},
-  "BAGLEY GALL TRAVIATA ORIGINAL CR 324GR PAQ AGR 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040144088",},
-  "BAGLEY TRAVIATA C/KESIT GALL CR 288GR 1UN PAQ AGR X3": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040150270",},
-  "BAGLEY TRAVIATA C/REX GALL CRACKER 288GR X3 PAQ AGR 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040143920",},
-  "BAGLEY TRAVIATA CRACKERS 108GR 5U PAQUETE 540G PAQ AGR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040144095",},
-  "BAGLEY TRAVIATA GALL CR C/ REX SAL ORIG 1U PAQUETE 96GR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040143937",},
-  "BAGLEY TRAVIATA GALL CR KESIT 1U PAQUETE 96GR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040143944",},
-  "BAGLEY TRAVIATA.CRACKERS 108GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040144071",},
-  "TRAVIATA BAGLEY BALANCE CR 321GR X3U PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040142763",},
-  "AGUILA ALFAJOR MINITORTA TRIPLE 69GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "AGUILA", "ean": "7790040133587",},
-  "AGUILA ALFAJOR.MINITORTA BROWNI 71.5GR TRPL PQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "AGUILA", "ean": "7790040133594",},
-  "AGUILA MINITORTA TRIPLE 70.5 GR 1U PAQ REGULAR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "AGUILA", "ean": "7790040133600",},
-  "B&N ALFAJOR NEGRO 50GR SPL PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BLCO/NGRO", "ean": "7790040141179",},
-  "BAGLEY ALFAJOR BLANCO TRIPLE 69GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BLCO/NGRO", "ean": "7790040133570",},
-  "BAGLEY B & N 3.0 ALFAJOR BLANCO 73.5 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BLCO/NGRO", "ean": "7790040991910",},
-  "BAGLEY B & N 3.0 ALFAJOR NEGRO 73.5 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BLCO/NGRO", "ean": "7790040375000",},
-  "BON O BON ALFAJORES MINI 19.5GR X6 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BON O BON", "ean": "7790040129764",},
-  "BON O BON BLANCO ALFAJOR 40 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BON O BON", "ean": "7790040613607",},
-  "BON O BON NEGRO ALFAJOR 40 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BON O BON", "ean": "7790040613706",},
-  "BON O BON NEGRO ALFAJOR 40 GRPAQ.X6 U.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BON O BON", "ean": "7790040613904",},
-  "BON O BON NEGRO ALFAJOR TRIPLE 60 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BON O BON", "ean": "7790040614000",},
-  "COFLER CHOCO CREAMY ALFAJOR TRIPLE 60GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCO CREAMY", "ean": "7790040150010",},
-  "CHOCOTORTA ALFAJOR TRIPLE 71.5GR PAQ 1UN BAGLEY": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOTORTA", "ean": "7790040150072",},
-  "COFLER ALFAJOR SPL MOUSSE 40GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "COFLER", "ean": "7790040143647",},
-  "COFLER BLOCK ALFAJOR SIMPLE 40.7GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "COFLER", "ean": "7790040143654",},
-  "COFLER BLOCK RELL.CHOC.ALF.TRIPLE 60 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "COFLER", "ean": "7790040659605",},
-  "COFLER BLOCK.ALFAJOR SIMPLE 40.7GR 6U PAQ 244.2G": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "COFLER", "ean": "7790040143630",},
-  "TATIN ALFAJOR NEGRO 33 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TATIN", "ean": "7790040331204",},
-  "TATIN ALFAJOR TRIPLE 60 GRARG": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TATIN", "ean": "7790040405608",},
-  "TATIN BLANCO REGULAR BOLSA ALF. 33GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TATIN", "ean": "7790040331303",},
-  "TATIN TRIPLE ALFAJOR 60 GRARG": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TATIN", "ean": "77944375",},
-  "TATIN TRIPLE BLANCO ALFAJOR 60 GRARG": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TATIN", "ean": "7790040405301",},
-  "TOFI ALFAJOR NEGRO 46 GRPAQ.X6 U.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TOFI", "ean": "7790040117143",},
-  "TOFI MINI ALFAJOR REGULAR SIMPLE 144 GR BAND.6": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TOFI", "ean": "7790040116641",},
-  "TOFI NEGRO ALFAJOR 46 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TOFI", "ean": "7790040116610",},
-  "TOFI TRIPLE BLANCO ALFAJOR 73 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TOFI", "ean": "7790040953703",},
-  "TOFI TRIPLE NEGRO ALFAJOR 73 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TOFI", "ean": "7790040484801",},
-  "AGUILA ALMENDRAS BAN C/CHOCOLAT 120GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "AGUILA", "ean": "7790580142384",},
-  "AGUILA BARRA MOUSSE BANADA160GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "AGUILA", "ean": "7790580131135",},
-  "AGUILA BARRA TRIFLE BANADA 160GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "AGUILA", "ean": "7790580131111",},
-  "AGUILA NUT OBLEA BANADA CHOC 105GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "AGUILA", "ean": "7790580147556",},
-  "AGUILA PASAS BAN CHOCOLATE 120G BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "AGUILA", "ean": "7790580142421",},
-  "ARCOR BV ALMENDRA BANADAS C/CHOCO. 120 GR BOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ARCOR", "ean": "7790580139438",},
-  "ARCOR CEREAL DE ARROZ BAN CHC 50GR BOL 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ARCOR", "ean": "7790580142414",},
-  "ARCOR GOMITA BAN CHC 80GR BOLSA 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ARCOR", "ean": "7790580139568",},
-  "ARCOR MILK OBLE BANADA CHC 20GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ARCOR", "ean": "7790580144227",},
-  "ARCOR TURRON BANADO C/CHOCOLA.90 GR CAJA ARG": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ARCOR", "ean": "7790580392604",},
-  "ARCOR TWIT O BANADOS 20GR PAQ.1U REG.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ARCOR", "ean": "7790580132712",},
-  "BON O BON BLANCA OBLEA BANADA 30 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580346614",},
-  "BON O BON CUBANITOS RELLE.BAN.C/CHOCO. 78GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580146948",},
-  "BON O BON OBLEA BANADA C/CHOCO. 30 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580346515",},
-  "BON O BON POSTRE RELL. BANA.C/CHO 260 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580136352",},
-  "BON O BON XL OBLEA BAN.CHO.C/LEC. 45 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580109646",},
-  "BON O BON.TENTACION BARRA MANI/OBLEA 120 GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580141301",},
-  "CABSHA CHO.BARRA C/GALL.CARA. DDL 110G 1U PAQ": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "CABSHA", "ean": "7790580135973",},
-  "COFLER ALMENDRAS BAN C/CHOCO 100GR BOL 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580141714",},
-  "COFLER ALMENDRAS BAN C/CHOCO C/LECH 100GR BOL 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580141721",},
-  "COFLER BLANCO OBLEA BAN TRPL C/CHOCLIN 110GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580142513",},
-  "COFLER BLOCK OBLEA BAN CHOCOMANI TRPL 110GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580141394",},
-  "COFLER CHOCOLINAS BAN. BARRA 110GR PAQ. 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580146856",},
-  "COFLER PASAS BANAD C/CHOCO. 100GR BOL 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580141707",},
-  "COFLER GRAFFITI OBLEA BAN.RELLENA C/CHO. 45 GRPAQ.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GRAFFITI", "ean": "7790580111755",},
-  "HAMLET HAMLETON OBLEA BANADA 28GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "HAMLET", "ean": "7790580137656",},
-  "ARCOR PASAS BAN.C/CHO. 100 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O ARCOR", "ean": "7790580135942",},
-  "ROCKLETS 3 DESEOS REGULAR PAQUETE 120 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ROCKLETS", "ean": "7790580122652",},
-  "ROCKLETS BOLLS CEREAL BAN.C/CHO. 120 GRPAQ.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ROCKLETS", "ean": "7790580118235",},
-  "AGUILA D´OR FRUTOS SECOS BAN.CHOC.BOL 120GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "AGUILA", "ean": "7790580136420",},
-  "AGUILA MEDALLON CHOCOLATE 168GR 1U CAJA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "AGUILA", "ean": "7790580139872",},
-  "ARCOR BOMBONES SURTIDO ESP 223GR CAJA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ARCOR", "ean": "7790580138370",},
-  "ARCOR EL KIOSCO EN CASA 246GR CAJA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ARCOR", "ean": "7790580131371",},
-  "BON O BON AGUILA BOMBON 15 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "77953537",},
-  "BON O BON AGUILA BOMBON CAJA 18 U X 15 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580102517",},
-  "BON O BON BLANCO BOMBON 15 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "77958594",},
-  "BON O BON BOMBON BLANCO 16 GR.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "77961815",},
-  "BON O BON BOMBON CHC 15 GR CAJA 18UN 270G": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580119065",},
-  "BON O BON BOMBON CHOCO C/LECHE CAJA 270GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580146368",},
-  "BON O BON BOMBON LECHE DI 288 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580119157",},
-  "BON O BON BOMBON REGULAR 15 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "77958921",},
-  "BON O BON CHOCOLINAS BYB CHC CAJA 270GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580110772",},
-  "BON O BON CHOCOLINASBOMBONES CAJA 270 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580117771",},
-  "BON O BON REGULAR ED. ESP. BOLSA 15 GR C/U 7 U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580119164",},
-  "BON O BON SUPERBOLLS CHOC BCO POUCH 80 GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580135775",},
-  "BON O BON SURTIDO REGULAR BOMBONES CAJA 255 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580119126",},
-  "ROSPO SAPITO BOCADITO RE.CHOCOL. 10.5 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROSPO", "ean": "77928894",},
-  "ROSPO SAPITO BOCADITO REL.D.D.L. 10 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROSPO", "ean": "77928870",},
-  "ROSPO SAPITO BOCADITO RELL.FRUT. 10 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROSPO", "ean": "77917393",},
-  "ROSPO SAPITO BOCADITO RELL.MANI 10 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROSPO", "ean": "77912718",},
-  "ARCOR SELECCION BOMB SURTIDO 228.6GR CAJA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "SELECCION", "ean": "7790580131388",},
-  "TOFI BOMBON CH.C/LE.RELL.C/D.D.LEC. 15 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "TOFI", "ean": "77972279",},
-  "ARCOR MANI BANADO MANI CH 35GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580128043",},
-  "ARCOR MANI COLOR CONF.C/CH. 80 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580106195",},
-  "ARCOR MANI CON CHOC. BLANCO 80GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580139223",},
-  "ARCOR MANI CON CHOCOLATE 120 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580330309",},
-  "ARCOR MANI CON CHOCOLATE 80 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580106027",},
-  "ARCOR MANI CON CHOCOLATE BOLSA 100 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580136444",},
-  "ARCOR MANI.CROCANTE BAN.C/CHC 100GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580141738",},
-  "BON O BON CITOS CONFITADOSPOTE 200 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BON O BON", "ean": "7790580111243",},
-  "COFLER BLOCK BOMBON MANI CON CHOCOLATE 16GR X16U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "COFLER", "ean": "7790580130565",},
-  "COFLER BLOCK MANI C/CHOC BCO 100GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "COFLER", "ean": "7790580139780",},
-  "COFLER BLOCK MANI C/CHOCOLATE 100GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "COFLER", "ean": "7790580139797",},
-  "COFLER BLOCK MANI CON CHOCOLATE 40 GRCAJA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "COFLER", "ean": "7790580110284",},
-  "ROCKLETS CHOC CONFI 14GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "77990747",},
-  "ROCKLETS CONFIT CHC MOMIA BOLSA 40GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580151560",},
-  "ROCKLETS GRAGEAS C/CHOCOLATE 20 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580421007",},
-  "ROCKLETS GRAGEAS CHOCOLATE BOLSA 40 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580327415",},
-  "ROCKLETS HALLOWEEN CH CONF 120GR CAJA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580144876",},
-  "ROCKLETS MANI C/CHOCO. BOLSA 40 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580327613",},
-  "ROCKLETS MINI GRAGEAS DE CHOCOLATE PAQUETE 120 GRS": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580418106",},
-  "ROCKLETS NAVIDAD GRAGEAS C/CHOCO. 120 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580415808",},
-  "ROCKLETS NAVIDAD MANI CON CHOCOLATE 120 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580423001",},
-  "ARCOR MILK C/SORP HUEVO PAQUETE 22 GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "ARCOR", "ean": "7790580133573",},
-  "COFLER ROCKELETS HVO CHC S/SORP 54GR BOL1UN PAS/NAV": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "COFLER", "ean": "7790580121402",},
-  "ARCOR SAPITO FIGURA DE CHOC 10GR 1U PAQUETE": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "SAPITO", "ean": "77990358",},
-  "AGUILA EXTRA FINO CHC P/REPOST. 150GR TAB 1U PAQUETE": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "AGUILA", "ean": "7790580109882",},
-  "ARCOR 50 CACAO TABLETA SOLIDA 25 GR PAQ.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580120092",},
-  "ARCOR BLANCO TAB.SOLIDA 25 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580607418",},
-  "ARCOR C/LECHE TAB.SOLIDA 25 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580607210",},
-  "ARCOR CHOCOLATE LECHE Y MANI 25 GRS PAQUETE": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580124960",},
-  "ARCOR CHOCOLATIN C/LECHE TAB.SOLIDA 8 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "77958563",},
-  "ARCOR MILK RELLE. 12GR PAQUETE 1U 35% LECHE": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "77977991",},
-  "ARCOR MILK RELLENA CHC 12GR PAQUETE 4UN 48G": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580135140",},
-  "ARCOR SOLIDAS 95GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580133634",},
-  "ARCOR SOLIDAS C/LECHE Y MANI 95GR 1U PAQ": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580123734",},
-  "ARCOR SOLIDAS C/LECHE Y MANI 95GR 1U PAQ": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580133740",},
-  "BON O BON TABLETA CHC RELLENA 160GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "BON O BON", "ean": "7790580146047",},
-  "COFFLER AIR C/LECHE TAB.AIREA. 100 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103446",},
-  "COFLER AIR BLANCO TAB.AIREA. 100 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103453",},
-  "COFLER AIR BLANCO TAB.AIREA. 27 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103378",},
-  "COFLER AIR BLANCO TAB.AIREA. 27 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103385",},
-  "COFLER AIR C/ALMENDR.TAB.AIREA. 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103439",},
-  "COFLER AIR CHO.C/LEC.TAB.AIREA. 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580033408",},
-  "COFLER AIR CHOCO. C/ALMENDRAS 100 GRTAB.AIREA.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103477",},
-  "COFLER AIR CHOCOLATE MIXTO 100 GRTAB.AIREA.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103460",},
-  "COFLER AIR LECHE TAB.AIREA. 27 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103361",},
-  "COFLER AIR MIXTO TAB.AIREA. 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103422",},
-  "COFLER AIREADO BON O BON TAB AIREA 30GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580127145",},
-  "COFLER BLOCK 300 C/LECHE Y MANI 300 GRTAB.SOLIDA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103743",},
-  "COFLER BLOCK BCO C/MANI TAB.SOLIDA 38 GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "77981912",},
-  "COFLER BLOCK C.MANI TAB.SOLIDA 38 GR 1U PAQ": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580137090",},
-  "COFLER BLOCK C/MANI TAB.SOLIDA 170 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580105013",},
-  "COFLER BLOCK C/MANI TAB.SOLIDA 38 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "77953124",},
-  "COFLER BLOCK CH.LE/MANITAB.SOLIDA 110 GRARG": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "77950031",},
-  "COFLER BLOCK CHOCOLATE C/LEC.MANI 38 GRTAB.SOL.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "77917706",},
-  "COFLER BLOCK TAB.SOLIDA 110 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "77922120",},
-  "COFLER BLOCKAZO CHO.C/LEC.C/MANI 1000 GRTAB.SOLIDA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580115579",},
-  "COFLER BON O BON RELLENO BON O BON 67 GRTAB.AIREA.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580115562",},
-  "COFLER C/CHOCOLINAS SOLIDAS 55GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103538",},
-  "COFLER C/LECHE MANI TAB.SOLIDA 170GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580132750",},
-  "COFLER C/LECHE TAB.SOLIDA 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103484",},
-  "COFLER C/LECHE Y ALMENDRAS TAB.SOLIDA 140GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580128234",},
-  "COFLER C/LECHE Y ALMENDRAS TAB.SOLIDA 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580033507",},
-  "COFLER CHOCOLINAS TABL BLANCO 140GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580127336",},
-  "COFLER DUBAI TABL CHC RELLENAS 192GR CAJA 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "634240334733",},
-  "COFLER DUBAI TABLETA RELLENAS 45GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "77960474",},
-  "COFLER DULCE DE LECHE RELLENAS 38GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580132958",},
-  "COFLER LECHE SOLIDAS 18GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "77971685",},
-  "COFLER RELL AVELLANA TABLETA 35 GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580146016",},
-  "COFLER ROCKLETS C/CONFITESTAB.SOLIDA 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580242015",},
-  "COFLER ROCKLETS TAB.SOLIDA 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103521",},
-  "COFLER ROCKLETS TABL SOL 140GR 1UN PAQUETE": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580146092",},
-  "COFLER TABL.LECHE COFLER 140GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580127947",},
-  "COFLER TABLETA CHC 60%CACAO SOLIDA 100GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580141776",},
-  "COFLER TABLETA CHC 60%CACAO SOLIDA 100GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580143862",},
-  "COFLER TABLETA CHC SOLIDA 100GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580141752",},
-  "COFLER TRES PLACERES CH.AMA.BL.LEC. 55 GRTAB.SOLIDA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580106560",},
-  "COFLER YOGURT FRUTILLA RELL 64GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580123642",},
-  "COFLER YOGURT FRUTILLA TABLETA RELLENA 35GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580123772",},
-  "HAMLET CHOCOLATO-SO LECHE C/CHOCO.Y CERE.43 GRTAB.RELLE.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HAMLET", "ean": "7794612066211",},
-  "HAMLET LECHE MANI ALMENDRA CEREAL 45 GRTAB.SOLIDA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HAMLET", "ean": "7794612065719",},
-  "HAMLET YOGUR FRUTILLA TAB.RELLE. 43 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HAMLET", "ean": "7794612066419",},
-  "ARCOR ROCKLETON TAB.SOL REG. 13.5 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O ARCOR", "ean": "77961471",},
-  "TOFI C/LECHE TAB.RELLE. 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TOFI", "ean": "7790580746612",},
-  "TOP LINE DIET 6.7 GR FRUTA 4 TAB.PAQ.CAJA X20 U": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580144609",},
-  "TOP LINE DIETETICO 6.7 GR SANDIA 4 TABL.PAQ.": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77919489",},
-  "TOP LINE S/AZUCAR 6.7 GR FRUTA 4 TABL.PAQ.": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77916389",},
-  "TOP LINE S/AZUCAR 6.7 GR STRONG 4 TABL.PAQ.": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77916396",},
-  "TOP LINE S/AZUCAR SEVEN 14 GR ATOMIC STRO.7 TABL.PAQ": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77939753",},
-  "TOP LINE S/AZUCAR SEVEN 14 GR BLOW.MAND.7 TABL.PAQ": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77932693",},
-  "TOP LINE S/AZUCAR SEVEN 14 GR SANDIA 7 TABL.PAQ.": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77948588",},
-  "TOP LINE S/AZUCAR SEVEN 14 GR STRAWBERRY 7 TABL.PAQ.": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77951113",},
-  "TOP LINE S/AZUCAR SEVEN 14 GR XPLO.MINT 7 TABL.PAQ": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77931764",},
-  "TOP LINE SEVEN TURBO MINT 20 CHI.CONF. ADU. 2.5G C/U PT 50GR": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580138547",},
-  "TOP LINE SEVEN ULTRA GREEN MINT 12TABL. ADU. PQ. 24GR 1UN": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580120702",},
-  "TOP LINE SEVEN ULTRA S/AZUCAR DIET 12U.TABL 24 GR CAJA": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580120573",},
-  "TOP LINE SEVEN ULTRA TAB. DIET DOBLE CAPA 12U. 24 GR CAJA": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580121013",},
-  "TOPLINE SEVEN CONFITADO 10P. TURBO MINT ADU. CJ.25GR 1UN": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580146818",},
-  "TOPLINE SEVEN ULTRA CITRUS BLUEBERRY 12TAB. ADU CJ.24GR 1UN": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580137076",},
-  "CLIGHT DIET LIMONADA MARACUYA SOBRE 7.5 P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201733834",},
-  "CLIGHT LIMONADA ARANDANOS DIET SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622202236846",},
-  "CLIGHT LIMONADA ROSA S/AZUCARES SOBRE 7.5G P/1 L.": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201682026",},
-  "CLIGHT NAR/DUR S/A VITC+D SOBRE 7.5G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201702717",},
-  "CLIGHT POLVO ANANA SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201702625",},
-  "CLIGHT POLVO DIET MANZANA DELI. SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703080",},
-  "CLIGHT POLVO NARA MANGO DIET SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201702687",},
-  "CLIGHT POLVO NARANJA VITC+D SOBRE 8GR P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201807467",},
-  "CLIGHT POLVO PERA SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703202",},
-  "CLIGHT POLVO S/A LIMONADA VITC+D SOBRE 8GR P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201702656",},
-  "CLIGHT POLVO S/A MANDARINA SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201704148",},
-  "CLIGHT POLVO S/A NARANJA VIT CY D SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703110",},
-  "CLIGHT POLVO STEVIA NARANJA SOB. 9.5GR P/1LT": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201704551",},
-  "CLIGHT PVO S/A MANZANA VERDE SOBRE 7.5GR P/1LT": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703059",},
-  "CLIGHT PVO S/A NARANJA DULCE VIT C Y D SOBRE 7.5G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703141",},
-  "CLIGHT PVO S/A POMELO AMARILLO VIT C Y D SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703233",},
-  "CLIGHT PVO S/A POMELO ROSADO VIT C Y D SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703172",},
-  "TANG BALANCE POLVO LIMONADA SIN ENDULZAR SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622202012082",},
-  "TANG BALANCE POLVO NARANJADA S/ENDULZAR SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622202012129",},
-  "TANG MIX NAR/MARA/FRUT BAJAS CALORIAS SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201746063",},
-  "TANG POLV POM ROSADO REG SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735746",},
-  "TANG POLVO MANZANA REG VITC+D SOBRE 18GR P/1LT": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201814854",},
-  "TANG POLVO PERA REG SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201745738",},
-  "TANG POLVO REG ANANA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201745967",},
-  "TANG POLVO REG DURAZNO SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201745936",},
-  "TANG POLVO REG FRUTILLA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201746490",},
-  "TANG POLVO REG LIMONADA DULCE SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735685",},
-  "TANG POLVO REG MANDARINA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201733865",},
-  "TANG POLVO REG MANZANA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201705992",},
-  "TANG POLVO REG MULTIFRUTA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735715",},
-  "TANG POLVO REG NAR/DURAZNO SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201745707",},
-  "TANG POLVO REG NARA/BANANA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735777",},
-  "TANG POLVO REG NARA/MANGO SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735371",},
-  "TANG POLVO REG NARANJA DULCE SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735340",},
-  "TANG POLVO REG NARANJA LIMA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201746018",},
-  "TANG POLVO REG NARANJA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201705961",},
-  "TANG POLVO REG UVA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201746117",},
-  "VERAO POLVO ANANA REG SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "VERAO", "ean": "7622201717506",},
-  "VERAO POLVO MANZANA REG SOB. 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "VERAO", "ean": "7622201717445",},
-  "VERAO POLVO NAR/DURAZNO REG SOB. 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "VERAO", "ean": "7622201717476",},
-  "VERAO POLVO NARANJA REG SOB. 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "VERAO", "ean": "7622201717414",},
-  "MONDELEZ CEREALITAS CACAO D.S. 170GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREALITAS", "ean": "7622202241505",},
-  "MONDELEZ CEREALITAS GRANOLA D.S. 170GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREALITAS", "ean": "7622202241567",},
-  "MDLZ TERRABUSI.DUQUESA GALL DUL. REL 115GR PAQ 3U 345GR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DUQUESA", "ean": "7622202218729",},
-  "MONDELEZ TERRABUSI DUQUESA DUL.RELLE. 115 GRPAQUETE": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DUQUESA", "ean": "7622300742645",},
-  "MONDELEZ TERRABUSI MELBA DUL.RELLE. 120 GRPAQUETE": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELBA", "ean": "7622300829728",},
-  "TERRABUSI MELBA ANGRY BIRDS DU.REL.PAQ.120GR C/UPACK X 3 U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELBA", "ean": "7794600004539",},
-  "MONDELEZ INTL.MILKA GALL. REL C/MOUS 124GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MILKA", "ean": "7622202210051",},
-  "MONDELEZ INTL.MILKA GALL. REL C/MOUS 124GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MILKA", "ean": "7622202210075",},
-  "MONDELEZ OREO D.R. 118GR 3U 354G PQ AGR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201735258",},
-  "MONDELEZ OREO D.R. 118GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201735296",},
-  "MONDELEZ OREO DUL.REL. 182.5GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201735821",},
-  "MONDELEZ OREO GALL MANI DUL.REL. PAQUETE 118GR 1UN": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202302862",},
-  "MONDELEZ OREO GOLDEN GAL DUL REL 354GR PAQ AGR X3 118G 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201806538",},
-  "MONDELEZ OREO MINI DUL.RELLE 50GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201761288",},
-  "MONDELEZ OREO MINI. GALLETAS DUL RELL 150 BOL 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202219337",},
-  "MONDELEZ OREO SIN GLUTEN GALL DR 95GR PAQUETE 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202038099",},
-  "MONDELEZ OREO VAINILLA GOLDEN 118GR PAQ.DU.RE 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201806552",},
-  "OREO BAADAS. CHOCOLATE BSA 119GR 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201740368",},
-  "OREO BANADAS CHC MILKA BCO BSA 119GR 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201745608",},
-  "MONDELEZ PEPITOS C/CHISPAS DS 119 GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PEPITOS", "ean": "7622201735906",},
-  "MONDELEZ PEPITOS MINI. DULCE SECA 50GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PEPITOS", "ean": "7622201740399",},
-  "MONDELEZ PEPITOS. DU. SEC 119GR 3UN 357G PAQ AGR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PEPITOS", "ean": "7622201735883",},
-  "MODELEZ TERRABUSI ANILLOS D. S. 170GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201808884",},
-  "MONDELEZ LINCOLN ANGRY.BIRD DUL SEC 153GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201745523",},
-  "MONDELEZ LINCOLN CHOCOLATE DUL.SECA 153 GR PAQUETE": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622300742676",},
-  "MONDELEZ LINCOLN CLASICA DUL. SEC 219GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201735319",},
-  "MONDELEZ LINCOLN CLASICAS DUL SEC 153GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201386719",},
-  "MONDELEZ LINCOLN COCO. DUL SEC 153GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622300742713",},
-  "MONDELEZ TERRABUSI ANILLOS CLASIC 300GR BOL.DU.SE.": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201504007",},
-  "MONDELEZ TERRABUSI BOCA DE DAMA D.S. 170GR BOL": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201808860",},
-  "MONDELEZ TERRABUSI C/CHIPS 144GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201385279",},
-  "MONDELEZ TERRABUSI MANON DULC. SECA 182GR PAQ. 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201385255",},
-  "MONDELEZ TERRABUSI MIEL GALLE DUL.SEC 120GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622202220579",},
-  "MONDELEZ TERRABUSI SCONS DUL SEC 160GR BOLSA": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201491611",},
-  "MONDELEZ TERRABUSI VAINILLA GALL DUL.SEC 120GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622202220555",},
-  "MONDELEZ TERRABUSI VARIED.MIX DU.SE. 590GR BOL": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201745585",},
-  "MONDELEZ.TERRABUSI VARIED.MIX DU.SE. 390GR BOL": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201745561",},
-  "TERRABUSI HABANITOS GALLETITA BAN.C/CHO. 60GRBOLSA": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622300335076",},
-  "TERRABUSI LINCOLN CLASICA. D.S. 3U 153GR PQ AGR 459G": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201745547",},
-  "TERRABUSI VARIEDAD CHC DUL.SEC 300GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201503987",},
-  "TERRABUSI VARIEDAD D. S. 170GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201745639",},
-  "TERRABUSI VARIEDAD DORADA DUL.SEC 300GR BOL 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201503963",},
-  "MONDELEZ CEREALITA CLASICA INT 212GR PAQ 3U 636G": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201745905",},
-  "MONDELEZ CEREALITA CLASICAS INTEG 212GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201736033",},
-  "MONDELEZ CEREALITAS SALV CER 208GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201745981",},
-  "MONDELEZ CEREALITAS SALVA. CER 208GR 3U 624GR PAQ AGR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201746032",},
-  "MONDELEZ CEREALITASTOST.DE ARROZ 160 GRPAQ.CEREAL": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201753061",},
-  "MONDELEZ CLUB SOCIAL ORIG. CR PQ. 24GR 6UN 1X 144G PQ AGR,": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CLUB SOCIAL", "ean": "7622202293733",},
-  "MONDELEZ CLUB.SOCIAL ORIGINAL 144 GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CLUB SOCIAL", "ean": "7622300990749",},
-  "MONDELEZ INTL CLUB SOCIAL JAMON 23.5 GR X6U PQ AGR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CLUB SOCIAL", "ean": "7622210691835",},
-  "TERRABUSI EXPRESS CLASC CR 103GR PAQ AGR 3U 309GR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "EXPRESS", "ean": "7622201388485",},
-  "TERRABUSI EXPRESS CLASICA CRACKER 103GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "EXPRESS", "ean": "7622201388461",},
-  "MILKA ALFAJOR TRIPLE 70 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "77903778",},
-  "MILKA MINI ALFAJORES MOUSSE SPL 19GR 6U BOLSA 114G": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622202220074",},
-  "MILKA MOUSSE LECHE 42 GRPAQ.X 6 U.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622300759490",},
-  "MILKA MOUSSE LECHE ALFAJOR 42 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622300759506",},
-  "MILKA MOUSSE TRIPLE ALFAJOR 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "77903785",},
-  "MILKA MOUSSE TRIPLE BLANCO ALF. 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622300457303",},
-  "MILKA TORTA OREO ALF.TRIPLE 61 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622300835620",},
-  "OREO ALFAJOR TRIPLE. 56GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "OREO", "ean": "77976307",},
-  "PEPITOS CON CHIPS Y MOUSSE TRIPLE PAQUETE 57 GR UN.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "PEPITOS", "ean": "77915481",},
-  "SHOT ALFAJOR MANI BAN CHC SIMPLE 44GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "SHOT", "ean": "7622202304705",},
-  "SHOT ALFAJOR MINI SIMPLE 19GR BOLSA 6UN 114G": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "SHOT", "ean": "7622202223372",},
-  "SHOT ALFAJOR TRIPLE 60 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "SHOT", "ean": "77956699",},
-  "TERRABUSI ALFAJOR 50 GRPAQ. X6 U.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "7622300742584",},
-  "TERRABUSI ALFAJOR CHOCOLATE 50 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "77939234",},
-  "TERRABUSI ALFAJOR S/GLUT SPL BAN CHC 55GR PAQ 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "7622202296291",},
-  "TERRABUSI X 3 DCE.DE LE.ALFAJOR 70 GRTRIPLE": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "77903792",},
-  "TERRABUSI X 3 TORTA ALFAJOR 70 GRTRIPLE": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "77903860",},
-  "TITA NEGRO ALFAJOR RELL.LIMON 36 GRARG": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TITA", "ean": "77908308",},
-  "MILKA BIS OBLEA RELL.CUB.CHOCO. 105.6GR X 16U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "MILKA", "ean": "7622210788207",},
-  "MILKA BIS OREO PAQ. 105.6 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "MILKA", "ean": "7622210719829",},
-  "MILKA CHOCO PAUSE.OREO OBLEA BAN.CHC 45GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "MILKA", "ean": "7622201492465",},
-  "MILKA CHOCO PAUSE OBLEA BAN.CHO.C/LEC.RELL.45 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "MILKA CHOCO PAUSE", "ean": "7622201492717",},
-  "RHODESIA MINI OBLEAS 60 GRBOLSA": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "RHODESIA", "ean": "7622300335090",},
-  "RHODESIA OBLEA 22 GRCAJA X 36": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "RHODESIA", "ean": "7622300423759",},
-  "RHODESIA OBLEA BAN.C/CHO. 22 GRBOLSA": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "RHODESIA", "ean": "77995681",},
-  "RHODESIA OBLEA BANADA 22 GRPAQ.X4 U.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "RHODESIA", "ean": "7622300742935",},
-  "RHODESIA OBLEA RELL. LIMON BAÑ. 22 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "RHODESIA", "ean": "7622201142223",},
-  "TITA GALLE.BAN. 18 GRPAQ. X 5 U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "TITA", "ean": "7622201803285",},
-  "TITA O BANADOS 19GR PAQ 1U REGULAR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "TITA", "ean": "77976291",},
-  "MILKA OREO BOMBON CHC 19GR 13U CAJA 1UN 247G": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "MILKA", "ean": "7622202399107",},
-  "MILKA HUEVO LECHE 22GR 1U S/SORP PAS": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "MILKA", "ean": "77981325",},
-  "CADBURY C/YOGHURT. NUEZ TAB. RELL.29GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818654",},
-  "CADBURY CHOCOLATE CON ALMENDRAS X82GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201807405",},
-  "CADBURY INTENSE 50% CACAO 25GR TAB.SOLIDA 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818609",},
-  "CADBURY INTENSE SOLIDAS 50% CACAO PAQ 162GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201800505",},
-  "CADBURY TRES SUENOS.TAB. SOLIDA 82GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818739",},
-  "CADBURY TRES.SUENOS. 25GR TAB.SOLIDA 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818579",},
-  "CADBURY YOGHURT FRUTILLA RELL 82 GRS PAQUETE 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818715",},
-  "CADBURY YOGURTH TABL RELL FRUTILLA PAQ 162GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818692",},
-  "MILKA . TAB CHC SOLIDA 20GRS PAQUETE 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210795625",},
-  "MILKA ALMENDRA TABLETA RELLENA 55 GR PAQ.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210745620",},
-  "MILKA ALMENDRAS TAB.SOLIDA 155 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300990152",},
-  "MILKA BLANCO C/D.D.LEC.TAB.RELLE. 67.5 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300844967",},
-  "MILKA C/LECHE TAB.SOLIDA 150 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300990114",},
-  "MILKA CASTANA TAB. SOLIDA 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210745293",},
-  "MILKA CASTANAS C/CARAMELOTAB.SOLIDA 155 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300990183",},
-  "MILKA CHOCO.C/LECHE TAB.SOLIDA 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210745224",},
-  "MILKA CHOCOLATE C/DULCE DE LECHE 67.5 GRTAB.RELLE.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300844943",},
-  "MILKA COOKIESTABLETA CHC SOLIDA 100GR PAQ 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201424848",},
-  "MILKA LEGER COMBINADO TAB AIREA. LECHE 110GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201812775",},
-  "MILKA LEGER COMBINADO TAB.AIREA. LECHE 50GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201818951",},
-  "MILKA LEGER LECHE CON ALMENDRAS TAB AIREA. LECHE 110GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201812805",},
-  "MILKA LEGER LECHE TAB AIREA. LECHE 110GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201812744",},
-  "MILKA LEGER TAB.AIREA. LECHE 50GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201818937",},
-  "MILKA LEGER TAB.AIREA. LECHE CON ALMENDRAS 50GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201818975",},
-  "MILKA LILA GO OREO PAQ. 37 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210828606",},
-  "MILKA NEGRO C/D.D.LEC.TAB.RELLE. 135 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300846565",},
-  "MILKA OREO C/GALLET. TAB.SOLIDA 100 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300631574",},
-  "MILKA OREO CH.BLANCO TAB.SOLIDA 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210745132",},
-  "MILKA OREO CHOCOLATE BLANCO 155 GRTAB.SOLIDA": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300990213",},
-  "MILKA OREO TAB. SOLIDA 20GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210795908",},
-  "MILKA OREO TABLETA RELLENA 300GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210277503",},
-  "MILKA STRAWB CHEESECAK TAB.RELL 300GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210678171",},
-  "MILKA SWING TAB.SOLIDA 300 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "9012200872739",},
-  "MILKA TAB CHC AIREADA C.LECHE 25GR 1UN PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202322150",},
-  "MILKA TAB CHC AIREADA COMBINADO 25GR 1UN PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202322181",},
-  "MILKA TABLETA CHC AVELLANAS TAB. SOL 95GR 1UN PAQUETE": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202257599",},
-  "MILKA TABLETA CHC RELLENA 29GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202322068",},
-  "MILKA TABLETA CHC RELLENA 29GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202322129",},
-  "MILKA TABLETA DE CHOCOLATE BLANCO 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210745583",},
-  "SHOT BLOQUE TAB.SOLIDA 35 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SHOT", "ean": "77914217",},
-  "SHOT C/LECHE Y MANI TAB.SOLIDA 170 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SHOT", "ean": "7622300424084",},
-  "SHOT C/MANI TAB.SOLIDA 90 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SHOT", "ean": "7791249451656",},
-  "SHOT CHOCOLAE C/MANI TAB.SOLIDA 35 GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SHOT", "ean": "77983992",},
-  "TOBLERONE TAB.SOLIDA 100 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TOBLERONE", "ean": "7614500010013",},
-  "BELDENT CHI. TABLETA ADU. S/AZ. 6 CHI. PQ. 10GR 1UN": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969101",},
-  "BELDENT FRESH SPARKS SANDIA 6CHI.TABL. ADU. PQ. 10GR 1UN": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77987686",},
-  "BELDENT FRUT.-LIMA RELL. CH.CONF. X28PZ. POTE 54GR 1UN": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622202012037",},
-  "BELDENT FRUTILLA S/AZ. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969118",},
-  "BELDENT INFINIT 7 BLUEBERRY CHIC. TABL. CJ. 13.3GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201448325",},
-  "BELDENT INFINIT CITRUS 7 CHIC. TABL. CJ. 13.3GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201448288",},
-  "BELDENT INFINIT CITRUS CHI. 14 TABL. DIET CJ. 26.6GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201457426",},
-  "BELDENT INFINIT MENTA 7U PQ. 13.3GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201421496",},
-  "BELDENT INFINIT MENTA DIET 14 TABL. CJ. 26.6GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201457334",},
-  "BELDENT INFINIT SPEARMINT 14 TABL. CJ. 26.6 GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201457396",},
-  "BELDENT INFINIT SPEARMINT 7 TABL. CJ. 13.3 GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201448226",},
-  "BELDENT INFINITE 14 CHI. TABL. BLUEBERRY MINT DIET CJ.26.6GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201457457",},
-  "BELDENT MANDARINA FRESH SPARKS ADU. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77981844",},
-  "BELDENT MENTA FUERTE S/AZ. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969088",},
-  "BELDENT MENTA S/AZ. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969071",},
-  "BELDENT MENTOL S/AZ. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969095",},
-  "BELDENT XTRA MENTA RELL. CH.CONF. X28PZ. LIGHT POTE 54GR 1UN": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622202012204",},
-  "BUBBALOO MENTA CHIC. GLOBO INF. ENVOL. 5GR 1UN": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "INFANTILES", "marca": "BUBBALOO", "ean": "77982346",},
-  "BUBBALOO TUTTI-FRUTTI CHIC. GLOBO INF. ENVOL. 5GR 1UN": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "INFANTILES", "marca": "BUBBALOO", "ean": "77982353",},
-  "9 DE ORO ANILLITOS DULCE.SEC.COCO BOL180G 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180143488",},
-  "9 DE ORO ANILLITOS DULCE.SECA VAIN BOL180G 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180143464",},
-  "9 DE ORO ANILLITOS DULCE.SECA.CHOC BOL180G 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180143471",},
-  "9 DE ORO PEPAS MEMBRILLO INTEG. PAQ.140GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180143266",},
-  "M. CANUELA 9 DE ORO PEPAS 500GR BOL DU.SE.1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180143273",},
-  "M.CANUELAS 9 DE ORO AVENA C/MIEL DU.SE. 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180130761",},
-  "M.CANUELAS 9 DE ORO OBLEAS.RELL FRUTILLA PAQ100GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792052175517",},
-  "M.CANUELAS 9 DE ORO PEPAS DU.SE. 350GR BOL.1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180143280",},
-  "M.CANUELAS 9 DE ORO PEPAS MEMBRILLO DUL.SECA BOLSA 200GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180133502",},
-  "M.CANUELAS BRIGITTE 9 DE ORO CHOC/LIM DU.RELL.BOL 160 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180132703",},
-  "M.CANUELAS BRIGITTE 9 DE ORO DUL. RELL.CHOC. BOL. 160 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180132710",},
-  "M.CANUELAS BRIGITTE 9 DE ORO DUL. RELL.LIMON BOL. 160 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180132680",},
-  "M.CANUELAS BRIGITTE 9 DE ORODULC. RELL.CHOC.BOL.120GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180137142",},
-  "M.CANUELAS9 DE ORO BIZ CARA SUCIA DULC SECA 200GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180143587",},
-  "M.CANUELAS9 DE ORO BIZC.AZUC.DULCE SECA 210 GRSPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792200000319",},
-  "M.CANUELAS9 DE ORO CUAD.AGRI.DULCE SECA 200 GRBOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792200000128",},
-  "M.CANUELAS9 DE ORO GRANOL. DUL SEC 200GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180140814",},
-  "M.CANUELAS9 DE ORO SCONCITOS DULCE SECAPAQ.200 GRARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792200000791",},
-  "BAUDUCCO FRESA OBLEA 140 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962032283",},
-  "BAUDUCCO GALL. DUL SEC COOK C/CHIPS 60GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962071152",},
-  "BAUDUCCO GALL. DUL SEC COOK C/CHIPS 60GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962071169",},
-  "BAUDUCCO GALLETITAS DS C/CHC 80GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962056500",},
-  "BAUDUCCO VAINILLA OBLEA 140 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962032306",},
-  "BAUDUCCO WAFER CHOCOLATE OBLEA 140 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962032290",},
-  "BAUDUCCO WAFER OBLEAS CHOCOLATE 78 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962058399",},
-  "BAUDUCCO WAFER OBLEAS FRUTILLA 78 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962058405",},
-  "BIMBO DULCE SECA VAINILLAS148 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BIMBO", "ean": "7793890258639",},
-  "BIMBO VAINILLAS DULCE SECA 74GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BIMBO", "ean": "7793890258684",},
-  "BIMBO VAINILLAS GALL. DUL.SECA 444GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BIMBO", "ean": "7793890258646",},
-  "BONAFIDE DONUTS BAN.C/CHO 78GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BONAFIDE", "ean": "7792360096818",},
-  "BONAFIDE DONUTS BAN.C/CHO 78GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BONAFIDE", "ean": "7792360096825",},
-  "BONAFIDE DONUTS GALL.BANA.CHO.BLANCO 78 GRFLOW PACK": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BONAFIDE", "ean": "7792222042434",},
-  "DONUTS GALLE.VAI.BAN.C/CHO.PAQ. 78 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BONAFIDE", "ean": "7792360071518",},
-  "BRIOSH VAINILLAS DULCE SECA 148GR. PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BRIOSH", "ean": "7793890257984",},
-  "BRIOSH VAINILLAS DULCE SECA 148GR. PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BRIOSH", "ean": "7793890258592",},
-  "CHOCMAN BIZCOCHUELO BAN CHC 68GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCMAN", "ean": "7792360096658",},
-  "CHOCMAN BIZCOCHUELO COCO BAN CHC 35GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCMAN", "ean": "7792360097075",},
-  "CHOCMAN BLACK BIZCOCHUELO BAN CHC 35GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCMAN", "ean": "7792360096597",},
-  "CHOCMAN MINITORTA RELLENA C/D.D.LECHE 35 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCMAN", "ean": "7792360096634",},
-  "COSTA DONUTS GALLE.BAN. 78 GRPAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCO DONUTS", "ean": "7792222042427",},
-  "COSTA DONUTS GALLE.BAN.C/CHO.BLA. 78 GRPAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCO DONUTS", "ean": "7792360071525",},
-  "DALE BLACK DUL.RELLE.115 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DALE", "ean": "7798113152206",},
-  "DILEXIS DALE MARIA DUL.SEC 132G.C/U X3U.PAQ.ARG 396": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DALE", "ean": "7798113152268",},
-  "PEPSICO DALE FRUTILLA DUL.RELLE. 81 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DALE", "ean": "7798113151261",},
-  "PEPSICO DALE VAINILLA DUL.RELLE. 81 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DALE", "ean": "7798113151278",},
-  "DIELO FANTOCHE ESPUMITA DULCE SECA 300 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DF ESPUM", "ean": "7791672000735",},
-  "DIELO FANTOCHE HOROSCOPO DULCE SECAPAQ.300 GRARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DF HOROSC", "ean": "7791672001008",},
-  "DIELO FANTOCHE MARMOLADA DULCE SECA 350 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DF MARM", "ean": "7791672000759",},
-  "DR. SCHÄR SCHAR GALL GLUT.F. DU.SE. C/CHIP 200GR BOL 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DR. SCHAR", "ean": "8008698005491",},
-  "SCHAR MARIA DULCE SECA 125 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DR. SCHAR", "ean": "8008698010402",},
-  "SCHAR P/CELIACOS DUL.RELLE.100 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DR. SCHAR", "ean": "8008698008157",},
-  "SCHAR WAFERS ALLA VANIGLIA OBLEAS RELL.CREMA VAIN 125GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DR. SCHAR", "ean": "8008698001905",},
-  "CACHAFAZ INTEGRAL AVE.MIEL DULC SEC 170 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128002145",},
-  "CACHAFAZ INTEGRAL AVE.PASA DE UVA D.S. 225 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128000677",},
-  "CACHAFAZ INTEGRAL AVEN.C/CHIP.CHOC.D.S. 225 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128000691",},
-  "CACHAFAZ INTEGRAL GRAN.C/AVENA/ALM/MANI 225 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128000707",},
-  "CACHAFAZ INTEGRAL HAR.INT.ALGARRO.D.S. 225 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128000684",},
-  "CACHAFAZ ORGANICAS AVENA&MIEL DUL.SECA PAQ.170GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128002138",},
-  "EL TRIGAL BRIDGE CHOCOLATE OBLEA 140 GR PAQUE.URU": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL TRIGAL", "ean": "7730116460131",},
-  "DONLEY FACHITAS MINI TAPITDULCE SECA400 GRS. PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7790369000089",},
-  "FACHITAS CORONITAS CEREAL AVENA/CHIPS DUL.SEC BOLSA 140GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7790369008023",},
-  "FACHITAS CORONITAS CEREAL C/AVENA&PASAS DUL.SEC BOLSA 140GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7790369008016",},
-  "FACHITAS GALLETAS C/CHISP DUL.SEC BOLSA 140GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7790369008153",},
-  "FACHITAS MINI CORO.FRUTOS DEL BOSQ. DULCE RELL 140GR BOL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7790369007903",},
-  "FACHITAS MINI CORONITAS CHOC.DUL.SECA 140 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7790369007811",},
-  "FACHITAS MINI CORONITAS CHOCO.BCO.DUL. SECA 140 GR PAQU.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7790369007835",},
-  "FACHITAS MINI CORONITAS FRUT.DUL.SECA 140 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7790369007828",},
-  "FACHITAS MINI CORONITAS VAIN.DUL.SECA 140 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7790369007842",},
-  "FACHITAS MINI TAPITAS DULCE SECA 200 GRS.BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7790369000249",},
-  "FACHITAS MINI TAPITAS DULCE SECA350 GR PAQUE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7791672000766",},
-  "GRANIX FRUTIGRAN AVE/SOJA C/CHIPS CHOC.D.SECA 255 PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045824893",},
-  "GRANIX FRUTIGRAN AVEN.C/FRUT.ROJOS DUL.SECA 250GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045825791",},
-  "GRANIX FRUTIGRAN C/SEM.SES-AM.Y GIRASD.SECA 260 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045825401",},
-  "GRANIX FRUTIGRAN C/SEMI.DE CHIA/LINO DU.SECA 240 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045825395",},
-  "GRANIX FRUTIGRAN SALV.AVENAPAS.DE UVA 250 GRS.DU.SE.PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045001188",},
-  "GRANIX FRUTIGRAN SALV.AVENAPAS.DE UVA 500 GRS.DU.SE.PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045001218",},
-  "GRANIX FRUTIGRAN SALVADO DULCE SECA 250 GRS.PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045001195",},
-  "GRANIX FRUTIGRAN SALVADO DULCE SECA 500 GRS.PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045001201",},
-  "GRANIX FRUTIGRAN TROPICAL DUL.SECA 250 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045823452",},
-  "HAVANNA LIMON DUL.RELL. 150GR CAJA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "HAVANNA", "ean": "7791875101468",},
-  "HAVANNA LIMON GALLETITA CUB.C/CHOC. 35GR X6U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "HAVANNA", "ean": "7791875101475",},
-  "M PROPIAS": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "M PROPIAS", "ean": "1",},
-  "LIA MACUCAS BLACK GALL DUL RELL 110GR PAQ SPL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MACUCAS", "ean": "7790040150461",},
-  "LIA MACUCAS CHOCOLATE DUL.RELLE.85 GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MACUCAS", "ean": "7790040146877",},
-  "LIA MACUCAS GALL DUL RELL 110GR PAQ SPL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MACUCAS", "ean": "7790040145337",},
-  "OKEBON MOLINO NATURAL 10 SEMILLAS 246 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MOLINO NATURAL", "ean": "7790263119351",},
-  "OKEBON MOLINO NATURAL 10SEMILLAS DUL.SECA PAQ. 231GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MOLINO NATURAL", "ean": "7790263119658",},
-  "OKEBON MOLINO NATURAL AVEN/CACAO 255 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MOLINO NATURAL", "ean": "7790263119313",},
-  "OKEBON MOLINO NATURAL AVEN/PASAS 232 GR PAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MOLINO NATURAL", "ean": "7790263119641",},
-  "OKEBON MOLINO NATURAL DUL.SEC AVEN/CACAO PAQ.240G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MOLINO NATURAL", "ean": "7790263119634",},
-  "OKEBON MOLINO NATURAL NARAN/CHIPS 253 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MOLINO NATURAL", "ean": "7790263119375",},
-  "OKEBON MOLINO NATURAL NJA&CHISPASP DULC.SECPAQ.238G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MOLINO NATURAL", "ean": "7790263119665",},
-  "DON SATUR BIZCOCHO DULCE DULCE SECA 200 GRBOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O DSATUR", "ean": "7795735000335",},
-  "DON SATUR PEPAS C/MEMBRILLO DULCE SECA 300 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O DSATUR", "ean": "7795735600924",},
-  "FANTOCHE FUN! C/CHISPAS DE CHOCOL. 150 GRBOL.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O FANTOCHE", "ean": "7791672000094",},
-  "FANTOCHE HOROSCOPO GALL DS 240GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O FANTOCHE", "ean": "7791672014404",},
-  "GRANIX GRANOLITAS GALL DUL SECA 150GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O GRANIX", "ean": "7790045827641",},
-  "GRANIX GRANOLITAS GALLE. DULCE SECA C/X 150GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O GRANIX", "ean": "7790045827610",},
-  "GRANIX GRANOLITAS.GALL DUL SEC C/PASAS 150GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O GRANIX", "ean": "7790045827580",},
-  "GRANIX GRANOVITA LIMON DULCE SECA 140 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O GRANIX", "ean": "7790045000846",},
-  "HOJALMAR L.LARGUITA DULCE SECA 150 GRS.BANDEJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000159",},
-  "HOJALMAR L.LARGUITA DULCE SECA250 GRS. BANDEJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000142",},
-  "HOJALMAR LARGUITA DULCE SECA 150GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000937",},
-  "HOJALMAR MATERO BIZCO. HOJAL.AZUCBOLSA 180 GR ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000593",},
-  "HOJALMAR PALMERAS DULCE SECA150 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000913",},
-  "HOJALMAR TRIANGULI. DULCE SECA 150 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000920",},
-  "HOJALMAR TRIANGULI. DULCE SECA 150 GRS.BANDEJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000128",},
-  "HOJALMAR TRIANGULIT DULCE SECA250 GRS. PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000111",},
-  "AGLU ANILLITOS DUL.SECA 140 GRS. CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798128410278",},
-  "AGLU GALLETA C/CHI.CHOC.DUL.SEC. 150GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798128417802",},
-  "AGLU GALLETAS BANADAS CHC 150GR CAJA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798128417819",},
-  "AGLU GALLETITASTAPITAS BAN.C/CHO. 180 GRCAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798128410292",},
-  "AGLU P/CELIACO SAB.LIMON DUL.SECA 150 GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798128410070",},
-  "AGLU SABOR VAINILLA DUL.SECA 500 GRS. BOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798128410117",},
-  "AGLU VAINILLA C/CHI.CHOC.DUL.SECA 180 GR CAJA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798128410285",},
-  "ALFA PAMPA GALL. RELL LIMON C/BANO 280GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798171732457",},
-  "ALFA PAMPA GALL. RELL MOUSSE CHOCOLATE 228 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798171732419",},
-  "ALFA PAMPA GALLET RELL MOUSE LIMON C/BANO 290GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798171732433",},
-  "ALFA PAMPA GALLETAS RELLEN MOUSSE LIMON 228 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798171732389",},
-  "ALFA PAMPA GALLETITA RELL LIMON C/BANO 290GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798171732402",},
-  "ALFA PAMPA GALLETITA RELL LIMON C/BANO 290GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798171732426",},
-  "ALFA PAMPA GALLETITA RELL. LIMON C/BANO 220GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798171732440",},
-  "ALFA PAMPA GALLETITAS RELL LIMON C/BANO 270GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798171732396",},
-  "ALMAR GALL PALMERITAS DS 130GR BANDEJA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798217939833",},
-  "ALMAR GALLETA PEPA DS 200GR BANDEJA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798217939796",},
-  "AMARETTI GALLE.COOKIES DUL.SECA BOLSA 150GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7790349850659",},
-  "ANIMAL KIND GALLETITAS DUL.SEC. VEGAN 170GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798184451352",},
-  "ANIMAL KIND GALLETITAS DULC.SEC. VEGAN 170GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798184451215",},
-  "ARBANIT GALLETA OB/WF 26GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "736372567604",},
-  "ARBANIT GALLETA OB/WF 26GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "754697494443",},
-  "ARBANIT OBLEA RELLENA AVELLANA PAQUETE 28 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "754697494481",},
-  "ARBANIT OBLEA RELLENA DULCE DE LECHE 28GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "754697494498",},
-  "ARBANIT OBLEA RELLENA FRUTILLA 28GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "763331452213",},
-  "ARBANIT OBLEA RELLENA MARACUYA 28GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "763331452206",},
-  "ARROZEN PEPAS C/MEMBR. S/GLUTEN DUL.SECA 200 GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798082001000",},
-  "BAY BISCUIT BIZCO.SAB.ORIG.D.SEC. 100GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798004241255",},
-  "BAY BISCUIT BIZCO.SAB.ORIG.D.SEC. 140 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798004241248",},
-  "BAY BISCUIT BIZCOCHO DULCE DUL. SEC. 172GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798004241231",},
-  "BAY BISCUIT C.CHIPS CHOCOLATE DUL SECA 144GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798004241262",},
-  "BEEPURE GALLETAS C/AV DUL SEC 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798165594382",},
-  "BEEPURE GALLETAS C/AV DUL SEC 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798165594399",},
-  "BILLIKEN OBLEA DUL.RELL.TURRO-MANI PAQ.25GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798186032924",},
-  "BRIA GALLET AVENA DULCE SEC C/CHISP CHC 100GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "701575359165",},
-  "BRIA GALLET AVENA DULCE SEC C/CHISP CHC 100GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "701575359172",},
-  "BRIA GALLET AVENA DULCE SEC C/CHISP CHC 100GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "701575359189",},
-  "BRIA GALLET DE QUINOA BANADA CHC 100GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "764451098909",},
-  "BRIA GALLET FTOS SEC/ALM/COCO DULCE SEC C/CHC 100GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "764451098923",},
-  "BRIA GALLET QUINOA DULCE SEC C/CHC 100GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "724373596235",},
-  "CACHAMAI GALLETAS DS 165GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7792280006287",},
-  "CACHAMAI GALLETAS DS C/INCLUS 165GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7792280006270",},
-  "DANCAKE BUT.COOKIES DUL.SECA 454 GR. LATA IMP": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "5601069113011",},
-  "DEUBEL PALMERITA DE MANTEC.DUL.SECA 200 GRS. BANDEJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791696008014",},
-  "DORYS BISCOTTI C VAINILLA DUL SEC 100GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7792184003382",},
-  "ELGORRIAGA GALLETA DR 180GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8410255009055",},
-  "ELGORRIAGA GALLETA DR 180GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8410255009253",},
-  "ELGORRIAGA GALLETA DR 180GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8410255009376",},
-  "ELGORRIAGA GALLETA DR 180GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8410255914403",},
-  "ELGORRIAGA GALLETA DR 180GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8410255914410",},
-  "ELGORRIAGA GALLETA DR 180GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8410255914458",},
-  "ELGORRIAGA GALLETA DR 180GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8410255919422",},
-  "ELGORRIAGA GALLETA DR 180GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8410255919835",},
-  "ELGORRIAGA GALLETA DR 180GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8410255919873",},
-  "FANTOCHE MINI CORONITAS FRAMBUESA 140 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7790369000997",},
-  "FEMAR FROLIS DUL.SECA 300 GRS. BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791787100030",},
-  "FIRENZE MINIPAMELA LIMON DULCE SECA 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568000696",},
-  "FIRENZE MINIPAMELA SCONES DULCE SECA 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568000849",},
-  "FIRENZE PAMELA CHOCOLATE DUL.RELLE. 97 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568000962",},
-  "FIRENZE PAMELA CHOCOLATE DUL.RELLE. 97 GRPACK X 3 U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568001044",},
-  "FIRENZE PAMELA COCO DULCE SECA 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568000689",},
-  "FIRENZE PAMELA LIMON DULCE SECA 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568000719",},
-  "FIRENZE PAMELA VAINILLA DUL.RELLE. 97 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568000955",},
-  "FIRENZE PAMELA VAINILLA DUL.RELLE. 97 GRPACK X 3 U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568001037",},
-  "GAONA SINFONIA OBL.LIMON DUL.RELLE. 100 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126072287",},
-  "GAONA SINFONIA OBLEAS 50 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126072249",},
-  "GAONA SINFONIA OBLEAS 50 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126072331",},
-  "GAONA SINFONIA OBLEAS CALSSSIC 50GR X4IU PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126072805",},
-  "GAONA SINFONIA OBLEAS CHOCOLATE 50 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126072317",},
-  "GAONA SINFONIA OBLEAS FRUTILLA 100 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126072348",},
-  "GAONA SINFONIA OBLEAS FRUTILLA 50 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126072355",},
-  "GAONA SINFONIA OBLEAS LIMON 50 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126072294",},
-  "GAONA SINFONIA.OBLEAS FRUTILLA 50GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126073109",},
-  "GAONA STAR CHOCOLATE OBLEAS 100 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126071273",},
-  "GAONA STAR FRUTILLA OBLEAS 100 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126070948",},
-  "GAONA STAR OBLEAS LIMON 100 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126071747",},
-  "GAONA STAR SAB. CLASICO NARANJA OBLEAS 100 GR FLOW PACK": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126070931",},
-  "GOLD MUNDOANILLOS COCO DULCE SECA250 GR BOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791376000987",},
-  "GOLD MUNDOANILLOS LIMON DULCE SECA 250 GRBOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791376000994",},
-  "GRISBI GALLETA DS CAJA 135GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8000350007911",},
-  "GRISBI GALLETA DS CAJA 135GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8000350007928",},
-  "GRISBI GALLETA DS CAJA 135GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8000350007935",},
-  "GRISBI GALLETA DS CAJA 135GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8000350007959",},
-  "GRISBI GALLETA DS CAJA 135GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8000350008130",},
-  "GRISBI GALLETA DS CAJA 150GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8000350005771",},
-  "GRISBI GALLETA DS CAJA 150GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8000350005788",},
-  "GULLON BARQUILLOS CHOCOLATE DUL.SECA 70 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8410376037685",},
-  "GULLON BARQUILLOS VAINILLA DULCE SECA 70 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8410376017687",},
-  "GULLON DIBUS SHARKIES CACAO S/GLUTEN 250 GRCAJA DU.SE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8410376044959",},
-  "GULLON DIET NATU.S/AZUC.DU.SECA CHISPAS CHOC.125 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8410376009415",},
-  "GULLON GLUTEN FREE CHIPS DE CHOCO. 130 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8410376037883",},
-  "GULLON S/GLUTEN CACAO/CHI DUL.SECA 200 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8410376017342",},
-  "GULLON S/GLUTEN PASTAS DUL.SECA 200 GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8410376017359",},
-  "H.J. BISCUITS DULCE SECA130 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7792184003146",},
-  "HAPPY FOOD GALLET. C/PERA DUL SEC 120GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798308250335",},
-  "HAPPY FOOD GALLET. DUL SEC NARANJA 44GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798308250205",},
-  "HAPPY FOOD GALLET. DUL SEC PERA 44 GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798308250212",},
-  "HAPPY FOOD GALLET. DULC SEC COCO 44 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798308250199",},
-  "HAPPY FOOD GALLET. DULC SEC LIMON 120GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798308250427",},
-  "INTEGRA GALLETA DS C/CHISP 200GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798343751507",},
-  "INTEGRA GALLETA DS C/CHISP 200GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798343751514",},
-  "INTEGRA GALLETA DS C/CHISP 200GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798343751521",},
-  "JACOBSEN DANESAS DULCE SECA 150 GRLATA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "5776879012653",},
-  "JACOBSEN GALLETAS DS 150GR LATA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "5776879009653",},
-  "JACOBSEN THE MARKET PLACE DULCE SECA 150 GRLATA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "5776879011861",},
-  "JASMINE GALLETAS DS 75GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7896283006456",},
-  "JASMINE GALLETAS DS 75GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7896283006524",},
-  "JASMINE GALLETAS DS C/INC S/GLU 120GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7896283002069",},
-  "JULES DESTROOPER BUTTER DS C/CHC 100GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "5410471917199",},
-  "JULES DESTROOPER BUTTER DS. C/CARAM 100GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "5410471918202",},
-  "JULES DESTROOPERALMENDRAS DUL.SECA 100 GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "5410471110217",},
-  "JULES DESTROOPERBU.CRUMBLEDULCE SECA100 GR CAJA IMP": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "5410471111238",},
-  "JULES DESTROOPERBUT.CRISPSDULCE SECA100 GR CAJA IMP": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "5410471110774",},
-  "JULES DESTROOPERCANE/CHOC GALLE.BANADA 100 GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "5410471112068",},
-  "JULES DESTROOPERTHINS GALL.BANA. 100 GRCAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "5410471130901",},
-  "KAPAC C/CHIPS DE CHOCOL. S/TACCS/GLUT.DUL.SECA 200 GRCAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794906020011",},
-  "KAPAC GALLET DUL.SEC 150GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794906040293",},
-  "KAPAC GALLET DUL.SEC 150GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794906040309",},
-  "KAPAC GALLET DUL.SEC 150GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794906040316",},
-  "KAPAC PEPAS DUL.SECA 200 GRS. BOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794906020080",},
-  "KAPAC SAB/CHOCO. DUL.SECA 200 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794906020042",},
-  "KAPAC SABOR VAINILLA DUL.SECA 200 GRS. PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794906020059",},
-  "KUKINAS C/CHIPS DS 133GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810058",},
-  "KUKINAS C/CHIPS DS 180GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810096",},
-  "KUKINAS DUL SEC CHIPS CHOC 80GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810133",},
-  "KUKINAS DUL SEC CHIPS CHOC 80GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810188",},
-  "KUKINAS DULCE SECA VAINILLA 180GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810034",},
-  "KUKINAS DULCE SECA VAINILLA 180GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810072",},
-  "KUKINAS GALLETAS ANILLO CHC DUL.SEC. 180GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810171",},
-  "LA ESPANOLA MIEL DULCE SECA500 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793412000166",},
-  "LA PROVIDENCIA GALLETAS C/CHIPS DUL.SE. 220GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798141972807",},
-  "LAGO GROUP LAGO GALL OB/WF OBLEAS 250GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8004800002372",},
-  "LAGO GROUP LAGO GALL OB/WF OBLEAS 250GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8004800002426",},
-  "LAGO GROUP LAGO GALL OB/WF OBLEAS 250GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8004800002433",},
-  "LAGO GROUP LAGO GALL OB/WF OBLEAS 250GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8004800002600",},
-  "LAGO GROUP LAGO OB/WF OBLEAS MINI 125GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8004800003409",},
-  "LAGO GROUP LAGO OB/WF OBLEAS MINI 125GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8004800003416",},
-  "LAGO GROUP LAGO OB/WF OBLEAS MINI 125GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8004800003430",},
-  "LAGO GROUP LAGO OB/WF OBLEAS MINI 125GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8004800003607",},
-  "LAGO GROUP LAGO OB/WF OBLEAS MINI 125GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8004800003614",},
-  "LEIVA DULCE DE LECHE DUL.SECA 260 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7790412000011",},
-  "MERBA COOKIES C/CHISP DS 200GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8710502007866",},
-  "MERBA COOKIES C/CHISP DS 200GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8710502100864",},
-  "MERBA COOKIES C/CHISP DS 200GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8710502154027",},
-  "MERBA COOKIES C/CHISP DS 200GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8710502470035",},
-  "MERBA COOKIES C/CHISP DS 200GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8710502718274",},
-  "MERBA COOKIES C/CHISP DS 210GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8710502060021",},
-  "MERBA GALL DS C/INC 225GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8710502196614",},
-  "MERBA GALLET BAN CHC 180GR POUCH 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8710502279003",},
-  "NAMUR TURRON DE MANI 25GRS 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7790380003809",},
-  "NATUZEN RUEDITAS CHOCOLATE DULCE SECA 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798082000539",},
-  "NATUZEN TAPITAS DUL.SECA 200 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798082001086",},
-  "NINA GALL. S/AZU. LEMON CAJA 120GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "723540525955",},
-  "NINA S/TACC GALL. VAINILLA CAJA 120GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "723540526235",},
-  "NINA SIN TACC DUL. SECA LIM/JENG CAJA 120 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "655257741376",},
-  "NINA SIN TACC DUL. SECA VAINILLA CAJA 120 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "655257736631",},
-  "PAMELA GALLETAS DUL SEC CHOCOLATE 220GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568006162",},
-  "PAR-NOR GALL CHIPPIS CHOC DUL.SEC. 120GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791324157664",},
-  "PAR-NOR MINI BARRITA FRUT BOSQ DUL.REL.160GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791324157657",},
-  "PAR-NOR MINI MANTECADAS DULCE SECA BOL. 170 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791324156919",},
-  "PAR-NOR MOROCHITASDULCE SECABOLSA 200 GRS.1324156827": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791324156827",},
-  "PAR-NOR SUAVECITAS DULCE SECA140 GR BOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791324156926",},
-  "POZO GALL VAINILLAS DUL. SEC. 80GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7790077000326",},
-  "POZO GALL VAINILLAS DULCE SECA 148GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7790077000067",},
-  "R.RENDO GOLD MUNDOC/CHIPS DULCE SECA200 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791376000864",},
-  "R.RENDO GOLD MUNDOPEPAS DULCE SECA 250 GRS.PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791376000208",},
-  "R.RENDO GOLD MUNDOPEPITAS DULCE SECA500 GRS. PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791376000185",},
-  "R.RENDO GOLD MUNDOPOLVORON DULCE SECA200 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791376000901",},
-  "RIANITOS GALL BAN CHC 90GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798157740209",},
-  "RIANITOS GALL BAN CHC 90GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798157740216",},
-  "RIANITOS HOJALDRE AZUCARADAS DUL.SECA 170 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798157740131",},
-  "RONDA HOJALDRADA DULCE SECA150 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793450000524",},
-  "SANTA MARIA MARMOLADAS S/GLUTEN DUL.SECA 200 GR PAQU": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079230628",},
-  "SANTA MARIA OBLEA COCO RELL 90GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079234398",},
-  "SANTA MARIA OBLEA RELL CHOC PAQ 90 GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079234374",},
-  "SANTA MARIA OBLEA RELL LIMON PAQUETE 90 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079230833",},
-  "SANTA MARIA OBLEAS RELL FRUT. PAQUETE 90 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079234367",},
-  "SANTA MARIA OBLEAS VAIN RELL PAQUETE 90 GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079234381",},
-  "SANTA MARIA VAINILLA DUL.SECA 200 GR CAJA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079230062",},
-  "SIMPLY KETO GALL COOKIE C/CHIP DS 100GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "798190246574",},
-  "SIMPLY KETO GALL COOKIE C/CHIP DS 100GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "798190246598",},
-  "SIMPLY KETO GALL PEPAS DS 100GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "798190246604",},
-  "SORIANO BISCUITS GALL. BAÑ.CHOCO 20GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "77962898",},
-  "SORIANO CHOCO BISCUITS GALL. BAÑ.CHOCO. DP 160GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7792184003313",},
-  "TOSTEX C/AVENA Y MIEL DUL. SECA 270GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811092",},
-  "TOSTEX C/AVENA Y PASAS DUL. SECA 270GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811078",},
-  "TOSTEX CHIPS C/CHISP DULCE SECA 270GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811009",},
-  "TOSTEX CHIPS C/CHISP DULCE SECA 270GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811023",},
-  "TOSTEX CHIPS C/CHISP/AVENA DULCE SECA 270GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811061",},
-  "TOSTEX CHIPS&MANI GALL. DUL.SECA 300GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125810781",},
-  "TOSTEX GALL C/AVENA Y ARANDANOS DUL. SECA 270GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811085",},
-  "TOSTI TOSTADAS DUL.SECA 200GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794529041639",},
-  "VENEZIANA TOS.LIGHT DULCES DUL.SECA 200 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791708617432",},
-  "VICENZI CANTUCCINI DUL.SECA 225 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8000350003821",},
-  "VICENZI GALLETA DS 100GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8000350008215",},
-  "VICENZI GALLETAS DS . VAINILLAS 400GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8000350000462",},
-  "VICENZI GALLETAS DS .175GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8000350006105",},
-  "VICENZI GALLETAS DS 100GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8000350002114",},
-  "VICENZI GALLETAS SURTIDAS DS 250GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8000350008376",},
-  "VICENZI GALLETAS VAINILLAS DS 125GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8000350005795",},
-  "VICENZI LENGUA DE GATO DUL.SECA 100 GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8000350001308",},
-  "VICENZI VAINILLAS DULCE SECA200 GR CAJA IMP": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8000350000585",},
-  "WONDERFUL COPENHAGEN BUTTER COOKIE.D.S.LAT 454GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "5776879000650",},
-  "ZAFRAN CHIAPAZ CEREAL DULCE SECA 150 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798187760147",},
-  "ZAFRAN LINOCCO CEREAL DULCE SECA 150 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798187760130",},
-  "ZAFRAN TAKKU CEREAL DULCE SECA 150 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798187760154",},
-  "ZAFRAN TANLATAM CEREAL DULCE SECA 150 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798187760161",},
-  "ZAFRANITO GALL DUL.SEC ORG INTEG. SAB.CHOCO BOLSA 150G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798187760390",},
-  "OKEBON MOLINO NATURAL AVENA&GRANOLA DUL.SECA 236 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O OKEBON", "ean": "7790263119627",},
-  "SORIANO BISCUIT DULCE SECA 125 GRS.PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O SORIANO", "ean": "7792184003085",},
-  "SORIANO BISCUIT DULCE SECA 250 GRS.BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O SORIANO", "ean": "7792184002026",},
-  "SORIANO BISCUIT DULCE SECA 500 GRS.CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O SORIANO", "ean": "7792184001029",},
-  "SORIANO BISCUITS C/CHIPS CHOCOLATE 100 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O SORIANO", "ean": "7792184000084",},
-  "SORIANO BISCUITS C/CHIPS DE CHOC. DUL.SECA 200GR PAQUE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O SORIANO", "ean": "7792184003283",},
-  "SORIANO MINI TAPITAS VAINIL.DUL.SECA 200 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O SORIANO", "ean": "7792184000022",},
-  "SORIANO PALMERITAS DULCE SECA BOLSA 200 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O SORIANO", "ean": "7792184003337",},
-  "SORIANO PEPITAS DULCE SECA400 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O SORIANO", "ean": "7792184003184",},
-  "TIA MARUCA MANTEQUITAS DULCE SECA 200 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O TMARUCA", "ean": "7798082743603",},
-  "TIA MARUCA PEPAS DUL.SECA BOLSA 250 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O TMARUCA", "ean": "7798082745140",},
-  "TRIO FROLITAS DULCE SECA 300 GRS.BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O TRIO", "ean": "7791787000644",},
-  "OKEBON FORTI PLUS LECHE CLASICA 290 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OKEBON LECHE", "ean": "7790263110846",},
-  "OKEBON FORTI PLUS LECHE Y DCE.LECHE 165 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OKEBON LECHE", "ean": "7790263110839",},
-  "OKEBON FORTI PLUS LECHE Y DCE.LECHE 290 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OKEBON LECHE", "ean": "7790263110921",},
-  "OKEBON LECHE D.DE LECHEDULCE SECA PAQ 273GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OKEBON LECHE", "ean": "7790263119610",},
-  "OKEBON LECHE D.DE LECHEDULCESECA PAQ.290G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OKEBON LECHE", "ean": "7790263119597",},
-  "OKEBONLECHE CHOCOLATADA DULC SEC 273 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OKEBON LECHE", "ean": "7790263119603",},
-  "PAR-NOR MINI BARRITA MEMBRILLO DUL.RELLE.160 GRS. BOL ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324157619",},
-  "PAR-NOR MINI PITU.CHOC.RELL.C/CRE.SAB.LECHE 160GBOLSA.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324157046",},
-  "PAR-NOR MINI PITU.VAIN.RELL.C/CRE.SAB.LECHE 160GBOLSA.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324157022",},
-  "PAR-NOR MINI PITUSAS BLACK DUL.REL 130GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324157633",},
-  "PAR-NOR MINI PITUSAS DUL.RELLE. 140 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324157527",},
-  "PAR-NOR MINI PITUSAS FRUTIL.DUL.RELLE.160 GRS. BOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324157466",},
-  "PAR-NOR PITUSAS MERENGUE DUL. RELL. 120 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324157534",},
-  "LIA POLVORITA CHC/VAIN DUL.RELLE.152GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040146143",},
-  "LIA POLVORITA CHOC DUL.RELLE.81GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040139183",},
-  "LIA POLVORITA FRUT DUL.RELLE.81GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040139176",},
-  "LIA POLVORITA VAIN DUL.RELLE.81GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040139169",},
-  "PLASENCIA POZO VAINILLA DULCE SECA480 GR PAQ. ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POZO", "ean": "7790077000135",},
-  "RIERA TOSTADAS DULCES DULCE SECA 200GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "RIERA", "ean": "7790071090125",},
-  "SMAMS GALL.DUL.SECA VAINILLA COLEGIAL 150 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510847",},
-  "SMAMS GALLET CHIP/CHOC. DUL SEC . PAQ. 150GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511004",},
-  "SMAMS GALLET S/TACC CHOC DU.SE. 200GR PAQ. 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511011",},
-  "SMAMS PEPAS MEBRILLO 150GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510786",},
-  "SMAMS POLVORON COCO DULCE SECA 120GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511196",},
-  "SMAMS POLVORON LIMON DULCE SECA 120 GR BOL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511202",},
-  "SMAMS POLVORON VAIN DULCE SECA 120 GR BOL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511219",},
-  "SMAMS S/GLUTEN BISCUITS DULCE SECA 120 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510120",},
-  "SMAMS S/GLUTEN BIZ.AGRIDUL.AZUCARA. 150 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510182",},
-  "SMAMS S/GLUTEN BIZCOCHO AGRIDULCE 200 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510069",},
-  "SMAMS S/GLUTEN CHOCOLATE DUL.RELLE. 110 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510014",},
-  "SMAMS S/GLUTEN FRUTILLA DUL.RELLE. 105 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510267",},
-  "SMAMS S/GLUTEN VAINILLA DUL.RELLE. 110 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510021",},
-  "SMAMS VEGGIE PEPAS MEBRILLO 150GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511226",},
-  "PEPSICO TODDY C/CHISP.CHOCO.DUL.SECA PAQ.126G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TODDY", "ean": "7790310982846",},
-  "PEPSICO TODDY C/CHISP.CHOCO.DUL.SECA PAQ.126G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TODDY", "ean": "7790380023432",},
-  "PEPSICO TODDY CLAS. DUL. SECA PAQ. 126 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TODDY", "ean": "7790310982488",},
-  "TODDY GALL MINI DUL SEC 50GR PAQ. 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TODDY", "ean": "7790380023487",},
-  "TRIO PEPAS ALEMANAS C/MEMBRIL.GLACIADA 300 GRBOL.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TRIO PEPAS", "ean": "7791787100719",},
-  "TRIO PEPAS DUL.SECA 320 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TRIO PEPAS", "ean": "7791787100924",},
-  "TRIO PEPAS DULCE SECA 500 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TRIO PEPAS", "ean": "7791787000040",},
-  "VALENTE VAINILLAS DUL. SEC. 148GR. PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "VALENTE VAIN", "ean": "7793890258691",},
-  "BAGLEY VOCACION CLASICA.DUL.SECA 141 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "VOCACION", "ean": "7790040146389",},
-  "LIA VOCACION GALL DULCE SEC 384GR 3U PAQ AGR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "VOCACION", "ean": "7790040143623",},
-  "M.CANUELAS9 DE ORO BIZC.CLAS.CRACKERS 200 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "9 DE ORO", "ean": "7792200000159",},
-  "M.CANUELAS9 DE ORO BIZC.LIGHTCRACKERS 170 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "9 DE ORO", "ean": "7792200000777",},
-  "BAUDUCCO TOSTADAS INTEGRAL CRACKERS PAQ142 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "BAUDUCCO", "ean": "7891962060460",},
-  "BAUDUCCO TOSTADAS MULTIGRANOS CRACKERS PAQ142 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "BAUDUCCO", "ean": "7891962060477",},
-  "BAUDUCCO TOSTADAS ORIGINAL CRACKERS PAQ 142GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "BAUDUCCO", "ean": "7891962060453",},
-  "DON SATUR BIZCOCHOS SALADOS CRACKERS PAQ.200 GR5735000328": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "D SATUR BIZ", "ean": "7795735000328",},
-  "DON SATUR BIZCOCHOS C/QUESO BOLSA 140 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "DON SATUR", "ean": "7795735000519",},
-  "DR SCHAR CRACKERS 210 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "DR. SCHAR", "ean": "8008698003503",},
-  "SCHAR P/CELIACOSSALADAS CRACKERS 175 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "DR. SCHAR", "ean": "8008698002049",},
-  "SCHAR SALINIS SNACKS 60 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "DR. SCHAR", "ean": "8008698002070",},
-  "SCHAR TOSTADAS CEREAL S/GLU.PAQUETE 87GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "DR. SCHAR", "ean": "8008698028582",},
-  "GRANIX GRAN AGUA SANDWICH CRACKERS 200 GRS.PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANAGUA", "ean": "7790045001133",},
-  "GRANIX GRAN AGUA SANDWICH CRACKERS PAQ.200 X30045001379": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANAGUA", "ean": "7790045001379",},
-  "GRANIX GALL CRACKERS SIN SAL 200GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANIX", "ean": "7790045827733",},
-  "GRANIX GALLETAS CR 600GR 1UN PAQUETE AGR X3": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANIX", "ean": "7790045827740",},
-  "GRANIX SALVADO CEREAL 240 GRS. PAQUE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANIX", "ean": "7790045826200",},
-  "GRANIX SALVADO S/SAL 3EN1 3U 720 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANIX", "ean": "7790045826231",},
-  "LA PROVIDENCIA CRACKERS CR PAQUETE 101 GRPACK X 3 U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "LA PROVIDENCIA", "ean": "7798141972371",},
-  "M PROPIAS": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "M PROPIAS", "ean": "1",},
-  "ARCOR MEDIA TARDE SANDWICH CRACKERS 107 GR PAQ.X 5U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "MEDIA TARDE", "ean": "7790040143012",},
-  "BAGLEY MEDIA TARDE SANDWICH CRACKER 107GR PAQ AGR 3U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "MEDIA TARDE", "ean": "7790040143005",},
-  "LIA MEDIA TARDE CLASICA. CR 105GR X3U PAQ 315 GR AGR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "MEDIA TARDE", "ean": "7790040133693",},
-  "LIA MEDIA TARDE CRACKERS 105 GR PAQUE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "MEDIA TARDE", "ean": "7790040143593",},
-  "LIA MEDIA TARDE CRACKERS 110GR X 3UPAQ.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "MEDIA TARDE", "ean": "7790270336307",},
-  "LIA MEDIA TARDE GALL CR 315GR PAQUE AGR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "MEDIA TARDE", "ean": "7790040143586",},
-  "DON SATUR TALITAS CRACKERS 140 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O DSATUR", "ean": "7795735000106",},
-  "GRANIX SIN SAL CRACKERS 140 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O GRANIX", "ean": "7790045000907",},
-  "GRANIX SIN SAL CRACKERS 185 GRS.PAQ.X 3 U.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O GRANIX", "ean": "7790045001317",},
-  "AGLU P/CELIACO SALADAS SNACK 150 GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798128410094",},
-  "AGLU SAB.QUESO SNACKS 150 GR CAJA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798128410063",},
-  "ALMADRE GALLET CR SAL 200GR CAJA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798371600068",},
-  "ALMADRE GALLET HORN CR 200GR CAJA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798371600051",},
-  "ANIMAL KIND BIZCOCHO MATERO VEG CR 170 GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798184451383",},
-  "BINFINIT TOSTADAS C/SEM S/GLUT CR 65GR 1UN PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798221642064",},
-  "BINFINIT TOSTADAS CLASICAS LIBRE DE GLUTEN CR 65GR 1U PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798221642057",},
-  "BREVISS TOSTADAS CLASSICA CRACKERS 200GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529041530",},
-  "BREVISS TOSTADAS LIGHT CRACKERS 200 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529041622",},
-  "BREVISS TOSTADITAS LIGHT C/FITOESTER 110GR PAQ. 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529042230",},
-  "CROWIE SNACKS ARROZ JAMON BOLSA 50 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798228640407",},
-  "CROWIE SNACKS DE ARROZ PIZZA BOLSA 50 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798228640414",},
-  "CROWIE SNACKS DE ARROZ QUESO BOLSA 50GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798228640421",},
-  "DILEXIS ARGENTITAS AGUA CRACKERS 102 GRPACK X 3 U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798113151308",},
-  "DON PANCHO MARINERAS C/SEMILLAS 220 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798033900215",},
-  "DON PANCHO MARINERAS CRACKERS 220 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798033900161",},
-  "DON PANCHO MARINERAS DE SALVAD CRACKERS 220 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798033900178",},
-  "DON PANCHO MARINERAS LIGHT CRACKERS 220 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798033900208",},
-  "DON PANCHO MARINERAS S/SAL CRACKERS 220GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798033900154",},
-  "FIRENZE TOSTADAS C/GLUTEN C/FIBRAS 180 GRCRACK.PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791568000528",},
-  "FIRENZE TOSTADAS C/GLUTEN CRACKERS 180 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791568000511",},
-  "FIRENZE TOSTADAS DULCE CRACKERS 180 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791568000504",},
-  "FRESH MARINERAS LINO Y CHIA BOLSA 200GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157742111",},
-  "GALLO BIZCOCHOS ARROZ SAL CRACKERS 100GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790070418463",},
-  "GALLO BIZCOCHOS SALADOS CRACKERS 50GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790070418456",},
-  "GRANDIET MULTICERE.DULCE CEREAL 100 GRS. PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7797330102384",},
-  "GRANDIET MULTICEREAL SIN SAL CEREAL 100 GRS. PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7797330102377",},
-  "GULLON FIB.INTEG.S/AZUCAR CRACKERS 170 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "8410376009392",},
-  "GULLON S/GLUTEN CRACKERS CAJA 200 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "8410376045017",},
-  "HAPPY FOOD CHALITAS JAMON 100GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798308250397",},
-  "JORGITO BIZCOCHITOC/GRASA CRACKERS 400 GR BOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790957000651",},
-  "JORGITO BIZCOCHO C/GRASA CRACKERS 200 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790957000668",},
-  "KAPAC GALL SNACKS PIZZA S/GLUT 80GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794906040217",},
-  "KAPAC GALLETAS CR C/SEM S/GLUT 120GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794906040415",},
-  "KAPAC GALLETAS CR S/GLUT 120GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794906040408",},
-  "KAPAC SNACKS JAMON S/GLUT 80GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794906040200",},
-  "LEIVA GALL.MARINERA LIGHT C/SEM 450GR X3 PAQ AGR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790412002077",},
-  "LEIVA GALLETITAS CR C/ SALVADO 345GR PAQ AGR X3": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790412001971",},
-  "LEIVA MARINERA LIGH.S/SALC/SEMILLAS 330 GRPAQ.CRACK.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790412000226",},
-  "LEIVA SALVADO CEREAL PAQ.X 3 U. 345 GRARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790412000967",},
-  "LEIVA SANDWICH CRACKERS 110 GRPAQ.X3 ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790412000981",},
-  "LULEMUU TOST.ARROZ MUL-SEMIL.CRACKERS 120 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798146300803",},
-  "LULEMUU TOSTADAS ARROZ CRACKERS 120 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798146300308",},
-  "M CANUELAS PASEO GALLETAS SN QUESO 250GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7792180145444",},
-  "MARETTI BRUSCHETTAS TOMATE/OLIVA/OREGANO BOLSA 70 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "3800205875109",},
-  "MARETTI BRUSCHETTAS VEGETAL MEDITERRANEAN 70 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "3800205875307",},
-  "MARETTI BRUSCHETTE TOST. CREM/CEB BOL.140GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "3800205877936",},
-  "MARETTI GALL SN MINI CREM/CEB 70GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "3800205877325",},
-  "MARETTI GALL SN MINI TOST. OLIV/TOM 70GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "3800205877547",},
-  "MARETTI GALL SN MINI TOST. PIZZA 70GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "3800205871255",},
-  "MOLINOS ALA TOST.ARROZ CLAS.CRACKERS 150 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791120098093",},
-  "NATUZEN BIZCOCHIT.DE GRASA CRACKERS 200 GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798082000324",},
-  "PASEO GALLETAS CRACKERS OLIV/ROME 250GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7792180145420",},
-  "PINDY DE AGUA CRACKERS 102 GRPACK X 3 U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798113151322",},
-  "PINDY DE AGUA CRACKERS 330 GRS. PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798113153012",},
-  "RIANITOS GUACH JAMON SN ENTRER PAQ.120GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157742166",},
-  "RIANITOS GUACHINES ORIGINAL ENTRERIANOS PAQ.140GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157740148",},
-  "RIANITOS MARINERA LINO Y CHIA. 170GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157740117",},
-  "RIANITOS MARINERA OLIVA Y PARMES CRACKERS 170GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157740100",},
-  "RIANITOS MARINERA ORIG CRACKERS 170GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157740094",},
-  "RIANITOS MINI BIZC.PARMESANO OLIVA 200 GRBOL.CRACKE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157742074",},
-  "RIANITOS MINI BIZC.PARMESANO/OLIVA 200 GRBOL.CRACKE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157740070",},
-  "RIANITOS MINI BIZCO.LINO/CHIA CRACKERS 200 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157740049",},
-  "RIANITOS MINI BIZCO.LINO/CHIA CRACKERS 200 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157742043",},
-  "RIANITOS MINI BIZCOCHOS CRACKERS 200 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157740018",},
-  "RIANITOS MINI BIZCOCHOS CRACKERS 200 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157742098",},
-  "RIANITOS ORIGINAL MINI BIZCO.CRACKERS 200 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157742012",},
-  "RIANITOS.MARINERA OLIVA Y PARM CRACK 200GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157742104",},
-  "SALTLETTS GALL STICKS ORIG SN 250GR BANDEJA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "4017100706004",},
-  "SALTLETTS GALL STICKS SAL SN BOLSA 150GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "4017100737909",},
-  "SANTA MARIA SALADITAS S/GLUTEN 120 GR CRACK.PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798079230659",},
-  "SHIVA CARBON VEGETAL CR SIN TACC PAQ 100GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "617308824094",},
-  "SHIVA CRACKER MIX DE SEMILLAS 100GR 1U BOL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "617308824100",},
-  "SHIVA GALL SN JALAP 100GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "791466298451",},
-  "SHIVA MEDITERRANEAS SIN TACC PAQ 100GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "617308824117",},
-  "SHIVA PIMIENTON AHUMADO CR SIN TACC PAQ 100GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "617308824087",},
-  "SHIVA TOST SARRACENO GERM SN 100GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "791466298468",},
-  "TOSTEX CINTITAS CLASICAS CRACKERS 125 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810354",},
-  "TOSTEX CINTITAS CROCANTES PIZZA CRACKERS 125 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810385",},
-  "TOSTEX CINTITAS JAMON CRACKERS 125 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810521",},
-  "TOSTEX CINTITAS QUESO CRACKERS 125 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810347",},
-  "TOSTI TALITAS CLASICA 100GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529042087",},
-  "TOSTI TOSTADAS CLASICAS PAQ 200GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529041608",},
-  "TOSTI TOSTADAS FINA LIGHT 140GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529041660",},
-  "TOSTI TOSTADAS FINA S/SAL 140GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529041677",},
-  "VENEZIANA TOST. C/ SALVADO CRACKERS 200 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791708617364",},
-  "VENEZIANA TOST. MULTICEREAL CRACKERS 200 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791708617357",},
-  "VENEZIANA TOST. SALADAS CR 200GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791708001569",},
-  "VENEZIANA TOST. SIN SAL CRACKERS 200 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791708617326",},
-  "VIAVITA FAJITAS SAB.JAMON SNACKS 100 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798195940180",},
-  "VIAVITA FAJITAS SAB.QUESO PARMESANO 100 GRBOL.SNACKS": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798195940173",},
-  "VIAVITA SIN GLUTEN FAJITAS C/MIX DE SEM 100GR BANDEJA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798195940142",},
-  "VIAVITA SIN GLUTEN FAJITAS CLASICAS CR 100 GRS BANDEJA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798195940128",},
-  "TIA MARUCA FAJITAS CR CLASICAS 120GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O TMARUCA", "ean": "7798082745430",},
-  "TIA MARUCATOSTADITAS DE ARROZ CRACKERS 120 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O TMARUCA", "ean": "7798082743726",},
-  "M CANUELAS PASEO GALLETAS CR PIZZA 250GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180145437",},
-  "M.CANUELASPASEO MINI CRACKERS 300 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180006448",},
-  "M.CANUELASPASEO MINI MARINER. CRACKERS 220 GR. BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180006462",},
-  "M.CANUELASPASEO MINICRACKERS 5 SEMILLAS 300 GRBOL.CEREAL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180007315",},
-  "M.CANUELASPASEO MINICRACKERS MIX CEREAL 300 GRBOL.CEREAL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180007346",},
-  "M.CANUELASPASEO MINICRACKERS S/SAL 300 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180007254",},
-  "M.CANUELASPASEO MINICRACKERS SESAMO 300 GRBOL.CEREAL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180007285",},
-  "M.CANUELASPASEO SANDWICHS CRACKERS 300 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792200020089",},
-  "RIERA TOSTADAS 7 SEMI PAQUETE 200 GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "RIERA", "ean": "7790071070417",},
-  "RIERA TOSTADAS CLASICA CRACKERS 200 GR PAQUE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "RIERA", "ean": "7790071090231",},
-  "RIERA TOSTADAS INTEGRAL 200GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "RIERA", "ean": "7790071070318",},
-  "RIERA TOSTADAS INTEGRAL 200GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "RIERA", "ean": "7790071090330",},
-  "RIERA TOSTADAS LIGHT PAQUETE 200G PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "RIERA", "ean": "7790071070134",},
-  "RIERA TOSTADAS S/SAL CRACK 200 GR PAQUE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "RIERA", "ean": "7790071090422",},
-  "SMAMS CRACKERS CRACKERS BOLSA 150 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SMAMS", "ean": "7798181510212",},
-  "SMAMS CRACKERS SIN SAL CRACKERS 150 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SMAMS", "ean": "7798181510205",},
-  "SMAMS MIX DE SEMILLAS CEREALES 150 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SMAMS", "ean": "7798181510229",},
-  "SMAMS S/GLUTEN JAMON SNACKS 80GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SMAMS", "ean": "7798181510908",},
-  "SMAMS S/GLUTEN QUESO SNACKS 80GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SMAMS", "ean": "7798181510892",},
-  "TIA MARUCA CRACKERS 3 U 106 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TM S/SAL CR", "ean": "7798082744518",},
-  "PEPSICO TWISTOS HORNEADOS JAMON 40GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310987094",},
-  "PEPSICO TWISTOS JAMON IBER 155GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310984475",},
-  "PEPSICO TWISTOS MINI TOS HORNEAD QUESO 40GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310987100",},
-  "PEPSICO TWISTOS MINI TOST SN QUESO 155GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310984444",},
-  "TWISTOS MINI TOST.JAMON 95GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310983256",},
-  "TWISTOS MINI TOST.QUESO 95GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310983270",},
-  "BIMBO ZENISSIMO SALMAS HORN.CLAS SN CAJA 90GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "ZENISSIMO", "ean": "7793890261844",},
-  "ALFAJOR CHOCOARROZ LIMON SPL 22G 30U CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418258",},
-  "CHOCOARROZ ALFAJOR ARROZ 28GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070104410",},
-  "CHOCOARROZ ALFAJOR ARROZ SPL 36GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070103192",},
-  "CHOCOARROZ ALFAJOR D/ARROZ BLANCO C/D.D.LEC 22 GR X6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418302",},
-  "CHOCOARROZ ALFAJOR DE ARROZ C/D.D.LEC 22 GR X6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418227",},
-  "CHOCOARROZ ALFAJOR DE ARROZ C/LIMON 22GR X 6U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418265",},
-  "CHOCOARROZ ALFAJOR DE ARROZ CHO.BLANCO 22GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418289",},
-  "CHOCOARROZ ALFAJOR DE ARROZ DDL 22 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418203",},
-  "CHOCOARROZ ALFAJOR DE ARROZ DDL 22 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418210",},
-  "CHOCOARROZ ALFAJOR FRUTI DE ARROZ 22GR PAQ. 6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070416872",},
-  "CHOCOARROZ ALFAJOR FRUTILLA D/ARROZ 22GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070416865",},
-  "CHOCOARROZ ALFAJOR SPL ARROZ 28GR PAQUETE 6UN 168G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070104403",},
-  "CHOCOARROZALFAJOR DE ARROZ C/LIMON 22 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418241",},
-  "CHOCOARROZALFAJOR DE ARROZ MARROC 22 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418326",},
-  "CHOCOARROZALFAJOR DE ARROZ MARROC 22 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418333",},
-  "CHOCOARROZALFAJOR DE ARROZ MARROC 22 GR X 6 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418340",},
-  "CACHAFAZ ALFAJOR CHOCOLATE BLANCO 60 GRCAJA X6 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "7798128000493",},
-  "CACHAFAZ ALFAJOR CHOCOLATE NEGRO 60 GRCAJA X6 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "7798128000479",},
-  "CACHAFAZ ALFAJOR DE ARROZ MOUSSE 25 GRPAQ.X6 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "7798128000721",},
-  "CACHAFAZ ALFAJOR MIXTO CHOCOLATE 60 GRCAJA X12 U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "7798128000509",},
-  "CACHAFAZ ALFAJOR MOUSSE 49 GR CAJA X 6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "7798128000257",},
-  "EL CACHAFAZ ALFAJOR 72%CHC SPL 64GR 6U CAJA 512G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "7798128002527",},
-  "EL CACHAFAZ ALFAJOR BLANCO 60 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "77934505",},
-  "EL CACHAFAZ ALFAJOR BLANCO 60 GRCAJA X 6": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "7798128001698",},
-  "EL CACHAFAZ ALFAJOR MINI CHC SPL 27GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "77926852",},
-  "EL CACHAFAZ ALFAJOR NEGRO 50 GRCAJ.X6 ARG": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "7798128001742",},
-  "EL CACHAFAZ ALFAJOR NEGRO MOU. 50 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "77930057",},
-  "EL CACHAFAZ ALFAJOR.MINI CHC SPL 162GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "7798128002459",},
-  "FANTOCHE ELIXIR ALFAJOR CHC SPL 60GR PAQ 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "ELIXIR", "ean": "7791672014770",},
-  "FANTOCHE ELIXIR ALFAJOR CHC SPL 60GR PAQ 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "ELIXIR", "ean": "7791672014787",},
-  "FANTOCHE ELIXIR ALFAJOR SPL 70GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "ELIXIR", "ean": "7791672014794",},
-  "FANTOCHE BLANCO TRIPLE ALFAJOR 80GRS.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "FANTOCHE", "ean": "77991584",},
-  "FANTOCHE DAY EDICION LIMITADA TRIPLE 85 GR ENV 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "FANTOCHE", "ean": "7791672000339",},
-  "FANTOCHE DAY REG SIMPLE 50 GR ENV 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "FANTOCHE", "ean": "7791672002074",},
-  "FANTOCHE MINI ALF. CHO.BLANCO PAQ.X 6U. 20 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "FANTOCHE", "ean": "7791672002005",},
-  "FANTOCHE MINI ALFAJOR 25GR X6UN PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "FANTOCHE", "ean": "7791672002012",},
-  "FANTOCHE SIMPLE NIGHT REGULAR SIMPLE 50 GR PAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "FANTOCHE", "ean": "7791672002067",},
-  "FANTOCHE TRIPLE ALFAJOR 85 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "FANTOCHE", "ean": "77991577",},
-  "FANTOCHE TRIPLE NIGHT ALF.TOR.C/DDL. 85 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "FANTOCHE", "ean": "7791672000247",},
-  "GEORGALOS FULL MANI SIMPLE ALFAJOR 45 GR 1 UNIDAD": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "GEORGALOS", "ean": "7790380024620",},
-  "GEORGALOS FULL.MANI ALFAJOR SPL 40GR PAQ 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "GEORGALOS", "ean": "7790380025191",},
-  "GUAYMALLEN ALFAJOR 35 GR.C/U.BOLSA X6 U1 U.GUAYM.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "GUAYMALLEN", "ean": "7796073000056",},
-  "GUAYMALLEN ALFAJOR 38GRS. ALEX VIAN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "GUAYMALLEN", "ean": "77980229",},
-  "GUAYMALLEN FRUTA ALFAJOR 38GR BOLSA 6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "GUAYMALLEN", "ean": "7796073000032",},
-  "GUAYMALLEN FRUTA ALFAJOR SMPL 38GR 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "GUAYMALLEN", "ean": "77980236",},
-  "GUAYMALLENBLANCO ALFAJOR 38GR BOLSA X 6": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "GUAYMALLEN", "ean": "7796073000049",},
-  "HAVANNA MIXTOS ALFAJOR 255 GRS.CAJA X 6 U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "HAVANNA", "ean": "7791875000013",},
-  "JORGITO ALFAJOR 55 GRS.C/UPAQ.X 6 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGITO", "ean": "7790957000026",},
-  "JORGITO ALFAJOR 55GRS.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGITO", "ean": "77905741",},
-  "JORGITO ALFAJOR BLANCO SPL 50GR 6U PAQ 300G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGITO", "ean": "7790957000019",},
-  "JORGITO ALFAJOR FRUTA 150 GR 6 U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGITO", "ean": "7790957000552",},
-  "JORGITO ALFAJORCI.PAQ.X 6 U. 155 GRS.0957000545": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGITO", "ean": "7790957000545",},
-  "JORGITO MOUSSE ALFAJORCI.PAQ.X 6 UN128 GR ARG": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGITO", "ean": "7790957000569",},
-  "ALFA PAMPA ALFAJOR BLANCO CHOC PAQ. 32GR X6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798171732785",},
-  "ALFA PAMPA ALFAJOR CHOCOLATE 60 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798171730095",},
-  "ALFA PAMPA MINI ALFAJOR CHOC.NEGRO PAQ. 32GR X6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798171730262",},
-  "ALFAPAMPA ALFAJOR DDL BLANCO 60GR 6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798171731757",},
-  "ALFAPAMPA ALFAJOR DDL NEGRO 60GR 6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798171731740",},
-  "ANIMAL KIND ALFAJOR BAN. SPL 50GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798184451413",},
-  "ANIMAL KIND ALFAJOR CHOC VEGANO 50GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798184451192",},
-  "ANIMAL KIND ALFAJOR LIMON VEGANO 50GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798184451314",},
-  "ANIMAL KIND ALFAJOR PISTACH 42GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798184451369",},
-  "ARBANIT ALFAJOR SPL BAN CHC 50GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "736372567666",},
-  "ARBANIT ALFAJOR SPL BAN CHC 50GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "736372567703",},
-  "ARROCITAS MINI ALF.ARROZ C/LIMON 11.2 GRPACK X5 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7790538009677",},
-  "CHAMMAS ALFAJOR BCO SPL 50GR 6U PAQ 300G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232707",},
-  "CHAMMAS ALFAJOR CHOCO NEGRO SPL 50GR 6U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232691",},
-  "CHAMMAS BLANCO TRAD ALFAJOR 40GR 6U PAQ 240G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232684",},
-  "CHAMMAS MEMBRILLO ALFAJOR 40GR 6U CAJA 240G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232677",},
-  "ENTRE DOS ALFAJOR BAN CHC SPL 45GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "763571682333",},
-  "ENTRE DOS ALFAJOR BAN. CHC SPL 45GR 6UN CAJA 270G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "714604060505",},
-  "ENTRE DOS ALFAJOR BAN. CHC SPL 45GR 6UN CAJA 270G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "727373043693",},
-  "ENTRE DOS ALFAJOR DDL NEGRO SPL 45GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "763571682326",},
-  "ESTANCIA EL ROSARIO ALFAJOR DDL BAN AZUC 38GR CAJA X6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7790097000702",},
-  "ESTANCIA EL.ROSARIO ALFAJOR DDF 38GR CAJA 6U 228G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7790097000726",},
-  "HAPP FOOD ALFAJOR X 50G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250038",},
-  "HAPPY FOOD ALFA S/TACC COCO/DDL SPL 50GR 3U BDJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250274",},
-  "HAPPY FOOD ALFAJ LS/TACC DDL SPL 50GR 3U BANDJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250069",},
-  "HAPPY FOOD ALFAJOR 50G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250021",},
-  "HAPPY FOOD ALFAJOR DDL. SIN AZUCAR 50GR 1UN PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250250",},
-  "HAPPY FOOD ALFAJOR SIN AZUCAR 50GR 1UN PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250113",},
-  "HAPPY FOOD LIBRE DE GLUTEN SIMPLE 50 GRS PAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250014",},
-  "HAPPY FOOD LS/TACC MANI SIMPLE 50GR 3U BANDJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250052",},
-  "HAPPY FOOD LS/TACC MOUSSE SIMPLE 50GR 3U BANDJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250045",},
-  "HAPPY FOOD S/TACC DDL S/AZ. SPL 50GR 3U BNDJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250120",},
-  "MARLEY ALFAJOR BAJON CHOC SIMP. 75GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798359560445",},
-  "MARLEY ALFAJOR BAJON CHOC SIMP. 75GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798359560452",},
-  "MARLEY ALFAJOR BAJON CHOC SPL 100GR 1UN PAQUETE": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798359560469",},
-  "MARLEY ALFAJOR BAJONERO CHC TRP 100GR 1UN PAQUETE": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798359560476",},
-  "VAUQUITA ALFAJOR 55 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798138290723",},
-  "VAUQUITA ALFAJOR CAPUCC SPL 72GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798138291423",},
-  "VAUQUITA ALFAJOR DDL. SPL 72GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798138290167",},
-  "VAUQUITA ALFAJOR DE ARROZ EXT.MOU.D.D.L. 28 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798138290587",},
-  "VAUQUITA ALFAJOR DE ARROZ RELL.LIMON 28 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798138290600",},
-  "VAUQUITA ALFAJOR REG. 55 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798138290716",},
-  "VAUQUITA MINI ALFAJOR REG SPL 35GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798138290952",},
-  "VAUQUITA MINI ALFAJORES REG SPL 35GR 10U BOLSA 350G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798138290976",},
-  "VAUQUITA ROGEL ALFAJOR SPL 75GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798138291447",},
-  "TODDY ALFAJOR MOUSSE SPL 50GR REG PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TODDY", "ean": "7790380023579",},
-  "TODDY ALFAJOR MOUSSE SPL 50GR REG PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TODDY", "ean": "7790380023630",},
-  "BANANITA DOLCA BOMBON BOCAD BANANA 30GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BANTA-DOLCA", "ean": "77988263",},
-  "BANANITA DOLCA CHOC 14GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BANTA-DOLCA", "ean": "77988256",},
-  "BARILOCHE ALMENDRAS C/CHOCOLA.BOLSA 80 GRARG": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430902810",},
-  "BARILOCHE ALMENDRAS C/CHOCOLA.BOLSA 80 GRARG": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430902858",},
-  "BARILOCHE AVELLANA C/CHOC. 80GR 1U BOL": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430902865",},
-  "BARILOCHE BOLITAS DE CEREAL BAN.100 GRFL.PACK": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430608309",},
-  "BARILOCHE FRUT SECOS C/CHOCOLA. 200 GR CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430902780",},
-  "BARILOCHE PASAS CUB.C/CHO. 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430902827",},
-  "BARILOCHE PASAS DE UVA BANAD. 120 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430095741",},
-  "BARILOCHE PRALINE CHOC/AVE 180 GR CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430902742",},
-  "BARILOCHE PRALINE PREMIUM TRUFA 180 GR CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430902704",},
-  "BARILOCHE TURRON C/ALMEND. BAN.C/CHO. 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430609214",},
-  "BARILOCHE TURRON MANI C/CH. 150 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430370701",},
-  "BIZNIKKE BLACK BIZCOCHO 28 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BIZNIKE", "ean": "77971333",},
-  "BIZNIKKE NEVADO BIZ.BAN.C/CH.C/LE.Y BLA. 28 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BIZNIKE", "ean": "77991430",},
-  "FANTOCHE PASAS DE UVA BAN C/CHOC 80GR POUCH 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "FANTOCHE", "ean": "7792360097969",},
-  "GALLO OBLEA D/ARROZ BLACK RELL.BAN. 20GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070431639",},
-  "GALLO OBLEA D/ARROZ RELL.BAN. CHC 20GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070431905",},
-  "GALLO OBLEA DE ARROZ RELLE.BAN. 20 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070411952",},
-  "GALLO SNACK CHOCOBAR BAR ARR DDL BAN.C/CHO 20GR PAQ 6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070431240",},
-  "GALLO SNACK CHOCOBAR BAR ARROZ BAN.C/CHO 20GR PAQ 6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070431257",},
-  "GALLO SNACK CHOCOBAR BAR ARROZ BAN.C/CHO 20GR PAQ 6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070431899",},
-  "GALLO SNACK CHOCOBAR OBLEA ARROZ BAN.C/CHO 20GR PAQ 6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070417572",},
-  "GEORGALOS ALMENDRAS BAN.C/CHO. 100 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380011866",},
-  "GEORGALOS ALMENDRAS BAN.C/CHO. 90 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380015543",},
-  "GEORGALOS ALMENDRAS C/CHOCOLA. 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380037767",},
-  "GEORGALOS AVELLANAS C/CHOCO. 100 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380011873",},
-  "GEORGALOS BOLITAS DE CEREAL BAN.C/CHO.80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380037804",},
-  "GEORGALOS FRAMBUESAS BAN.C/CH. 100 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380037033",},
-  "GEORGALOS PASAS BANADAS 80 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380037774",},
-  "GEORGALOS PASAS BANADAS BOLSA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380016625",},
-  "GEORGALOS PASAS D/UVA BANADAS 100 GR BOL": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380037002",},
-  "GEORGALOS TURRON CAPUCCINO CUB.CHOCO. 100GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380033196",},
-  "GEORGALOS TURRON CROC. MANI.ALME.C/CH 100 GR CJ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380015536",},
-  "GEORGALOS TURRON DE MANI BAN.C/CHO. 90 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380034025",},
-  "GEORGALOS TURRON DE MANI C/CHOCO. 90 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380013594",},
-  "HAVANNA HAVANNETS CONITOS BAN.C/CHO. 210 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "HAVANNA", "ean": "7791875000501",},
-  "HERSHEY'S MAIS CHOC C/ LECHE 102GR BL 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "HERSHEY'S", "ean": "7899970400674",},
-  "HERSHEY'S MAIS CHOCOLATE AMENDOIN 102GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "HERSHEY'S", "ean": "7899970400698",},
-  "HERSHEY'S MAIS COOKIES N CREME 102GR BL 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "HERSHEY'S", "ean": "7899970400681",},
-  "HERSHEY'S MAIS TRIPLE CHOC 102GR BL 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "HERSHEY'S", "ean": "7899970400704",},
-  "KINDER BUENO BOMBON 21.5 GRX2 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KINDER BUENO", "ean": "80052760",},
-  "KINDER BUENO WHITE REG. BOMBON 19.5 GR X2 PAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KINDER BUENO", "ean": "80761761",},
-  "KIT KAT CHOCOLATE BLEA BANADA DARK 41.5GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KIT-KAT", "ean": "7891000379073",},
-  "KIT KAT CHOCOLATE OBLEA BAN TRP CHC 41.5GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KIT-KAT", "ean": "7891000422052",},
-  "KIT KAT OBLEA BAN.CHOCOLATE C/LECHE 41.5 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KIT-KAT", "ean": "7891000248799",},
-  "KIT KAT OBLEA BANADA CHOCOLATE 41.5GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KIT-KAT", "ean": "7891000441039",},
-  "KIT KAT OBLEA.BANADA BCO CHOCOLATE 41.5GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KIT-KAT", "ean": "7891000379028",},
-  "MANTECOL OYG GALL OBLEA BANADA CHC 27GR PAQ 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "MANTECOL", "ean": "7790380026426",},
-  "NESTLE ALMENDRAS BAN CHC O BANADOS 80GR POUCH 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "NESTLE", "ean": "8445291996809",},
-  "NESTLE AVELLANAS BAN CHC O BANADOS 80GR POUCH 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "NESTLE", "ean": "8445291996731",},
-  "NUGATON BLACK OBLEA BAN.PAQ. 27 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "NUGATON", "ean": "7792360072485",},
-  "NUGATON BLANCO OBLEA BANADA 27 GRARG": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "NUGATON", "ean": "7792222041062",},
-  "NUGATON OBLEA BAN.CHO.C/LEC.PAQ. 27 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "NUGATON", "ean": "7792360072447",},
-  "NUGATON OBLEA BANADA 27 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "NUGATON", "ean": "7792222041055",},
-  "NUGATON OBLEA CHOCOLATE BLANCO 27 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "NUGATON", "ean": "7792360072461",},
-  "BIG OBLEA BANADA CHC 28GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7791672014756",},
-  "BRIA SNACKS BAN CHC 100GR 1U POUCH": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "764451098916",},
-  "CONOSUR PASAS DE UVA C/CHOCO 150GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7798143356148",},
-  "DR SCHAR OBLEA BANADA CHC 35GR BOLSA 3UN 105G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8008698005286",},
-  "EDEMY CUBANITOS BAN CHO 90GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7790229111191",},
-  "EXPOVERDE ARANDANO BAN CHC 100GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7798149701676",},
-  "EXPOVERDE AVELLA BAN CHC 100GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7798149701669",},
-  "HAPPY FOOD BOCADITO DDL S/TACC 40GR 3UN PAQ 120G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7798308250151",},
-  "LA CASA PRALINE 3 CHOCHOLATES 250GR CAJA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740903776",},
-  "LA CASA TURRON CHOCO/NARANJA BANA. CJA 225 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740901918",},
-  "LACASA ALMEND BANA CHOC NEGRO 125G BOL 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740910569",},
-  "LACASA ALMEND BANA CHOC NEGRO 125G BOL 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740910576",},
-  "LACASA PASAS BANA CHOC NEGRO 150G BOL 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740907064",},
-  "LADDU BAR BARRITA ARANDANOS 30GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8904150127483",},
-  "LADDU BAR BARRITA CHOC/NARANJA 30GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8904150195246",},
-  "LADDU BAR BARRITA FRUTOS ROJOS 30GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8904150127438",},
-  "LADDU BAR BARRITA VEGANA BROWNIE 30GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8906038788601",},
-  "LADDU BAR BARRITA VEGANA COCO 30GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8906038788625",},
-  "LADDU BAR BARRITA VEGANA COCO 30GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8906038788649",},
-  "LULEMUU REPOP CUBANITOS ARROZ RELL. 15GR CU X 5U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7798146300834",},
-  "LULEMUU REPOP CUBANITOS ARROZ RELL. 15GR CU X 5U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7798146300858",},
-  "NATURAL CANDY ALM/SEM BAN CHOC 100GR 1U POUCH": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "726367920217",},
-  "NATURAL CANDY ALM/SEM BAN CHOC 100GR 1U POUCH": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "734191437115",},
-  "NATURAL CANDY ALMEND BAN CHOC 100GR 1U POUCH": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "734191403813",},
-  "NATURAL CANDY CAST/SEM BAN CHOC 100GR 1U POUCH": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "724373747095",},
-  "PECAN NUEZ BAN CHC 125GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7700247001787",},
-  "SABE BIEN ! BRAUNICHOC O BAN 35GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7793890261530",},
-  "VAUQUITA BLACK TABLETA DE D.D.LE.BAN. 80 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7798138290570",},
-  "SNICKER BARRA RELLENA 48GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "SNICKERS", "ean": "7506174512248",},
-  "SNICKERS ALMOND BARRA 49.9 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "SNICKERS", "ean": "40000001058",},
-  "TWIX BARRA DE CHOCOLATE C/CARAMELO 50.7 GRTAB.SOLIDA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "TWIX", "ean": "40000514206",},
-  "VIZZIO ALMENDRAS BAN CHC 80GR POUCH 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "VIZZIO", "ean": "7792360098003",},
-  "VIZZIO CROCANTE CEREAL BAN.C/CHO. 80 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "VIZZIO", "ean": "7792360097983",},
-  "AFTER EIGHT MINT BOMBONES 200 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "AFTER EIGHT", "ean": "7613032596668",},
-  "NESTLE ALPINO BOMBONES CHC 195GR CAJA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ALPINO", "ean": "7891000067253",},
-  "BACCI-PERUGINA BOMBON CHC 200GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BACCI-PERUGINA", "ean": "8000300420715",},
-  "BACCI-PERUGINA BOMBONES CHOCOLATE 125GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BACCI-PERUGINA", "ean": "8000300389043",},
-  "BACCI-PERUGINA BOMBONES CHOCOLATE 125GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BACCI-PERUGINA", "ean": "8000300421361",},
-  "BACI CHOCOLATE BYB TUBO 37.5GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BACCI-PERUGINA", "ean": "8000300387629",},
-  "BACI CHOCOLATE BYB TUBO 37.5GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BACCI-PERUGINA", "ean": "8000300388855",},
-  "BACI CHOCOLATE BYB TUBO 37.5GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BACCI-PERUGINA", "ean": "8000300388893",},
-  "BACI CHOCOLATE BYB TUBO 37.5GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BACCI-PERUGINA", "ean": "8000300420753",},
-  "BACI PERUGINA BOMBON CHC 150G CAJA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BACCI-PERUGINA", "ean": "8000300421927",},
-  "BACI PERUGINA BOMBON CHC 175GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BACCI-PERUGINA", "ean": "8000300387278",},
-  "BONAFIDE BOCADITO DULCE DE LECHE 16 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BONAFIDE", "ean": "7792360070047",},
-  "EL CACHAFAZ MARROC BOCAD CHC 14GR PAQ 1U REG": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "EL CACHAFAZ", "ean": "77985996",},
-  "EL CACHAFAZ MARROC CHC BOCAD 14GR CAJA 6UN 84G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "EL CACHAFAZ", "ean": "7798128002466",},
-  "EL CACHAFAZ MARROC.BOCAD CHC 14GR CAJA 12UN 168G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "EL CACHAFAZ", "ean": "7798128002473",},
-  "GAROTO BOMBONES SURTIDOS CAJA 250GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "GAROTO", "ean": "7891000392775",},
-  "GAROTO SERENATA DE AMOR O BAN 140.8GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "GAROTO", "ean": "7891000404249",},
-  "LINDT BOMBONES CHOC BYB 221GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "LINDT", "ean": "3046920040150",},
-  "LINDT LINDOR BOMBON CHOCO 137GR CAJA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "LINDT", "ean": "8003340803449",},
-  "LINDT LINDOR BOMBON CHOCO 137GR CAJA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "LINDT", "ean": "8003340803456",},
-  "LINDT LINDOR BOMBON CHOCO.CJA 75 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "LINDT", "ean": "8003340096247",},
-  "LINDT LINDOR BOMBON CORNET CHOCO 137GR CAJA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "LINDT", "ean": "8003340807775",},
-  "LINDT LINDOR BOMBON MILK CHOCO 137GR CAJA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "LINDT", "ean": "8003340807751",},
-  "LINDT LINDOR BOMBONES LECHE 75GR CAJA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "LINDT", "ean": "8003340096230",},
-  "LINDT LINDOR MILK BOMBONES CHC 37GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "LINDT", "ean": "8003340801216",},
-  "NESTLE ESPECIALIDADES BOMB.SURT. 251 GR CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "NESTLE", "ean": "7891000391068",},
-  "NESTLE TAB CHOC SOL BYB 22GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "NESTLE", "ean": "8445291565203",},
-  "CAFFAREL BOCADITOS CHOC 150GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "8013108007668",},
-  "CAFFAREL BOMBONES CHOC 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "8013108699771",},
-  "CAFFAREL BOMBONES CHOC 150GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "8013108007637",},
-  "CAFFAREL BOMBONES.CHOC 180GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "8013108695209",},
-  "DE LA VIUDA TRUFAS CHOC 100GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "8410223605913",},
-  "DE LA VIUDA TRUFAS CHOC 100GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "8410223608105",},
-  "DELAVIUDA BOMBONES CHC BYB 150GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "8410223607726",},
-  "DELAVIUDA BOMBONES CHC BYB 150GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "8410223706016",},
-  "DELAVIUDA BOMBONES CHC. BYB 160GR ESTUCHE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "8410223705774",},
-  "INTEGRA BOCADITO CHC ARANDANOS 26GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "7798343751354",},
-  "INTEGRA BOCADITO CHOCOLATE C/MANI 26GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "7798343751347",},
-  "LACASA TRUFAS AL CACAO PUROBOMBONES 200 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "8410740050616",},
-  "LACASA TRUFAS CACAO 70% 150GR CAJA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "8410740910743",},
-  "SCHOGETTEN BOMBONES B&W 100GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "4000415039707",},
-  "SCHOGETTEN BOMBONES CHC 100GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "4000415000660",},
-  "SCHOGETTEN BOMBONES CHC AMARG 100GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "4000415192600",},
-  "SCHOGETTEN BOMBONES CHC AMARG 100GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "4000415730109",},
-  "SCHOGETTEN BOMBONES CHC AMARG 100GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "4000415851705",},
-  "SCHOGETTEN BOMBONES CHC AMARG 100GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "4000607852008",},
-  "SCHOGETTEN BOMBONES CHC CARAM 100GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "4000415040109",},
-  "SCHOGETTEN BOMBONES CHC PIST 100GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "4000415852207",},
-  "SCHOGETTEN BOMBONES WHIT 100GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "4000415851309",},
-  "SCHOGETTEN BOMBONES YOGURT FRES 100GR CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "4000607854705",},
-  "SCHOGETTENBOMBONES BLANCO CAJA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "4000415856601",},
-  "STABZ TRUFAS C/AVELLANAS CAJA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "3481290025886",},
-  "STABZ TRUFAS C/CARAMELO CAJA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "3481290025879",},
-  "VERGANI BOMBONES PRALINE CHC 180GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "8002325571304",},
-  "VERGANI GIANDUIOT.CLASICO BOMBONES 130 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "8002325640697",},
-  "VILLARS BOCADOS CHC SURT 150GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "7610036018080",},
-  "FERRERO ROCHER BOMBON CJA 4U 50G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "7898024397861",},
-  "FERRERO ROCHER BOMBON ESTUCHE 150GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "7898024396994",},
-  "FERRERO ROCHER BOMBONES 100 GRCAJA PL.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "7861002900117",},
-  "FERRERO ROCHER BOMBONES 12.5 GRCAJA X 24": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "7898024395331",},
-  "FERRERO ROCHER BOMBONES 12.5 GRCAJA X8 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "7898024392019",},
-  "FERRERO ROCHER BOMBONES 12.5 GRPAQ.X 3 U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "78909434",},
-  "FERRERO ROCHER BOMBONES 300 GREST.PL.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "8000500009673",},
-  "FERRERO ROCHER BOMBONES COLLECTION X 77 GR CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "7898024397151",},
-  "BARILOCHE MANI COLOR CHOCOLATE 120GR BOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BARILOCHE", "ean": "7792430095680",},
-  "BARILOCHE MANI CON CHOCOLATE 120 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BARILOCHE", "ean": "7792430095420",},
-  "BARILOCHE MANI CON CHOCOLATE 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BARILOCHE", "ean": "7792430902803",},
-  "BARILOCHE MANI GARAP C/CHOCO. BOLSA 100GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BARILOCHE", "ean": "7792430603106",},
-  "BARILOCHE TURRON BANADO MANI 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BARILOCHE", "ean": "7792430608651",},
-  "GEORGALOS CONFITES LIC. INFANTIL CHOCOLATE BOLSA 80GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380037903",},
-  "GEORGALOS GARRAPIN. DE MANI BAN.C/CHO.80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380037811",},
-  "GEORGALOS MANI C/CH.CONFITADO 100 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380011897",},
-  "GEORGALOS MANI COLOR C/CHOCOLATE 80GR BOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380037828",},
-  "GEORGALOS MANI CON CHOCOLATE 110 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380014621",},
-  "GEORGALOS MANI CON CHOCOLATE 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380037736",},
-  "GEORGALOS MANI CON CHOCOLATE BOLSA 120 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380037743",},
-  "GEORGALOS MANI CROC.BAN.C/CHO. 100 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380011880",},
-  "M & M´S CONFITES CHOCO. PAQ. 48 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "7797453001441",},
-  "M & M´S MINIS CONFITES CHOCO. TBO 30 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "7797453001465",},
-  "M & M'S CHOC CONF 40GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "40000508830",},
-  "M & M'S CHOC CONFITES 46.2GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "40000001447",},
-  "M & M'S MANI CON CHOCOLATE PAQ. 49 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "7797453001458",},
-  "M & M'S MILK CHOCOLATE P/SHARE 47.9 GR REGULAR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "200062911579",},
-  "M & M'S MINIS CONFITES C/CHOCO. 30 GRTUBO": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "7896423419276",},
-  "M & M'S PEANUT CANDIES CONFITES 150.3 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "40000017325",},
-  "M & M'S PLAIN GRAGEAS C/CHOCOLATE 150 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "40000017318",},
-  "CONOSUR ALMENDRA C/CHOCOLATE 150GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7798143356117",},
-  "CONOSUR AVELLANA C/CHOCOLATE 150GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7798143356124",},
-  "CONOSUR CAFE C/CHOCOLATE 150GR 1U BDJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7798143356155",},
-  "CONOSUR CHOCO C/LECHE CONFITADO 150GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7798143356162",},
-  "CONOSUR MANI CON CHOCOLATE 150GR 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7798143356131",},
-  "KING MANI CON CHOCOLATE 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7798151953667",},
-  "LACASA LENTEJAS DE CHOC CONF 190GR 1U BOL": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "8410740006262",},
-  "LOS CAROLINOS MANI C/CHOCO. 100 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7794377085168",},
-  "SKITTLES ORIGINAL GRAGEAS DE CHOCOL. 204.1 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "40000140924",},
-  "VIZZIO MANI BANAD. C/CHOCOLATE 85GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "VIZZIO", "ean": "7792360094548",},
-  "VIZZIO MANI BANADO C/CHOCOLATE 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "VIZZIO", "ean": "7792360097976",},
-  "GEORGALOS CHOCOMOTI HUEV.CHC 22GR 1U BOL PAS/NAV": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "GEORGALOS", "ean": "7790380032465",},
-  "KINDER JOY HUEVO DE CHOCOLATE 20 GRC/SORPRESA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER JOY", "ean": "78602731",},
-  "KINDER JOY HUEVO DE CHOCOLATE 20 GRX 2U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER JOY", "ean": "7861002900421",},
-  "KINDER C/ LECHE P/NENA C/SORP 20 GRS HYF 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "78931053",},
-  "KINDER C/LECHE P/NENE C/SORP 20 GRS HYF 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "40084107",},
-  "KINDER C/LECHE. C/SORP 20 GRS HYF 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "77965349",},
-  "KINDER JOY HUEVO CHO. 20 GR CAJA 2U C/SORP": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "7797394002453",},
-  "KINDER SORPRESA C/SORP 20GR HYF 1UN ENV": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "78931039",},
-  "KINDER SORPRESA HUEVO THE HAPPOS FAMILY 20 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "77954930",},
-  "KINDER SORPRESA NENA HUEVO DE CHO. 20 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "77939500",},
-  "KINDER SORPRESA NENA HUEVO DE CHO. 20 GRCAJA 2 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "7797394000749",},
-  "KINDER SORPRESA NENA HUEVO DE CHO. 20 GRCAJA 2 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "7898024395867",},
-  "KINDER SORPRESA SELVATICOS HUEVO CHOC. 20 GR 2 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "7797394001555",},
-  "FULL MANI HUEVO DE CHOCOLATE 45GR PAS/NAV. 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "O GEORGALOS", "ean": "7790380032175",},
-  "PECOSOS HUEVITOS D/CHOC 110GR 1U S/SORP BOL": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "O MARCAS", "ean": "8410740917476",},
-  "NESTLE CHOC ALPINO TAB.SOL. 85GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ALPINO", "ean": "7891000336373",},
-  "BIZNIKKE NEVADO C/MANI TAB.SOLIDA 30 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "BIZNIKE", "ean": "77971340",},
-  "BONAFIDE TABLETA CHOCO SOLIDA 30GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "BONAFIDE", "ean": "7792360952657",},
-  "BONAFIDE TABLETA MANI SOLIDAS 90GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "BONAFIDE", "ean": "7792360097709",},
-  "CACHAFAZ TAB ALMEND PART SOLIDA 100GR 1U CJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "EL CACHAFAZ", "ean": "7798128002282",},
-  "CACHAFAZ TAB AVELL PARTID SOLIDA 100GR 1U CJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "EL CACHAFAZ", "ean": "7798128001001",},
-  "CACHAFAZ TAB C/AVELL C/LECH SOLIDA 100GR 1U CJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "EL CACHAFAZ", "ean": "7798128002190",},
-  "CACHAFAZ TAB C/L ALMENDRA SOLIDA 100GR 1U CJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "EL CACHAFAZ", "ean": "7798128002183",},
-  "CACHAFAZ TAB CON LECHE SOLIDA 100GR 1U CJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "EL CACHAFAZ", "ean": "7798128002176",},
-  "GEORGALOS BLANCO TAB.SOLIDA 25 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "7790380024217",},
-  "GEORGALOS C/LECHE TAB.SOLIDA 25 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "7790380024194",},
-  "GEORGALOS C/PASTA DE ALMEND.TAB.RELL. 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "7790380013662",},
-  "GEORGALOS FULL MANI CHO.C/LEC.Y MANI 160 GRTAB.SOLIDA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "7790380005438",},
-  "GEORGALOS FULL MANI SOLIDAS 100 GRS PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "7790380024750",},
-  "GEORGALOS FULL MANI SOLIDAS 35 GRS PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "7790380024408",},
-  "GEORGALOS FULL MANI TABL. 9 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "77969347",},
-  "GEORGALOS S/AZUCAR TAB.SOLIDA 70 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "7790380005612",},
-  "HERSHEY'S 73% DARK TAB.SOLIDA 85GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HERSHEY'S", "ean": "7899970401657",},
-  "HERSHEY'S AIREADO CHOC C/LECHE TABLETA 85GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HERSHEY'S", "ean": "7899970400452",},
-  "HERSHEY'S CHC C/LECH TAB.SOLIDA 82GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HERSHEY'S", "ean": "7899970402982",},
-  "HERSHEY'S CHC SEM AMARG 40% TAB.SOLIDA 82GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HERSHEY'S", "ean": "7899970402838",},
-  "HERSHEY'S CHC TAB.SOLIDA 82GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HERSHEY'S", "ean": "7899970402814",},
-  "HERSHEY'S COOKIES & CREAM TABLETA CHC SOLIDA 77GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HERSHEY'S", "ean": "7899970403026",},
-  "HERSHEY'S SEMI AMARGO 40% TAB.SOLIDA 92 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HERSHEY'S", "ean": "7899970400070",},
-  "HERSHEY'S TAB AIREADO CHOC C/LECHE 85GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HERSHEY'S", "ean": "7899970402586",},
-  "KINDER CHOCOLATE C/LECHE TAB.SOLIDA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "KINDER", "ean": "77949707",},
-  "KINDER CHOCOLATE C/LECHE TAB.SOLIDA 50 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "KINDER", "ean": "80177609",},
-  "KINDER CHOCOLATE C/LECHE TAB.SOLIDA 50 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "KINDER", "ean": "77949677",},
-  "KINDER CHOCOLATE C/LECHE TAB.SOLIDA 50 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "KINDER", "ean": "7797394001654",},
-  "KINDER TAB.SOLIDA 100.72 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "KINDER", "ean": "80177616",},
-  "KINDER TAB.SOLIDA 12.5 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "KINDER", "ean": "80050315",},
-  "KINDER MAXI TAB.SOLIDA 21 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "KINDER MAXI", "ean": "80050094",},
-  "LINDT DARK CHOC.TABLETA SOLIDA 100 GRIMP": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "3046920028004",},
-  "LINDT EXCELLENCE 90% CACAO TAB.SOLID 100GR IMP CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "3046920029759",},
-  "LINDT EXCELLENCE DARK TAB.SOLIDA 100 GRIMP": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "3046920028370",},
-  "LINDT EXCELLENCE FLEUR DE SEL 100 GRTAB.SOLIDA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "3046920029674",},
-  "LINDT EXCELLENCE TAB.SOLIDA 100 GRIMP": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "3046920028363",},
-  "LINDT GOLDSURF. AMARGO TAB.SOLIDA 300 GRIMP": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "7610400013857",},
-  "LINDT IMP0RTADO SWISSALMONTAB.SOLIDA 100 GRS.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "7610400014038",},
-  "LINDT IMPORTADA HAZELNUT TAB.SOLIDA100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "7610400010023",},
-  "LINDT IMPORTADO HAZELNUT MILK 100 GR TAB.SOLID": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "7610400010016",},
-  "LINDT IMPORTADO MILK LINDOSINGLE 100 GRS.TAB.SOLIDA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "7610400014649",},
-  "LINDT IMPORTADO MILK SURFIN 100 GR TAB.SOLIDA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "7610400010108",},
-  "LINDT IMPORTADO WHITE TAB.SOLIDA100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "7610400014571",},
-  "LINDT LINDOR 60% CACAO TAB.SOLIDA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "7610400074155",},
-  "LINDT MILK HAZELNUTS TAB.SOLIDA 300 GRIMP": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "7610400013864",},
-  "LINDT NAPOLITANOMINI TABL.SURTIDAS CJ. 350 GRTAB.SOLIDA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "7610400078559",},
-  "MECANO TAB.CHOC BCO DDL RELLE. 45GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MECANO", "ean": "7792360095279",},
-  "MECANO TAB.CHOC DDL RELLE. 45GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MECANO", "ean": "7792360095262",},
-  "NESTLE CHOCOTRIO CHC RELL C/GALL 90GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7891000377543",},
-  "NESTLE CHOCOTRIO CHC RELL C/GALL 90GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7891000377598",},
-  "NESTLE CHOCOTRIO CHC RELL C/GALL 90GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7891000377642",},
-  "NESTLE GALAK SOLIDA 80GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7891000368626",},
-  "NESTLE MANI SOLIDAS 33GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7613287526236",},
-  "NESTLE MANI SOLIDAS 90GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7613287529497",},
-  "NESTLE TAB CHC SOLIDAS 45GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565173",},
-  "NESTLE TAB CHOC SOLIDAS 50GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565333",},
-  "NESTLE TAB CHOC SOLIDAS 50GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565395",},
-  "NESTLE TAB CHOC. SOLIDAS 25GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565364",},
-  "NESTLE TAB CHOC. SOLIDAS 25GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565425",},
-  "NESTLE TABLETA CHOCO CON MANI 150GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7613287526311",},
-  "NESTLE CLASSIC AMARGO TAB.SOLIDA 80GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE CLASSIC", "ean": "7891000368572",},
-  "NESTLE CLASSIC DIPLOMATA SOLIDAS 80GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE CLASSIC", "ean": "7891000368893",},
-  "NESTLE CLASSIC TAB.SOLIDA 80GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE CLASSIC", "ean": "7891000369098",},
-  "NESTLE DUO CLASSIC TAB.SOLIDA 80GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE CLASSIC", "ean": "7891000368992",},
-  "NESTLE CRUNCH SOLIDA 80GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE CRUNCH", "ean": "7891000369371",},
-  "CACHET TAB CHOCOLATE SOLIDAS 100GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "5412956213734",},
-  "CACHET TAB CHOCOLATE SOLIDAS 100GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "5412956213772",},
-  "CACHET TAB CHOCOLATE SOLIDAS 100GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "5412956214519",},
-  "CACHET TAB CHOCOLATE SOLIDAS 100GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "5412956214526",},
-  "CACHET TAB CHOCOLATE SOLIDAS 100GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "5412956214540",},
-  "CACHET TAB CHOCOLATE SOLIDAS 100GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "5412956214656",},
-  "CACHET TAB CHOCOLATE SOLIDAS 100GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "5412956214670",},
-  "COLONIAL CHOCOLATE 55% CACAO S/AZUCAR S/TACC 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7797897003001",},
-  "COLONIAL CHOCOLATE 70% CACAO C/STEVIA S/AZU S/TACC 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7797897003186",},
-  "COLONIAL TABL CHOC 60% CACAO S/AZU 100GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7797897002929",},
-  "COLONIAL TABL CHOC 70% CACAO S/AZU 100GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7797897002936",},
-  "DROSTE PASTILLAS CHOCO. MILK DARK CJ 85GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "8715675121036",},
-  "DROSTE PASTILLAS CHOCO. MILK LAITE CJ 85GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "8715675121012",},
-  "DROSTE PASTILLAS CHOCO. MILK WHITE CJ 85GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "8715675121043",},
-  "KARINA CHOCOLATE AMARGO TAB.SOL. 100 GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "4000411016221",},
-  "KARINA CHOCOLATE BLANCO TAB.SOL. 100 GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "4001743016170",},
-  "KARINA CHOCOLATE CON AVELLANAS TAB.SOL. 100 GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "4000411016214",},
-  "KARINA CHOCOLATE CON LECHE TAB.SOL. 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "4000411016207",},
-  "KARINA CHOCOLATE PASA/AVELLANAS TAB.SOL. 100 GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "4000411016238",},
-  "LA CASA TAB.SOLIDA 70% CACAO 100GR 1U CJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "8410740906128",},
-  "LA CASA TAB.SOLIDA NEGRO ARANDANO 100GR 1U CJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "8410740911542",},
-  "LA CASA TAB.SOLIDA NEGRO NARANJA 100GR 1U CJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "8410740906005",},
-  "LA CASA TAB.SOLIDA NEGRO70% C/MENTA 100GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "8410740907163",},
-  "MR BEAST TAB CHC RELLENAS 60GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "850027880280",},
-  "MR BEAST TAB CHC SOLIDA 60GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "850027880105",},
-  "MR BEAST TAB CHC SOLIDA 60GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "850027880129",},
-  "MR BEAST TAB CHC SOLIDA 60GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "850027880266",},
-  "MUECAS TABLETA CHC 71% CACAO ALM 80GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7798333090302",},
-  "MUNZ AVELLANAS TAB.SOLIDA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7610041080102",},
-  "MUNZ CHO.NEGRO C/AVELLAN.TAB.SOLIDA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7610041080904",},
-  "MUNZ CHO.NEGRO C/NARANJA TAB.SOLIDA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7613900080350",},
-  "MUNZ NOIR TAB.SOLIDA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7610041080201",},
-  "MUNZ SWISS PREMIUM TAB.SOLIDA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7610041080003",},
-  "RITTER SPORT C/AVELLAN.Y PASAS 100 GRTAB.SOLIDA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "4000417022004",},
-  "RITTER SPORT C/LECHE TAB.SOLIDA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "4000417018007",},
-  "RITTER SPORT CASTA DE CAJU 100GR TAB.SOL. 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "4000417707000",},
-  "RITTER SPORT CH.BLANCO C/AVELL. 100 GRTAB.SOLIDA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "4000417701008",},
-  "RITTER SPORT CHO.C/LEC.Y AVELLAN. 100 GRTAB.SOLIDA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "4000417700001",},
-  "RITTER SPORT CHO.DARK WHOLE HAZ. 100 GRTAB.SOLIDA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "4000417702005",},
-  "RITTER SPORT CHOCOLATE C/ALMENDR. 100 GRTAB.SOLIDA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "4000417703002",},
-  "RITTER SPORT KAKAO/MOU.TAB.SOLIDA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "4000417294005",},
-  "RITTER SPORT MARZIPAN TAB.SOLIDA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "4000417025005",},
-  "RITTER SPORT MINI CHOC 116GR TAB.SOL.1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "4000417117106",},
-  "RITTER SPORT PERU 74% 100GR TAB.SOLIDA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "4000417933003",},
-  "SCHOGETTEN TAB CHC SOLIDAS 100GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "4000607851001",},
-  "SCHOGETTEN TAB SOL. CHOCO ALPIN MILK 100GR CJ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "4000607850004",},
-  "SCHOGETTEN TAB SOL. CHOCO NOISE 100GR CJ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "4000415143800",},
-  "VALOR AMARGO 70%CACAO C/SAL MEDIT. 100 GRTAB.SOLIDA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "8410109051247",},
-  "VALOR DARK CHOCOL.70%WITH ORAN. 100 GRTAB.SOLIDA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "8410109050523",},
-  "VALOR DARK CHOCOL.70%WITH TOFF. 100 GRTAB.SOLIDA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "8410109050578",},
-  "VALOR DARK CHOCOLATE 70% 100 GRTAB.SOLIDA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "8410109050509",},
-  "VALOR S/AZUCAR C/LECHE Y AVELLANAS 100 GRTAB.SOLIDA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "8410109056549",},
-  "VALOR S/AZUCAR CHO.C/MOU.DE TRUFA 100 GRTAB.RELLE.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "8410109056532",},
-  "VALOR S/AZUCAR CHOCOLATE C/LECHE 100 GRTAB.SOLIDA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "8410109055795",},
-  "VALOR TABLETA CACAO SOLIDAS S/AZ 100GR 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "8410109050882",},
-  "VALOR TABLETA CHOC 82% SOLIDAS 100GR 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "8410109104950",},
-  "VALOR TABLETA CHOC 85% SOLIDAS 100GR 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "8410109120462",},
-  "VALOR TABLETA CHOC S/AZ 85% SOLIDAS 100GR 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "8410109109832",},
-  "VAUQUITA TAB. DDL SOLIDA 22GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "77927361",},
-  "VAUQUITA TAB.SOLIDA 22GR X4U PAQ88GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7798138290136",},
-  "VILLARS AMARGO TAB.SOLIDA 50 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7610036003802",},
-  "VILLARS BCO.C/LEC.SUIZA TAB.SOLIDA 100 GRIMP": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7610036002713",},
-  "VILLARS CH.AMARGO C/NARANJA TAB.SOLIDA 100 GRIMP": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7610036002829",},
-  "VILLARS CH.LECHE/ ALMENDRAS TAB.SOLIDA 100 GRIMP": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7610036002744",},
-  "VILLARS CHOCOLATE C/AVELLAN.TAB.SOLIDA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7610036002836",},
-  "VILLARS CHOCOLATE C/LECHE TAB.SOLIDA 50 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7610036003710",},
-  "VILLARS CHOCOLATE MILK PURE TAB.SOLIDA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7610036010305",},
-  "VILLARS CHOCOLATE TABLETA SOLIDA 100GR 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7610036002775",},
-  "VILLARS NEGRO 72% CACAO TAB.SOLIDA 100 GRIMP": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7610036002737",},
-  "VILLARS NEGRO CACAO TAB.SOLIDA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7610036010503",},
-  "VILLARS PUR FUSION VILORE 100 GR TAB.SOLIDA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7610036002720",},
-  "VILLARS WHITE PURE TAB.SOLIDA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7610036010107",},
-  "NESTLE SUFLAIR CHOCOLATE C/LECHE 50 GRTAB.AIREA.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SUFLAIR", "ean": "7891000107836",},
-  "SUFLAIR MILK AIREADO TABLETA 80GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SUFLAIR", "ean": "7891000329856",},
-  "TODDY TABLETAS AIREADAS 50GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TODDY", "ean": "7790380018056",},
-  "TODDY TABLETAS CHC SOLIDA 60GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TODDY", "ean": "7790380025139",},
-  "TODDY TABLETAS RELLENAS 60GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TODDY", "ean": "7790380025122",},
-  "TOKKE C/MANI TAB.SOLIDA 120 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TOKKE", "ean": "7790380022145",},
-  "TOKKE CHOC C/LECHE TAB.SOLIDA 60 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TOKKE", "ean": "7790380022114",},
-  "VIZZIO TAB SOLIDA 60% CACAO 50GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360095033",},
-  "VIZZIO TAB SOLIDA BLANCO 50GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360095064",},
-  "VIZZIO TAB SOLIDA C LECHE 50GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360095002",},
-  "VIZZIO TAB. CHOC C/LECHE Y ALMENDRAS 35GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360094524",},
-  "VIZZIO TAB. CHOCO C/ALMENDRAS 100GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360094586",},
-  "VIZZIO TAB.SOLIDA Y MANI 35GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360094500",},
-  "VIZZIO TABLE CHOC 60% CACAO 90GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360095040",},
-  "VIZZIO TABLE CHOC BLANCO 90GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360095071",},
-  "VIZZIO TABLE CHOC C/LECHE 90GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360095019",},
-  "VIZZIO TABLETA D/CHOC 60% CACAO 130GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360095057",},
-  "MENTOS PURE FRESH CONF. 28P ADULTO POTE 56GR 1UN": {"empresa": "RESTO", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "MENTOS", "ean": "7895144295930",},
-  "ICE CUBES PEPPERMINT.S/AZUCAR ADU.CONF. 40P POTE 92GR 1UN": {"empresa": "RESTO", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "O MARCAS", "ean": "34000008438",},
-  "ICE CUBES RASPBERRY.S/AZUCAR ADU.CONF. 40P POTE 92GR 1UN": {"empresa": "RESTO", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "O MARCAS", "ean": "34000008483",},
-  "ICE CUBES SPEARMINT.S/AZUCAR ADU.CONF. 40P POTE 92GR 1UN": {"empresa": "RESTO", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "O MARCAS", "ean": "34000008476",},
-  "WRIGLEY'S 45 GR SLIM SPEARMINT PAQ. 15 TABL.": {"empresa": "RESTO", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "WRIGLEY S", "ean": "22000006653",},
-  "WRIGLEY'S DOUBLEMINT 15CHI. TABL. ADU. PQ. 40.5GR 1UN": {"empresa": "RESTO", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "WRIGLEY S", "ean": "22000006660",},
-  "BUBBLE ROLL PINK POWER CHI. GLOBO EST. 58GR 1.8 MT DE CHICLE": {"empresa": "RESTO", "categoría": "Gums", "subcategoría": "INFANTILES", "marca": "O MARCAS", "ean": "7798130959376",},
-}
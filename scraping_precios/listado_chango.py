@@ -1,1180 +0,0 @@
-productos = {
-  "ARCOR JUGO POLVO REG FRUTILLA SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143244",},
-  "ARCOR POLVO ANANA BAJO AZUCARES SOBRE 18GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580129699",},
-  "ARCOR POLVO ANANA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580141516",},
-  "ARCOR POLVO DURAZNO SOBRE 15GR P/1 LT": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580142766",},
-  "ARCOR POLVO FRUTILLA BAJO AZUCARES SOBRE 18GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580129910",},
-  "ARCOR POLVO LIMONADA BAJO AZUCARES SOBRE 18GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580129682",},
-  "ARCOR POLVO LIMONADA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143527",},
-  "ARCOR POLVO MANZANA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580144142",},
-  "ARCOR POLVO MULTIFRUTA BAJO AZUCARES SOBRE 18GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580129774",},
-  "ARCOR POLVO NARA-DURAZNO BAJO AZUCARES SOBRE 18GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580129675",},
-  "ARCOR POLVO NARANJA BANANA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580141509",},
-  "ARCOR POLVO NARANJA DULCE BAJO AZUCARES SOBRE 18GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580129712",},
-  "ARCOR POLVO NARANJA DULCE REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143008",},
-  "ARCOR POLVO NARANJA DURAZNO REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580141943",},
-  "ARCOR POLVO NARANJA MANGO REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143763",},
-  "ARCOR POLVO NARANJA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143237",},
-  "ARCOR POLVO POMELO ROSADO REG SOBRE 18GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580423896",},
-  "ARCOR POLVO POMELO ROSADO SOBRE REG 15GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580142285",},
-  "ARCOR POLVO REG FRUTILLA ANANA BANANA SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143824",},
-  "ARCOR POLVO REG MULTIFRUTA SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580142490",},
-  "BC LA CAMPAGNOLA FRUTILLA LIMON SIN AZU SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129637",},
-  "BC LA CAMPAGNOLA NARANJA DULCE SIN AZU SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129965",},
-  "BC LA CAMPAGNOLA POMELO AMARILLO SIN AZU. SOB .7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129576",},
-  "BC LA CAMPAGNOLA SIN AZU ANANA SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129620",},
-  "BC LA CAMPAGNOLA SIN AZU LIMONADA SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129941",},
-  "BC LA CAMPAGNOLA SIN AZU MANZANA SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129972",},
-  "BC LA CAMPAGNOLA SIN AZU NAR/DUR SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129880",},
-  "BC LA CAMPAGNOLA SIN AZU NARANJA SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580132774",},
-  "BC LA CAMPAGNOLA SIN AZU. MANGO NARANJA SOB .7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129958",},
-  "BC LA CAMPAGNOLA SIN AZU. MIX FRUTAL SOB .7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129385",},
-  "BC LA CAMPAGNOLA SIN AZU. POMELO ROSADO SOB .7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129644",},
-  "BAGLEY AMOR DUL RELL 330GR C/3U PAQUETE AGR 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "AMOR", "ean": "7790040143500",},
-  "BAGLEY AMOR VAINILLA DULCE RELLENA 110GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "AMOR", "ean": "7790040143531",},
-  "BAGLEY SURTIDO DUL.SECA 400GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAGL SURT", "ean": "7790040147720",},
-  "ARCOR CEREAL MIX AVENA Y PASAS DUL.SECA PAQ. 207 G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040135741",},
-  "ARCOR CEREAL MIX DUL.SECA CACAO 150GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040140943",},
-  "ARCOR CEREAL MIX DUL.SECA FRUTILL 150GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040140936",},
-  "ARCOR CEREAL MIX FRUTILLA/CHIA DUL.SECA PAQ. 207 G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040135765",},
-  "ARCOR CEREAL MIX GALL DUL SECA 100GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040140912",},
-  "ARCOR CEREAL MIX GALL DUL SECA 100GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040140929",},
-  "ARCOR CEREAL MIX GALL.CM.AVE/CHOC 207GR 1UN PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040145023",},
-  "ARCOR CEREAL MIXAVE/SEM/CHIPS DUL.SECA 207 GR PAQ.": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040135758",},
-  "BAGLEY CHOCOLINAS BCO DUL SEC 245GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040142985",},
-  "BAGLEY CHOCOLINAS DUL.SECA PAQ.170G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040143227",},
-  "BAGLEY CHOCOLINAS DULCE SECA250 GRS. PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040143234",},
-  "BAGLEY CHOCOLINAS GALLET DUL.SEC PAQUETE 170G 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040148857",},
-  "BAGLEY CHOCOLINAS NEG DUL SEC. 258GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040142992",},
-  "BAGLEY GALL CHOCOLINAS DUL SEC 100GR PAQUE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040143241",},
-  "ARCOR COFLER BLOCK DULCE SECA PAQ. 124 GR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040116955",},
-  "ARCOR COFLER BOB GALL RELL 85GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143807",},
-  "ARCOR COFLER COOKIES DULCE SECA BOLSA 120 GR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040127944",},
-  "ARCOR COFLER GALL BANADA CHC 105.6G PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143739",},
-  "ARCOR COFLER GALL OBLEAS 87GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143821",},
-  "ARCOR COFLER GALL TARTAL.BAN CHC 105.6GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143753",},
-  "ARCOR COFLER GALL. BAN CHC 132.8GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143692",},
-  "ARCOR COFLER GALLET DULCE RELL 85GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143777",},
-  "ARCOR COFLER GALLET DULCE RELL 85GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143784",},
-  "ARCOR COFLER GALLETA DULCE OBLEA 91GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143814",},
-  "BAGLEY COQUITAS DULCE SECA 177GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COQUITAS", "ean": "7790040143258",},
-  "BAGLEY COQUITAS DULCE SECA 260GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COQUITAS", "ean": "7790040143265",},
-  "ARCOR DIVERSION SURTIDO DU.SE.REL. 400 GRBOLSA": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DIVERSION", "ean": "7790040143364",},
-  "ARCOR FORMIS ANIMALES DULCES SECAS 72 GRS PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139909",},
-  "ARCOR FORMIS C/D.DE LECHE DUL.RELL 72GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139916",},
-  "ARCOR FORMIS DDL DUL REL 102GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139961",},
-  "ARCOR FORMIS FRUTILLA DUL REL 102GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139923",},
-  "ARCOR FORMIS VAI/CHO DUL REL 102GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139930",},
-  "ARCOR FORMIS VAI/CHO DUL REL 102GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139978",},
-  "ARCOR FORMIS VAIN/FRUT DUL.RELL 72GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139893",},
-  "ARCOR MANA CHOC DUL SEC 136GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040137912",},
-  "ARCOR MANA CHOCOLATE DUL.RELLE.152 GR. PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040133242",},
-  "ARCOR MANA FRUTILLA DR 152 GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040133266",},
-  "ARCOR MANA LIMON DUL.RELLE.152 GR. PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040133259",},
-  "ARCOR MANA VAIN ACARAMELADA DS 145GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040151901",},
-  "ARCOR MANA VAIN DUL.SEC 136GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040137837",},
-  "ARCOR MANA VAIN DUL.SEC. 136GR PAQ 3U 408G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040137844",},
-  "ARCOR MANA VAINILLA DUL.RELLE.152 GR. PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040133235",},
-  "BAGLEY MELITAS C/MIEL DUL SEC 159GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELITAS", "ean": "7790040139770",},
-  "BAGLEY MELLIZAS DUCE .RELL. 110GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELLIZAS", "ean": "7790040143548",},
-  "BAGLEY MELLIZAS GALL DUL RELL 330GR 1U PAQ AGR X3": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELLIZAS", "ean": "7790040143555",},
-  "BAGLEY MERENGADAS DUL.REL. 88GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MERENGADA", "ean": "7790040139657",},
-  "BAGLEY MERENGADAS. DUL.REL. 88GR PAQ AGR 3U 264G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MERENGADA", "ean": "7790040139091",},
-  "ARCOR GALLETA OBLEA WF 25GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O ARCOR", "ean": "77940131",},
-  "ARCOR GALLETA OBLEA WF 25GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O ARCOR", "ean": "77975737",},
-  "ARCOR OBLEA RELL TURRON Y MANI 25GR PAQ 250G 10UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O ARCOR", "ean": "7790580401504",},
-  "BAGLEY OPERA OBLEA PAQUETE 55 GR ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OPERA", "ean": "77903501",},
-  "BAGLEY OPERA OBLEAS 220 GRS. PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OPERA", "ean": "7790040008175",},
-  "BAGLEY OPERA OBLEAS DUL.RELLE.92 GR PAQUE.ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OPERA", "ean": "77903518",},
-  "BAGLEY PORTENITAS D.S VAINILLA/CARAME PAQ. 139G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PORTENITAS", "ean": "7790040132689",},
-  "BAGLEY PORTENITAS D.SEC VAIN/CARAME PAQ AGR 417G 3X 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PORTENITAS", "ean": "7790040151192",},
-  "BAGLEY RUMBA DUL.RELL. 108GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "RUMBA", "ean": "7790040139268",},
-  "BAGLEY RUMBA GALL DUL.RELL. 110GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "RUMBA", "ean": "7790040143517",},
-  "BAGLEY RUMBA GALLET DUL.RELL. 330GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "RUMBA", "ean": "7790040143524",},
-  "BAGLEY SONRISAS DR 108 GRS PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SONRISAS", "ean": "7790040133488",},
-  "BAGLEY SONRISAS FRAM DL RELLE 108GR PACK X3 U 324 G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SONRISAS", "ean": "7790040133471",},
-  "ARCOR TORTITAS BLACK DUL.SECA 125 GRS. PAQUE.ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TORTITAS", "ean": "7790040676800",},
-  "ARCOR TORTITAS CHOCOLATE DUL.SECA 125 GRS. PAQUE.ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TORTITAS", "ean": "7790040677005",},
-  "BAGLEY CRIOLLITAS CRACKERS 100 GR C/U PAQ.X 3 U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040377806",},
-  "BAGLEY CRIOLLITAS ORIGINAL CR. 499G EST FAM 5X 1UN PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040139015",},
-  "BAGLEY CRIOLLITASORIGINAL CRACKERS 100 GR PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040377707",},
-  "BAGLEY CEREAL C/SALVADO 169GR 3U PAQ AGR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "FAM", "ean": "7790040136243",},
-  "BAGLEY SALVADO 169 GR PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "FAM", "ean": "7790040136250",},
-  "ARCOR HOGARENAS 7 SEMILLAS CEREAL 189GR PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040136069",},
-  "ARCOR HOGARENAS 7 SEMILLAS CEREAL 189GR X3U PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040136076",},
-  "ARCOR HOGARENAS C/SESAMO CEREAL 167 GR PAQUE.": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040136083",},
-  "ARCOR HOGARENAS MIX CEREAL 185GR C/U PAQ. X 3U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040136106",},
-  "ARCOR HOGARENAS SALVADO CEREAL 200 G.C/U PAQ.X 3 UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040132955",},
-  "ARCOR HOGARENAS SALVADO CEREAL 200 GRS. PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040132962",},
-  "ARCOR HOGARENAS. MIX CEREALES CEREAL 185 GR PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040136090",},
-  "BAGLEY KESITAS GALL SNACKS QUESO 250GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "KESITAS", "ean": "7790040144033",},
-  "BAGLEY KESITAS HORNEADAS SNACKS 125 GR CAJA": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "KESITAS", "ean": "7790040173200",},
-  "BAGLEY REX KESITAS SNACKS 75 GRBOLSA ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "KESITAS", "ean": "7790040003606",},
-  "BAGLEY REX ORIGINAL SNACK 225GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "REX", "ean": "7790040144125",},
-  "BAGLEY REX ORIGINAL SNACKS 125 GR CAJA": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "REX", "ean": "7790040719804",},
-  "BAGLEY REX ORIGINAL SNACKS BOL 75 GRARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "REX", "ean": "7790040003569",},
-  "ARCOR SALADIX CALABRESA SNACKS 100 GRS. CAJA ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790580716806",},
-  "ARCOR SALADIX CALABRESA SNACKS 30 GR BOLSA ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790580775407",},
-  "ARCOR SALADIX CHIPS FUEGO 60GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790040133846",},
-  "ARCOR SALADIX JAMON SNACKS 100 GRS. CAJA ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790580716707",},
-  "ARCOR SALADIX PIZZA SNACKS 100 GRS. CAJA": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790580697303",},
-  "ARCOR SALADIX PIZZA SNACKS 30 GR BOLSA ARG.": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790580387006",},
-  "SALADIX HORNEADO SN PICANTE 30GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790040147782",},
-  "SALADIX SALADIX SN PICANTE 100GR CAJA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790040141254",},
-  "SALADIX XTRA PICANTE SNACKS CAJA 100 GRS 1U ARCOR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790040147775",},
-  "BAGLEY GALL TRAVIATA ORIGINAL CR 324GR PAQ AGR 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040144088",},
-  "BAGLEY TRAVIATA C/REX GALL CRACKER 288GR X3 PAQ AGR 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040143920",},
-  "BAGLEY TRAVIATA CRACKERS 108GR 5U PAQUETE 540G PAQ AGR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040144095",},
-  "BAGLEY TRAVIATA GALL CR C/ REX SAL ORIG 1U PAQUETE 96GR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040143937",},
-  "BAGLEY TRAVIATA GALL CR KESIT 1U PAQUETE 96GR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040143944",},
-  "BAGLEY TRAVIATA SANDWICH CRACKERS 101 G.C/U PAQ.X 3 UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040872202",},
-  "BAGLEY TRAVIATA.CRACKERS 108GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040144071",},
-  "TRAVIATA BAGLEY BALANCE CR 321GR X3U PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040142763",},
-  "AGUILA ALFAJOR MINITORTA TRIPLE 69GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "AGUILA", "ean": "7790040133587",},
-  "AGUILA ALFAJOR.MINITORTA BROWNI 71.5GR TRPL PQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "AGUILA", "ean": "7790040133594",},
-  "BAGLEY ALFAJOR BLANCO TRIPLE 69GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BLCO/NGRO", "ean": "7790040133570",},
-  "BAGLEY B & N 3.0 ALFAJOR BLANCO 73.5 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BLCO/NGRO", "ean": "7790040991910",},
-  "BAGLEY B & N 3.0 ALFAJOR NEGRO 73.5 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BLCO/NGRO", "ean": "7790040375000",},
-  "BON O BON ALFAJORES MINI 19.5GR X6 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BON O BON", "ean": "7790040129764",},
-  "BON O BON BLANCO ALFAJOR 40 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BON O BON", "ean": "7790040613607",},
-  "BON O BON NEGRO ALFAJOR 40 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BON O BON", "ean": "7790040613706",},
-  "BON O BON NEGRO ALFAJOR 40 GRPAQ.X6 U.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BON O BON", "ean": "7790040613904",},
-  "BON O BON NEGRO ALFAJOR TRIPLE 60 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BON O BON", "ean": "7790040614000",},
-  "COFLER CHOCO CREAMY ALFAJOR TRIPLE 60GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCO CREAMY", "ean": "7790040150010",},
-  "CHOCOTORTA ALFAJOR TRIPLE 71.5GR PAQ 1UN BAGLEY": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOTORTA", "ean": "7790040150072",},
-  "COFLER ALFAJOR SPL MOUSSE 40GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "COFLER", "ean": "7790040143647",},
-  "COFLER BLOCK ALFAJOR SIMPLE 40.7GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "COFLER", "ean": "7790040143654",},
-  "COFLER BLOCK RELL.CHOC.ALF.TRIPLE 60 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "COFLER", "ean": "7790040659605",},
-  "COFLER BLOCK.ALFAJOR SIMPLE 40.7GR 6U PAQ 244.2G": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "COFLER", "ean": "7790040143630",},
-  "TATIN ALFAJOR NEGRO 33 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TATIN", "ean": "7790040331204",},
-  "TATIN ALFAJOR TRIPLE 60 GRARG": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TATIN", "ean": "7790040405608",},
-  "TOFI ALFAJOR NEGRO 46 GRPAQ.X6 U.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TOFI", "ean": "7790040117143",},
-  "TOFI NEGRO ALFAJOR 46 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TOFI", "ean": "7790040116610",},
-  "TOFI TRIPLE NEGRO ALFAJOR 73 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TOFI", "ean": "7790040484801",},
-  "AGUILA ALMENDRAS BAN C/CHOCOLAT 120GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "AGUILA", "ean": "7790580142384",},
-  "AGUILA ALMENDRAS CHOCOLATE 120GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "AGUILA", "ean": "7790580122119",},
-  "AGUILA BARRA MOUSSE BANADA160GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "AGUILA", "ean": "7790580131135",},
-  "AGUILA BARRA TRIFLE BANADA 160GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "AGUILA", "ean": "7790580131111",},
-  "AGUILA NUT OBLEA BANADA CHOC 105GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "AGUILA", "ean": "7790580147556",},
-  "AGUILA PASAS BAN CHOCOLATE 120G BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "AGUILA", "ean": "7790580142421",},
-  "ARCOR BV ALMENDRA BANADAS C/CHOCO. 120 GR BOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ARCOR", "ean": "7790580139438",},
-  "ARCOR CEREAL DE ARROZ BAN CHC 50GR BOL 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ARCOR", "ean": "7790580142414",},
-  "ARCOR MILK OBLE BANADA CHC 20GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ARCOR", "ean": "7790580144227",},
-  "ARCOR TURRON BANADO C/CHOCOLA.90 GR CAJA ARG": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ARCOR", "ean": "7790580392604",},
-  "ARCOR TWIT O BANADOS 20GR PAQ.1U REG.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ARCOR", "ean": "7790580132712",},
-  "BON O BON BLANCA OBLEA BANADA 30 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580346614",},
-  "BON O BON CUBANITOS RELLE.BAN.C/CHOCO. 78GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580146948",},
-  "BON O BON OBLEA BANADA C/CHOCO. 30 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580346515",},
-  "BON O BON POSTRE RELL. BANA.C/CHO 260 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580136352",},
-  "BON O BON XL OBLEA BAN.CHO.C/LEC. 45 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580109646",},
-  "BON O BON.TENTACION BARRA MANI/OBLEA 120 GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580141301",},
-  "COFLER ALMENDRAS BAN C/CHOCO 100GR BOL 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580141714",},
-  "COFLER ALMENDRAS BAN C/CHOCO C/LECH 100GR BOL 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580141721",},
-  "COFLER BLANCO OBLEA BAN TRPL C/CHOCLIN 110GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580142513",},
-  "COFLER BLOCK BARRA MANI BAN CHC 45GR 1U PAQUETE": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580143800",},
-  "COFLER BLOCK OBLEA BAN CHOCOMANI TRPL 110GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580141394",},
-  "COFLER CHOCOLINAS BAN. BARRA 110GR PAQ. 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580146856",},
-  "COFLER PASAS BANAD C/CHOCO. 100GR BOL 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580141707",},
-  "COFLER GRAFFITI OBLEA BAN.RELLENA C/CHO. 45 GRPAQ.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GRAFFITI", "ean": "7790580111755",},
-  "COFLER GRAFFITI OBLEA BANA RELL.45GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GRAFFITI", "ean": "7790580123741",},
-  "HAMLET HAMLETON OBLEA BANADA 28GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "HAMLET", "ean": "7790580137656",},
-  "ARCOR PASAS BAN.C/CHO. 100 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O ARCOR", "ean": "7790580135942",},
-  "ROCKLETS BARRA EXPLOTA O.BANADOS 44GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ROCKLETS", "ean": "7790580128548",},
-  "ROCKLETS BOLLS CEREAL BAN.C/CHO. 120 GRPAQ.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ROCKLETS", "ean": "7790580118235",},
-  "AGUILA D´OR FRUTOS SECOS BAN.CHOC.BOL 120GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "AGUILA", "ean": "7790580136420",},
-  "AGUILA MEDALLON CHOCOLATE 168GR 1U CAJA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "AGUILA", "ean": "7790580139872",},
-  "ARCOR BOMBONES SURTIDO ESP 223GR CAJA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ARCOR", "ean": "7790580138370",},
-  "ARCOR EL KIOSCO EN CASA 246GR CAJA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ARCOR", "ean": "7790580131371",},
-  "BON O BON BOMBON BLANCO 16 GR.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "77961815",},
-  "BON O BON BOMBON BLANCO CAJA X 30 450 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580119058",},
-  "BON O BON BOMBON CHC 15 GR CAJA 18UN 270G": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580119065",},
-  "BON O BON BOMBON CHOCO C/LECHE CAJA 270GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580146368",},
-  "BON O BON BOMBON LECHE DI 288 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580119157",},
-  "BON O BON BOMBON REGULAR 15 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "77958921",},
-  "BON O BON BOMBONES BOTA NAVIDAD 150GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580146924",},
-  "BON O BON NEGRO BOMBONES CAJA X 30 450 G": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580119133",},
-  "BON O BON REGULAR ED. ESP. BOLSA 15 GR C/U 7 U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580119164",},
-  "BON O BON SUPERBOLLS CHOC BCO POUCH 80 GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580135775",},
-  "BON O BON SURTIDO REGULAR BOMBONES CAJA 255 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580119126",},
-  "ROSPO SAPITO BOCADITO RE.CHOCOL. 10.5 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROSPO", "ean": "77928894",},
-  "ROSPO SAPITO BOCADITO REL.D.D.L. 10 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROSPO", "ean": "77928870",},
-  "ROSPO SAPITO BOCADITO RELL.MANI 10 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROSPO", "ean": "77912718",},
-  "ARCOR SAPITO D.DE LECHECAJA 10 GR X 24 U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "SAPITO", "ean": "7794612139106",},
-  "ARCOR SAPITO FRUTILLA CAJA 10 GR X 24 UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "SAPITO", "ean": "7794612129107",},
-  "ARCOR SAPITO RELLENO DE MANI CAJA 10 GR X 24 UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "SAPITO", "ean": "7794612127103",},
-  "ARCOR SELECCION BOMB SURTIDO 228.6GR CAJA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "SELECCION", "ean": "7790580131388",},
-  "ARCOR MANI BANADO MANI CH 35GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580128043",},
-  "ARCOR MANI COLOR CONF.C/CH. 80 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580106195",},
-  "ARCOR MANI CON CHOC. BLANCO 80GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580139223",},
-  "ARCOR MANI CON CHOCOLATE 80 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580106027",},
-  "ARCOR MANI CON CHOCOLATE BOLSA 100 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580136444",},
-  "ARCOR MANI.CROCANTE BAN.C/CHC 100GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580141738",},
-  "BON O BON CITOS CONFITADOSPOTE 200 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BON O BON", "ean": "7790580111243",},
-  "COFLER BLOCK MANI C/CHOC BCO 100GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "COFLER", "ean": "7790580139780",},
-  "COFLER BLOCK MANI C/CHOCOLATE 100GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "COFLER", "ean": "7790580139797",},
-  "COFLER BLOCK MANI CON CHOCOLATE 40 GRCAJA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "COFLER", "ean": "7790580110284",},
-  "ROCKLETS CONFIT CHC MOMIA BOLSA 40GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580151560",},
-  "ROCKLETS GRAGEAS C/CHOCOLATE 20 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580421007",},
-  "ROCKLETS GRAGEAS CHOCOLATE BOLSA 40 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580327415",},
-  "ROCKLETS HALLOWEEN CH CONF 120GR CAJA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580144876",},
-  "ROCKLETS LENTEJAS COLOR BOLSA 150 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580107635",},
-  "ROCKLETS MANI C/CHOCO. BOLSA 40 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580327613",},
-  "ROCKLETS MINI GRAGEAS DE CHOCOLATE PAQUETE 120 GRS": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580418106",},
-  "ROCKLETS NAVIDAD GRAGEAS C/CHOCO. 120 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580415808",},
-  "ROCKLETS NAVIDAD MANI CON CHOCOLATE 120 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580423001",},
-  "ARCOR SAPITO GRAGEAS C/CHOCO. 15 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "SAPITO", "ean": "7790580404314",},
-  "ARCOR MILK C/SORP HUEVO PAQUETE 22 GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "ARCOR", "ean": "7790580133573",},
-  "COFLER BLOCK HUEVO DE CHOCOLATE 25 GRPAS/NAV.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "COFLER", "ean": "7790580195007",},
-  "ARCOR SAPITO FIGURA DE CHOC 10GR 1U PAQUETE": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "SAPITO", "ean": "77990358",},
-  "AGUILA EXTRA FINO CHC P/REPOST. 150GR TAB 1U PAQUETE": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "AGUILA", "ean": "7790580109882",},
-  "ARCOR 50 CACAO TABLETA SOLIDA 25 GR PAQ.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580120092",},
-  "ARCOR BLANCO TAB.SOLIDA 25 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580607418",},
-  "ARCOR C/LECHE TAB.SOLIDA 25 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580607210",},
-  "ARCOR CHOCOLATE LECHE Y MANI 25 GRS PAQUETE": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580124960",},
-  "ARCOR CHOCOLATIN C/LECHE TAB.SOLIDA 8 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "77958563",},
-  "ARCOR DUO SOLIDAS 95GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580133795",},
-  "ARCOR MILK RELLE. 12GR PAQUETE 1U 35% LECHE": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "77977991",},
-  "ARCOR MILK RELLENA CHC 12GR PAQUETE 4UN 48G": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580135140",},
-  "ARCOR SOLIDAS 95GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580133634",},
-  "ARCOR SOLIDAS C/LECHE Y MANI 95GR 1U PAQ": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580133740",},
-  "ARCOR TABLETA SOLIDAS 50% CACAO 95GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580133771",},
-  "BON O BON TABLETA CHC RELLENA 160GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "BON O BON", "ean": "7790580146047",},
-  "COFFLER AIR BLANCO TAB.AIREA. 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103415",},
-  "COFFLER AIR C/LECHE TAB.AIREA. 100 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103446",},
-  "COFLER AIR BLANCO TAB.AIREA. 100 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103453",},
-  "COFLER AIR BLANCO TAB.AIREA. 27 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103378",},
-  "COFLER AIR BLANCO TAB.AIREA. 27 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103385",},
-  "COFLER AIR C/ALMENDR.TAB.AIREA. 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103439",},
-  "COFLER AIR CHO.C/LEC.TAB.AIREA. 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580033408",},
-  "COFLER AIR CHOCO. C/ALMENDRAS 100 GRTAB.AIREA.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103477",},
-  "COFLER AIR CHOCOLATE MIXTO 100 GRTAB.AIREA.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103460",},
-  "COFLER AIR LECHE TAB.AIREA. 27 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103361",},
-  "COFLER AIR MIXTO TAB.AIREA. 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103422",},
-  "COFLER AIREADO BON O BON TAB AIREA 30GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580127145",},
-  "COFLER BLOCK 300 C/LECHE Y MANI 300 GRTAB.SOLIDA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103743",},
-  "COFLER BLOCK BCO C/MANI TAB.SOLIDA 38 GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "77981912",},
-  "COFLER BLOCK C/MANI TAB.SOLIDA 170 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580105013",},
-  "COFLER BLOCK C/MANI TAB.SOLIDA 38 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "77953124",},
-  "COFLER BLOCK TAB.SOLIDA 110 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "77922120",},
-  "COFLER C/CHOCOLINAS SOLIDAS 55GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103538",},
-  "COFLER C/LECHE MANI TAB.SOLIDA 170GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580132750",},
-  "COFLER C/LECHE TAB.SOLIDA 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103484",},
-  "COFLER C/LECHE Y ALMENDRAS TAB.SOLIDA 140GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580128234",},
-  "COFLER C/LECHE Y ALMENDRAS TAB.SOLIDA 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580033507",},
-  "COFLER CHOCOLINAS TABL BLANCO 140GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580127336",},
-  "COFLER DULCE DE LECHE RELLENAS 38GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580132958",},
-  "COFLER LECHE SOLIDAS 18GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "77971685",},
-  "COFLER RELL AVELLANA TABLETA 35 GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580146016",},
-  "COFLER ROCKLETS TAB.SOLIDA 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103521",},
-  "COFLER ROCKLETS TABL SOL 140GR 1UN PAQUETE": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580146092",},
-  "COFLER TABL.LECHE COFLER 140GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580127947",},
-  "COFLER TABLETA CHC 60%CACAO SOLIDA 100GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580141776",},
-  "COFLER TABLETA CHC SOLIDA 100GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580141752",},
-  "COFLER TABLETA CHC SOLIDA C/AVE 140GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580144005",},
-  "COFLER TRES PLACERES CH.AMA.BL.LEC. 55 GRTAB.SOLIDA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580106560",},
-  "HAMLET BLANCO COOKIES SOLIDA 46GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HAMLET", "ean": "7794612066310",},
-  "HAMLET CHOCOLATO-SO LECHE C/CHOCO.Y CERE.43 GRTAB.RELLE.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HAMLET", "ean": "7794612066211",},
-  "HAMLET LECHE MANI ALMENDRA CEREAL 45 GRTAB.SOLIDA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HAMLET", "ean": "7794612065719",},
-  "HAMLET SOLIDAS LECH Y COOK 43GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HAMLET", "ean": "7794612065917",},
-  "HAMLET YOGUR FRUTILLA TAB.RELLE. 43 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HAMLET", "ean": "7794612066419",},
-  "ARCOR ROCKLETON TAB.SOL REG. 13.5 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O ARCOR", "ean": "77961471",},
-  "COFLER ROCKLETS SOLIDAS 18 PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ROCKLETS", "ean": "77987112",},
-  "TOP LINE DIETETICO 6.7 GR SANDIA 4 TABL.PAQ.": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77919489",},
-  "TOP LINE S/AZUCAR 6.7 GR DEFENSE 4 TABL.PAQ.": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77916419",},
-  "TOP LINE S/AZUCAR 6.7 GR FRUTA 4 TABL.PAQ.": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77916389",},
-  "TOP LINE S/AZUCAR 6.7 GR MENTA 4 TABL.PAQ.": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77916426",},
-  "TOP LINE S/AZUCAR 6.7 GR STRONG 4 TABL.PAQ.": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77916396",},
-  "TOP LINE S/AZUCAR SEVEN 14 GR ATOMIC STRO.7 TABL.PAQ": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77939753",},
-  "TOP LINE S/AZUCAR SEVEN 14 GR SANDIA 7 TABL.PAQ.": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77948588",},
-  "TOP LINE S/AZUCAR SEVEN 14 GR STRAWBERRY 7 TABL.PAQ.": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77951113",},
-  "TOP LINE S/AZUCAR SEVEN 14 GR VIOLET CHERRY 7 TABL.PAQ.": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77948496",},
-  "TOP LINE S/AZUCAR SEVEN 14 GR XPLO.MINT 7 TABL.PAQ": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77931764",},
-  "TOP LINE SEVEN FREZZING MENTOL 7CH. TABL. ADU. PQ. 14GR 1UN": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77964137",},
-  "TOP LINE SEVEN TURBO MINT 20 CHI.CONF. ADU. 2.5G C/U PT 50GR": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580138547",},
-  "TOP LINE SEVEN ULTRA GREEN MINT 12TABL. ADU. PQ. 24GR 1UN": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580120702",},
-  "TOP LINE SEVEN ULTRA S/AZUCAR DIET 12U.TABL 24 GR CAJA": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580120573",},
-  "TOP LINE SEVEN ULTRA TAB. DIET DOBLE CAPA 12U. 24 GR CAJA": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580121013",},
-  "TOPLINE SEVEN BUBLE FUN 7CHI. TABL. ADU. PQ. 14GR 1UN": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77983794",},
-  "TOPLINE SEVEN CONFITADO 10P. TURBO MINT ADU. CJ.25GR 1UN": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580146818",},
-  "TOPLINE SEVEN TURBO MINT CHI.CONF. ADU. PQ. 2.5GR 1UN": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77986771",},
-  "TOPLINE SEVEN ULTRA CITRUS BLUEBERRY 12TAB. ADU CJ.24GR 1UN": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580137076",},
-  "CLIGHT DIET LIMONADA MARACUYA SOBRE 7.5 P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201733834",},
-  "CLIGHT ED LIM POMELADA HIBISCUS SIN AZUCARES SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622202359934",},
-  "CLIGHT LIMONADA ARANDANOS DIET SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622202236846",},
-  "CLIGHT LIMONADA ROSA S/AZUCARES SOBRE 7.5G P/1 L.": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201682026",},
-  "CLIGHT NAR/DUR S/A VITC+D SOBRE 7.5G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201702717",},
-  "CLIGHT POLVO ANANA SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201702625",},
-  "CLIGHT POLVO DIET MANZANA DELI. SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703080",},
-  "CLIGHT POLVO NARA MANGO DIET SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201702687",},
-  "CLIGHT POLVO PERA SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703202",},
-  "CLIGHT POLVO S/A LIMONADA VITC+D SOBRE 8GR P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201702656",},
-  "CLIGHT POLVO S/A MANDARINA SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201704148",},
-  "CLIGHT POLVO S/A NARANJA VIT CY D SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703110",},
-  "CLIGHT POLVO STEVIA NARANJA SOB. 9.5GR P/1LT": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201704551",},
-  "CLIGHT PVO S/A MANZANA VERDE SOBRE 7.5GR P/1LT": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703059",},
-  "CLIGHT PVO S/A NARANJA DULCE VIT C Y D SOBRE 7.5G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703141",},
-  "CLIGHT PVO S/A POMELO AMARILLO VIT C Y D SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703233",},
-  "CLIGHT PVO S/A POMELO ROSADO VIT C Y D SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703172",},
-  "CLIGHT STEVIA POLVO LIMONADA SOB 7.5G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201704582",},
-  "TANG BALANCE POLVO NARANJADA S/ENDULZAR SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622202012129",},
-  "TANG GALACTICO ED. LIM POLVO FRUTAL REG SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622202311482",},
-  "TANG MIX NAR/MARA/FRUT BAJAS CALORIAS SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201746063",},
-  "TANG POLV POM ROSADO REG SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735746",},
-  "TANG POLVO PERA REG SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201745738",},
-  "TANG POLVO REG ANANA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201745967",},
-  "TANG POLVO REG DURAZNO SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201745936",},
-  "TANG POLVO REG FRUTILLA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201746490",},
-  "TANG POLVO REG LIMONADA DULCE SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735685",},
-  "TANG POLVO REG MANDARINA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201733865",},
-  "TANG POLVO REG MANZANA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201705992",},
-  "TANG POLVO REG MULTIFRUTA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735715",},
-  "TANG POLVO REG NAR/DURAZNO SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201745707",},
-  "TANG POLVO REG NARA/BANANA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735777",},
-  "TANG POLVO REG NARA/MANGO SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735371",},
-  "TANG POLVO REG NARANJA DULCE SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735340",},
-  "TANG POLVO REG NARANJA LIMA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201746018",},
-  "TANG POLVO REG NARANJA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201705961",},
-  "TANG POLVO REG UVA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201746117",},
-  "VERAO POLVO ANANA REG SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "VERAO", "ean": "7622201717506",},
-  "VERAO POLVO MANZANA REG SOB. 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "VERAO", "ean": "7622201717445",},
-  "VERAO POLVO NAR/DURAZNO REG SOB. 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "VERAO", "ean": "7622201717476",},
-  "VERAO POLVO NARANJA REG SOB. 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "VERAO", "ean": "7622201717414",},
-  "MONDELEZ CEREALITAS CACAO D.S. 170GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREALITAS", "ean": "7622202241505",},
-  "MONDELEZ CEREALITAS GRANOLA D.S. 170GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREALITAS", "ean": "7622202241567",},
-  "MDLZ TERRABUSI.DUQUESA GALL DUL. REL 115GR PAQ 3U 345GR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DUQUESA", "ean": "7622202218729",},
-  "MONDELEZ TERRABUSI DUQUESA DUL.RELLE. 115 GRPAQUETE": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DUQUESA", "ean": "7622300742645",},
-  "MONDELEZ TERRABUSI MELBA DUL.RELLE. 120 GRPAQUETE": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELBA", "ean": "7622300829728",},
-  "TERRABUSI MELBA ANGRY BIRDS DU.REL.PAQ.120GR C/UPACK X 3 U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELBA", "ean": "7794600004539",},
-  "MONDELEZ INTL.MILKA GALL. REL C/MOUS 124GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MILKA", "ean": "7622202210051",},
-  "MONDELEZ INTL.MILKA GALL. REL C/MOUS 124GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MILKA", "ean": "7622202210075",},
-  "MONDELEZ OREO CHOCOLATE. DUL.RELLE. PAQ 118GR 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202049033",},
-  "MONDELEZ OREO D.R. 118GR 3U 354G PQ AGR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201735258",},
-  "MONDELEZ OREO D.R. 118GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201735296",},
-  "MONDELEZ OREO DUL.REL. 182.5GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201735821",},
-  "MONDELEZ OREO DUL.RELLE.PAQ 118GR 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201735272",},
-  "MONDELEZ OREO GALLETAS DR 258GR PAQ AGR 1UN X4": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202317187",},
-  "MONDELEZ OREO GALLETAS FRUT/CACAO DUL RELL 118GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202049057",},
-  "MONDELEZ OREO GOLDEN GAL DUL REL 354GR PAQ AGR X3 118G 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201806538",},
-  "MONDELEZ OREO MINI DUL.RELLE 50GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201761288",},
-  "MONDELEZ OREO MINI. GALLETAS DUL RELL 150 BOL 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202219337",},
-  "MONDELEZ OREO SIN GLUTEN GALL DR 95GR PAQUETE 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202038099",},
-  "MONDELEZ OREO VAINILLA GOLDEN 118GR PAQ.DU.RE 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201806552",},
-  "OREO BAADAS. CHOCOLATE BSA 119GR 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201740368",},
-  "OREO BANADAS CHC MILKA BCO BSA 119GR 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201745608",},
-  "OREO BANADAS CHOCOLATE 119GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201740375",},
-  "OREO BANADAS CHOCOLATE BCO BSA 119GR 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201745615",},
-  "MONDELEZ PEPITOS C/CHISPAS DS 119 GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PEPITOS", "ean": "7622201735906",},
-  "MONDELEZ PEPITOS MINI. DULCE SECA 50GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PEPITOS", "ean": "7622201740399",},
-  "MONDELEZ PEPITOS. DU. SEC 119GR 3UN 357G PAQ AGR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PEPITOS", "ean": "7622201735883",},
-  "MODELEZ TERRABUSI ANILLOS D. S. 170GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201808884",},
-  "MONDELEZ LINCOLN ANGRY.BIRD DUL SEC 153GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201745523",},
-  "MONDELEZ LINCOLN CHOCOLATE DUL.SECA 153 GR PAQUETE": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622300742676",},
-  "MONDELEZ LINCOLN CLASICA DUL. SEC 219GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201735319",},
-  "MONDELEZ LINCOLN CLASICAS DUL SEC 153GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201386719",},
-  "MONDELEZ TERRABUSI ANILLOS CLASIC 300GR BOL.DU.SE.": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201504007",},
-  "MONDELEZ TERRABUSI BOCA DE DAMA D.S. 170GR BOL": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201808860",},
-  "MONDELEZ TERRABUSI C/CHIPS 144GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201385279",},
-  "MONDELEZ TERRABUSI MANON DULC. SECA 182GR PAQ. 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201385255",},
-  "MONDELEZ TERRABUSI MIEL GALLE DUL.SEC 120GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622202220579",},
-  "MONDELEZ TERRABUSI SCONS DUL SEC 160GR BOLSA": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201491611",},
-  "MONDELEZ TERRABUSI VAINILLA GALL DUL.SEC 120GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622202220555",},
-  "MONDELEZ TERRABUSI VARIED.MIX DU.SE. 590GR BOL": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201745585",},
-  "MONDELEZ.TERRABUSI VARIED.MIX DU.SE. 390GR BOL": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201745561",},
-  "TERRABUSI HABANITOS GALLETITA BAN.C/CHO. 60GRBOLSA": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622300335076",},
-  "TERRABUSI LINCOLN CLASICA. D.S. 3U 153GR PQ AGR 459G": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201745547",},
-  "TERRABUSI VARIEDAD CHC DUL.SEC 300GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201503987",},
-  "TERRABUSI VARIEDAD DORADA DUL.SEC 300GR BOL 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201503963",},
-  "MONDELEZ CEREALITA CLASICA INT 212GR PAQ 3U 636G": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201745905",},
-  "MONDELEZ CEREALITA CLASICAS INTEG 212GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201736033",},
-  "MONDELEZ CEREALITAS SALV CER 208GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201745981",},
-  "MONDELEZ CEREALITAS SALVA. CER 208GR 3U 624GR PAQ AGR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201746032",},
-  "MONDELEZ CEREALITASTOST.DE ARROZ 160 GRPAQ.CEREAL": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201753061",},
-  "MONDELEZ CLUB SOCIAL ORIG. CR PQ. 24GR 6UN 1X 144G PQ AGR,": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CLUB SOCIAL", "ean": "7622202293733",},
-  "MONDELEZ INTL CLUB SOCIAL JAMON 23.5 GR X6U PQ AGR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CLUB SOCIAL", "ean": "7622210691835",},
-  "TERRABUSI EXPRESS CLASC CR 103GR PAQ AGR 3U 309GR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "EXPRESS", "ean": "7622201388485",},
-  "TERRABUSI EXPRESS CLASICA CRACKER 103GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "EXPRESS", "ean": "7622201388461",},
-  "MILKA ALFAJOR TRIPLE 70 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "77903778",},
-  "MILKA MINI ALFAJORES MOUSSE SPL 19GR 6U BOLSA 114G": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622202220074",},
-  "MILKA MOUSSE LECHE 42 GRPAQ.X 6 U.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622300759490",},
-  "MILKA MOUSSE LECHE ALFAJOR 42 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622300759506",},
-  "MILKA MOUSSE TRIPLE ALFAJOR 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "77903785",},
-  "MILKA MOUSSE TRIPLE BLANCO ALF. 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622300457303",},
-  "MILKA TORTA OREO ALF.TRIPLE 61 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622300835620",},
-  "OREO ALFAJOR TRIPLE. 56GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "OREO", "ean": "77976307",},
-  "PEPITOS CON CHIPS Y MOUSSE TRIPLE PAQUETE 57 GR UN.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "PEPITOS", "ean": "77915481",},
-  "SHOT ALFAJOR MANI BAN CHC SIMPLE 44GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "SHOT", "ean": "7622202304705",},
-  "SHOT ALFAJOR MINI SIMPLE 19GR BOLSA 6UN 114G": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "SHOT", "ean": "7622202223372",},
-  "SHOT ALFAJOR TRIPLE 60 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "SHOT", "ean": "77956699",},
-  "TERRABUSI ALFAJOR 50 GRPAQ. X6 U.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "7622300742584",},
-  "TERRABUSI ALFAJOR CHOCOLATE 50 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "77939234",},
-  "TERRABUSI ALFAJOR S/GLUT SPL BAN CHC 55GR PAQ 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "7622202296291",},
-  "TERRABUSI X 3 DCE.DE LE.ALFAJOR 70 GRTRIPLE": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "77903792",},
-  "TERRABUSI X 3 TORTA ALFAJOR 70 GRTRIPLE": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "77903860",},
-  "TITA NEGRO ALFAJOR RELL.LIMON 36 GRARG": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TITA", "ean": "77908308",},
-  "MILKA BIS OBLEA RELL.CUB.CHOCO. 105.6GR X 16U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "MILKA", "ean": "7622210788207",},
-  "MILKA BIS OREO PAQ. 105.6 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "MILKA", "ean": "7622210719829",},
-  "MILKA CHOCO PAUSE.OREO OBLEA BAN.CHC 45GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "MILKA", "ean": "7622201492465",},
-  "MILKA CHOCO PAUSE OBLEA BAN.CHO.C/LEC.RELL.45 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "MILKA CHOCO PAUSE", "ean": "7622201492717",},
-  "RHODESIA MINI OBLEAS 60 GRBOLSA": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "RHODESIA", "ean": "7622300335090",},
-  "RHODESIA OBLEA BAN.C/CHO. 22 GRBOLSA": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "RHODESIA", "ean": "77995681",},
-  "RHODESIA OBLEA BANADA 22 GRPAQ.X4 U.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "RHODESIA", "ean": "7622300742935",},
-  "RHODESIA OBLEA RELL. LIMON BAÑ. 22 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "RHODESIA", "ean": "7622201142223",},
-  "TITA GALLE.BAN. 18 GRPAQ. X 5 U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "TITA", "ean": "7622201803285",},
-  "TITA O BANADOS 19GR PAQ 1U REGULAR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "TITA", "ean": "77976291",},
-  "MILKA OREO BOMBON 19G BOLSA 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "MILKA", "ean": "77971630",},
-  "MILKA OREO BOMBON CHC 19GR 13U CAJA 1UN 247G": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "MILKA", "ean": "7622202399107",},
-  "MILKA HUEVO LECHE 22GR 1U S/SORP PAS": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "MILKA", "ean": "77981325",},
-  "CADBURY C/YOGHURT. NUEZ TAB. RELL.29GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818654",},
-  "CADBURY CHOCOLATE CON ALMENDRAS X82GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201807405",},
-  "CADBURY INTENSE 50% CACAO 25GR TAB.SOLIDA 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818609",},
-  "CADBURY INTENSE SOLIDAS 50% CACAO PAQ 162GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201800505",},
-  "CADBURY TRES SUENOS.TAB. SOLIDA 82GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818739",},
-  "CADBURY TRES.SUENOS. 25GR TAB.SOLIDA 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818579",},
-  "CADBURY YOGHURT FRUTILLA RELL 82 GRS PAQUETE 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818715",},
-  "CADBURY YOGURTH TABL RELL FRUTILLA PAQ 162GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818692",},
-  "MILKA . TAB CHC SOLIDA 20GRS PAQUETE 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210795625",},
-  "MILKA ALMENDRA TABLETA RELLENA 55 GR PAQ.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210745620",},
-  "MILKA ALMENDRAS TAB.SOLIDA 155 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300990152",},
-  "MILKA BLANCO C/D.D.LEC.TAB.RELLE. 67.5 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300844967",},
-  "MILKA C/LECHE TAB.SOLIDA 150 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300990114",},
-  "MILKA CARAMELO Y AVELLANATAB.SOLIDA 300 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300134532",},
-  "MILKA CASTANA TAB. SOLIDA 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210745293",},
-  "MILKA CASTANAS C/CARAMELOTAB.SOLIDA 155 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300990183",},
-  "MILKA CHOCO.C/LECHE TAB.SOLIDA 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202328947",},
-  "MILKA CHOCOLATE C/DULCE DE LECHE 67.5 GRTAB.RELLE.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300844943",},
-  "MILKA COOKIESTABLETA CHC SOLIDA 100GR PAQ 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201424848",},
-  "MILKA LEGER COMBINADO TAB AIREA. LECHE 110GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201812775",},
-  "MILKA LEGER COMBINADO TAB.AIREA. LECHE 50GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201818951",},
-  "MILKA LEGER LECHE CON ALMENDRAS TAB AIREA. LECHE 110GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201812805",},
-  "MILKA LEGER LECHE TAB AIREA. LECHE 110GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201812744",},
-  "MILKA LEGER TAB.AIREA. LECHE 50GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201818937",},
-  "MILKA LEGER TAB.AIREA. LECHE CON ALMENDRAS 50GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201818975",},
-  "MILKA LILA GO OREO PAQ. 37 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210828606",},
-  "MILKA MMMAX BUBBLY TAB AIREADO 250GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300757717",},
-  "MILKA NEGRO C/D.D.LEC.TAB.RELLE. 135 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300846565",},
-  "MILKA OREO C/GALLET. TAB.SOLIDA 100 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300631574",},
-  "MILKA OREO CH.BLANCO TAB.SOLIDA 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210745132",},
-  "MILKA OREO CHOCOLATE BLANCO 155 GRTAB.SOLIDA": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300990213",},
-  "MILKA OREO TAB. SOLIDA 20GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210795908",},
-  "MILKA OREO TABLETA RELLENA 300GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210277503",},
-  "MILKA STRAWB CHEESECAK TAB.RELL 300GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210678171",},
-  "MILKA SWING TAB.SOLIDA 300 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "9012200872739",},
-  "MILKA TAB CHC AIREADA C.LECHE 25GR 1UN PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202322150",},
-  "MILKA TAB CHC AIREADA COMBINADO 25GR 1UN PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202322181",},
-  "MILKA TABLETA CHC RELLENA 29GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202322068",},
-  "MILKA TABLETA CHC RELLENA 29GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202322129",},
-  "MILKA TABLETA DE CHOCOLATE BLANCO 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210745583",},
-  "SHOT BLOQUE TAB.SOLIDA 35 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SHOT", "ean": "77914217",},
-  "SHOT C/LECHE Y MANI TAB.SOLIDA 170 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SHOT", "ean": "7622300424084",},
-  "SHOT C/MANI TAB.SOLIDA 90 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SHOT", "ean": "7622202333255",},
-  "SHOT C/MANI TAB.SOLIDA 90 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SHOT", "ean": "7791249451656",},
-  "SHOT CHOCOLAE C/MANI TAB.SOLIDA 35 GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SHOT", "ean": "77983992",},
-  "TOBLERONE TAB.SOLIDA 100 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TOBLERONE", "ean": "7614500010013",},
-  "BELDENT CHI. TABLETA ADU. S/AZ. 6 CHI. PQ. 10GR 1UN": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969101",},
-  "BELDENT FRESH SPARKS SANDIA 6CHI.TABL. ADU. PQ. 10GR 1UN": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77987686",},
-  "BELDENT FRUT.-LIMA RELL. CH.CONF. X28PZ. POTE 54GR 1UN": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622202012037",},
-  "BELDENT FRUTILLA S/AZ. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969118",},
-  "BELDENT INFINIT 7 BLUEBERRY CHIC. TABL. CJ. 13.3GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201448325",},
-  "BELDENT INFINIT CITRUS 7 CHIC. TABL. CJ. 13.3GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201448288",},
-  "BELDENT INFINIT CITRUS CHI. 14 TABL. DIET CJ. 26.6GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201457426",},
-  "BELDENT INFINIT MENTA 7U PQ. 13.3GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201421496",},
-  "BELDENT INFINIT MENTA DIET 14 TABL. CJ. 26.6GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201457334",},
-  "BELDENT INFINIT SPEARMINT 14 TABL. CJ. 26.6 GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201457396",},
-  "BELDENT INFINIT SPEARMINT 7 TABL. CJ. 13.3 GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201448226",},
-  "BELDENT INFINITE 14 CHI. TABL. BLUEBERRY MINT DIET CJ.26.6GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201457457",},
-  "BELDENT MANDARINA FRESH SPARKS ADU. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77981844",},
-  "BELDENT MENTA FUERTE S/AZ. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969088",},
-  "BELDENT MENTA FUERTE S/AZUCAR 6 TABLETAS PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201149208",},
-  "BELDENT MENTA S/AZ. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969071",},
-  "BELDENT MENTOL S/AZ. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969095",},
-  "BELDENT TROP. FRESH SPARKS 6 TABL. ADU. PQ. 10GR 1UN": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622202273131",},
-  "RINDE DOS ANANA BAJAS CAL SOBRE 13G P/2LT": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908401588",},
-  "RINDE DOS LIMON DIET SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908401540",},
-  "RINDE DOS MIX FRUTAL POLVO BAJAS CAL. SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908400536",},
-  "RINDE DOS NAR/MANGO POLVO BAJAS CAL SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908404152",},
-  "RINDE DOS PERA POLVO BAJAS CAL. SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908401847",},
-  "RINDE DOS POLVO DIET NARANJA SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908400529",},
-  "RINDE DOS POLVO DURAZNO BAJAS CAL. SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908400543",},
-  "RINDE DOS POLVO FRUTILLA DIET SOBRE 13G P/2LT": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908401526",},
-  "RINDE DOS POLVO MANZANA DIET SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908400567",},
-  "RINDE DOS POLVO NAR/BANA BAJAS CAL. SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908400987",},
-  "RINDE DOS POLVO NARANJA DURAZNO BAJAS CAL. SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908404169",},
-  "RINDE DOS POLVO POMELO ROSADO DIET SOBRE 13G P/2LT": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908402578",},
-  "9 DE ORO ANILLITOS DUL.SEC VAINILLA DUL.SEC.BOL120G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180136602",},
-  "9 DE ORO ANILLITOS DUL.SEC.CHOCO DUL.SEC.BOL120G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180136626",},
-  "9 DE ORO ANILLITOS DUL.SEC.COCO BOL120G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180136619",},
-  "9 DE ORO ANILLITOS DULCE.SECA VAIN BOL180G 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180143464",},
-  "9 DE ORO OBLEAS CHOCO/NARA DUL.RELL. PAQUETE 100 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180133274",},
-  "9 DE ORO PEPAS MEMBRILLO INTEG. PAQ.140GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180143266",},
-  "M CANUELAS 9 DE ORO COOKIE C/CHIP 120GR PAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180138491",},
-  "M CANUELAS 9 DE ORO COOKIE C/CHIP 120GR PAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180138507",},
-  "M.CANUELAS 9 DE ORO AVENA C/MIEL DU.SE. 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180130761",},
-  "M.CANUELAS 9 DE ORO AVENA C/PASAS DU.SE. 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180130754",},
-  "M.CANUELAS 9 DE ORO OBLEAS FRUTILLA DUL. RELL. PAQ. 100GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180132994",},
-  "M.CANUELAS 9 DE ORO PEPAS DU.SE. 350GR BOL.1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180143280",},
-  "M.CANUELAS 9 DE ORO SCONS LIMON DULCE SECA 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180009524",},
-  "M.CANUELAS BRIG.9DE ORO VAINDULC. RELL LIM BOL.120GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180137111",},
-  "M.CANUELAS BRIGITTE 9 DE ORO CHOC/LIM DU.RELL.BOL 160 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180132703",},
-  "M.CANUELAS BRIGITTE 9 DE ORO DUL. RELL.CHOC. BOL. 160 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180132697",},
-  "M.CANUELAS BRIGITTE 9 DE ORO DUL. RELL.CHOC. BOL. 160 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180132710",},
-  "M.CANUELAS BRIGITTE 9 DE ORO DUL. RELL.LIMON BOL. 160 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180132680",},
-  "M.CANUELAS9 DE ORO BIZ CARA SUCIA DULC SECA 200GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180143587",},
-  "M.CANUELAS9 DE ORO BIZC.AGRI.DULCE SECA 215 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180139726",},
-  "M.CANUELAS9 DE ORO BIZC.AZUC.DULCE SECA 210 GRSPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792200000319",},
-  "M.CANUELAS9 DE ORO CUAD.AGRI.DULCE SECA 200 GRBOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792200000128",},
-  "M.CANUELAS9 DE ORO SCONCITOS DULCE SECAPAQ.200 GRARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792200000791",},
-  "BAUDUCCO GALL. DUL SEC COOK C/CHIPS 60GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962071152",},
-  "BAUDUCCO GALL. DUL SEC COOK C/CHIPS 60GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962071169",},
-  "BAUDUCCO WAFER OBLEAS CHOCOLATE 78 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962058399",},
-  "BAUDUCCO WAFER OBLEAS FRUTILLA 78 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962058405",},
-  "BIMBO DULCE SECA VAINILLAS148 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BIMBO", "ean": "7793890258639",},
-  "BIMBO VAINILLAS DULCE SECA 74GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BIMBO", "ean": "7793890258684",},
-  "BIMBO VAINILLAS GALL. DUL.SECA 444GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BIMBO", "ean": "7793890258646",},
-  "BONAFIDE DONUTS BAN.C/CHO 78GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BONAFIDE", "ean": "7792360096818",},
-  "BONAFIDE DONUTS BAN.C/CHO 78GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BONAFIDE", "ean": "7792360096825",},
-  "BONAFIDE DONUTS.BAN.C/CHO 40GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BONAFIDE", "ean": "7792360097006",},
-  "BRIOSH VAINILLAS DULCE SECA 148GR. PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BRIOSH", "ean": "7793890258592",},
-  "CAPRI BISCUITS VAIN DULCE SECA 105GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CAPRI", "ean": "7793450000999",},
-  "CHOCMAN BIZCOCHUELO BAN CHC 68GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCMAN", "ean": "7792360096658",},
-  "CHOCMAN BIZCOCHUELO COCO BAN CHC 35GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCMAN", "ean": "7792360097075",},
-  "CHOCMAN BLACK BIZCOCHUELO BAN CHC 35GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCMAN", "ean": "7792360096597",},
-  "CHOCMAN MINITORTA RELLENA C/D.D.LECHE 35 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCMAN", "ean": "7792360096634",},
-  "DIELO FANTOCHE ESPUMITA DULCE SECA 300 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DF ESPUM", "ean": "7791672000735",},
-  "CACHAFAZ INTEGRAL AVE.MIEL DULC SEC 170 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128002145",},
-  "CACHAFAZ INTEGRAL AVE.PASA DE UVA D.S. 225 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128000677",},
-  "CACHAFAZ INTEGRAL AVEN.C/CHIP.CHOC.D.S. 225 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128000691",},
-  "CACHAFAZ INTEGRAL GRAN.C/AVENA/ALM/MANI 225 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128000707",},
-  "CACHAFAZ INTEGRAL HAR.INT.ALGARRO.D.S. 225 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128000684",},
-  "CACHAFAZ ORGANICAS AVENA&MIEL DUL.SECA PAQ.170GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128002138",},
-  "DONLEY FACHITAS MINI TAPITDULCE SECA400 GRS. PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7790369000089",},
-  "FACHITAS CORONITAS CEREAL AVENA/CHIPS DUL.SEC BOLSA 140GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7790369008023",},
-  "FACHITAS CORONITAS CEREAL C/AVENA&PASAS DUL.SEC BOLSA 140GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7790369008016",},
-  "FACHITAS MINI CORONITAS FRUT.DUL.SECA 140 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7790369007828",},
-  "FACHITAS MINI TAPITAS DULCE SECA 200 GRS.BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7790369000249",},
-  "FACHITAS MINI TAPITAS DULCE SECA350 GR PAQUE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7791672000766",},
-  "GRANIX FRUTIGRAN AVE/SOJA C/CHIPS CHOC.D.SECA 255 PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045824893",},
-  "GRANIX FRUTIGRAN AVEN.C/FRUT.ROJOS DUL.SECA 250GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045825791",},
-  "GRANIX FRUTIGRAN C/SEM.SES-AM.Y GIRASD.SECA 260 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045825401",},
-  "GRANIX FRUTIGRAN C/SEMI.DE CHIA/LINO DU.SECA 240 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045825395",},
-  "GRANIX FRUTIGRAN SALV.AVENAPAS.DE UVA 250 GRS.DU.SE.PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045001188",},
-  "GRANIX FRUTIGRAN SALV.AVENAPAS.DE UVA 500 GRS.DU.SE.PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045001218",},
-  "GRANIX FRUTIGRAN SALVADO DULCE SECA 250 GRS.PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045001195",},
-  "GRANIX FRUTIGRAN SALVADO DULCE SECA 500 GRS.PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045001201",},
-  "GRANIX FRUTIGRAN TROPICAL DUL.SECA 250 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045823452",},
-  "M PROPIAS": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "M PROPIAS", "ean": "1",},
-  "LIA MACUCAS BLACK GALL DUL RELL 110GR PAQ SPL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MACUCAS", "ean": "7790040150461",},
-  "LIA MACUCAS CHOCOLATE DUL.RELLE.85 GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MACUCAS", "ean": "7790040146877",},
-  "LIA MACUCAS GALL DUL RELL 110GR PAQ SPL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MACUCAS", "ean": "7790040145337",},
-  "OKEBON MOLINO NATURAL 10SEMILLAS DUL.SECA PAQ. 231GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MOLINO NATURAL", "ean": "7790263119658",},
-  "OKEBON MOLINO NATURAL AVEN/PASAS 232 GR PAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MOLINO NATURAL", "ean": "7790263119641",},
-  "OKEBON MOLINO NATURAL DUL.SEC AVEN/CACAO PAQ.240G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MOLINO NATURAL", "ean": "7790263119634",},
-  "DON SATUR BIZCOCHO DULCE DULCE SECA 200 GRBOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O DSATUR", "ean": "7795735000335",},
-  "DON SATUR NEGRITOS DULCE SECA 200 GRBOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O DSATUR", "ean": "7795735000342",},
-  "DON SATUR PEPAS C/MEMBRILLO DULCE SECA 300 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O DSATUR", "ean": "7795735600924",},
-  "FANTOCHE HOROSCOPO GALL DS 240GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O FANTOCHE", "ean": "7791672014404",},
-  "GRANIX FIESTA SURTIDAS DUL.SECA 350 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O GRANIX", "ean": "7790045824886",},
-  "GRANIX GRANOVITA COCO DULCE SECA 140 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O GRANIX", "ean": "7790045000860",},
-  "HOJALMAR L.LARGUITA DULCE SECA 150 GRS.BANDEJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000159",},
-  "HOJALMAR L.LARGUITA DULCE SECA250 GRS. BANDEJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000142",},
-  "HOJALMAR LARGUITA DULCE SECA 150GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000937",},
-  "HOJALMAR MATERO BIZCO. HOJAL.AZUCBOLSA 180 GR ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000593",},
-  "HOJALMAR PALMERAS DULCE SECA150 GR BANDE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000364",},
-  "HOJALMAR PALMERAS DULCE SECA150 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000913",},
-  "HOJALMAR TRIANGULI. DULCE SECA 150 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000920",},
-  "HOJALMAR TRIANGULI. DULCE SECA 150 GRS.BANDEJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000128",},
-  "HOJALMAR TRIANGULIT DULCE SECA250 GRS. PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000111",},
-  "AIRES DE LUJAN DUL. SECA.PEPAS MEMBRR. BOLSA 200 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798094222769",},
-  "AIRES DE LUJAN GALLETA MANTECA DUL SEC 180GR 1U BOL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798094223186",},
-  "AIRES DE LUJAN GALLETAS CHOC DUL SEC 180GR 1U BOL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798094223179",},
-  "ALMAR GALL PALMERITAS DS 130GR BANDEJA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798217939833",},
-  "ALMAR GALLETA PEPA DS 200GR BANDEJA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798217939796",},
-  "BINFINIT TOSTADAS DULCES 65GR 1UN PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798221642040",},
-  "CACHAMAI GALLETAS DS 165GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7792280006287",},
-  "CACHAMAI GALLETAS DS C/INCLUS 165GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7792280006270",},
-  "DEUBEL COQUITOS DULCE SECA 200 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791696011137",},
-  "DEUBEL PALMERITA DE MANTEC.DUL.SECA 200 GRS. BANDEJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791696008014",},
-  "DIMAX PEPAS BATATA DUL.SECA 200 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798144940155",},
-  "DIMAX PEPAS CHOCOLATE DUL.SECA 160 GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798144941039",},
-  "DIMAX PEPAS MEMBRILLO DUL.SECA 200 GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798144940131",},
-  "DORYS BISCOTTI C VAINILLA DUL SEC 100GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7792184003382",},
-  "FANTOCHE MINI CORONITAS FRAMBUESA 140 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7790369000997",},
-  "FIRENZE MINIPAMELA LIMON DULCE SECA 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568000696",},
-  "FIRENZE MINIPAMELA SCONES DULCE SECA 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568000849",},
-  "FIRENZE PAMELA C/CHIPS CHO.DU.SE. 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568000702",},
-  "FIRENZE PAMELA CHOCOLATE DUL.RELLE. 97 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568000962",},
-  "FIRENZE PAMELA CHOCOLATE DUL.RELLE. 97 GRPACK X 3 U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568001044",},
-  "FIRENZE PAMELA CHOCOLATE DUL.SEC 180GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568005615",},
-  "FIRENZE PAMELA COCO DULCE SECA 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568000689",},
-  "FIRENZE PAMELA LIMON DULCE SECA 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568000719",},
-  "FIRENZE PAMELA VAINILLA DUL.RELLE. 97 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568000955",},
-  "FIRENZE PAMELA VAINILLA DUL.RELLE. 97 GRPACK X 3 U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568001037",},
-  "FIRENZE PAMELAS GALLETA CHO DUL. SEC. 170GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568006100",},
-  "GAONA BIZCOCHITO DULCE SECA 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126073062",},
-  "GAONA CRUNCHIPS CHOC.C/DUL.LECHE172GRPAQ.DU.SEC": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126073376",},
-  "GAONA CRUNCHIPS COLOR DUL SEC 132GR 1U PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126074212",},
-  "GAONA CRUNCHIPS GALL MINI DUL SEC C/CHIP 90GR 1U BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126073925",},
-  "GAONA CRUNCHIPS. DUL SEC 132GR 1U PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126074182",},
-  "GAONA PEPAS DUL. MEMBRILLO DUL.SECA 300GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126073536",},
-  "GAONA SABORES DE.LA VIDA GALL D.S.C/CHI PAQ 160GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126074472",},
-  "GAONA SINFONIA OBLEA OB/WF 96GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126074151",},
-  "GAONA SINFONIA OBLEA OB/WF BLACK 100GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126074144",},
-  "GAONA SINFONIA OBLEAS CALSSSIC 50GR X4IU PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126072805",},
-  "GAONA SINFONIA OBLEAS FRUTI.C/CREMA 100 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126072232",},
-  "GAONA SINFONIA OBLEAS NARANJA/CHOCO. 100 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126072591",},
-  "GAONA STAR CHOCOLATE OBLEAS 100 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126071273",},
-  "GAONA STAR FRUTILLA OBLEAS 100 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126070948",},
-  "GAONA STAR OBLEAS LIMON 100 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126071747",},
-  "GAONA STAR SAB. CLASICO NARANJA OBLEAS 100 GR FLOW PACK": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126070931",},
-  "HAPPY FOOD GALL. NRJA DUL SEC 44GR 3U PAQ 132G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798308250298",},
-  "HAPPY FOOD GALLET. C/PERA DUL SEC 120GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798308250335",},
-  "HAPPY FOOD GALLET. COCO DUL SEC 44GR 3U PAQ 132G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798308250281",},
-  "HAPPY FOOD GALLET. DULC SEC LIMON 120GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798308250427",},
-  "KUKINAS BLACK DUL SEC CHIPS CHOC 80GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810140",},
-  "KUKINAS C/CHIPS DS 133GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810058",},
-  "KUKINAS C/CHIPS DS 180GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810096",},
-  "KUKINAS DUL SEC CHIPS CHOC 80GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810133",},
-  "KUKINAS DULCE SECA CHOCOLATE 80 PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810010",},
-  "KUKINAS DULCE SECA VAINILLA 180GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810034",},
-  "KUKINAS DULCE SECA VAINILLA 180GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810072",},
-  "LA PROVIDENCIA GALL C/CHIPS DUL.SEC 357GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798141972760",},
-  "LA PROVIDENCIA GALL DR 119GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798141972906",},
-  "LA PROVIDENCIA GALLETAS DR. 357GR PAQUETE 1UN X3": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798141972913",},
-  "LEIVA DULCE DE LECHE DUL.SECA 260 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7790412000011",},
-  "LEIVA MIEL DULCE SECAPACK X 3 U120 GR C/UARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7790412000950",},
-  "LEIVA TOSTADAS DULCES PAQUETE 150 GRS": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7790412000288",},
-  "MANIERI TOST LIGH TOST.DULC.DUL.SECA 200 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798120180674",},
-  "MANIERI TOST.DUL. ARROZ DUL.SECA 120GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798120180803",},
-  "MISKY GALL OBLEA RELL TUR/MANI 25GRS 1U PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "77940148",},
-  "NEVARES BOQUITAS DE LIMON DULCE SECA 45 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798094229454",},
-  "NEVARES COQUITOS DUL.SECA 45 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798094229461",},
-  "NEVARES PALMERITAS DUL.SECA 45 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798094229492",},
-  "NEVARES TURRON MANI 25GR 1U PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "77923523",},
-  "OBLITA CUBANITOS CHOCOLATE DUL.RELLE. 165 GRCAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123016111",},
-  "OBLITA CUBANITOS RELLE.D.D LECHE DUL.RELLE.288 GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123000394",},
-  "OBLITA OBLEAS CHOC/LIMON DUL.RELL. 50 GRPACK X 4 U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123013226",},
-  "OBLITA OBLEAS FRUTI/VAIN.DUL.RELL. 50 GRPACK X 4 U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123013202",},
-  "OBLITA OBLEAS FRUTILLA DUL.RELLE. 50 GRPACK X 4 U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123013219",},
-  "PAMELA MINI AVENA Y COCO GALL.DUL.SECA BOLSA 180GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568005608",},
-  "PAMELA MINI AVENA Y PASAS GALL.DUL.SECA BOLSA 180GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568005660",},
-  "PAR-NOR GALL CHIPPIS CHOC DUL.SEC. 120GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791324157664",},
-  "PAR-NOR MINI BARRITA FRUT BOSQ DUL.REL.160GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791324157657",},
-  "PAR-NOR MINI MANTECADAS DULCE SECA BOL. 170 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791324156919",},
-  "PAR-NOR MOROCHITASDULCE SECABOLSA 200 GRS.1324156827": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791324156827",},
-  "POZO GALL VAINILLAS DUL. SEC. 80GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7790077000326",},
-  "RIANITOS HOJALDRE AZUCARADAS DUL.SECA 170 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798157740131",},
-  "SANTA MARIA LIMON DULCE SECA 200 GRCAJA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079230116",},
-  "SANTA MARIA OBLEA RELL CHOC PAQ 90 GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079234374",},
-  "SANTA MARIA OBLEA RELL LIMON PAQUETE 90 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079230833",},
-  "SANTA MARIA OBLEAS RELL FRUT. PAQUETE 90 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079234367",},
-  "SANTA MARIA PEPITAS DULCE SECA200 GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079230161",},
-  "SANTA MARIA VAINILLA DULCE SECA 200 GRCAJA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079230147",},
-  "SMACK . TORTA BANADA RELL DDL 70GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798094223063",},
-  "SORIANO CHOCO BISCUITS GALL. BAÑ.CHOCO. DP 160GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7792184003313",},
-  "TEM-FLOR BANANITAS C/BAN PARCIAL CHC DUL. SEC. 300GR BOL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793176003380",},
-  "TEM-FLOR GALL MINIFAUNA DUL. SEC. 300GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793176003397",},
-  "TOSTEX AVENA Y CHIPS DUL. SECA 300 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125810583",},
-  "TOSTEX C/AVENA Y MIEL DUL. SECA 270GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811092",},
-  "TOSTEX C/AVENA Y PASAS DUL. SECA 270GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811078",},
-  "TOSTEX CHIPS C/CHISP DULCE SECA 270GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811009",},
-  "TOSTEX CHIPS C/CHISP DULCE SECA 270GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811023",},
-  "TOSTEX CHIPS C/CHISP/AVENA DULCE SECA 270GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811061",},
-  "TOSTEX CHIPS&MANI GALL. DUL.SECA 300GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125810781",},
-  "TOSTEX GALL C/AVENA Y ARANDANOS DUL. SECA 270GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811085",},
-  "TYM VAINILLA OBLEAS 105 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793209000348",},
-  "VEGUIS ARITOS CANELA D.S. 200GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793176003328",},
-  "VEGUIS BANANITAS C/CHIPS CHOC D.S. 200GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793176003311",},
-  "YUKA COOKIE C/CHIPS S/TACC DUL. SEC BOL 150 GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794903232189",},
-  "YUKA COOKIE VAINILLA S/TACC DULC. SECA BOLSA 150 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794903232196",},
-  "YUKA NARANJA DULCE S/TACC SECA BOLSA 150 GRARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794903232233",},
-  "YUKA PEPITAS DULCE S/TACC SECA BOLSA 150 GRARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794903232219",},
-  "ZAFRANITO GALL DUL.SEC ORG INTEG. SAB.CHOCO BOLSA 150G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798187760390",},
-  "ZAFRANITO GALL DUL.SEC ORG INTEG. SAB.VAINILLA BOLSA 150G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798187760383",},
-  "OKEBON GIROTONDO VAIN 224GR PAQ.DU.SE. 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O OKEBON", "ean": "7790263119726",},
-  "OKEBON GIROTONDO VAIN C/CHIPS 214GR PAQ.DU.SE. 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O OKEBON", "ean": "7790263119719",},
-  "OKEBON MOLINO NATURAL AVENA&GRANOLA DUL.SECA 236 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O OKEBON", "ean": "7790263119627",},
-  "OKEBON PANAL COCO DUL SEC 222GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O OKEBON", "ean": "7790263119696",},
-  "OKEBON PANAL VAINILLA DUL SEC 220GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O OKEBON", "ean": "7790263119689",},
-  "SORIANO BISCUIT DULCE SECA 125 GRS.PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O SORIANO", "ean": "7792184003085",},
-  "SORIANO BISCUITS C/CHIPS CHOCOLATE 100 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O SORIANO", "ean": "7792184000084",},
-  "TRIO FROLITAS DULCE SECA 300 GRS.BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O TRIO", "ean": "7791787000644",},
-  "TRIO GALL SCONES DULCE SECA 320GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O TRIO", "ean": "7791787101075",},
-  "TRIO TARTELETTE C/MERM DUL RELL 300GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O TRIO", "ean": "7791787100979",},
-  "TRIO TRI-CHOC PEPAS DULCE SECA 300 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O TRIO", "ean": "7791787000705",},
-  "TRIO TRI-CHOC PEPAS DULCE SECA 300 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O TRIO", "ean": "7791787100894",},
-  "OKEBON FORTI PLUS LECHE Y DCE.LECHE 165 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OKEBON LECHE", "ean": "7790263110839",},
-  "PAR-NOR MINI BARRITA MEMBRILLO DUL.RELLE.160 GRS. BOL ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324157619",},
-  "PAR-NOR MINI PITU.CHOC.RELL.C/CRE.SAB.LECHE 160GBOLSA.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324157046",},
-  "PAR-NOR MINI PITU.VAIN.RELL.C/CRE.SAB.LECHE 160GBOLSA.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324157022",},
-  "PAR-NOR MINI PITUSAS DUL.RELLE. 140 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324157527",},
-  "PAR-NOR MINI PITUSAS FRUTIL.DUL.RELLE.160 GRS. BOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324157466",},
-  "LIA POLVORITA CHC/VAIN DUL.RELLE.152GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040146143",},
-  "LIA POLVORITA CHOC DUL.RELLE.81GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040139183",},
-  "LIA POLVORITA FRUT DUL.RELLE.81GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040139176",},
-  "LIA POLVORITA MINI CHOC DUL.RELLE.152GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040139251",},
-  "LIA POLVORITA MINI VAIN DUL.RELLE.152GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040139190",},
-  "LIA POLVORITA VAIN DUL.RELLE.81GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040139169",},
-  "LIA POLVORITA VAIN/FRUT DUL.RELLE.152GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040139640",},
-  "PLASENCIA POZO VAINILLA DULCE SECA480 GR PAQ. ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POZO", "ean": "7790077000135",},
-  "SMAMS GALL DUL RELL LIMON S/TACC 105GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511257",},
-  "SMAMS GALL DUL RELL VAINILLA S/TACC 105GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511240",},
-  "SMAMS GALL.DUL.SECA VAINILLA COLEGIAL 150 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510847",},
-  "SMAMS GALLET CHIP/CHOC. DUL SEC . PAQ. 150GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511004",},
-  "SMAMS GALLET S/TACC CHOC DU.SE. 200GR PAQ. 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511011",},
-  "SMAMS PEPAS MEBRILLO 150GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510786",},
-  "SMAMS POLVORON COCO DULCE SECA 120GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511196",},
-  "SMAMS POLVORON LIMON DULCE SECA 120 GR BOL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511202",},
-  "SMAMS POLVORON VAIN DULCE SECA 120 GR BOL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511219",},
-  "SMAMS S/GLUTEN BISCUITS DULCE SECA 120 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510120",},
-  "SMAMS S/GLUTEN BIZ.AGRIDUL.AZUCARA. 150 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510182",},
-  "SMAMS S/GLUTEN CHOCOLATE DUL.RELLE. 110 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510014",},
-  "SMAMS S/GLUTEN FRUTILLA DUL.RELLE. 105 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510267",},
-  "SMAMS S/GLUTEN VAINILLA DUL.RELLE. 110 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510021",},
-  "SMAMS VEGGIE PEPAS MEBRILLO 150GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511226",},
-  "TEPERIN PEPAS DUL. SECA PAQUETE 200 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TEREPIN", "ean": "7798054220156",},
-  "TEREPIN GALLETA DS C/FRUTA 300GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TEREPIN", "ean": "7798054220781",},
-  "TEREPIN GALLETA DS C/FRUTA 300GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TEREPIN", "ean": "7798054220798",},
-  "TEREPIN GALLETA DS C/FRUTA 300GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TEREPIN", "ean": "7798054220804",},
-  "TEREPIN PEPAS C/DCE.BATA.DULC.SECA 300 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TEREPIN", "ean": "7798054220606",},
-  "TEREPIN PEPAS DULCE D/MEMBRILLO DULCE SECA 500GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TEREPIN", "ean": "7798054220293",},
-  "TEREPIN PEPAS FRUTOS DEL BOSQUE 300 GRBOL.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TEREPIN", "ean": "7798054220590",},
-  "PEPSICO TODDY C/CHISP.CHOCO.DUL.SECA PAQ.126G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TODDY", "ean": "7790380023432",},
-  "TODDY GALL MINI DUL SEC 50GR PAQ. 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TODDY", "ean": "7790380023487",},
-  "TRIO PEPAS DUL.SECA 320 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TRIO PEPAS", "ean": "7791787100924",},
-  "TRIO PEPAS DULCE SECA 500 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TRIO PEPAS", "ean": "7791787000040",},
-  "TRIO TARTELETTE DULCE SECA 300GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TRIO PEPAS", "ean": "7791787100900",},
-  "VALENTE VAINILLA DUL. SEC. 444GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "VALENTE VAIN", "ean": "7793890258707",},
-  "VALENTE VAINILLA DULCE SECA 74 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "VALENTE VAIN", "ean": "7793890258738",},
-  "VALENTE VAINILLAS DUL. SEC. 148GR. PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "VALENTE VAIN", "ean": "7793890258691",},
-  "9 DE ORO PASEO MINI CRACKERS VEG. ZAPALLO BOL 150G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "9 DE ORO", "ean": "7792180136329",},
-  "M.CANUELAS9 DE ORO BIZ.C/GRA.CRACKERS 100 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "9 DE ORO", "ean": "7792200000098",},
-  "M.CANUELAS9 DE ORO BIZ.C/SALVCEREAL 200 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "9 DE ORO", "ean": "7792200020119",},
-  "M.CANUELAS9 DE ORO BIZC.CLAS.CRACKERS 200 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "9 DE ORO", "ean": "7792200000159",},
-  "M.CANUELAS9 DE ORO BIZC.LIGHTCRACKERS 170 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "9 DE ORO", "ean": "7792200000777",},
-  "BAUDUCCO TOSTADAS INTEGRAL CRACKERS PAQ142 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "BAUDUCCO", "ean": "7891962060460",},
-  "BAUDUCCO TOSTADAS MULTIGRANOS CRACKERS PAQ142 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "BAUDUCCO", "ean": "7891962060477",},
-  "BAUDUCCO TOSTADAS ORIGINAL CRACKERS PAQ 142GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "BAUDUCCO", "ean": "7891962060453",},
-  "DON SATUR 100% VEGETAL . BIZCOCHOS 170 GRS BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "D SATUR BIZ", "ean": "7795735601228",},
-  "DON SATUR BIZCOCHOS SALADOS CRACKERS PAQ.200 GR5735000328": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "D SATUR BIZ", "ean": "7795735000328",},
-  "FANTOCHE BIZCOCHO MATERO CR 200GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "DF BIZ GRASA", "ean": "7791672014565",},
-  "DON SATUR BIZCOCHOS C/QUESO BOLSA 140 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "DON SATUR", "ean": "7795735000519",},
-  "DON SATUR TALITAS QUESO 110 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "DON SATUR", "ean": "7795735000243",},
-  "GRANIX GRAN AGUA SANDWICH CRACKERS 200 GRS.PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANAGUA", "ean": "7790045001133",},
-  "GRANIX GRAN AGUA SANDWICH CRACKERS PAQ.200 X30045001379": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANAGUA", "ean": "7790045001379",},
-  "GRANIX GALL CRACKERS SIN SAL 200GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANIX", "ean": "7790045827733",},
-  "GRANIX GALLETAS CR 600GR 1UN PAQUETE AGR X3": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANIX", "ean": "7790045827740",},
-  "GRANIX SALVADO CEREAL 240 GRS. PAQUE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANIX", "ean": "7790045826200",},
-  "GRANIX SALVADO S/SAL 3EN1 3U 720 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANIX", "ean": "7790045826231",},
-  "GRANIX SALVADO SIN SAL CEREAL 690 GRS PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANIX", "ean": "7790045826101",},
-  "GRANIX SALVADO SIN SAL PAQ 230 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANIX", "ean": "7790045826095",},
-  "LA PROVIDENCIA CRACKERS CR PAQUETE 101 GRPACK X 3 U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "LA PROVIDENCIA", "ean": "7798141972371",},
-  "LA PROVIDENCIA CRACKERS PAQ. FAM. X 5 U. 101 GR C/U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "LA PROVIDENCIA", "ean": "7798141972388",},
-  "LA PROVIDENCIA GALL BIZCOCHO SAL CR 200GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "LA PROVIDENCIA", "ean": "7798141972920",},
-  "M CANUELAS 9 DE ORO GALL SN CRE/CEB 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "M CA¥UELAS 9 ORO", "ean": "7792180146120",},
-  "M CANUELAS 9 DE ORO GALL SN HIERBAS 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "M CA¥UELAS 9 ORO", "ean": "7792180146144",},
-  "M CANUELAS 9 DE ORO GALL SN JAMON 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "M CA¥UELAS 9 ORO", "ean": "7792180146137",},
-  "M CANUELAS 9 DE ORO GALL SN ORIG 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "M CA¥UELAS 9 ORO", "ean": "7792180146090",},
-  "M CANUELAS 9 DE ORO GALL SN QUESO 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "M CA¥UELAS 9 ORO", "ean": "7792180146106",},
-  "M PROPIAS": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "M PROPIAS", "ean": "1",},
-  "ARCOR MEDIA TARDE SANDWICH CRACKERS 107 GR PAQ.X 5U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "MEDIA TARDE", "ean": "7790040143012",},
-  "BAGLEY MEDIA TARDE SANDWICH CRACKER 107GR PAQ AGR 3U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "MEDIA TARDE", "ean": "7790040143005",},
-  "LIA MEDIA TARDE GALL CR 315GR PAQUE AGR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "MEDIA TARDE", "ean": "7790040143586",},
-  "DON SATUR MIX DE SEMIL.TALITAS CEREAL 140 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O DSATUR", "ean": "7795735600917",},
-  "DON SATUR TALITAS CRACKERS 140 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O DSATUR", "ean": "7795735000106",},
-  "GRANIX SEMOLADAS.CRACKERS 420GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O GRANIX", "ean": "7790045827047",},
-  "BINFINIT TOSTADAS CLASICAS LIBRE DE GLUTEN CR 65GR 1U PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798221642057",},
-  "BINFINIT TOSTADITAS JAMON 130GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798221642002",},
-  "BINFINIT TOSTADITAS QUESO 130GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798221642033",},
-  "BREVISS TOSTADAS LIGHT CRACKERS 200 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529041547",},
-  "BREVISS TOSTADAS LIGHT CRACKERS 200 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529041622",},
-  "BREVISS TOSTADITAS CLAS.CRACKERS 110GR PAQ. 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529042223",},
-  "BREVISS TOSTADITAS LIGHT C/FITOESTER 110GR PAQ. 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529042230",},
-  "DON PANCHO MARINERAS C/SEMILLAS 220 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798033900215",},
-  "DON PANCHO MARINERAS CRACKERS 220 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798033900161",},
-  "DON PANCHO MARINERAS CRACKERS 220 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798033900222",},
-  "DON PANCHO MARINERAS DE SALVAD CRACKERS 220 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798033900178",},
-  "DON PANCHO MARINERAS LIGHT CRACKERS 220 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798033900208",},
-  "DON PANCHO MARINERAS S/SAL CRACKERS 220GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798033900154",},
-  "DOS HERMANOS TOST.DE ARROZ CRACKERS 120 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790503000333",},
-  "DOS HERMANOS TOST.DE ARROZ S/SAL CRACKERS 120 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790503000326",},
-  "G&M MARINERAS CLASICA CRACKER 220GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798153719322",},
-  "G&M MARINERAS SALVADO CRACKER 220GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798153719346",},
-  "G&M MARINERAS SIN SAL CRACKER 220GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798153719339",},
-  "GALLO BIZCOCHOS ARROZ SAL CRACKERS 100GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790070418463",},
-  "GALLO BIZCOCHOS SALADOS CRACKERS 50GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790070418456",},
-  "GAONA ALAMESA TOSTADAS DE MESA 200GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798126073970",},
-  "GAONA STAR BIZCOCHITOS PAQUETE 180 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798126073055",},
-  "GAONA TOSTADAS LIGHT CRACKE.200GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798126074007",},
-  "GRANDIET MULTICEREAL SIN SAL CEREAL 100 GRS. PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7797330102377",},
-  "HAPPY FOOD CHALITAS JAMON 100GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798308250397",},
-  "HOJALMAR TALITAS SAB.JAMON PAQ.100GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7793450000906",},
-  "HOJALMAR TALITAS SAB.QUESO PAQ.100GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7793450000890",},
-  "LEIVA GALL MARINERA S/SAL 420GR 3 PAQ AGR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790412002046",},
-  "LEIVA GALLETAS CR MINI LIGHT 250GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790412001964",},
-  "LEIVA MULTICE LINO/SESAMO. CEREAL 160GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790412001612",},
-  "LEIVA SANDWICH CRACKER VEG 110GR PAQ.X3 PQ AGR 330G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790412001896",},
-  "LEIVA TOSTADA ARROZ CHIA Y LINO 160GR 1U PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790412001629",},
-  "LEIVA TOSTADAS DE ARROZ PAQUETE 150 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790412000271",},
-  "M CANUELAS PASEO GALLETAS SN QUESO 250GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7792180145444",},
-  "MANIERI C/GLUTEN TOSTADAS DE MESA CRACK. 200 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798120180544",},
-  "MANIERI C/GLUTEN TOSTADAS DULCES CRACK. 200 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798120180551",},
-  "MANIERI C/GLUTEN TOSTADAS S/SAL CRACK. 200 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798120180575",},
-  "MANIERI EQUILIBRIO LIGHT TOST.SALV 200 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798120180667",},
-  "MANIERI EQUILIBRIO LIGHT TOSTA. PAQ 200 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798120180773",},
-  "MANIERI TOST.SALV.C/GLUTEN CRACKERS 200 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798120180568",},
-  "MANIERI TOSTADA.C/GLUTE.SALV.S/SAL 200 GRPAQ.CEREAL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798120180599",},
-  "MANIERI TOSTADAS ARROZ CR 120GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798120180797",},
-  "MANIERI TOSTADAS ARROZ S/SAL CR 120GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798120180780",},
-  "MOLINOS ALA TOST.ARROZ CLAS.CRACKERS 150 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791120098093",},
-  "PASEO GALLETAS CRACKERS OLIV/ROME 250GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7792180145420",},
-  "PIPAS GALLET CRACKERS C/SEM GIR 100GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798044151354",},
-  "RIANITOS MARINERA LINO Y CHIA. 170GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157740117",},
-  "RIANITOS MARINERA OLIVA Y PARMES CRACKERS 170GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157740100",},
-  "RIANITOS MARINERA ORIG CRACKERS 170GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157740094",},
-  "RIANITOS MINI BIZC.PARMESANO/OLIVA 200 GRBOL.CRACKE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157740070",},
-  "RIANITOS MINI BIZCO.LINO/CHIA CRACKERS 200 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157740049",},
-  "RIANITOS MINI BIZCOCHOS CRACKERS 200 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157740018",},
-  "SHIVA CARBON VEGETAL CR SIN TACC PAQ 100GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "617308824094",},
-  "SHIVA CRACKER MIX DE SEMILLAS 100GR 1U BOL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "617308824100",},
-  "SHIVA MEDITERRANEAS SIN TACC PAQ 100GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "617308824117",},
-  "SHIVA PIMIENTON AHUMADO CR SIN TACC PAQ 100GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "617308824087",},
-  "TOSTEX CINTITAS CEBOLLAS CRACKERS 125 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810361",},
-  "TOSTEX CINTITAS CLASICAS CRACKERS 125 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810354",},
-  "TOSTEX CINTITAS CROCANTES PIZZA CRACKERS 125 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810385",},
-  "TOSTEX CINTITAS JAMON CRACKERS 125 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810521",},
-  "TOSTEX CINTITAS PROVOLETA BOL .125GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810958",},
-  "TOSTEX CINTITAS QUESO CRACKERS 125 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810347",},
-  "TOSTEX CINTITAS SAB OLIVA BOLSA 125GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125811436",},
-  "TOSTEX CINTITAS SAB. ASADO BOLSA.125GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125811412",},
-  "TOSTEX CINTITAS SAB.BARBACOA BOLSA.125G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810750",},
-  "TOSTEX CINTITAS SAB.CHEDDAR BOLSA.125G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810767",},
-  "TOSTEX CINTITAS SALAME BOL .125GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810965",},
-  "TOSTEX CINTITAS SEMILLAS CRACKERS 125 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810446",},
-  "TOSTEX GALL SN CINTITAS PICANTE BOLSA.125GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125811214",},
-  "TOSTI TALITAS C/SEMILLAS 100GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529042148",},
-  "TOSTI TALITAS CLASICA 100GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529042087",},
-  "TOSTI TALITAS PIZZA 100GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529042117",},
-  "TOSTI TALITAS QUESO 100GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529042124",},
-  "TOSTI TOSTADA GRUESA SIN SAL PAQ 200GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529041615",},
-  "TOSTI TOSTADAS CLASICA 140GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529041653",},
-  "TOSTI TOSTADAS CLASICAS PAQ 200GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529041608",},
-  "TOSTI TOSTADAS FINA LIGHT 140GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529041660",},
-  "TOSTI TOSTADAS MULTICER. 200GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529041646",},
-  "TOSTI TOSTADAS MULTICEREAL 140GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529041691",},
-  "URQUIZA TALITAS CEBOLLA SNACKS 100 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798177401302",},
-  "URQUIZA TALITAS CLASICAS CRACKERS 110 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798177401265",},
-  "URQUIZA TALITAS QUESO SNACKS 100 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798177401296",},
-  "VEGUIS BIZCOCHO MAT CR 200GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7793176003304",},
-  "VIAVITA FAJITAS SAB.JAMON SNACKS 100 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798195940180",},
-  "VIAVITA FAJITAS SAB.QUESO PARMESANO 100 GRBOL.SNACKS": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798195940173",},
-  "VIAVITA SIN GLUTEN FAJITAS C/MIX DE SEM 100GR BANDEJA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798195940142",},
-  "VIAVITA SIN GLUTEN FAJITAS CLASICAS CR 100 GRS BANDEJA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798195940128",},
-  "YUKA QUESO SALADAS S/TACC SECA BOLSA 150 GRARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794903232226",},
-  "M.CANUELAS PASEO CLASICAS TOST 200 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180137845",},
-  "M.CANUELAS PASEO SALVADO TOST 200 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180137852",},
-  "M.CANUELASPASEO MINI CRACKERS 300 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180006448",},
-  "M.CANUELASPASEO MINI MARINER. CRACKERS 220 GR. BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180006462",},
-  "M.CANUELASPASEO MINI SALVADO CEREAL 300 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180006455",},
-  "M.CANUELASPASEO MINICRACKERS 5 SEMILLAS 300 GRBOL.CEREAL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180007315",},
-  "M.CANUELASPASEO MINICRACKERS MIX CEREAL 300 GRBOL.CEREAL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180007346",},
-  "M.CANUELASPASEO MINICRACKERS S/SAL 300 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180007254",},
-  "M.CANUELASPASEO MINICRACKERS SESAMO 300 GRBOL.CEREAL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180007285",},
-  "SMAMS CRACKERS CRACKERS BOLSA 150 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SMAMS", "ean": "7798181510212",},
-  "SMAMS MIX DE SEMILLAS CEREALES 150 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SMAMS", "ean": "7798181510229",},
-  "PEPSICO TWISTOS HORNEADOS JAMON 40GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310987094",},
-  "PEPSICO TWISTOS JAMON IBER 155GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310984475",},
-  "PEPSICO TWISTOS MINI TOS HORNEAD QUESO 40GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310987100",},
-  "PEPSICO TWISTOS MINI TOST SN QUESO 155GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310984444",},
-  "TWISTOS MINI TOST.JAMON 95GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310983256",},
-  "TWISTOS MINI TOST.QUESO 95GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310983270",},
-  "BIMBO ZENISSIMO SALMAS HORN.CLAS SN CAJA 90GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "ZENISSIMO", "ean": "7793890261844",},
-  "CHOCOARROZ ALFAJOR D/ARROZ BLANCO C/D.D.LEC 22 GR X6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418302",},
-  "CHOCOARROZ ALFAJOR DE ARROZ C/D.D.LEC 22 GR X6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418227",},
-  "CHOCOARROZ ALFAJOR DE ARROZ C/LIMON 22GR X 6U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418265",},
-  "CHOCOARROZ ALFAJOR DE ARROZ CHO.BLANCO 22GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418289",},
-  "CHOCOARROZ ALFAJOR DE ARROZ DDL 22 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418203",},
-  "CHOCOARROZ ALFAJOR FRUTI DE ARROZ 22GR PAQ. 6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070416872",},
-  "CHOCOARROZ ALFAJOR FRUTILLA D/ARROZ 22GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070416865",},
-  "CHOCOARROZ ALFAJOR SPL ARROZ 28GR PAQUETE 6UN 168G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070104403",},
-  "CHOCOARROZALFAJOR DE ARROZ C/LIMON 22 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418241",},
-  "CHOCOARROZALFAJOR DE ARROZ MARROC 22 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418326",},
-  "CHOCOARROZALFAJOR DE ARROZ MARROC 22 GR X 6 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418340",},
-  "CACHAFAZ ALFAJOR CHOCOLATE NEGRO 60 GRCAJA X6 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "7798128000479",},
-  "CACHAFAZ ALFAJOR MIXTO CHOCOLATE 60 GRCAJA X12 U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "7798128000509",},
-  "FANTOCHE BLANCO TRIPLE ALFAJOR 80GRS.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "FANTOCHE", "ean": "77991584",},
-  "FANTOCHE MINI ALF. CHO.BLANCO PAQ.X 6U. 20 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "FANTOCHE", "ean": "7791672002005",},
-  "FANTOCHE MINI ALFAJOR 25GR X6UN PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "FANTOCHE", "ean": "7791672002012",},
-  "FANTOCHE TRIPLE ALFAJOR 85 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "FANTOCHE", "ean": "77991577",},
-  "GUAYMALLEN ALFAJOR 35 GR.C/U.BOLSA X6 U1 U.GUAYM.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "GUAYMALLEN", "ean": "7796073000056",},
-  "GUAYMALLEN ALFAJOR 38GRS. ALEX VIAN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "GUAYMALLEN", "ean": "77980229",},
-  "GUAYMALLEN FRUTA ALFAJOR 38GR BOLSA 6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "GUAYMALLEN", "ean": "7796073000032",},
-  "GUAYMALLENBLANCO ALFAJOR 38GR BOLSA X 6": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "GUAYMALLEN", "ean": "7796073000049",},
-  "JORGITO ALFAJOR 55 GRS.C/UPAQ.X 6 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGITO", "ean": "7790957000026",},
-  "JORGITO ALFAJOR 55GRS.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGITO", "ean": "77905741",},
-  "JORGITO ALFAJOR BLANCO SPL 50GR 6U PAQ 300G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGITO", "ean": "7790957000019",},
-  "JORGITO ALFAJOR FRUTA 150 GR 6 U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGITO", "ean": "7790957000552",},
-  "JORGITO ALFAJORCI.PAQ.X 6 U. 155 GRS.0957000545": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGITO", "ean": "7790957000545",},
-  "JORGITO BLANCO ALFAJOR PAQ.X 6 U 26 GRARG": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGITO", "ean": "7790957000033",},
-  "JORGITO MOUSSE ALFAJORCI.PAQ.X 6 UN128 GR ARG": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGITO", "ean": "7790957000569",},
-  "M PROPIAS": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "M PROPIAS", "ean": "1",},
-  "9 DE ORO ALFAJOR SPL BAN 45GR 6UN CAJA 270G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7792180145529",},
-  "CHAMMAS ALFAJOR BCO SPL 50GR 6U PAQ 300G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232707",},
-  "CHAMMAS ALFAJOR CHOCO NEGRO SPL 50GR 6U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232691",},
-  "CHAMMAS BLANCO TRAD ALFAJOR 40GR 6U PAQ 240G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232684",},
-  "CHAMMAS MEMBRILLO ALFAJOR 40GR 6U CAJA 240G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232677",},
-  "DE NUESTRA PANADERIA ALF. DDL BAN.CHOCO.NEG.12 25GR C/U PAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7791696008595",},
-  "DONN ALFAJ ARROZ BAN CHC SPL 78GR 6U PAQUETE 468G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798033900512",},
-  "DONN ALFAJ ARROZ. BAN CHC SPL 78GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798033900529",},
-  "DONN ALFAJ ARROZ. BAN CHC SPL 78GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798033900536",},
-  "DONN ALFAJ ARROZ. BAN CHC SPL 78GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798033900543",},
-  "FULBITO ALFAJOR 25 GR ARG": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "77902320",},
-  "FULBITO ALFAJOR CHOCOLATE 30 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "77913586",},
-  "FULBITO ALFAJOR CHOCOLATE 30 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798094224237",},
-  "GENIO NEVARES ALFAJOR TRIPLE BLANCO 60GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798094220963",},
-  "GENIO NEVARES ALFAJOR TRIPLE REG PAQUETE 60GR 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798094220956",},
-  "HAPPY FOOD ALFA S/TACC COCO/DDL SPL 50GR 3U BDJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250274",},
-  "HAPPY FOOD ALFAJ LS/TACC DDL SPL 50GR 3U BANDJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250069",},
-  "HAPPY FOOD LS/TACC MANI SIMPLE 50GR 3U BANDJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250052",},
-  "HAPPY FOOD LS/TACC MOUSSE SIMPLE 50GR 3U BANDJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250045",},
-  "HAPPY FOOD S/TACC DDL S/AZ. SPL 50GR 3U BNDJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250120",},
-  "NEVARES ALFAJOR BLANCO PAQ. 45 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "77925626",},
-  "NEVARES C/DDL ALFAJOR CH.NEGRO 45GR 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "77908193",},
-  "SMACK ALFAJOR MOUSSE 50 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798094221809",},
-  "SMACK ALFAJOR NEGRO RELLE.D.D.LEC. 60 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798094220437",},
-  "SMACK ALFAJOR RELLE.DDL SPL 60GR PAQ 6U 360G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798094224183",},
-  "SMAMS ALFAJOR DDL SPL 50GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798181511264",},
-  "SMAMS ALFAJOR DDL SPL 50GR 3U PAQ 150G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798181511370",},
-  "SMAMS ALFAJOR DDL. TRIPLE 81GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798181511288",},
-  "SOL SERRANO ALFAJOR CHOC 40GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232431",},
-  "SOL SERRANO ALFAJOR D.D/LECHE 40GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232417",},
-  "SOL SERRANO ALFAJOR FRUTA 40GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232424",},
-  "SOL SERRANO ALFAJOR FTOS BOSQUE SPL 40GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232615",},
-  "YUKA ALFAJOR CHOC MIX S/TACC 50GR 6UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232479",},
-  "YUKA ALFAJOR CHOC S/TACC 50GR 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232165",},
-  "YUKA ALFAJOR MIX S/TACC 50GR 6UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232509",},
-  "TODDY ALFAJOR MOUSSE SPL 50GR REG PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TODDY", "ean": "7790380023579",},
-  "VIMAR ALFAJOR CHOCOLATE DOBLE 38GR 6UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "VIMAR", "ean": "7798073420186",},
-  "VIMAR ALFAJOR X3 CHOCOLATE 60GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "VIMAR", "ean": "77958365",},
-  "BANANITA DOLCA BOMBON BOCAD BANANA 30GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BANTA-DOLCA", "ean": "77988263",},
-  "BARILOCHE ALME BAN C/CHO 100GR POUCH 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430903985",},
-  "BARILOCHE ALMENDRAS C/CHOCOLA.BOLSA 80 GRARG": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430904036",},
-  "BARILOCHE AVELLANA BAN C/CHO 100GR POUCH 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430904029",},
-  "BARILOCHE BOL.CEREAL C/CHOCOLATE BOLSA 80GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430095864",},
-  "BARILOCHE CEREAL BAN CHC 100GR POUCH 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430904012",},
-  "BARILOCHE PASAS BAN C/CHO 100GR POUCH 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430904005",},
-  "BARILOCHE PASAS DE UVA BANAD. 120 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430095741",},
-  "BARILOCHE PRALINE TRUFA 120 GR CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430609221",},
-  "BARILOCHE TURRON MANI C/CH. 150 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430370701",},
-  "BONAFIDE ALMENDRAS BAN.C/CHO.BOLSA 80GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BONAFIDE", "ean": "7792360097136",},
-  "BONAFIDE CEREAL BAN.C/CHO.80GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BONAFIDE", "ean": "7792360097129",},
-  "BONAFIDE PASAS DE UVA BANA. C/CHO. 80GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BONAFIDE", "ean": "7792360097105",},
-  "FANTOCHE PASAS DE UVA BAN C/CHOC 80GR POUCH 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "FANTOCHE", "ean": "7792360097969",},
-  "GALLO CHOCONUSS OBLEA ARR.RELL.AVEL.BAN.C/CHO.20 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070416247",},
-  "GALLO OBLEA D/ARROZ RELL.BAN. CHC 20GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070431905",},
-  "GALLO OBLEA D/ARROZ WHITE RELL.BAN. 20GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070431653",},
-  "GALLO OBLEA DE ARROZ RELLE.BAN. 20 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070411952",},
-  "GALLO SNACK CHOCOBAR OBLEA ARROZ BAN.C/CHO 20GR PAQ 6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070417572",},
-  "GEORGALOS ALMENDRAS BAN.C/CHO. 100 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380011866",},
-  "GEORGALOS ALMENDRAS C/CHOCOLA. 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380037767",},
-  "GEORGALOS AVELLANAS C/CHOCO. 100 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380011873",},
-  "GEORGALOS AVELLANAS C/CHOCOLA.80GR 1U BOL": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380824947",},
-  "GEORGALOS FRAMBUESAS BAN.C/CH. 100 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380037033",},
-  "GEORGALOS PASAS BANADAS 80 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380037774",},
-  "GEORGALOS TURRON CAPUCCINO CUB.CHOCO. 100GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380033196",},
-  "GEORGALOS TURRON CROC. MANI.ALME.C/CH 100 GR CJ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380015536",},
-  "GEORGALOS TURRON DE MANI BAN.C/CHO. 90 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380034025",},
-  "GEORGALOS TURRON DE MANI C/CHOCO. 90 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380013594",},
-  "KINDER BUENO BOMBON 21.5 GRX2 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KINDER BUENO", "ean": "80052760",},
-  "KINDER BUENO WHITE REG. BOMBON 19.5 GR X2 PAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KINDER BUENO", "ean": "80761761",},
-  "KIT KAT CHOCOLATE BLEA BANADA DARK 41.5GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KIT-KAT", "ean": "7891000379073",},
-  "KIT KAT CHOCOLATE OBLEA BAN TRP CHC 41.5GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KIT-KAT", "ean": "7891000422052",},
-  "KIT KAT OBLEA BAN.CHOCOLATE C/LECHE 41.5 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KIT-KAT", "ean": "7891000248799",},
-  "KIT KAT OBLEA BANADA CHOCOLATE 41.5GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KIT-KAT", "ean": "7891000441039",},
-  "KIT KAT OBLEA.BANADA BCO CHOCOLATE 41.5GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KIT-KAT", "ean": "7891000379028",},
-  "M PROPIAS": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "M PROPIAS", "ean": "1",},
-  "MANTECOL OYG GALL OBLEA BANADA CHC 27GR PAQ 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "MANTECOL", "ean": "7790380026426",},
-  "NESTLE ALMENDRAS BAN CHC O BANADOS 80GR POUCH 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "NESTLE", "ean": "8445291996809",},
-  "NESTLE AVELLANAS BAN CHC O BANADOS 80GR POUCH 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "NESTLE", "ean": "8445291996731",},
-  "NUGATON BAÑ CHOCO.ESTUCHE 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "NUGATON", "ean": "7792360092681",},
-  "NUGATON OBLEA BAN.CHO.C/LEC.PAQ. 27 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "NUGATON", "ean": "7792360072447",},
-  "NUGATON OBLEA CHOCOLATE BLANCO 27 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "NUGATON", "ean": "7792360072461",},
-  "CONOSUR PASAS DE UVA C/CHOCO 150GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7798143356148",},
-  "HAPPY FOOD BOCADITO DDL S/TACC 40GR 3UN PAQ 120G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7798308250151",},
-  "KENNILAR NARANJA BANADA POTE 150 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7798066799480",},
-  "LA CASA PRALINE 3 CHOCHOLATES 250GR CAJA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740903776",},
-  "LA CASA TURRON CHOCO/NARANJA BANA. CJA 225 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740901918",},
-  "LACASA ALMEND BANA CHOC NEGRO 125G BOL 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740910569",},
-  "LACASA ALMEND BANA CHOC NEGRO 125G BOL 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740910576",},
-  "LACASA ARANDANO BANA CHOC NEGRO 125G BOL 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740911733",},
-  "LACASA PASAS BANA CHOC NEGRO 150G BOL 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740907064",},
-  "LADDU BAR BARRITA FRUTOS ROJOS 30GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8904150127438",},
-  "LADDU BAR BARRITA VEGANA BROWNIE 30GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8906038788601",},
-  "LADDU BAR BARRITA VEGANA COCO 30GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8906038788649",},
-  "NEVARES SMACK CUBA.RELL.MOU.BAN.C/CH. 27 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7798094223605",},
-  "NEVARES SMACK OBLEA BANADA 33 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7798094220444",},
-  "PLENARIO PASAS DE UVA BAN.C/CHOCO.MIX 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7792307030080",},
-  "PLENARIO PASAS DE UVA BAN.C/CHOCO.NEG. 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7792307030141",},
-  "SABE BIEN ! BRAUNICHOC O BAN 35GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7793890261530",},
-  "SMACK BARRA RELLENA BANADA 35GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7798094223360",},
-  "SNICKER BARRA RELLENA 48GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "SNICKERS", "ean": "7506174512248",},
-  "SNICKERS ALMOND BARRA 49.9 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "SNICKERS", "ean": "40000001058",},
-  "VIZZIO ALMENDRAS BAN CHC 80GR POUCH 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "VIZZIO", "ean": "7792360098003",},
-  "VIZZIO CEREAL BAN.C/CHO.BOLSA 33 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "VIZZIO", "ean": "7792360091776",},
-  "VIZZIO CROCANTE CEREAL BAN.C/CHO. 80 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "VIZZIO", "ean": "7792360097983",},
-  "AFTER EIGHT MINT BOMBONES 200 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "AFTER EIGHT", "ean": "7613032596668",},
-  "NESTLE ALPINO BOMBONES CHC 195GR CAJA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ALPINO", "ean": "7891000067253",},
-  "BARILOCHE BOMBONERA LENTEJA 150GR CAJA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BARILOCHE", "ean": "7792430902698",},
-  "BONAFIDE BOCADITO DULCE DE LECHE 16 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BONAFIDE", "ean": "7792360070047",},
-  "GAROTO BOMBONES SURTIDOS CAJA 250GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "GAROTO", "ean": "7891000392775",},
-  "GAROTO SERENATA DE AMOR O BAN 140.8GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "GAROTO", "ean": "7891000404249",},
-  "LINDT LINDOR BOMBON CHOCO.CJA 75 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "LINDT", "ean": "8003340096247",},
-  "LINDT LINDOR BOMBONES LECHE 75GR CAJA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "LINDT", "ean": "8003340096230",},
-  "MECANO BOCAD CHOC RELL 19GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "MECANO", "ean": "7792360094906",},
-  "NESTLE ESPECIALIDADES BOMB.SURT. 251 GR CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "NESTLE", "ean": "7891000391068",},
-  "NESTLE TAB CHOC SOL BYB 22GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "NESTLE", "ean": "8445291565203",},
-  "LACASA TRUFAS AL CACAO PUROBOMBONES 200 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "8410740050616",},
-  "LACASA TRUFAS NARANJA BOMBONES 200 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "8410740905817",},
-  "NEUGEBAUERLEMBRANIA BOMBONES SURTIDOS 200 GR CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "7891330016068",},
-  "NEVARES SMACK BOMBON 16GR PAQ REGULAR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "7798094221793",},
-  "SMACK BOMBON MOUS CHC 160GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "7798094223889",},
-  "FERRERO ROCHER BOMBON CJA 4U 50G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "7898024397861",},
-  "FERRERO ROCHER BOMBON ESTUCHE 150GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "7898024396994",},
-  "FERRERO ROCHER BOMBONES 100 GRCAJA PL.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "7861002900117",},
-  "FERRERO ROCHER BOMBONES 12.5 GRPAQ.X 3 U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "78909434",},
-  "FERRERO ROCHER BOMBONES 300 GREST.PL.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "8000500009673",},
-  "BARILOCHE CH CONF 100GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BARILOCHE", "ean": "7792430904043",},
-  "BARILOCHE LENTEJAS CONFITADAS BOLSA 80GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BARILOCHE", "ean": "7792430095840",},
-  "BARILOCHE MANI COLOR CHOCOLATE 120GR BOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BARILOCHE", "ean": "7792430095680",},
-  "BARILOCHE MANI CON CHOCOLATE 120 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BARILOCHE", "ean": "7792430095420",},
-  "BARILOCHE TURRON BANADO MANI 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BARILOCHE", "ean": "7792430608651",},
-  "BONAFIDE MANI BAN CHOCO 80GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BONAFIDE", "ean": "7792360097112",},
-  "GEORGALOS CONFITES LIC. INFANTIL CHOCOLATE BOLSA 80GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380037903",},
-  "GEORGALOS GARRAPIN. DE MANI BAN.C/CHO.80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380037811",},
-  "GEORGALOS MANI C/CH.CONFITADO 100 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380011897",},
-  "GEORGALOS MANI C/CHOCOLATE 120GR BOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380004783",},
-  "GEORGALOS MANI COLOR C/CHOCOLATE 80GR BOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380037828",},
-  "GEORGALOS MANI CON CHOCOLATE 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380037736",},
-  "GEORGALOS MANI CON CHOCOLATE BOLSA 120 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380037743",},
-  "GEORGALOS MANI CROC.BAN.C/CHO. 100 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380011880",},
-  "M & M´S CONFITES CHOCO. PAQ. 48 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "7797453001441",},
-  "M & M´S MINIS CONFITES CHOCO. TBO 30 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "7797453001465",},
-  "M & M'S CHOC CONF 40GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "40000508830",},
-  "M & M'S CHOC CONFITES 46.2GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "40000001447",},
-  "M & M'S MANI CON CHOCOLATE PAQ. 49 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "7797453001458",},
-  "M & M'S PEANUT CANDIES CONFITES 150.3 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "40000017325",},
-  "M & M'S PLAIN GRAGEAS C/CHOCOLATE 150 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "40000017318",},
-  "M PROPIAS": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M PROPIAS", "ean": "1",},
-  "BREK MANI CON CHOCOLATE BOLSA 70 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7798036730796",},
-  "CANNETTINEMANI CON CHOCOLATE FLOW PACK 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7798036732004",},
-  "CANNETTINEMANI CON CHOCOLATE FLOW PACK 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7798036732097",},
-  "CONGUITOS MANI BAN C/CHOCOLATE 80GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "8410740924894",},
-  "CONOSUR ALMENDRA C/CHOCOLATE 150GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7798143356117",},
-  "CONOSUR AVELLANA C/CHOCOLATE 150GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7798143356124",},
-  "CONOSUR CHOCO C/LECHE CONFITADO 150GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7798143356162",},
-  "CONOSUR MANI CON CHOCOLATE 150GR 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7798143356131",},
-  "KING MANI CON CHOCOLATE 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7798151950697",},
-  "LACASA LENTEJAS DE CHOC CONF 190GR 1U BOL": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "8410740006262",},
-  "PLENARIO GARRAPINA.DE MANI BAN.C/CHO. 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7792307030073",},
-  "PLENARIO LENTEJAS C/CHOCO. BOLSA 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7792307030158",},
-  "PLENARIO MANI CON CHOCOLATE BOLSA 150 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7792307003312",},
-  "PLENARIO MANI CON CHOCOLATE MIX 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7792307030066",},
-  "PLENARIO MANI CON CHOCOLATE NEGRO 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7792307030059",},
-  "PLENARIO MANI CON CHOCOLATE SURT 80GR BOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7792307030011",},
-  "SKITTLES ORIGINAL GRAGEAS DE CHOCOL. 204.1 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "40000140924",},
-  "VIZZIO MANI BANAD. C/CHOCOLATE 85GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "VIZZIO", "ean": "7792360094548",},
-  "VIZZIO MANI BANADO C/CHOCOLATE 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "VIZZIO", "ean": "7792360097976",},
-  "BONAFIDE FIGURA DE CHOCOLATE CONEJO SIN 60 GR PAS NAV": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "BONAFIDE", "ean": "7802200844186",},
-  "KINDER JOY HUEVO DE CHOCOLATE 20 GRC/SORPRESA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER JOY", "ean": "78602731",},
-  "KINDER JOY HUEVO DE CHOCOLATE 20 GRX 2U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER JOY", "ean": "7861002900421",},
-  "KINDER C/ LECHE P/NENA C/SORP 20 GRS HYF 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "78931053",},
-  "KINDER C/LECHE P/NENE C/SORP 20 GRS HYF 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "40084107",},
-  "KINDER JOY HUEVO CHO. 20 GR CAJA 2U C/SORP": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "7797394002453",},
-  "KINDER SORPRESA NENA HUEVO DE CHO. 20 GRCAJA 2 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "7898024395867",},
-  "KINDER SORPRESA SELVATICOS HUEVO CHOC. 20 GR 2 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "7797394001555",},
-  "CANNETTINEHUEVO DE CHOCOLATE BLANCO 250 GRPASCUAS": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "O MARCAS", "ean": "7798036731915",},
-  "PECOSOS HUEVITOS D/CHOC 110GR 1U S/SORP BOL": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "O MARCAS", "ean": "8410740917476",},
-  "NESTLE CHOC ALPINO TAB.SOL. 85GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ALPINO", "ean": "7891000336373",},
-  "BARILOCHE DUO TABLETA CHOC SOLIDA 35GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "BARILOCHE", "ean": "7792430611620",},
-  "BARILOCHE TABLE. CHOC C/MANI 30GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "BARILOCHE", "ean": "7792430611644",},
-  "BARILOCHE TABLETA ALM C/LECH TAB.SOL 100GR 1U CJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "BARILOCHE", "ean": "7792430903374",},
-  "BARILOCHE TABLETA BCO C/ALM TAB.SOL 100GR 1U CJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "BARILOCHE", "ean": "7792430903404",},
-  "BARILOCHE TABLETA CHC SOLIDA 70GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "BARILOCHE", "ean": "7792430903695",},
-  "BARILOCHE TABLETA CHC SOLIDA 70GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "BARILOCHE", "ean": "7792430903701",},
-  "BARILOCHE TABLETA CHC SOLIDA 70GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "BARILOCHE", "ean": "7792430903718",},
-  "BARILOCHE TABLETA CHC SOLIDA 70GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "BARILOCHE", "ean": "7792430903725",},
-  "BARILOCHE TABLETA RELL C/DDL 35GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "BARILOCHE", "ean": "7792430611606",},
-  "BARILOCHE TABLETA RELL C/DDL 35GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "BARILOCHE", "ean": "7792430611668",},
-  "BONAFIDE TABLETA CHOCO SOLIDA 30GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "BONAFIDE", "ean": "7792360952657",},
-  "CACHAFAZ TAB C/AVELL C/LECH SOLIDA 100GR 1U CJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "EL CACHAFAZ", "ean": "7798128002190",},
-  "CACHAFAZ TAB C/L ALMENDRA SOLIDA 100GR 1U CJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "EL CACHAFAZ", "ean": "7798128002183",},
-  "GEORGALOS 60% CACAO TAB.SOLIDA 25GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "7790380024712",},
-  "GEORGALOS BLANCO TAB.SOLIDA 25 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "7790380024217",},
-  "GEORGALOS C MOUSE DDL TAB.RELLE.100GR 1U CAJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "7790380033240",},
-  "GEORGALOS C/LECHE TAB.SOLIDA 25 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "7790380024194",},
-  "GEORGALOS C/PASTA DE ALMEND.TAB.RELL. 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "7790380013662",},
-  "GEORGALOS CHOCOLATIN BCO. TAB.SOLIDA 8 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "77969361",},
-  "GEORGALOS CHOCOLATIN TAB.SOLIDA 8 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "77969354",},
-  "GEORGALOS DDL TAB.RELLE.100GR 1U CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "7790380033349",},
-  "GEORGALOS FULL MANI SOLIDAS 100 GRS PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "7790380024750",},
-  "GEORGALOS FULL MANI SOLIDAS 35 GRS PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "7790380024408",},
-  "GEORGALOS PAST MANI MOUS TAB.RELLE.100GR 1U CAJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "7790380033356",},
-  "KINDER CHOCOLATE C/LECHE TAB.SOLIDA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "KINDER", "ean": "77949707",},
-  "KINDER CHOCOLATE C/LECHE TAB.SOLIDA 50 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "KINDER", "ean": "77949677",},
-  "KINDER TAB.SOLIDA 12.5 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "KINDER", "ean": "80050315",},
-  "KINDER MAXI TAB.SOLIDA 21 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "KINDER MAXI", "ean": "80050094",},
-  "LINDT EXCELLENCE DARK TAB.SOLIDA 100 GRIMP": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "3046920028370",},
-  "LINDT EXCELLENCE TAB.SOLIDA 100 GRIMP": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "3046920028363",},
-  "LINDT IMP0RTADO SWISSALMONTAB.SOLIDA 100 GRS.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "7610400014038",},
-  "LINDT IMPORTADA HAZELNUT TAB.SOLIDA100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "7610400010023",},
-  "LINDT IMPORTADO HAZELNUT MILK 100 GR TAB.SOLID": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "7610400010016",},
-  "LINDT IMPORTADO WHITE TAB.SOLIDA100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "7610400014571",},
-  "M PROPIAS": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "M PROPIAS", "ean": "1",},
-  "MECANO TAB.CHOC BCO DDL RELLE. 45GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MECANO", "ean": "7792360095279",},
-  "MECANO TAB.CHOC DDL RELLE. 45GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MECANO", "ean": "7792360095262",},
-  "MECANO TUERCA TAB.RELLE. 19 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MECANO", "ean": "7792360072423",},
-  "NESTLE CHOCOTRIO CHC RELL C/GALL 90GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7891000377543",},
-  "NESTLE CHOCOTRIO CHC RELL C/GALL 90GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7891000377598",},
-  "NESTLE CHOCOTRIO CHC RELL C/GALL 90GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7891000377642",},
-  "NESTLE GALAK SOLIDA 80GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7891000368626",},
-  "NESTLE MANI SOLIDAS 33GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7613287526236",},
-  "NESTLE MANI SOLIDAS 90GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7613287529497",},
-  "NESTLE TAB CHC SOLIDAS 45GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565173",},
-  "NESTLE TAB CHOC SOLIDAS 50GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565333",},
-  "NESTLE TAB CHOC SOLIDAS 50GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565395",},
-  "NESTLE TAB CHOC. SOLIDAS 25GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565364",},
-  "NESTLE TAB CHOC. SOLIDAS 25GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565425",},
-  "NESTLE TABLETA CHOCO CON MANI 150GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7613287526311",},
-  "NESTLE CLASSIC AMARGO TAB.SOLIDA 80GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE CLASSIC", "ean": "7891000368572",},
-  "NESTLE CLASSIC DIPLOMATA SOLIDAS 80GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE CLASSIC", "ean": "7891000368893",},
-  "NESTLE CLASSIC TAB.SOLIDA 80GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE CLASSIC", "ean": "7891000369098",},
-  "NESTLE DUO CLASSIC TAB.SOLIDA 80GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE CLASSIC", "ean": "7891000368992",},
-  "NESTLE CRUNCH SOLIDA 80GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE CRUNCH", "ean": "7891000369371",},
-  "BALL CHOC BARRA CON LECHE Y MANI 30 GRS PAQUETE": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7795522003983",},
-  "BALL CHOC CHOCOLATE C/LECHE Y MANI 70 GRTAB.SOLIDA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7795522003242",},
-  "BENEVIA RELLENAS 12GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7798040462973",},
-  "NEUGEBAUER TABLETA CHC SOLIDA 80GR CJ 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7891330019977",},
-  "NEUGEBAUER TABLETA CHC SOLIDA 80GR CJ 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7891330019991",},
-  "NEUGEBAUER TABLETA CHC SOLIDA 80GR CJ 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7891330020003",},
-  "NEUGEBAUER TABLETA CHC SOLIDA 80GR CJ 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7891330020010",},
-  "NEUGEBAUER TABLETA CHC SOLIDA 80GR CJ 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7891330021505",},
-  "VAUQUITA TAB. DDL SOLIDA 22GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "77927361",},
-  "VAUQUITA TAB.SOLIDA 22GR X4U PAQ88GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7798138290136",},
-  "NESTLE SUFLAIR CHOCOLATE C/LECHE 50 GRTAB.AIREA.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SUFLAIR", "ean": "7891000107836",},
-  "NESTLE SUFLAIR DUO TAB.AIREA. 80GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SUFLAIR", "ean": "7891000329665",},
-  "SUFLAIR MILK AIREADO TABLETA 80GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SUFLAIR", "ean": "7891000329856",},
-  "TODDY TABLETAS AIREADAS 50GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TODDY", "ean": "7790380018056",},
-  "TODDY TABLETAS CHC SOLIDA 60GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TODDY", "ean": "7790380025139",},
-  "TODDY TABLETAS RELLENAS 60GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TODDY", "ean": "7790380025115",},
-  "TODDY TABLETAS RELLENAS 60GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TODDY", "ean": "7790380025122",},
-  "TOKKE CHOC C/LECHE TAB.SOLIDA 60 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TOKKE", "ean": "7790380022114",},
-  "TOKKE CHOC.SOLIDA C/LECHE MANI 500GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TOKKE", "ean": "7790380022206",},
-  "TOKKE LECHE C/MANI TAB.SOLIDA 62GR 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TOKKE", "ean": "7790380022121",},
-  "TOKKE TAB.RELLE DDL 72GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TOKKE", "ean": "7790380022107",},
-  "VIZZIO TAB SOLIDA BLANCO 50GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360095064",},
-  "VIZZIO TAB SOLIDA C LECHE 50GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360095002",},
-  "VIZZIO TAB. CHOC C/LECHE Y ALMENDRAS 35GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360094524",},
-  "VIZZIO TAB. CHOCO C/ALMENDRAS 100GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360094586",},
-  "VIZZIO TAB.SOLIDA Y MANI 35GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360094500",},
-  "VIZZIO TABLE CHOC BLANCO 90GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360095071",},
-  "VIZZIO TABLE CHOC C/LECHE 90GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360095019",},
-  "VIZZIO TABLETA CHOC. RELL. 45GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360095705",},
-}
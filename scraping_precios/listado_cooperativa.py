@@ -1,826 +0,0 @@
-productos = {
-  "ARCOR JUGO EN POLVO DURAZNO CAJA X18U 15GR C/U P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580144395", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR JUGO POLVO REG FRUTILLA SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143244", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR POLVO ANANA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580141516", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR POLVO LIMONADA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143527", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR POLVO MANZANA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580144142", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR POLVO NARANJA BANANA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580141509", "cod_coope": "314376",},
-  "ARCOR POLVO NARANJA DULCE REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143008", "cod_coope": "314377",},
-  "ARCOR POLVO NARANJA DURAZNO REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580141943", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR POLVO NARANJA MANGO REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143763", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR POLVO NARANJA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143237", "cod_coope": "314372",},
-  "ARCOR POLVO REG MULTIFRUTA SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580142490", "cod_coope": "NO_ENCONTRADO",},
-  "BC LA CAMPAGNOLA NARANJA DULCE SIN AZU SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129965", "cod_coope": "286548",},
-  "BC LA CAMPAGNOLA POMELO AMARILLO SIN AZU. SOB .7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129576", "cod_coope": "NO_ENCONTRADO",},
-  "BC LA CAMPAGNOLA S/AZU FRUTI LIMON SOB 7G P/1L CJ 18U": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580131845", "cod_coope": "NO_ENCONTRADO",},
-  "BC LA CAMPAGNOLA S/AZU LIMONADA SOB 7G P/1L CJ 18U": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580131784", "cod_coope": "286545",},
-  "BC LA CAMPAGNOLA S/AZU MIX FRUTAL SOB 7G P/1L CJ 18U": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580130381", "cod_coope": "286546",},
-  "BC LA CAMPAGNOLA SIN AZU ANANA SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129620", "cod_coope": "NO_ENCONTRADO",},
-  "BC LA CAMPAGNOLA SIN AZU MANZANA SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129972", "cod_coope": "286549",},
-  "BC LA CAMPAGNOLA SIN AZU NAR/DUR SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129880", "cod_coope": "286550",},
-  "BC LA CAMPAGNOLA SIN AZU NARANJA SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580132774", "cod_coope": "286544",},
-  "BC LA CAMPAGNOLA SIN AZU. MANGO NARANJA SOB .7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129958", "cod_coope": "286547",},
-  "BC LA CAMPAGNOLA SIN AZU. POMELO ROSADO SOB .7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129644", "cod_coope": "286552",},
-  "BAGLEY AMOR DUL RELL 330GR C/3U PAQUETE AGR 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "AMOR", "ean": "7790040143500", "cod_coope": "311224",},
-  "BAGLEY AMOR VAINILLA DULCE RELLENA 110GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "AMOR", "ean": "7790040143531", "cod_coope": "311223",},
-  "BAGLEY SURTIDO DUL.SECA 400GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAGL SURT", "ean": "7790040147720", "cod_coope": "313302",},
-  "ARCOR CEREAL MIX AVENA Y PASAS DUL.SECA PAQ. 207 G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040135741", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR CEREAL MIX DUL.SECA CACAO 150GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040140943", "cod_coope": "313295",},
-  "ARCOR CEREAL MIX DUL.SECA FRUTILL 150GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040140936", "cod_coope": "313294",},
-  "ARCOR CEREAL MIX GALL.CM.AVE/CHOC 207GR 1UN PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040145023", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR CEREAL MIXAVE/SEM/CHIPS DUL.SECA 207 GR PAQ.": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040135758", "cod_coope": "NO_ENCONTRADO",},
-  "BAGLEY CHOCOLINAS BCO DUL SEC 245GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040142985", "cod_coope": "309274",},
-  "BAGLEY CHOCOLINAS DUL.SECA PAQ.170G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040143227", "cod_coope": "311225",},
-  "BAGLEY CHOCOLINAS DULCE SECA250 GRS. PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040143234", "cod_coope": "311226",},
-  "BAGLEY CHOCOLINAS GALL DUL.SECA 181GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040148864", "cod_coope": "NO_ENCONTRADO",},
-  "BAGLEY CHOCOLINAS GALLET DUL.SEC PAQUETE 170G 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040148857", "cod_coope": "NO_ENCONTRADO",},
-  "BAGLEY CHOCOLINAS NEG DUL SEC. 258GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040142992", "cod_coope": "309272",},
-  "BAGLEY GALL CHOCOLINAS DUL SEC 100GR PAQUE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040143241", "cod_coope": "311228",},
-  "ARCOR COFLER BLOCK DULCE SECA PAQ. 124 GR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040116955", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR COFLER BOB GALL RELL 85GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143807", "cod_coope": "312472",},
-  "ARCOR COFLER COOKIES DULCE SECA BOLSA 120 GR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040127944", "cod_coope": "284501",},
-  "ARCOR COFLER GALL BANADA CHC 105.6G PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143739", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR COFLER GALL OBLEAS 87GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143821", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR COFLER GALL TARTAL.BAN CHC 105.6GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143753", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR COFLER GALL. BAN CHC 132.8GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143692", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR COFLER GALLET DULCE RELL 85GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143777", "cod_coope": "312471",},
-  "ARCOR COFLER GALLET DULCE RELL 85GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143784", "cod_coope": "312473",},
-  "ARCOR COFLER GALLETA DULCE OBLEA 91GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143814", "cod_coope": "NO_ENCONTRADO",},
-  "BAGLEY COQUITAS DULCE SECA 260GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COQUITAS", "ean": "7790040143265", "cod_coope": "312158",},
-  "ARCOR DIVERSION SURTIDO DU.SE.REL. 400 GRBOLSA": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DIVERSION", "ean": "7790040143364", "cod_coope": "311230",},
-  "ARCOR FORMIS ANIMALES DULCES SECAS 72 GRS PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139909", "cod_coope": "294184",},
-  "ARCOR FORMIS C/D.DE LECHE DUL.RELL 72GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139916", "cod_coope": "294186",},
-  "ARCOR FORMIS DDL DUL REL 102GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139961", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR FORMIS FRUTILLA DUL REL 102GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139923", "cod_coope": "294178",},
-  "ARCOR FORMIS VAI/CHO DUL REL 102GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139930", "cod_coope": "294180",},
-  "ARCOR FORMIS VAIN/FRUT DUL.RELL 72GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139893", "cod_coope": "294183",},
-  "ARCOR MANA CHOC DUL SEC 136GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040137912", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR MANA CHOCOLATE DUL.RELLE.152 GR. PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040133242", "cod_coope": "282679",},
-  "ARCOR MANA FRUTILLA DR 152 GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040133266", "cod_coope": "282680",},
-  "ARCOR MANA LIMON DUL.RELLE.152 GR. PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040133259", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR MANA VAIN ACARAMELADA DS 145GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040151901", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR MANA VAIN DUL.SEC 136GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040137837", "cod_coope": "291902",},
-  "ARCOR MANA VAIN DUL.SEC. 136GR PAQ 3U 408G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040137844", "cod_coope": "291904",},
-  "ARCOR MANA VAINILLA DUL.RELLE.152 GR. PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040133235", "cod_coope": "282678",},
-  "BAGLEY MELITAS C/MIEL DUL SEC 159GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELITAS", "ean": "7790040139770", "cod_coope": "294192",},
-  "BAGLEY MELLIZAS DUCE .RELL. 110GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELLIZAS", "ean": "7790040143548", "cod_coope": "311934",},
-  "BAGLEY MELLIZAS GALL DUL RELL 330GR 1U PAQ AGR X3": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELLIZAS", "ean": "7790040143555", "cod_coope": "312484",},
-  "BAGLEY MERENGADAS DUL.REL. 88GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MERENGADA", "ean": "7790040139657", "cod_coope": "292473",},
-  "BAGLEY MERENGADAS. DUL.REL. 88GR PAQ AGR 3U 264G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MERENGADA", "ean": "7790040139091", "cod_coope": "292536",},
-  "ARCOR GALLETA OBLEA WF 25GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O ARCOR", "ean": "77940131", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR GALLETA OBLEA WF 25GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O ARCOR", "ean": "77975737", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR GALLETA TURROKLET OB/WF 25GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O ARCOR", "ean": "77993540", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR OBLEA RELL TURRON Y MANI 25GR PAQ 250G 10UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O ARCOR", "ean": "7790580401504", "cod_coope": "NO_ENCONTRADO",},
-  "BAGLEY OPERA OBLEA PAQUETE 55 GR ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OPERA", "ean": "77903501", "cod_coope": "NO_ENCONTRADO",},
-  "BAGLEY OPERA OBLEAS 220 GRS. PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OPERA", "ean": "7790040008175", "cod_coope": "174564",},
-  "BAGLEY OPERA OBLEAS DUL.RELLE.92 GR PAQUE.ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OPERA", "ean": "77903518", "cod_coope": "NO_ENCONTRADO",},
-  "BAGLEY PORTENITAS D.S VAINILLA/CARAME PAQ. 139G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PORTENITAS", "ean": "7790040132689", "cod_coope": "282675",},
-  "BAGLEY PORTENITAS D.SEC VAIN/CARAME PAQ AGR 417G 3X 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PORTENITAS", "ean": "7790040151192", "cod_coope": "NO_ENCONTRADO",},
-  "BAGLEY RUMBA GALL DUL.RELL. 110GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "RUMBA", "ean": "7790040143517", "cod_coope": "312155",},
-  "BAGLEY RUMBA GALLET DUL.RELL. 330GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "RUMBA", "ean": "7790040143524", "cod_coope": "311937",},
-  "BAGLEY SONRISAS DR 108 GRS PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SONRISAS", "ean": "7790040133488", "cod_coope": "NO_ENCONTRADO",},
-  "BAGLEY SONRISAS FRAM DL RELLE 108GR PACK X3 U 324 G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SONRISAS", "ean": "7790040133471", "cod_coope": "282668",},
-  "BAGLEY CRIOLLITAS CRACKERS 100 GR C/U PAQ.X 3 U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040377806", "cod_coope": "NO_ENCONTRADO",},
-  "BAGLEY CRIOLLITAS ORIGINAL CR. 499G EST FAM 5X 1UN PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040139015", "cod_coope": "NO_ENCONTRADO",},
-  "BAGLEY CRIOLLITASORIGINAL CRACKERS 100 GR PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040377707", "cod_coope": "NO_ENCONTRADO",},
-  "BAGLEY CRIOLLITASTOST.CLAS.CRACK 195 GR PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040124509", "cod_coope": "278079",},
-  "BAGLEY CEREAL C/SALVADO 169GR 3U PAQ AGR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "FAM", "ean": "7790040136243", "cod_coope": "289711",},
-  "ARCOR HOGARENAS 7 SEMILLAS CEREAL 189GR X3U PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040136076", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR HOGARENAS C/SESAMO CEREAL 167 GR PAQUE.": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040136083", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR HOGARENAS SALVADO CEREAL 200 G.C/U PAQ.X 3 UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040132955", "cod_coope": "282355",},
-  "ARCOR HOGARENAS SALVADO CEREAL 200 GRS. PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040132962", "cod_coope": "282354",},
-  "BAGLEY KESITAS GALL SNACKS QUESO 250GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "KESITAS", "ean": "7790040144033", "cod_coope": "312903",},
-  "BAGLEY KESITAS HORNEADAS SNACKS 125 GR CAJA": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "KESITAS", "ean": "7790040173200", "cod_coope": "178481",},
-  "BAGLEY REX KESITAS SNACKS 75 GRBOLSA ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "KESITAS", "ean": "7790040003606", "cod_coope": "NO_ENCONTRADO",},
-  "BAGLEY REX ORIGINAL SNACK 225GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "REX", "ean": "7790040144125", "cod_coope": "312902",},
-  "BAGLEY REX ORIGINAL SNACKS 125 GR CAJA": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "REX", "ean": "7790040719804", "cod_coope": "163264",},
-  "BAGLEY REX ORIGINAL SNACKS BOL 75 GRARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "REX", "ean": "7790040003569", "cod_coope": "101335",},
-  "ARCOR SALADIX DUO JAM.Y QUESO SNACKS 25 GR. BOLSA ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790040374706", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR SALADIX PIZZA SNACKS 100 GRS. CAJA": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790580697303", "cod_coope": "139319",},
-  "SALADIX SALADIX SN PICANTE 100GR CAJA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790040141254", "cod_coope": "315364",},
-  "SALADIX XTRA PICANTE SNACKS CAJA 100 GRS 1U ARCOR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790040147775", "cod_coope": "NO_ENCONTRADO",},
-  "BAGLEY GALL TRAVIATA ORIGINAL CR 324GR PAQ AGR 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040144088", "cod_coope": "311935",},
-  "BAGLEY TRAVIATA C/REX GALL CRACKER 288GR X3 PAQ AGR 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040143920", "cod_coope": "315329",},
-  "BAGLEY TRAVIATA CRACKERS 108GR 5U PAQUETE 540G PAQ AGR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040144095", "cod_coope": "311216",},
-  "BAGLEY TRAVIATA GALL CR C/ REX SAL ORIG 1U PAQUETE 96GR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040143937", "cod_coope": "312904",},
-  "BAGLEY TRAVIATA GALL CR KESIT 1U PAQUETE 96GR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040143944", "cod_coope": "312905",},
-  "BAGLEY TRAVIATA.CRACKERS 108GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040144071", "cod_coope": "312159",},
-  "TRAVIATA BAGLEY BALANCE CR 321GR X3U PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040142763", "cod_coope": "NO_ENCONTRADO",},
-  "AGUILA ALFAJOR MINITORTA TRIPLE 69GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "AGUILA", "ean": "7790040133587", "cod_coope": "NO_ENCONTRADO",},
-  "AGUILA ALFAJOR.MINITORTA BROWNI 71.5GR TRPL PQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "AGUILA", "ean": "7790040133594", "cod_coope": "292546",},
-  "BAGLEY B & N 3.0 ALFAJOR BLANCO 73.5 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BLCO/NGRO", "ean": "7790040991910", "cod_coope": "NO_ENCONTRADO",},
-  "BAGLEY B & N 3.0 ALFAJOR NEGRO 73.5 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BLCO/NGRO", "ean": "7790040375000", "cod_coope": "NO_ENCONTRADO",},
-  "BON O BON ALFAJORES MINI 19.5GR X6 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BON O BON", "ean": "7790040129764", "cod_coope": "NO_ENCONTRADO",},
-  "BON O BON BLANCO ALFAJOR 40 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BON O BON", "ean": "7790040613607", "cod_coope": "113860",},
-  "BON O BON NEGRO ALFAJOR 40 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BON O BON", "ean": "7790040613706", "cod_coope": "113858",},
-  "BON O BON NEGRO ALFAJOR 40 GRPAQ.X6 U.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BON O BON", "ean": "7790040613904", "cod_coope": "132292",},
-  "BON O BON NEGRO ALFAJOR TRIPLE 60 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BON O BON", "ean": "7790040614000", "cod_coope": "NO_ENCONTRADO",},
-  "COFLER CHOCO CREAMY ALFAJOR TRIPLE 60GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCO CREAMY", "ean": "7790040150010", "cod_coope": "NO_ENCONTRADO",},
-  "CHOCOTORTA ALFAJOR TRIPLE 71.5GR PAQ 1UN BAGLEY": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOTORTA", "ean": "7790040150072", "cod_coope": "317788",},
-  "COFLER BLOCK RELL.CHOC.ALF.TRIPLE 60 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "COFLER", "ean": "7790040659605", "cod_coope": "NO_ENCONTRADO",},
-  "TATIN TRIPLE BLANCO ALFAJOR 60 GRARG": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TATIN", "ean": "7790040405301", "cod_coope": "270444",},
-  "TOFI TRIPLE BLANCO ALFAJOR 73 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TOFI", "ean": "7790040953703", "cod_coope": "NO_ENCONTRADO",},
-  "AGUILA ALMENDRAS BAN C/CHOCOLAT 120GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "AGUILA", "ean": "7790580142384", "cod_coope": "NO_ENCONTRADO",},
-  "AGUILA BARRA MOUSSE BANADA160GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "AGUILA", "ean": "7790580131135", "cod_coope": "NO_ENCONTRADO",},
-  "AGUILA BARRA TRIFLE BANADA 160GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "AGUILA", "ean": "7790580131111", "cod_coope": "NO_ENCONTRADO",},
-  "AGUILA NUT OBLEA BANADA CHOC 105GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "AGUILA", "ean": "7790580147556", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR CEREAL DE ARROZ BAN CHC 50GR BOL 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ARCOR", "ean": "7790580142414", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR TURRON BANADO C/CHOCOLA.90 GR CAJA ARG": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ARCOR", "ean": "7790580392604", "cod_coope": "NO_ENCONTRADO",},
-  "BON O BON BLANCA OBLEA BANADA 30 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580346614", "cod_coope": "NO_ENCONTRADO",},
-  "BON O BON CUBANITOS RELLE.BAN.C/CHOCO. 78GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580146948", "cod_coope": "NO_ENCONTRADO",},
-  "BON O BON OBLEA BANADA 30 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580346508", "cod_coope": "136955",},
-  "BON O BON XL OBLEA BAN.CHO.C/LEC. 45 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580109646", "cod_coope": "258397",},
-  "BON O BON.TENTACION BARRA MANI/OBLEA 120 GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580141301", "cod_coope": "NO_ENCONTRADO",},
-  "COFLER ALMENDRAS BAN C/CHOCO 100GR BOL 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580141714", "cod_coope": "NO_ENCONTRADO",},
-  "COFLER BLANCO OBLEA BAN TRPL C/CHOCLIN 110GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580142513", "cod_coope": "NO_ENCONTRADO",},
-  "COFLER BLOCK OBLEA BAN CHOCOMANI TRPL 110GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580141394", "cod_coope": "NO_ENCONTRADO",},
-  "COFLER BLOCK XL OBLEA RELL BAN CHC 45GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580131562", "cod_coope": "NO_ENCONTRADO",},
-  "COFLER CHOCOLINAS BAN. BARRA 110GR PAQ. 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580146856", "cod_coope": "NO_ENCONTRADO",},
-  "COFLER CHOCOLINAS XL OBLEA BAN 45GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580131586", "cod_coope": "NO_ENCONTRADO",},
-  "COFLER CUBANITOS O BANADOS 29GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580121716", "cod_coope": "318427",},
-  "COFLER CUBANITOS O BANADOS 29GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580121723", "cod_coope": "318428",},
-  "COFLER CUBANITOS O BANADOS 29GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580123215", "cod_coope": "318429",},
-  "COFLER CUBANITOS O BANADOS 29GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580123222", "cod_coope": "318425",},
-  "COFLER PASAS BANAD C/CHOCO. 100GR BOL 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580141707", "cod_coope": "NO_ENCONTRADO",},
-  "COFLER GRAFFITI OBLEA BAN.RELLENA C/CHO. 45 GRPAQ.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GRAFFITI", "ean": "7790580111755", "cod_coope": "266486",},
-  "COFLER GRAFFITI OBLEA BANA RELL.45GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GRAFFITI", "ean": "7790580123741", "cod_coope": "279729",},
-  "ARCOR PASAS BAN.C/CHO. 100 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O ARCOR", "ean": "7790580135942", "cod_coope": "NO_ENCONTRADO",},
-  "ROCKLETS 3 DESEOS REGULAR PAQUETE 120 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ROCKLETS", "ean": "7790580122652", "cod_coope": "NO_ENCONTRADO",},
-  "ROCKLETS BOLLS CEREAL BAN.C/CHO. 120 GRPAQ.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ROCKLETS", "ean": "7790580118235", "cod_coope": "NO_ENCONTRADO",},
-  "AGUILA BYB BOCAD CHC 70GR CAJA 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "AGUILA", "ean": "7790580151539", "cod_coope": "NO_ENCONTRADO",},
-  "AGUILA MEDALLON CHOCOLATE 168GR 1U CAJA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "AGUILA", "ean": "7790580139872", "cod_coope": "NO_ENCONTRADO",},
-  "AGUILA MENTA BOMBON CH.RELL.MENTA 14 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "AGUILA", "ean": "77947505", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR EL KIOSCO EN CASA 246GR CAJA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ARCOR", "ean": "7790580131371", "cod_coope": "285115",},
-  "BON O BON AGUILA BOMBON 15 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "77953537", "cod_coope": "NO_ENCONTRADO",},
-  "BON O BON BOMBON BLANCO 16 GR.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "77961815", "cod_coope": "NO_ENCONTRADO",},
-  "BON O BON BOMBON COCO CHC 15GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "77990679", "cod_coope": "NO_ENCONTRADO",},
-  "BON O BON BOMBON LECHE DI 288 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580119157", "cod_coope": "243392",},
-  "BON O BON BOMBON REGULAR 15 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "77958921", "cod_coope": "NO_ENCONTRADO",},
-  "BON O BON BOMBONES BOTA NAVIDAD 150GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580146924", "cod_coope": "NO_ENCONTRADO",},
-  "BON O BON CHOCOLINAS BOMBON 15 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "77956712", "cod_coope": "NO_ENCONTRADO",},
-  "BON O BON NEGRO BOMBONES C/MOUSE 119 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580300609", "cod_coope": "NO_ENCONTRADO",},
-  "BON O BON SUPERBOLLS CHOC BCO POUCH 80 GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580135775", "cod_coope": "NO_ENCONTRADO",},
-  "COFLER CUPS BYB CHC 17.5GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "COFLER", "ean": "77989772", "cod_coope": "NO_ENCONTRADO",},
-  "COFLER CUPS ORIGINAL O BANADOS 17.5GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "COFLER", "ean": "77990754", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR SELECCION BOMB SURTIDO 228.6GR CAJA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "SELECCION", "ean": "7790580131388", "cod_coope": "285114",},
-  "ARCOR MANI COLOR CONF.C/CH. 80 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580106195", "cod_coope": "236399",},
-  "ARCOR MANI CON CHOC. BLANCO 80GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580139223", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR MANI CON CHOCOLATE 80 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580106027", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR MANI CON CHOCOLATE BOLSA 100 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580136444", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR MANI.CROCANTE BAN.C/CHC 100GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580141738", "cod_coope": "NO_ENCONTRADO",},
-  "BON O BON CITOS CONFITADOSPOTE 200 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BON O BON", "ean": "7790580111243", "cod_coope": "NO_ENCONTRADO",},
-  "COFLER BLOCK MANI C/CHOC BCO 100GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "COFLER", "ean": "7790580139780", "cod_coope": "NO_ENCONTRADO",},
-  "COFLER BLOCK MANI C/CHOCOLATE 100GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "COFLER", "ean": "7790580139797", "cod_coope": "NO_ENCONTRADO",},
-  "ROCKLETS EXTREME CHC CONF 20GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580120085", "cod_coope": "318430",},
-  "ROCKLETS GRAGEAS CHOCOLATE BOLSA 40 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580327415", "cod_coope": "153242",},
-  "ROCKLETS LENTEJAS COLOR BOLSA 150 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580107635", "cod_coope": "245329",},
-  "ROCKLETS MANI C/CHOCO. BOLSA 40 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580327613", "cod_coope": "NO_ENCONTRADO",},
-  "ROCKLETS MINI CONFITES C/CHOCO. 150 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580116583", "cod_coope": "263930",},
-  "ROCKLETS MINI GRAGEAS DE CHOCOLATE PAQUETE 120 GRS": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580418106", "cod_coope": "NO_ENCONTRADO",},
-  "ROCKLETS NAVIDAD GRAGEAS C/CHOCO. 120 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580415808", "cod_coope": "100962",},
-  "ROCKLETS NAVIDAD MANI CON CHOCOLATE 120 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580423001", "cod_coope": "NO_ENCONTRADO",},
-  "ROCKLETS PICANTE CHC CONF 20GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580120078", "cod_coope": "318431",},
-  "BON O BON HUEVO DE CHOCOLATE BLANCO 20 GRPAS/NAV.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "BON O BON", "ean": "7790580463403", "cod_coope": "263895",},
-  "BON O BON HUEVO DE CHOCOLATE C/LECHE 110 GRPAS/NAV.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "BON O BON", "ean": "7790580587802", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR 50 CACAO TABLETA SOLIDA 25 GR PAQ.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580120092", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR BLANCO TAB.SOLIDA 25 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580607418", "cod_coope": "178542",},
-  "ARCOR C/LECHE TAB.SOLIDA 25 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580607210", "cod_coope": "228529",},
-  "ARCOR CHOCO. MEDIO AMARGO PAQ. 80GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580104375", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR MILK RELLENA CHC 12GR PAQUETE 4UN 48G": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580135140", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR SOLIDAS C/LECHE Y MANI 95GR 1U PAQ": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580123734", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR TAB SOLIDA CHC PAQUETE 80GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580102852", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR TAB SOLIDA CHC PAQUETE 80GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580102890", "cod_coope": "318433",},
-  "ARCOR TAB SOLIDA CHC PAQUETE 80GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580103279", "cod_coope": "318435",},
-  "ARCOR TAB SOLIDA CHC PAQUETE 80GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580118655", "cod_coope": "318437",},
-  "BON O BON TABLETA CHC RELLENA 160GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "BON O BON", "ean": "7790580146047", "cod_coope": "313026",},
-  "COFFLER AIR BLANCO TAB.AIREA. 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103415", "cod_coope": "NO_ENCONTRADO",},
-  "COFFLER AIR C/LECHE TAB.AIREA. 100 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103446", "cod_coope": "172991",},
-  "COFLER AIR BLANCO TAB.AIREA. 100 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103453", "cod_coope": "232997",},
-  "COFLER AIR C/ALMENDR.TAB.AIREA. 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103439", "cod_coope": "NO_ENCONTRADO",},
-  "COFLER AIR CHO.C/LEC.TAB.AIREA. 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580033408", "cod_coope": "172994",},
-  "COFLER AIREADO MENTA SHAKE 30 GRTAB.AIREA.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "77948403", "cod_coope": "NO_ENCONTRADO",},
-  "COFLER BLOCK 300 C/LECHE Y MANI 300 GRTAB.SOLIDA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103743", "cod_coope": "232312",},
-  "COFLER BLOCK BCO C/MANI TAB.SOLIDA 38 GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "77981912", "cod_coope": "NO_ENCONTRADO",},
-  "COFLER BLOCK C/MANI TAB.SOLIDA 170 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580105013", "cod_coope": "244925",},
-  "COFLER BLOCK C/MANI TAB.SOLIDA 38 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "77953124", "cod_coope": "NO_ENCONTRADO",},
-  "COFLER BLOCK TAB.SOLIDA 110 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "77922120", "cod_coope": "NO_ENCONTRADO",},
-  "COFLER BLOCKAZO CHO.C/LEC.C/MANI 1000 GRTAB.SOLIDA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580115579", "cod_coope": "266487",},
-  "COFLER BON O BON RELLENO BON O BON 67 GRTAB.AIREA.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580115562", "cod_coope": "NO_ENCONTRADO",},
-  "COFLER C/CHOCOLINAS SOLIDAS 55GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103538", "cod_coope": "243774",},
-  "COFLER C/LECHE MANI TAB.SOLIDA 170GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580132750", "cod_coope": "NO_ENCONTRADO",},
-  "COFLER C/LECHE Y ALMENDRAS TAB.SOLIDA 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580033507", "cod_coope": "NO_ENCONTRADO",},
-  "COFLER CHOCOLINAS TABL BLANCO 140GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580127336", "cod_coope": "NO_ENCONTRADO",},
-  "COFLER DUBAI TABLETA RELLENAS 45GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "77960474", "cod_coope": "NO_ENCONTRADO",},
-  "COFLER DULCE DE LECHE RELLENAS 38GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580132958", "cod_coope": "NO_ENCONTRADO",},
-  "COFLER ROCKLETS TABL SOL 140GR 1UN PAQUETE": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580146092", "cod_coope": "312465",},
-  "COFLER TOFI C/RELLENO D.D.LECHE 70 GRTAB.AIREA.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580116842", "cod_coope": "265299",},
-  "COFLER TRES PLACERES CH.AMA.BL.LEC. 55 GRTAB.SOLIDA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580106560", "cod_coope": "245331",},
-  "COFLER YOGURT FRUTILLA RELL 64GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580123642", "cod_coope": "NO_ENCONTRADO",},
-  "HAMLET BLANCO COOKIES SOLIDA 46GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HAMLET", "ean": "7794612066310", "cod_coope": "101926",},
-  "HAMLET LECHE MANI ALMENDRA CEREAL 45 GRTAB.SOLIDA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HAMLET", "ean": "7794612065719", "cod_coope": "101924",},
-  "TOP LINE S/AZUCAR 6.7 GR FRUTA 4 TABL.PAQ.": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77916389", "cod_coope": "NO_ENCONTRADO",},
-  "TOP LINE S/AZUCAR 6.7 GR STRONG 4 TABL.PAQ.": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77916396", "cod_coope": "NO_ENCONTRADO",},
-  "TOP LINE S/AZUCAR SEVEN 14 GR ATOMIC STRO.7 TABL.PAQ": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77939753", "cod_coope": "NO_ENCONTRADO",},
-  "TOP LINE S/AZUCAR SEVEN 14 GR STRAWBERRY 7 TABL.PAQ.": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77951113", "cod_coope": "NO_ENCONTRADO",},
-  "TOP LINE SEVEN ULTRA GREEN MINT 12TABL. ADU. PQ. 24GR 1UN": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580120702", "cod_coope": "272308",},
-  "CLIGHT LIMONADA ARANDANOS DIET SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622202236846", "cod_coope": "NO_ENCONTRADO",},
-  "CLIGHT LIMONADA ROSA S/AZUCARES SOBRE 7.5G P/1 L.": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201682026", "cod_coope": "290249",},
-  "CLIGHT NAR/DUR S/A VITC+D SOBRE 7.5G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201702717", "cod_coope": "293969",},
-  "CLIGHT POLVO ANANA SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201702625", "cod_coope": "293968",},
-  "CLIGHT POLVO DIET MANZANA DELI. SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703080", "cod_coope": "284852",},
-  "CLIGHT POLVO NARA MANGO DIET SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201702687", "cod_coope": "293974",},
-  "CLIGHT POLVO PERA SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703202", "cod_coope": "NO_ENCONTRADO",},
-  "CLIGHT POLVO S/A LIMONADA VITC+D SOBRE 8GR P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201702656", "cod_coope": "293975",},
-  "CLIGHT POLVO S/A MANDARINA SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201704148", "cod_coope": "284862",},
-  "CLIGHT POLVO S/A NARANJA VIT CY D SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703110", "cod_coope": "293972",},
-  "CLIGHT PVO S/A MANZANA VERDE SOBRE 7.5GR P/1LT": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703059", "cod_coope": "NO_ENCONTRADO",},
-  "CLIGHT PVO S/A NARANJA DULCE VIT C Y D SOBRE 7.5G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703141", "cod_coope": "293971",},
-  "CLIGHT PVO S/A POMELO AMARILLO VIT C Y D SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703233", "cod_coope": "NO_ENCONTRADO",},
-  "CLIGHT PVO S/A POMELO ROSADO VIT C Y D SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703172", "cod_coope": "284377",},
-  "TANG POLV POM ROSADO REG SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735746", "cod_coope": "294294",},
-  "TANG POLVO PERA REG SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201745738", "cod_coope": "NO_ENCONTRADO",},
-  "TANG POLVO REG ANANA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201745967", "cod_coope": "294302",},
-  "TANG POLVO REG DURAZNO SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201745936", "cod_coope": "NO_ENCONTRADO",},
-  "TANG POLVO REG FRUTILLA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201746490", "cod_coope": "NO_ENCONTRADO",},
-  "TANG POLVO REG LIMONADA DULCE SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735685", "cod_coope": "284372",},
-  "TANG POLVO REG MANDARINA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201733865", "cod_coope": "315170",},
-  "TANG POLVO REG MANZANA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201705992", "cod_coope": "284869",},
-  "TANG POLVO REG MULTIFRUTA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735715", "cod_coope": "294293",},
-  "TANG POLVO REG NAR/DURAZNO SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201745707", "cod_coope": "294296",},
-  "TANG POLVO REG NARA/BANANA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735777", "cod_coope": "294295",},
-  "TANG POLVO REG NARA/MANGO SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735371", "cod_coope": "284371",},
-  "TANG POLVO REG NARANJA DULCE SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735340", "cod_coope": "294291",},
-  "TANG POLVO REG NARANJA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201705961", "cod_coope": "294290",},
-  "MONDELEZ CEREALITAS CACAO D.S. 170GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREALITAS", "ean": "7622202241505", "cod_coope": "315409",},
-  "MONDELEZ CEREALITAS GRANOLA D.S. 170GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREALITAS", "ean": "7622202241567", "cod_coope": "315408",},
-  "MDLZ TERRABUSI.DUQUESA GALL DUL. REL 115GR PAQ 3U 345GR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DUQUESA", "ean": "7622202218729", "cod_coope": "312520",},
-  "MONDELEZ TERRABUSI DUQUESA DUL.RELLE. 115 GRPAQUETE": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DUQUESA", "ean": "7622300742645", "cod_coope": "186498",},
-  "MONDELEZ TERRABUSI MELBA DUL.RELLE. 120 GRPAQUETE": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELBA", "ean": "7622300829728", "cod_coope": "219280",},
-  "TERRABUSI MELBA ANGRY BIRDS DU.REL.PAQ.120GR C/UPACK X 3 U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELBA", "ean": "7794600004539", "cod_coope": "100652",},
-  "MONDELEZ INTL.MILKA GALL. REL C/MOUS 124GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MILKA", "ean": "7622202210051", "cod_coope": "320353",},
-  "MONDELEZ INTL.MILKA GALL. REL C/MOUS 124GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MILKA", "ean": "7622202210075", "cod_coope": "316315",},
-  "MONDELEZ OREO C/CACAO DUL.RELLE.PAQ 118GR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201735845", "cod_coope": "NO_ENCONTRADO",},
-  "MONDELEZ OREO CHOCOLATE. DUL.RELLE. PAQ 118GR 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202049033", "cod_coope": "313957",},
-  "MONDELEZ OREO D.R. 118GR 3U 354G PQ AGR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201735258", "cod_coope": "290325",},
-  "MONDELEZ OREO D.R. 118GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201735296", "cod_coope": "290324",},
-  "MONDELEZ OREO DUL.REL. 182.5GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201735821", "cod_coope": "290492",},
-  "MONDELEZ OREO GALL MANI DUL.REL. PAQUETE 118GR 1UN": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202302862", "cod_coope": "NO_ENCONTRADO",},
-  "MONDELEZ OREO GALLETAS FRUT/CACAO DUL RELL 118GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202049057", "cod_coope": "313958",},
-  "MONDELEZ OREO GOLDEN GAL DUL REL 354GR PAQ AGR X3 118G 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201806538", "cod_coope": "284284",},
-  "MONDELEZ OREO MINI DUL.RELLE 50GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201761288", "cod_coope": "226274",},
-  "MONDELEZ OREO MINI. GALLETAS DUL RELL 150 BOL 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202219337", "cod_coope": "312234",},
-  "MONDELEZ OREO SIN GLUTEN GALL DR 95GR PAQUETE 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202038099", "cod_coope": "312235",},
-  "MONDELEZ OREO VAINILLA GOLDEN 118GR PAQ.DU.RE 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201806552", "cod_coope": "288807",},
-  "OREO BAADAS. CHOCOLATE BSA 119GR 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201740368", "cod_coope": "NO_ENCONTRADO",},
-  "MONDELEZ PEPITOS C/CHISPAS DS 119 GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PEPITOS", "ean": "7622201735906", "cod_coope": "290331",},
-  "MONDELEZ PEPITOS MINI. DULCE SECA 50GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PEPITOS", "ean": "7622201740399", "cod_coope": "267151",},
-  "MONDELEZ PEPITOS. DU. SEC 119GR 3UN 357G PAQ AGR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PEPITOS", "ean": "7622201735883", "cod_coope": "290330",},
-  "MODELEZ TERRABUSI ANILLOS D. S. 170GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201808884", "cod_coope": "283896",},
-  "MONDELEZ LINCOLN CHOCOLATE DUL.SECA 153 GR PAQUETE": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622300742676", "cod_coope": "186094",},
-  "MONDELEZ LINCOLN CLASICA DUL. SEC 219GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201735319", "cod_coope": "286194",},
-  "MONDELEZ LINCOLN CLASICAS DUL SEC 153GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201386719", "cod_coope": "NO_ENCONTRADO",},
-  "MONDELEZ TERRABUSI ANILLOS CLASIC 300GR BOL.DU.SE.": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201504007", "cod_coope": "290099",},
-  "MONDELEZ TERRABUSI BOCA DE DAMA D.S. 170GR BOL": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201808860", "cod_coope": "283897",},
-  "MONDELEZ TERRABUSI C/CHIPS 144GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201385279", "cod_coope": "285272",},
-  "MONDELEZ TERRABUSI MANON DULC. SECA 182GR PAQ. 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201385255", "cod_coope": "290907",},
-  "MONDELEZ TERRABUSI VARIED.MIX DU.SE. 590GR BOL": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201745585", "cod_coope": "290328",},
-  "MONDELEZ.TERRABUSI VARIED.MIX DU.SE. 390GR BOL": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201745561", "cod_coope": "290329",},
-  "TERRABUSI HABANITOS GALLETITA BAN.C/CHO. 60GRBOLSA": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622300335076", "cod_coope": "144397",},
-  "TERRABUSI LINCOLN CLASICA. D.S. 3U 153GR PQ AGR 459G": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201745547", "cod_coope": "219298",},
-  "TERRABUSI VARIEDAD CHC DUL.SEC 300GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201503987", "cod_coope": "296347",},
-  "TERRABUSI VARIEDAD D. S. 170GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201745639", "cod_coope": "NO_ENCONTRADO",},
-  "TERRABUSI VARIEDAD DORADA DUL.SEC 300GR BOL 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201503963", "cod_coope": "296348",},
-  "MONDELEZ CEREALITA CLASICA INT 212GR PAQ 3U 636G": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201745905", "cod_coope": "296346",},
-  "MONDELEZ CEREALITA CLASICAS INTEG 212GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201736033", "cod_coope": "296345",},
-  "MONDELEZ CEREALITAS SALV CER 208GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201745981", "cod_coope": "298810",},
-  "MONDELEZ CEREALITAS SALVA. CER 208GR 3U 624GR PAQ AGR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201746032", "cod_coope": "308766",},
-  "MONDELEZ CEREALITASTOST.DE ARROZ 160 GRPAQ.CEREAL": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201753061", "cod_coope": "190250",},
-  "MONDELEZ CLUB SOCIAL ORIG. CR PQ. 24GR 6UN 1X 144G PQ AGR,": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CLUB SOCIAL", "ean": "7622202293733", "cod_coope": "321231",},
-  "MONDELEZ CLUB.SOCIAL ORIGINAL 144 GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CLUB SOCIAL", "ean": "7622300990749", "cod_coope": "270205",},
-  "MONDELEZ INTL CLUB SOCIAL JAMON 23.5 GR X6U PQ AGR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CLUB SOCIAL", "ean": "7622210691835", "cod_coope": "270204",},
-  "MILKA ALFAJOR TRIPLE 70 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "77903778", "cod_coope": "117967",},
-  "MILKA MINI ALFAJORES MOUSSE SPL 19GR 6U BOLSA 114G": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622202220074", "cod_coope": "313146",},
-  "MILKA MOUSSE LECHE 42 GRPAQ.X 6 U.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622300759490", "cod_coope": "191741",},
-  "MILKA MOUSSE LECHE ALFAJOR 42 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622300759506", "cod_coope": "165419",},
-  "MILKA MOUSSE TRIPLE ALFAJOR 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "77903785", "cod_coope": "117966",},
-  "MILKA MOUSSE TRIPLE BLANCO ALF. 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622300457303", "cod_coope": "165423",},
-  "MILKA TORTA OREO ALF.TRIPLE 61 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622300835620", "cod_coope": "231895",},
-  "OREO ALFAJOR TRIPLE. 56GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "OREO", "ean": "77976307", "cod_coope": "286345",},
-  "PEPITOS CON CHIPS Y MOUSSE TRIPLE PAQUETE 57 GR UN.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "PEPITOS", "ean": "77915481", "cod_coope": "101766",},
-  "SHOT ALFAJOR MANI BAN CHC SIMPLE 44GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "SHOT", "ean": "7622202304705", "cod_coope": "317353",},
-  "SHOT ALFAJOR MINI SIMPLE 19GR BOLSA 6UN 114G": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "SHOT", "ean": "7622202223372", "cod_coope": "313147",},
-  "SHOT ALFAJOR TRIPLE 60 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "SHOT", "ean": "77956699", "cod_coope": "104055",},
-  "TERRABUSI ALFAJOR 50 GRPAQ. X6 U.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "7622300742584", "cod_coope": "186009",},
-  "TERRABUSI ALFAJOR CHOCOLATE 50 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "77939234", "cod_coope": "888397",},
-  "TERRABUSI ALFAJOR S/GLUT SPL BAN CHC 55GR PAQ 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "7622202296291", "cod_coope": "318464",},
-  "TERRABUSI X 3 DCE.DE LE.ALFAJOR 70 GRTRIPLE": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "77903792", "cod_coope": "101765",},
-  "TERRABUSI X 3 TORTA ALFAJOR 70 GRTRIPLE": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "77903860", "cod_coope": "101781",},
-  "TITA NEGRO ALFAJOR RELL.LIMON 36 GRARG": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TITA", "ean": "77908308", "cod_coope": "101767",},
-  "MILKA BIS OBLEA RELL.CUB.CHOCO. 105.6GR X 16U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "MILKA", "ean": "7622210788207", "cod_coope": "270578",},
-  "MILKA BIS OREO PAQ. 105.6 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "MILKA", "ean": "7622210719829", "cod_coope": "NO_ENCONTRADO",},
-  "MILKA CHOCO PAUSE.OREO OBLEA BAN.CHC 45GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "MILKA", "ean": "7622201492465", "cod_coope": "277562",},
-  "MILKA CHOCO PAUSE OBLEA BAN.CHO.C/LEC.RELL.45 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "MILKA CHOCO PAUSE", "ean": "7622201492717", "cod_coope": "257094",},
-  "RHODESIA MINI OBLEAS 60 GRBOLSA": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "RHODESIA", "ean": "7622300335090", "cod_coope": "145355",},
-  "RHODESIA OBLEA BAN.C/CHO. 22 GRBOLSA": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "RHODESIA", "ean": "77995681", "cod_coope": "232356",},
-  "RHODESIA OBLEA BANADA 22 GRPAQ.X4 U.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "RHODESIA", "ean": "7622300742935", "cod_coope": "186684",},
-  "TITA GALLE.BAN. 18 GRPAQ. X 5 U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "TITA", "ean": "7622201803285", "cod_coope": "186008",},
-  "TITA O BANADOS 19GR PAQ 1U REGULAR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "TITA", "ean": "77976291", "cod_coope": "284434",},
-  "MILKA OREO BOMBON 19G BOLSA 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "MILKA", "ean": "77971630", "cod_coope": "282560",},
-  "MILKA HUEVO LECHE 22GR 1U S/SORP PAS": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "MILKA", "ean": "77981325", "cod_coope": "NO_ENCONTRADO",},
-  "CADBURY C/YOGHURT. NUEZ TAB. RELL.29GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818654", "cod_coope": "284445",},
-  "CADBURY CHOCOLATE CON ALMENDRAS X82GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201807405", "cod_coope": "284442",},
-  "CADBURY INTENSE 50% CACAO 25GR TAB.SOLIDA 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818609", "cod_coope": "284447",},
-  "CADBURY INTENSE SOLIDAS 50% CACAO PAQ 162GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201800505", "cod_coope": "284441",},
-  "CADBURY TRES SUENOS.TAB. SOLIDA 82GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818739", "cod_coope": "284444",},
-  "CADBURY TRES.SUENOS. 25GR TAB.SOLIDA 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818579", "cod_coope": "284446",},
-  "CADBURY YOGHURT FRUTILLA RELL 82 GRS PAQUETE 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818715", "cod_coope": "284439",},
-  "CADBURY YOGURTH TABL RELL FRUTILLA PAQ 162GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818692", "cod_coope": "284443",},
-  "MILKA . TAB CHC SOLIDA 20GRS PAQUETE 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210795625", "cod_coope": "272200",},
-  "MILKA ALMENDRA TABLETA RELLENA 55 GR PAQ.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210745620", "cod_coope": "271351",},
-  "MILKA ALMENDRAS TAB.SOLIDA 155 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300990152", "cod_coope": "265279",},
-  "MILKA BLANCO C/D.D.LEC.TAB.RELLE. 67.5 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300844967", "cod_coope": "229932",},
-  "MILKA C/LECHE TAB.SOLIDA 150 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300990114", "cod_coope": "265277",},
-  "MILKA CARAMELO Y AVELLANATAB.SOLIDA 300 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300134532", "cod_coope": "229941",},
-  "MILKA CASTANA TAB. SOLIDA 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210745293", "cod_coope": "271466",},
-  "MILKA CASTANAS C/CARAMELOTAB.SOLIDA 155 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300990183", "cod_coope": "265280",},
-  "MILKA CHOCO.C/LECHE TAB.SOLIDA 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202328947", "cod_coope": "271350",},
-  "MILKA CHOCOLATE C/DULCE DE LECHE 67.5 GRTAB.RELLE.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300844943", "cod_coope": "229924",},
-  "MILKA LEGER COMBINADO TAB AIREA. LECHE 110GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201812775", "cod_coope": "284437",},
-  "MILKA LEGER COMBINADO TAB.AIREA. LECHE 50GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201818951", "cod_coope": "284450",},
-  "MILKA LEGER LECHE CON ALMENDRAS TAB AIREA. LECHE 110GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201812805", "cod_coope": "284438",},
-  "MILKA LEGER LECHE TAB AIREA. LECHE 110GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201812744", "cod_coope": "284436",},
-  #VALUE!
-  "MILKA LEGER TAB.AIREA. LECHE CON ALMENDRAS 50GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201818975", "cod_coope": "284449",},
-  "MILKA LILA GO OREO PAQ. 37 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210828606", "cod_coope": "272202",},
-  "MILKA MAND/KARAM TAB.RELL CHOC 300GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210732507", "cod_coope": "NO_ENCONTRADO",},
-  "MILKA MMMAX BUBBLY TAB AIREADO 250GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300757717", "cod_coope": "316429",},
-  "MILKA NEGRO C/D.D.LEC.TAB.RELLE. 135 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300846565", "cod_coope": "241761",},
-  "MILKA OREO C/GALLET. TAB.SOLIDA 100 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300631574", "cod_coope": "NO_ENCONTRADO",},
-  "MILKA OREO CH.BLANCO TAB.SOLIDA 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210745132", "cod_coope": "271463",},
-  "MILKA OREO CHOCOLATE BLANCO 155 GRTAB.SOLIDA": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300990213", "cod_coope": "265278",},
-  "MILKA OREO TAB. SOLIDA 20GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210795908", "cod_coope": "272201",},
-  "MILKA OREO TABLETA RELLENA 300GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210277503", "cod_coope": "271348",},
-  "MILKA SWING TAB.SOLIDA 300 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "9012200872739", "cod_coope": "145356",},
-  "MILKA TAB CHC AIREADA C.LECHE 25GR 1UN PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202322150", "cod_coope": "317590",},
-  "MILKA TAB CHC AIREADA COMBINADO 25GR 1UN PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202322181", "cod_coope": "317591",},
-  "MILKA TABLETA CHC AVELLANAS TAB. SOL 95GR 1UN PAQUETE": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202257599", "cod_coope": "NO_ENCONTRADO",},
-  "MILKA TABLETA CHC RELLENA 29GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202322068", "cod_coope": "317588",},
-  "MILKA TABLETA CHC RELLENA 29GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202322129", "cod_coope": "317589",},
-  "MILKA TABLETA DE CHOCOLATE BLANCO 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210745583", "cod_coope": "271464",},
-  "SHOT BLOQUE TAB.SOLIDA 35 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SHOT", "ean": "77914217", "cod_coope": "232463",},
-  "SHOT C/LECHE Y MANI TAB.SOLIDA 170 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SHOT", "ean": "7622300424084", "cod_coope": "238785",},
-  "SHOT C/MANI TAB.SOLIDA 90 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SHOT", "ean": "7791249451656", "cod_coope": "266726",},
-  "SHOT CHOCOLAE C/MANI TAB.SOLIDA 35 GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SHOT", "ean": "77983992", "cod_coope": "310874",},
-  "TOBLERONE TAB.SOLIDA 100 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TOBLERONE", "ean": "7614500010013", "cod_coope": "451171",},
-  "BELDENT CHI. TABLETA ADU. S/AZ. 6 CHI. PQ. 10GR 1UN": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969101", "cod_coope": "282571",},
-  "BELDENT FRESH SPARKS SANDIA 6CHI.TABL. ADU. PQ. 10GR 1UN": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77987686", "cod_coope": "308767",},
-  "BELDENT FRUTILLA S/AZ. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969118", "cod_coope": "282569",},
-  "BELDENT INFINIT 7 BLUEBERRY CHIC. TABL. CJ. 13.3GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201448325", "cod_coope": "284389",},
-  "BELDENT INFINIT MENTA 7U PQ. 13.3GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201421496", "cod_coope": "284387",},
-  "BELDENT INFINIT MENTA DIET 14 TABL. CJ. 26.6GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201457334", "cod_coope": "284382",},
-  "BELDENT INFINIT SPEARMINT 7 TABL. CJ. 13.3 GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201448226", "cod_coope": "284388",},
-  "BELDENT MANDARINA FRESH SPARKS ADU. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77981844", "cod_coope": "NO_ENCONTRADO",},
-  "BELDENT MENTA FUERTE S/AZ. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969088", "cod_coope": "282573",},
-  "BELDENT MENTA S/AZ. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969071", "cod_coope": "282568",},
-  "BELDENT MENTOL S/AZ. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969095", "cod_coope": "282572",},
-  "BELDENT TROP. FRESH SPARKS 6 TABL. ADU. PQ. 10GR 1UN": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622202273131", "cod_coope": "315876",},
-  "M. CANUELA 9 DE ORO PEPAS 500GR BOL DU.SE.1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180143273", "cod_coope": "308652",},
-  "M.CANUELAS 9 DE ORO PEPAS DU.SE. 350GR BOL.1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180143280", "cod_coope": "308653",},
-  "M.CANUELAS 9 DE ORO SCONS LIMON DULCE SECA 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180009524", "cod_coope": "266226",},
-  "M.CANUELAS9 DE ORO BIZC.AGRI.DULCE SECAPAQ.420 GR60G.GR.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792200001125", "cod_coope": "NO_ENCONTRADO",},
-  "M.CANUELAS9 DE ORO BIZC.AZUC.DULCE SECA 210 GRSPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792200000319", "cod_coope": "866750",},
-  "M.CANUELAS9 DE ORO CUAD.AGRI.DULCE SECA 200 GRBOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792200000128", "cod_coope": "NO_ENCONTRADO",},
-  "M.CANUELAS9 DE ORO SCONCITOS DULCE SECAPAQ.200 GRARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792200000791", "cod_coope": "889563",},
-  "BAUDUCCO FRESA OBLEA 140 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962032283", "cod_coope": "163756",},
-  "BAUDUCCO GALL. DUL SEC COOK C/CHIPS 60GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962071152", "cod_coope": "315039",},
-  "BAUDUCCO GALL. DUL SEC COOK C/CHIPS 60GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962071169", "cod_coope": "NO_ENCONTRADO",},
-  "BAUDUCCO VAINILLA OBLEA 140 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962032306", "cod_coope": "163757",},
-  "BAUDUCCO WAFER CHOCOLATE OBLEA 140 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962032290", "cod_coope": "163758",},
-  "BAUDUCCO WAFER OBLEAS CHOCOLATE 78 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962058399", "cod_coope": "NO_ENCONTRADO",},
-  "BAUDUCCO WAFER OBLEAS FRUTILLA 78 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962058405", "cod_coope": "NO_ENCONTRADO",},
-  "BONAFIDE DONUTS BAN.C/CHO 78GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BONAFIDE", "ean": "7792360096818", "cod_coope": "100487",},
-  "BONAFIDE DONUTS BAN.C/CHO 78GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BONAFIDE", "ean": "7792360096825", "cod_coope": "102003",},
-  "CHOCMAN MINITORTA RELLENA C/D.D.LECHE 35 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCMAN", "ean": "7792360096634", "cod_coope": "312184",},
-  "DR. SCHÄR SCHAR GALL GLUT.F. DU.SE. C/CHIP 200GR BOL 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DR. SCHAR", "ean": "8008698005491", "cod_coope": "319340",},
-  "SCHAR MARIA DULCE SECA 125 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DR. SCHAR", "ean": "8008698010402", "cod_coope": "319339",},
-  "SCHAR P/CELIACOS DUL.RELLE.100 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DR. SCHAR", "ean": "8008698008157", "cod_coope": "319337",},
-  "SCHAR WAFERS ALLA VANIGLIA OBLEAS RELL.CREMA VAIN 125GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DR. SCHAR", "ean": "8008698001905", "cod_coope": "319338",},
-  "CACHAFAZ INTEGRAL AVE.MIEL DULC SEC 170 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128002145", "cod_coope": "294544",},
-  "CACHAFAZ INTEGRAL AVE.PASA DE UVA D.S. 225 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128000677", "cod_coope": "294538",},
-  "CACHAFAZ INTEGRAL AVEN.C/CHIP.CHOC.D.S. 225 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128000691", "cod_coope": "294540",},
-  "CACHAFAZ INTEGRAL GRAN.C/AVENA/ALM/MANI 225 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128000707", "cod_coope": "294539",},
-  "CACHAFAZ INTEGRAL HAR.INT.ALGARRO.D.S. 225 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128000684", "cod_coope": "294541",},
-  "CACHAFAZ ORGANICAS AVENA&MIEL DUL.SECA PAQ.170GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128002138", "cod_coope": "294542",},
-  "DONLEY FACHITAS MINI TAPITDULCE SECA400 GRS. PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7790369000089", "cod_coope": "447143",},
-  "FACHITAS BOOM JALEA FRAMBUESA DUL.RELL. 140 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7790369001055", "cod_coope": "313970",},
-  "FACHITAS GALLETAS VAIN DUL.SEC BOLSA 140GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7790369008238", "cod_coope": "313972",},
-  "FACHITAS MINI CORO.FRUTOS DEL BOSQ. DULCE RELL 140GR BOL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7790369007903", "cod_coope": "313975",},
-  "FACHITAS MINI CORONITAS CHOC.DUL.SECA 140 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7790369007811", "cod_coope": "447152",},
-  "FACHITAS MINI CORONITAS CHOCO.BCO.DUL. SECA 140 GR PAQU.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7790369007835", "cod_coope": "447076",},
-  "FACHITAS MINI CORONITAS FRUT.DUL.SECA 140 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7790369007828", "cod_coope": "313974",},
-  "FACHITAS MINI TAPITAS DUL SEC 3000GR PAQ 1U CAJ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FACHITAS", "ean": "7790369000294", "cod_coope": "NO_ENCONTRADO",},
-  "GRANIX FRUTIGRAN AVE/SOJA C/CHIPS CHOC.D.SECA 255 PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045824893", "cod_coope": "147995",},
-  "GRANIX FRUTIGRAN C/SEM.SES-AM.Y GIRASD.SECA 260 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045825401", "cod_coope": "155260",},
-  "GRANIX FRUTIGRAN SALV.AVENAPAS.DE UVA 250 GRS.DU.SE.PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045001188", "cod_coope": "862010",},
-  "GRANIX FRUTIGRAN SALVADO DULCE SECA 250 GRS.PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045001195", "cod_coope": "NO_ENCONTRADO",},
-  "M PROPIAS": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "M PROPIAS", "ean": "1", "cod_coope": "NO_ENCONTRADO",},
-  "LIA MACUCAS BLACK GALL DUL RELL 110GR PAQ SPL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MACUCAS", "ean": "7790040150461", "cod_coope": "NO_ENCONTRADO",},
-  "LIA MACUCAS CHOCOLATE DUL.RELLE.85 GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MACUCAS", "ean": "7790040146877", "cod_coope": "313299",},
-  "LIA MACUCAS GALL DUL RELL 110GR PAQ SPL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MACUCAS", "ean": "7790040145337", "cod_coope": "313301",},
-  "OKEBON MOLINO NATURAL 10SEMILLAS DUL.SECA PAQ. 231GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MOLINO NATURAL", "ean": "7790263119658", "cod_coope": "NO_ENCONTRADO",},
-  "OKEBON MOLINO NATURAL AVEN/PASAS 232 GR PAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MOLINO NATURAL", "ean": "7790263119641", "cod_coope": "279979",},
-  "OKEBON MOLINO NATURAL DUL.SEC AVEN/CACAO PAQ.240G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MOLINO NATURAL", "ean": "7790263119634", "cod_coope": "279372",},
-  "OKEBON MOLINO NATURAL NJA&CHISPASP DULC.SECPAQ.238G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MOLINO NATURAL", "ean": "7790263119665", "cod_coope": "294364",},
-  "DON SATUR BIZCOCHO DULCE DULCE SECA 200 GRBOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O DSATUR", "ean": "7795735000335", "cod_coope": "931250",},
-  "DON SATUR NEGRITOS DULCE SECA 200 GRBOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O DSATUR", "ean": "7795735000342", "cod_coope": "931268",},
-  "HOJALMAR L.LARGUITA DULCE SECA 150 GRS.BANDEJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000159", "cod_coope": "NO_ENCONTRADO",},
-  "HOJALMAR L.LARGUITA DULCE SECA250 GRS. BANDEJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000142", "cod_coope": "292953",},
-  "HOJALMAR MATERO BIZCO. HOJAL.AZUCBOLSA 180 GR ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000593", "cod_coope": "NO_ENCONTRADO",},
-  "HOJALMAR PALMERAS DULCE SECA150 GR BANDE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000364", "cod_coope": "453457",},
-  "HOJALMAR TRIANGULI. DULCE SECA 150 GRS.BANDEJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000128", "cod_coope": "NO_ENCONTRADO",},
-  "HOJALMAR TRIANGULIT DULCE SECA250 GRS. PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000111", "cod_coope": "NO_ENCONTRADO",},
-  "AGLU GALLETA C/CHI.CHOC.DUL.SEC. 150GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798128417802", "cod_coope": "NO_ENCONTRADO",},
-  "AGLU P/CELIACO SAB.CHOCO.DUL.SECA 150 GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798128410032", "cod_coope": "NO_ENCONTRADO",},
-  "AGLU P/CELIACO SAB.LIMON DUL.SECA 150 GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798128410070", "cod_coope": "145666",},
-  "AGLU SABOR VAINILLA DUL.SECA 500 GRS. BOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798128410117", "cod_coope": "NO_ENCONTRADO",},
-  "ANIMAL KIND GALLETITAS DUL.SEC. VEGAN 170GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798184451352", "cod_coope": "315232",},
-  "ANIMAL KIND GALLETITAS DULC.SEC. VEGAN 170GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798184451215", "cod_coope": "315231",},
-  "BAY BISCUIT BIZCO SAB.ORIG.D.SEC. 142 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798004241187", "cod_coope": "NO_ENCONTRADO",},
-  "BAY BISCUIT BIZCO.SAB.ORIG.D.SEC. 140 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798004241248", "cod_coope": "NO_ENCONTRADO",},
-  "BILLIKEN OBLEA DUL.RELL.TURRO-MANI PAQ.25GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798186032924", "cod_coope": "NO_ENCONTRADO",},
-  "CACHAMAI GALLETAS DS 165GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7792280006287", "cod_coope": "NO_ENCONTRADO",},
-  "CACHAMAI GALLETAS DS C/INCLUS 165GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7792280006270", "cod_coope": "NO_ENCONTRADO",},
-  "DELICEL GALLETA COOKIE DS 200 GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798160700610", "cod_coope": "317016",},
-  "DELICEL GALLETA COOKIE DS C/CHIP 200 GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798160700603", "cod_coope": "NO_ENCONTRADO",},
-  "DELICEL GALLETA S/GLUT DS 200GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798160700627", "cod_coope": "NO_ENCONTRADO",},
-  "DELICEL GALLETA S/GLUT LIMA DULCE SECA 200GR CAJA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798160700573", "cod_coope": "315224",},
-  "DELICEL S/GLUTEN PEPAS DULC SECA 150GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798160700597", "cod_coope": "NO_ENCONTRADO",},
-  "DIMAX BISCUIT SAB.VAINI.DUL.SECA 120 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798144940223", "cod_coope": "NO_ENCONTRADO",},
-  "DIMAX CHOCOMIEL DUL.SECA 200 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798144940469", "cod_coope": "NO_ENCONTRADO",},
-  "DIMAX PEPAS BATATA DUL.SECA 200 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798144940155", "cod_coope": "NO_ENCONTRADO",},
-  "DIMAX PEPAS CHOCOLATE DUL.SECA 160 GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798144941039", "cod_coope": "NO_ENCONTRADO",},
-  "DIMAX PEPAS MEMBRILLO DUL.SECA 200 GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798144940131", "cod_coope": "199561",},
-  "DIMAX VAINILLA S/TACC S/ GLUTEN DUL.SECA 200 GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798144941244", "cod_coope": "254426",},
-  "FANTOCHE MINI CORONITAS FRAMBUESA 140 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7790369000997", "cod_coope": "313973",},
-  "FIRENZE MINIPAMELA SCONES DULCE SECA 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568000849", "cod_coope": "299524",},
-  "FIRENZE PAMELA C/CHIPS CHO.DU.SE. 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568000702", "cod_coope": "NO_ENCONTRADO",},
-  "FIRENZE PAMELA CHOCOLATE DUL.RELLE. 97 GRPACK X 3 U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568001044", "cod_coope": "294548",},
-  "FIRENZE PAMELA CHOCOLATE DUL.SEC 180GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568005615", "cod_coope": "299523",},
-  "FIRENZE PAMELA LIMON DULCE SECA 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568000719", "cod_coope": "NO_ENCONTRADO",},
-  "FIRENZE PAMELA VAINILLA DUL.RELLE. 97 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568000955", "cod_coope": "NO_ENCONTRADO",},
-  "FIRENZE PAMELA VAINILLA DUL.RELLE. 97 GRPACK X 3 U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568001037", "cod_coope": "294547",},
-  "FIRENZE PAMELAS GALLETA CHO DUL. SEC. 170GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568006100", "cod_coope": "294546",},
-  "GAONA SINFONIA OBLEA COCO Y DUL 100GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126073598", "cod_coope": "NO_ENCONTRADO",},
-  "GAONA SINFONIA OBLEAS 2 CHOCOLATES 100 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126072256", "cod_coope": "291726",},
-  "GAONA SINFONIA OBLEAS FRUTI.C/CREMA 100 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126072232", "cod_coope": "NO_ENCONTRADO",},
-  "GAONA SINFONIA OBLEAS NARANJA/CHOCO. 100 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126072591", "cod_coope": "291729",},
-  "GAONA STAR CHOCOLATE OBLEAS 100 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126071273", "cod_coope": "NO_ENCONTRADO",},
-  "GAONA STAR FRUTILLA OBLEAS 100 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126070948", "cod_coope": "281295",},
-  "GAONA STAR OBLEAS LIMON 100 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126071747", "cod_coope": "281297",},
-  "GAONA STAR SAB. CLASICO NARANJA OBLEAS 100 GR FLOW PACK": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126070931", "cod_coope": "281293",},
-  "INTEGRA GALLETA DS C/CHISP 200GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798343751507", "cod_coope": "321386",},
-  "INTEGRA GALLETA DS C/CHISP 200GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798343751521", "cod_coope": "321387",},
-  "LEIVA DULCE DE LECHE DUL.SECA 260 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7790412000011", "cod_coope": "NO_ENCONTRADO",},
-  "LEIVA TOSTADAS DULCES PAQUETE 150 GRS": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7790412000288", "cod_coope": "295731",},
-  "LOS ARTESANOS PEPAS DUL.SECA 300 GRS. BOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798032380247", "cod_coope": "NO_ENCONTRADO",},
-  "PAMELA MINI AVENA Y CHIPS DUL.SECA BOL.180GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568005714", "cod_coope": "299526",},
-  "PAMELA MINI AVENA Y PASAS GALL.DUL.SECA BOLSA 180GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568005660", "cod_coope": "299527",},
-  "POZO GALL VAINILLAS DUL. SEC. 80GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7790077000326", "cod_coope": "279934",},
-  "POZO GALL VAINILLAS DULCE SECA 148GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7790077000067", "cod_coope": "NO_ENCONTRADO",},
-  "POZO GALL VAINILLAS DULCE SECA 148GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7790077001354", "cod_coope": "NO_ENCONTRADO",},
-  "PRIMER PRECIO ANILLOS DUL SEC 400GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7795643021651", "cod_coope": "312073",},
-  "PRIMER PRECIO BIZ HOJALD DUL SEC 200GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798172410828", "cod_coope": "NO_ENCONTRADO",},
-  "PRIMER PRECIO BIZC.HOJ. MATEROS D.SECA 180 GR.BOL.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798172410781", "cod_coope": "NO_ENCONTRADO",},
-  "PRIMER PRECIO BIZCOCHO AZUC.DUL.SEC. 200GR BOL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7795643020227", "cod_coope": "298053",},
-  "PRIMER PRECIO GALL MARIA. DS 360GR PAQ AGR 1UN X3": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7792683502102", "cod_coope": "318524",},
-  "PRIMER PRECIO GALL VAINILLAS DUL.SECA 148GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7790077001293", "cod_coope": "309331",},
-  "PRIMER PRECIO GALL. DUL. SEC. C/MEMB 400GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7795643101421", "cod_coope": "312078",},
-  "PRIMER PRECIO GALLET C/CHIPS CHC 300GR BOL.DU.SE.1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7795643101438", "cod_coope": "312077",},
-  "PRIMER PRECIO GALLETA DR 97GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568006421", "cod_coope": "315429",},
-  "PRIMER PRECIO GALLETA DR 97GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568006438", "cod_coope": "315430",},
-  "PRIMER PRECIO GALLETA DULCE SECA 400GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7795643101445", "cod_coope": "312076",},
-  "PRIMER PRECIO GALLETIS VAINILLA 444GR DU.SE.PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7790077001309", "cod_coope": "309332",},
-  "PRIMER PRECIO LARGUITOS HOJALDRE PAQ.150GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798172410149", "cod_coope": "278792",},
-  "PRIMER PRECIO MINI FROLADULCE SECA 300 GRBOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791787100207", "cod_coope": "101128",},
-  "PRIMER PRECIO PEPAS DUL.SEC 200GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7795643021507", "cod_coope": "316244",},
-  "PRIMER PRECIO PEPAS DULCE SECA 300 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791787100863", "cod_coope": "275836",},
-  "PRIMER PRECIO PEPAS DULCE SECA 300 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791787100887", "cod_coope": "275835",},
-  "PRIMER PRECIO PEPAS DULCE SECA 300 GRBOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791787100191", "cod_coope": "173439",},
-  "PRIMER PRECIO SURTIDAS DULCE SECA 300 GRBOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791787100184", "cod_coope": "100342",},
-  "PRIMER PRECIO TOSTAD.DULC.DUL.SECA 180GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568006407", "cod_coope": "312080",},
-  "PRIMER PRECIO TRIANGULI.HOJALDRE DUL.SE.PAQ.150G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798172410132", "cod_coope": "278791",},
-  "PRIMER PRECIO.GALLETA DULCE SECA 170GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568006414", "cod_coope": "314777",},
-  "STEINHAUSER BUDIN BANAD CHOC NARANJA 250GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568005929", "cod_coope": "NO_ENCONTRADO",},
-  "STEINHAUSER BUDIN BANADO CHOC C/CHIPS 250GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568005905", "cod_coope": "NO_ENCONTRADO",},
-  "SUYAI GALLETAS DULCES SUYAI BSA. 250 GRARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "200065441211", "cod_coope": "NO_ENCONTRADO",},
-  "TOSTEX AVENA Y MIEL DUL. SECA 300 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125810774", "cod_coope": "NO_ENCONTRADO",},
-  "TOSTEX C/AVENA Y MIEL DUL. SECA 270GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811092", "cod_coope": "310946",},
-  "TOSTEX CHIPS C/CHISP DULCE SECA 270GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811009", "cod_coope": "296284",},
-  "TOSTEX CHIPS C/CHISP DULCE SECA 270GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811023", "cod_coope": "295927",},
-  "TOSTEX CHIPS C/CHISP/AVENA DULCE SECA 270GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811061", "cod_coope": "312733",},
-  "TOSTEX CHIPS&MANI GALL. DUL.SECA 300GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125810781", "cod_coope": "279865",},
-  "TOSTEX GALL C/AVENA Y ARANDANOS DUL. SECA 270GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811085", "cod_coope": "310945",},
-  "TOSTEX GALL C/CHIPS CHC DUL SEC 120GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811238", "cod_coope": "NO_ENCONTRADO",},
-  "TOSTEX GALL C/CHIPS CHC DUL SEC 120GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811245", "cod_coope": "NO_ENCONTRADO",},
-  "TRINI MASITAS CACAO&STEVIA 120 GR DUL.SEC BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798134783045", "cod_coope": "281943",},
-  "TRINI MASITAS DE LIMON&STEVIA 120 GR DUL.SEC BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798134783052", "cod_coope": "281944",},
-  "TURIMAR CHIP C/PEPITAS DE CHOCO.DUL.SECA 400 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7797675001045", "cod_coope": "280777",},
-  "TYM CHOCOLATE OBLEAS 105 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793209000362", "cod_coope": "257434",},
-  "TYM CHOCOLATE OBLEAS 46 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793209000171", "cod_coope": "NO_ENCONTRADO",},
-  "TYM DCE.DE LECHE OBLEA 105 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793209000355", "cod_coope": "290385",},
-  "TYM FRUTILLA OBLEAS 105 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793209000331", "cod_coope": "257432",},
-  "TYM FRUTILLA OBLEAS 46 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793209000157", "cod_coope": "NO_ENCONTRADO",},
-  "TYM GALL OBLEAS WF CACAO 100GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793209904127", "cod_coope": "NO_ENCONTRADO",},
-  "TYM OBLEAS LIMON DUL.RELLE. 100 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793209000461", "cod_coope": "290387",},
-  "TYM OBLEAS VAI/FRUT DUL.RELLE. 100 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793209903649", "cod_coope": "290384",},
-  "TYM VAINILLA OBLEAS 105 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793209000348", "cod_coope": "257433",},
-  "TYM VAINILLA OBLEAS 46 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793209000140", "cod_coope": "NO_ENCONTRADO",},
-  "ZAFRAN CHIAPAZ CEREAL DULCE SECA 150 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798187760147", "cod_coope": "285157",},
-  "ZAFRAN LINOCCO CEREAL DULCE SECA 150 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798187760130", "cod_coope": "285158",},
-  "ZAFRAN TANLATAM CEREAL DULCE SECA 150 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798187760161", "cod_coope": "285159",},
-  "ZAFRANITO GALL DUL.SEC ORG INTEG. SAB.CHOCO BOLSA 150G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798187760390", "cod_coope": "296530",},
-  "ZAFRANITO GALL DUL.SEC ORG INTEG. SAB.VAINILLA BOLSA 150G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798187760383", "cod_coope": "NO_ENCONTRADO",},
-  "OKEBON GIROTONDO CHOC 245GR PAQ.DU.SE. 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O OKEBON", "ean": "7790263119733", "cod_coope": "298652",},
-  "OKEBON GIROTONDO VAIN 224GR PAQ.DU.SE. 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O OKEBON", "ean": "7790263119726", "cod_coope": "298651",},
-  "OKEBON MOLINO NATURAL AVENA&GRANOLA DUL.SECA 236 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O OKEBON", "ean": "7790263119627", "cod_coope": "279977",},
-  "OKEBON PANAL CHOCOLATE.DUL SEC 247GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O OKEBON", "ean": "7790263119702", "cod_coope": "298650",},
-  "OKEBON PANAL VAINILLA DUL SEC 220GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O OKEBON", "ean": "7790263119689", "cod_coope": "298649",},
-  "OKEBON LECHE D.DE LECHEDULCE SECA PAQ 273GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OKEBON LECHE", "ean": "7790263119610", "cod_coope": "279976",},
-  "OKEBON LECHE D.DE LECHEDULCESECA PAQ.290G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OKEBON LECHE", "ean": "7790263119597", "cod_coope": "279371",},
-  "OKEBONLECHE CHOCOLATADA DULC SEC 273 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OKEBON LECHE", "ean": "7790263119603", "cod_coope": "279980",},
-  "LIA POLVORITA CHC/VAIN DUL.RELLE.152GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040146143", "cod_coope": "312489",},
-  "LIA POLVORITA CHOC DUL.RELLE.81GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040139183", "cod_coope": "NO_ENCONTRADO",},
-  "LIA POLVORITA FRUT DUL.RELLE.81GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040139176", "cod_coope": "294176",},
-  "LIA POLVORITA VAIN DUL.RELLE.81GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040139169", "cod_coope": "294175",},
-  "LIA POLVORITA VAIN/FRUT DUL.RELLE.152GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040139640", "cod_coope": "294190",},
-  "PLASENCIA POZO VAINILLA DULCE SECA480 GR PAQ. ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POZO", "ean": "7790077000135", "cod_coope": "NO_ENCONTRADO",},
-  "RIERA TOSTADAS DULCES DULCE SECA 200GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "RIERA", "ean": "7790071090125", "cod_coope": "309631",},
-  "SMAMS GALL DUL RELL LIMON S/TACC 105GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511257", "cod_coope": "NO_ENCONTRADO",},
-  "SMAMS GALL DUL RELL VAINILLA S/TACC 105GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511240", "cod_coope": "NO_ENCONTRADO",},
-  "SMAMS GALL.DUL.SECA VAINILLA COLEGIAL 150 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510847", "cod_coope": "281316",},
-  "SMAMS GALLET CHIP/CHOC. DUL SEC . PAQ. 150GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511004", "cod_coope": "308704",},
-  "SMAMS GALLET S/TACC CHOC DU.SE. 200GR PAQ. 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511011", "cod_coope": "NO_ENCONTRADO",},
-  "SMAMS PEPAS MEBRILLO 150GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510786", "cod_coope": "281315",},
-  "SMAMS S/GLUTEN BIZ.AGRIDUL.AZUCARA. 150 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510182", "cod_coope": "NO_ENCONTRADO",},
-  "SMAMS S/GLUTEN CHOCOLATE DUL.RELLE. 110 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510014", "cod_coope": "NO_ENCONTRADO",},
-  "SMAMS S/GLUTEN FRUTILLA DUL.RELLE. 105 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510267", "cod_coope": "NO_ENCONTRADO",},
-  "SMAMS S/GLUTEN VAINILLA DUL.RELLE. 110 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510021", "cod_coope": "NO_ENCONTRADO",},
-  "TEPERIN PEPAS DUL. SECA PAQUETE 200 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TEREPIN", "ean": "7798054220156", "cod_coope": "NO_ENCONTRADO",},
-  "TEREPIN GALLETA DS C/FRUTA 300GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TEREPIN", "ean": "7798054220781", "cod_coope": "NO_ENCONTRADO",},
-  "TEREPIN GALLETA DS C/FRUTA 300GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TEREPIN", "ean": "7798054220804", "cod_coope": "NO_ENCONTRADO",},
-  "TEREPIN GALLETAS PEPAS DUL SEC 360GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TEREPIN", "ean": "7798054220811", "cod_coope": "NO_ENCONTRADO",},
-  "TEREPIN PEPAS C/DCE.BATA.DULC.SECA 300 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TEREPIN", "ean": "7798054220606", "cod_coope": "299903",},
-  "TEREPIN PEPAS DULCE D/MEMBRILLO DULCE SECA 500GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TEREPIN", "ean": "7798054220293", "cod_coope": "NO_ENCONTRADO",},
-  "TEREPIN PEPAS FRUTOS DEL BOSQUE 300 GRBOL.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TEREPIN", "ean": "7798054220590", "cod_coope": "NO_ENCONTRADO",},
-  "PEPSICO TODDY C/CHISP.CHOCO.DUL.SECA PAQ.126G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TODDY", "ean": "7790380023432", "cod_coope": "279298",},
-  "TODDY GALL MINI DUL SEC 50GR PAQ. 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TODDY", "ean": "7790380023487", "cod_coope": "313081",},
-  "LIA VOCACION ACARAMELA DUL.SECA PAQ 435 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "VOCACION", "ean": "7790040133228", "cod_coope": "NO_ENCONTRADO",},
-  "LIA VOCACION ACARAMELA.DUL.SECA 145 GR. PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "VOCACION", "ean": "7790040133211", "cod_coope": "312486",},
-  "M.CANUELAS9 DE ORO BIZ.C/SALVCEREAL 200 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "9 DE ORO", "ean": "7792200020119", "cod_coope": "150636",},
-  "M.CANUELAS9 DE ORO BIZC.CLAS.CRACKERS 200 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "9 DE ORO", "ean": "7792200000159", "cod_coope": "858170",},
-  "M.CANUELAS9 DE ORO BIZC.LIGHTCRACKERS 170 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "9 DE ORO", "ean": "7792200000777", "cod_coope": "873381",},
-  "BAUDUCCO TOSTADAS INTEGRAL CRACKERS PAQ142 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "BAUDUCCO", "ean": "7891962060460", "cod_coope": "NO_ENCONTRADO",},
-  "BAUDUCCO TOSTADAS MULTIGRANOS CRACKERS PAQ142 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "BAUDUCCO", "ean": "7891962060477", "cod_coope": "281043",},
-  "BAUDUCCO TOSTADAS ORIGINAL CRACKERS PAQ 142GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "BAUDUCCO", "ean": "7891962060453", "cod_coope": "281040",},
-  "DON SATUR BIZCOCHOS SALADOS CRACKERS PAQ.200 GR5735000328": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "D SATUR BIZ", "ean": "7795735000328", "cod_coope": "931241",},
-  "SCHAR SALINIS SNACKS 60 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "DR. SCHAR", "ean": "8008698002070", "cod_coope": "319342",},
-  "SCHAR TOSTADAS CEREAL S/GLU.PAQUETE 87GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "DR. SCHAR", "ean": "8008698028582", "cod_coope": "319336",},
-  "GRANIX GRAN AGUA SANDWICH CRACKERS 200 GRS.PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANAGUA", "ean": "7790045001133", "cod_coope": "136220",},
-  "GRANIX GRAN AGUA SANDWICH CRACKERS PAQ.200 X30045001379": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANAGUA", "ean": "7790045001379", "cod_coope": "136131",},
-  "GRANIX GALL CRACKERS SIN SAL 200GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANIX", "ean": "7790045827733", "cod_coope": "317272",},
-  "GRANIX GALLETAS CR 600GR 1UN PAQUETE AGR X3": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANIX", "ean": "7790045827740", "cod_coope": "NO_ENCONTRADO",},
-  "GRANIX SALVADO CEREAL 240 GRS. PAQUE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANIX", "ean": "7790045826200", "cod_coope": "277474",},
-  "GRANIX SALVADO SIN SAL PAQ 230 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANIX", "ean": "7790045826095", "cod_coope": "NO_ENCONTRADO",},
-  "M CANUELAS 9 DE ORO GALL SN CRE/CEB 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "M CA¥UELAS 9 ORO", "ean": "7792180146120", "cod_coope": "321318",},
-  "M CANUELAS 9 DE ORO GALL SN HIERBAS 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "M CA¥UELAS 9 ORO", "ean": "7792180146144", "cod_coope": "321321",},
-  "M CANUELAS 9 DE ORO GALL SN JAMON 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "M CA¥UELAS 9 ORO", "ean": "7792180146137", "cod_coope": "321322",},
-  "M CANUELAS 9 DE ORO GALL SN ORIG 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "M CA¥UELAS 9 ORO", "ean": "7792180146090", "cod_coope": "321317",},
-  "M CANUELAS 9 DE ORO GALL SN QUESO 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "M CA¥UELAS 9 ORO", "ean": "7792180146106", "cod_coope": "321319",},
-  "M PROPIAS": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "M PROPIAS", "ean": "1", "cod_coope": "NO_ENCONTRADO",},
-  "ARCOR MEDIA TARDE SANDWICH CRACKERS 107 GR PAQ.X 5U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "MEDIA TARDE", "ean": "7790040143012", "cod_coope": "310732",},
-  "BAGLEY MEDIA TARDE SANDWICH CRACKER 107GR PAQ AGR 3U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "MEDIA TARDE", "ean": "7790040143005", "cod_coope": "310733",},
-  "LIA MEDIA TARDE CRACKERS 105 GR PAQUE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "MEDIA TARDE", "ean": "7790040143593", "cod_coope": "NO_ENCONTRADO",},
-  "LIA MEDIA TARDE GALL CR 315GR PAQUE AGR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "MEDIA TARDE", "ean": "7790040143586", "cod_coope": "311941",},
-  "AGLU P/CELIACO SALADAS SNACK 150 GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798128410094", "cod_coope": "NO_ENCONTRADO",},
-  "AGLU SAB.QUESO SNACKS 150 GR CAJA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798128410063", "cod_coope": "NO_ENCONTRADO",},
-  "ANIMAL KIND BIZCOCHO MATERO VEG CR 170 GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798184451383", "cod_coope": "NO_ENCONTRADO",},
-  "DIMAX BIZCO. MIX SEM. SALADOS S/GLU. 150GR CJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798144941336", "cod_coope": "278692",},
-  "DIMAX BIZCOCHOS SALADOS LIB.GLUTEN CRACK.200 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798144940384", "cod_coope": "NO_ENCONTRADO",},
-  "DOS HERMANOS TOST.DE ARROZ CRACKERS 120 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790503000333", "cod_coope": "265708",},
-  "DOS HERMANOS TOST.DE ARROZ S/SAL CRACKERS 120 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790503000326", "cod_coope": "265707",},
-  "GALLO BIZCOCHOS ARROZ SAL CRACKERS 100GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790070418463", "cod_coope": "NO_ENCONTRADO",},
-  "HOJALMAR SNACK MATERO BIZCOCH. SALADO BOL. 180GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7793450000876", "cod_coope": "NO_ENCONTRADO",},
-  "KAPAC GALL SNACKS PIZZA S/GLUT 80GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794906040217", "cod_coope": "NO_ENCONTRADO",},
-  "KAPAC GALLETAS CR C/SEM S/GL 100GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794906040286", "cod_coope": "NO_ENCONTRADO",},
-  "KAPAC GALLETAS SN CLASICAS 100GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794906040262", "cod_coope": "NO_ENCONTRADO",},
-  "KAPAC GALLETAS SN PIMIENTO 100GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794906040279", "cod_coope": "NO_ENCONTRADO",},
-  "KAPAC SNACKS JAMON S/GLUT 80GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794906040200", "cod_coope": "NO_ENCONTRADO",},
-  "KAPAC SNACKS QUESO S/GLUT 80GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794906040194", "cod_coope": "NO_ENCONTRADO",},
-  "LEIVA CRACKERS SALVADO 420 GRS. PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790412001759", "cod_coope": "NO_ENCONTRADO",},
-  "LEIVA GALL CR C/SAL 420GR 1UN PAQUETE AGR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790412002084", "cod_coope": "320352",},
-  "LEIVA GALL S/SAL CRACKERS 330GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790412001315", "cod_coope": "294408",},
-  "LEIVA MARINERA S/SAL 3U.PAQ AGR 110GR C/U 330G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790412001919", "cod_coope": "294439",},
-  "LEIVA MULTI.SEMILL CEREAL 175 GR PAQ AGR 3U 525G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790412001735", "cod_coope": "NO_ENCONTRADO",},
-  "LEIVA SANDWICH CRACKERS 110 GRPAQ.X3 ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790412000981", "cod_coope": "294407",},
-  "LEIVA TOSTADAS DE ARROZ PAQUETE 150 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790412000271", "cod_coope": "295730",},
-  "LEIVA TOSTADAS DE ARROZ S/SAL CRACKERS 150 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790412000295", "cod_coope": "295732",},
-  "M CANUELAS PASEO GALLETAS SN QUESO 250GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7792180145444", "cod_coope": "NO_ENCONTRADO",},
-  "NUEVO SOL S/SAL CRACKERS 200 GRS. PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "8124687002002", "cod_coope": "NO_ENCONTRADO",},
-  "PASEO GALLETAS CRACKERS OLIV/ROME 250GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7792180145420", "cod_coope": "NO_ENCONTRADO",},
-  "PRIMER PRECIO BIZC.C/GRASA 200GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7795643020210", "cod_coope": "312075",},
-  "PRIMER PRECIO GALL SANDWICH CR 300GR PAQ AGR 1UN X3": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7792683501105", "cod_coope": "318525",},
-  "PRIMER PRECIO MARINERAS C/SEM BOLSA 220GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798033900437", "cod_coope": "278423",},
-  "PRIMER PRECIO MARINERAS CLASICAS BOLSA 220GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798033900406", "cod_coope": "280493",},
-  "PRIMER PRECIO MARINERAS LIGHT BOLSA 220GR MP": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798033900420", "cod_coope": "278422",},
-  "PRIMER PRECIO MARINERAS S/SAL BOLSA 220GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798033900413", "cod_coope": "281304",},
-  "PRIMER PRECIO SANDWICH CRACKERS 3PAQ.101GR C/U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798141972524", "cod_coope": "318218",},
-  "PRIMER PRECIO SANDWICH CRACKERS 5PAQ.101GR C/U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798141972517", "cod_coope": "318219",},
-  "PRIMER PRECIO TOST.ARROZ 100GR PAQ.CRACKE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "656750790489", "cod_coope": "NO_ENCONTRADO",},
-  "PRIMER PRECIO TOST.ARROZ.C/SEM.100GR PAQ.CRAC. 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "656750790502", "cod_coope": "NO_ENCONTRADO",},
-  "PRIMER PRECIO TOSTA.ARROZ 150GR PAQ.CRACKE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "656750790472", "cod_coope": "NO_ENCONTRADO",},
-  "PRIMER PRECIO TOSTA.ARROZ 150GR PAQ.CRACKE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "656750790496", "cod_coope": "NO_ENCONTRADO",},
-  "PRIMER PRECIO TOSTADAS C/SEM CRACKERS 180GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791568006377", "cod_coope": "312082",},
-  "PRIMER PRECIO TOSTADAS CLASICAS CRACKERS 180GR PAQUETE 1": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791568006360", "cod_coope": "NO_ENCONTRADO",},
-  "PRIMER PRECIO TOSTADAS LIGHT CRACKERS 180GR PAQUETE 1": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791568006384", "cod_coope": "312079",},
-  "PRIMER PRECIO TOSTADAS S/SAL CR 180GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791568006391", "cod_coope": "312081",},
-  "TOSTEX CINTITAS CEBOLLAS CRACKERS 125 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810361", "cod_coope": "NO_ENCONTRADO",},
-  "TOSTEX CINTITAS CLASICAS CRACKERS 125 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810354", "cod_coope": "708065",},
-  "TOSTEX CINTITAS CROCANTES PIZZA CRACKERS 125 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810385", "cod_coope": "708072",},
-  "TOSTEX CINTITAS JAMON CRACKERS 125 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810521", "cod_coope": "708071",},
-  "TOSTEX CINTITAS QUESO CRACKERS 125 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810347", "cod_coope": "708066",},
-  "TOSTEX CINTITAS SAB.BARBACOA BOLSA.125G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810750", "cod_coope": "NO_ENCONTRADO",},
-  "TOSTEX CINTITAS SAB.CHEDDAR BOLSA.125G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810767", "cod_coope": "708935",},
-  "TOSTEX CINTITAS SEMILLAS CRACKERS 125 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810446", "cod_coope": "708069",},
-  "TOSTEX GALL SN CINTITAS PICANTE BOLSA.125GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125811214", "cod_coope": "715144",},
-  "TOSTEX GALL SN CINTITAS SAB.KETCHUP BOLSA 125GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125811221", "cod_coope": "715145",},
-  "YIN YANG TOSTADAS C/CHIA BOLSA 120GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790495004401", "cod_coope": "280543",},
-  "YIN YANG TOSTADAS C/QUINOA BOLSA 120GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790495004395", "cod_coope": "280544",},
-  "M CANUELAS PASEO GALLETAS CR PIZZA 250GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180145437", "cod_coope": "NO_ENCONTRADO",},
-  "M.CANUELASPASEO MINI CRACKERS 300 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180006448", "cod_coope": "250601",},
-  "M.CANUELASPASEO MINI MARINER. CRACKERS 220 GR. BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180006462", "cod_coope": "250603",},
-  "M.CANUELASPASEO MINI SALVADO CEREAL 300 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180006455", "cod_coope": "250602",},
-  "M.CANUELASPASEO MINICRACKERS 5 SEMILLAS 300 GRBOL.CEREAL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180007315", "cod_coope": "253961",},
-  "M.CANUELASPASEO MINICRACKERS MIX CEREAL 300 GRBOL.CEREAL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180007346", "cod_coope": "253959",},
-  "M.CANUELASPASEO MINICRACKERS S/SAL 300 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180007254", "cod_coope": "253957",},
-  "M.CANUELASPASEO MINICRACKERS SESAMO 300 GRBOL.CEREAL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180007285", "cod_coope": "253958",},
-  "RIERA TOSTADAS 7 SEMI PAQUETE 200 GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "RIERA", "ean": "7790071070417", "cod_coope": "309645",},
-  "RIERA TOSTADAS CLASICA CRACKERS 200 GR PAQUE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "RIERA", "ean": "7790071090231", "cod_coope": "309629",},
-  "RIERA TOSTADAS INTEGRAL 200GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "RIERA", "ean": "7790071090330", "cod_coope": "309638",},
-  "RIERA TOSTADAS LIGHT PAQUETE 200G PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "RIERA", "ean": "7790071070134", "cod_coope": "309639",},
-  "RIERA TOSTADAS ORGANICA 200GR PAQUE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "RIERA", "ean": "7790071070516", "cod_coope": "309646",},
-  "RIERA TOSTADAS PROTEICA CRACKERS 200 GR PAQUE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "RIERA", "ean": "7790071070219", "cod_coope": "309647",},
-  "RIERA TOSTADAS S/SAL CRACK 200 GR PAQUE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "RIERA", "ean": "7790071090422", "cod_coope": "309632",},
-  "SMAMS CRACKERS CRACKERS BOLSA 150 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SMAMS", "ean": "7798181510212", "cod_coope": "NO_ENCONTRADO",},
-  "SMAMS MIX DE SEMILLAS CEREALES 150 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SMAMS", "ean": "7798181510229", "cod_coope": "NO_ENCONTRADO",},
-  "PEPSICO TWISTOS JAMON IBER 155GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310984475", "cod_coope": "285003",},
-  "PEPSICO TWISTOS MINI TOST SN QUESO 155GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310984444", "cod_coope": "284909",},
-  "TWISTOS MINI TOST.JAMON 95GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310983256", "cod_coope": "NO_ENCONTRADO",},
-  "TWISTOS MINI TOST.QUESO 95GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310983270", "cod_coope": "281737",},
-  "BIMBO ZENISSIMO SALMAS HORN.CLAS SN CAJA 90GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "ZENISSIMO", "ean": "7793890261844", "cod_coope": "NO_ENCONTRADO",},
-  "CHOCOARROZ ALFAJOR DE ARROZ CHO.BLANCO 22GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418289", "cod_coope": "284537",},
-  "CHOCOARROZ ALFAJOR DE ARROZ DDL 22 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418203", "cod_coope": "284535",},
-  "CHOCOARROZALFAJOR DE ARROZ C/LIMON 22 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418241", "cod_coope": "284532",},
-  "CHOCOARROZALFAJOR DE ARROZ MARROC 22 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418326", "cod_coope": "NO_ENCONTRADO",},
-  "CACHAFAZ ALFAJOR NEGRO 60 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "77934499", "cod_coope": "NO_ENCONTRADO",},
-  "EL CACHAFAZ ALFAJOR BLANCO 60 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "77934505", "cod_coope": "NO_ENCONTRADO",},
-  "EL CACHAFAZ ALFAJOR NEGRO MOU. 50 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "77930057", "cod_coope": "NO_ENCONTRADO",},
-  "EL CACHAFAZ ALFAJOR.MINI CHC SPL 162GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "7798128002459", "cod_coope": "NO_ENCONTRADO",},
-  "GEORGALOS FULL.MANI ALFAJOR SPL 40GR PAQ 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "GEORGALOS", "ean": "7790380025191", "cod_coope": "NO_ENCONTRADO",},
-  "M PROPIAS": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "M PROPIAS", "ean": "1", "cod_coope": "NO_ENCONTRADO",},
-  "9 DE ORO ALFAJOR SIMPL DDL 45GR 1UN PAQUETE": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7792180145390", "cod_coope": "NO_ENCONTRADO",},
-  "9 DE ORO ALFAJOR SIMPL DDL 45GR 1UN PAQUETE": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7792180145406", "cod_coope": "317907",},
-  "9 DE ORO ALFAJOR SPL 45GR 1UN PAQUETE": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7792180145413", "cod_coope": "317908",},
-  "ANIMAL KIND ALFAJOR BAN. SPL 50GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798184451413", "cod_coope": "315229",},
-  "ANIMAL KIND ALFAJOR CHOC VEGANO 50GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798184451192", "cod_coope": "NO_ENCONTRADO",},
-  "ANIMAL KIND ALFAJOR MANI 42GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798184451123", "cod_coope": "NO_ENCONTRADO",},
-  "ANIMAL KIND ALFAJOR PISTACH 42GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798184451369", "cod_coope": "315227",},
-  "GRANDIOSO 2 ALFAJOR CHC SPL 38GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798415000076", "cod_coope": "318052",},
-  "GRANDIOSO 2 ALFAJOR CHC SPL 38GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798415000083", "cod_coope": "NO_ENCONTRADO",},
-  "GRANDIOSO ALFAJOR CHC BLANCO TRIPLE 70GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798415000021", "cod_coope": "NO_ENCONTRADO",},
-  "GRANDIOSO ALFAJOR NEGRO TRIPLE 70GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798415000014", "cod_coope": "NO_ENCONTRADO",},
-  "MIKO ALFAJOR NEGRO DDL 38GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798171732952", "cod_coope": "296477",},
-  "SMAMS ALFAJOR DDL SPL 50GR 3U PAQ 150G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798181511370", "cod_coope": "NO_ENCONTRADO",},
-  "TODDY ALFAJOR MOUSSE SPL 50GR REG PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TODDY", "ean": "7790380023579", "cod_coope": "313082",},
-  "TODDY ALFAJOR MOUSSE SPL 50GR REG PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TODDY", "ean": "7790380023630", "cod_coope": "NO_ENCONTRADO",},
-  "TURIMAR ALFAJOR 35 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TURIMAR", "ean": "77909923", "cod_coope": "NO_ENCONTRADO",},
-  "TURIMAR TRIPLE BLANCO ALFAJOR 60 GR ARG": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TURIMAR", "ean": "77911018", "cod_coope": "NO_ENCONTRADO",},
-  "TURIMAR TRIPLE NEGRO ALFAJOR 60 GRARG": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TURIMAR", "ean": "77910080", "cod_coope": "NO_ENCONTRADO",},
-  "BARILOCHE ALMENDRAS C/CHOCOLA.BOLSA 80 GRARG": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430903831", "cod_coope": "NO_ENCONTRADO",},
-  "BARILOCHE PASAS DE UVA BANAD. 120 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430095741", "cod_coope": "NO_ENCONTRADO",},
-  "BARILOCHE PASAS DE UVA C/CHOCO. BOLSA 80GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430095833", "cod_coope": "NO_ENCONTRADO",},
-  "BARILOCHE PRALINE CHOC/AVE 180 GR CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430902742", "cod_coope": "NO_ENCONTRADO",},
-  "BARILOCHE PRALINE CHOC/AVE 180 GR CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430903480", "cod_coope": "NO_ENCONTRADO",},
-  "BARILOCHE PRALINE PREMIUM CHOCO/ALM 180 GR CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430902773", "cod_coope": "NO_ENCONTRADO",},
-  "BARILOCHE PRALINE PREMIUM TIRAMISU 180 GR CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430902711", "cod_coope": "NO_ENCONTRADO",},
-  "BARILOCHE PRALINE PREMIUM TRUFA 180 GR CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430902704", "cod_coope": "NO_ENCONTRADO",},
-  "BARILOCHE PRALINE TRUFA 120 GR CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430609221", "cod_coope": "NO_ENCONTRADO",},
-  "BARILOCHE TURRON COCO BANADO 180GR CAJA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430902940", "cod_coope": "NO_ENCONTRADO",},
-  "BARILOCHE TURRON MANI C/CH. 150 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430370701", "cod_coope": "NO_ENCONTRADO",},
-  "FANTOCHE PASAS DE UVA BAN C/CHOC 80GR POUCH 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "FANTOCHE", "ean": "7792360097969", "cod_coope": "NO_ENCONTRADO",},
-  "GALLO OBLEA D/ARROZ RELL.BAN. CHC 20GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070431905", "cod_coope": "NO_ENCONTRADO",},
-  "GALLO OBLEA DE ARROZ RELLE.BAN. 20 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070411952", "cod_coope": "NO_ENCONTRADO",},
-  "GEORGALOS ALMENDRAS C/CHOCOLA. 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380037767", "cod_coope": "NO_ENCONTRADO",},
-  "GEORGALOS PASAS BANADAS 80 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380037774", "cod_coope": "NO_ENCONTRADO",},
-  "GEORGALOS TURRON CAPUCCINO CUB.CHOCO. 100GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380033196", "cod_coope": "NO_ENCONTRADO",},
-  "GEORGALOS TURRON DE MANI C/CHOCO. 90 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380013594", "cod_coope": "NO_ENCONTRADO",},
-  "KINDER BUENO BOMBON 21.5 GRX2 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KINDER BUENO", "ean": "80052760", "cod_coope": "NO_ENCONTRADO",},
-  "KINDER BUENO WHITE REG. BOMBON 19.5 GR X2 PAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KINDER BUENO", "ean": "80761761", "cod_coope": "NO_ENCONTRADO",},
-  "KIT KAT CHOCOLATE OBLEA BAN TRP CHC 41.5GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KIT-KAT", "ean": "7891000422052", "cod_coope": "NO_ENCONTRADO",},
-  "KIT KAT OBLEA BAN.CHOCOLATE C/LECHE 41.5 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KIT-KAT", "ean": "7891000248799", "cod_coope": "267590",},
-  "KIT KAT OBLEA BANADA CHOCOLATE 41.5GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KIT-KAT", "ean": "7891000441039", "cod_coope": "NO_ENCONTRADO",},
-  "KIT KAT OBLEA.BANADA BCO CHOCOLATE 41.5GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KIT-KAT", "ean": "7891000379028", "cod_coope": "299968",},
-  "LHERITIER PASAS DE UVA BAN.C/CHO. 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "LHERITIER", "ean": "7792860007925", "cod_coope": "NO_ENCONTRADO",},
-  "LHERITIER TURRON DE MANI BAN. C/CHO.100GR BOL": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "LHERITIER", "ean": "7792860000810", "cod_coope": "NO_ENCONTRADO",},
-  "CHOCOLART ALMENDRAS BAN C/CHC 80GR POUCH 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "M PROPIAS", "ean": "7798136349331", "cod_coope": "NO_ENCONTRADO",},
-  "CHOCOLART ARANDANOS C/ CHOCO 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "M PROPIAS", "ean": "7798136347993", "cod_coope": "NO_ENCONTRADO",},
-  "CHOCOLART AVELLANAS BAN.C/CHO. 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "M PROPIAS", "ean": "7798136347559", "cod_coope": "NO_ENCONTRADO",},
-  "CHOCOLART BALON CEREAL BAN.C/CHO.C/LE.80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "M PROPIAS", "ean": "7798136347290", "cod_coope": "NO_ENCONTRADO",},
-  "CHOCOLART BOCADOS DDL CUB.CHOCO CJA 80GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "M PROPIAS", "ean": "7798136349348", "cod_coope": "NO_ENCONTRADO",},
-  "CHOCOLART GRANOS DE CAFE BAN. C/CH.80 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "M PROPIAS", "ean": "7798136347504", "cod_coope": "NO_ENCONTRADO",},
-  "CHOCOLART LMENDRAS BAN.C/CHO. 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "M PROPIAS", "ean": "7798136347511", "cod_coope": "NO_ENCONTRADO",},
-  "CHOCOLART NARANJAS C/CHOCO. 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "M PROPIAS", "ean": "7798136348006", "cod_coope": "NO_ENCONTRADO",},
-  "CHOCOLART PASAS DE UVA BAN.C/CHO. 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "M PROPIAS", "ean": "7798136347610", "cod_coope": "NO_ENCONTRADO",},
-  "M PROPIAS": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "M PROPIAS", "ean": "1", "cod_coope": "NO_ENCONTRADO",},
-  "MANTECOL OYG GALL OBLEA BANADA CHC 27GR PAQ 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "MANTECOL", "ean": "7790380026426", "cod_coope": "318411",},
-  "NUGATON OBLEA BAN.CHO.C/LEC.PAQ. 27 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "NUGATON", "ean": "7792360072447", "cod_coope": "226492",},
-  "NUGATON OBLEA CHOCOLATE BLANCO 27 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "NUGATON", "ean": "7792360072461", "cod_coope": "NO_ENCONTRADO",},
-  "LA CASA PISTACHO BANA CHOC 100GR BOL 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740910590", "cod_coope": "NO_ENCONTRADO",},
-  "LA CASA TURRON CHOCO/NARANJA BANA. CJA 225 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740901918", "cod_coope": "NO_ENCONTRADO",},
-  "LACASA ALMEND BANA CHOC NEGRO 125G BOL 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740910569", "cod_coope": "NO_ENCONTRADO",},
-  "LACASA ALMEND BANA CHOC NEGRO 125G BOL 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740910576", "cod_coope": "NO_ENCONTRADO",},
-  "LACASA ARANDANO BANA CHOC NEGRO 125G BOL 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740911733", "cod_coope": "NO_ENCONTRADO",},
-  "LACASA NARANJA BANA CHOC NEGRO 125G BOL 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740910583", "cod_coope": "NO_ENCONTRADO",},
-  "LACASA PASAS BANA CHOC NEGRO 150G BOL 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740907064", "cod_coope": "NO_ENCONTRADO",},
-  "PALMESANO ALMENDRAS C/CHOCOLA.PAQUETE 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7795522000128", "cod_coope": "NO_ENCONTRADO",},
-  "PALMESANO TURRON C/ CIRUELA BAN.C/CHO. 100 GRPAQUETE": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7795522002559", "cod_coope": "NO_ENCONTRADO",},
-  "PALMESANO UVAS PASASC/CHOCOLATBOLSA 80 GR ARG": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7795522000333", "cod_coope": "NO_ENCONTRADO",},
-  "ROIG HUESITOS C/CHOCO. BOLSA 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7795522002801", "cod_coope": "NO_ENCONTRADO",},
-  "ROIG LENTEJA CHOCOLATE BOLSA 80 GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7795522404681", "cod_coope": "NO_ENCONTRADO",},
-  "SABE BIEN ! BRAUNICHOC O BAN 35GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7793890261530", "cod_coope": "NO_ENCONTRADO",},
-  "TYM OBLEAS BANO CH. 27GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7793209904028", "cod_coope": "NO_ENCONTRADO",},
-  "TYM OBLEAS BANO CH. 27GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7793209904035", "cod_coope": "NO_ENCONTRADO",},
-  "TYM OBLEAS BANO CH. 27GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7793209904042", "cod_coope": "NO_ENCONTRADO",},
-  "VIZZIO ALMENDRAS BAN CHC 80GR POUCH 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "VIZZIO", "ean": "7792360098003", "cod_coope": "NO_ENCONTRADO",},
-  "VIZZIO CROCANTE CEREAL BAN.C/CHO. 80 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "VIZZIO", "ean": "7792360097983", "cod_coope": "NO_ENCONTRADO",},
-  "NESTLE ALPINO BOMBONES CHC 195GR CAJA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ALPINO", "ean": "7891000067253", "cod_coope": "NO_ENCONTRADO",},
-  "GAROTO BOMBONES SURTIDOS CAJA 250GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "GAROTO", "ean": "7891000392775", "cod_coope": "NO_ENCONTRADO",},
-  "GAROTO SERENATA DE AMOR O BAN 140.8GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "GAROTO", "ean": "7891000404249", "cod_coope": "NO_ENCONTRADO",},
-  "CHOCOLART BOCADO BAN CHOCO POUCH 80GR 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "M PROPIAS", "ean": "7798136349621", "cod_coope": "NO_ENCONTRADO",},
-  "M PROPIAS": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "M PROPIAS", "ean": "1", "cod_coope": "NO_ENCONTRADO",},
-  "NESTLE ESPECIALIDADES BOMB.SURT. 251 GR CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "NESTLE", "ean": "7891000391068", "cod_coope": "NO_ENCONTRADO",},
-  "NESTLE TAB CHOC SOL BYB 22GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "NESTLE", "ean": "8445291565203", "cod_coope": "318300",},
-  "LACASA TRUFAS AL CACAO PUROBOMBONES 200 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "8410740050616", "cod_coope": "NO_ENCONTRADO",},
-  "LACASA TRUFAS CACAO 70% 150GR CAJA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "8410740910743", "cod_coope": "NO_ENCONTRADO",},
-  "LACASA TRUFAS FRESA BOMBONES 200 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "8410740903547", "cod_coope": "NO_ENCONTRADO",},
-  "LACASA TRUFAS NARANJA BOMBONES 200 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "8410740905817", "cod_coope": "NO_ENCONTRADO",},
-  "FERRERO ROCHER BOMBON CJA 4U 50G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "7898024397861", "cod_coope": "NO_ENCONTRADO",},
-  "FERRERO ROCHER BOMBON ESTUCHE 150GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "7898024396994", "cod_coope": "281047",},
-  "FERRERO ROCHER BOMBONES 100 GRCAJA PL.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "7861002900117", "cod_coope": "105542",},
-  "FERRERO ROCHER BOMBONES 12.5 GRPAQ.X 3 U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "78909434", "cod_coope": "NO_ENCONTRADO",},
-  "FERRERO ROCHER BOMBONES 300 GREST.PL.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "8000500009673", "cod_coope": "186781",},
-  "FERRERO ROCHER BOMBONES COLLECTION X 77 GR CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "7898024397151", "cod_coope": "NO_ENCONTRADO",},
-  "BARILOCHE CONFITE MANI BOL. 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BARILOCHE", "ean": "7792430095826", "cod_coope": "281579",},
-  "BARILOCHE LENTEJAS CONFITADAS BOLSA 80GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BARILOCHE", "ean": "7792430095840", "cod_coope": "NO_ENCONTRADO",},
-  "BARILOCHE MANI CON CHOCOLATE 120 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BARILOCHE", "ean": "7792430095420", "cod_coope": "NO_ENCONTRADO",},
-  "BARILOCHE TURRON BANADO MANI 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BARILOCHE", "ean": "7792430608651", "cod_coope": "NO_ENCONTRADO",},
-  "GEORGALOS GARRAPIN. DE MANI BAN.C/CHO.80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380037811", "cod_coope": "NO_ENCONTRADO",},
-  "GEORGALOS MANI COLOR C/CHOCOLATE 80GR BOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380037828", "cod_coope": "NO_ENCONTRADO",},
-  "GEORGALOS MANI CON CHOCOLATE 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380037736", "cod_coope": "NO_ENCONTRADO",},
-  "GEORGALOS MANI CROC.BAN.C/CHO. 100 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380011880", "cod_coope": "NO_ENCONTRADO",},
-  "LHERITIER MANI CON CHOCOLATE 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "LHERITIER", "ean": "7792860007680", "cod_coope": "240006",},
-  "CHOCOLART CONFITES C/CHOCO. 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M PROPIAS", "ean": "7798136340031", "cod_coope": "NO_ENCONTRADO",},
-  "CHOCOLART MANI CON CHOCOLATE 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M PROPIAS", "ean": "7798136347818", "cod_coope": "NO_ENCONTRADO",},
-  "M PROPIAS": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M PROPIAS", "ean": "1", "cod_coope": "NO_ENCONTRADO",},
-  "CONGUITOS MANI BAN C/CHOCOLATE 80GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "8410740924894", "cod_coope": "NO_ENCONTRADO",},
-  "KING MANI CON CHOCOLATE 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7798151950697", "cod_coope": "NO_ENCONTRADO",},
-  "PALMESANO MANI CON CHOCOLATE BOLSA 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7795522000173", "cod_coope": "NO_ENCONTRADO",},
-  "PALMESANO MANI CONF COLOR C/CHOC. BOLSA 100GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7795522004089", "cod_coope": "NO_ENCONTRADO",},
-  "ROIG MANI CON CHOCOLATE BOLSA 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7795522002825", "cod_coope": "NO_ENCONTRADO",},
-  "VIZZIO MANI BANADO C/CHOCOLATE 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "VIZZIO", "ean": "7792360097976", "cod_coope": "NO_ENCONTRADO",},
-  "GEORGALOS HVO PASCUAS C/CONFITES 22GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "GEORGALOS", "ean": "7790380032458", "cod_coope": "NO_ENCONTRADO",},
-  "KINDER JOY HUEVO DE CHOCOLATE 20 GRC/SORPRESA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER JOY", "ean": "78602731", "cod_coope": "NO_ENCONTRADO",},
-  "KINDER JOY HUEVO DE CHOCOLATE 20 GRX 2U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER JOY", "ean": "7861002900421", "cod_coope": "NO_ENCONTRADO",},
-  "KINDER C/ LECHE P/NENA C/SORP 20 GRS HYF 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "78931053", "cod_coope": "NO_ENCONTRADO",},
-  "KINDER C/LECHE P/NENE C/SORP 20 GRS HYF 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "40084107", "cod_coope": "NO_ENCONTRADO",},
-  "KINDER JOY HUEVO CHO. 20 GR CAJA 2U C/SORP": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "7797394002453", "cod_coope": "NO_ENCONTRADO",},
-  "KINDER SORPRESA NENA HUEVO DE CHO. 20 GRCAJA 2 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "7898024395867", "cod_coope": "208827",},
-  "KINDER SORPRESA SELVATICOS HUEVO CHOC. 20 GR 2 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "7797394001555", "cod_coope": "208831",},
-  "PALMESANO T/ITALIANOHUEVO DE CHOCOLATE 100 GRPAS/NAV.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "O MARCAS", "ean": "7795522004195", "cod_coope": "NO_ENCONTRADO",},
-  "TODDY HUEVO CHC S/SORP 75GR ENV 1U PAS/NAV": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "TODDY", "ean": "7790380032632", "cod_coope": "NO_ENCONTRADO",},
-  "KINDER CHOCOLATE C/LECHE TAB.SOLIDA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "KINDER", "ean": "77949707", "cod_coope": "NO_ENCONTRADO",},
-  "KINDER CHOCOLATE C/LECHE TAB.SOLIDA 50 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "KINDER", "ean": "77949677", "cod_coope": "NO_ENCONTRADO",},
-  "KINDER MAXI TAB.SOLIDA 21 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "KINDER MAXI", "ean": "80050094", "cod_coope": "NO_ENCONTRADO",},
-  "MECANO TUERCA TAB.RELLE. 19 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MECANO", "ean": "7792360072423", "cod_coope": "NO_ENCONTRADO",},
-  "NESTLE TAB CHC SOLIDAS 45GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565173", "cod_coope": "318304",},
-  "NESTLE TAB CHOC SOLIDAS 50GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565333", "cod_coope": "318303",},
-  "NESTLE TAB CHOC SOLIDAS 50GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565395", "cod_coope": "NO_ENCONTRADO",},
-  "NESTLE TAB CHOC. SOLIDAS 25GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565364", "cod_coope": "318301",},
-  "NESTLE TAB CHOC. SOLIDAS 25GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565425", "cod_coope": "NO_ENCONTRADO",},
-  "NESTLE CLASSIC DIPLOMATA SOLIDAS 80GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE CLASSIC", "ean": "7891000368893", "cod_coope": "NO_ENCONTRADO",},
-  "NESTLE CLASSIC TAB.SOLIDA 80GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE CLASSIC", "ean": "7891000369098", "cod_coope": "NO_ENCONTRADO",},
-  "NESTLE DUO CLASSIC TAB.SOLIDA 80GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE CLASSIC", "ean": "7891000368992", "cod_coope": "NO_ENCONTRADO",},
-  "DAQUI MAX TAB.SOLIDA 120 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7790380040286", "cod_coope": "NO_ENCONTRADO",},
-  "DIGIMON C/LECHE C/STICKER TAB.SOLIDA 8 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "77948335", "cod_coope": "NO_ENCONTRADO",},
-  "PRIMER PRECIO BLANCO TAB.SOLIDA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7798036732196", "cod_coope": "102020",},
-  "PRIMER PRECIO CHOC.C/LE.TAB.SOLIDA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7798036732172", "cod_coope": "102019",},
-}
@@ -1,1231 +0,0 @@
-productos = {
-  "ARCOR JUGO POLVO REG FRUTILLA SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143244",},
-  "ARCOR POLVO ANANA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580141516",},
-  "ARCOR POLVO DURAZNO BAJO AZUCARES SOBRE 18GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580129927",},
-  "ARCOR POLVO DURAZNO SOBRE 15GR P/1 LT": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580142766",},
-  "ARCOR POLVO FRUTILLA BAJO AZUCARES SOBRE 18GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580129910",},
-  "ARCOR POLVO LIMONADA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143527",},
-  "ARCOR POLVO MANZANA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580144142",},
-  "ARCOR POLVO MULTIFRUTA BAJO AZUCARES SOBRE 18GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580129774",},
-  "ARCOR POLVO NARA-DURAZNO BAJO AZUCARES SOBRE 18GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580129675",},
-  "ARCOR POLVO NARANJA BANANA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580141509",},
-  "ARCOR POLVO NARANJA DULCE REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143008",},
-  "ARCOR POLVO NARANJA DURAZNO REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580141943",},
-  "ARCOR POLVO NARANJA MANGO REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143763",},
-  "ARCOR POLVO NARANJA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143237",},
-  "ARCOR POLVO NAR-MANGO BAJO AZUCARES SOBRE 18GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580129729",},
-  "ARCOR POLVO POMELO ROSADO SOBRE REG 15GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580142285",},
-  "ARCOR POLVO REG FRUTILLA ANANA BANANA SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143824",},
-  "ARCOR POLVO REG MULTIFRUTA SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580142490",},
-  "BC LA CAMPAGNOLA FRUTILLA LIMON SIN AZU SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129637",},
-  "BC LA CAMPAGNOLA NARANJA DULCE SIN AZU SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129965",},
-  "BC LA CAMPAGNOLA POMELO AMARILLO SIN AZU. SOB .7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129576",},
-  "BC LA CAMPAGNOLA SIN AZU ANANA SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129620",},
-  "BC LA CAMPAGNOLA SIN AZU LIMONADA SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129941",},
-  "BC LA CAMPAGNOLA SIN AZU MANZANA SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129972",},
-  "BC LA CAMPAGNOLA SIN AZU NAR/DUR SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129880",},
-  "BC LA CAMPAGNOLA SIN AZU NARANJA SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580132774",},
-  "BC LA CAMPAGNOLA SIN AZU. MANGO NARANJA SOB .7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129958",},
-  "BC LA CAMPAGNOLA SIN AZU. MIX FRUTAL SOB .7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129385",},
-  "BC LA CAMPAGNOLA SIN AZU. POMELO ROSADO SOB .7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129644",},
-  "BAGLEY AMOR DUL RELL 330GR C/3U PAQUETE AGR 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "AMOR", "ean": "7790040143500",},
-  "BAGLEY AMOR VAINILLA DULCE RELLENA 110GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "AMOR", "ean": "7790040143531",},
-  "BAGLEY SURTIDO DUL.SECA 400GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAGL SURT", "ean": "7790040147720",},
-  "ARCOR CEREAL MIX AVENA Y PASAS DUL.SECA PAQ. 207 G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040135741",},
-  "ARCOR CEREAL MIX DUL.SECA CACAO 150GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040140943",},
-  "ARCOR CEREAL MIX DUL.SECA FRUTILL 150GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040140936",},
-  "ARCOR CEREAL MIX FRUTILLA/CHIA DUL.SECA PAQ. 207 G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040135765",},
-  "ARCOR CEREAL MIX GALL DUL SECA 100GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040140912",},
-  "ARCOR CEREAL MIX GALL.CM.AVE/CHOC 207GR 1UN PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040145023",},
-  "ARCOR CEREAL MIXAVE/SEM/CHIPS DUL.SECA 207 GR PAQ.": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040135758",},
-  "BAGLEY CHOCOLINAS BCO DUL SEC 245GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040142985",},
-  "BAGLEY CHOCOLINAS DUL.SECA PAQ.170G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040143227",},
-  "BAGLEY CHOCOLINAS DULCE SECA250 GRS. PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040143234",},
-  "BAGLEY CHOCOLINAS GALL DUL.SECA 181GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040148864",},
-  "BAGLEY CHOCOLINAS GALLET DUL.SEC PAQUETE 170G 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040148857",},
-  "BAGLEY CHOCOLINAS NEG DUL SEC. 258GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040142992",},
-  "BAGLEY GALL CHOCOLINAS DUL SEC 100GR PAQUE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040143241",},
-  "ARCOR COFLER BLOCK DULCE SECA PAQ. 124 GR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040116955",},
-  "ARCOR COFLER BOB GALL RELL 85GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143807",},
-  "ARCOR COFLER COOKIES DULCE SECA BOLSA 120 GR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040127944",},
-  "ARCOR COFLER GALL BANADA CHC 105.6G PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143739",},
-  "ARCOR COFLER GALL OBLEAS 87GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143821",},
-  "ARCOR COFLER GALL TARTAL.BAN CHC 105.6GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143753",},
-  "ARCOR COFLER GALL. BAN CHC 132.8GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143692",},
-  "ARCOR COFLER GALLET DULCE RELL 85GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143777",},
-  "ARCOR COFLER GALLET DULCE RELL 85GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143784",},
-  "ARCOR COFLER GALLETA DULCE OBLEA 91GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143814",},
-  "BAGLEY COQUITAS DULCE SECA 177GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COQUITAS", "ean": "7790040143258",},
-  "BAGLEY COQUITAS DULCE SECA 260GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COQUITAS", "ean": "7790040143265",},
-  "BAGLEY CRIOLLITAS TOSTADAS DULCES PAQ.195GR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CRIOLL", "ean": "7790040124530",},
-  "ARCOR DIVERSION SURTIDO DU.SE.REL. 400 GRBOLSA": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DIVERSION", "ean": "7790040143364",},
-  "ARCOR FORMIS ANIMALES DULCES SECAS 72 GRS PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139909",},
-  "ARCOR FORMIS C/D.DE LECHE DUL.RELL 72GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139916",},
-  "ARCOR FORMIS DDL DUL REL 102GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139961",},
-  "ARCOR FORMIS FRUTILLA DUL REL 102GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139923",},
-  "ARCOR FORMIS VAI/CHO DUL REL 102GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139930",},
-  "ARCOR FORMIS VAI/CHO DUL REL 102GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139978",},
-  "ARCOR FORMIS VAIN/FRUT DUL.RELL 72GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139893",},
-  "ARCOR MANA CHOC DUL SEC 136GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040137912",},
-  "ARCOR MANA CHOCOLATE DUL.RELLE.152 GR. PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040133242",},
-  "ARCOR MANA FRUTILLA DR 152 GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040133266",},
-  "ARCOR MANA LIMON DUL.RELLE.152 GR. PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040133259",},
-  "ARCOR MANA LIVIANAS LECHE DU.SE. PAQ 136GR 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040137813",},
-  "ARCOR MANA LIVIANAS LIMON DUL.SEC 136GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040137820",},
-  "ARCOR MANA VAIN ACARAMELADA DS 145GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040151901",},
-  "ARCOR MANA VAIN DUL.SEC 136GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040137837",},
-  "ARCOR MANA VAIN DUL.SEC. 136GR PAQ 3U 408G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040137844",},
-  "ARCOR MANA VAINILLA DUL.RELLE.152 GR. PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040133235",},
-  "BAGLEY MELITAS C/MIEL DUL SEC 159GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELITAS", "ean": "7790040139770",},
-  "BAGLEY MELLIZAS DUCE .RELL. 110GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELLIZAS", "ean": "7790040143548",},
-  "BAGLEY MELLIZAS GALL DUL RELL 330GR 1U PAQ AGR X3": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELLIZAS", "ean": "7790040143555",},
-  "BAGLEY MERENGADAS DUL.REL. 88GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MERENGADA", "ean": "7790040139657",},
-  "BAGLEY MERENGADAS. DUL.REL. 88GR PAQ AGR 3U 264G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MERENGADA", "ean": "7790040139091",},
-  "ARCOR GALLETA OBLEA WF 25GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O ARCOR", "ean": "77940131",},
-  "ARCOR GALLETA OBLEA WF 25GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O ARCOR", "ean": "77975737",},
-  "ARCOR GALLETA TURROKLET OB/WF 25GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O ARCOR", "ean": "77993540",},
-  "ARCOR OBLEA RELL TURRON Y MANI 25GR PAQ 250G 10UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O ARCOR", "ean": "7790580401504",},
-  "BAGLEY OPERA OBLEA PAQUETE 55 GR ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OPERA", "ean": "77903501",},
-  "BAGLEY OPERA OBLEAS 220 GRS. PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OPERA", "ean": "7790040008175",},
-  "BAGLEY OPERA OBLEAS DUL.RELLE.92 GR PAQUE.ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OPERA", "ean": "77903518",},
-  "BAGLEY PORTENITAS D.S VAINILLA/CARAME PAQ. 139G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PORTENITAS", "ean": "7790040132689",},
-  "BAGLEY PORTENITAS D.SEC VAIN/CARAME PAQ AGR 417G 3X 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PORTENITAS", "ean": "7790040151192",},
-  "ARCOR RECETA DE LA ABUELA PEPAS D.S.183GR BOL": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "R ABUELA", "ean": "7790040135895",},
-  "BAGLEY RUMBA GALL DUL.RELL. 110GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "RUMBA", "ean": "7790040143517",},
-  "BAGLEY RUMBA GALLET DUL.RELL. 330GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "RUMBA", "ean": "7790040143524",},
-  "BAGLEY SONRISAS DR 108 GRS PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SONRISAS", "ean": "7790040133488",},
-  "BAGLEY SONRISAS FRAM DL RELLE 108GR PACK X3 U 324 G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SONRISAS", "ean": "7790040133471",},
-  "ARCOR TORTITAS BLACK DUL.SECA 125 GRS. PAQUE.ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TORTITAS", "ean": "7790040676800",},
-  "ARCOR TORTITAS CHOCOLATE DUL.SECA 125 GRS. PAQUE.ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TORTITAS", "ean": "7790040677005",},
-  "BAGLEY CRIOLLITAS CRACKERS 100 GR C/U PAQ.X 3 U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040377806",},
-  "BAGLEY CRIOLLITAS ORIGINAL CR. 499G EST FAM 5X 1UN PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040139015",},
-  "BAGLEY CRIOLLITAS S/SAL CRACKERS 195GR PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040124523",},
-  "BAGLEY CRIOLLITAS SALVA CRACKERS 195GR PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040124516",},
-  "BAGLEY CRIOLLITASMAS GRANDES CRACKERS 169 G C/U PAQ.X 3 U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040946200",},
-  "BAGLEY CRIOLLITASMAS GRANDES CRACKERS 169 GR PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040946101",},
-  "BAGLEY CRIOLLITASORIGINAL CRACKERS 100 GR PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040377707",},
-  "BAGLEY CRIOLLITASSIN SAL CRACKERS 169 G.C/U PAQ.X 3UN.": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040946408",},
-  "BAGLEY CRIOLLITASSIN SAL CRACKERS 169 GRS. PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040946309",},
-  "BAGLEY CRIOLLITASTOST.CLAS.CRACK 195 GR PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040124509",},
-  "BAGLEY CEREAL C/SALVADO 169GR 3U PAQ AGR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "FAM", "ean": "7790040136243",},
-  "BAGLEY CEREALES SALVADO S/SAL 169GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "FAM", "ean": "7790040136267",},
-  "BAGLEY SALVADO 169 GR PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "FAM", "ean": "7790040136250",},
-  "ARCOR HOGARENAS 7 SEMILLAS CEREAL 189GR PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040136069",},
-  "ARCOR HOGARENAS 7 SEMILLAS CEREAL 189GR X3U PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040136076",},
-  "ARCOR HOGARENAS C/SESAMO CEREAL 167 GR PAQUE.": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040136083",},
-  "ARCOR HOGARENAS MIX CEREAL 185GR C/U PAQ. X 3U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040136106",},
-  "ARCOR HOGARENAS SALVADO CEREAL 200 G.C/U PAQ.X 3 UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040132955",},
-  "ARCOR HOGARENAS SALVADO CEREAL 200 GRS. PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040132962",},
-  "ARCOR HOGARENAS. MIX CEREALES CEREAL 185 GR PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040136090",},
-  "BAGLEY KESITAS GALL SNACKS QUESO 250GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "KESITAS", "ean": "7790040144033",},
-  "BAGLEY KESITAS HORNEADAS SNACKS 125 GR CAJA": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "KESITAS", "ean": "7790040173200",},
-  "BAGLEY REX KESITAS SNACKS 75 GRBOLSA ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "KESITAS", "ean": "7790040003606",},
-  "BAGLEY CEREALES CON ARROZ 181GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O BAGL", "ean": "7790040136229",},
-  "BAGLEY REX ORIGINAL SNACK 225GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "REX", "ean": "7790040144125",},
-  "BAGLEY REX ORIGINAL SNACKS 125 GR CAJA": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "REX", "ean": "7790040719804",},
-  "BAGLEY REX ORIGINAL SNACKS BOL 75 GRARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "REX", "ean": "7790040003569",},
-  "ARCOR SALADIX CALABRESA SNACKS 100 GRS. CAJA ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790580716806",},
-  "ARCOR SALADIX CALABRESA SNACKS 30 GR BOLSA ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790580775407",},
-  "ARCOR SALADIX CHIPS FUEGO 60GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790040133846",},
-  "ARCOR SALADIX DUO JAMON Y QUESO SN 33G BOLSA 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790040152052",},
-  "ARCOR SALADIX JAMON SNACKS 100 GRS. CAJA ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790580716707",},
-  "ARCOR SALADIX JAMON SNACKS 30 GR BOLSA ARG.": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790580387105",},
-  "ARCOR SALADIX PIZZA SNACKS 100 GRS. CAJA": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790580697303",},
-  "ARCOR SALADIX PIZZA SNACKS 30 GR BOLSA ARG.": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790580387006",},
-  "ARCOR SALADIX SN CALABRESA 1UN BOLSA 40GR 30%+": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790040152038",},
-  "SALADIX GALL SN JAMON 1U BOLSA 40GR ARCOR 30%+": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790040152014",},
-  "SALADIX GALL SN PIZZA 1UN BOLSA 40 GRS ARCOR 30%+": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790040152021",},
-  "SALADIX HORNEADO SN PICANTE 30GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790040147782",},
-  "SALADIX SALADIX SN PICANTE 100GR CAJA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790040141254",},
-  "SALADIX XTRA PICANTE SNACKS CAJA 100 GRS 1U ARCOR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790040147775",},
-  "BAGLEY GALL TRAVIATA ORIGINAL CR 324GR PAQ AGR 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040144088",},
-  "BAGLEY TRAVIATA C/KESIT GALL CR 288GR 1UN PAQ AGR X3": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040150270",},
-  "BAGLEY TRAVIATA C/REX GALL CRACKER 288GR X3 PAQ AGR 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040143920",},
-  "BAGLEY TRAVIATA CRACKERS 108GR 5U PAQUETE 540G PAQ AGR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040144095",},
-  "BAGLEY TRAVIATA GALL CR C/ REX SAL ORIG 1U PAQUETE 96GR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040143937",},
-  "BAGLEY TRAVIATA GALL CR KESIT 1U PAQUETE 96GR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040143944",},
-  "BAGLEY TRAVIATA.CRACKERS 108GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040144071",},
-  "TRAVIATA BAGLEY BALANCE CR 321GR X3U PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040142763",},
-  "AGUILA ALFAJOR MINITORTA TRIPLE 69GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "AGUILA", "ean": "7790040133587",},
-  "AGUILA ALFAJOR.MINITORTA BROWNI 71.5GR TRPL PQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "AGUILA", "ean": "7790040133594",},
-  "AGUILA MINITORTA TRIPLE 70.5 GR 1U PAQ REGULAR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "AGUILA", "ean": "7790040133600",},
-  "BAGLEY B & N 3.0 ALFAJOR NEGRO 73.5 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BLCO/NGRO", "ean": "7790040375000",},
-  "BON O BON ALFAJORES MINI 19.5GR X6 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BON O BON", "ean": "7790040129764",},
-  "BON O BON BLANCO ALFAJOR 40 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BON O BON", "ean": "7790040613607",},
-  "BON O BON NEGRO ALFAJOR 40 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BON O BON", "ean": "7790040613706",},
-  "BON O BON NEGRO ALFAJOR 40 GRPAQ.X6 U.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BON O BON", "ean": "7790040613904",},
-  "BON O BON NEGRO ALFAJOR TRIPLE 60 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BON O BON", "ean": "7790040614000",},
-  "COFLER CHOCO CREAMY ALFAJOR TRIPLE 60GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCO CREAMY", "ean": "7790040150010",},
-  "CHOCOTORTA ALFAJOR TRIPLE 71.5GR PAQ 1UN BAGLEY": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOTORTA", "ean": "7790040150072",},
-  "COFLER ALFAJOR SPL MOUSSE 40GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "COFLER", "ean": "7790040143647",},
-  "COFLER BLOCK ALFAJOR SIMPLE 40.7GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "COFLER", "ean": "7790040143654",},
-  "COFLER BLOCK RELL.CHOC.ALF.TRIPLE 60 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "COFLER", "ean": "7790040659605",},
-  "COFLER BLOCK.ALFAJOR SIMPLE 40.7GR 6U PAQ 244.2G": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "COFLER", "ean": "7790040143630",},
-  "TOFI ALFAJOR NEGRO 46 GRPAQ.X6 U.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TOFI", "ean": "7790040117143",},
-  "TOFI NEGRO ALFAJOR 46 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TOFI", "ean": "7790040116610",},
-  "AGUILA ALMENDRAS BAN C/CHOCOLAT 120GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "AGUILA", "ean": "7790580142384",},
-  "AGUILA BARRA TRIFLE BANADA 160GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "AGUILA", "ean": "7790580131111",},
-  "AGUILA NUT OBLEA BANADA CHOC 105GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "AGUILA", "ean": "7790580147556",},
-  "AGUILA PASAS BAN CHOCOLATE 120G BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "AGUILA", "ean": "7790580142421",},
-  "ARCOR CEREAL DE ARROZ BAN CHC 50GR BOL 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ARCOR", "ean": "7790580142414",},
-  "ARCOR GOMITA BAN CHC 80GR BOLSA 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ARCOR", "ean": "7790580139568",},
-  "ARCOR MILK OBLE BANADA CHC 20GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ARCOR", "ean": "7790580144227",},
-  "ARCOR TURRON BANADO C/CHOCOLA.90 GR CAJA ARG": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ARCOR", "ean": "7790580392604",},
-  "BON O BON BLANCA OBLEA BANADA 30 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580346614",},
-  "BON O BON CUBANITOS RELLE.BAN.C/CHOCO. 78GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580146948",},
-  "BON O BON OBLEA BANADA 30 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580346508",},
-  "BON O BON OBLEA BANADA C/CHOCO. 30 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580346515",},
-  "BON O BON POSTRE RELL. BANA.C/CHO 260 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580136352",},
-  "BON O BON.TENTACION BARRA MANI/OBLEA 120 GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580141301",},
-  "CABSHA CHO.BARRA C/GALL.CARA. DDL 110G 1U PAQ": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "CABSHA", "ean": "7790580135973",},
-  "COFLER ALMENDRAS BAN C/CHOCO 100GR BOL 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580141714",},
-  "COFLER ALMENDRAS BAN C/CHOCO C/LECH 100GR BOL 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580141721",},
-  "COFLER BLANCO OBLEA BAN TRPL C/CHOCLIN 110GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580142513",},
-  "COFLER BLOCK OBLEA BAN CHOCOMANI TRPL 110GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580141394",},
-  "COFLER BOTONES D/CHOCO SEMIAMARG 100GR BOL 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580141745",},
-  "COFLER CHOCOLINAS BAN. BARRA 110GR PAQ. 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580146856",},
-  "COFLER PASAS BANAD C/CHOCO. 100GR BOL 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580141707",},
-  "COFLER GRAFFITI OBLEA BAN.RELLENA C/CHO. 45 GRPAQ.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GRAFFITI", "ean": "7790580111755",},
-  "COFLER GRAFFITI OBLEA BANA RELL.45GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GRAFFITI", "ean": "7790580123741",},
-  "ARCOR PASAS BAN.C/CHO. 100 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O ARCOR", "ean": "7790580135942",},
-  "ROCKLETS 3 DESEOS REGULAR PAQUETE 120 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ROCKLETS", "ean": "7790580122652",},
-  "ROCKLETS BOLLS CEREAL BAN.C/CHO. 120 GRPAQ.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ROCKLETS", "ean": "7790580118235",},
-  "AGUILA D´OR FRUTOS SECOS BAN.CHOC.BOL 120GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "AGUILA", "ean": "7790580136420",},
-  "AGUILA MEDALLON CHOCOLATE 168GR 1U CAJA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "AGUILA", "ean": "7790580139872",},
-  "ARCOR BOMBONES SURTIDO ESP 223GR CAJA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ARCOR", "ean": "7790580138370",},
-  "ARCOR EL KIOSCO EN CASA 246GR CAJA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ARCOR", "ean": "7790580131371",},
-  "BON O BON AGUILA BOMBON CAJA 18 U X 15 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580102517",},
-  "BON O BON BOMBON BLANCO 16 GR.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "77961815",},
-  "BON O BON BOMBON BLANCO CAJA X 30 450 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580119058",},
-  "BON O BON BOMBON CHC 15 GR CAJA 18UN 270G": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580119065",},
-  "BON O BON BOMBON CHOCO C/LECHE CAJA 270GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580146368",},
-  "BON O BON BOMBON LECHE DI 288 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580119157",},
-  "BON O BON BOMBON REGULAR 15 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "77958921",},
-  "BON O BON BOMBONES BOTA NAVIDAD 150GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580146924",},
-  "BON O BON CHOCOLINASBOMBONES CAJA 270 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580117771",},
-  "BON O BON NEGRO BOMBONES CAJA X 30 450 G": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580119133",},
-  "BON O BON REGULAR ED. ESP. BOLSA 15 GR C/U 7 U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580119164",},
-  "BON O BON SUPERBOLLS CHOC BCO POUCH 80 GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580135775",},
-  "BON O BON SURTIDO REGULAR BOMBONES CAJA 255 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580119126",},
-  "ROSPO SAPITO BOCADITO REL.D.D.L. 10 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROSPO", "ean": "77928870",},
-  "ROSPO SAPITO BOCADITO RELL.MANI 10 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROSPO", "ean": "77912718",},
-  "ARCOR SELECCION BOMB SURTIDO 228.6GR CAJA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "SELECCION", "ean": "7790580131388",},
-  "ARCOR MANI COLOR CONF.C/CH. 80 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580106195",},
-  "ARCOR MANI CON CHOC. BLANCO 80GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580139223",},
-  "ARCOR MANI CON CHOCOLATE 80 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580106027",},
-  "ARCOR MANI CON CHOCOLATE BOLSA 100 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580136444",},
-  "ARCOR MANI.CROCANTE BAN.C/CHC 100GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580141738",},
-  "BON O BON CITOS CONFITADOSPOTE 200 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BON O BON", "ean": "7790580111243",},
-  "COFLER BLOCK BOMBON MANI CON CHOCOLATE 16GR X16U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "COFLER", "ean": "7790580130565",},
-  "COFLER BLOCK MANI C/CHOCOLATE 100GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "COFLER", "ean": "7790580139797",},
-  "COFLER BLOCK MANI CON CHOCOLATE 40 GRCAJA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "COFLER", "ean": "7790580110284",},
-  "ROCKLETS GRAGEAS C/CHOCOLATE 20 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580421007",},
-  "ROCKLETS GRAGEAS C/CHOCOLATE 40 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580327408",},
-  "ROCKLETS GRAGEAS CHOCOLATE BOLSA 40 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580327415",},
-  "ROCKLETS LENTEJAS COLOR BOLSA 150 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580107635",},
-  "ROCKLETS MANI C/CHOCO. CONFITADO 20 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580423414",},
-  "ROCKLETS MINI GRAGEAS DE CHOCOLATE PAQUETE 120 GRS": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580418106",},
-  "ROCKLETS NAVIDAD GRAGEAS C/CHOCO. 120 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580415808",},
-  "ROCKLETS NAVIDAD MANI CON CHOCOLATE 120 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580423001",},
-  "ARCOR MILK C/SORP HUEVO PAQUETE 22 GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "ARCOR", "ean": "7790580133573",},
-  "BON O BON HUEVO DE CHOCOLATE C/LECHE 110 GRPAS/NAV.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "BON O BON", "ean": "7790580587802",},
-  "TOFI HUEVO DE CHOCOLATE 115 GRPAS/NAV.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "TOFI", "ean": "7790580299903",},
-  "AGUILA EXTRA FINO CHC P/REPOST. 150GR TAB 1U PAQUETE": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "AGUILA", "ean": "7790580109882",},
-  "ARCOR 50 CACAO TABLETA SOLIDA 25 GR PAQ.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580120092",},
-  "ARCOR BLANCO TAB.SOLIDA 25 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580607418",},
-  "ARCOR C/LECHE TAB.SOLIDA 25 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580607210",},
-  "ARCOR CHOCO. MEDIO AMARGO PAQ. 80GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580104375",},
-  "ARCOR CHOCOLATE LECHE Y MANI 25 GRS PAQUETE": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580124960",},
-  "ARCOR DUO SOLIDAS 95GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580133795",},
-  "ARCOR MILK RELLE. 12GR PAQUETE 1U 35% LECHE": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "77977991",},
-  "ARCOR MILK RELLENA CHC 12GR PAQUETE 4UN 48G": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580135140",},
-  "ARCOR SOLIDAS 95GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580133634",},
-  "ARCOR SOLIDAS C/LECHE Y MANI 95GR 1U PAQ": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580133740",},
-  "ARCOR TAB SOLIDA CHC PAQUETE 80GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580102852",},
-  "ARCOR TAB SOLIDA CHC PAQUETE 80GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580102890",},
-  "ARCOR TAB SOLIDA CHC PAQUETE 80GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580103279",},
-  "ARCOR TABLETA SOLIDAS 50% CACAO 95GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580133771",},
-  "BON O BON TABLETA CHC RELLENA 160GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "BON O BON", "ean": "7790580146047",},
-  "COFFLER AIR BLANCO TAB.AIREA. 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103415",},
-  "COFLER AIR BLANCO TAB.AIREA. 27 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103385",},
-  "COFLER AIR C/ALMENDR.TAB.AIREA. 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103439",},
-  "COFLER AIR CHO.C/LEC.TAB.AIREA. 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580033408",},
-  "COFLER AIR CHOCO. C/ALMENDRAS 100 GRTAB.AIREA.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103477",},
-  "COFLER AIR CHOCOLATE MIXTO 100 GRTAB.AIREA.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103460",},
-  "COFLER AIR LECHE TAB.AIREA. 27 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103361",},
-  "COFLER AIR MIXTO TAB.AIREA. 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103422",},
-  "COFLER AIREADO BON O BON TAB AIREA 30GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580127145",},
-  "COFLER BLOCK 300 C/LECHE Y MANI 300 GRTAB.SOLIDA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103743",},
-  "COFLER BLOCK BCO C/MANI TAB.SOLIDA 38 GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "77981912",},
-  "COFLER BLOCK C/LECHE Y MANI 38 GRTAB.SOLIDA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580531201",},
-  "COFLER BLOCK C/MANI TAB.SOLIDA 170 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580105013",},
-  "COFLER BLOCK C/MANI TAB.SOLIDA 38 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "77953124",},
-  "COFLER BLOCK LECHE C/MANI TAB.SOL. 16GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "77971944",},
-  "COFLER BLOCK TAB.SOLIDA 110 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "77922120",},
-  "COFLER BLOCKAZO CHO.C/LEC.C/MANI 1000 GRTAB.SOLIDA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580115579",},
-  "COFLER C/CHOCOLINAS SOLIDAS 55GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103538",},
-  "COFLER C/LECHE TAB.SOLIDA 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103484",},
-  "COFLER C/LECHE Y ALMENDRAS TAB.SOLIDA 140GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580128234",},
-  "COFLER C/LECHE Y ALMENDRAS TAB.SOLIDA 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580033507",},
-  "COFLER CHOCOLINAS TABL BLANCO 140GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580127336",},
-  "COFLER DUBAI TABL CHC RELLENAS 192GR CAJA 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "634240334733",},
-  "COFLER DUBAI TABLETA RELLENAS 45GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "77960474",},
-  "COFLER DULCE DE LECHE RELLENAS 38GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580132958",},
-  "COFLER RELL AVELLANA TABLETA 35 GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580146016",},
-  "COFLER ROCKLETS TAB.SOLIDA 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103521",},
-  "COFLER TABL.LECHE COFLER 140GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580127947",},
-  "COFLER TABLETA CHC 60%CACAO SOLIDA 100GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580141776",},
-  "COFLER TABLETA CHC 60%CACAO SOLIDA 100GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580143862",},
-  "COFLER TABLETA CHC SOLIDA 100GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580141752",},
-  "COFLER TABLETA CHC SOLIDA C/AVE 140GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580144005",},
-  "COFLER TRES PLACERES CH.AMA.BL.LEC. 55 GRTAB.SOLIDA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580106560",},
-  "COFLER YOGURT FRUTILLA RELL 64GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580123642",},
-  "HAMLET BICOLOR CHO.Y CER.TAB.SOLIDA 42 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HAMLET", "ean": "7794612491013",},
-  "HAMLET BICOLOR TAB.SOLIDA 42 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HAMLET", "ean": "7794612491006",},
-  "HAMLET BLANCO COOKIES SOLIDA 46GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HAMLET", "ean": "7794612066310",},
-  "HAMLET CHOCO.LECHE/GALL TAB. SOL. 45GR 21U PAQ": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HAMLET", "ean": "7794612001472",},
-  "HAMLET SOLIDAS LECH Y COOK 43GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HAMLET", "ean": "7794612065917",},
-  "TOFI BLANCO TAB.RELLE. 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TOFI", "ean": "7790580746711",},
-  "TOFI C/LECHE TAB.RELLE. 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TOFI", "ean": "7790580746612",},
-  "TOP LINE DIET 6.7 GR FRUTA 4 TAB.PAQ.CAJA X20 U": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580144609",},
-  "TOP LINE DIET 6.7 GR MENTA 4 TAB.PAQ.CAJA X20 U": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580145002",},
-  "TOP LINE S/AZUCAR 6.7 GR FRUTA 4 TABL.PAQ.": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77916389",},
-  "TOP LINE S/AZUCAR 6.7 GR MENTA 4 TABL.PAQ.": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77916426",},
-  "TOP LINE S/AZUCAR 6.7 GR STRONG 4 TABL.PAQ.": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77916396",},
-  "TOP LINE S/AZUCAR SEVEN 14 GR BLOW.MAND.7 TABL.PAQ": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77932693",},
-  "TOP LINE S/AZUCAR SEVEN 14 GR SANDIA 7 TABL.PAQ.": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77948588",},
-  "TOP LINE S/AZUCAR SEVEN 14 GR XPLO.MINT 7 TABL.PAQ": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77931764",},
-  "TOP LINE SEVEN TURBO MINT 20 CHI.CONF. ADU. 2.5G C/U PT 50GR": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580138547",},
-  "TOP LINE SEVEN TURBO PINK 20 CHI.CONF. ADU. 2.5G C/U PT 50GR": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580150068",},
-  "TOPLINE SEVEN BUBLE FUN 7CHI. TABL. ADU. PQ. 14GR 1UN": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77983794",},
-  "TOPLINE SEVEN CONFITADO 10P. TURBO MINT ADU. CJ.25GR 1UN": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580146818",},
-  "CLIGHT DIET LIMONADA MARACUYA SOBRE 7.5 P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201733834",},
-  "CLIGHT ED LIM POMELADA HIBISCUS SIN AZUCARES SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622202359934",},
-  "CLIGHT LIMONADA ARANDANOS DIET SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622202236846",},
-  "CLIGHT LIMONADA ROSA S/AZUCARES SOBRE 7.5G P/1 L.": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201682026",},
-  "CLIGHT NAR/DUR S/A VITC+D SOBRE 7.5G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201702717",},
-  "CLIGHT POLVO ANANA SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201702625",},
-  "CLIGHT POLVO DIET MANZANA DELI. SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703080",},
-  "CLIGHT POLVO NARA MANGO DIET SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201702687",},
-  "CLIGHT POLVO PERA SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703202",},
-  "CLIGHT POLVO S/A LIMONADA VITC+D SOBRE 8GR P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201702656",},
-  "CLIGHT POLVO S/A MANDARINA SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201704148",},
-  "CLIGHT POLVO S/A NARANJA VIT CY D SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703110",},
-  "CLIGHT PVO S/A MANZANA VERDE SOBRE 7.5GR P/1LT": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703059",},
-  "CLIGHT PVO S/A NARANJA DULCE VIT C Y D SOBRE 7.5G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703141",},
-  "CLIGHT PVO S/A POMELO AMARILLO VIT C Y D SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703233",},
-  "CLIGHT PVO S/A POMELO ROSADO VIT C Y D SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703172",},
-  "CLIGHT STEVIA POLVO LIMONADA SOB 7.5G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201704582",},
-  "TANG BALANCE POLVO LIMONADA SIN ENDULZAR SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622202012082",},
-  "TANG BALANCE POLVO NARANJADA S/ENDULZAR SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622202012129",},
-  "TANG GALACTICO ED. LIM POLVO FRUTAL REG SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622202311482",},
-  "TANG MIX NAR/MARA/FRUT BAJAS CALORIAS SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201746063",},
-  "TANG POLV POM ROSADO REG SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735746",},
-  "TANG POLVO PERA REG SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201745738",},
-  "TANG POLVO REG ANANA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201745967",},
-  "TANG POLVO REG DURAZNO SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201745936",},
-  "TANG POLVO REG FRUTILLA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201746490",},
-  "TANG POLVO REG LIMONADA DULCE SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735685",},
-  "TANG POLVO REG MANDARINA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201733865",},
-  "TANG POLVO REG MANZANA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201705992",},
-  "TANG POLVO REG MULTIFRUTA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735715",},
-  "TANG POLVO REG NAR/DURAZNO SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201745707",},
-  "TANG POLVO REG NARA/BANANA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735777",},
-  "TANG POLVO REG NARA/MANGO SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735371",},
-  "TANG POLVO REG NARANJA DULCE SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735340",},
-  "TANG POLVO REG NARANJA LIMA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201746018",},
-  "TANG POLVO REG NARANJA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201705961",},
-  "TANG POLVO REG UVA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201746117",},
-  "VERAO POLVO ANANA REG SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "VERAO", "ean": "7622201717506",},
-  "VERAO POLVO MANZANA REG SOB. 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "VERAO", "ean": "7622201717445",},
-  "VERAO POLVO NAR/DURAZNO REG SOB. 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "VERAO", "ean": "7622201717476",},
-  "VERAO POLVO NARANJA REG SOB. 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "VERAO", "ean": "7622201717414",},
-  "MONDELEZ CEREALITAS CACAO D.S. 170GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREALITAS", "ean": "7622202241505",},
-  "MONDELEZ CEREALITAS GRANOLA D.S. 170GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREALITAS", "ean": "7622202241567",},
-  "MDLZ TERRABUSI.DUQUESA GALL DUL. REL 115GR PAQ 3U 345GR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DUQUESA", "ean": "7622202218729",},
-  "MONDELEZ TERRABUSI DUQUESA DUL.RELLE. 115 GRPAQUETE": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DUQUESA", "ean": "7622300742645",},
-  "MONDELEZ TERRABUSI MELBA DUL.RELLE. 120 GRPAQUETE": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELBA", "ean": "7622300829728",},
-  "TERRABUSI MELBA ANGRY BIRDS DU.REL.PAQ.120GR C/UPACK X 3 U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELBA", "ean": "7794600004539",},
-  "MONDELEZ INTL MILKA GALLE. REL CHC C/MOUSSE PAQ. 116GR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MILKA", "ean": "7622210940230",},
-  "MONDELEZ INTL.MILKA GALL. REL C/MOUS 124GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MILKA", "ean": "7622202210051",},
-  "MONDELEZ INTL.MILKA GALL. REL C/MOUS 124GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MILKA", "ean": "7622202210075",},
-  "MONDELEZ OREO CHOCOLATE. DUL.RELLE. PAQ 118GR 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202049033",},
-  "MONDELEZ OREO D.R. 118GR 3U 354G PQ AGR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201735258",},
-  "MONDELEZ OREO D.R. 118GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201735296",},
-  "MONDELEZ OREO DUL.REL. 182.5GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201735821",},
-  "MONDELEZ OREO GALL MANI DUL.REL. PAQUETE 118GR 1UN": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202302862",},
-  "MONDELEZ OREO GALLETAS DR 258GR PAQ AGR 1UN X4": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202317187",},
-  "MONDELEZ OREO GALLETAS FRUT/CACAO DUL RELL 118GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202049057",},
-  "MONDELEZ OREO GOLDEN GAL DUL REL 354GR PAQ AGR X3 118G 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201806538",},
-  "MONDELEZ OREO MINI DUL.RELLE 50GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201761288",},
-  "MONDELEZ OREO MINI. GALLETAS DUL RELL 150 BOL 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202219337",},
-  "MONDELEZ OREO ORIG GALL VAIN DUL.REL. 64.5GR PAQ 1UN": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202318634",},
-  "MONDELEZ OREO SIN GLUTEN GALL DR 95GR PAQUETE 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202038099",},
-  "MONDELEZ OREO VAINILLA GOLDEN 118GR PAQ.DU.RE 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201806552",},
-  "OREO BAADAS. CHOCOLATE BSA 119GR 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201740368",},
-  "OREO BANADAS CHC MILKA BCO BSA 119GR 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201745608",},
-  "MONDELEZ PEPITOS C/CHISPAS DS 119 GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PEPITOS", "ean": "7622201735906",},
-  "MONDELEZ PEPITOS MINI. DULCE SECA 50GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PEPITOS", "ean": "7622201740399",},
-  "MONDELEZ PEPITOS. DU. SEC 119GR 3UN 357G PAQ AGR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PEPITOS", "ean": "7622201735883",},
-  "MODELEZ TERRABUSI ANILLOS D. S. 170GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201808884",},
-  "MONDELEZ LINCOLN CHOCOLATE DUL.SECA 153 GR PAQUETE": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622300742676",},
-  "MONDELEZ LINCOLN CLASICA DUL. SEC 219GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201735319",},
-  "MONDELEZ LINCOLN CLASICAS DUL SEC 153GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201386719",},
-  "MONDELEZ LINCOLN COCO. DUL SEC 153GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622300742713",},
-  "MONDELEZ TERRABUSI ANILLOS CLASIC 300GR BOL.DU.SE.": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201504007",},
-  "MONDELEZ TERRABUSI BOCA DE DAMA D.S. 170GR BOL": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201808860",},
-  "MONDELEZ TERRABUSI C/CHIPS 144GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201385279",},
-  "MONDELEZ TERRABUSI MANON DULC. SECA 182GR PAQ. 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201385255",},
-  "MONDELEZ TERRABUSI MIEL GALLE DUL.SEC 120GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622202220579",},
-  "MONDELEZ TERRABUSI SCONS DUL SEC 160GR BOLSA": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201491611",},
-  "MONDELEZ TERRABUSI VAINILLA GALL DUL.SEC 120GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622202220555",},
-  "MONDELEZ TERRABUSI VARIED.MIX DU.SE. 590GR BOL": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201745585",},
-  "MONDELEZ.TERRABUSI VARIED.MIX DU.SE. 390GR BOL": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201745561",},
-  "TERRABUSI HABANITOS GALLETITA BAN.C/CHO. 60GRBOLSA": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622300335076",},
-  "TERRABUSI LINCOLN CLASICA. D.S. 3U 153GR PQ AGR 459G": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201745547",},
-  "TERRABUSI VARIEDAD CHC DUL.SEC 300GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201503987",},
-  "TERRABUSI VARIEDAD D. S. 170GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201745639",},
-  "TERRABUSI VARIEDAD DORADA DUL.SEC 300GR BOL 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201503963",},
-  "MONDELEZ CEREALITA CLASICA INT 212GR PAQ 3U 636G": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201745905",},
-  "MONDELEZ CEREALITA CLASICAS INTEG 212GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201736033",},
-  "MONDELEZ CEREALITAS SALV CER 208GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201745981",},
-  "MONDELEZ CEREALITAS SALVA. CER 208GR 3U 624GR PAQ AGR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201746032",},
-  "MONDELEZ CEREALITASTOST.DE ARROZ 160 GRPAQ.CEREAL": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201753061",},
-  "MONDELEZ CLUB SOCIAL ORIG. CR PQ. 24GR 6UN 1X 144G PQ AGR,": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CLUB SOCIAL", "ean": "7622202293733",},
-  "MONDELEZ CLUB.SOCIAL ORIGINAL 144 GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CLUB SOCIAL", "ean": "7622202293740",},
-  "MONDELEZ CLUB.SOCIAL ORIGINAL 144 GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CLUB SOCIAL", "ean": "7622300990749",},
-  "MONDELEZ INTL CLUB SOCIAL JAMON 23.5 GR X6U PQ AGR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CLUB SOCIAL", "ean": "7622210691835",},
-  "MILKA ALFAJOR TRIPLE 70 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "77903778",},
-  "MILKA MINI ALFAJORES MOUSSE SPL 19GR 6U BOLSA 114G": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622202220074",},
-  "MILKA MOUSSE LECHE 42 GRPAQ.X 6 U.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622300759490",},
-  "MILKA MOUSSE LECHE ALFAJOR 42 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622300759506",},
-  "MILKA MOUSSE TRIPLE ALFAJOR 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "77903785",},
-  "MILKA MOUSSE TRIPLE BLANCO ALF. 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622300457303",},
-  "MILKA TORTA OREO ALF.TRIPLE 61 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622300835620",},
-  "OREO ALFAJOR TRIPLE. 56GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "OREO", "ean": "77976307",},
-  "PEPITOS CON CHIPS Y MOUSSE TRIPLE PAQUETE 57 GR UN.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "PEPITOS", "ean": "77915481",},
-  "SHOT ALFAJOR MANI BAN CHC SIMPLE 44GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "SHOT", "ean": "7622202304705",},
-  "SHOT ALFAJOR MINI SIMPLE 19GR BOLSA 6UN 114G": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "SHOT", "ean": "7622202223372",},
-  "SHOT ALFAJOR TRIPLE 60 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "SHOT", "ean": "77956699",},
-  "TERRABUSI ALFAJOR 50 GRPAQ. X6 U.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "7622300742584",},
-  "TERRABUSI ALFAJOR CHOCOLATE 50 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "77939234",},
-  "TERRABUSI ALFAJOR S/GLUT SPL BAN CHC 55GR PAQ 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "7622202296291",},
-  "TERRABUSI X 3 DCE.DE LE.ALFAJOR 70 GRTRIPLE": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "77903792",},
-  "TERRABUSI X 3 TORTA ALFAJOR 70 GRTRIPLE": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "77903860",},
-  "TITA NEGRO ALFAJOR RELL.LIMON 36 GRARG": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TITA", "ean": "77908308",},
-  "MILKA BIS OBLEA RELL.CUB.CHOCO. 105.6GR X 16U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "MILKA", "ean": "7622210788207",},
-  "MILKA BIS OREO PAQ. 105.6 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "MILKA", "ean": "7622210719829",},
-  "MILKA CHOCO PAUSE.OREO OBLEA BAN.CHC 45GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "MILKA", "ean": "7622201492465",},
-  "MILKA CHOCO PAUSE OBLEA BAN.CHO.C/LEC.RELL.45 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "MILKA CHOCO PAUSE", "ean": "7622201492717",},
-  "RHODESIA MINI OBLEAS 60 GRBOLSA": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "RHODESIA", "ean": "7622300335090",},
-  "RHODESIA OBLEA 22 GRCAJA X 36": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "RHODESIA", "ean": "7622300423759",},
-  "RHODESIA OBLEA BAN.C/CHO. 22 GRBOLSA": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "RHODESIA", "ean": "77995681",},
-  "RHODESIA OBLEA BANADA 22 GRPAQ.X4 U.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "RHODESIA", "ean": "7622300742935",},
-  "RHODESIA OBLEA RELL. LIMON BAÑ. 22 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "RHODESIA", "ean": "7622201142223",},
-  "TITA GALLE.BAN. 18 GRPAQ. X 5 U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "TITA", "ean": "7622201803285",},
-  "TITA O BANADOS 19GR PAQ 1U REGULAR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "TITA", "ean": "77976291",},
-  "MILKA OREO BOMBON 19G BOLSA 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "MILKA", "ean": "77971630",},
-  "MILKA OREO BOMBON CHC 19GR 13U CAJA 1UN 247G": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "MILKA", "ean": "7622202399107",},
-  "CADBURY C/YOGHURT. NUEZ TAB. RELL.29GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818654",},
-  "CADBURY CHOCOLATE CON ALMENDRAS X82GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201807405",},
-  "CADBURY INTENSE 50% CACAO 25GR TAB.SOLIDA 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818609",},
-  "CADBURY INTENSE SOLIDAS 50% CACAO PAQ 162GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201800505",},
-  "CADBURY TRES SUENOS.TAB. SOLIDA 82GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818739",},
-  "CADBURY TRES.SUENOS. 25GR TAB.SOLIDA 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818579",},
-  "CADBURY YOGHURT FRUTILLA RELL 82 GRS PAQUETE 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818715",},
-  "CADBURY YOGURTH TABL RELL FRUTILLA PAQ 162GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818692",},
-  "MILKA . TAB CHC SOLIDA 20GRS PAQUETE 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210795625",},
-  "MILKA ALMENDRA TABLETA RELLENA 55 GR PAQ.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210745620",},
-  "MILKA ALMENDRAS TAB.SOLIDA 155 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300990152",},
-  "MILKA BLANCO C/D.D.LEC.TAB.RELLE. 67.5 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300844967",},
-  "MILKA C/LECHE TAB.SOLIDA 150 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300990114",},
-  "MILKA CASTANA TAB. SOLIDA 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210745293",},
-  "MILKA CASTANAS C/CARAMELOTAB.SOLIDA 155 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300990183",},
-  "MILKA CHOCO.C/LECHE TAB.SOLIDA 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210745224",},
-  "MILKA CHOCOLATE C/DULCE DE LECHE 67.5 GRTAB.RELLE.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300844943",},
-  "MILKA LEGER COMBINADO TAB AIREA. LECHE 110GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201812775",},
-  "MILKA LEGER COMBINADO TAB.AIREA. LECHE 50GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201818951",},
-  "MILKA LEGER LECHE CON ALMENDRAS TAB AIREA. LECHE 110GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201812805",},
-  "MILKA LEGER LECHE TAB AIREA. LECHE 110GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201812744",},
-  "MILKA LEGER TAB.AIREA. LECHE 50GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201818937",},
-  "MILKA LEGER TAB.AIREA. LECHE CON ALMENDRAS 50GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201818975",},
-  "MILKA NEGRO C/D.D.LEC.TAB.RELLE. 135 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300846565",},
-  "MILKA OREO C/GALLET. TAB.SOLIDA 100 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300631574",},
-  "MILKA OREO CH.BLANCO TAB.SOLIDA 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210745132",},
-  "MILKA OREO CHOCOLATE BLANCO 155 GRTAB.SOLIDA": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300990213",},
-  "MILKA OREO TAB. SOLIDA 20GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210795908",},
-  "MILKA OREO TABLETA RELLENA 300GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210277503",},
-  "MILKA TAB CHC AIREADA C.LECHE 25GR 1UN PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202322150",},
-  "MILKA TAB CHC AIREADA COMBINADO 25GR 1UN PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202322181",},
-  "MILKA TABLETA CHC AVELLANAS TAB. SOL 95GR 1UN PAQUETE": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202257599",},
-  "MILKA TABLETA CHC RELLENA 29GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202322068",},
-  "MILKA TABLETA CHC RELLENA 29GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202322129",},
-  "MILKA TABLETA DE CHOCOLATE BLANCO 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210745583",},
-  "SHOT BLOQUE TAB.SOLIDA 35 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SHOT", "ean": "77914217",},
-  "SHOT C/LECHE Y MANI TAB.SOLIDA 170 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SHOT", "ean": "7622300424084",},
-  "SHOT C/MANI TAB.SOLIDA 90 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SHOT", "ean": "7791249451656",},
-  "SHOT CHOCOLAE C/MANI TAB.SOLIDA 35 GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SHOT", "ean": "77983992",},
-  "BELDENT CHI. TABLETA ADU. S/AZ. 6 CHI. PQ. 10GR 1UN": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969101",},
-  "BELDENT FRESH SPARKS SANDIA 6CHI.TABL. ADU. PQ. 10GR 1UN": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77987686",},
-  "BELDENT FRUTILLA S/AZ. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969118",},
-  "BELDENT INFINIT 7 BLUEBERRY CHIC. TABL. CJ. 13.3GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201448325",},
-  "BELDENT INFINIT 7 MENTA CHIC.TABL. CJ. 13.3GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201421489",},
-  "BELDENT INFINIT CITRUS 7 CHIC. TABL. CJ. 13.3GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201448288",},
-  "BELDENT INFINIT CITRUS CHI. 14 TABL. DIET CJ. 26.6GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201457426",},
-  "BELDENT INFINIT MENTA 7U PQ. 13.3GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201421496",},
-  "BELDENT INFINIT MENTA DIET 14 TABL. CJ. 26.6GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201457334",},
-  "BELDENT INFINIT SPEARMINT 14 TABL. CJ. 26.6 GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201457396",},
-  "BELDENT INFINIT SPEARMINT 7 TABL. CJ. 13.3 GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201448226",},
-  "BELDENT INFINITE 14 CHI. TABL. BLUEBERRY MINT DIET CJ.26.6GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201457457",},
-  "BELDENT MANDARINA FRESH SPARKS ADU. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77981844",},
-  "BELDENT MENTA FUERTE S/AZ. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969088",},
-  "BELDENT MENTA S/AZ. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969071",},
-  "BELDENT MENTOL S/AZ. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969095",},
-  "BELDENT TROP. FRESH SPARKS 6 TABL. ADU. PQ. 10GR 1UN": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622202273131",},
-  "BUBBALOO FRUTILLA CHIC. GLOBO INF. ENVOL. 5GR 1UN": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "INFANTILES", "marca": "BUBBALOO", "ean": "77982360",},
-  "BUBBALOO MENTA CHIC. GLOBO INF. ENVOL. 5GR 1UN": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "INFANTILES", "marca": "BUBBALOO", "ean": "77982346",},
-  "BUBBALOO TUTTI-FRUTTI CHIC. GLOBO INF. ENVOL. 5GR 1UN": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "INFANTILES", "marca": "BUBBALOO", "ean": "77982353",},
-  "BUBBALOO UVA CHIC. GLOBO INF. ENVOL. 5GR 1UN": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "INFANTILES", "marca": "BUBBALOO", "ean": "77982377",},
-  "M PROPIAS": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "M PROPIAS", "ean": "1",},
-  "RINDE DOS 1+1 POLVO MANZANA DIET SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908404763",},
-  "RINDE DOS ANANA BAJAS CAL SOBRE 13G P/2LT": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908401588",},
-  "RINDE DOS LIMON DIET SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908401540",},
-  "RINDE DOS MIX FRUTAL POLVO BAJAS CAL. SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908400536",},
-  "RINDE DOS NAR/MANGO POLVO BAJAS CAL SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908404152",},
-  "RINDE DOS PERA POLVO BAJAS CAL. SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908401847",},
-  "RINDE DOS POLVO 1+1 NARANJA DIET SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908404756",},
-  "RINDE DOS POLVO DIET NARANJA SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908400529",},
-  "RINDE DOS POLVO DURAZNO BAJAS CAL. SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908400543",},
-  "RINDE DOS POLVO FRUTILLA DIET SOBRE 13G P/2LT": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908401526",},
-  "RINDE DOS POLVO LIMON 1+1 DIET SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908404770",},
-  "RINDE DOS POLVO MANZANA DIET SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908400567",},
-  "RINDE DOS POLVO NAR/BANA BAJAS CAL. SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908400987",},
-  "RINDE DOS POLVO NARANJA DURAZNO BAJAS CAL. SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908404169",},
-  "RINDE DOS POLVO POMELO ROSADO DIET SOBRE 13G P/2LT": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908402578",},
-  "RINDE DOS PVO 1L+1L ANANA DIET SOBRE 13G P/2LT 1U": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908404862",},
-  "RINDE DOS PVO 1L+1L DURAZNO DIET SOBRE 13G P/2LT 1U": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908404909",},
-  "RINDE DOS PVO 1L+1L NARANJA MANGO DIET SOBRE 13G P/2LT 1U": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908404947",},
-  "RINDE DOS PVO NARANJA BANANA 1L+1L DIET SOBRE 13G P/2LT 1U": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908404930",},
-  "9 DE ORO ANILLITOS DULCE.SEC.COCO BOL180G 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180143488",},
-  "9 DE ORO ANILLITOS DULCE.SECA VAIN BOL180G 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180143464",},
-  "9 DE ORO OBLEAS CHOCO/NARA DUL.RELL. PAQUETE 100 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180133274",},
-  "M CANUELAS 9 DE ORO C/CH DE CH DUL.SECA BOL. 180GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180132901",},
-  "M CANUELAS 9 DE ORO COOKIES C/CHIPS 180 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180009517",},
-  "M CANUELAS 9 DE ORO COOKIES DUL. SECA BOLSA 180 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180132895",},
-  "M. CANUELA 9 DE ORO PEPAS 500GR BOL DU.SE.1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180143273",},
-  "M.CANUELAS 9 DE ORO OBLEAS FRUTILLA DUL. RELL. PAQ. 100GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180132994",},
-  "M.CANUELAS 9 DE ORO OBLEAS RELLENAS PAQUETE 100 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180132932",},
-  "M.CANUELAS 9 DE ORO PEPAS DU.SE. 350GR BOL.1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180143280",},
-  "M.CANUELAS 9 DE ORO PEPAS MEMBRILLO DUL.SECA BOLSA 200GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180133502",},
-  "M.CANUELAS 9 DE ORO SCONS LIMON DULCE SECA 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180009524",},
-  "M.CANUELAS BRIGITTE 9 DE ORO CHOC/LIM DU.RELL.BOL 160 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180132703",},
-  "M.CANUELAS BRIGITTE 9 DE ORO DUL. RELL.CHOC. BOL. 160 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180132697",},
-  "M.CANUELAS BRIGITTE 9 DE ORO DUL. RELL.CHOC. BOL. 160 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180132710",},
-  "M.CANUELAS BRIGITTE 9 DE ORO DUL. RELL.LIMON BOL. 160 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180132680",},
-  "M.CANUELAS9 DE ORO BIZ CARA SUCIA DULC SECA 200GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180143587",},
-  "M.CANUELAS9 DE ORO BIZC.AZUC.DULCE SECA 210 GRSPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792200000319",},
-  "M.CANUELAS9 DE ORO CUAD.AGRI.DULCE SECA 200 GRBOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792200000128",},
-  "BAUDUCCO FRESA OBLEA 140 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962032283",},
-  "BAUDUCCO GALL. DUL SEC COOK C/CHIPS 60GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962071152",},
-  "BAUDUCCO GALL. DUL SEC COOK C/CHIPS 60GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962071169",},
-  "BAUDUCCO VAINILLA OBLEA 140 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962032306",},
-  "BAUDUCCO WAFER CHOCOLATE OBLEA 140 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962032290",},
-  "BAUDUCCO WAFER OBLEAS CHOCOLATE 78 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962058399",},
-  "BAUDUCCO WAFER OBLEAS FRUTILLA 78 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962058405",},
-  "BIMBO DULCE SECA VAINILLAS148 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BIMBO", "ean": "7793890258639",},
-  "BIMBO VAINILLAS GALL. DUL.SECA 444GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BIMBO", "ean": "7793890258646",},
-  "BONAFIDE DONUTS BAN.C/CHO 78GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BONAFIDE", "ean": "7792360096818",},
-  "BONAFIDE DONUTS BAN.C/CHO 78GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BONAFIDE", "ean": "7792360096825",},
-  "BONAFIDE DONUTS.BAN.C/CHO 40GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BONAFIDE", "ean": "7792360097006",},
-  "BRIOSH VAINILLAS DULCE SECA 148GR. PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BRIOSH", "ean": "7793890258592",},
-  "CHOCMAN BIZCOCHUELO BAN CHC 68GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCMAN", "ean": "7792360096658",},
-  "CHOCMAN BLACK BIZCOCHUELO BAN CHC 35GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCMAN", "ean": "7792360096597",},
-  "CHOCMAN MINITORTA BLACK BAN CHC 68GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCMAN", "ean": "7792360096580",},
-  "CHOCMAN MINITORTA RELLENA C/D.D.LECHE 35 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCMAN", "ean": "7792360096634",},
-  "DALE BLACK DUL.RELLE.115 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DALE", "ean": "7798113152206",},
-  "DALE MARIA VAINILLA DULCE SECA 145 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DALE", "ean": "7798113151599",},
-  "DILEXIS DALE MARIA DUL.SEC 132G.C/U X3U.PAQ.ARG 396": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DALE", "ean": "7798113152268",},
-  "PEPSICO DALE CHOCOLATE DUL.RELLE. 81 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DALE", "ean": "7798113159892",},
-  "PEPSICO DALE FRUTILLA DUL.RELLE. 81 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DALE", "ean": "7798113151261",},
-  "PEPSICO DALE VAINILLA DUL.RELLE. 81 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DALE", "ean": "7798113151278",},
-  "SCHAR MARIA DULCE SECA 125 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DR. SCHAR", "ean": "8008698010402",},
-  "SCHAR P/CELIACOS DUL.RELLE.100 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DR. SCHAR", "ean": "8008698008157",},
-  "SCHAR WAFERS ALLA VANIGLIA OBLEAS RELL.CREMA VAIN 125GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DR. SCHAR", "ean": "8008698001905",},
-  "CACHAFAZ INTEGRAL AVE.PASA DE UVA D.S. 225 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128000677",},
-  "CACHAFAZ INTEGRAL AVEN.C/CHIP.CHOC.D.S. 225 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128000691",},
-  "CACHAFAZ INTEGRAL GRAN.C/AVENA/ALM/MANI 225 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128000707",},
-  "CACHAFAZ INTEGRAL HAR.INT.ALGARRO.D.S. 225 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128000684",},
-  "CACHAFAZ ORGANICAS AVENA&MIEL DUL.SECA PAQ.170GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128002138",},
-  "EL TRIGAL BRIDGE CHOCOLATE OBLEA 140 GR PAQUE.URU": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL TRIGAL", "ean": "7730116460131",},
-  "GRANIX FRUTIGRAN AVE/SOJA C/CHIPS CHOC.D.SECA 255 PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045824893",},
-  "GRANIX FRUTIGRAN C/SEM.SES-AM.Y GIRASD.SECA 260 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045825401",},
-  "GRANIX FRUTIGRAN C/SEMI.DE CHIA/LINO DU.SECA 240 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045825395",},
-  "GRANIX FRUTIGRAN SALV.AVENAPAS.DE UVA 250 GRS.DU.SE.PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045001188",},
-  "GRANIX FRUTIGRAN SALVADO DULCE SECA 250 GRS.PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045001195",},
-  "HAVANNA LIMON DUL.RELL. 150GR CAJA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "HAVANNA", "ean": "7791875101468",},
-  "HAVANNA LIMON GALLETITA CUB.C/CHOC. 35GR X6U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "HAVANNA", "ean": "7791875101475",},
-  "M PROPIAS": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "M PROPIAS", "ean": "1",},
-  "LIA MACUCAS BLACK GALL DUL RELL 110GR PAQ SPL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MACUCAS", "ean": "7790040150461",},
-  "LIA MACUCAS CHOCOLATE DUL.RELLE.85 GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MACUCAS", "ean": "7790040146877",},
-  "LIA MACUCAS GALL DUL RELL 110GR PAQ SPL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MACUCAS", "ean": "7790040145337",},
-  "DON SATUR BIZCOCHO DULCE DULCE SECA 200 GRBOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O DSATUR", "ean": "7795735000335",},
-  "DON SATUR NEGRITOS DULCE SECA 200 GRBOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O DSATUR", "ean": "7795735000342",},
-  "HOJALMAR L.LARGUITA DULCE SECA 150 GRS.BANDEJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000159",},
-  "HOJALMAR L.LARGUITA DULCE SECA250 GRS. BANDEJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000142",},
-  "HOJALMAR LARGUITA DULCE SECA 150GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000937",},
-  "HOJALMAR LARGUITA DULCE SECA 150GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000944",},
-  "HOJALMAR MATERO BIZCO. HOJAL.AZUCBOLSA 180 GR ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000593",},
-  "HOJALMAR PALMERAS DULCE SECA150 GR BANDE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000364",},
-  "HOJALMAR PALMERAS DULCE SECA150 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000913",},
-  "HOJALMAR TRIANGULI. DULCE SECA 150 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000920",},
-  "HOJALMAR TRIANGULI. DULCE SECA 150 GRS.BANDEJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000128",},
-  "HOJALMAR TRIANGULIT DULCE SECA250 GRS. PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000111",},
-  "AGLU P/CELIACO SAB.CHOCO.DUL.SECA 150 GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798128410032",},
-  "AGLU P/CELIACO SAB.LIMON DUL.SECA 150 GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798128410070",},
-  "ALFA PAMPA GALL.RELL.LIMON C/BANO 19GR 1UN PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798171732914",},
-  "ANGIOLA GALL S/GLUT CHC DUL SEC 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798294150336",},
-  "ANGIOLA GALL S/GLUT DS 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798294150312",},
-  "ANGIOLA GALL S/GLUT NARANJA DUL SEC 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798294150343",},
-  "ANGIOLA GALLETITA LIMON BANADA 130 GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798294150114",},
-  "ANGIOLA GALLETITA NARANJA BANADA 130 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798294150220",},
-  "ANGIOLA S/GLUTEN DUL SEC 130GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798294150176",},
-  "ANGIOLA S/GLUTEN LIMON DUL SEC 130GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798294150169",},
-  "ANGIOLA S/GLUTEN LIMON DUL SEC 130GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798294150442",},
-  "ANGIOLA S/GLUTEN LIMON S.AZU. DUL SEC 120GR BOL1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798294150329",},
-  "ANGIOLA S/GLUTEN NARANJA DUL SEC 130GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798294150466",},
-  "ANGIOLA S/GLUTEN SAB CHOCOLATE DUL SEC 130GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798294150459",},
-  "ANGIOLA S/GLUTEN VAIN DUL SEC 130GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798294150435",},
-  "ARBANIT GALLETA OB/WF 26GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "736372567604",},
-  "ARBANIT GALLETA OB/WF 26GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "754697494443",},
-  "ARBANIT GALLETA OB/WF 26GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "763331452145",},
-  "ARBANIT OBLEA RELLENA AVELLANA PAQUETE 28 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "754697494481",},
-  "ARBANIT OBLEA RELLENA CACAO 28GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "763331452152",},
-  "ARBANIT OBLEA RELLENA DULCE DE LECHE 28GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "754697494498",},
-  "ARBANIT OBLEA RELLENA FRUTILLA 28GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "763331452213",},
-  "ARBANIT OBLEA RELLENA MARACUYA 28GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "763331452206",},
-  "ARBANIT OBLEA RELLENA MARROC 28GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "763331452169",},
-  "BAKERY CRISTAL GALL TRIANG D. S. HOJALDRE PAQ 150GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793450001217",},
-  "BAKERY CRISTAL GALL TRIANG D. S. HOJALDRE PAQ 150GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793450001231",},
-  "BAY BISCUIT BIZCO.SAB.ORIG.D.SEC. 100GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798004241255",},
-  "BAY BISCUIT BIZCO.SAB.ORIG.D.SEC. 140 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798004241248",},
-  "BAY BISCUIT BIZCOCHO DULCE DUL. SEC. 172GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798004241231",},
-  "BEEPURE GALLETAS C/AV DUL SEC 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798165594382",},
-  "BEEPURE GALLETAS C/AV DUL SEC 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798165594399",},
-  "BISCOTTIFICIO VERONA MARINI GALL D.S. 150GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8015997002373",},
-  "BISCOTTIFICIO VERONA MARINI GALL D.S. 150GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8015997002380",},
-  "BISCOTTIFICIO VERONA MARINI GALL D.S. 150GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8015997003059",},
-  "BISCOTTIFICIO VERONA.MARINI C/CHISP D.S. 200GR BOL 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8015997002359",},
-  "BISCOTTIFICIO VERONA.MARINI COOKIE D.S. 200GR BOL 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8015997000027",},
-  "BISCOTTIFICIO VERONA.MARINI D.S. 200GR BOL 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8015997000133",},
-  "BRIA GALLET AVENA DULCE SEC C/CHISP CHC 100GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "701575359165",},
-  "BRIA GALLET AVENA DULCE SEC C/CHISP CHC 100GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "701575359189",},
-  "BRIA GALLET DE QUINOA BANADA CHC 100GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "764451098909",},
-  "BRIA GALLET FTOS SEC/ALM/COCO DULCE SEC C/CHC 100GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "764451098923",},
-  "BRIA GALLET QUINOA DULCE SEC C/CHC 100GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "724373596235",},
-  "CELOSA GALLETITASVAINILLA BAN.C/CHO. 110 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798036830168",},
-  "DELICIAS DE LA NONA MANTENONNA DUL.SECA 150 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798048730548",},
-  "DELICIAS DE LA NONNA ANILLO GLAC D.S. 150GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798048730739",},
-  "DELICIAS DE LA NONNA ANILLO GLAC DUL.SEC. 300 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798048730746",},
-  "DELICIAS DE LA NONNA GALL PEPAS DS 200GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798048730999",},
-  "DELICIAS DE LA NONNA MANTENONNA DU.SE. 300 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798048730555",},
-  "DELICIAS DE LA NONNA PEPAS BATATA PAQ.180GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798048730906",},
-  "DELICIAS DE LA NONNA PEPAS PAQ.180GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798048730883",},
-  "DELICIAS DE LA NONNA STREAMER GALL DR 160GR BL 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798048731002",},
-  "DELICIAS DE LA.NONNA STREAMER DR MIN 160GR BL 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798048730982",},
-  "DELICIAS DE LA.NONNA.PEPAS PAQ 160GR 1U BOL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798048730579",},
-  "DEUBEL COQUITOS DUL.SECA 180 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791696008441",},
-  "DEUBEL SCONS C/FRUTAS DULCE SECA 180 GRBANDEJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791696008687",},
-  "DEUBEL SCONS CLASICOS DULCE SECA 180 GRBANDEJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791696008694",},
-  "DON RAUL PALMERITAS DULCE SECA 200 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7796675000256",},
-  "DON RAUL PALMERITAS DULCE SECA 200 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7796675000270",},
-  "DORYS BISCOTTI C VAINILLA DUL SEC 100GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7792184003382",},
-  "EDRA DELIC.DE LA NONA PEPAS DUL.SECA 320G.BOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798048730364",},
-  "EDRA DELICAS DE LA NONA PEPAS DUL.SECA BOLSA 300 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798048730913",},
-  "EDRA DELICIAS DE LA NONA BANA.CHOC. 350 GRBOL.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798048730630",},
-  "EDRA DELICIAS DE LA NONA DULC.RELLE.SABOR CHOCO. 160GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798048730715",},
-  "EDRA DELICIAS DE LA NONA DULC.RELLE.SABOR FRUTI.160 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798048730722",},
-  "EDRA DELICIAS DE LA NONA DULC.RELLE.SABOR VAINI.160 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798048730708",},
-  "EDRA DELICIAS DE LA NONA PEPAS MEMBRILLO 320 GRBOL.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798048730586",},
-  "EDRA DELICIAS DE LA NONA SURT.GLAS. DUL.RELL. 400 GR. PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798048730753",},
-  "EDRA SURTIDAS DUL.SECA 300 GRS. BOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798048730395",},
-  "FRANKS C/CHIPS CHOC DULCE SECA PAQ. 120GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798340790189",},
-  "FRANKS DULCE SECA CHOCOLATE PAQ. 120GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798340790165",},
-  "FRANKS DULCE SECA LIMON PAQUETE 120GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798340790172",},
-  "GAONA BIZCOCHITO DULCE SECA 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126073062",},
-  "GAONA CRUNCHIPS COLOR DUL SEC 132GR 1U PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126074212",},
-  "GAONA CRUNCHIPS GALL.MINI D. S. C/CHIP PAQ 72GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126074199",},
-  "GAONA CRUNCHIPS. DUL SEC 132GR 1U PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126074182",},
-  "GAONA CUBI CUB OBLEAS VAINILLA 100 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126071464",},
-  "GAONA SABORES DE LA VIDA GALL D.S. PAQUETE 160GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126074458",},
-  "GAONA SABORES DE.LA VIDA GALL D.S.C/CHI PAQ 160GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126074472",},
-  "GAONA SINFONIA OBLEAS 2 CHOCOLATES 100 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126072256",},
-  "GAONA SINFONIA OBLEAS 50 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126072331",},
-  "GAONA SINFONIA OBLEAS CALSSSIC 50GR X4IU PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126072805",},
-  "GAONA SINFONIA OBLEAS FRUTI.C/CREMA 100 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126072232",},
-  "GAONA SINFONIA OBLEAS FRUTILLA 50 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126072355",},
-  "GAONA SINFONIA OBLEAS NARANJA/CHOCO. 100 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126072591",},
-  "GAONA STAR CHOCOLATE OBLEAS 100 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126071273",},
-  "GAONA STAR SAB. CLASICO NARANJA OBLEAS 100 GR FLOW PACK": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126070931",},
-  "GOLD MUNDO ANILLOS VAIN/CHOCO.DULCE SECA 250 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791376002004",},
-  "GOLD MUNDOANILLOS LIMON DULCE SECA 250 GRBOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791376000994",},
-  "GOLD MUNDOANILLOS VAINILLA DULCE SECA 250 GRBOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791376000970",},
-  "GRUN PEPAS ORGANICAS FRAMBUESA PAQ. 150GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798015440081",},
-  "GULLON BARQUILLOS CHOCOLATE DUL.SECA 70 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8410376037685",},
-  "GULLON BARQUILLOS VAINILLA DULCE SECA 70 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8410376017687",},
-  "GULLON DIBUS SHARKIES CACAO S/GLUTEN 250 GRCAJA DU.SE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8410376044959",},
-  "GULLON DIET NATU.S/AZUC.DU.SECA CHISPAS CHOC.125 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8410376009415",},
-  "GULLON S/GLUTEN CACAO/CHI DUL.SECA 200 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "8410376017342",},
-  "H.J. BISCUITS DULCE SECA130 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7792184003146",},
-  "HAPPY FOOD GALL. NRJA DUL SEC 44GR 3U PAQ 132G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798308250298",},
-  "HAPPY FOOD GALLET. C/PERA DUL SEC 120GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798308250335",},
-  "HAPPY FOOD GALLET. COCO DUL SEC 44GR 3U PAQ 132G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798308250281",},
-  "HAPPY FOOD GALLET. DULC SEC LIMON 120GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798308250427",},
-  "INTEGRA GALLETA DS C/CHISP 200GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798343751507",},
-  "INTEGRA GALLETA DS C/CHISP 200GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798343751514",},
-  "INTEGRA GALLETA DS C/CHISP 200GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798343751521",},
-  "KAPAC C/CHIPS DE CHOCOL. S/TACCS/GLUT.DUL.SECA 200 GRCAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794906020011",},
-  "KAPAC CHOQUITAS DULCE SECA 300 GRS.PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794906000150",},
-  "KAPAC PEPAS DUL.SECA 200 GRS. BOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794906020080",},
-  "KAPAC SCONS DULCE SECA 500 GRBOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794906020004",},
-  "LA AMISTAD CUBANITOS P/RELLENAR DUL.SEC. 150 GR. PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793013000015",},
-  "MAFALDA LARGUITAS HOLADRE DUL.SECA. PAQ.150GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798172410095",},
-  "MAFALDA TRIANGULO HOJALDRE DUL.SECA. PAQ.150 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798172410118",},
-  "MELTAIM C/CHIPS VAINI.DUL.SECA 150GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "754697550170",},
-  "MELTAIM GALETAS C/CHIPS DUL.SECA 150GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "754697550200",},
-  "MELTAIM PEPAS DUL SEC 300GR 1U BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "758890950171",},
-  "MISKY GALL OBLEA RELL TUR/MANI 25GRS 1U PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "77940148",},
-  "MISKY TURRON D/MANI 25GRS 50U PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "17790580401402",},
-  "MONTE- CRISTO OBLITA OBL.DU.RE.FRUTILL. 100GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123160272",},
-  "MONTE CRISTO OBLITAS TURROC TUR OBLEA REL 21GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123010201",},
-  "MONTE NIEVAS CELOSAS CORAZON 100 GRBOL.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798036830311",},
-  "MONTE NIEVAS CELOSAS POLV.VAINIL. DUL.SECA 250GR. BOL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798036830250",},
-  "NAMUR TURRON DE MANI 25GRS 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7790380003809",},
-  "OBLITA FRUTILLA OBLEAS 46 GRS. PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123160029",},
-  "OBLITA OB/WF 50 GRS PAQUETE 1U MONTE CRISTO T/SABORES": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123160012",},
-  "OBLITA VAINILLA OBLEAS 96 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123160265",},
-  "PANEX PEPAS MEMBRILO DULCE SECA 200GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798133500117",},
-  "PANEX PEPASBATATA DULCE SECA 200GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798133500100",},
-  "PAR-NOR SUAVECITAS DULCE SECA140 GR BOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791324156926",},
-  "POZO GALL VAINILLAS DUL. SEC. 80GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7790077000326",},
-  "R.RENDO GOLD MUNDOBIZC.ACAR.DULCE SECA250 GRS. PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791376000307",},
-  "R.RENDO GOLD MUNDOC/CHIPS DULCE SECA200 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791376000864",},
-  "R.RENDO GOLD MUNDOPALMERITASDULCE SECA250 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791376000222",},
-  "RIANITOS HOJALDRE AZUCARADAS DUL.SECA 170 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798157740131",},
-  "RONDA HOJALDRADA DULCE SECA150 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793450000524",},
-  "SANTA MARIA CHOCOLATE DUL.SECA 200 GRS. CAJA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079230017",},
-  "SANTA MARIA COCO DULCE SECA 200 GRCAJA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079230109",},
-  "SANTA MARIA LIMON DULCE SECA 200 GRCAJA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079230116",},
-  "SANTA MARIA MARMOLADAS S/GLUTEN DUL.SECA 200 GR PAQU": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079230628",},
-  "SANTA MARIA MECHADITOSDUL.SECA 200 GRS. CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079230598",},
-  "SANTA MARIA OBLEA COCO RELL 90GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079234398",},
-  "SANTA MARIA OBLEA RELL CHOC PAQ 90 GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079234374",},
-  "SANTA MARIA OBLEA RELL LIMON PAQUETE 90 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079230833",},
-  "SANTA MARIA OBLEAS RELL FRUT. PAQUETE 90 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079234367",},
-  "SANTA MARIA OBLEAS VAIN RELL PAQUETE 90 GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079234381",},
-  "SANTA MARIA SCONES DULCE SECA 200 GRCAJA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079230154",},
-  "SANTA MARIA VAINILLA DUL.SECA 200 GR CAJA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079230062",},
-  "SANTA MARIA VAINILLA DULCE SECA 200 GRCAJA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798079230147",},
-  "SMOOKIES GALLETA DS 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798166860158",},
-  "SMOOKIES GALLETA DS 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798166860196",},
-  "SORIANO BISCUITS GALL. BAÑ.CHOCO 20GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "77962898",},
-  "SORIANO CHOCO BISCUITS GALL. BAÑ.CHOCO. DP 160GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7792184003313",},
-  "STEINHAUSER BUDIN BANADO CHOC C/CHIPS 250GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568005905",},
-  "TOSTI TOSTADAS DUL.SECA 200GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794529041639",},
-  "TRIMAK PALITOS DUL.ALMENDRA D.SECA 180 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798024290318",},
-  "TRIMAK POLVORONES C/CHIPS CHOCOLATE 150 GRBOL.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798024290332",},
-  "TRIMAK POLVORONES C/CHIPS CHOCOLATE 150 GRBOL.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798024290349",},
-  "TRIMAK POLVORONES LIMON DULCE SECA 170 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798024290301",},
-  "YUKA COOKIE C/CHIPS S/TACC DUL. SEC BOL 150 GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794903232189",},
-  "YUKA COOKIE DULCE C/MIEL S/TACC DULC. SECA BOLSA 150 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794903232202",},
-  "YUKA COOKIE VAINILLA S/TACC DULC. SECA BOLSA 150 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794903232196",},
-  "YUKA PEPITAS DULCE S/TACC SECA BOLSA 150 GRARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794903232219",},
-  "ZAFRAN CHIAPAZ CEREAL DULCE SECA 150 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798187760147",},
-  "ZAFRAN LINOCCO CEREAL DULCE SECA 150 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798187760130",},
-  "ZAFRAN TAKKU CEREAL DULCE SECA 150 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798187760154",},
-  "ZAFRAN TANLATAM CEREAL DULCE SECA 150 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798187760161",},
-  "ZAFRANITO GALL DUL.SEC ORG INTEG. SAB.CHOCO BOLSA 150G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798187760390",},
-  "ZAFRANITO GALL DUL.SEC ORG INTEG. SAB.VAINILLA BOLSA 150G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798187760383",},
-  "ZUPAY OBLEA BLOKE NUTELA 100 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7790349000870",},
-  "SORIANO BISCUIT DULC. SEC. 25GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O SORIANO", "ean": "77935830",},
-  "SORIANO BISCUIT DULCE SECA 125 GRS.PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O SORIANO", "ean": "7792184003085",},
-  "SORIANO BISCUIT DULCE SECA 250 GRS.BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O SORIANO", "ean": "7792184002026",},
-  "SORIANO BISCUIT DULCE SECA 500 GRS.CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O SORIANO", "ean": "7792184001029",},
-  "SORIANO BISCUITS C/CHIPS CHOCOLATE 100 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O SORIANO", "ean": "7792184000084",},
-  "SORIANO LARGUITAS HOJALDRE DU.SECA PQ.150GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O SORIANO", "ean": "7792184003351",},
-  "SORIANO MINI TAPITAS VAINIL.DUL.SECA 200 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O SORIANO", "ean": "7792184000022",},
-  "SORIANO PALMERITAS DULCE SECA BOLSA 200 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O SORIANO", "ean": "7792184003337",},
-  "SORIANO TRIANGULITOS HOJALDRE DU.SECA PQ.150GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O SORIANO", "ean": "7792184003368",},
-  "TIA MARUCA ANILLOS DE COCO DULCE SECA BOLSA 250 GRS": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O TMARUCA", "ean": "7798082740107",},
-  "TIA MARUCA MANTEQUITAS DULCE SECA 200 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O TMARUCA", "ean": "7798082743603",},
-  "TIA MARUCA PEPAS DUL.SECA BOLSA 250 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O TMARUCA", "ean": "7798082745140",},
-  "TRIO FROLITAS DULCE SECA 300 GRS.BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O TRIO", "ean": "7791787000644",},
-  "PAR-NOR MINI PITU.CHOC.RELL.C/CRE.SAB.LECHE 160GBOLSA.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324157046",},
-  "PAR-NOR MINI PITU.MOUSSE C/CREMA SAB.CHOC.RELL.160G BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324157084",},
-  "LIA POLVORITA CHC/VAIN DUL.RELLE.152GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040146143",},
-  "LIA POLVORITA CHOC DUL.RELLE.81GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040139183",},
-  "LIA POLVORITA FRUT DUL.RELLE.81GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040139176",},
-  "LIA POLVORITA MINI CHOC DUL.RELLE.152GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040139251",},
-  "LIA POLVORITA VAIN DUL.RELLE.81GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040139169",},
-  "PLASENCIA POZO GALL PEPAS DULCE SECA 170GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POZO", "ean": "7790077001330",},
-  "PLASENCIA POZO VAINILLA DULCE SECA480 GR PAQ. ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POZO", "ean": "7790077000135",},
-  "PLASENCIA POZO VAINILLAS DULCE SECA190 GRS. PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POZO", "ean": "7790077000104",},
-  "SMAMS GALL DUL RELL LIMON S/TACC 105GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511257",},
-  "SMAMS GALL DUL RELL VAINILLA S/TACC 105GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511240",},
-  "SMAMS GALL.DUL.SECA VAINILLA COLEGIAL 150 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510847",},
-  "SMAMS GALLET CHIP/CHOC. DUL SEC . PAQ. 150GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511004",},
-  "SMAMS GALLET S/TACC CHOC DU.SE. 200GR PAQ. 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511011",},
-  "SMAMS GALLETITAS C/CHIPS DUL SEC 120GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511349",},
-  "SMAMS PEPAS MEBRILLO 150GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510786",},
-  "SMAMS POLVORON COCO DULCE SECA 120GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511196",},
-  "SMAMS POLVORON LIMON DULCE SECA 120 GR BOL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511202",},
-  "SMAMS POLVORON VAIN DULCE SECA 120 GR BOL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511219",},
-  "SMAMS S/GLUTEN BIZ.AGRIDUL.AZUCARA. 150 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510182",},
-  "SMAMS S/GLUTEN CHOCOLATE DUL.RELLE. 110 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510014",},
-  "SMAMS S/GLUTEN VAINILLA DUL.RELLE. 110 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510021",},
-  "TIA MARUCANARANJITA DULCE SECABOLSA 250 GR ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TM NARANJ", "ean": "7798082740183",},
-  "PEPSICO TODDY C/CHISP.CHOCO.DUL.SECA PAQ.126G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TODDY", "ean": "7790380023432",},
-  "TODDY GALL MINI DUL SEC 50GR PAQ. 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TODDY", "ean": "7790380023487",},
-  "VALENTE VAINILLA DUL. SEC. 444GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "VALENTE VAIN", "ean": "7793890258707",},
-  "VALENTE VAINILLA DULCE SECA 74 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "VALENTE VAIN", "ean": "7793890258738",},
-  "VALENTE VAINILLAS DUL. SEC. 148GR. PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "VALENTE VAIN", "ean": "7793890258691",},
-  "BAGLEY VOCACION CLASICA.DUL.SECA 141 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "VOCACION", "ean": "7790040146389",},
-  "M.CANUELAS9 DE ORO BIZ.C/SALVCEREAL 200 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "9 DE ORO", "ean": "7792200020119",},
-  "M.CANUELAS9 DE ORO BIZC.CLAS.CRACKERS 200 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "9 DE ORO", "ean": "7792200000159",},
-  "M.CANUELAS9 DE ORO BIZC.LIGHTCRACKERS 170 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "9 DE ORO", "ean": "7792200000777",},
-  "BAUDUCCO TOSTADAS INTEGRAL CRACKERS PAQ142 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "BAUDUCCO", "ean": "7891962060460",},
-  "BAUDUCCO TOSTADAS MULTIGRANOS CRACKERS PAQ142 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "BAUDUCCO", "ean": "7891962060477",},
-  "BAUDUCCO TOSTADAS ORIGINAL CRACKERS PAQ 142GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "BAUDUCCO", "ean": "7891962060453",},
-  "DON SATUR BIZCOCHOS SALAD CRACKERS 200 GR BL X30": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "D SATUR BIZ", "ean": "17795735000325",},
-  "DON SATUR BIZCOCHOS SALADOS CRACKERS PAQ.200 GR5735000328": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "D SATUR BIZ", "ean": "7795735000328",},
-  "DON SATUR BIZCOCHOS C/QUESO BOLSA 140 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "DON SATUR", "ean": "7795735000519",},
-  "DON SATUR TALITAS QUESO 110 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "DON SATUR", "ean": "7795735000243",},
-  "DR SCHAR CRACKERS 210 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "DR. SCHAR", "ean": "8008698003503",},
-  "SCHAR P/CELIACOSSALADAS CRACKERS 175 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "DR. SCHAR", "ean": "8008698002049",},
-  "GRANIX GRAN AGUA SANDWICH CRACKERS 200 GRS.PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANAGUA", "ean": "7790045001133",},
-  "GRANIX GRAN AGUA SANDWICH CRACKERS PAQ.200 X30045001379": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANAGUA", "ean": "7790045001379",},
-  "GRANIX SALVADO CEREAL 240 GRS. PAQUE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANIX", "ean": "7790045826200",},
-  "GRANIX SALVADO S/SAL 3EN1 3U 720 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANIX", "ean": "7790045826231",},
-  "GRANIX SALVADO SIN SAL PAQ 230 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANIX", "ean": "7790045826095",},
-  "HOJALMAR TALITAS CLASICAS PAQ.120GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOJALMAR", "ean": "7793450000883",},
-  "LA PROVIDENCIA CRACKERS 101 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "LA PROVIDENCIA", "ean": "7798141972364",},
-  "LA PROVIDENCIA CRACKERS C/SALVADO PAQ 120GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "LA PROVIDENCIA", "ean": "7798141972470",},
-  "LA PROVIDENCIA CRACKERS C/SALVADO PAQ. 120GR PACK X 3U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "LA PROVIDENCIA", "ean": "7798141972487",},
-  "LA PROVIDENCIA CRACKERS C/SALVADO PAQ. 600 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "LA PROVIDENCIA", "ean": "7798141972494",},
-  "LA PROVIDENCIA CRACKERS CR PAQUETE 101 GRPACK X 3 U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "LA PROVIDENCIA", "ean": "7798141972371",},
-  "LA PROVIDENCIA CRACKERS PAQ. FAM. X 5 U. 101 GR C/U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "LA PROVIDENCIA", "ean": "7798141972388",},
-  "M CANUELAS 9 DE ORO GALL SN JAMON 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "M CA¥UELAS 9 ORO", "ean": "7792180146137",},
-  "M CANUELAS 9 DE ORO GALL SN ORIG 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "M CA¥UELAS 9 ORO", "ean": "7792180146090",},
-  "M CANUELAS 9 DE ORO GALL SN QUESO 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "M CA¥UELAS 9 ORO", "ean": "7792180146106",},
-  "M PROPIAS": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "M PROPIAS", "ean": "1",},
-  "ARCOR MEDIA TARDE SANDWICH CRACKERS 107 GR PAQ.X 5U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "MEDIA TARDE", "ean": "7790040143012",},
-  "LIA MEDIA TARDE CRACKERS 105 GR PAQUE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "MEDIA TARDE", "ean": "7790040143593",},
-  "LIA MEDIA TARDE GALL CR 315GR PAQUE AGR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "MEDIA TARDE", "ean": "7790040143586",},
-  "DON SATUR TALITAS CRACKERS 140 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O DSATUR", "ean": "7795735000106",},
-  "AGLU SAB.QUESO SNACKS 150 GR CAJA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798128410063",},
-  "ANGIOLA CRACKERS SALADAS BOLSA 150 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798294150121",},
-  "ANGIOLA CRACKERS SALADAS JAMON BOLSA 150 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798294150145",},
-  "BINFINIT TOSTADITAS JAMON 130GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798221642002",},
-  "BINFINIT TOSTADITAS PIZZA 130GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798221642019",},
-  "BINFINIT TOSTADITAS QUESO 130GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798221642033",},
-  "BINFINIT TOSTADITAS TOM Y ALBAC 130GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798221642026",},
-  "BONTA SCHIACCE GALL SNACK JAMON 150GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "8014941052891",},
-  "BONTA SCHIACCE GALL SNACK PIZZA 150GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "8014941052778",},
-  "BONTA SCHIACCE GALL SNACK ROMERO 150GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "8014941052754",},
-  "BONTA SCHIACCE GALL SNACK TOMAT/OREG 150GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "8014941054390",},
-  "BREVISS TOSTADAS LIGHT CRACKERS 200 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529041622",},
-  "DILEXIS ARGENTIT. SIN SAL CRACKERS 160 G.C/U PAQ.X 3 UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798113157638",},
-  "DILEXIS ARGENTITAS AGUA CRACKERS 102 GRPACK X 3 U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798113151308",},
-  "DON PANCHO MARINERAS C/SEMILLAS 220 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798033900215",},
-  "DON PANCHO MARINERAS CRACKERS 220 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798033900161",},
-  "DON PANCHO MARINERAS LIGHT CRACKERS 220 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798033900208",},
-  "DON PANCHO MARINERAS S/SAL CRACKERS 220GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798033900154",},
-  "DOS HERMANOS TOST.DE ARROZ CRACKERS 120 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790503000333",},
-  "DOS HERMANOS TOST.DE ARROZ S/SAL CRACKERS 120 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790503000326",},
-  "FRANKS BIZCOCHITOS DE QUESO 100GR 1U BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798340790264",},
-  "GALLO BIZCOCHOS ARROZ SAL CRACKERS 100GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790070418463",},
-  "GAONA STAR BIZCOCHITOS PAQUETE 180 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798126073055",},
-  "GOLD MUNDO MATERITOS BIZCOCHOS PAQUETE 200 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791376000291",},
-  "GRANDIET MULTI- CEREAL CEREAL 100 GRS. PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7797330102322",},
-  "GRANDIET MULTICERE.DULCE CEREAL 100 GRS. PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7797330102384",},
-  "GRANDIET MULTICEREAL SIN SAL CEREAL 100 GRS. PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7797330102377",},
-  "GRUN SIN SAL CRACKERS 140GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798015440050",},
-  "GULLON FIB.INTEG.S/AZUCAR CRACKERS 170 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "8410376009392",},
-  "HAPPY FOOD CHALITAS JAMON 100GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798308250397",},
-  "HOJALMAR SNACK MATERO BIZCOCH. SALADO BOL. 180GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7793450000876",},
-  "JORGITO BIZCOCHITOC/GRASA CRACKERS 400 GR BOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790957000651",},
-  "LULEMUU TOST.ARROZ MUL-SEMIL.CRACKERS 120 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798146300803",},
-  "LULEMUU TOSTADAS ARROZ CRACKERS 120 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798146300308",},
-  "M CANUELAS PASEO GALLETAS SN QUESO 250GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7792180145444",},
-  "M.C. TOSTADITA CLAS.CRACK 110GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529042452",},
-  "M.C. TOSTADITA CLAS.CRACK 110GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529042476",},
-  "MELTAIM GALLETAS SN OLIV/OREG 150GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "754697550224",},
-  "MELTAIM GALLETAS SNACK QUESO 150GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "723540526853",},
-  "MOLINOS ALA TOST.ARROZ CLAS.CRACKERS 150 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791120098093",},
-  "PASEO GALLETAS CRACKERS OLIV/ROME 250GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7792180145420",},
-  "PINDY DE AGUA CRACKERS 102 GRPACK X 3 U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798113151322",},
-  "PIPAS GALLET CRACKERS C/SEM GIR 100GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798044151354",},
-  "RIANITOS MARINERA LINO Y CHIA. 170GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157740117",},
-  "RIANITOS MARINERA OLIVA Y PARMES CRACKERS 170GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157740100",},
-  "RIANITOS MARINERA ORIG CRACKERS 170GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157740094",},
-  "RIANITOS MINI BIZC.PARMESANO/OLIVA 200 GRBOL.CRACKE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157740070",},
-  "RIANITOS MINI BIZCO.LINO/CHIA CRACKERS 200 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157740049",},
-  "RIANITOS MINI BIZCOCHOS CRACKERS 200 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798157740018",},
-  "SHIVA CRACKER MIX DE SEMILLAS 100GR 1U BOL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "617308824100",},
-  "SHIVA GALL SN JALAP 100GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "791466298451",},
-  "SHIVA GALLETAS SN ORIGINAL 100GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "791466298444",},
-  "SHIVA MEDITERRANEAS SIN TACC PAQ 100GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "617308824117",},
-  "SHIVA PIMIENTON AHUMADO CR SIN TACC PAQ 100GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "617308824087",},
-  "SHIVA TOST SARRACENO GERM SN 100GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "791466298468",},
-  "TOSTI TALITAS CLASICA 100GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529042087",},
-  "TOSTI TALITAS PIZZA 100GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529042117",},
-  "TOSTI TOSTADA GRUESA SIN SAL PAQ 200GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529041615",},
-  "TOSTI TOSTADAS CLASICA 140GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529041653",},
-  "TOSTI TOSTADAS CLASICAS PAQ 200GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529041608",},
-  "TOSTI TOSTADAS FINA S/SAL 140GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529041677",},
-  "TOSTI TOSTADAS MULTICEREAL 140GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529041691",},
-  "YUKA QUESO SALADAS S/TACC SECA BOLSA 150 GRARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794903232226",},
-  "TIA MARUCA DILEXIS GALL CR SALVADO 630GR X3 PAQ AGR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O TMARUCA", "ean": "7798082744778",},
-  "TIA MARUCA FAJITAS CR CLASICAS 120GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O TMARUCA", "ean": "7798082745430",},
-  "TIA MARUCA FAJITAS QUESO 120 GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O TMARUCA", "ean": "7798082745447",},
-  "TIA MARUCA FAJITAS.SAB.PIZZA SNACKS 120 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O TMARUCA", "ean": "7798082745546",},
-  "TIA MARUCATOSTADITAS DE ARROZ CRACKERS 120 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O TMARUCA", "ean": "7798082743726",},
-  "TIA MARUCATOSTADITAS DE ARROZ S/SAL 120 GRBOL.CRACK.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O TMARUCA", "ean": "7798082743849",},
-  "M CANUELAS PASEO GALLETAS CR PIZZA 250GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180145437",},
-  "M.CANUELASPASEO MINI CRACKERS 300 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180006448",},
-  "M.CANUELASPASEO MINI SALVADO CEREAL 300 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180006455",},
-  "M.CANUELASPASEO MINICRACKERS 5 SEMILLAS 300 GRBOL.CEREAL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180007315",},
-  "M.CANUELASPASEO MINICRACKERS MIX CEREAL 300 GRBOL.CEREAL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180007346",},
-  "M.CANUELASPASEO MINICRACKERS S/SAL 300 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180007254",},
-  "RIERA TOSTADAS 7 SEMI PAQUETE 200 GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "RIERA", "ean": "7790071070417",},
-  "RIERA TOSTADAS CLASICA CRACKERS 200 GR PAQUE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "RIERA", "ean": "7790071090231",},
-  "RIERA TOSTADAS INTEGRAL 200GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "RIERA", "ean": "7790071090330",},
-  "RIERA TOSTADAS LIGHT PAQUETE 200G PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "RIERA", "ean": "7790071070134",},
-  "RIERA TOSTADAS S/SAL CRACK 200 GR PAQUE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "RIERA", "ean": "7790071090422",},
-  "SMAMS BIZCOCHO SALADO CR 150GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SMAMS", "ean": "7798181511417",},
-  "SMAMS CRACKERS CRACKERS BOLSA 150 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SMAMS", "ean": "7798181510212",},
-  "SMAMS MIX DE SEMILLAS CEREALES 150 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SMAMS", "ean": "7798181510229",},
-  "TIA MARUCA CRACKERS 3 U 106 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TM S/SAL CR", "ean": "7798082744518",},
-  "PEPSICO TWISTOS HORNEADOS JAMON 40GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310987094",},
-  "PEPSICO TWISTOS JAMON IBER 155GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310984475",},
-  "PEPSICO TWISTOS MINI TOS HORNEAD QUESO 40GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310987100",},
-  "PEPSICO TWISTOS MINI TOST SN QUESO 155GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310984444",},
-  "TWISTOS MINI TOST.JAMON 95GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310983256",},
-  "TWISTOS MINI TOST.QUESO 95GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310983270",},
-  "BIMBO ZENISSIMO SALMAS HORN.CLAS SN CAJA 90GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "ZENISSIMO", "ean": "7793890261844",},
-  "CHOCOARROZ ALFAJOR ARROZ 28GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070104410",},
-  "CHOCOARROZ ALFAJOR DE ARROZ C/D.D.LEC 22 GR X6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418227",},
-  "CHOCOARROZ ALFAJOR DE ARROZ C/LIMON 22GR X 6U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418265",},
-  "CHOCOARROZ ALFAJOR DE ARROZ DDL 22 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418203",},
-  "CHOCOARROZ ALFAJOR SPL ARROZ 28GR PAQUETE 6UN 168G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070104403",},
-  "CHOCOARROZALFAJOR DE ARROZ C/LIMON 22 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418241",},
-  "CHOCOARROZALFAJOR DE ARROZ MARROC 22 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418326",},
-  "CHOCOARROZALFAJOR DE ARROZ MARROC 22 GR X 6 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418340",},
-  "CACHAFAZ ALFAJOR CHOCOLATE BLANCO 60 GRCAJA X6 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "7798128000493",},
-  "CACHAFAZ ALFAJOR CHOCOLATE NEGRO 60 GRCAJA X6 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "7798128000479",},
-  "CACHAFAZ ALFAJOR MIXTO CHOCOLATE 60 GRCAJA X12 U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "7798128000509",},
-  "CACHAFAZ ALFAJOR MOUSSE 49 GR CAJA X 6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "7798128000257",},
-  "CACHAFAZ ALFAJOR NEGRO 60 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "77934499",},
-  "GUAYMALLEN ALFAJOR 38GRS. ALEX VIAN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "GUAYMALLEN", "ean": "77980229",},
-  "GUAYMALLENTRI ALFAJOR 70 GR ARG": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "GUAYMALLEN", "ean": "77980274",},
-  "HAVANNA ALFAJOR CHOCOLATE. 60GR X4U 240GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "HAVANNA", "ean": "7791875101413",},
-  "HAVANNA MIXTOS ALFAJOR 255 GRS.CAJA X 6 U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "HAVANNA", "ean": "7791875000013",},
-  "JORGELIN MAXI BLANCO ALFAJOR 85 GR C/U.PAQ.X3U AR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGELIN", "ean": "7790957002709",},
-  "JORGITO ALFAJOR 55 GRS.C/UPAQ.X 6 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGITO", "ean": "7790957000026",},
-  "JORGITO ALFAJOR BLANCO SPL 50GR 6U PAQ 300G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGITO", "ean": "7790957000019",},
-  "JORGITO ALFAJOR CHOCOLATE BLANCO 55 GRPACK X6 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGITO", "ean": "7790957000163",},
-  "JORGITO ALFAJOR FRUTA 150 GR 6 U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGITO", "ean": "7790957000552",},
-  "JORGITO ALFAJOR MOUSSE SPL 270GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGITO", "ean": "7790957003317",},
-  "JORGITO ALFAJOR S/GLUT SPL 50GR PAQUETE 6UN 300G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGITO", "ean": "7790957000415",},
-  "JORGITO ALFAJOR SIMPLE 45GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGITO", "ean": "7790957000101",},
-  "JORGITO ALFAJOR SPL BAN CHC 50GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGITO", "ean": "7790957000408",},
-  "JORGITO ALFAJORCI.PAQ.X 6 U. 155 GRS.0957000545": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGITO", "ean": "7790957000545",},
-  "JORGITO MOUSSE ALFAJORCI.PAQ.X 6 UN128 GR ARG": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGITO", "ean": "7790957000569",},
-  "M PROPIAS": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "M PROPIAS", "ean": "1",},
-  "ANGIOLA S/GLUTEN ALFAJOR NEG.C/DDL. 50 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798294150046",},
-  "ANGIOLA S/GLUTEN ALFAJOR NEG.C/DDL. 50 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798294150091",},
-  "CHAMMAS ALFAJOR BCO SPL 50GR 6U PAQ 300G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232707",},
-  "CHAMMAS ALFAJOR CHOCO NEGRO SPL 50GR 6U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232691",},
-  "CHAMMAS BLANCO TRAD ALFAJOR 40GR 6U PAQ 240G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232684",},
-  "CHAMMAS MEMBRILLO ALFAJOR 40GR 6U CAJA 240G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232677",},
-  "DE NUESTRA PANADERIA ALF.DDL BAN.CHOCO.NEG.6U 25GR C/U PAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7791696008083",},
-  "DONN ALFAJ ARROZ BAN CHC SPL 78GR 6U PAQUETE 468G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798033900512",},
-  "DONN ALFAJ ARROZ. BAN CHC SPL 78GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798033900529",},
-  "DONN ALFAJ ARROZ. BAN CHC SPL 78GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798033900536",},
-  "DONN ALFAJ ARROZ. BAN CHC SPL 78GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798033900543",},
-  "EL CORDOBES ALFAJOR CHC DDL SPL 50GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798350889149",},
-  "EL CORDOBES ALFAJOR DDL SPL 48GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798350888753",},
-  "ENTRE DOS ALFAJOR BAN CHC SPL 45GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "763571682333",},
-  "ENTRE DOS ALFAJOR BAN. CHC SPL 45GR 6UN CAJA 270G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "714604060505",},
-  "ENTRE DOS ALFAJOR BAN. CHC SPL 45GR 6UN CAJA 270G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "727373043693",},
-  "ENTRE DOS ALFAJOR DDL NEGRO SPL 45GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "763571682326",},
-  "FELICES LAS VACAS ALFAJOR NEGRO PAQ.60GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "724751091963",},
-  "FELICES LAS VACAS ALFAJOR SPL 60GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "727373150148",},
-  "FELICES LAS VACAS ALFAJOR. PAQ.60GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "727373150131",},
-  "FELICES LAS VACAS ALFAJOR. SPL PAQ.60GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "714604451662",},
-  "FRANKS ALF.DE CHOC.C/D.DE LECHE SIMPLE 50 G ENV. UNID.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798340790035",},
-  "FRANKS ALFAJOR MOUSS SPL 50GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798340790271",},
-  "HAPPY FOOD ALFA S/TACC COCO/DDL SPL 50GR 3U BDJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250274",},
-  "HAPPY FOOD ALFAJ LS/TACC DDL SPL 50GR 3U BANDJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250069",},
-  "HAPPY FOOD LS/TACC MANI SIMPLE 50GR 3U BANDJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250052",},
-  "HAPPY FOOD LS/TACC MOUSSE SIMPLE 50GR 3U BANDJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250045",},
-  "HAPPY FOOD S/TACC DDL S/AZ. SPL 50GR 3U BNDJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250120",},
-  "LA QUINTA COSQUIN ALFAJOR SPL 70GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798350889019",},
-  "LA QUINTA LA MONA SPL 50GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798350889071",},
-  "LULEMUU ALFAJOR ARROZ BCO DDL SPL 22GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "77987839",},
-  "LULEMUU ALFAJOR ARROZ LIMON SPL 22GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "77987877",},
-  "LULEMUU ALFAJOR ARROZ MARROC SPL 22GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "77987853",},
-  "LULEMUU ALFAJOR ARROZ NEGRO SPL 22GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "77987846",},
-  "LULEMUU ALFAJOR ARROZ YOG VAIN SPL 22GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "77987884",},
-  "MARLEY ALFAJOR BAJON CHOC SIMP. 75GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798359560445",},
-  "MARLEY ALFAJOR BAJON CHOC SIMP. 75GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798359560452",},
-  "MELTAIM ALFAJOR ARROZ SPL 60GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "754697490513",},
-  "MELTAIM ALFAJOR ARROZ SPL 60GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "754697490537",},
-  "MELTAIM ALFAJOR CACAO MANI SPL 45GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "754697550101",},
-  "PERMITIDO ALFAJOR BAN CHC SPL 29GR 6U BOL 145G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798353240039",},
-  "PERMITIDO ALFAJOR SPL 140GR 1UN PAQUETE": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798353240374",},
-  "PERMITIDO ALFAJOR SPL 140GR 1UN PAQUETE": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798353240381",},
-  "PERMITIDO ALFAJOR SPL 145GR 1UN PAQUETE": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798353240022",},
-  "SMAMS ALFAJOR DDL SPL 50GR 3U PAQ 150G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798181511370",},
-  "SOL SERRANO ALFAJOR CHC. BLANCO SPL 40GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232592",},
-  "SOL SERRANO ALFAJOR D.D/LECHE 40GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232417",},
-  "SOL SERRANO ALFAJOR FRUTA 40GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232424",},
-  "SOL SERRANO ALFAJOR FTOS BOSQUE SPL 40GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232615",},
-  "SOL SERRANO ALFAJOR MANI SPL 40GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232608",},
-  "TRASSENS ALFAJOR SPL 70GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "77967442",},
-  "TRIMAK D.DE LECHE ALFAJOR PAQUETE 29 GR X 5 UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798024295122",},
-  "YUKA ALFAJOR CHOC MIX S/TACC 50GR 6UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232479",},
-  "YUKA ALFAJOR MIX S/TACC 50GR 6UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232509",},
-  "YUKA ALFAJOR.DDL S/TACC 50GR 6UN CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232493",},
-  "VIMAR ALFAJOR CHOCOLATE 38G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "VIMAR", "ean": "77958327",},
-  "VIMAR ALFAJOR TRIPLE CHOCOLATE 60GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "VIMAR", "ean": "77958341",},
-  "VIMAR ALFAJOR X3 CHOCOLATE 60GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "VIMAR", "ean": "77958365",},
-  "VIMAR ESCOLAR ALFAJOR 28G.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "VIMAR", "ean": "77958259",},
-  "BANANITA DOLCA BOMBON BOCAD BANANA 30GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BANTA-DOLCA", "ean": "77988263",},
-  "BARILOCHE ALMENDRAS C/CHOCOLA.BOLSA 80 GRARG": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430903831",},
-  "BARILOCHE ALMENDRAS C/CHOCOLA.BOLSA 80 GRARG": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430904036",},
-  "BARILOCHE PASAS DE UVA BANAD. 120 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430095741",},
-  "BARILOCHE PASAS DE UVA C/CHOCO. BOLSA 80GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430095833",},
-  "BARILOCHE PISTACHO BAN CHC 160GR TUBO 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BARILOCHE", "ean": "7792430904098",},
-  "BIZNIKKE BLACK BIZCOCHO 28 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BIZNIKE", "ean": "77971333",},
-  "BIZNIKKE NEVADO BIZ.BAN.C/CH.C/LE.Y BLA. 28 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BIZNIKE", "ean": "77991430",},
-  "BONAFIDE ALMENDRAS BAN.C/CHO.BOLSA 80GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BONAFIDE", "ean": "7792360097136",},
-  "BONAFIDE CEREAL BAN.C/CHO.80GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BONAFIDE", "ean": "7792360097129",},
-  "BONAFIDE PASAS DE UVA BANA. C/CHO. 80GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BONAFIDE", "ean": "7792360097105",},
-  "BONAFIDE TURRON DE MANI BAN.C/CHO. 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BONAFIDE", "ean": "7792360071693",},
-  "EL CACHAFAZ CONITO 38 GRCAJA X 6": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "EL CACHAFAZ", "ean": "7798128001896",},
-  "FANTOCHE PASAS DE UVA BAN C/CHOC 80GR POUCH 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "FANTOCHE", "ean": "7792360097969",},
-  "GALLO CHOCONUSS OBLEA ARR.RELL.AVEL.BAN.C/CHO.20 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070416247",},
-  "GALLO OBLEA D/ARROZ BLACK RELL.BAN. 20GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070431639",},
-  "GALLO OBLEA D/ARROZ RELL.BAN. CHC 20GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070431905",},
-  "GALLO OBLEA D/ARROZ WHITE RELL.BAN. 20GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070431653",},
-  "GALLO OBLEA DE ARROZ RELLE.BAN. 20 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070411952",},
-  "GALLO SNACK CHOCOBAR BAR ARROZ BAN.C/CHO 20GR PAQ 6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070431899",},
-  "GALLO SNACK CHOCOBAR OBLEA ARROZ BAN.C/CHO 20GR PAQ 6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070417572",},
-  "GEORGALOS ALMENDRAS C/CHOCOLA. 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380037767",},
-  "GEORGALOS BOLITAS DE CEREAL BAN.C/CHO.80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380037804",},
-  "GEORGALOS CEREZAS AL RHUM BAN.C/CHO.100 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380037019",},
-  "GEORGALOS FRAMBUESAS BAN.C/CH. 100 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380037033",},
-  "GEORGALOS PASAS BANADAS 80 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380037774",},
-  "GEORGALOS TURRON CAPUCCINO CUB.CHOCO. 100GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380033196",},
-  "GEORGALOS TURRON CROC. MANI.ALME.C/CH 100 GR CJ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GEORGALOS", "ean": "7790380015536",},
-  "HAVANNA HAVANNETS CONITOS BAN.C/CHO. 210 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "HAVANNA", "ean": "7791875000501",},
-  "HERSHEY'S MAIS CHOC C/ LECHE 102GR BL 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "HERSHEY'S", "ean": "7899970400674",},
-  "HERSHEY'S MAIS CHOCOLATE AMENDOIN 102GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "HERSHEY'S", "ean": "7899970400698",},
-  "HERSHEY'S MAIS COOKIES N CREME 102GR BL 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "HERSHEY'S", "ean": "7899970400681",},
-  "HERSHEY'S MAIS TRIPLE CHOC 102GR BL 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "HERSHEY'S", "ean": "7899970400704",},
-  "KINDER BUENO BOMBON 21.5 GRX2 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KINDER BUENO", "ean": "80052760",},
-  "KINDER BUENO WHITE REG. BOMBON 19.5 GR X2 PAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KINDER BUENO", "ean": "80761761",},
-  "KIT KAT CHOCOLATE BLEA BANADA DARK 41.5GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KIT-KAT", "ean": "7891000379073",},
-  "KIT KAT CHOCOLATE OBLEA BAN TRP CHC 41.5GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KIT-KAT", "ean": "7891000422052",},
-  "KIT KAT OBLEA BAN.CHOCOLATE C/LECHE 41.5 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KIT-KAT", "ean": "7891000248799",},
-  "KIT KAT OBLEA.BANADA BCO CHOCOLATE 41.5GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KIT-KAT", "ean": "7891000379028",},
-  "M PROPIAS": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "M PROPIAS", "ean": "1",},
-  "NESTLE ALMENDRAS BAN CHC O BANADOS 80GR POUCH 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "NESTLE", "ean": "8445291996809",},
-  "NESTLE AVELLANAS BAN CHC O BANADOS 80GR POUCH 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "NESTLE", "ean": "8445291996731",},
-  "NUGATON BLACK OBLEA BAN.PAQ. 27 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "NUGATON", "ean": "7792360072485",},
-  "NUGATON OBLEA BAN.CHO.C/LEC.PAQ. 27 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "NUGATON", "ean": "7792360072447",},
-  "NUGATON OBLEA CHOCOLATE BLANCO 27 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "NUGATON", "ean": "7792360072461",},
-  "BRIA SNACKS BAN CHC 100GR 1U POUCH": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "764451098916",},
-  "BRIA SNACKS O BANADOS CHC 35GR 1UN BOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "745853848781",},
-  "CONOSUR PASAS DE UVA C/CHOCO 150GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7798143356148",},
-  "DR SCHAR OBLEA BANADA CHC 35GR BOLSA 3UN 105G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8008698005286",},
-  "FELICES LAS VACAS BITS O BANADOS 22GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "714604229568",},
-  "FELICES LAS VACAS BITS O BANADOS 22GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "714604229575",},
-  "FRANKS BOCADITOS DDL BANADO 40GR 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7798340790127",},
-  "HAPPY FOOD BOCADITO DDL S/TACC 40GR 3UN PAQ 120G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7798308250151",},
-  "LADDU BAR BARRITA ARANDANOS 30GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8904150127483",},
-  "LADDU BAR BARRITA CHOC/NARANJA 30GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8904150195246",},
-  "LADDU BAR BARRITA FRUTOS ROJOS 30GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8904150127438",},
-  "LADDU BAR BARRITA VEGANA COCO 30GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8906038788625",},
-  "LADDU BAR BARRITA VEGANA COCO 30GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8906038788649",},
-  "LOS CAROLINOS ALMENDRAS C/CHOCO. 150 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7794377085106",},
-  "LOS CAROLINOS CEREAL BAN C/CHO. 150GR BANDEJA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7794377085533",},
-  "LOS CAROLINOS PASAS C/CHOCO. 150 GRCAJA PL.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7794377085113",},
-  "LULEMUU CHORQUI OBLEA DE ARROZ BANADA 20 GR PAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "77966865",},
-  "LULEMUU LIMU BARRA DE ARROZ 15GR PAQ LIMON": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "77954411",},
-  "LULEMUU REPOP CUBANITO D/ARROZ RELL.MANI 18GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "77961884",},
-  "LULEMUU REPOP CUBANITO DE ARROZ RELL.AVEL.15 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "77958228",},
-  "NATURAL CANDY ALM/SEM BAN CHOC 100GR 1U POUCH": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "726367920217",},
-  "NATURAL CANDY CAST/SEM BAN CHOC 100GR 1U POUCH": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "724373747095",},
-  "NATURAL CANDY CEREAL BAN CHOC 80GR 1U POUCH": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "736372166883",},
-  "PLENARIO ALMENDRAS C/CHOCO BOLSA 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7792307030110",},
-  "PLENARIO CEREAL C/CHOCO. BOLSA 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7792307005293",},
-  "PLENARIO PASAS DE UVA BAN.C/CHOCO.NEG. 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7792307030141",},
-  "SABE BIEN ! BRAUNICHOC O BAN 35GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7793890261530",},
-  "SOL SERRANO CONITO BAN CHO DDL 6U 38GR 228G CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7794903232110",},
-  "OBLI BON BLANCA OBLEA BANADA 28 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "OBLI BON", "ean": "7793123160852",},
-  "OBLITA OBLEA BAN.C/CHO.RELL.LIMON 16 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "OBLITA", "ean": "77952127",},
-  "OBLITA OBLEA BANADA 30 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "OBLITA", "ean": "7793123160821",},
-  "SNICKER BARRA RELLENA 48GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "SNICKERS", "ean": "7506174512248",},
-  "SNICKERS ALMOND BARRA 49.9 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "SNICKERS", "ean": "40000001058",},
-  "TWIX BARRA DE CHOCOLATE C/CARAMELO 50.7 GRTAB.SOLIDA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "TWIX", "ean": "40000514206",},
-  "VIZZIO ALMENDRAS BAN CHC 80GR POUCH 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "VIZZIO", "ean": "7792360098003",},
-  "VIZZIO CROCANTE CEREAL BAN.C/CHO. 80 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "VIZZIO", "ean": "7792360097983",},
-  "BONAFIDE BOCADITO DULCE DE LECHE 16 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BONAFIDE", "ean": "7792360070047",},
-  "GAROTO BOMBONES SURTIDOS CAJA 250GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "GAROTO", "ean": "7891000392775",},
-  "M PROPIAS": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "M PROPIAS", "ean": "1",},
-  "NESTLE ESPECIALIDADES BOMB.SURT. 251 GR CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "NESTLE", "ean": "7891000391068",},
-  "NESTLE TAB CHOC SOL BYB 22GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "NESTLE", "ean": "8445291565203",},
-  "INTEGRA BOCADITO CHC ARANDANOS 26GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "7798343751354",},
-  "INTEGRA BOCADITO CHOCOLATE C/MANI 26GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "7798343751347",},
-  "PERGALE BOMB BYB CHC 113GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "4770179998366",},
-  "PERGALE BOMB BYB CHC 114GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "4770179999042",},
-  "PERGALE BOMB BYB CHC 117GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "4770179998281",},
-  "STABZ TRUFAS C/AVELLANAS CAJA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "3481290025886",},
-  "STABZ TRUFAS C/CHAMPAGNE CAJA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "3481290025909",},
-  "STABZ TRUFAS NATURALES CAJA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "3481290025893",},
-  "OBLI BON BOCADITO BLANCO 17 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "OBLI BON", "ean": "77925770",},
-  "OBLI BON BOCADITO D.D.LECHE 10 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "OBLI BON", "ean": "77929686",},
-  "OBLI BON BOMBON CHC BYB H/25G REG 15GR ENVOLTORIO 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "OBLI BON", "ean": "77925763",},
-  "OBLI BON CRASH BONBON 17 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "OBLI BON", "ean": "77971821",},
-  "FERRERO ROCHER BOMBON CJA 4U 50G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "7898024397861",},
-  "FERRERO ROCHER BOMBON ESTUCHE 150GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "7898024396994",},
-  "FERRERO ROCHER BOMBONES 100 GRCAJA PL.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "7861002900117",},
-  "FERRERO ROCHER BOMBONES 12.5 GRPAQ.X 3 U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "78909434",},
-  "FERRERO ROCHER BOMBONES 300 GREST.PL.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "8000500009673",},
-  "FERRERO ROCHER BOMBONES COLLECTION X 77 GR CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "7898024397151",},
-  "TOKKE BOMBON CHOC.RELL.DULC.LECHE 10GRARG": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "TOKKE", "ean": "7790380022176",},
-  "BARILOCHE CONFITE MANI BOL. 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BARILOCHE", "ean": "7792430095826",},
-  "BARILOCHE MANI CH 100GR POUCH 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BARILOCHE", "ean": "7792430903992",},
-  "BARILOCHE MANI COLOR CHOCOLATE 120GR BOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BARILOCHE", "ean": "7792430095680",},
-  "BARILOCHE MANI CON CHOCOLATE 120 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BARILOCHE", "ean": "7792430095420",},
-  "BARILOCHE MANI CON CHOCOLATE BOLSA 120GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BARILOCHE", "ean": "7792430095819",},
-  "BARILOCHE TURRON BANADO MANI 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BARILOCHE", "ean": "7792430608651",},
-  "BONAFIDE MANI BAN CHOCO 80GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "BONAFIDE", "ean": "7792360097112",},
-  "GEORGALOS GARRAPIN. DE MANI BAN.C/CHO.80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380037811",},
-  "GEORGALOS MANI COLOR C/CHOCOLATE 80GR BOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380037828",},
-  "GEORGALOS MANI CON CHOCOLATE 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380037736",},
-  "GEORGALOS MANI CON CHOCOLATE BOLSA 120 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380037743",},
-  "GEORGALOS MANI CROC.BAN.C/CHO. 100 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "GEORGALOS", "ean": "7790380011880",},
-  "M & M´S CONFITES CHOCO. PAQ. 48 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "7797453001441",},
-  "M & M´S MINIS CONFITES CHOCO. TBO 30 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "7797453001465",},
-  "M & M'S CHOC CONF 40GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "40000508830",},
-  "M & M'S MANI CON CHOCOLATE PAQ. 49 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "7797453001458",},
-  "M & M'S PEANUT CANDIES CONFITES 150.3 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "40000017325",},
-  "M & M'S PLAIN GRAGEAS C/CHOCOLATE 150 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "40000017318",},
-  "M PROPIAS": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M PROPIAS", "ean": "1",},
-  "CONOSUR ALMENDRA C/CHOCOLATE 150GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7798143356117",},
-  "CONOSUR AVELLANA C/CHOCOLATE 150GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7798143356124",},
-  "CONOSUR CAFE C/CHOCOLATE 150GR 1U BDJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7798143356155",},
-  "CONOSUR CHOCO C/LECHE CONFITADO 150GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7798143356162",},
-  "CONOSUR MANI CON CHOCOLATE 150GR 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7798143356131",},
-  "CROPPERS MANI BAN CHC 85G BOLSA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7790524324746",},
-  "LOS CAROLINOS MANI C/CHOCO. 100 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7794377085168",},
-  "PLENARIO GARRAPINA.DE MANI BAN.C/CHO. 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7792307030073",},
-  "PLENARIO MANI CON CHOCOLATE NEGRO 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7792307030059",},
-  "SKITTLES ORIGINAL GRAGEAS DE CHOCOL. 204.1 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "40000140924",},
-  "PAULISTA MANI CON CHOCOLATE 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "PAULISTA", "ean": "7792730021426",},
-  "VIZZIO MANI BANAD. C/CHOCOLATE 85GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "VIZZIO", "ean": "7792360094548",},
-  "VIZZIO MANI BANADO C/CHOCOLATE 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "VIZZIO", "ean": "7792360097976",},
-  "BARILOCHE.HUEVO D/CHC S/SORP 80GR 1U ENVOL PAS/NAV": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "BARILOCHE", "ean": "7792430903923",},
-  "BIZNIKKE NEVADO HUEVO DE CHOCOLATE 20 GRPAS/NAV.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "BIZNIKE", "ean": "7792730019638",},
-  "GEORGALOS CHOCOMOTI HUEV.CHC 22GR 1U BOL PAS/NAV": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "GEORGALOS", "ean": "7790380032465",},
-  "KINDER JOY HUEVO DE CHOCOLATE 20 GRC/SORPRESA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER JOY", "ean": "78602731",},
-  "KINDER JOY HUEVO DE CHOCOLATE 20 GRX 2U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER JOY", "ean": "7861002900421",},
-  "KINDER C/ LECHE P/NENA C/SORP 20 GRS HYF 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "78931053",},
-  "KINDER C/LECHE P/NENE C/SORP 20 GRS HYF 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "40084107",},
-  "KINDER JOY HUEVO CHO. 20 GR CAJA 2U C/SORP": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "7797394002453",},
-  "KINDER SORPRESA NENA HUEVO DE CHO. 20 GRCAJA 2 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "7898024395867",},
-  "KINDER SORPRESA SELVATICOS HUEVO CHOC. 20 GR 2 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "7797394001555",},
-  "BIZNIKKE NEVADO C/MANI TAB.SOLIDA 30 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "BIZNIKE", "ean": "77971340",},
-  "GEORGALOS C MOUSE DDL TAB.RELLE.100GR 1U CAJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "7790380033240",},
-  "GEORGALOS C/LECHE TAB.SOLIDA 25 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "7790380024194",},
-  "GEORGALOS CHOCOLATIN BCO. TAB.SOLIDA 8 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "77969361",},
-  "GEORGALOS CHOCOLATIN TAB.SOLIDA 8 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "77969354",},
-  "GEORGALOS DDL TAB.RELLE.100GR 1U CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "7790380033349",},
-  "GEORGALOS FULL MANI TABL. 9 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "77969347",},
-  "GEORGALOS PAST MANI MOUS TAB.RELLE.100GR 1U CAJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "7790380033356",},
-  "GEORGALOS S/AZUCAR BLANCO TAB.SOLIDA 30 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "7790380024248",},
-  "GEORGALOS S/AZUCAR C/LECHE TAB.SOLIDA 30 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "77917911",},
-  "HERSHEY'S 73% DARK TAB.SOLIDA 85GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HERSHEY'S", "ean": "7899970401657",},
-  "HERSHEY'S COOKIES & CREAM TABLETA CHC SOLIDA 77GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HERSHEY'S", "ean": "7899970403026",},
-  "HERSHEY'S TAB AIREADO CHOC C/LECHE 85GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HERSHEY'S", "ean": "7899970400469",},
-  "KINDER CHOCOLATE C/LECHE TAB.SOLIDA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "KINDER", "ean": "77949707",},
-  "KINDER CHOCOLATE C/LECHE TAB.SOLIDA 50 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "KINDER", "ean": "77949677",},
-  "KINDER TAB.SOLIDA 12.5 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "KINDER", "ean": "80050315",},
-  "KINDER MAXI TAB.SOLIDA 21 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "KINDER MAXI", "ean": "80050094",},
-  "LINDT DARK CHOC.TABLETA SOLIDA 100 GRIMP": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "3046920028004",},
-  "LINDT EXCELLENCE DARK TAB.SOLIDA 100 GRIMP": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "3046920028370",},
-  "LINDT EXCELLENCE FLEUR DE SEL 100 GRTAB.SOLIDA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "3046920029674",},
-  "LINDT EXCELLENCE TAB.SOLIDA 100 GRIMP": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "3046920028363",},
-  "LINDT HAZELNUT LINDOR TAB.SOLIDA 100 GRIMP": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "7610400068369",},
-  "LINDT IMPORTADA HAZELNUT TAB.SOLIDA100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "7610400010023",},
-  "LINDT IMPORTADO HAZELNUT MILK 100 GR TAB.SOLID": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "7610400010016",},
-  "LINDT IMPORTADO WHITE TAB.SOLIDA100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "7610400014571",},
-  "LINDT LINDOR 60% CACAO TAB.SOLIDA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "7610400074155",},
-  "LINDT NAPOLITANOMINI TABL.SURTIDAS CJ. 350 GRTAB.SOLIDA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "LINDT", "ean": "7610400078559",},
-  "M PROPIAS": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "M PROPIAS", "ean": "1",},
-  "NESTLE CHOCOTRIO CHC RELL C/GALL 90GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7891000377543",},
-  "NESTLE CHOCOTRIO CHC RELL C/GALL 90GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7891000377598",},
-  "NESTLE CHOCOTRIO CHC RELL C/GALL 90GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7891000377642",},
-  "NESTLE GALAK SOLIDA 80GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7891000368626",},
-  "NESTLE MANI SOLIDAS 33GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7613287526236",},
-  "NESTLE MANI SOLIDAS 90GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7613287529497",},
-  "NESTLE TAB CHC SOLIDAS 45GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565173",},
-  "NESTLE TAB CHOC SOLIDAS 50GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565333",},
-  "NESTLE TAB CHOC SOLIDAS 50GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565395",},
-  "NESTLE TAB CHOC. SOLIDAS 25GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565364",},
-  "NESTLE TAB CHOC. SOLIDAS 25GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565425",},
-  "NESTLE TABLETA CHOCO CON MANI 150GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7613287526311",},
-  "NESTLE CLASSIC AMARGO TAB.SOLIDA 80GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE CLASSIC", "ean": "7891000368572",},
-  "NESTLE CLASSIC DIPLOMATA SOLIDAS 80GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE CLASSIC", "ean": "7891000368893",},
-  "NESTLE CLASSIC TAB.SOLIDA 80GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE CLASSIC", "ean": "7891000369098",},
-  "NESTLE DUO CLASSIC TAB.SOLIDA 80GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE CLASSIC", "ean": "7891000368992",},
-  "NESTLE CRUNCH SOLIDA 80GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE CRUNCH", "ean": "7891000369371",},
-  "LE CHOC CHOCO.SEMI AMAR.RELL.DUL.ALMENDRA CJA 48GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "76625288185",},
-  "LOS CAROLINOS EN RAMA C/CHC BCO TAB.SOLI 100GR BAN 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7794377085236",},
-  "LOS CAROLINOS EN RAMA C/CHC TAB.SOLIDA 100GR BAN 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7794377085205",},
-  "MR BEAST TAB CHC RELLENAS 35GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "850027880327",},
-  "MR BEAST TAB CHC RELLENAS 60GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "850027880280",},
-  "MR BEAST TAB CHC SOLIDA 35GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "850027880174",},
-  "MR BEAST TAB CHC SOLIDA 35GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "850027880341",},
-  "MR BEAST TAB CHC SOLIDA 60GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "850027880105",},
-  "MR BEAST TAB CHC SOLIDA 60GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "850027880129",},
-  "MR BEAST TAB CHC SOLIDA 60GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "850027880266",},
-  "MUNZ AVELLANAS TAB.SOLIDA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7610041080102",},
-  "MUNZ SWISS PREMIUM TAB.SOLIDA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7610041080003",},
-  "RITTER SPORT CASTA DE CAJU 100GR TAB.SOL. 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "4000417707000",},
-  "RITTER SPORT MINI CHOC 116GR TAB.SOL.1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "4000417117106",},
-  "RITTER SPORT PERU 74% 100GR TAB.SOLIDA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "4000417933003",},
-  "VAUQUITA TAB. DDL SOLIDA 22GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "77927361",},
-  "VAUQUITA TAB.SOLIDA 22GR X4U PAQ88GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "7798138290136",},
-  "NESTLE SUFLAIR DUO TAB.AIREA. 80GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SUFLAIR", "ean": "7891000329665",},
-  "SUFLAIR MILK AIREADO TABLETA 80GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SUFLAIR", "ean": "7891000329856",},
-  "TODDY TABLETAS AIREADAS 50GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TODDY", "ean": "7790380018056",},
-  "TODDY TABLETAS CHC SOLIDA 60GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TODDY", "ean": "7790380025139",},
-  "TODDY TABLETAS RELLENAS 60GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TODDY", "ean": "7790380025115",},
-  "TODDY TABLETAS RELLENAS 60GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TODDY", "ean": "7790380025122",},
-  "TOKKE CHOC C/LECHE TAB.SOLIDA 60 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TOKKE", "ean": "7790380022114",},
-  "TOKKE TAB.RELLE DDL 72GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TOKKE", "ean": "7790380022107",},
-  "VIZZIO TAB. CHOCO C/ALMENDRAS 100GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360094586",},
-  "VIZZIO TAB.SOLIDA Y MANI 35GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360094500",},
-  "VIZZIO TABLE CHOC 60% CACAO 90GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360095040",},
-  "VIZZIO TABLE CHOC C/LECHE 90GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360095019",},
-  "ICE CUBES PEPPERMINT.S/AZUCAR ADU.CONF. 40P POTE 92GR 1UN": {"empresa": "RESTO", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "O MARCAS", "ean": "34000008438",},
-  "ICE CUBES RASPBERRY.S/AZUCAR ADU.CONF. 40P POTE 92GR 1UN": {"empresa": "RESTO", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "O MARCAS", "ean": "34000008483",},
-  "ICE CUBES SPEARMINT.S/AZUCAR ADU.CONF. 40P POTE 92GR 1UN": {"empresa": "RESTO", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "O MARCAS", "ean": "34000008476",},
-  "WRIGLEY'S 45 GR SLIM SPEARMINT PAQ. 15 TABL.": {"empresa": "RESTO", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "WRIGLEY S", "ean": "22000006653",},
-  "WRIGLEY'S DOUBLEMINT 5P. TABL. ADU. PQ. 12.5GR 1UN": {"empresa": "RESTO", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "WRIGLEY S", "ean": "22000293213",},
-  "WRIGLEY'S SPEARMINT 5P. TABL. ADU. PQ. 12.5GR 1UN": {"empresa": "RESTO", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "WRIGLEY S", "ean": "22000293305",},
-  "BUBBLE ROLL PINK POWER CHI. GLOBO EST. 58GR 1.8 MT DE CHICLE": {"empresa": "RESTO", "categoría": "Gums", "subcategoría": "INFANTILES", "marca": "O MARCAS", "ean": "7798130959376",},
-}
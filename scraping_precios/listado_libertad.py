@@ -1,1033 +0,0 @@
-productos = {
-  "ARCOR JUGO POLVO REG FRUTILLA SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143244",},
-  "ARCOR POLVO ANANA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580141516",},
-  "ARCOR POLVO LIMONADA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143527",},
-  "ARCOR POLVO MANZANA BAJO AZUCARES SOBRE 18GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580129286",},
-  "ARCOR POLVO MANZANA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580144142",},
-  "ARCOR POLVO NARANJA BANANA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580141509",},
-  "ARCOR POLVO NARANJA DULCE REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143008",},
-  "ARCOR POLVO NARANJA DURAZNO REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580141943",},
-  "ARCOR POLVO NARANJA MANGO REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143763",},
-  "ARCOR POLVO NARANJA REG SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143237",},
-  "ARCOR POLVO POMELO ROSADO SOBRE REG 15GR P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580142285",},
-  "ARCOR POLVO REG FRUTILLA ANANA BANANA SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580143824",},
-  "ARCOR POLVO REG MULTIFRUTA SOBRE 15G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580142490",},
-  "ARCOR.JUGO EN POLVO NARANJA DURAZNO CAJA X18U 15GR C/U P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "ARCOR", "ean": "7790580144326",},
-  "BC LA CAMPAGNOLA FRUTILLA LIMON SIN AZU SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129637",},
-  "BC LA CAMPAGNOLA NARANJA DULCE SIN AZU SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129965",},
-  "BC LA CAMPAGNOLA POMELO AMARILLO SIN AZU. SOB .7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129576",},
-  "BC LA CAMPAGNOLA SIN AZU ANANA SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129620",},
-  "BC LA CAMPAGNOLA SIN AZU LIMONADA SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129941",},
-  "BC LA CAMPAGNOLA SIN AZU MANZANA SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129972",},
-  "BC LA CAMPAGNOLA SIN AZU NAR/DUR SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129880",},
-  "BC LA CAMPAGNOLA SIN AZU NARANJA SOB. 7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580132774",},
-  "BC LA CAMPAGNOLA SIN AZU. MIX FRUTAL SOB .7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129385",},
-  "BC LA CAMPAGNOLA SIN AZU. POMELO ROSADO SOB .7G P/1L": {"empresa": "ARCOR", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "BC", "ean": "7790580129644",},
-  "BAGLEY AMOR DUL RELL 330GR C/3U PAQUETE AGR 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "AMOR", "ean": "7790040143500",},
-  "BAGLEY AMOR VAINILLA DULCE RELLENA 110GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "AMOR", "ean": "7790040143531",},
-  "BAGLEY SURTIDO DUL.SECA 400GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAGL SURT", "ean": "7790040147720",},
-  "ARCOR CEREAL MIX AVENA Y PASAS DUL.SECA PAQ. 207 G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040135741",},
-  "ARCOR CEREAL MIX GALL DUL SECA 100GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040140912",},
-  "ARCOR CEREAL MIX GALL DUL SECA 100GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040140929",},
-  "ARCOR CEREAL MIX GALL.CM.AVE/CHOC 207GR 1UN PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040145023",},
-  "ARCOR CEREAL MIXAVE/SEM/CHIPS DUL.SECA 207 GR PAQ.": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREAL MIX", "ean": "7790040135758",},
-  "BAGLEY CHOCOLINAS BCO DUL SEC 245GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040142985",},
-  "BAGLEY CHOCOLINAS DUL.SECA PAQ.170G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040143227",},
-  "BAGLEY CHOCOLINAS DULCE SECA250 GRS. PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040143234",},
-  "BAGLEY CHOCOLINAS GALL DUL.SECA 181GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040148864",},
-  "BAGLEY CHOCOLINAS GALLET DUL.SEC PAQUETE 170G 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040148857",},
-  "BAGLEY CHOCOLINAS NEG DUL SEC. 258GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040142992",},
-  "BAGLEY GALL CHOCOLINAS DUL SEC 100GR PAQUE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCOLINAS", "ean": "7790040143241",},
-  "ARCOR COFLER BOB GALL RELL 85GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143807",},
-  "ARCOR COFLER COOKIES DULCE SECA BOLSA 120 GR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040127944",},
-  "ARCOR COFLER GALL BANADA CHC 105.6G PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143739",},
-  "ARCOR COFLER GALL OBLEAS 87GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143821",},
-  "ARCOR COFLER GALL TARTAL.BAN CHC 105.6GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143753",},
-  "ARCOR COFLER GALL. BAN CHC 132.8GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143692",},
-  "ARCOR COFLER GALLET DULCE RELL 85GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143777",},
-  "ARCOR COFLER GALLET DULCE RELL 85GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143784",},
-  "ARCOR COFLER GALLETA DULCE OBLEA 91GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COFLER", "ean": "7790040143814",},
-  "BAGLEY COQUITAS DULCE SECA 177GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COQUITAS", "ean": "7790040143258",},
-  "BAGLEY COQUITAS DULCE SECA 260GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "COQUITAS", "ean": "7790040143265",},
-  "ARCOR DIVERSION SURTIDO DU.SE.REL. 400 GRBOLSA": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DIVERSION", "ean": "7790040143364",},
-  "ARCOR FORMIS ANIMALES DULCES SECAS 72 GRS PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139909",},
-  "ARCOR FORMIS DDL DUL REL 102GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139961",},
-  "ARCOR FORMIS FRUTILLA DUL REL 102GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139923",},
-  "ARCOR FORMIS VAI/CHO DUL REL 102GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139930",},
-  "ARCOR FORMIS VAI/CHO DUL REL 102GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139978",},
-  "ARCOR FORMIS VAIN/FRUT DUL.RELL 72GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FORMIS", "ean": "7790040139893",},
-  "ARCOR MANA CHOC DUL SEC 136GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040137912",},
-  "ARCOR MANA CHOCOLATE DUL.RELLE.152 GR. PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040133242",},
-  "ARCOR MANA FRUTILLA DR 152 GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040133266",},
-  "ARCOR MANA LIMON DUL.RELLE.152 GR. PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040133259",},
-  "ARCOR MANA LIVIANAS LECHE DU.SE. PAQ 136GR 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040137813",},
-  "ARCOR MANA LIVIANAS LIMON DUL.SEC 136GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040137820",},
-  "ARCOR MANA VAIN ACARAMELADA DS 145GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040151901",},
-  "ARCOR MANA VAIN DUL.SEC 136GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040137837",},
-  "ARCOR MANA VAIN DUL.SEC. 136GR PAQ 3U 408G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040137844",},
-  "ARCOR MANA VAINILLA DUL.RELLE.152 GR. PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MANA", "ean": "7790040133235",},
-  "BAGLEY MELITAS C/MIEL DUL SEC 159GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELITAS", "ean": "7790040139770",},
-  "BAGLEY MELLIZAS DUCE .RELL. 110GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELLIZAS", "ean": "7790040143548",},
-  "BAGLEY MELLIZAS GALL DUL RELL 330GR 1U PAQ AGR X3": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELLIZAS", "ean": "7790040143555",},
-  "BAGLEY MERENGADAS DUL.REL. 88GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MERENGADA", "ean": "7790040139657",},
-  "BAGLEY MERENGADAS. DUL.REL. 88GR PAQ AGR 3U 264G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MERENGADA", "ean": "7790040139091",},
-  "ARCOR GALLETA OBLEA WF 25GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O ARCOR", "ean": "77940131",},
-  "ARCOR GALLETA TURROKLET OB/WF 25GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O ARCOR", "ean": "77993540",},
-  "ARCOR OBLEA RELL TURRON Y MANI 25GR PAQ 250G 10UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O ARCOR", "ean": "7790580401504",},
-  "BAGLEY OPERA OBLEAS 220 GRS. PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OPERA", "ean": "7790040008175",},
-  "BAGLEY OPERA OBLEAS DUL.RELLE.92 GR PAQUE.ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OPERA", "ean": "77903518",},
-  "BAGLEY PORTENITAS D.S VAINILLA/CARAME PAQ. 139G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PORTENITAS", "ean": "7790040132689",},
-  "BAGLEY PORTENITAS D.SEC VAIN/CARAME PAQ AGR 417G 3X 1UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PORTENITAS", "ean": "7790040151192",},
-  "BAGLEY RUMBA GALL DUL.RELL. 110GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "RUMBA", "ean": "7790040143517",},
-  "BAGLEY RUMBA GALLET DUL.RELL. 330GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "RUMBA", "ean": "7790040143524",},
-  "BAGLEY SONRISAS DR 108 GRS PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SONRISAS", "ean": "7790040133488",},
-  "BAGLEY SONRISAS FRAM DL RELLE 108GR PACK X3 U 324 G": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SONRISAS", "ean": "7790040133471",},
-  "BAGLEY CRIOLLITAS CRACKERS 100 GR C/U PAQ.X 3 U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040377806",},
-  "BAGLEY CRIOLLITAS ORIGINAL CR. 499G EST FAM 5X 1UN PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040139015",},
-  "BAGLEY CRIOLLITAS SALVA CRACKERS 195GR PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040124516",},
-  "BAGLEY CRIOLLITASMAS GRANDES CRACKERS 169 GR PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040946101",},
-  "BAGLEY CRIOLLITASORIGINAL CRACKERS 100 GR PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040377707",},
-  "BAGLEY CRIOLLITASTOST.CLAS.CRACK 195 GR PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CRIOLL", "ean": "7790040124509",},
-  "BAGLEY CEREAL C/SALVADO 169GR 3U PAQ AGR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "FAM", "ean": "7790040136243",},
-  "BAGLEY SALVADO 169 GR PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "FAM", "ean": "7790040136250",},
-  "ARCOR HOGARENAS 7 SEMILLAS CEREAL 189GR PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040136069",},
-  "ARCOR HOGARENAS C/SESAMO CEREAL 167 GR PAQUE.": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040136083",},
-  "ARCOR HOGARENAS MIX CEREAL 185GR C/U PAQ. X 3U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040136106",},
-  "ARCOR HOGARENAS SALVADO CEREAL 200 G.C/U PAQ.X 3 UN": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040132955",},
-  "ARCOR HOGARENAS SALVADO CEREAL 200 GRS. PAQUETE": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040132962",},
-  "ARCOR HOGARENAS. MIX CEREALES CEREAL 185 GR PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOGARENAS", "ean": "7790040136090",},
-  "BAGLEY KESITAS GALL SNACKS QUESO 250GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "KESITAS", "ean": "7790040144033",},
-  "BAGLEY KESITAS HORNEADAS SNACKS 125 GR CAJA": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "KESITAS", "ean": "7790040173200",},
-  "BAGLEY REX KESITAS SNACKS 75 GRBOLSA ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "KESITAS", "ean": "7790040003606",},
-  "BAGLEY REX ORIGINAL SNACK 225GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "REX", "ean": "7790040144125",},
-  "BAGLEY REX ORIGINAL SNACKS 125 GR CAJA": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "REX", "ean": "7790040719804",},
-  "BAGLEY REX ORIGINAL SNACKS BOL 75 GRARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "REX", "ean": "7790040003569",},
-  "ARCOR SALADIX CALABRESA SNACKS 100 GRS. CAJA ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790580716806",},
-  "ARCOR SALADIX CHIPS FUEGO 60GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790040133846",},
-  "ARCOR SALADIX DUO QUE.Y JAM.SNACKS 80 GR. CAJA ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790040374607",},
-  "ARCOR SALADIX JAMON SNACKS 100 GRS. CAJA ARG": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790580716707",},
-  "ARCOR SALADIX PIZZA SNACKS 100 GRS. CAJA": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790580697303",},
-  "SALADIX SALADIX SN PICANTE 100GR CAJA 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SALADIX", "ean": "7790040141254",},
-  "BAGLEY GALL TRAVIATA ORIGINAL CR 324GR PAQ AGR 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040144088",},
-  "BAGLEY TRAVIATA C/REX GALL CRACKER 288GR X3 PAQ AGR 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040143920",},
-  "BAGLEY TRAVIATA CRACKERS 108GR 5U PAQUETE 540G PAQ AGR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040144095",},
-  "BAGLEY TRAVIATA GALL CR C/ REX SAL ORIG 1U PAQUETE 96GR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040143937",},
-  "BAGLEY TRAVIATA GALL CR KESIT 1U PAQUETE 96GR": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040143944",},
-  "BAGLEY TRAVIATA.CRACKERS 108GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040144071",},
-  "TRAVIATA BAGLEY BALANCE CR 321GR X3U PAQ": {"empresa": "ARCOR", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TRAV", "ean": "7790040142763",},
-  "AGUILA ALFAJOR MINITORTA TRIPLE 69GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "AGUILA", "ean": "7790040133587",},
-  "AGUILA ALFAJOR.MINITORTA BROWNI 71.5GR TRPL PQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "AGUILA", "ean": "7790040133594",},
-  "AGUILA MINITORTA TRIPLE 70.5 GR 1U PAQ REGULAR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "AGUILA", "ean": "7790040133600",},
-  "B&N ALFAJOR NEGRO 50GR SPL PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BLCO/NGRO", "ean": "7790040141179",},
-  "BAGLEY B & N 3.0 ALFAJOR BLANCO 73.5 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BLCO/NGRO", "ean": "7790040991910",},
-  "BON O BON ALFAJORES MINI 19.5GR X6 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BON O BON", "ean": "7790040129764",},
-  "BON O BON NEGRO ALFAJOR 40 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "BON O BON", "ean": "7790040613706",},
-  "COFLER CHOCO CREAMY ALFAJOR TRIPLE 60GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCO CREAMY", "ean": "7790040150010",},
-  "CHOCOTORTA ALFAJOR TRIPLE 71.5GR PAQ 1UN BAGLEY": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOTORTA", "ean": "7790040150072",},
-  "COFLER ALFAJOR SPL MOUSSE 40GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "COFLER", "ean": "7790040143647",},
-  "COFLER BLOCK ALFAJOR SIMPLE 40.7GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "COFLER", "ean": "7790040143654",},
-  "COFLER BLOCK RELL.CHOC.ALF.TRIPLE 60 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "COFLER", "ean": "7790040659605",},
-  "COFLER BLOCK.ALFAJOR SIMPLE 40.7GR 6U PAQ 244.2G": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "COFLER", "ean": "7790040143630",},
-  "TATIN ALFAJOR TRIPLE 60 GRARG": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TATIN", "ean": "7790040405608",},
-  "TOFI ALFAJOR NEGRO 46 GRPAQ.X6 U.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TOFI", "ean": "7790040117143",},
-  "TOFI NEGRO ALFAJOR 46 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TOFI", "ean": "7790040116610",},
-  "TOFI TRIPLE BLANCO ALFAJOR 73 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TOFI", "ean": "7790040953703",},
-  "TOFI TRIPLE NEGRO ALFAJOR 73 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TOFI", "ean": "7790040484801",},
-  "AGUILA ALMENDRAS BAN C/CHOCOLAT 120GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "AGUILA", "ean": "7790580142384",},
-  "AGUILA BARRA MOUSSE BANADA160GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "AGUILA", "ean": "7790580131135",},
-  "AGUILA BARRA TRIFLE BANADA 160GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "AGUILA", "ean": "7790580131111",},
-  "AGUILA NUT OBLEA BANADA CHOC 105GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "AGUILA", "ean": "7790580147556",},
-  "AGUILA PASAS BAN CHOCOLATE 120G BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "AGUILA", "ean": "7790580142421",},
-  "ARCOR BV ALMENDRA BANADAS C/CHOCO. 120 GR BOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ARCOR", "ean": "7790580139438",},
-  "ARCOR CEREAL DE ARROZ BAN CHC 50GR BOL 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ARCOR", "ean": "7790580142414",},
-  "ARCOR MILK OBLE BANADA CHC 20GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ARCOR", "ean": "7790580144227",},
-  "ARCOR TURRON BANADO C/CHOCOLA.90 GR CAJA ARG": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ARCOR", "ean": "7790580392604",},
-  "ARCOR TWIT O BANADOS 20GR PAQ.1U REG.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ARCOR", "ean": "7790580132712",},
-  "BON O BON BLANCA OBLEA BANADA 30 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580346614",},
-  "BON O BON CUBANITOS RELLE.BAN.C/CHOCO. 78GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580146948",},
-  "BON O BON POSTRE RELL. BANA.C/CHO 260 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BON O BON", "ean": "7790580136352",},
-  "COFLER ALMENDRAS BAN C/CHOCO 100GR BOL 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580141714",},
-  "COFLER ALMENDRAS BAN C/CHOCO C/LECH 100GR BOL 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580141721",},
-  "COFLER BLANCO OBLEA BAN TRPL C/CHOCLIN 110GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580142513",},
-  "COFLER BLOCK BARRA MANI BAN CHC 45GR 1U PAQUETE": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580143800",},
-  "COFLER BLOCK XL OBLEA RELL BAN CHC 45GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580131562",},
-  "COFLER BOTONES D/CHOCO SEMIAMARG 100GR BOL 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580141745",},
-  "COFLER CHOCOLINA BARRA C REL 40 G PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580131531",},
-  "COFLER CHOCOLINAS BAN. BARRA 110GR PAQ. 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580146856",},
-  "COFLER CUBANITOS O BANADOS 29GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580121716",},
-  "COFLER CUBANITOS O BANADOS 29GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580121723",},
-  "COFLER CUBANITOS O BANADOS 29GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580123222",},
-  "COFLER PASAS BANAD C/CHOCO. 100GR BOL 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COFLER", "ean": "7790580141707",},
-  "COFLER GRAFFITI OBLEA BAN.RELLENA C/CHO. 45 GRPAQ.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GRAFFITI", "ean": "7790580111755",},
-  "COFLER GRAFFITI OBLEA BANA RELL.45GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GRAFFITI", "ean": "7790580123741",},
-  "HAMLET HAMLETON OBLEA BANADA 28GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "HAMLET", "ean": "7790580137656",},
-  "ARCOR PASAS BAN.C/CHO. 100 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O ARCOR", "ean": "7790580135942",},
-  "ROCKLETS 3 DESEOS REGULAR PAQUETE 120 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ROCKLETS", "ean": "7790580122652",},
-  "ROCKLETS BOLLS CEREAL BAN.C/CHO. 120 GRPAQ.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "ROCKLETS", "ean": "7790580118235",},
-  "AGUILA BOMBONES MENTA CAJA 210 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "AGUILA", "ean": "7790580107987",},
-  "AGUILA D´OR FRUTOS SECOS BAN.CHOC.BOL 120GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "AGUILA", "ean": "7790580136420",},
-  "ARCOR BOMBONES SURTIDO ESP 223GR CAJA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ARCOR", "ean": "7790580138370",},
-  "ARCOR EL KIOSCO EN CASA 246GR CAJA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ARCOR", "ean": "7790580131371",},
-  "BON O BON AGUILA BOMBON CAJA 18 U X 15 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580102517",},
-  "BON O BON BOMBON CHC 15 GR CAJA 18UN 270G": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580119065",},
-  "BON O BON BOMBON CHOCO C/LECHE CAJA 270GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580146368",},
-  "BON O BON BOMBON REGULAR 15 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "77958921",},
-  "BON O BON BOMBONES BOTA NAVIDAD 150GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580146924",},
-  "BON O BON REGULAR ED. ESP. BOLSA 15 GR C/U 7 U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580119164",},
-  "BON O BON SUPERBOLLS CHOC BCO POUCH 80 GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580135775",},
-  "BON O BON SURTIDO REGULAR BOMBONES CAJA 255 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "BON O BON", "ean": "7790580119126",},
-  "CABSHA BOCADO CHC 10GR 24UN CAJA 240G": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "CABSHA", "ean": "7790580132156",},
-  "ARCOR SELECCION BOMB SURTIDO 228.6GR CAJA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "SELECCION", "ean": "7790580131388",},
-  "ARCOR MANI BANADO MANI CH 35GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580128043",},
-  "ARCOR MANI COLOR CONF.C/CH. 80 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580106195",},
-  "ARCOR MANI CON CHOC. BLANCO 80GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580139223",},
-  "ARCOR MANI CON CHOCOLATE 80 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580106027",},
-  "ARCOR MANI CON CHOCOLATE BOLSA 100 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580136444",},
-  "ARCOR MANI.CROCANTE BAN.C/CHC 100GR BOLSA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ARCOR", "ean": "7790580141738",},
-  "COFLER BLOCK MANI C/CHOC BCO 100GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "COFLER", "ean": "7790580139780",},
-  "COFLER BLOCK MANI C/CHOCOLATE 100GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "COFLER", "ean": "7790580139797",},
-  "ROCKLETS CONFIT CHC MOMIA BOLSA 40GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580151560",},
-  "ROCKLETS CONFIT.CELESTE BOLSA 500 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580132583",},
-  "ROCKLETS EXTREME CHC CONF 20GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580120085",},
-  "ROCKLETS GRAGEAS CHOCOLATE BOLSA 40 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580327415",},
-  "ROCKLETS HALLOWEEN CH CONF 120GR CAJA 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580144876",},
-  "ROCKLETS LENTEJAS COLOR BOLSA 150 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580107635",},
-  "ROCKLETS MINI CONFITES C/CHOCO. 150 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580116583",},
-  "ROCKLETS MINI GRAGEAS C/CHOCO. 10 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "77942432",},
-  "ROCKLETS MINI GRAGEAS DE CHOCOLATE PAQUETE 120 GRS": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580418106",},
-  "ROCKLETS NAVIDAD GRAGEAS C/CHOCO. 120 GRBOLSA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580415808",},
-  "ROCKLETS PICANTE CHC CONF 20GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "ROCKLETS", "ean": "7790580120078",},
-  "ARCOR MILK C/SORP HUEVO PAQUETE 22 GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "ARCOR", "ean": "7790580133573",},
-  "ROCKLETS HUEVO DE CHOCOLATE 28GR PAS/NAV 1U S/SOR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "ROCKLETS", "ean": "7790580131517",},
-  "AGUILA EXTRA FINO CHC P/REPOST. 150GR TAB 1U PAQUETE": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "AGUILA", "ean": "7790580109882",},
-  "ARCOR CHOCO. MEDIO AMARGO PAQ. 80GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580104375",},
-  "ARCOR DUO SOLIDAS 95GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580133795",},
-  "ARCOR MILK RELLENA 12GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580133450",},
-  "ARCOR MILK RELLENA CHC 12GR PAQUETE 4UN 48G": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580135140",},
-  "ARCOR SOLIDAS 95GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580133634",},
-  "ARCOR SOLIDAS C/LECHE Y MANI 95GR 1U PAQ": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580133740",},
-  "ARCOR TAB SOLIDA CHC PAQUETE 80GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580102852",},
-  "ARCOR TAB SOLIDA CHC PAQUETE 80GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580102890",},
-  "ARCOR TAB SOLIDA CHC PAQUETE 80GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580103279",},
-  "ARCOR TABLETA SOLIDAS 50% CACAO 95GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ARCOR", "ean": "7790580133771",},
-  "BON O BON TABLETA CHC RELLENA 160GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "BON O BON", "ean": "7790580146047",},
-  "COFFLER AIR BLANCO TAB.AIREA. 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103415",},
-  "COFFLER AIR C/LECHE TAB.AIREA. 100 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103446",},
-  "COFLER AIR BLANCO TAB.AIREA. 100 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103453",},
-  "COFLER AIR BLANCO TAB.AIREA. 27 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103378",},
-  "COFLER AIR BLANCO TAB.AIREA. 27 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103385",},
-  "COFLER AIR C/ALMENDR.TAB.AIREA. 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103439",},
-  "COFLER AIR CHO.C/LEC.TAB.AIREA. 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580033408",},
-  "COFLER AIR CHOCO. C/ALMENDRAS 100 GRTAB.AIREA.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103477",},
-  "COFLER AIR CHOCOLATE MIXTO 100 GRTAB.AIREA.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103460",},
-  "COFLER AIR LECHE TAB.AIREA. 27 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103361",},
-  "COFLER AIR MIXTO TAB.AIREA. 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103422",},
-  "COFLER AIREADO BLANCO TAB.AIREA. 100 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790407049025",},
-  "COFLER BLOCK 300 C/LECHE Y MANI 300 GRTAB.SOLIDA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103743",},
-  "COFLER BLOCK C/MANI TAB.SOLIDA 170 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580105013",},
-  "COFLER BLOCK C/MANI TAB.SOLIDA 38 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "77953124",},
-  "COFLER BLOCK TAB.SOLIDA 110 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "77922120",},
-  "COFLER BLOCKAZO CHO.C/LEC.C/MANI 1000 GRTAB.SOLIDA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580115579",},
-  "COFLER BON O BON RELLENO BON O BON 67 GRTAB.AIREA.": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580115562",},
-  "COFLER C/LECHE MANI TAB.SOLIDA 170GR 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580132750",},
-  "COFLER C/LECHE TAB.SOLIDA 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103484",},
-  "COFLER C/LECHE Y ALMENDRAS TAB.SOLIDA 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580033507",},
-  "COFLER CHOCOLINAS TABL BLANCO 140GR 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580127336",},
-  "COFLER DULCE DE LECHE RELLENAS 38GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580132958",},
-  "COFLER ROCKLETS BLANCO C/ROCKLETS 55 GRTAB.SOLIDA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103514",},
-  "COFLER ROCKLETS TAB.SOLIDA 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580103521",},
-  "COFLER ROCKLETS TABL SOL 140GR 1UN PAQUETE": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580146092",},
-  "COFLER SUPREME LECHE TAB.RELLE. 55 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580014230",},
-  "COFLER TABLETA CHC 60%CACAO SOLIDA 100GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580141776",},
-  "COFLER TABLETA CHC SOLIDA 100GR PAQUETE 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580141752",},
-  "COFLER TABLETA CHC SOLIDA C/AVE 140GR PAQUETE 1UN": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580144005",},
-  "COFLER TRES PLACERES CH.AMA.BL.LEC. 55 GRTAB.SOLIDA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "COFLER", "ean": "7790580106560",},
-  "HAMLET BLANCO COOKIES SOLIDA 46GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HAMLET", "ean": "7794612066310",},
-  "HAMLET CHOCOLATE C/MANI TAB.SOLIDA 35 GR": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HAMLET", "ean": "7790580007355",},
-  "HAMLET LECHE MANI ALMENDRA CEREAL 45 GRTAB.SOLIDA": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HAMLET", "ean": "7794612065719",},
-  "HAMLET SOLIDAS LECH Y COOK 43GR PAQ 1U": {"empresa": "ARCOR", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HAMLET", "ean": "7794612065917",},
-  "TOP LINE S/AZUCAR 6.7 GR MENTA 4 TABL.PAQ.": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "77916426",},
-  "TOP LINE S/AZUCAR ORIG.MINT5 24 GR GREENMINT 12 TABL.CAJA": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580102432",},
-  "TOP LINE SEVEN TURBO MINT 20 CHI.CONF. ADU. 2.5G C/U PT 50GR": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580138547",},
-  "TOP LINE SEVEN ULTRA GREEN MINT 12TABL. ADU. PQ. 24GR 1UN": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580120702",},
-  "TOP LINE SEVEN ULTRA S/AZUCAR DIET 12U.TABL 24 GR CAJA": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580120573",},
-  "TOPLINE SEVEN CONFITADO 10P. TURBO MINT ADU. CJ.25GR 1UN": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580146818",},
-  "TOPLINE SEVEN TURBO MINT 50CHI.CONF. ADU. 2.5G CU CJ. 125GR": {"empresa": "ARCOR", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "TOPLINE", "ean": "7790580133931",},
-  "CLIGHT DIET LIMONADA MARACUYA SOBRE 7.5 P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201733834",},
-  "CLIGHT ED LIM POMELADA HIBISCUS SIN AZUCARES SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622202359934",},
-  "CLIGHT LIMONADA ARANDANOS DIET SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622202236846",},
-  "CLIGHT LIMONADA ROSA S/AZUCARES SOBRE 7.5G P/1 L.": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201682026",},
-  "CLIGHT NAR/DUR S/A VITC+D SOBRE 7.5G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201702717",},
-  "CLIGHT POLVO ANANA SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201702625",},
-  "CLIGHT POLVO DIET MANZANA DELI. SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703080",},
-  "CLIGHT POLVO NARA MANGO DIET SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201702687",},
-  "CLIGHT POLVO PERA SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703202",},
-  "CLIGHT POLVO S/A LIMONADA VITC+D SOBRE 8GR P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201702656",},
-  "CLIGHT POLVO S/A MANDARINA SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201704148",},
-  "CLIGHT POLVO S/A NARANJA VIT CY D SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703110",},
-  "CLIGHT PVO S/A MANZANA VERDE SOBRE 7.5GR P/1LT": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703059",},
-  "CLIGHT PVO S/A NARANJA DULCE VIT C Y D SOBRE 7.5G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703141",},
-  "CLIGHT PVO S/A POMELO AMARILLO VIT C Y D SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703233",},
-  "CLIGHT PVO S/A POMELO ROSADO VIT C Y D SOBRE 8G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "CLIGHT", "ean": "7622201703172",},
-  "TANG ART.POLVO LIMONA.DU.SOBRE 18 GRP/1 LT": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622300868697",},
-  "TANG GALACTICO ED. LIM POLVO FRUTAL REG SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622202311482",},
-  "TANG POLV POM ROSADO REG SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735746",},
-  "TANG POLVO PERA REG SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201745738",},
-  "TANG POLVO REG ANANA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201745967",},
-  "TANG POLVO REG DURAZNO SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201745936",},
-  "TANG POLVO REG FRUTILLA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201746490",},
-  "TANG POLVO REG LIMONADA DULCE SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735685",},
-  "TANG POLVO REG MANDARINA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201733865",},
-  "TANG POLVO REG MANZANA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201705992",},
-  "TANG POLVO REG MULTIFRUTA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735715",},
-  "TANG POLVO REG NAR/DURAZNO SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201745707",},
-  "TANG POLVO REG NARA/BANANA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735777",},
-  "TANG POLVO REG NARA/MANGO SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735371",},
-  "TANG POLVO REG NARANJA DULCE SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201735340",},
-  "TANG POLVO REG NARANJA LIMA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201746018",},
-  "TANG POLVO REG NARANJA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201705961",},
-  "TANG POLVO REG UVA SOBRE 15G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "TANG", "ean": "7622201746117",},
-  "VERAO POLVO ANANA REG SOBRE 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "VERAO", "ean": "7622201717506",},
-  "VERAO POLVO MANZANA REG SOB. 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "VERAO", "ean": "7622201717445",},
-  "VERAO POLVO NAR/DURAZNO REG SOB. 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "VERAO", "ean": "7622201717476",},
-  "VERAO POLVO NARANJA REG SOB. 7G P/1L": {"empresa": "MONDELEZ", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "VERAO", "ean": "7622201717414",},
-  "MONDELEZ CEREALITAS CACAO D.S. 170GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREALITAS", "ean": "7622202241505",},
-  "MONDELEZ CEREALITAS GRANOLA D.S. 170GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CEREALITAS", "ean": "7622202241567",},
-  "MDLZ TERRABUSI.DUQUESA GALL DUL. REL 115GR PAQ 3U 345GR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DUQUESA", "ean": "7622202218729",},
-  "MONDELEZ TERRABUSI DUQUESA DUL.RELLE. 115 GRPAQUETE": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DUQUESA", "ean": "7622300742645",},
-  "MONDELEZ TERRABUSI MELBA DUL.RELLE. 120 GRPAQUETE": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELBA", "ean": "7622300829728",},
-  "TERRABUSI MELBA ANGRY BIRDS DU.REL.PAQ.120GR C/UPACK X 3 U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MELBA", "ean": "7794600004539",},
-  "MONDELEZ INTL.MILKA GALL. REL C/MOUS 124GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MILKA", "ean": "7622202210051",},
-  "MONDELEZ INTL.MILKA GALL. REL C/MOUS 124GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MILKA", "ean": "7622202210075",},
-  "MONDELEZ OREO CHOCOLATE. DUL.RELLE. PAQ 118GR 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202049033",},
-  "MONDELEZ OREO D.R. 118GR 3U 354G PQ AGR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201735258",},
-  "MONDELEZ OREO D.R. 118GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201735296",},
-  "MONDELEZ OREO DUL.REL. 182.5GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201735821",},
-  "MONDELEZ OREO GALLETAS DR 258GR PAQ AGR 1UN X4": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202317187",},
-  "MONDELEZ OREO GALLETAS FRUT/CACAO DUL RELL 118GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202049057",},
-  "MONDELEZ OREO GOLDEN GAL DUL REL 354GR PAQ AGR X3 118G 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201806538",},
-  "MONDELEZ OREO MINI DUL.RELLE 50GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201761288",},
-  "MONDELEZ OREO MINI. GALLETAS DUL RELL 150 BOL 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202219337",},
-  "MONDELEZ OREO SIN GLUTEN GALL DR 95GR PAQUETE 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622202038099",},
-  "MONDELEZ OREO VAINILLA GOLDEN 118GR PAQ.DU.RE 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201806552",},
-  "OREO BAADAS. CHOCOLATE BSA 119GR 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201740368",},
-  "OREO BANADAS CHC MILKA BCO BSA 119GR 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OREO", "ean": "7622201745608",},
-  "MONDELEZ PEPITOS C/CHISPAS DS 119 GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PEPITOS", "ean": "7622201735906",},
-  "MONDELEZ PEPITOS MINI. DULCE SECA 50GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PEPITOS", "ean": "7622201740399",},
-  "MONDELEZ PEPITOS. DU. SEC 119GR 3UN 357G PAQ AGR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PEPITOS", "ean": "7622201735883",},
-  "MODELEZ TERRABUSI ANILLOS D. S. 170GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201808884",},
-  "MONDELEZ LINCOLN CHOCOLATE DUL.SECA 153 GR PAQUETE": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622300742676",},
-  "MONDELEZ LINCOLN CLASICA DUL. SEC 219GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201735319",},
-  "MONDELEZ LINCOLN CLASICAS DUL SEC 153GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201386719",},
-  "MONDELEZ LINCOLN COCO. DUL SEC 153GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622300742713",},
-  "MONDELEZ TERRABUSI ANILLOS CLASIC 300GR BOL.DU.SE.": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201504007",},
-  "MONDELEZ TERRABUSI BOCA DE DAMA D.S. 170GR BOL": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201808860",},
-  "MONDELEZ TERRABUSI C/CHIPS 144GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201385279",},
-  "MONDELEZ TERRABUSI MANON DULC. SECA 182GR PAQ. 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201385255",},
-  "MONDELEZ TERRABUSI MIEL GALLE DUL.SEC 120GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622202220579",},
-  "MONDELEZ TERRABUSI SCONS DUL SEC 160GR BOLSA": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201491611",},
-  "MONDELEZ TERRABUSI VAINILLA GALL DUL.SEC 120GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622202220555",},
-  "MONDELEZ TERRABUSI VARIED.MIX DU.SE. 590GR BOL": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201745585",},
-  "MONDELEZ.TERRABUSI VARIED.MIX DU.SE. 390GR BOL": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201745561",},
-  "TERRABUSI HABANITOS GALLETITA BAN.C/CHO. 60GRBOLSA": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622300335076",},
-  "TERRABUSI LINCOLN CLASICA. D.S. 3U 153GR PQ AGR 459G": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201745547",},
-  "TERRABUSI VARIEDAD CHC DUL.SEC 300GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201503987",},
-  "TERRABUSI VARIEDAD D. S. 170GR BOLSA 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201745639",},
-  "TERRABUSI VARIEDAD DORADA DUL.SEC 300GR BOL 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TERRABUSI", "ean": "7622201503963",},
-  "MONDELEZ CEREALITA CLASICA INT 212GR PAQ 3U 636G": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201745905",},
-  "MONDELEZ CEREALITA CLASICAS INTEG 212GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201736033",},
-  "MONDELEZ CEREALITAS SALV CER 208GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201745981",},
-  "MONDELEZ CEREALITAS SALVA. CER 208GR 3U 624GR PAQ AGR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201746032",},
-  "MONDELEZ CEREALITASTOST.DE ARROZ 160 GRPAQ.CEREAL": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CEREALITAS", "ean": "7622201753061",},
-  "MONDELEZ CLUB.SOCIAL ORIGINAL 144 GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CLUB SOCIAL", "ean": "7622202293740",},
-  "MONDELEZ CLUB.SOCIAL ORIGINAL 144 GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CLUB SOCIAL", "ean": "7622300990749",},
-  "MONDELEZ INTL CLUB SOCIAL HORNEADA JAMON PAQ. 23.5 GR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CLUB SOCIAL", "ean": "7622210692245",},
-  "MONDELEZ INTL CLUB SOCIAL HORNEADAS ORIGINAL 24 GR PAQ.": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CLUB SOCIAL", "ean": "7622300990732",},
-  "MONDELEZ INTL CLUB SOCIAL JAMON 23.5 GR X6U PQ AGR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CLUB SOCIAL", "ean": "7622210691835",},
-  "NABISCO CLUB SOCIAL JAMON SNACKS 25 GR C/U X 8 U.PAQ": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "CLUB SOCIAL", "ean": "7622300725174",},
-  "TERRABUSI EXPRESS CLASC CR 103GR PAQ AGR 3U 309GR": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "EXPRESS", "ean": "7622201388485",},
-  "TERRABUSI EXPRESS CLASICA CRACKER 103GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "EXPRESS", "ean": "7622201388461",},
-  "MILKA ALFAJOR TRIPLE 70 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "77903778",},
-  "MILKA MINI ALFAJORES MOUSSE SPL 19GR 6U BOLSA 114G": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622202220074",},
-  "MILKA MOUSSE LECHE 42 GRPAQ.X 6 U.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622300759490",},
-  "MILKA MOUSSE LECHE ALFAJOR 42 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622300759506",},
-  "MILKA MOUSSE TRIPLE ALFAJOR 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "77903785",},
-  "MILKA MOUSSE TRIPLE BLANCO ALF. 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622300457303",},
-  "MILKA TORTA OREO ALF.TRIPLE 61 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "MILKA", "ean": "7622300835620",},
-  "OREO ALFAJOR TRIPLE. 56GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "OREO", "ean": "77976307",},
-  "PEPITOS CON CHIPS Y MOUSSE TRIPLE PAQUETE 57 GR UN.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "PEPITOS", "ean": "77915481",},
-  "SHOT ALFAJOR MANI BAN CHC SIMPLE 44GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "SHOT", "ean": "7622202304705",},
-  "SHOT ALFAJOR MINI SIMPLE 19GR BOLSA 6UN 114G": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "SHOT", "ean": "7622202223372",},
-  "SHOT ALFAJOR TRIPLE 60 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "SHOT", "ean": "77956699",},
-  "TERRABUSI ALFAJOR 50 GRPAQ. X6 U.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "7622300742584",},
-  "TERRABUSI ALFAJOR CHOCOLATE 50 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "77939234",},
-  "TERRABUSI ALFAJOR S/GLUT SPL BAN CHC 55GR PAQ 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "7622202296291",},
-  "TERRABUSI X 3 DCE.DE LE.ALFAJOR 70 GRTRIPLE": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "77903792",},
-  "TERRABUSI X 3 TORTA ALFAJOR 70 GRTRIPLE": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TERRABUSI", "ean": "77903860",},
-  "TITA NEGRO ALFAJOR RELL.LIMON 36 GRARG": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TITA", "ean": "77908308",},
-  "MILKA BIS OBLEA RELL.CUB.CHOCO. 105.6GR X 16U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "MILKA", "ean": "7622210788207",},
-  "MILKA BIS OREO PAQ. 105.6 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "MILKA", "ean": "7622210719829",},
-  "MILKA CHOCO PAUSE.OREO OBLEA BAN.CHC 45GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "MILKA", "ean": "7622201492465",},
-  "MILKA CHOCO PAUSE OBLEA BAN.CHO.C/LEC.RELL.45 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "MILKA CHOCO PAUSE", "ean": "7622201492717",},
-  "RHODESIA MINI OBLEAS 60 GRBOLSA": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "RHODESIA", "ean": "7622300335090",},
-  "RHODESIA OBLEA BAN.C/CHO. 22 GRBOLSA": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "RHODESIA", "ean": "77995681",},
-  "RHODESIA OBLEA BANADA 22 GRPAQ.X4 U.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "RHODESIA", "ean": "7622300742935",},
-  "TERRABUSI SNACKY CUBANITOS BAN.C/CHO. 60 GRBOLSA": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "TERRABUSI", "ean": "7622300335052",},
-  "TITA GALLE.BAN. 18 GRPAQ. X 5 U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "TITA", "ean": "7622201803285",},
-  "TITA O BANADOS 19GR PAQ 1U REGULAR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "TITA", "ean": "77976291",},
-  "MILKA OREO BOMBON 19G BOLSA 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "MILKA", "ean": "77971630",},
-  "CADBURY C/YOGHURT. NUEZ TAB. RELL.29GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818654",},
-  "CADBURY CHOCOLATE CON ALMENDRAS X82GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201807405",},
-  "CADBURY INTENSE 50% CACAO 25GR TAB.SOLIDA 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818609",},
-  "CADBURY INTENSE SOLIDAS 50% CACAO PAQ 162GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201800505",},
-  "CADBURY TRES SUENOS.TAB. SOLIDA 82GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818739",},
-  "CADBURY TRES.SUENOS. 25GR TAB.SOLIDA 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818579",},
-  "CADBURY YOGHURT FRUTILLA RELL 82 GRS PAQUETE 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818715",},
-  "CADBURY YOGURTH TABL RELL FRUTILLA PAQ 162GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "CADBURY", "ean": "7622201818692",},
-  "MILKA . TAB CHC SOLIDA 20GRS PAQUETE 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210795625",},
-  "MILKA ALMENDRA TABLETA RELLENA 55 GR PAQ.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210745620",},
-  "MILKA ALMENDRAS TAB.SOLIDA 155 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300990152",},
-  "MILKA BLANCO C/D.D.LEC.TAB.RELLE. 67.5 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300844967",},
-  "MILKA C/LECHE TAB.SOLIDA 150 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300990114",},
-  "MILKA CASTANA TAB. SOLIDA 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210745293",},
-  "MILKA CASTANAS C/CARAMELOTAB.SOLIDA 155 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300990183",},
-  "MILKA CHOCO.C/LECHE TAB.SOLIDA 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210745224",},
-  "MILKA CHOCOLATE C/DULCE DE LECHE 67.5 GRTAB.RELLE.": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300844943",},
-  "MILKA COOKIESTABLETA CHC SOLIDA 100GR PAQ 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201424848",},
-  "MILKA LEGER COMBINADO TAB AIREA. LECHE 110GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201812775",},
-  "MILKA LEGER COMBINADO TAB.AIREA. LECHE 50GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201818951",},
-  "MILKA LEGER LECHE CON ALMENDRAS TAB AIREA. LECHE 110GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201812805",},
-  "MILKA LEGER LECHE TAB AIREA. LECHE 110GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201812744",},
-  "MILKA LEGER TAB.AIREA. LECHE 50GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201818937",},
-  "MILKA LEGER TAB.AIREA. LECHE CON ALMENDRAS 50GR 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622201818975",},
-  "MILKA LILA GO OREO PAQ. 37 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210828606",},
-  "MILKA MAND/KARAM TAB.RELL CHOC 300GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210732507",},
-  "MILKA MMMAX BUBBLY TAB AIREADO 250GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300757717",},
-  "MILKA NEGRO C/D.D.LEC.TAB.RELLE. 135 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300846565",},
-  "MILKA OREO CH.BLANCO TAB.SOLIDA 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210745132",},
-  "MILKA OREO CHOCOLATE BLANCO 155 GRTAB.SOLIDA": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622300990213",},
-  "MILKA OREO TAB. SOLIDA 20GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210795908",},
-  "MILKA STRAWB CHEESECAK TAB.RELL 300GR PAQ 1U": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210678171",},
-  "MILKA SWING TAB.SOLIDA 300 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "9012200872739",},
-  "MILKA TAB CHC AIREADA C.LECHE 25GR 1UN PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202322150",},
-  "MILKA TAB CHC AIREADA COMBINADO 25GR 1UN PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202322181",},
-  "MILKA TABLETA CHC AVELLANAS TAB. SOL 95GR 1UN PAQUETE": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202257599",},
-  "MILKA TABLETA CHC RELLENA 29GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202322068",},
-  "MILKA TABLETA CHC RELLENA 29GR PAQUETE 1UN": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622202322129",},
-  "MILKA TABLETA DE CHOCOLATE BLANCO 55 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MILKA", "ean": "7622210745583",},
-  "SHOT BLOQUE TAB.SOLIDA 35 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SHOT", "ean": "77914217",},
-  "SHOT C/LECHE Y MANI TAB.SOLIDA 170 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SHOT", "ean": "7622300424084",},
-  "SHOT C/MANI TAB.SOLIDA 90 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SHOT", "ean": "7791249451656",},
-  "SHOT CHOCOLAE C/MANI TAB.SOLIDA 35 GR 1U PAQ": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SHOT", "ean": "77983992",},
-  "TOBLERONE TAB.SOLIDA 100 GR": {"empresa": "MONDELEZ", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TOBLERONE", "ean": "7614500010013",},
-  "BELDENT CHI. TABLETA ADU. S/AZ. 6 CHI. PQ. 10GR 1UN": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969101",},
-  "BELDENT FRESH SPARKS SANDIA 6CHI.TABL. ADU. PQ. 10GR 1UN": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77987686",},
-  "BELDENT FRUTILLA S/AZ. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969118",},
-  "BELDENT INFINIT 7 BLUEBERRY CHIC. TABL. CJ. 13.3GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201448325",},
-  "BELDENT INFINIT CITRUS 7 CHIC. TABL. CJ. 13.3GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201448288",},
-  "BELDENT INFINIT CITRUS CHI. 14 TABL. DIET CJ. 26.6GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201457426",},
-  "BELDENT INFINIT MENTA 7U PQ. 13.3GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201421496",},
-  "BELDENT INFINIT MENTA DIET 14 TABL. CJ. 26.6GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201457334",},
-  "BELDENT INFINIT SPEARMINT 14 TABL. CJ. 26.6 GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201457396",},
-  "BELDENT INFINIT SPEARMINT 7 TABL. CJ. 13.3 GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201448226",},
-  "BELDENT INFINITE 14 CHI. TABL. BLUEBERRY MINT DIET CJ.26.6GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622201457457",},
-  "BELDENT MANDARINA FRESH SPARKS ADU. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77981844",},
-  "BELDENT MENTA FUERTE S/AZ. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969088",},
-  "BELDENT MENTA S/AZ. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969071",},
-  "BELDENT MENTOL S/AZ. 6 TABL. PQ. 10GR": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "77969095",},
-  "BELDENT TROP. FRESH SPARKS 6 TABL. ADU. PQ. 10GR 1UN": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "BELDENT", "ean": "7622202273131",},
-  "BUBBALOO 5GR T.FRUTTI 60U CAJA C.GLOBO": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "INFANTILES", "marca": "BUBBALOO", "ean": "7622210964458",},
-  "BUBBALOO 5GR UVA 60U CAJA C.GLOBO": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "INFANTILES", "marca": "BUBBALOO", "ean": "7622210965134",},
-  "BUBBALOO CHIC. BOMBA FRUTILLA 5GR C/U CJ. 60UN": {"empresa": "MONDELEZ", "categoría": "Gums", "subcategoría": "INFANTILES", "marca": "BUBBALOO", "ean": "7622210965035",},
-  "RINDE DOS 1+1 POLVO MANZANA DIET SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908404763",},
-  "RINDE DOS ANANA BAJAS CAL SOBRE 13G P/2LT": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908401588",},
-  "RINDE DOS LIMON DIET SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908401540",},
-  "RINDE DOS MIX FRUTAL POLVO BAJAS CAL. SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908400536",},
-  "RINDE DOS NAR/MANGO POLVO BAJAS CAL SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908404152",},
-  "RINDE DOS PERA POLVO BAJAS CAL. SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908401847",},
-  "RINDE DOS POLVO 1+1 NARANJA DIET SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908404756",},
-  "RINDE DOS POLVO DIET NARANJA SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908400529",},
-  "RINDE DOS POLVO DURAZNO BAJAS CAL. SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908400543",},
-  "RINDE DOS POLVO FRUTILLA DIET SOBRE 13G P/2LT": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908401526",},
-  "RINDE DOS POLVO LIMON 1+1 DIET SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908404770",},
-  "RINDE DOS POLVO MANZANA DIET SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908400567",},
-  "RINDE DOS POLVO NAR/BANA BAJAS CAL. SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908400987",},
-  "RINDE DOS POLVO NARANJA DURAZNO BAJAS CAL. SOBRE 13G P/2L": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908404169",},
-  "RINDE DOS POLVO POMELO ROSADO DIET SOBRE 13G P/2LT": {"empresa": "RESTO", "categoría": "Beverages", "subcategoría": "Pbs", "marca": "RINDE DOS", "ean": "7730908402578",},
-  "9 DE ORO ANILLITOS DUL.SEC VAINILLA DUL.SEC.BOL120G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180136602",},
-  "9 DE ORO ANILLITOS DUL.SEC.CHOCO DUL.SEC.BOL120G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180136626",},
-  "9 DE ORO ANILLITOS DUL.SEC.COCO BOL120G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180136619",},
-  "9 DE ORO ANILLITOS DULCE.SECA VAIN BOL180G 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180143464",},
-  "9 DE ORO OBLEAS CHOCO/NARA DUL.RELL. PAQUETE 100 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180133274",},
-  "9 DE ORO PEPAS MEMBRILLO INTEG. PAQ.140GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180143266",},
-  "M CANUELAS 9 DE ORO CKIE C/CHIP 120GR BOL.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180138514",},
-  "M CANUELAS 9 DE ORO COOKIE C/CHIP 120GR PAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180138491",},
-  "M CANUELAS 9 DE ORO COOKIE C/CHIP 120GR PAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180138507",},
-  "M. CANUELA 9 DE ORO PEPAS 500GR BOL DU.SE.1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180143273",},
-  "M.CANUELAS 9 DE ORO AVENA C/MIEL DU.SE. 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180130761",},
-  "M.CANUELAS 9 DE ORO AVENA C/PASAS DU.SE. 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180130754",},
-  "M.CANUELAS 9 DE ORO OBLEAS FRUTILLA DUL. RELL. PAQ. 100GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180132994",},
-  "M.CANUELAS 9 DE ORO OBLEAS RELLENAS PAQUETE 100 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180132932",},
-  "M.CANUELAS 9 DE ORO PEPAS DU.SE. 350GR BOL.1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180143280",},
-  "M.CANUELAS 9 DE ORO PEPAS MEMBRILLO DUL.SECA BOLSA 200GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180133502",},
-  "M.CANUELAS 9 DE ORO SCONS LIMON DULCE SECA 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180009524",},
-  "M.CANUELAS 9DE ORO VAIN.D.R BANANA BOL.120GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180138750",},
-  "M.CANUELAS 9DE ORO VAIN.DUL.RELL.FRUT BOL.120GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180138743",},
-  "M.CANUELAS.9DE ORO VAIN FRUT D.R BOL.120GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180139986",},
-  "M.CANUELAS9 DE ORO BIZ CARA SUCIA DULC SECA 200GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180143587",},
-  "M.CANUELAS9 DE ORO BIZ DULCE SECA 100GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792200000036",},
-  "M.CANUELAS9 DE ORO BIZC.AGRI.DULCE SECAPAQ.420 GR60G.GR.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792200001125",},
-  "M.CANUELAS9 DE ORO BIZC.AZUC.DULCE SECA 210 GRSPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792200000319",},
-  "M.CANUELAS9 DE ORO CUAD.AGRI.DULCE SECA 200 GRBOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792200000128",},
-  "M.CANUELAS9 DE ORO GRANOL. DUL SEC 200GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792180140814",},
-  "M.CANUELAS9 DE ORO SCONCITOS DULCE SECAPAQ.200 GRARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "9 DE ORO", "ean": "7792200000791",},
-  "BAUDUCCO GALL. DUL SEC COOK C/CHIPS 60GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962071152",},
-  "BAUDUCCO GALL. DUL SEC COOK C/CHIPS 60GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BAUDUCCO", "ean": "7891962071169",},
-  "BIMBO DULCE SECA VAINILLAS148 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BIMBO", "ean": "7793890258639",},
-  "BIMBO VAINILLAS DULCE SECA 74GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BIMBO", "ean": "7793890258684",},
-  "BIMBO VAINILLAS GALL. DUL.SECA 444GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BIMBO", "ean": "7793890258646",},
-  "DONUTS GALLE.VAI.BAN.C/CHO.PAQ. 78 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BONAFIDE", "ean": "7792360071518",},
-  "BRIOSH VAINILLAS DULCE SECA 148GR. PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "BRIOSH", "ean": "7793890258592",},
-  "CAPRI BISCUITS VAIN DULCE SECA 105GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CAPRI", "ean": "7793450000999",},
-  "CHOCMAN MINITORTA BLACK BAN CHC 68GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCMAN", "ean": "7792360096580",},
-  "CHOCMAN MINITORTA RELLENA C/D.D.LECHE 35 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "CHOCMAN", "ean": "7792360096634",},
-  "DALE BLACK DUL.RELLE.115 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DALE", "ean": "7798113152206",},
-  "DALE CHOCOLATE/BANANA DUL.RELLE.75 GRS. PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DALE", "ean": "7798113159427",},
-  "DALE MARIA VAINILLA DULCE SECA 145 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DALE", "ean": "7798113151599",},
-  "DILEXIS DALE SURTIDO POTE 300 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DALE", "ean": "7798113152183",},
-  "PEPSICO DALE CHOCOLATE DUL.RELLE. 81 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DALE", "ean": "7798113159892",},
-  "PEPSICO DALE FRUTILLA DUL.RELLE. 81 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "DALE", "ean": "7798113151261",},
-  "CACHAFAZ INTEGRAL AVE.MIEL DULC SEC 170 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128002145",},
-  "CACHAFAZ INTEGRAL AVE.PASA DE UVA D.S. 225 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128000677",},
-  "CACHAFAZ INTEGRAL AVEN.C/CHIP.CHOC.D.S. 225 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128000691",},
-  "CACHAFAZ INTEGRAL GRAN.C/AVENA/ALM/MANI 225 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128000707",},
-  "CACHAFAZ INTEGRAL HAR.INT.ALGARRO.D.S. 225 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128000684",},
-  "CACHAFAZ ORGANICAS AVENA&MIEL DUL.SECA PAQ.170GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "EL CACHAFAZ", "ean": "7798128002138",},
-  "GRANIX FRUTIGRAN C/SEM.SES-AM.Y GIRASD.SECA 260 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045825401",},
-  "GRANIX FRUTIGRAN C/SEMI.DE CHIA/LINO DU.SECA 240 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045825395",},
-  "GRANIX FRUTIGRAN SALV.AVENAPAS.DE UVA 250 GRS.DU.SE.PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045001188",},
-  "GRANIX FRUTIGRAN SALV.AVENAPAS.DE UVA 500 GRS.DU.SE.PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045001218",},
-  "GRANIX FRUTIGRAN SALVADO DULCE SECA 250 GRS.PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045001195",},
-  "GRANIX FRUTIGRAN SALVADO DULCE SECA 500 GRS.PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "FRUTIGRAN", "ean": "7790045001201",},
-  "JORGITO DULCE SECA CHIPS PAQUETE 240 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "JORG/JLIN", "ean": "7790957001214",},
-  "JORGITO DULCE SECA CHIPS PAQUETE 60 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "JORG/JLIN", "ean": "7790957001238",},
-  "JORGITO DULCE SECA CHOCOLATE PAQUETE 240 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "JORG/JLIN", "ean": "7790957001115",},
-  "JORGITO DULCE SECA CHOCOLATE PAQUETE 60 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "JORG/JLIN", "ean": "7790957001139",},
-  "JORGITO DULCE SECA LIMON PAQUETE 120 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "JORG/JLIN", "ean": "7790957001023",},
-  "JORGITO DULCE SECA LIMON PAQUETE 60 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "JORG/JLIN", "ean": "7790957001030",},
-  "LIA MACUCAS CHOCOLATE DUL.RELLE.85 GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MACUCAS", "ean": "7790040146877",},
-  "LIA MACUCAS GALL DUL RELL 110GR PAQ SPL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MACUCAS", "ean": "7790040145337",},
-  "OKEBON MOLINO NATURAL 10SEMILLAS DUL.SECA PAQ. 231GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MOLINO NATURAL", "ean": "7790263119658",},
-  "OKEBON MOLINO NATURAL AVEN/PASAS 232 GR PAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MOLINO NATURAL", "ean": "7790263119641",},
-  "OKEBON MOLINO NATURAL NJA&CHISPASP DULC.SECPAQ.238G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "MOLINO NATURAL", "ean": "7790263119665",},
-  "DON SATUR BIZCOCHO DULCE DULCE SECA 200 GRBOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O DSATUR", "ean": "7795735000335",},
-  "DON SATUR NEGRITOS DULCE SECA 200 GRBOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O DSATUR", "ean": "7795735000342",},
-  "DON SATUR PEPAS C/MEMBRILLO DULCE SECA 300 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O DSATUR", "ean": "7795735600924",},
-  "HOJALMAR L.LARGUITA DULCE SECA 150 GRS.BANDEJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000159",},
-  "HOJALMAR L.LARGUITA DULCE SECA250 GRS. BANDEJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000142",},
-  "HOJALMAR LARGUITA DULCE SECA 150GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000937",},
-  "HOJALMAR LARGUITA DULCE SECA 150GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000944",},
-  "HOJALMAR MATERO BIZCO. HOJAL.AZUCBOLSA 180 GR ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000593",},
-  "HOJALMAR PALMERAS DULCE SECA150 GR BANDE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000364",},
-  "HOJALMAR PALMERAS DULCE SECA150 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000913",},
-  "HOJALMAR TRIANGULI. DULCE SECA 150 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000920",},
-  "HOJALMAR TRIANGULI. DULCE SECA 150 GRS.BANDEJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000128",},
-  "HOJALMAR TRIANGULIT DULCE SECA250 GRS. PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O HOJALMAR", "ean": "7793450000111",},
-  "BAKERY CRISTAL GALL TRIANG D. S. HOJALDRE PAQ 150GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793450001217",},
-  "BAKERY CRISTAL GALL TRIANG D. S. HOJALDRE PAQ 150GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793450001231",},
-  "CARICIAS MANTECADOS DUL.SECA 350 GR FLOW PACK": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798010260295",},
-  "CARICIAS PEPAS DUL.SECA 350 GR BOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798010260301",},
-  "CARICIAS SURTIDAS DULCE SECA600 GR BOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798010260028",},
-  "CARICIAS VAINILLA DULCE SECA 155 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798010260110",},
-  "CARICIAS VAINILLAS DULCE SECA400 GRS. PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798010260035",},
-  "CILO BIZCOCHO AZUCARADO DUL.SECA 200 GR. BOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7795643000458",},
-  "DEUBEL COQUITOS DULCE SECA 200 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791696011137",},
-  "DEUBEL PALMERITA DE MANTEC.DUL.SECA 200 GRS. BANDEJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791696008014",},
-  "DEUBEL PEPAS DE MEMBRILLO DULCE SECA 220 GRBANDEJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791696011120",},
-  "DEUBEL SCONS C/FRUTAS DULCE SECA 180 GRBANDEJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791696008687",},
-  "DEUBEL SCONS CLASICOS DULCE SECA 180 GRBANDEJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791696008694",},
-  "DIMAX PEPAS DE BATATA S/GLUT.DUL.SECA 100 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798144940162",},
-  "DIMAX PEPAS DE MEMBRILLO S/GLUT.DUL.SECA 100 GR BOL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798144940148",},
-  "DONINAS GALL C/COCO Y CHIPS.DDL D.S. 200GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798359330086",},
-  "DULCE MAMA GALL. DUL. SEC PEPAS 350GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7792180138613",},
-  "DULCE MAMA GALL. DULC. SEC PEPAS 200 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7792180138620",},
-  "FIRENZE MINIPAMELA LIMON DULCE SECA 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568000696",},
-  "FIRENZE MINIPAMELA SCONES DULCE SECA 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568000849",},
-  "FIRENZE PAMELA C/CHIPS CHO.DU.SE. 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568000702",},
-  "FIRENZE PAMELA CHOCOLATE DUL.RELLE. 97 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568000962",},
-  "FIRENZE PAMELA CHOCOLATE DUL.SEC 180GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568005615",},
-  "FIRENZE PAMELA COCO DULCE SECA 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568000689",},
-  "FIRENZE PAMELA LIMON DULCE SECA 180 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568000719",},
-  "FIRENZE PAMELA VAINILLA DUL.RELLE. 97 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568000955",},
-  "FIRENZE PAMELAS GALLETA CHO DUL. SEC. 170GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568006100",},
-  "GAONA CRUNCHIPS GALL MINI D. S. C/CHIP PAQ 90GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126074281",},
-  "GAONA CRUNCHIPS GALL.MINI D. S. C/CHIP PAQ 72GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126074199",},
-  "GAONA CRUNCHIPS. DUL SEC C/CHIP 132GR 1UN PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126074205",},
-  "GAONA CRUNCHIPS.MANI DUL SEC 132GR 1U PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126074441",},
-  "GAONA GALL ANILLOS COCO DULCE SECA BOL 220GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126073789",},
-  "GAONA MANTECADITAS DULCE SECA 220GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126073765",},
-  "GAONA RECREO SURTIDAS DUL.SECA 300GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126073857",},
-  "GAONA SABORES DE LA VIDA .DS AVE/CHC 75GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126074489",},
-  "GAONA SABORES DE LA VIDA G DS C/CHIS 160GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126074465",},
-  "GAONA SABORES DE LA VIDA GALL D.S. PAQUETE 160GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126074458",},
-  "GAONA SABORES DE LA VIDA.DS AVE/PAS 75GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126074496",},
-  "GAONA SABORES DE LA VIDAAVEN&COC&DUL.LECHE100GRPAQ.DU.S": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126073437",},
-  "GAONA SABORES DE.LA VIDA GALL D.S.C/CHI PAQ 160GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798126074472",},
-  "HAPPY FOOD GALL DUL. SEC S/GLUT NAR C/SES 120GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798308250311",},
-  "HAPPY FOOD GALL.DUL. SEC S/GLUT COC 120GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798308250328",},
-  "HAPPY FOOD GALLET. C/PERA DUL SEC 120GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798308250335",},
-  "HAPPY FOOD GALLET. DUL SEC 44GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798308250434",},
-  "HAPPY FOOD GALLET. DUL SEC NARANJA 44GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798308250205",},
-  "HAPPY FOOD GALLET. DUL SEC PERA 44 GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798308250212",},
-  "HAPPY FOOD GALLET. DULC SEC COCO 44 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798308250199",},
-  "HAPPY FOOD GALLET. DULC SEC LIMON 120GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798308250427",},
-  "JULICROC DONINAS FRUTOS D/BOSQUE 200 GRBOL.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793706000438",},
-  "JULICROC DONINAS MIX DE SEMILLAS 200 GRBOL.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793706000360",},
-  "JUNCALCOR KUKINAS GALL DS C/CONF 50GR PAQ 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810249",},
-  "JUNCALCOR KUKINAS GALL DUL. SECA C/CHISP 50GR PAQ 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810232",},
-  "JUNCALCOR KUKINAS GALL DUL. SECA C/CHISP 50GR PAQ 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810256",},
-  "KAPAC C/CHIPS DE CHOCOL. S/TACCS/GLUT.DUL.SECA 200 GRCAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794906020011",},
-  "KAPAC PEPAS DUL.SECA 200 GRS. BOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794906020080",},
-  "KAPAC SAB/CHOCO. DUL.SECA 200 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794906020042",},
-  "KAPAC SABOR VAINILLA DUL.SECA 200 GRS. PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7794906020059",},
-  "KUKINAS C/CHIPS DS 133GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810058",},
-  "KUKINAS C/CHIPS DS 180GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810096",},
-  "KUKINAS DUL SEC CHIPS CHOC 80GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810133",},
-  "KUKINAS DULCE SECA CHOCOLATE 80 PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810010",},
-  "KUKINAS DULCE SECA VAINILLA 180GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810034",},
-  "KUKINAS DULCE SECA VAINILLA 180GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810072",},
-  "KUKINAS GALLETAS ANILLO CHC DUL.SEC. 180GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810171",},
-  "KUKINAS GALLETAS DULCE RELL 65GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810218",},
-  "KUKINAS GALLETAS DULCE RELL 65GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810225",},
-  "KUKINAS GALLETAS DULCE SECA LIMON 180GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798360810164",},
-  "LA PROVIDENCIA GALL C/CHIP DUL SEC 119GR PAQUETE1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798141972753",},
-  "LA PROVIDENCIA GALL C/CHIPS DUL.SEC 357GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798141972760",},
-  "LOQUITAS OBLEAS FRUTILLA 92R PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123003920",},
-  "LOQUITAS OBLEASVAINILLA 92GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123003906",},
-  "MONTE- CRISTO OBLITA OBL.DU.RE.FRUTILL. 100GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123160272",},
-  "MONTE CRISTO OBLITAS OB/WF 50 GRS PAQUETE 1U T/SAB": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123160043",},
-  "MONTE CRISTO OBLITAS TURROC TUR OBLEA REL 21GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123010201",},
-  "NEVARES PICNIC BIZC.RELL.DULC.LECHEBAN.C/CHO.38 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798094220994",},
-  "NEVARES TURRON MANI 25GR 1U PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "77923523",},
-  "OBLITA CHOCOLATE OBLEAS 46 GRS. PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123160050",},
-  "OBLITA CHOCOLATE OBLEAS 96 GR. PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123160296",},
-  "OBLITA CUBA.RELL.CHOCOLATE OBLEA 5.5 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "77929518",},
-  "OBLITA CUBA.RELL.MARROC OBLEA 5.5 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "77929525",},
-  "OBLITA CUBANITOS RELLE.CHOCOLATE DUL.RELLE.288 GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123000356",},
-  "OBLITA CUBANITOS RELLE.MARROC D.RELL.288 GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123000363",},
-  "OBLITA DULCE DE LECHE OBLEAS 46 GRS. PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123160036",},
-  "OBLITA FRUTILLA OBLEAS 46 GRS. PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123160029",},
-  "OBLITA LOQUITAS GALL OBLEA VAINIL 46 GR. PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123003401",},
-  "OBLITA LOQUITAS GALLETA OBLEA FRUTILLA 45GR PAQ 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123003425",},
-  "OBLITA MILK CALCIO OBLEAS 170 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123070274",},
-  "OBLITA MIX FRUTAL OBLEAS 46 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123013431",},
-  "OBLITA OB/WF 50 GRS PAQUETE 1U MONTE CRISTO T/SABORES": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123160012",},
-  "OBLITA OBLEAS CHOC/LIMON DUL.RELL. 50 GRPACK X 4 U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123013226",},
-  "OBLITA OBLEAS FRUTI/VAIN.DUL.RELL. 50 GRPACK X 4 U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123013202",},
-  "OBLITA OBLEAS FRUTILLA DUL.RELLE. 50 GRPACK X 4 U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123013219",},
-  "OBLITA VAINILLA OBLEAS 96 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793123160265",},
-  "PAMELA GALLETAS DUL SEC CHOCOLATE 220GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568006162",},
-  "PAMELA MINI AVENA Y CHIPS DUL.SECA BOL.180GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568005714",},
-  "PAMELA MINI AVENA Y COCO GALL.DUL.SECA BOLSA 180GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568005608",},
-  "PAMELA MINI AVENA Y PASAS GALL.DUL.SECA BOLSA 180GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791568005660",},
-  "PAR NOR MARMOLADAS DULCE SECA 170 GRPAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791324156933",},
-  "PAR-NOR COCO DULCE SECAPAQUETE 400 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791324156537",},
-  "PAR-NOR GALL CHIPPIS CHOC DUL.SEC. 120GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791324157664",},
-  "PAR-NOR MINI BARRITA FRUT BOSQ DUL.REL.160GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791324157657",},
-  "PAR-NOR MOROCHITAS DULCE SECA400 GRS. BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791324156544",},
-  "PAR-NOR SUAVECITAS DULCE SECA140 GR BOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791324156926",},
-  "POZO GALL VAINILLAS DUL. SEC. 80GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7790077000326",},
-  "POZO GALL VAINILLAS DULCE SECA 148GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7790077001354",},
-  "PUNTA BALLENA I LIKE GALL OB/WF 140GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7730303011054",},
-  "PUNTA BALLENA I LIKE GALL OB/WF 140GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7730303012150",},
-  "RONDA HOJALDRADA DULCE SECA150 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793450000524",},
-  "TOSTEX C/AVENA Y MIEL DUL. SECA 270GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811092",},
-  "TOSTEX C/AVENA Y PASAS DUL. SECA 270GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811078",},
-  "TOSTEX CHIPS C/CHISP DULCE SECA 270GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811009",},
-  "TOSTEX CHIPS C/CHISP DULCE SECA 270GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811023",},
-  "TOSTEX CHIPS C/CHISP/AVENA DULCE SECA 270GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811061",},
-  "TOSTEX CHIPS&MANI GALL. DUL.SECA 300GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125810781",},
-  "TOSTEX GALL BAN CHC OYG 100GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811313",},
-  "TOSTEX GALL C/AVENA Y ARANDANOS DUL. SECA 270GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811085",},
-  "TOSTEX GALL C/AVENA Y SEMILLA DUL. SECA 270GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811016",},
-  "TOSTEX GALL C/CHIPS CHC DUL SEC 120GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811238",},
-  "TOSTEX GALLETA C/CHISP DS 240GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811375",},
-  "TOSTEX GALLETA C/CHISP DS 240GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811382",},
-  "TOSTEX GALLETA C/CHISP DS 240GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125811399",},
-  "TOSTEX POLVORONES DUL. SECA BOLSA 300GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798125810682",},
-  "TRIMAK SURTIDITAS DUL.SECA 170 GR. BOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7798024290325",},
-  "TYM CHOCOLATE OBLEAS 105 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793209000362",},
-  "TYM CHOCOLATE OBLEAS 46 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793209000171",},
-  "TYM D.DE LECHE OBLEAS 46 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793209000164",},
-  "TYM DCE.DE LECHE OBLEA 105 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793209000355",},
-  "TYM FRUTILLA OBLEAS 105 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793209000331",},
-  "TYM FRUTILLA OBLEAS 46 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793209000157",},
-  "TYM GALL OBLEAS WF CACAO 100GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793209904127",},
-  "TYM OBLEAS LIMON DUL.RELLE. 100 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793209000461",},
-  "TYM OBLEAS LIMON DUL.RELLE. 50 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793209000454",},
-  "TYM VAINILLA OBLEAS 105 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793209000348",},
-  "TYM VAINILLA OBLEAS 46 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7793209000140",},
-  "VENEZIANA TOS.LIGHT DULCES DUL.SECA 200 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O MARCAS", "ean": "7791708617432",},
-  "OKEBON GIROTONDO CHOC 245GR PAQ.DU.SE. 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O OKEBON", "ean": "7790263119733",},
-  "OKEBON GIROTONDO VAIN C/CHIPS 214GR PAQ.DU.SE. 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O OKEBON", "ean": "7790263119719",},
-  "OKEBON MOLINO NATURAL AVENA&GRANOLA DUL.SECA 236 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O OKEBON", "ean": "7790263119627",},
-  "OKEBON PANAL VAINILLA DUL SEC 220GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O OKEBON", "ean": "7790263119689",},
-  "TIA MARUCACHOCO CHIPIS DUL.SECA 160 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O TMARUCA", "ean": "7798082742682",},
-  "TRIO CHOCOLATINA DUL.SECA 300 GRS BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O TRIO", "ean": "7791787001085",},
-  "TRIO FROLITAS DULCE SECA 300 GRS.BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O TRIO", "ean": "7791787000644",},
-  "TRIO GALL SCONES DULCE SECA 320GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O TRIO", "ean": "7791787101075",},
-  "TRIO TRI-CHOC PEPAS DULCE SECA 300 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "O TRIO", "ean": "7791787000705",},
-  "OKEBON LECHE D.DE LECHEDULCE SECA PAQ 273GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OKEBON LECHE", "ean": "7790263119610",},
-  "OKEBON LECHE D.DE LECHEDULCESECA PAQ.290G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "OKEBON LECHE", "ean": "7790263119597",},
-  "PAR-NOR MINI PITU.CHOC.RELL.C/CRE.SAB.LECHE 160GBOLSA.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324157046",},
-  "PAR-NOR MINI PITU.MOUSSE C/CREMA SAB.CHOC.RELL.160G BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324157084",},
-  "PAR-NOR MINI PITU.VAIN.RELL.C/CRE.SAB.LECHE 160GBOLSA.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324157022",},
-  "PAR-NOR MINI PITUSAS BLACK DUL.REL 130GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324157633",},
-  "PAR-NOR MINI PITUSAS CHOC.RE.CREMA DU.REL.300 G.BOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324157435",},
-  "PAR-NOR MINI PITUSAS DUL.RELLE. 140 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324157527",},
-  "PAR-NOR MINI PITUSAS FRUTIL.DUL.RELLE.160 GRS. BOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324157466",},
-  "PAR-NOR MINI PITUSAS FRUTILLA D.RELLE.300 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324000052",},
-  "PAR-NOR MINI PITUSAS LIMON DUL.RELLE 160 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324000069",},
-  "PAR-NOR MINI PITUSAS VAINIL.DUL.RELLE.300 GR BOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324157428",},
-  "PAR-NOR PITUSAS MERENGUE DUL. RELL. 120 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "PITUSAS", "ean": "7791324157534",},
-  "LIA POLVORITA CHC/VAIN DUL.RELLE.152GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040146143",},
-  "LIA POLVORITA FRUT DUL.RELLE.81GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040139176",},
-  "LIA POLVORITA MINI VAIN DUL.RELLE.152GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040139190",},
-  "LIA POLVORITA VAIN DUL.RELLE.81GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040139169",},
-  "LIA POLVORITA VAIN/FRUT DUL.RELLE.152GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POLVORITA", "ean": "7790040139640",},
-  "PLASENCIA POZO GALL. PEPAS DS 300GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POZO", "ean": "7790077001347",},
-  "PLASENCIA POZO VAINILLA DULCE SECA480 GR PAQ. ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POZO", "ean": "7790077000135",},
-  "PLASENCIA POZO VAINILLAS DULCE SECA190 GRS. PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "POZO", "ean": "7790077000104",},
-  "SMAMS GALL DUL RELL LIMON S/TACC 105GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511257",},
-  "SMAMS GALL DUL RELL VAINILLA S/TACC 105GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511240",},
-  "SMAMS GALL.DUL.SECA VAINILLA COLEGIAL 150 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510847",},
-  "SMAMS GALLET CHIP/CHOC. DUL SEC . PAQ. 150GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511004",},
-  "SMAMS PEPAS MEBRILLO 150GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510786",},
-  "SMAMS POLVORON COCO DULCE SECA 120GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511196",},
-  "SMAMS POLVORON LIMON DULCE SECA 120 GR BOL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511202",},
-  "SMAMS POLVORON VAIN DULCE SECA 120 GR BOL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511219",},
-  "SMAMS POLVORONES VAINILLA DULCE SECA 115GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510946",},
-  "SMAMS S/GLUTEN BISCUITS DULCE SECA 120 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510120",},
-  "SMAMS S/GLUTEN BIZ.AGRIDUL.AZUCARA. 150 GRPAQ.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510182",},
-  "SMAMS S/GLUTEN CHOCOLATE DUL.RELLE. 110 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510014",},
-  "SMAMS S/GLUTEN FRUTILLA DUL.RELLE. 105 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510267",},
-  "SMAMS S/GLUTEN VAINILLA DUL.RELLE. 110 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181510021",},
-  "SMAMS VEGGIE PEPAS MEBRILLO 150GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "SMAMS", "ean": "7798181511226",},
-  "TRIO GLASY DULCE SECA 350 GRS.BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TRIO PEPAS", "ean": "7791787101020",},
-  "TRIO PEPAS ALEMANAS C/MEMBRIL.GLACIADA 300 GRBOL.DU.SE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TRIO PEPAS", "ean": "7791787100719",},
-  "TRIO PEPAS DULCE SECA 500 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "TRIO PEPAS", "ean": "7791787000040",},
-  "VALENTE VAINILLA DUL. SEC. 444GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "VALENTE VAIN", "ean": "7793890258707",},
-  "VALENTE VAINILLA DULCE SECA 74 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "VALENTE VAIN", "ean": "7793890258738",},
-  "VALENTE VAINILLAS DUL. SEC. 148GR. PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "VALENTE VAIN", "ean": "7793890258691",},
-  "BAGLEY VOCACION CLASICA.DUL.SECA 141 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "VOCACION", "ean": "7790040146389",},
-  "LIA VOCACION ACARAMELA DUL.SECA PAQ 435 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "VOCACION", "ean": "7790040133228",},
-  "LIA VOCACION GALL DULCE SEC 384GR 3U PAQ AGR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "DULCES", "marca": "VOCACION", "ean": "7790040143623",},
-  "9 DE ORO PASEO MINI CRACKERS VEG. ZAPALLO BOL 150G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "9 DE ORO", "ean": "7792180136329",},
-  "9 DE ORO PASEO MINICRACKERS VEG. ESPINACA BOL 150G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "9 DE ORO", "ean": "7792180136336",},
-  "M.CANUELAS9 DE ORO BIZ.C/CERECEREAL 240 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "9 DE ORO", "ean": "7792200000708",},
-  "M.CANUELAS9 DE ORO BIZ.C/GRA.CRACKERS 100 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "9 DE ORO", "ean": "7792200000098",},
-  "M.CANUELAS9 DE ORO BIZC.CLAS.CRACKERS 200 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "9 DE ORO", "ean": "7792200000159",},
-  "M.CANUELAS9 DE ORO BIZC.LIGHTCRACKERS 170 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "9 DE ORO", "ean": "7792200000777",},
-  "BAUDUCCO TOSTADAS INTEGRAL CRACKERS PAQ142 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "BAUDUCCO", "ean": "7891962060460",},
-  "BAUDUCCO TOSTADAS MULTIGRANOS CRACKERS PAQ142 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "BAUDUCCO", "ean": "7891962060477",},
-  "BAUDUCCO TOSTADAS ORIGINAL CRACKERS PAQ 142GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "BAUDUCCO", "ean": "7891962060453",},
-  "DON SATUR BIZCOCHOS SALADOS CRACKERS PAQ.200 GR5735000328": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "D SATUR BIZ", "ean": "7795735000328",},
-  "GRANIX GALL CRACKERS SIN SAL 200GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANIX", "ean": "7790045827733",},
-  "GRANIX GALLETAS CR 600GR 1UN PAQUETE AGR X3": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANIX", "ean": "7790045827740",},
-  "GRANIX SALVADO CEREAL 240 GRS. PAQUE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANIX", "ean": "7790045826200",},
-  "GRANIX SALVADO S/SAL 3EN1 3U 720 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANIX", "ean": "7790045826231",},
-  "GRANIX SALVADO SIN SAL CEREAL 690 GRS PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "GRANIX", "ean": "7790045826101",},
-  "HOJALMAR TALITAS CLASICAS PAQ.120GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "HOJALMAR", "ean": "7793450000883",},
-  "LA PROVIDENCIA GALL BIZCOCHO SAL CR 200GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "LA PROVIDENCIA", "ean": "7798141972920",},
-  "M CANUELAS 9 DE ORO GALL SN CRE/CEB 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "M CA¥UELAS 9 ORO", "ean": "7792180146120",},
-  "M CANUELAS 9 DE ORO GALL SN HIERBAS 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "M CA¥UELAS 9 ORO", "ean": "7792180146144",},
-  "M CANUELAS 9 DE ORO GALL SN JAMON 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "M CA¥UELAS 9 ORO", "ean": "7792180146137",},
-  "M CANUELAS 9 DE ORO GALL SN ORIG 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "M CA¥UELAS 9 ORO", "ean": "7792180146090",},
-  "M CANUELAS 9 DE ORO GALL SN QUESO 120GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "M CA¥UELAS 9 ORO", "ean": "7792180146106",},
-  "ARCOR MEDIA TARDE SANDWICH CRACKERS 107 GR PAQ.X 5U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "MEDIA TARDE", "ean": "7790040143012",},
-  "BAGLEY MEDIA TARDE SANDWICH CRACKER 107GR PAQ AGR 3U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "MEDIA TARDE", "ean": "7790040143005",},
-  "LIA MEDIA TARDE CRACKERS 105 GR PAQUE.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "MEDIA TARDE", "ean": "7790040143593",},
-  "LIA MEDIA TARDE GALL CR 315GR PAQUE AGR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "MEDIA TARDE", "ean": "7790040143586",},
-  "DON SATUR MIX DE SEMIL.TALITAS CEREAL 140 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O DSATUR", "ean": "7795735600917",},
-  "DON SATUR TALITAS CRACKERS 140 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O DSATUR", "ean": "7795735000106",},
-  "GRANIX SEMOLADAS.CRACKERS 420GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O GRANIX", "ean": "7790045827047",},
-  "GRANIX SIN SAL CRACKERS 140 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O GRANIX", "ean": "7790045000907",},
-  "GRANIX SIN SAL CRACKERS 175 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O GRANIX", "ean": "7790045826309",},
-  "BREVISS TOSTADAS LIGHT CRACKERS 200 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529041622",},
-  "CROCCANTO CHALITAS CR. MULTICEREAL 150GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798354950975",},
-  "CROCCANTO CHALITAS.INTEG. C/ALBAC 150GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798354950999",},
-  "CROCCANTO CHALITAS.INTEG. C/ROM.OLIV 150GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798354950982",},
-  "CROCCANTO CHALITAS.INTEGRALES 150 GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798354951002",},
-  "DIMAX LIBRE DE GLUTEN BIZCO.SAL.CRACK.100 GR BOL.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798144940377",},
-  "DOS HERMANOS TOST.DE ARROZ CRACKERS 120 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790503000333",},
-  "DOS HERMANOS TOST.DE ARROZ S/SAL CRACKERS 120 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790503000326",},
-  "DR.CORMILLOT LIGHT TOS.S/SA.C/GLU.CRACK.200 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791708001576",},
-  "FIRENZE TOSTAD.C/GLUTEN S/SAL CRACK. 180 GR PAQ.": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791568000498",},
-  "FIRENZE TOSTADAS C/GLUTEN CRACKERS 1000 GRPAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791568004755",},
-  "FIRENZE TOSTADAS C/GLUTEN CRACKERS 180 GR PAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791568000511",},
-  "FIRENZE TOSTADAS DULCE CRACKERS 180 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791568000504",},
-  "FIRENZE TOSTADAS LIGHT. CR 920GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791568005226",},
-  "FIRENZE TOSTADAS. DULCE CRAC 920GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791568001006",},
-  "FITZ ROY TOST.LIGHTBRIOCHADASC/GLUTEN PAQ.200 GRCRACK.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "806773050071",},
-  "FITZ ROY TOST.LIGHTC/GLUTEN CRACKERS 200 GR PAQUE.ARGG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "806773050040",},
-  "FITZ ROY TOST.LIGHTSALVADO CRACKERS 200 GR PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "806773050033",},
-  "GALLO BIZCOCHOS ARROZ SAL CRACKERS 100GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790070418463",},
-  "GALLO BIZCOCHOS SALADOS CRACKERS 50GR BOL 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790070418456",},
-  "GAONA STAR BIZCOCHITOS PAQUETE 180 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798126073055",},
-  "GRANDIET MULTI- CEREAL CEREAL 100 GRS. PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7797330102322",},
-  "GRANDIET MULTICERE.DULCE CEREAL 100 GRS. PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7797330102384",},
-  "GRANDIET MULTICEREAL SIN SAL CEREAL 100 GRS. PAQUE.ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7797330102377",},
-  "HAPPY FOOD CHALITAS JAMON 100GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798308250397",},
-  "HAPPY FOOD TALITAS SN QUESO 100GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798308250373",},
-  "HOJALMAR SNACK MATERO BIZCOCH. SALADO BOL. 180GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7793450000876",},
-  "HOJALMAR TALITAS SAB.JAMON PAQ.100GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7793450000906",},
-  "HOJALMAR TALITAS SAB.QUESO PAQ.100GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7793450000890",},
-  "JORGITO BIZCOCHITOC/GRASA CRACKERS 400 GR BOLSA ARG": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790957000651",},
-  "LEIVA MINI CON CHIA CEREAL 250 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790412000455",},
-  "M CANUELAS PASEO GALLETAS SN QUESO 250GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7792180145444",},
-  "M.C. TOSTADITA CLAS.CRACK 110GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529042452",},
-  "M.C. TOSTADITA CLAS.CRACK 110GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529042476",},
-  "MAROLIO AGUA CRACKERS 101 GR PACK 5 U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7797470009840",},
-  "MOLINOS ALA TOST.ARROZ CLAS.CRACKERS 150 GRPAQUETE": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791120098093",},
-  "PASEO GALLETAS CRACKERS OLIV/ROME 250GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7792180145420",},
-  "TOSTEX CINTITAS CEBOLLAS CRACKERS 125 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810361",},
-  "TOSTEX CINTITAS CLASICAS CRACKERS 125 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810354",},
-  "TOSTEX CINTITAS CROCANTES PIZZA CRACKERS 125 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810385",},
-  "TOSTEX CINTITAS JAMON CRACKERS 125 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810521",},
-  "TOSTEX CINTITAS MILANESA BOLSA125GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125811429",},
-  "TOSTEX CINTITAS PROVOLETA BOL .125GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810958",},
-  "TOSTEX CINTITAS QUESO CRACKERS 125 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810347",},
-  "TOSTEX CINTITAS SAB OLIVA BOLSA 125GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125811436",},
-  "TOSTEX CINTITAS SAB PANCHO C/MOZ BOLSA 125GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125811405",},
-  "TOSTEX CINTITAS SAB. ASADO BOLSA.125GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125811412",},
-  "TOSTEX CINTITAS SAB.BARBACOA BOLSA.125G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810750",},
-  "TOSTEX CINTITAS SAB.CHEDDAR BOLSA.125G": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810767",},
-  "TOSTEX CINTITAS SEMILLAS CRACKERS 125 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125810446",},
-  "TOSTEX GALL SN CINTITAS PICANTE BOLSA.125GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125811214",},
-  "TOSTEX GALL SN CINTITAS SAB.KETCHUP BOLSA 125GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7798125811221",},
-  "TOSTI TALITAS C/SEMILLAS 100GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529042148",},
-  "TOSTI TALITAS CLASICA 100GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529042087",},
-  "TOSTI TALITAS PIZZA 100GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529042117",},
-  "TOSTI TOSTADA GRUESA SIN SAL PAQ 200GR 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529041615",},
-  "TOSTI TOSTADAS CLASICAS PAQ 200GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529041608",},
-  "TOSTI TOSTADAS FINA LIGHT 140GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529041660",},
-  "TOSTI TOSTADAS FINA S/SAL 140GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7794529041677",},
-  "VEGETALEX SNACK DE ARROZ QUESO 40GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7790174001257",},
-  "VENEZIANA TOST. C/ SALVADO CRACKERS 200 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791708617364",},
-  "VENEZIANA TOST. MULTICEREAL CRACKERS 200 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791708617357",},
-  "VENEZIANA TOST. SALADAS CR 200GR PAQ 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791708001569",},
-  "VENEZIANA TOST. SIN SAL CRACKERS 200 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "O MARCAS", "ean": "7791708617326",},
-  "M CANUELAS PASEO GALLETAS CR PIZZA 250GR BOLSA 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180145437",},
-  "M.CANUELAS PASEO CLASICAS TOST 200 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180137845",},
-  "M.CANUELAS PASEO SALVADO TOST 200 GR PAQ": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180137852",},
-  "M.CANUELASPASEO MINI CRACKERS 300 GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180006448",},
-  "M.CANUELASPASEO MINI MARINER. CRACKERS 220 GR. BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180006462",},
-  "M.CANUELASPASEO MINI SALVADO CEREAL 300 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180006455",},
-  "M.CANUELASPASEO MINICRACKERS 5 SEMILLAS 300 GRBOL.CEREAL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180007315",},
-  "M.CANUELASPASEO MINICRACKERS MIX CEREAL 300 GRBOL.CEREAL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180007346",},
-  "M.CANUELASPASEO MINICRACKERS S/SAL 300 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180007254",},
-  "M.CANUELASPASEO MINICRACKERS SESAMO 300 GRBOL.CEREAL": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "PASEO", "ean": "7792180007285",},
-  "SMAMS CRACKERS CRACKERS BOLSA 150 GR": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SMAMS", "ean": "7798181510212",},
-  "SMAMS CRACKERS SIN SAL CRACKERS 150 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SMAMS", "ean": "7798181510205",},
-  "SMAMS MIX DE SEMILLAS CEREALES 150 GRBOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SMAMS", "ean": "7798181510229",},
-  "SMAMS S/GLUTEN JAMON SNACKS 80GR CAJA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "SMAMS", "ean": "7798181510908",},
-  "PEPSICO TWISTOS JAMON IBER 155GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310984475",},
-  "PEPSICO TWISTOS MINI TOST SN QUESO 155GR BOLSA 1U": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310984444",},
-  "TWISTOS MINI TOST.JAMON 95GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310983256",},
-  "TWISTOS MINI TOST.QUESO 95GR BOLSA": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "TWISTOS", "ean": "7790310983270",},
-  "BIMBO ZENISSIMO SALMAS HORN.CLAS SN CAJA 90GR 1UN": {"empresa": "RESTO", "categoría": "Biscuits", "subcategoría": "SALADAS", "marca": "ZENISSIMO", "ean": "7793890261844",},
-  "CHOCOARROZ ALFAJOR DE ARROZ CHO.BLANCO 22GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418289",},
-  "CHOCOARROZ ALFAJOR DE ARROZ DDL 22 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418203",},
-  "CHOCOARROZ ALFAJOR FRUTILLA D/ARROZ 22GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070416865",},
-  "CHOCOARROZALFAJOR DE ARROZ C/LIMON 22 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418241",},
-  "CHOCOARROZALFAJOR DE ARROZ MARROC 22 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "CHOCOARROZ", "ean": "7790070418326",},
-  "CACHAFAZ ALFAJOR CHOCOLATE BLANCO 60 GRCAJA X6 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "7798128000493",},
-  "EL CACHAFAZ ALFAJOR BLANCO 60 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "EL CACHAFAZ", "ean": "77934505",},
-  "GEORGALOS FULL.MANI ALFAJOR SPL 40GR PAQ 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "GEORGALOS", "ean": "7790380025191",},
-  "JORGELIN BLANCO TRIPLE ALFAJOR 85 GR ARG": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGELIN", "ean": "77901705",},
-  "JORGELIN TRIPLE ALFAJOR 85 GR ARG": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGELIN", "ean": "77901729",},
-  "JORGITO BLANCO ALFAJOR PAQ.X 6 U 26 GRARG": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "JORGITO", "ean": "7790957000033",},
-  "9 DE ORO ALFAJOR SIMPL DDL 45GR 1UN PAQUETE": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7792180145390",},
-  "9 DE ORO ALFAJOR SIMPL DDL 45GR 1UN PAQUETE": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7792180145406",},
-  "9 DE ORO ALFAJOR SIMPL DDL 45GR 1UN PAQUETE": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7792180145819",},
-  "9 DE ORO ALFAJOR SPL 45GR 1UN PAQUETE": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7792180145413",},
-  "9 DE ORO ALFAJOR SPL 45GR 1UN PAQUETE": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7792180145826",},
-  "CHAMMAS ALFAJOR BCO SPL 50GR 6U PAQ 300G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232707",},
-  "CHAMMAS ALFAJOR BLANCO DDL SPL 50GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903000115",},
-  "CHAMMAS ALFAJOR DURAZNO SPL 50GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903000061",},
-  "CHAMMAS ALFAJOR LECHE SPL 50GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903000054",},
-  "CHAMMAS ALFAJOR NEGRO SPL 50GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903000108",},
-  "CHAMMAS BLANCO TRAD ALFAJOR 40GR 6U PAQ 240G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232684",},
-  "CHAMMAS MEMBRILLO ALFAJOR 40GR 6U CAJA 240G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232677",},
-  "DE NUESTRA PANADERIA ALF.DDL BAN.CHOCO.NEG.6U 25GR C/U PAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7791696008083",},
-  "EL CORDOBES ALFAJOR CHC DDL SPL 50GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798350889149",},
-  "EL CORDOBES ALFAJOR DDL SPL 48GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798350888753",},
-  "ENTRE DOS ALFAJOR BAN CHC SPL 45GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "763571682333",},
-  "ENTRE DOS ALFAJOR BAN. CHC SPL 45GR 6UN CAJA 270G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "714604060505",},
-  "ENTRE DOS ALFAJOR DDL NEGRO SPL 45GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "763571682326",},
-  "FULBITO ALFAJOR 25 GR ARG": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "77902320",},
-  "FULBITO ALFAJOR CHOCOLATE 30 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "77913586",},
-  "HAPP FOOD ALFAJOR X 50G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250038",},
-  "HAPPY FOOD ALFA S/TACC COCO/DDL SPL 50GR 3U BDJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250274",},
-  "HAPPY FOOD ALFAJ LS/TACC DDL SPL 50GR 3U BANDJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250069",},
-  "HAPPY FOOD ALFAJOR 50G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250021",},
-  "HAPPY FOOD ALFAJOR SIN AZUCAR 50GR 1UN PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250113",},
-  "HAPPY FOOD LIBRE DE GLUTEN SIMPLE 50 GRS PAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250014",},
-  "HAPPY FOOD LS/TACC MANI SIMPLE 50GR 3U BANDJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250052",},
-  "HAPPY FOOD LS/TACC MOUSSE SIMPLE 50GR 3U BANDJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250045",},
-  "HAPPY FOOD S/TACC DDL S/AZ. SPL 50GR 3U BNDJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798308250120",},
-  "LA QUINTA COSQUIN ALFAJOR SPL 70GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798350889019",},
-  "LA QUINTA LA MONA SPL 50GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798350889071",},
-  "NEVARES ALFAJOR BLANCO PAQ. 45 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "77925626",},
-  "NEVARES C/DDL ALFAJOR CH.NEGRO 45GR 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "77908193",},
-  "SOL SERRANO ALFAJOR CHC. BLANCO SPL 40GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232592",},
-  "SOL SERRANO ALFAJOR CHOC 40GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232431",},
-  "SOL SERRANO ALFAJOR D.D/LECHE 40GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232417",},
-  "SOL SERRANO ALFAJOR FRUTA 40GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232424",},
-  "SOL SERRANO ALFAJOR MANI SPL 40GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232608",},
-  "TUCABON ALFAJOR NEGRO SPL 38GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798350889668",},
-  "TUCABON ALFAJOR SPL 38GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7798350889682",},
-  "YUKA ALFAJOR CHOC MIX S/TACC 50GR 6UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232479",},
-  "YUKA ALFAJOR CHOC S/TACC 50GR 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232165",},
-  "YUKA ALFAJOR DDL S/TACC 50GR 1UN PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232141",},
-  "YUKA ALFAJOR MEBRILLO SPL S/TACC 50GR 6UN CAJA 300G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232486",},
-  "YUKA ALFAJOR MEMBRILLO S/TACC 50GR 1UN PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "O MARCAS", "ean": "7794903232158",},
-  "PUNTA BALLENA ALFAJOR BAN CHC SPL 40GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "PUNTA BALLLENA", "ean": "7730303012242",},
-  "PUNTA BALLENA ALFAJOR BAN. CHC SPL 60GR PAQ 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "PUNTA BALLLENA", "ean": "7730303001048",},
-  "TODDY ALFAJOR MOUSSE SPL 50GR REG PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TODDY", "ean": "7790380023579",},
-  "TODDY ALFAJOR MOUSSE SPL 50GR REG PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "ALFAJORES", "marca": "TODDY", "ean": "7790380023630",},
-  "BANANITA DOLCA BOMBON BOCAD BANANA 30GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "BANTA-DOLCA", "ean": "77988263",},
-  "OBLITA COQUET OBLEA BAN.RELLENA C/MANI 25 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COQUET", "ean": "7793123017507",},
-  "OBLITA MINI COQUET CUBAN.RELL.MARR.BAN.11.5GRX 12U CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "COQUET", "ean": "7793123017514",},
-  "EL CACHAFAZ CONITO 38 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "EL CACHAFAZ", "ean": "77990327",},
-  "EL CACHAFAZ CONITO 38 GRCAJA X 6": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "EL CACHAFAZ", "ean": "7798128001896",},
-  "GALLO OBLEA D/ARROZ WHITE RELL.BAN. 20GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070431653",},
-  "GALLO OBLEA DE ARROZ RELLE.BAN. 20 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070411952",},
-  "GALLO SNACK CHOCOBAR BAR ARR DDL BAN.C/CHO 20GR PAQ 6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070431240",},
-  "GALLO SNACK CHOCOBAR BAR ARROZ BAN.C/CHO 20GR PAQ 6U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "GALLO", "ean": "7790070431257",},
-  "HERSHEY'S MAIS CHOC C/ LECHE 102GR BL 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "HERSHEY'S", "ean": "7899970400674",},
-  "HERSHEY'S MAIS CHOCOLATE AMENDOIN 102GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "HERSHEY'S", "ean": "7899970400698",},
-  "HERSHEY'S MAIS COOKIES N CREME 102GR BL 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "HERSHEY'S", "ean": "7899970400681",},
-  "HERSHEY'S MAIS TRIPLE CHOC 102GR BL 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "HERSHEY'S", "ean": "7899970400704",},
-  "KINDER BUENO BOMBON 21.5 GRX2 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KINDER BUENO", "ean": "80052760",},
-  "KINDER BUENO WHITE REG. BOMBON 19.5 GR X2 PAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KINDER BUENO", "ean": "80761761",},
-  "KIT KAT CHOCOLATE BLEA BANADA DARK 41.5GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KIT-KAT", "ean": "7891000379073",},
-  "KIT KAT CHOCOLATE OBLEA BAN TRP CHC 41.5GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KIT-KAT", "ean": "7891000422052",},
-  "KIT KAT OBLEA BAN.CHOCOLATE C/LECHE 41.5 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KIT-KAT", "ean": "7891000248799",},
-  "KIT KAT OBLEA.BANADA BCO CHOCOLATE 41.5GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "KIT-KAT", "ean": "7891000379028",},
-  "NUGATON OBLEA CHOCOLATE BLANCO 27 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "NUGATON", "ean": "7792360072461",},
-  "EL CORDOBES CONITO CHC NEGRO 120G CAJA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7798350888760",},
-  "EXPOVERDE ARANDANO BAN CHC 100GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7798149701676",},
-  "EXPOVERDE AVELLA BAN CHC 100GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7798149701669",},
-  "HAPPY FOOD BOCADITO DDL S/TACC 40GR 3UN PAQ 120G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7798308250151",},
-  "LA CASA PISTACHO BANA CHOC 100GR BOL 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740910590",},
-  "LA CASA PRALINE 3 CHOCHOLATES 250GR CAJA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740903776",},
-  "LACASA ALMEND BANA CHOC NEGRO 125G BOL 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740910569",},
-  "LACASA ALMEND BANA CHOC NEGRO 125G BOL 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740910576",},
-  "LACASA ARANDANO BANA CHOC NEGRO 125G BOL 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740911733",},
-  "LACASA NARANJA BANA CHOC NEGRO 125G BOL 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740910583",},
-  "LACASA PASAS BANA CHOC NEGRO 150G BOL 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8410740907064",},
-  "LADDU BAR BARRITA ARANDANOS 30GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8904150127483",},
-  "LADDU BAR BARRITA FRUTOS ROJOS 30GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8904150127438",},
-  "LADDU BAR BARRITA VEGANA BROWNIE 30GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8906038788601",},
-  "LADDU BAR BARRITA VEGANA COCO 30GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8906038788625",},
-  "LADDU BAR BARRITA VEGANA COCO 30GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "8906038788649",},
-  "NEVARES SMACK OBLEA BANADA 33 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7798094220444",},
-  "SABE BIEN ! BRAUNICHOC O BAN 35GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7793890261530",},
-  "TYM OBLEA/WF BAN CHC 33GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7793209904011",},
-  "TYM OBLEAS BANO CH. 20GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7793209903700",},
-  "TYM OBLEAS BANO CH. 27GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7793209904028",},
-  "TYM OBLEAS BANO CH. 27GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7793209904035",},
-  "TYM OBLEAS BANO CH. 27GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "O MARCAS", "ean": "7793209904042",},
-  "OBLITA OBLEA BAN.C/CHO.RELL.LIMON 16 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "OBLITA", "ean": "77952127",},
-  "OBLITA OBLEA BANADA 30 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "OBLITA", "ean": "7793123160821",},
-  "SNICKER BARRA RELLENA 48GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BANADOS", "marca": "SNICKERS", "ean": "7506174512248",},
-  "AFTER EIGHT MINT BOMBONES 200 GRCAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "AFTER EIGHT", "ean": "7613032596668",},
-  "NESTLE ALPINO BOMBONES CHC 195GR CAJA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ALPINO", "ean": "7891000067253",},
-  "GAROTO BOMBONES SURTIDOS CAJA 250GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "GAROTO", "ean": "7891000392775",},
-  "GAROTO SERENATA DE AMOR O BAN 140.8GR CAJA 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "GAROTO", "ean": "7891000404249",},
-  "": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "M PROPIAS", "ean": "",},
-  "MECANO BOCAD CHOC RELL 19GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "MECANO", "ean": "7792360094906",},
-  "NESTLE ESPECIALIDADES BOMB.SURT. 251 GR CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "NESTLE", "ean": "7891000391068",},
-  "NESTLE TAB CHOC SOL BYB 22GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "NESTLE", "ean": "8445291565203",},
-  "HAPPY FOOD BOCADITO.DDL S/TACC 40GR 1UN PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "O MARCAS", "ean": "7798308250144",},
-  "OBLI BON BOCADITO 17 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "OBLI BON", "ean": "77925787",},
-  "OBLI BON BOCADITO 17 GRCAJA X10 U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "OBLI BON", "ean": "7793123160456",},
-  "OBLI BON BOCADITO BLANCO 17 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "OBLI BON", "ean": "77925770",},
-  "OBLI BON BOCADITO BLANCO CAJA X 30 U. 17 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "OBLI BON", "ean": "7793123000059",},
-  "OBLI BON BOCADITO NEGRO CAJA 17 GRPACK X30 U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "OBLI BON", "ean": "7793123000042",},
-  "OBLI BON BOMBON CHC BYB H/25G REG 15GR ENVOLTORIO 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "OBLI BON", "ean": "77925763",},
-  "OBLI BON BOMBONES CLASICOS CAJA 240 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "OBLI BON", "ean": "7793123020217",},
-  "FERRERO ROCHER BOMBON CJA 4U 50G": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "7898024397861",},
-  "FERRERO ROCHER BOMBON ESTUCHE 150GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "7898024396994",},
-  "FERRERO ROCHER BOMBONES 100 GRCAJA PL.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "7861002900117",},
-  "FERRERO ROCHER BOMBONES 12.5 GRPAQ.X 3 U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "78909434",},
-  "FERRERO ROCHER BOMBONES 300 GREST.PL.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "8000500009673",},
-  "FERRERO ROCHER BOMBONES COLLECTION X 77 GR CAJA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "BOMBONES", "marca": "ROCHER", "ean": "7898024397151",},
-  "M & M´S CONFITES CHOCO. PAQ. 48 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "7797453001441",},
-  "M & M'S MANI CON CHOCOLATE PAQ. 49 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "7797453001458",},
-  "M & M'S PEANUT CANDIES CONFITES 150.3 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "40000017325",},
-  "M & M'S PLAIN GRAGEAS C/CHOCOLATE 150 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M & M", "ean": "40000017318",},
-  "": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "M PROPIAS", "ean": "",},
-  "NAMUR MANI CON CHOCOLATEBOLSA 80 GRARG": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O GEORGALOS", "ean": "7790380014690",},
-  "BREK MANI CON CHOCOLATE BOLSA 70 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7798036730796",},
-  "CANNETTINEMANI CON CHOCOLATE FLOW PACK 80 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7798036732004",},
-  "CROPPERS MANI BAN CHC 85G BOLSA 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7790524324746",},
-  "KING MANI CON CHOCOLATE 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7798151950697",},
-  "KING MANI CON CHOCOLATE 80 GRBOLSA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "7798151953667",},
-  "LACASA LENTEJAS DE CHOC CONF 190GR 1U BOL": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "CONFITURAS", "marca": "O MARCAS", "ean": "8410740006262",},
-  "KINDER JOY HUEVO DE CHOCOLATE 20 GRC/SORPRESA": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER JOY", "ean": "78602731",},
-  "KINDER JOY HUEVO DE CHOCOLATE 20 GRX 2U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER JOY", "ean": "7861002900421",},
-  "KINDER C/ LECHE P/NENA C/SORP 20 GRS HYF 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "78931053",},
-  "KINDER JOY HUEVO CHO. 20 GR CAJA 2U C/SORP": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "7797394002453",},
-  "KINDER SORPRESA HECHIS HUEVO CHOC. 20 GR 2 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "7797394001616",},
-  "KINDER SORPRESA SELVATICOS HUEVO CHOC. 20 GR 2 U.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "PASCUAS", "marca": "KINDER SORPRESA", "ean": "7797394001555",},
-  "NESTLE CHOC ALPINO TAB.SOL. 85GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "ALPINO", "ean": "7891000336373",},
-  "BONAFIDE TABLETA CHOCO SOLIDA 30GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "BONAFIDE", "ean": "7792360952657",},
-  "GEORGALOS C/LECHE TAB.SOLIDA 25 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "GEORGALOS", "ean": "7790380024194",},
-  "HERSHEY'S CHC C/LECH TAB.SOLIDA 82GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HERSHEY'S", "ean": "7899970402982",},
-  "HERSHEY'S CHC SEM AMARG 40% TAB.SOLIDA 82GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HERSHEY'S", "ean": "7899970402838",},
-  "HERSHEY'S COOKIES & CREAM TABLETA CHC SOLIDA 77GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HERSHEY'S", "ean": "7899970403026",},
-  "HERSHEY'S COOKIES'N CREME TAB.SOLIDA 20 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "HERSHEY'S", "ean": "7898292888764",},
-  "KINDER CHOCOLATE C/LECHE TAB.SOLIDA 100 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "KINDER", "ean": "77949707",},
-  "KINDER CHOCOLATE C/LECHE TAB.SOLIDA 50 GRPAQ.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "KINDER", "ean": "77949677",},
-  "KINDER TAB.SOLIDA 12.5 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "KINDER", "ean": "80050315",},
-  "KINDER MAXI TAB.SOLIDA 210 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "KINDER MAXI", "ean": "4008400221021",},
-  "MECANO TAB.CHOC BCO DDL RELLE. 45GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MECANO", "ean": "7792360095279",},
-  "MECANO TAB.CHOC DDL RELLE. 45GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "MECANO", "ean": "7792360095262",},
-  "NESTLE CHOCOTRIO CHC RELL C/GALL 90GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7891000377543",},
-  "NESTLE CHOCOTRIO CHC RELL C/GALL 90GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7891000377598",},
-  "NESTLE CHOCOTRIO CHC RELL C/GALL 90GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7891000377642",},
-  "NESTLE GALAK SOLIDA 80GR PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7891000368626",},
-  "NESTLE MANI SOLIDAS 90GR PAQUETE 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7613287529497",},
-  "NESTLE TAB CHC SOLIDAS 45GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565173",},
-  "NESTLE TAB CHOC SOLIDAS 50GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565333",},
-  "NESTLE TAB CHOC SOLIDAS 50GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565395",},
-  "NESTLE TAB CHOC. SOLIDAS 25GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565364",},
-  "NESTLE TAB CHOC. SOLIDAS 25GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "8445291565425",},
-  "NESTLE TABLETA CHOCO CON MANI 150GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE", "ean": "7613287526311",},
-  "NESTLE CLASSIC AMARGO TAB.SOLIDA 80GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE CLASSIC", "ean": "7891000368572",},
-  "NESTLE CLASSIC DIPLOMATA SOLIDAS 80GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE CLASSIC", "ean": "7891000368893",},
-  "NESTLE CLASSIC MILK CHOCOLATE 150G PAQ 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE CLASSIC", "ean": "7891000361214",},
-  "NESTLE CLASSIC TAB.SOLIDA 80GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE CLASSIC", "ean": "7891000369098",},
-  "NESTLE DUO CLASSIC TAB.SOLIDA 80GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE CLASSIC", "ean": "7891000368992",},
-  "NESTLE CRUNCH SOLIDA 80GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "NESTLE CRUNCH", "ean": "7891000369371",},
-  "LA CASA TAB.SOLIDA 85% CACAO 100GR 1U CJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "8410740905855",},
-  "LA CASA TAB.SOLIDA C/LECHE 100GR 1U CJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "8410740906647",},
-  "LA CASA TAB.SOLIDA NEGRO NARANJA 100GR 1U CJ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "O MARCAS", "ean": "8410740906005",},
-  "NESTLE SUFLAIR CHOCOLATE C/LECHE 50 GRTAB.AIREA.": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SUFLAIR", "ean": "7891000107836",},
-  "NESTLE SUFLAIR DUO TAB.AIREA. 80GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SUFLAIR", "ean": "7891000329665",},
-  "SUFLAIR MILK AIREADO TABLETA 80GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "SUFLAIR", "ean": "7891000329856",},
-  "TODDY TABLETAS AIREADAS 50GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TODDY", "ean": "7790380018056",},
-  "TODDY TABLETAS CHC SOLIDA 60GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TODDY", "ean": "7790380025139",},
-  "TODDY TABLETAS RELLENAS 60GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TODDY", "ean": "7790380025115",},
-  "TODDY TABLETAS RELLENAS 60GR PAQUETE 1UN": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TODDY", "ean": "7790380025122",},
-  "TOKKE C/MANI TAB.SOLIDA 120 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TOKKE", "ean": "7790380022145",},
-  "TOKKE CHOC C/LECHE TAB.SOLIDA 60 GR": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "TOKKE", "ean": "7790380022114",},
-  "VIZZIO TAB. CHOC C/LECHE Y ALMENDRAS 35GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360094524",},
-  "VIZZIO TAB. CHOCO C/ALMENDRAS 100GR 1U": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360094586",},
-  "VIZZIO TABLE CHOC C/LECHE 90GR 1U PAQ": {"empresa": "RESTO", "categoría": "Chocolates", "subcategoría": "TABLETAS", "marca": "VIZZIO", "ean": "7792360095019",},
-  "WRIGLEY'S DOUBLEMINT 15CHI. TABL. ADU. PQ. 40.5GR 1UN": {"empresa": "RESTO", "categoría": "Gums", "subcategoría": "ADULTOS", "marca": "WRIGLEY S", "ean": "22000006660",},
-  "BAZOOKA TUTTI FUTTI GLOBO INF. BOLSA 150GR 1UN": {"empresa": "RESTO", "categoría": "Gums", "subcategoría": "INFANTILES", "marca": "BAZOOKA", "ean": "7790380311058",},
-
-}
@@ -0,0 +1,807 @@
+# mercado.py
+# “Relevar Mercado” sin interfaz: ListPrice del mismo listado de EANs en todas las cadenas.
+# La usan pages/3_Mercado.py (tablas con estilo y descargas) y run.py (CLI).
+
+import math
+import re
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import requests
+
+import cache_http
+import coto
+import historial
+import metricas
+import motor
+import reintentos
+import resolucion
+import vtex
+from corrida import Corrida, Opciones, cargar_catalogo, clave_cadena
+
+PAGINA = "Mercado"
+CATALOGO = "mercado"  # lista del catálogo (con PSP)
+
+TIMEOUT = (4, 18)
+DISPERSION_THRESHOLD_ARS = 500
+BASE_COLS = ["Categoría", "Marca", "EAN", "Nombre"]
+
+
+# =========================
+# Utils comunes
+# =========================
+def format_ar_price_no_decimals(value):
+    """1795.0 -> '1795' (sin miles, sin decimales)."""
+    if value is None:
+        return ""
+    try:
+        v = float(value)
+        if v <= 0:
+            return ""
+        return str(int(round(v)))
+    except Exception:
+        return ""
+
+
+def precio(value) -> float:
+    """ListPrice de una tienda como float; NaN sin precio (None, vacío, <= 0)."""
+    v = safe_float(value)
+    return v if v is not None and v > 0 else math.nan
+
+
+def safe_float(x):
+    try:
+        if x is None or x == "":
+            return None
+        return float(x)
+    except Exception:
+        return None
+
+
+def parse_price_int(s: str):
+    """'3899' -> 3899 (int)"""
+    if s is None:
+        return None
+    s = str(s).strip()
+    if not s:
+        return None
+    try:
+        return int(float(s))
+    except Exception:
+        return None
+
+
+def pick_item_by_ean(items, ean: str):
+    ean = str(ean).strip()
+    for it in items or []:
+        if str(it.get("ean") or "").strip() == ean:
+            return it
+        for ref in (it.get("referenceId") or []):
+            if str(ref.get("Value") or "").strip() == ean:
+                return it
+    return items[0] if items else None
+
+
+# =========================
+# Fetchers por cadena (ListPrice)
+# =========================
+CARREFOUR_BASE = "https://www.carrefour.com.ar"
+CARREFOUR_SEGMENT = (
+    "eyJjYW1wYWlnbnMiOm51bGwsImNoYW5uZWwiOiIxIiwicHJpY2VUYWJsZXMiOm51bGwsInJlZ2lvbklkIjpudWxsLCJ1dG1fY2FtcGFpZ24iOm51bGws"
+    "InV0bV9zb3VyY2UiOm51bGwsInV0bWlfY2FtcGFpZ24iOm51bGwsImN1cnJlbmN5Q29kZSI6IkFSUyIsImN1cnJlbmN5U3ltYm9sIjoiJCIsImNvdW50"
+    "cnlDb2RlIjoiQVJHIiwiY3VsdHVyZUluZm8iOiJlcy1BUiIsImFkbWluX2N1dHR1cmVJbmZvIjoiZXMtQVIiLCJjaGFubmVsUHJpdmFjeSI6InB1YmxpYyJ9"
+)
+CARREFOUR_HEADERS = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept": "application/json,text/plain,*/*",
+    "Cookie": f"vtex_segment={CARREFOUR_SEGMENT}",
+}
+
+
+def search_carrefour(session: requests.Session, ean: str):
+    url = f"{CARREFOUR_BASE}/api/catalog_system/pub/products/search"
+    r = session.get(url, headers=CARREFOUR_HEADERS, params={"fq": f"alternateIds_Ean:{ean}"}, timeout=TIMEOUT)
+    r.raise_for_status()
+    return r.json()
+
+
+def fetch_carrefour_listprice(session: requests.Session, ean: str, lote: vtex.VtexBatchLookup = None) -> float:
+    data = lote.lookup(ean) if lote is not None else search_carrefour(session, ean)
+    if not data:
+        return math.nan
+    prod = data[0]
+    item = pick_item_by_ean(prod.get("items") or [], ean)
+    if not item:
+        return math.nan
+    sellers = item.get("sellers") or []
+    if not sellers:
+        return math.nan
+    co = sellers[0].get("commertialOffer") or {}
+    lp = safe_float(co.get("ListPrice"))
+    return precio(lp)
+
+
+DIA_BASE = "https://diaonline.supermercadosdia.com.ar"
+DIA_HEADERS = {"User-Agent": "Mozilla/5.0", "Accept": "application/json,text/plain,*/*"}
+
+
+def search_dia(session: requests.Session, cod_dia: str):
+    url = f"{DIA_BASE}/api/catalog_system/pub/products/search"
+    r = session.get(url, headers=DIA_HEADERS, params={"fq": f"skuId:{cod_dia}"}, timeout=TIMEOUT)
+    r.raise_for_status()
+    return r.json()
+
+
+def fetch_dia_listprice(session: requests.Session, cod_dia: str, lote: vtex.VtexBatchLookup = None) -> float:
+    data = lote.lookup(cod_dia) if lote is not None else search_dia(session, cod_dia)
+    if not data:
+        return math.nan
+    prod = data[0]
+    items = prod.get("items") or []
+    item = None
+    for it in items:
+        if str(it.get("itemId") or "").strip() == str(cod_dia).strip():
+            item = it
+            break
+    if not item and items:
+        item = items[0]
+    if not item:
+        return math.nan
+    sellers = item.get("sellers") or []
+    if not sellers:
+        return math.nan
+    co = sellers[0].get("commertialOffer") or {}
+    lp = safe_float(co.get("ListPrice"))
+    return precio(lp)
+
+
+CHANGO_BASE = "https://www.masonline.com.ar"
+CHANGO_SC = "1"
+CHANGO_SEGMENT = (
+    "eyJjYW1wYWlnbnMiOm51bGwsImNoYW5uZWwiOiIxIiwicHJpY2VUYWJsZXMiOm51bGwsInJlZ2lvbklkIjoidjIuNDdERkY5REI3QkE5NEEyMEI1ODRGRjYzQTA3RUIxQ0EiLCJ1dG1fY2FtcGFpZ24iOm51bGwsInV0bV9zb3VyY2UiOm51bGwsInV0bWlfY2FtcGFpZ24iOm51bGwsImN1cnJlbmN5Q29kZSI6IkFSUyIsImN1cnJlbmN5U3ltYm9sIjoiJCIsImNvdW50cnlDb2RlIjoiQVJHIiwiY3VsdHVyZUluZm8iOiJlcy1BUiIsImNoYW5uZWxQcml2YWN5IjoicHVibGljIn0"
+)
+CHANGO_HEADERS = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept": "application/json,text/plain,*/*",
+    "Cookie": f"vtex_segment={CHANGO_SEGMENT}",
+}
+
+
+def search_chango(session: requests.Session, ean: str):
+    url = f"{CHANGO_BASE}/api/catalog_system/pub/products/search"
+    ean = str(ean).strip()
+
+    attempts = [
+        {"fq": f"alternateIds_Ean:{ean}", "sc": CHANGO_SC},
+        {"fq": f"alternateIds_RefId:{ean}", "sc": CHANGO_SC},
+        {"ft": ean, "sc": CHANGO_SC},
+    ]
+
+    for params in attempts:
+        r = session.get(url, headers=CHANGO_HEADERS, params=params, timeout=TIMEOUT)
+        if r.status_code != 200:
+            continue
+        try:
+            data = r.json()
+        except Exception:
+            continue
+        if isinstance(data, list) and data:
+            return data
+    return []
+
+
+def fetch_chango_listprice(session: requests.Session, ean: str, lote: vtex.VtexBatchLookup = None) -> float:
+    ean = str(ean).strip()
+    data = lote.lookup(ean) if lote is not None else search_chango(session, ean)
+    if not isinstance(data, list) or not data:
+        return math.nan
+
+    prod = data[0] or {}
+    items = prod.get("items") or []
+    item = pick_item_by_ean(items, ean) or (items[0] if items else None)
+    if not item:
+        return math.nan
+
+    sellers = item.get("sellers") or []
+    if not sellers:
+        return math.nan
+
+    co = sellers[0].get("commertialOffer") or {}
+    lp = safe_float(co.get("ListPrice"))
+    return precio(lp)
+
+
+# ---- Coto helpers ----
+def cast_price(val):
+    if val is None:
+        return None
+    if isinstance(val, (int, float)):
+        return float(val)
+
+    s = str(val).strip()
+    if not s:
+        return None
+
+    s = s.replace("c/u", "").replace("c\\u002fu", "")
+    s = re.sub(r"[^\d\.,-]", "", s)
+    if not s:
+        return None
+
+    if s.count(",") == 1 and s.count(".") >= 1 and s.rfind(",") > s.rfind("."):
+        s = s.replace(".", "").replace(",", ".")
+    elif s.count(",") == 1 and s.count(".") == 0:
+        s = s.replace(",", ".")
+
+    try:
+        return float(s)
+    except Exception:
+        return None
+
+
+def fetch_coto_listprice(cliente: coto.CotoClient, ean: str, sucursal: str = "200") -> float:
+    # Cookies: el cliente hace el bootstrap una vez por corrida (y re-bootstrap ante 403)
+    BASE = coto.BASE
+    SEARCH = f"{BASE}/sitios/cdigi/categoria"
+    session = cliente.session
+
+    def _resolver():
+        params = {"Dy": "1", "Ntt": ean, "Ntk": "product.eanPrincipal", "idSucursal": sucursal, "format": "json"}
+        r = cliente.get(SEARCH, params=params, timeout=TIMEOUT)
+        if r.status_code == 403:
+            return None
+        r.raise_for_status()
+        idx = coto.IndiceEndeca(r.json(), ean=ean)
+
+        rec = idx.record_por_ean(ean)
+        if rec is not None:
+            record_id = idx.valor("record.id", rec)
+            return {"recordId": record_id} if record_id else None
+        return None
+
+    def _precio(ids):
+        product_url = f"{BASE}/sitios/cdigi/productos/_/R-{ids['recordId']}"
+        detail_url = f"{product_url}?Dy=1&idSucursal={sucursal}&format=json"
+
+        headers_detail = dict(session.headers)
+        headers_detail["Referer"] = product_url
+
+        r2 = cliente.get(detail_url, headers=headers_detail, timeout=TIMEOUT)
+        if r2.status_code == 403:
+            return math.nan
+        r2.raise_for_status()
+
+        det = coto.IndiceEndeca(r2.json(), hasta=coto.CLAVES_DETALLE)
+        det_ean = det.valor("product.eanPrincipal")
+        raw_list = det.valor("sku.activePrice")
+        # record.id que ya no apunta a este EAN (detalle vacío o de otro producto): re-resolver
+        if (det_ean is None and raw_list is None) or (det_ean is not None and str(det_ean) != str(ean)):
+            return None
+        lp = cast_price(raw_list)
+        return precio(lp)
+
+    return precio(resolucion.cache_identificadores().usar_o_resolver("Coto", ean, sucursal, _resolver, _precio))
+
+
+JUMBO_BASE = "https://www.jumbo.com.ar"
+JUMBO_SC = "32"
+JUMBO_SEGMENT = (
+    "eyJjYW1wYWlnbnMiOm51bGwsImNoYW5uZWwiOiIzMiIsInByaWNlVGFibGVzIjpudWxsLCJyZWdpb25JZCI6bnVsbCwidXRtX2NhbXBhaWduIjpudWxsLCJ1dG1fc291cmNlIjpudWxsLCJ1dG1pX2NhbXBhaWduIjpudWxsLCJjdXJyZW5jeUNvZGUiOiJBUlMiLCJjdXJyZW5jeVN5bWJvbCI6IiQiLCJjb3VudHJ5Q29kZSI6IkFSRyIsImN1bHR1cmVJbmZvIjoiZXMtQVIiLCJjaGFubmVsUHJpdmFjeSI6InB1YmxpYyJ9"
+)
+JUMBO_HEADERS = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept": "application/json,text/plain,*/*",
+    "Cookie": f"vtex_segment={JUMBO_SEGMENT}",
+}
+
+
+def search_jumbo(session: requests.Session, ean: str):
+    url = f"{JUMBO_BASE}/api/catalog_system/pub/products/search"
+    for fq in (f"alternateIds_Ean:{ean}", f"ean:{ean}"):
+        r = session.get(url, headers=JUMBO_HEADERS, params={"fq": fq, "sc": JUMBO_SC}, timeout=TIMEOUT)
+        r.raise_for_status()
+        data = r.json()
+        if data:
+            return data
+    return []
+
+
+def fetch_jumbo_listprice(session: requests.Session, ean: str, lote: vtex.VtexBatchLookup = None) -> float:
+    data = lote.lookup(ean) if lote is not None else search_jumbo(session, ean)
+    if not data:
+        return math.nan
+    prod = data[0]
+    item = pick_item_by_ean(prod.get("items") or [], ean)
+    if not item:
+        return math.nan
+    sellers = item.get("sellers") or []
+    if not sellers:
+        return math.nan
+    co = sellers[0].get("commertialOffer") or {}
+    pwd = safe_float(co.get("PriceWithoutDiscount"))
+    price = safe_float(co.get("Price"))
+    lp = pwd if (pwd and pwd > 0) else price
+    return precio(lp)
+
+
+VEA_BASE = "https://www.vea.com.ar"
+VEA_SC = "34"
+VEA_SEGMENT = (
+    "eyJjYW1wYWlnbnMiOm51bGwsImNoYW5uZWwiOiIzNCIsInByaWNlVGFibGVzIjpudWxsLCJyZWdpb25JZCI6IlUxY2phblZ0WW05aGNtZGxiblJwYm1GMk56QXdZMjl5Wkc5aVlUY3dNQT09IiwidXRtX2NhbXBhaWduIjpudWxsLCJ1dG1fc291cmNlIjpudWxsLCJ1dG1pX2NhbXBhaWduIjpudWxsLCJjdXJyZW5jeUNvZGUiOiJBUlMiLCJjdXJyZW5jeVN5bWJvbCI6IiQiLCJjb3VudHJ5Q29kZSI6IkFSRyIsImN1bHR1cmVJbmZvIjoiZXMtQVIiLCJhZG1pbl9jdWx0dXJlSW5mbyI6ImVzLUFSIiwiY2hhbm5lbFByaXZhY3kiOiJwdWJsaWMifQ"
+)
+VEA_HEADERS = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept": "application/json,text/plain,*/*",
+    "Cookie": f"vtex_segment={VEA_SEGMENT}",
+}
+
+
+def search_vea(session: requests.Session, ean: str):
+    url = f"{VEA_BASE}/api/catalog_system/pub/products/search"
+    r = session.get(url, headers=VEA_HEADERS, params={"fq": f"alternateIds_Ean:{ean}", "sc": VEA_SC}, timeout=TIMEOUT)
+    r.raise_for_status()
+    return r.json()
+
+
+def fetch_vea_listprice(session: requests.Session, ean: str, lote: vtex.VtexBatchLookup = None) -> float:
+    data = lote.lookup(ean) if lote is not None else search_vea(session, ean)
+    if not data:
+        return math.nan
+    prod = data[0]
+    item = pick_item_by_ean(prod.get("items") or [], ean)
+    if not item:
+        return math.nan
+    sellers = item.get("sellers") or []
+    if not sellers:
+        return math.nan
+    co = sellers[0].get("commertialOffer") or {}
+    pwd = safe_float(co.get("PriceWithoutDiscount"))
+    price = safe_float(co.get("Price"))
+    lp = pwd if (pwd and pwd > 0) else price
+    return precio(lp)
+
+
+def fetch_coope_listprice(session: requests.Session, cod_coope: str) -> float:
+    url = "https://api.lacoopeencasa.coop/api/articulo/detalle"
+    params = {"cod_interno": cod_coope, "simple": "false"}
+    headers = {"User-Agent": "Mozilla/5.0", "Accept": "application/json,text/plain,*/*"}
+
+    r = session.get(url, params=params, headers=headers, timeout=TIMEOUT)
+    r.raise_for_status()
+    j = r.json() if "application/json" in (r.headers.get("content-type") or "").lower() else {}
+    datos = (j or {}).get("datos") or {}
+    lp = safe_float(datos.get("precio_anterior"))
+    return precio(lp)
+
+
+LIBERTAD_BASE = "https://www.hiperlibertad.com.ar"
+LIBERTAD_HEADERS = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept": "application/json,text/plain,*/*",
+    "Content-Type": "application/json",
+}
+
+
+def search_libertad(session: requests.Session, ean: str):
+    url = f"{LIBERTAD_BASE}/api/catalog_system/pub/products/search"
+    r = session.get(url, headers=LIBERTAD_HEADERS, params={"fq": f"alternateIds_Ean:{ean}", "sc": "1"}, timeout=TIMEOUT)
+    if r.status_code != 200:
+        return []
+    return r.json()
+
+
+def libertad_sku(data, ean: str) -> str:
+    if not data:
+        return ""
+    item = pick_item_by_ean(data[0].get("items") or [], ean)
+    return str((item or {}).get("itemId") or "").strip()
+
+
+def fetch_libertad_listprice(
+    session: requests.Session,
+    ean: str,
+    lote: vtex.VtexBatchLookup = None,
+    sim: vtex.VtexBatchSimulation = None,
+) -> float:
+    BASE = LIBERTAD_BASE
+    headers = LIBERTAD_HEADERS
+
+    def _resolver():
+        data = lote.lookup(ean) if lote is not None else search_libertad(session, ean)
+        if not data:
+            return None
+        item = pick_item_by_ean(data[0].get("items") or [], ean)
+        ids = resolucion.ids_vtex(data[0], item)
+        return ids if ids["skuId"] else None
+
+    def _precio(ids):
+        sku_id = ids["skuId"]
+        if sim is not None:
+            sim_json = sim.get(sku_id, 1)
+            if not sim_json:
+                return math.nan
+        else:
+            sim_url = f"{BASE}/api/checkout/pub/orderForms/simulation"
+            payload = {"items": [{"id": sku_id, "quantity": 1, "seller": "1"}], "country": "ARG"}
+            rs = session.post(sim_url, headers=headers, params={"sc": "1"}, json=payload, timeout=TIMEOUT)
+            if rs.status_code != 200:
+                return math.nan
+            sim_json = rs.json()
+        items = sim_json.get("items") or []
+        if not items:
+            # skuId que el checkout ya no reconoce: re-resolver por catálogo
+            return None
+        lp_cents = items[0].get("listPrice")
+        try:
+            lp = float(lp_cents) / 100.0 if lp_cents else None
+        except Exception:
+            lp = None
+        return precio(lp)
+
+    # Con skuId cacheado se saltea la búsqueda en catálogo
+    return precio(resolucion.cache_identificadores().usar_o_resolver("HiperLibertad", ean, "1", _resolver, _precio))
+
+
+# =========================
+# Runner
+# =========================
+CHAIN_ORDER = ("Carrefour", "Día", "ChangoMas", "Coto", "Jumbo", "Vea", "Cooperativa", "Hiperlibertad")
+
+
+def precios_numericos(df: pd.DataFrame, cols) -> pd.DataFrame:
+    """Columnas con números como texto ('3899', '', None; el PSP del catálogo) como float, truncadas (NaN = sin dato)."""
+    num = df[list(cols)].apply(pd.to_numeric, errors="coerce").astype(float)
+    return num.where(np.isfinite(num)).apply(np.trunc)
+
+
+# Matriz de precios: una fila por producto (índice = EAN, en el orden de las filas), una columna por
+# cadena, float y NaN sin precio. Los fetchers ya devuelven floats (precio()), así que las filas de la
+# corrida son números; la matriz se arma una vez al terminar (corrida.detalle["precios"]) y dispersión,
+# % vs una cadena, mínimos y el índice vs PSP salen de ahí con operaciones por columna. El texto
+# ('1795') se arma solo para mostrar / exportar: vista_precios().
+def matriz_precios(df_prices: pd.DataFrame, chain_cols: list[str]) -> pd.DataFrame:
+    m = df_prices[list(chain_cols)].apply(pd.to_numeric, errors="coerce").astype(float)
+    m = m.where(np.isfinite(m) & (m > 0))  # NaN / 0: sin precio
+    m.index = pd.Index(df_prices["EAN"], name="EAN")
+    return m
+
+
+def vista_precios(df_prices: pd.DataFrame, chain_cols: list[str]) -> pd.DataFrame:
+    """Filas de la corrida con los precios como texto, para mostrar / exportar ('1795', '' sin precio)."""
+    out = df_prices.copy()
+    for c in chain_cols:
+        out[c] = out[c].map(format_ar_price_no_decimals).astype(object)
+    return out
+
+
+def dispersion(matriz: pd.DataFrame) -> pd.DataFrame:
+    """min / max / delta por producto entre las cadenas con precio (NaN con menos de dos)."""
+    mn, mx = matriz.min(axis=1), matriz.max(axis=1)
+    hay = matriz.count(axis=1) >= 2
+    return pd.DataFrame({"min": mn.where(hay), "max": mx.where(hay), "delta": (mx - mn).where(hay)})
+
+
+def pct_vs(matriz: pd.DataFrame, base: str = "Carrefour") -> pd.DataFrame:
+    """Diferencia relativa de cada cadena contra `base` (0.05 = 5% más cara); NaN sin alguno de los dos."""
+    if base not in matriz:
+        return matriz * np.nan
+    pct = matriz.div(matriz[base], axis=0) - 1.0
+    pct[base] = np.nan
+    return pct
+
+
+def minimos(matriz: pd.DataFrame) -> pd.DataFrame:
+    """True en las celdas con el precio más bajo de su fila (empates incluidos)."""
+    return matriz.eq(matriz.min(axis=1), axis=0)
+
+
+def build_pct_vs_table(df_prices: pd.DataFrame, chain_cols: list[str], base: str = "Carrefour",
+                       matriz: pd.DataFrame = None) -> pd.DataFrame:
+    """Tabla para mostrar / exportar: BASE_COLS + '% vs base' por cadena ('+5.0%', '' sin dato)."""
+    if matriz is None:
+        matriz = matriz_precios(df_prices, chain_cols)
+    pct = pct_vs(matriz[list(chain_cols)], base)
+    out = df_prices.reindex(columns=BASE_COLS).fillna("").reset_index(drop=True)
+    texto = pct.reset_index(drop=True).astype(object).apply(lambda col: col.map(lambda x: "" if pd.isna(x) else f"{x:+.1%}"))
+    return pd.concat([out, texto], axis=1)[BASE_COLS + list(chain_cols)]
+
+
+# Columnas por las que se puede abrir el resumen vs PSP (las que no están en el DataFrame de
+# precios salen del catálogo, por EAN)
+NIVELES_PSP = ("Categoría", "Subcategoría", "Marca", "Empresa")
+
+_psp_lock = threading.Lock()
+_psp_memo = (None, None, None)  # (productos, ids de sus metas, tabla)
+
+
+def tabla_psp(productos: dict) -> pd.DataFrame:
+    """
+    PSP (entero, NaN si falta o <= 0) + Subcategoría / Empresa por EAN, en columnas. Se arma una vez por
+    catálogo: vista() devuelve un dict nuevo en cada rerun pero con las mismas metas, así que la clave
+    son los ids de las metas.
+    """
+    global _psp_memo
+    ids = tuple(map(id, productos.values()))
+    with _psp_lock:
+        if _psp_memo[1] == ids:
+            return _psp_memo[2]
+    metas = [meta or {} for meta in productos.values()]
+    tabla = pd.DataFrame({
+        "EAN": [str(m.get("ean") or "").strip() for m in metas],
+        "_psp": [m.get("psp") for m in metas],
+        "Subcategoría": [str(m.get("subcategoría") or "").strip() for m in metas],
+        "Empresa": [str(m.get("empresa") or "").strip() for m in metas],
+    })
+    tabla = tabla[tabla["EAN"] != ""].drop_duplicates("EAN", keep="last").set_index("EAN")
+    psp = precios_numericos(tabla, ["_psp"])["_psp"]
+    tabla["_psp"] = psp.where(psp > 0)
+    with _psp_lock:
+        _psp_memo = (productos, ids, tabla)  # productos queda referenciado: los ids no se reciclan
+    return tabla
+
+
+def indices_psp(df_prices: pd.DataFrame, chain_cols: list[str], productos: dict = None,
+                matriz: pd.DataFrame = None) -> pd.DataFrame:
+    """
+    Índice precio / PSP por fila y cadena (float, NaN sin precio o sin PSP), junto con NIVELES_PSP.
+    Es la parte cara del resumen: con esto, abrirlo por cualquier nivel es un groupby.
+    Con `matriz` (matriz_precios de las mismas filas) no se vuelve a armar.
+    """
+    if productos is None:
+        productos = cargar_catalogo(CATALOGO)
+    tabla = tabla_psp(productos)
+    ean = df_prices["EAN"]
+    out = pd.DataFrame(index=df_prices.index)
+    for nivel in NIVELES_PSP:
+        out[nivel] = df_prices[nivel] if nivel in df_prices else ean.map(tabla[nivel])
+    psp = ean.map(tabla["_psp"])
+    if matriz is None:
+        matriz = matriz_precios(df_prices, chain_cols)
+    precios = matriz[list(chain_cols)].set_axis(df_prices.index)
+    indices = precios.div(psp, axis=0)
+    return pd.concat([out, indices], axis=1)
+
+
+def resumir_indices(indices: pd.DataFrame, chain_cols: list[str], por=("Categoría",)) -> pd.DataFrame:
+    """
+    Promedio del índice por `por` (niveles de NIVELES_PSP), todas las cadenas en un solo groupby.
+    Salida: enteros tipo 108 (= 1.08 * 100) como texto; vacío si no hay datos. Quedan afuera las filas
+    sin el primer nivel; un nivel de detalle vacío forma su propio grupo.
+    """
+    por = list(por)
+    claves = indices[por]
+    validas = claves[por[0]].notna() & (claves[por[0]].astype(str).str.strip() != "")
+    datos = indices.loc[validas, por + list(chain_cols)].copy()
+    for nivel in por[1:]:
+        datos[nivel] = datos[nivel].fillna("")
+    medias = datos.groupby(por, sort=True)[list(chain_cols)].mean()
+    texto = (medias * 100).round().astype(object).apply(lambda col: col.map(lambda v: "" if pd.isna(v) else str(int(v))))
+    return texto.reset_index()[por + list(chain_cols)]
+
+
+def build_resumen_por_categoria_psp(df_prices: pd.DataFrame, chain_cols: list[str], productos: dict = None,
+                                    por=("Categoría",)) -> pd.DataFrame:
+    """
+    Resumen por Categoría: índice vs PSP (precio sugerido).
+    Salida: enteros tipo 108 (= 1.08 * 100). Vacío si no hay datos.
+    El PSP sale del catálogo relevado (por defecto, la lista CATALOGO). `por` abre el resumen por más
+    niveles, ej. ("Categoría", "Marca").
+    """
+    return resumir_indices(indices_psp(df_prices, chain_cols, productos), chain_cols, por)
+
+
+CHAIN_HOSTS = {
+    "Carrefour": "www.carrefour.com.ar",
+    "Día": "diaonline.supermercadosdia.com.ar",
+    "ChangoMas": "www.masonline.com.ar",
+    "Coto": "www.cotodigital.com.ar",
+    "Jumbo": "www.jumbo.com.ar",
+    "Vea": "www.vea.com.ar",
+    "Cooperativa": "api.lacoopeencasa.coop",
+    "Hiperlibertad": "www.hiperlibertad.com.ar",
+}
+
+
+# Sucursal / sales channel de cada columna, para el historial
+CHAIN_UBICACION = {
+    "ChangoMas": CHANGO_SC,
+    "Coto": "200",
+    "Jumbo": JUMBO_SC,
+    "Vea": VEA_SC,
+    "Hiperlibertad": "1",
+}
+
+
+def build_lotes(sessions: dict, lotes: dict) -> dict:
+    """Lookups VTEX en lote por cadena (claves = columnas de CHAIN_ORDER)."""
+    def _lote(chain, base, search, headers, params, lote_key, field="alternateIds_Ean"):
+        sess = sessions[chain]
+        return vtex.VtexBatchLookup(
+            sess, base,
+            single=lambda e: search(sess, e),
+            headers=headers, params=params, field=field,
+            batch_size=lotes.get(lote_key, vtex.LOTE_DEFAULT[lote_key]),
+            timeout=TIMEOUT,
+        )
+
+    return {
+        "Carrefour": _lote("Carrefour", CARREFOUR_BASE, search_carrefour, CARREFOUR_HEADERS, None, "Carrefour"),
+        "Día": _lote("Día", DIA_BASE, search_dia, DIA_HEADERS, None, "Día", field="skuId"),
+        "ChangoMas": _lote("ChangoMas", CHANGO_BASE, search_chango, CHANGO_HEADERS, {"sc": CHANGO_SC}, "ChangoMás"),
+        "Jumbo": _lote("Jumbo", JUMBO_BASE, search_jumbo, JUMBO_HEADERS, {"sc": JUMBO_SC}, "Jumbo"),
+        "Vea": _lote("Vea", VEA_BASE, search_vea, VEA_HEADERS, {"sc": VEA_SC}, "Vea"),
+        "Hiperlibertad": _lote("Hiperlibertad", LIBERTAD_BASE, search_libertad, LIBERTAD_HEADERS, {"sc": "1"}, "HiperLibertad"),
+    }
+
+
+def relevar(cadenas=None, productos: dict = None, op: Opciones = None, on_progress=None) -> Corrida:
+    """
+    Releva el ListPrice de cada producto en las cadenas pedidas (todas por defecto).
+    Las filas quedan con BASE_COLS + una columna por cadena (corrida.detalle["cadenas"]), con el precio
+    como float (NaN sin precio); vista_precios() las pasa a texto.
+    """
+    op = op or Opciones()
+    with reintentos.presupuesto(), metricas.registro(), cache_http.descarga(op.forzar_descarga):
+        return _mercado(cadenas, productos, op, on_progress)
+
+
+def _mercado(cadenas, productos: dict, op: Opciones, on_progress=None) -> Corrida:
+    productos = cargar_catalogo(CATALOGO) if productos is None else productos
+    ubicacion = dict(CHAIN_UBICACION, Coto=op.sucursal)
+
+    # Una session por cadena: pool propio y headers que no se pisan entre cadenas
+    sessions = {name: motor.build_session(op.concurrencia) for name in CHAIN_ORDER}
+    sessions["Coto"].headers.update(coto.HEADERS_COTO)
+    cliente_coto = coto.CotoClient(sessions["Coto"], op.sucursal, timeout=TIMEOUT)
+    lotes_vtex = build_lotes(sessions, op.lotes)
+    sim_libertad = vtex.VtexBatchSimulation(
+        sessions["Hiperlibertad"],
+        LIBERTAD_BASE,
+        headers=LIBERTAD_HEADERS,
+        params={"sc": "1"},
+        batch_size=op.lote("HiperLibertad"),
+        timeout=TIMEOUT,
+    )
+
+    chain_funcs = [
+        ("Carrefour", lambda meta: fetch_carrefour_listprice(sessions["Carrefour"], meta["ean"], lote=lotes_vtex["Carrefour"])),
+        ("Día", lambda meta: fetch_dia_listprice(sessions["Día"], meta["cod_dia"], lote=lotes_vtex["Día"])),
+        ("ChangoMas", lambda meta: fetch_chango_listprice(sessions["ChangoMas"], meta["ean"], lote=lotes_vtex["ChangoMas"])),
+        ("Coto", lambda meta: fetch_coto_listprice(cliente_coto, meta["ean"], sucursal=op.sucursal)),
+        ("Jumbo", lambda meta: fetch_jumbo_listprice(sessions["Jumbo"], meta["ean"], lote=lotes_vtex["Jumbo"])),
+        ("Vea", lambda meta: fetch_vea_listprice(sessions["Vea"], meta["ean"], lote=lotes_vtex["Vea"])),
+        ("Cooperativa", lambda meta: fetch_coope_listprice(sessions["Cooperativa"], meta["cod_coope"])),
+        ("Hiperlibertad", lambda meta: fetch_libertad_listprice(
+            sessions["Hiperlibertad"], meta["ean"], lote=lotes_vtex["Hiperlibertad"], sim=sim_libertad)),
+    ]
+    if cadenas:
+        elegidas = {clave_cadena(c) for c in cadenas}
+        chain_funcs = [(name, fn) for name, fn in chain_funcs if clave_cadena(name) in elegidas]
+    chain_cols = [name for name, _ in chain_funcs]
+
+    corrida = Corrida(PAGINA, PAGINA, BASE_COLS + chain_cols, op)
+    corrida.detalle["cadenas"] = chain_cols
+
+    rows = []
+    for nombre, meta in productos.items():
+        meta = meta or {}
+        ean = str(meta.get("ean") or "").strip()
+        cod_dia = str(meta.get("cod_dia") or "").strip()
+        cod_coope = str(meta.get("cod_coope") or meta.get("cod_coop") or "").strip()
+
+        rows.append({
+            "Categoría": str(meta.get("categoría") or "").strip(),
+            "Marca": str(meta.get("marca") or "").strip(),
+            "EAN": ean,
+            "Nombre": str(nombre or "").strip(),
+            "ean": ean,
+            "cod_dia": cod_dia,
+            "cod_coope": cod_coope,
+        })
+
+    # Incremental: las celdas estables dentro de su TTL salen del historial, sin request
+    hist = historial.compartido()
+    refresco = historial.Refresco(hist, PAGINA, completo=op.completo)
+    pendientes = {c: [] for c in chain_cols}
+    for row in rows:
+        for c in chain_cols:
+            obs = refresco.reusar(c, row["ean"], ubicacion.get(c, ""))
+            if obs is None:
+                pendientes[c].append(row)
+            else:
+                row[c] = precio(obs["precio_lista"])
+                corrida.reusados.append({
+                    "EAN": row["EAN"],
+                    "Nombre": row["Nombre"],
+                    "Cadena": c,
+                    "Precio": format_ar_price_no_decimals(row[c]),
+                    "Observado": datetime.fromtimestamp(obs["ts"]).strftime("%d/%m/%Y %H:%M"),
+                })
+
+    # Fin de la última respuesta por cadena (para ver cuál acota la corrida)
+    t0 = time.time()
+    fin_por_cadena = {}
+    ids_cache = resolucion.cache_identificadores()
+    marca_ids = ids_cache.marca()
+
+    # Lotes VTEX: todas las cadenas en paralelo antes del fan-out por producto
+    prefetch_jobs = []
+    for chain_name, lote in lotes_vtex.items():
+        clave = "cod_dia" if lote.field == "skuId" else "ean"
+        claves = [r[clave] for r in pendientes.get(chain_name, [])]
+        if chain_name == "Hiperlibertad":
+            # Los EAN con skuId cacheado no necesitan catálogo
+            claves = [e for e in claves if ids_cache.get("HiperLibertad", e, "1", contar=False) is None]
+        prefetch_jobs += lote.prefetch_jobs(claves)
+    motor.run_jobs(prefetch_jobs, limite_por_host=op.concurrencia)
+
+    # HiperLibertad: con los SKUs (cacheados o del catálogo), una simulación por lote en vez de una por producto
+    lote_lib = lotes_vtex["Hiperlibertad"]
+    skus_lib = []
+    for r in pendientes.get("Hiperlibertad", []):
+        ids = ids_cache.get("HiperLibertad", r["ean"], "1", contar=False)
+        skus_lib.append(ids["skuId"] if ids else libertad_sku(lote_lib.cached(r["ean"]), r["ean"]))
+    sim_libertad.simulate(skus_lib, concurrencia=op.concurrencia)
+
+    def _job(chain_name, fn, row):
+        def _run():
+            try:
+                return fn({"ean": row["ean"], "cod_dia": row["cod_dia"], "cod_coope": row["cod_coope"]})
+            finally:
+                fin_por_cadena[chain_name] = time.time() - t0
+        return _run
+
+    # Todas las cadenas × todos los productos; el motor intercala por host
+    jobs = []
+    celdas = []
+    for chain_name, fn in chain_funcs:
+        for row in pendientes[chain_name]:
+            jobs.append((CHAIN_HOSTS[chain_name], _job(chain_name, fn, row), math.nan))
+            celdas.append((row, chain_name))
+    corrida.detalle["consultas"] = len(jobs)
+
+    valores = motor.run_jobs(jobs, limite_por_host=op.concurrencia, on_progress=on_progress)
+    for (row, chain_name), val in zip(celdas, valores):
+        row[chain_name] = math.nan if val is None else val
+
+    corrida.nota(
+        "⏱️",
+        "Fin por cadena: " + " · ".join(f"{c} {fin_por_cadena[c]:.1f}s" for c in chain_cols if c in fin_por_cadena),
+    )
+    for chain_name, lote in lotes_vtex.items():
+        if chain_name in chain_cols:
+            corrida.nota("📦", f"{chain_name} · {lote.resumen()}")
+    if "Hiperlibertad" in chain_cols:
+        corrida.nota("📦", f"Hiperlibertad · {sim_libertad.resumen()}")
+    ids_cache.guardar()
+    corrida.nota("🗂️", ids_cache.resumen(marca_ids))
+    if "Coto" in chain_cols:
+        corrida.nota("🍪", cliente_coto.resumen())
+    corrida.tiempo(len(rows))
+
+    # Una corrida = todas las cadenas, en una sola transacción (solo lo relevado, no lo reusado)
+    if op.guardar_historial:
+        hist.registrar(
+            PAGINA,
+            (
+                historial.observacion(c, row["ean"], lista=row[c], ubicacion=ubicacion.get(c, ""))
+                for row, c in celdas
+            ),
+        )
+        corrida.nota("🗄️", hist.resumen())
+    corrida.nota("♻️", refresco.resumen())
+
+    corrida.filas = [{c: row[c] for c in corrida.columnas} for row in rows]
+
+    matriz = corrida.detalle["precios"] = matriz_precios(corrida.df(), chain_cols)
+
+    # alerta de dispersión
+    max_delta = dispersion(matriz)["delta"].max()
+    if max_delta > DISPERSION_THRESHOLD_ARS:
+        corrida.avisos.append(
+            f"⚠️ Dispersión alta detectada en al menos 1 ítem: Δ máx = {max_delta:.0f} ARS (umbral {DISPERSION_THRESHOLD_ARS})"
+        )
+
+    return corrida
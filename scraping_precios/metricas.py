@@ -0,0 +1,205 @@
+# metricas.py
+# Métricas de requests por corrida: a dónde se va el tiempo de cada cadena.
+#
+# AdaptadorCache (cache_http) registra cada request que sale a la red (los hits del cache
+# HTTP no): cadena (por host), tipo de endpoint, latencia del último intento (hasta leer el
+# cuerpo), bytes, status (None = timeout / error de conexión) y reintentos. Cada relevar()
+# abre un Registro para su corrida; los workers del motor lo heredan como el presupuesto de
+# reintentos.
+# Al terminar, Corrida.tiempo() arma el resumen por (cadena, tipo): requests, p50/p95/p99,
+# tasa de error, bytes y status, y lo guarda como JSON en METRICAS_DIR, al lado del historial
+# (la barra lateral de app.py muestra los últimos). run.py también lo escribe junto a --salida.
+
+import json
+import math
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from urllib.parse import urlsplit
+
+import historial
+
+METRICAS_DIR = os.environ.get(
+    "SCRAPING_PRECIOS_METRICAS", os.path.join(os.path.dirname(historial.HISTORIAL_PATH), "metricas")
+)
+MAX_ARCHIVOS = 200
+
+CADENA_POR_HOST = {
+    "www.carrefour.com.ar": "Carrefour",
+    "diaonline.supermercadosdia.com.ar": "Día",
+    "www.masonline.com.ar": "ChangoMás",
+    "www.cotodigital.com.ar": "Coto",
+    "www.jumbo.com.ar": "Jumbo",
+    "www.vea.com.ar": "Vea",
+    "api.lacoopeencasa.coop": "Cooperativa",
+    "www.hiperlibertad.com.ar": "HiperLibertad",
+}
+
+# (fragmento del path, tipo): gana el primero que aparece en el path
+TIPOS = (
+    ("/orderForms/simulation", "simulation"),
+    ("/api/checkout/pub/orderForm", "orderForm"),
+    ("/search-promotions", "promotions"),
+    ("/products/search", "search"),
+    ("/sitios/cdigi/categoria", "search"),       # Coto: búsqueda por EAN
+    ("/products/variations", "detail"),
+    ("/sitios/cdigi/productos", "detail"),       # Coto: detalle format=json
+    ("/articulo/detalle", "detail"),             # Cooperativa
+)
+
+COLUMNAS = ("cadena", "tipo", "requests", "p50_ms", "p95_ms", "p99_ms", "error_pct", "kb", "reintentos", "status")
+
+_local = threading.local()
+
+
+def cadena_de(host: str) -> str:
+    return CADENA_POR_HOST.get(host, host)
+
+
+def tipo(url: str) -> str:
+    path = urlsplit(url).path
+    for fragmento, nombre in TIPOS:
+        if fragmento in path:
+            return nombre
+    return "otro"  # bootstrap de cookies de Coto, etc.
+
+
+def percentil(ordenados: list, p: float) -> float:
+    """Nearest-rank sobre una lista ya ordenada."""
+    if not ordenados:
+        return None
+    return ordenados[min(len(ordenados) - 1, max(0, math.ceil(p / 100 * len(ordenados)) - 1))]
+
+
+class Registro:
+    """Requests de una corrida: (cadena, tipo, segundos, bytes, status, reintentos)."""
+
+    def __init__(self):
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def request(self, url: str, segundos: float, n_bytes: int, status: int = None, reintentos: int = 0):
+        fila = (cadena_de(urlsplit(url).netloc), tipo(url), segundos, n_bytes, status, reintentos)
+        with self._lock:
+            self.requests.append(fila)
+
+    def resumen(self) -> list:
+        """Una fila (dict de COLUMNAS) por (cadena, tipo), ordenadas por tiempo total."""
+        grupos = {}
+        with self._lock:
+            for fila in self.requests:
+                grupos.setdefault(fila[:2], []).append(fila)
+        filas = []
+        for (cad, tip), reqs in sorted(grupos.items(), key=lambda kv: -sum(r[2] for r in kv[1])):
+            lat = sorted(r[2] for r in reqs)
+            errores = sum(1 for r in reqs if r[4] is None or r[4] >= 400)
+            status = Counter("error" if r[4] is None else str(r[4]) for r in reqs)
+            filas.append({
+                "cadena": cad,
+                "tipo": tip,
+                "requests": len(reqs),
+                "p50_ms": round(1000 * percentil(lat, 50)),
+                "p95_ms": round(1000 * percentil(lat, 95)),
+                "p99_ms": round(1000 * percentil(lat, 99)),
+                "error_pct": round(100 * errores / len(reqs), 1),
+                "kb": round(sum(r[3] for r in reqs) / 1024, 1),
+                "reintentos": sum(r[5] for r in reqs),
+                "status": dict(status.most_common()),
+            })
+        return filas
+
+    def nota(self) -> str:
+        """Una línea para las notas de la corrida (el detalle va al JSON y a la barra lateral)."""
+        with self._lock:
+            reqs = list(self.requests)
+        if not reqs:
+            return ""
+        lat = sorted(r[2] for r in reqs)
+        errores = sum(1 for r in reqs if r[4] is None or r[4] >= 400)
+        lento = max(self.resumen(), key=lambda f: f["p95_ms"])
+        return (
+            f"Requests: {len(reqs)} · p50 {1000 * percentil(lat, 50):.0f} ms · p95 {1000 * percentil(lat, 95):.0f} ms"
+            f" · {100 * errores / len(reqs):.1f}% errores · {sum(r[3] for r in reqs) / 1024 / 1024:.1f} MB"
+            f" · más lento: {lento['cadena']} {lento['tipo']} (p95 {lento['p95_ms']} ms)"
+        )
+
+
+@contextmanager
+def registro(r: Registro = None):
+    """Las requests de este thread (y de los workers de run_jobs) se registran en `r`."""
+    anterior = actual()
+    _local.registro = r if r is not None else Registro()
+    try:
+        yield _local.registro
+    finally:
+        _local.registro = anterior
+
+
+def actual() -> Registro:
+    return getattr(_local, "registro", None)
+
+
+def fijar(r: Registro):
+    """Para los workers del motor: heredan el registro del thread que los lanzó."""
+    _local.registro = r
+
+
+# --------------------------------------------
+# JSON
+# --------------------------------------------
+def documento(pagina: str, cadena: str, filas: list, segundos: float = None) -> dict:
+    return {
+        "pagina": pagina,
+        "cadena": cadena,
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "segundos": None if segundos is None else round(segundos, 2),
+        "filas": filas,
+    }
+
+
+def escribir(doc: dict, ruta: str):
+    """Escritura atómica (el sidebar puede estar leyendo la carpeta)."""
+    os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+    tmp = f"{ruta}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(doc, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, ruta)
+
+
+def _slug(texto: str) -> str:
+    s = unicodedata.normalize("NFKD", str(texto or "")).encode("ascii", "ignore").decode()
+    return re.sub(r"[^a-z0-9]+", "-", s.lower()).strip("-") or "x"
+
+
+def guardar(doc: dict, carpeta: str = None) -> str:
+    """Guarda el resumen en METRICAS_DIR (conserva los MAX_ARCHIVOS más nuevos); devuelve la ruta."""
+    carpeta = carpeta or METRICAS_DIR
+    nombre = f"{time.strftime('%Y%m%d-%H%M%S')}_{_slug(doc['pagina'])}_{_slug(doc['cadena'])}.json"
+    ruta = os.path.join(carpeta, nombre)
+    escribir(doc, ruta)
+    for viejo in recientes(carpeta)[MAX_ARCHIVOS:]:
+        try:
+            os.remove(viejo)
+        except OSError:
+            pass
+    return ruta
+
+
+def recientes(carpeta: str = None) -> list:
+    """Rutas de los resúmenes guardados, el más nuevo primero."""
+    carpeta = carpeta or METRICAS_DIR
+    try:
+        nombres = [n for n in os.listdir(carpeta) if n.endswith(".json")]
+    except OSError:
+        return []
+    return [os.path.join(carpeta, n) for n in sorted(nombres, reverse=True)]
+
+
+def leer(ruta: str) -> dict:
+    with open(ruta, encoding="utf-8") as f:
+        return json.load(f)
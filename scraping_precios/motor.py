@@ -0,0 +1,241 @@
+# motor.py
+# Motor de relevamiento concurrente compartido por todas las páginas.
+#
+# Cada pestaña arma su trabajo por producto (una función que devuelve la fila)
+# y lo envía acá. El motor:
+#   - ejecuta en un pool de threads, con un límite de requests en vuelo por host: la ventana
+#     AIMD de concurrencia.py (arranca en limite_por_host, sube mientras el host responde bien,
+#     se parte al medio ante 403/429/5xx/timeouts y no despacha durante un Retry-After)
+#   - despacha intercalando hosts (round-robin), así un host lento no frena al resto
+#   - devuelve los resultados en el MISMO orden en que se enviaron
+#   - si una tarea levanta excepción, usa el fallback de la pestaña ("Revisar", etc.)
+#   - llama on_progress(done, total) desde el thread que invocó (seguro para Streamlit)
+#   - deja de despachar si la corrida se cancela (trabajos.py) y levanta Cancelado
+#   - al final, una segunda pasada para los jobs cuyas requests fallaron (reintentos.py)
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlparse
+
+import requests
+
+import cache_http
+import concurrencia
+import metricas
+import reintentos
+
+DEFAULT_CONCURRENCIA = concurrencia.INICIAL
+MAX_CONCURRENCIA = concurrencia.TECHO
+
+# Streamlit es opcional: el motor también se usa fuera de la app.
+try:
+    from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+except Exception:
+    add_script_run_ctx = None
+    get_script_run_ctx = None
+
+
+class Cancelado(BaseException):
+    """
+    La corrida se canceló: no se despachan más jobs (los que estaban en vuelo terminan).
+    BaseException, como KeyboardInterrupt: los `except Exception` de los fetchers no la tapan.
+    """
+
+
+# Evento de cancelación de la corrida en curso, por thread (lo heredan los workers del motor)
+_local = threading.local()
+
+
+@contextmanager
+def cancelacion(evento: threading.Event):
+    """Todo run_jobs dentro del bloque (en este thread) se corta cuando se setea el evento."""
+    anterior = getattr(_local, "cancelar", None)
+    _local.cancelar = evento
+    try:
+        yield evento
+    finally:
+        _local.cancelar = anterior
+
+
+def chequear_cancelacion():
+    """Para loops secuenciales (sin run_jobs): levanta Cancelado si la corrida se canceló."""
+    cancelar = getattr(_local, "cancelar", None)
+    if cancelar is not None and cancelar.is_set():
+        raise Cancelado()
+
+
+def host_of(url: str) -> str:
+    """'https://www.jumbo.com.ar/api/...' -> 'www.jumbo.com.ar'"""
+    return urlparse(url).netloc or str(url)
+
+
+def build_session(pool_size: int = DEFAULT_CONCURRENCIA, headers: dict = None) -> requests.Session:
+    """
+    Session con pool de conexiones dimensionado a la concurrencia (keep-alive por host); la
+    ventana AIMD puede crecer hasta MAX_CONCURRENCIA, así que el pool también.
+    Los GET de catálogo pasan por el cache HTTP en disco compartido (cache_http).
+    """
+    s = requests.Session()
+    # pool_connections = hosts cacheados; pool_maxsize = conexiones por host
+    adapter = cache_http.AdaptadorCache(
+        pool_connections=max(10, pool_size), pool_maxsize=max(1, pool_size, MAX_CONCURRENCIA)
+    )
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    if headers:
+        s.headers.update(headers)
+    return s
+
+
+def _resolve_fallback(fallback, exc):
+    if callable(fallback):
+        return fallback(exc)
+    return fallback
+
+
+def run_jobs(jobs, limite_por_host: int = DEFAULT_CONCURRENCIA, on_progress=None):
+    """
+    Ejecuta jobs concurrentes respetando la ventana de concurrencia de cada host
+    (limite_por_host es la inicial; ver concurrencia.py).
+
+    jobs: lista de (host, fn, fallback)
+      - fn(): callable sin argumentos que hace el trabajo
+      - fallback: valor (o callable(exc)) a usar si fn levanta excepción
+    Devuelve la lista de resultados en el orden de `jobs`.
+    Los jobs con alguna request que terminó fallando (reintentos.py) se corren otra vez al final,
+    una sola, mientras quede presupuesto de reintentos para su host.
+    Levanta Cancelado si la corrida se cancela antes de despachar todo.
+    """
+    chequear_cancelacion()
+    cancelar = getattr(_local, "cancelar", None)
+    presupuesto = reintentos.actual()
+
+    jobs = list(jobs)
+    inicial = max(1, min(int(limite_por_host or 1), MAX_CONCURRENCIA))
+    results, fallidos = _pasada(jobs, inicial, on_progress, cancelar)
+    if fallidos and presupuesto is not None and not (cancelar is not None and cancelar.is_set()):
+        _segunda_pasada(jobs, results, fallidos, inicial, cancelar, presupuesto)
+    return results
+
+
+def _segunda_pasada(jobs, results, fallidos, inicial, cancelar, presupuesto):
+    """Vuelve a correr los jobs fallidos (cada uno gasta un reintento del host) y pisa sus resultados."""
+    indices = [i for i in sorted(fallidos) if presupuesto.gastar(jobs[i][0], segunda=True)]
+    if not indices:
+        return
+    try:
+        otra, siguen = _pasada([jobs[i] for i in indices], inicial, None, cancelar)
+    except Cancelado:
+        return  # quedan los resultados de la primera pasada; el que llamó ve la cancelación
+    for k, idx in enumerate(indices):
+        results[idx] = otra[k]
+        if k not in siguen:
+            presupuesto.recuperado(jobs[idx][0])
+
+
+def _pasada(jobs, inicial, on_progress, cancelar):
+    """Una pasada de run_jobs: (resultados, índices de los jobs con requests fallidas)."""
+    total = len(jobs)
+    results = [None] * total
+    fallidos = set()
+    if not total:
+        return results, fallidos
+
+    # Colas por host (respetan el orden de envío dentro de cada host)
+    colas = {}
+    for idx, (host, _fn, _fb) in enumerate(jobs):
+        colas.setdefault(host, deque()).append(idx)
+    hosts = deque(colas.keys())
+    en_vuelo = {h: 0 for h in colas}
+    control = concurrencia.compartido()
+    ventanas = {h: control.ventana(h) for h in colas}
+    for v in ventanas.values():
+        v.preparar(inicial, MAX_CONCURRENCIA)
+
+    # Fuera del script (trabajos en segundo plano, CLI) no hay contexto: sin warning
+    ctx = get_script_run_ctx(suppress_warning=True) if get_script_run_ctx else None
+    # Presupuesto de reintentos, métricas y descarga forzada de la corrida: los workers usan los de este thread
+    presupuesto = reintentos.actual()
+    registro = metricas.actual()
+    forzar = cache_http.forzada()
+
+    def _init_worker():
+        _local.cancelar = cancelar
+        reintentos.fijar(presupuesto)
+        metricas.fijar(registro)
+        cache_http.fijar(forzar)
+        if ctx is not None and add_script_run_ctx is not None:
+            add_script_run_ctx(threading.current_thread(), ctx)
+
+    def _correr(idx):
+        antes = reintentos.fallos()
+        try:
+            return jobs[idx][1]()
+        finally:
+            if reintentos.fallos() > antes:
+                fallidos.add(idx)
+
+    max_workers = min(total, MAX_CONCURRENCIA * len(colas))
+    done = 0
+    pendientes = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers, initializer=_init_worker) as pool:
+        def _despachar():
+            # Round-robin entre hosts hasta que ninguno tenga cupo o trabajo.
+            # Devuelve cuánto falta para que termine la pausa más corta de un host con trabajo.
+            if cancelar is not None and cancelar.is_set():
+                return None
+            progreso = True
+            while progreso:
+                progreso = False
+                for _ in range(len(hosts)):
+                    h = hosts[0]
+                    hosts.rotate(-1)
+                    if colas[h] and en_vuelo[h] < ventanas[h].limite and not ventanas[h].pausa():
+                        idx = colas[h].popleft()
+                        en_vuelo[h] += 1
+                        pendientes[pool.submit(_correr, idx)] = idx
+                        progreso = True
+            pausas = [p for p in (ventanas[h].pausa() for h in colas if colas[h]) if p > 0]
+            return min(pausas) if pausas else None
+
+        espera = _despachar()
+        while pendientes or espera:
+            if not pendientes:
+                # Todo lo que queda es de hosts en pausa (Retry-After)
+                time.sleep(min(espera, 0.25))
+                espera = _despachar()
+                continue
+            terminados, _ = wait(list(pendientes), timeout=espera, return_when=FIRST_COMPLETED)
+            for fut in terminados:
+                idx = pendientes.pop(fut)
+                host, _fn, fallback = jobs[idx]
+                en_vuelo[host] -= 1
+                try:
+                    results[idx] = fut.result()
+                except Exception as exc:
+                    results[idx] = _resolve_fallback(fallback, exc)
+                done += 1
+                if on_progress:
+                    on_progress(done, total)
+            espera = _despachar()
+
+    if cancelar is not None and cancelar.is_set() and done < total:
+        raise Cancelado()
+    return results, fallidos
+
+
+def map_ordered(fn, items, host: str, concurrencia: int = DEFAULT_CONCURRENCIA, fallback=None, on_progress=None):
+    """
+    Aplica fn(*item) a cada item (tupla de argumentos) contra un único host.
+    fallback(*item) arma la fila por defecto si fn levanta excepción.
+    """
+    items = list(items)
+    jobs = []
+    for item in items:
+        fb = (lambda exc, it=item: fallback(*it)) if fallback else None
+        jobs.append((host, (lambda it=item: fn(*it)), fb))
+    return run_jobs(jobs, limite_por_host=concurrencia, on_progress=on_progress)
@@ -8,13 +8,11 @@
 #    - Index < 95 -> 🔴
 # FIX: evita el error "AttributeError: module 'pandas.io.formats' has no attribute 'style'"
 #      removiendo el type-hint pd.io.formats.style.Styler (ruta interna no estable).
+# Las consultas a cada cadena viven en mercado.py (también las usa run.py).
 
-import time
-import re
 from datetime import datetime
 
 import pandas as pd
-import requests
 import streamlit as st
 
 
@@ -25,422 +23,54 @@ st.set_page_config(page_title="📊 Relevamiento de Mercado", layout="wide")
 st.title("📊 Relevar Mercado")
 st.caption("Consulta el **ListPrice** del mismo listado de EANs en todas las cadenas.")
 
-TIMEOUT = (4, 18)
-DISPERSION_THRESHOLD_ARS = 500
 WHITE_BG = "#FFFFFF"
 
 
 # =========================
 # Input único
 # =========================
-from consolidado_comparativos import productos
-st.markdown(f"**Productos cargados:** {len(productos)}")
-
+import cache_http
+import mercado
+import motor
+import panel_trabajos
+import vtex
+from corrida import Opciones, cargar_catalogo, clave_cadena
 
-# =========================
-# Utils comunes
-# =========================
-def format_ar_price_no_decimals(value):
-    """1795.0 -> '1795' (sin miles, sin decimales)."""
-    if value is None:
-        return ""
-    try:
-        v = float(value)
-        if v <= 0:
-            return ""
-        return str(int(round(v)))
-    except Exception:
-        return ""
-
-
-def safe_float(x):
-    try:
-        if x is None or x == "":
-            return None
-        return float(x)
-    except Exception:
-        return None
-
-
-def parse_price_int(s: str):
-    """'3899' -> 3899 (int)"""
-    if s is None:
-        return None
-    s = str(s).strip()
-    if not s:
-        return None
-    try:
-        return int(float(s))
-    except Exception:
-        return None
-
-
-def pick_item_by_ean(items, ean: str):
-    ean = str(ean).strip()
-    for it in items or []:
-        if str(it.get("ean") or "").strip() == ean:
-            return it
-        for ref in (it.get("referenceId") or []):
-            if str(ref.get("Value") or "").strip() == ean:
-                return it
-    return items[0] if items else None
+productos = cargar_catalogo(mercado.CATALOGO)
 
+st.markdown(f"**Productos cargados:** {len(productos)}")
 
-# =========================
-# Fetchers por cadena (ListPrice)
-# =========================
-def fetch_carrefour_listprice(session: requests.Session, ean: str) -> str:
-    COOKIE_SEGMENT = (
-        "eyJjYW1wYWlnbnMiOm51bGwsImNoYW5uZWwiOiIxIiwicHJpY2VUYWJsZXMiOm51bGwsInJlZ2lvbklkIjpudWxsLCJ1dG1fY2FtcGFpZ24iOm51bGws"
-        "InV0bV9zb3VyY2UiOm51bGwsInV0bWlfY2FtcGFpZ24iOm51bGwsImN1cnJlbmN5Q29kZSI6IkFSUyIsImN1cnJlbmN5U3ltYm9sIjoiJCIsImNvdW50"
-        "cnlDb2RlIjoiQVJHIiwiY3VsdHVyZUluZm8iOiJlcy1BUiIsImFkbWluX2N1dHR1cmVJbmZvIjoiZXMtQVIiLCJjaGFubmVsUHJpdmFjeSI6InB1YmxpYyJ9"
+with st.sidebar:
+    concurrencia = st.slider(
+        "Concurrencia inicial por cadena",
+        min_value=1,
+        max_value=motor.MAX_CONCURRENCIA,
+        value=motor.DEFAULT_CONCURRENCIA,
+        help="Requests simultáneos por host al arrancar."
+        " Se ajusta sola: sube mientras la cadena responde bien y se parte al medio"
+        " ante 403/429/5xx o timeouts (respetando Retry-After). Todas las cadenas corren en paralelo.",
     )
-    headers = {
-        "User-Agent": "Mozilla/5.0",
-        "Accept": "application/json,text/plain,*/*",
-        "Cookie": f"vtex_segment={COOKIE_SEGMENT}",
-    }
-    url = "https://www.carrefour.com.ar/api/catalog_system/pub/products/search"
-    r = session.get(url, headers=headers, params={"fq": f"alternateIds_Ean:{ean}"}, timeout=TIMEOUT)
-    r.raise_for_status()
-    data = r.json()
-    if not data:
-        return ""
-    prod = data[0]
-    item = pick_item_by_ean(prod.get("items") or [], ean)
-    if not item:
-        return ""
-    sellers = item.get("sellers") or []
-    if not sellers:
-        return ""
-    co = sellers[0].get("commertialOffer") or {}
-    lp = safe_float(co.get("ListPrice"))
-    return format_ar_price_no_decimals(lp)
-
-
-def fetch_dia_listprice(session: requests.Session, cod_dia: str) -> str:
-    headers = {"User-Agent": "Mozilla/5.0", "Accept": "application/json,text/plain,*/*"}
-    url = "https://diaonline.supermercadosdia.com.ar/api/catalog_system/pub/products/search"
-    r = session.get(url, headers=headers, params={"fq": f"skuId:{cod_dia}"}, timeout=TIMEOUT)
-    r.raise_for_status()
-    data = r.json()
-    if not data:
-        return ""
-    prod = data[0]
-    items = prod.get("items") or []
-    item = None
-    for it in items:
-        if str(it.get("itemId") or "").strip() == str(cod_dia).strip():
-            item = it
-            break
-    if not item and items:
-        item = items[0]
-    if not item:
-        return ""
-    sellers = item.get("sellers") or []
-    if not sellers:
-        return ""
-    co = sellers[0].get("commertialOffer") or {}
-    lp = safe_float(co.get("ListPrice"))
-    return format_ar_price_no_decimals(lp)
-
-
-def fetch_chango_listprice(session: requests.Session, ean: str) -> str:
-    BASE_CM = "https://www.masonline.com.ar"
-    DEFAULT_SEGMENT = (
-        "eyJjYW1wYWlnbnMiOm51bGwsImNoYW5uZWwiOiIxIiwicHJpY2VUYWJsZXMiOm51bGwsInJlZ2lvbklkIjoidjIuNDdERkY5REI3QkE5NEEyMEI1ODRGRjYzQTA3RUIxQ0EiLCJ1dG1fY2FtcGFpZ24iOm51bGwsInV0bV9zb3VyY2UiOm51bGwsInV0bWlfY2FtcGFpZ24iOm51bGwsImN1cnJlbmN5Q29kZSI6IkFSUyIsImN1cnJlbmN5U3ltYm9sIjoiJCIsImNvdW50cnlDb2RlIjoiQVJHIiwiY3VsdHVyZUluZm8iOiJlcy1BUiIsImNoYW5uZWxQcml2YWN5IjoicHVibGljIn0"
-    )
-    headers = {
-        "User-Agent": "Mozilla/5.0",
-        "Accept": "application/json,text/plain,*/*",
-        "Cookie": f"vtex_segment={DEFAULT_SEGMENT}",
-    }
-
-    url = f"{BASE_CM}/api/catalog_system/pub/products/search"
-    ean = str(ean).strip()
-    sc = "1"
-
-    attempts = [
-        {"fq": f"alternateIds_Ean:{ean}", "sc": sc},
-        {"fq": f"alternateIds_RefId:{ean}", "sc": sc},
-        {"ft": ean, "sc": sc},
-    ]
-
-    for params in attempts:
-        r = session.get(url, headers=headers, params=params, timeout=TIMEOUT)
-        if r.status_code != 200:
-            continue
-        try:
-            data = r.json()
-        except Exception:
-            continue
-        if not isinstance(data, list) or not data:
-            continue
-
-        prod = data[0] or {}
-        items = prod.get("items") or []
-        item = pick_item_by_ean(items, ean) or (items[0] if items else None)
-        if not item:
-            return ""
-
-        sellers = item.get("sellers") or []
-        if not sellers:
-            return ""
-
-        co = sellers[0].get("commertialOffer") or {}
-        lp = safe_float(co.get("ListPrice"))
-        return format_ar_price_no_decimals(lp)
-
-    return ""
-
-
-# ---- Coto helpers ----
-def cast_price(val):
-    if val is None:
-        return None
-    if isinstance(val, (int, float)):
-        return float(val)
-
-    s = str(val).strip()
-    if not s:
-        return None
-
-    s = s.replace("c/u", "").replace("c\\u002fu", "")
-    s = re.sub(r"[^\d\.,-]", "", s)
-    if not s:
-        return None
-
-    if s.count(",") == 1 and s.count(".") >= 1 and s.rfind(",") > s.rfind("."):
-        s = s.replace(".", "").replace(",", ".")
-    elif s.count(",") == 1 and s.count(".") == 0:
-        s = s.replace(",", ".")
-
-    try:
-        return float(s)
-    except Exception:
-        return None
-
-
-def find_key_recursive(obj, key):
-    if isinstance(obj, dict):
-        if key in obj:
-            return obj[key]
-        for v in obj.values():
-            r = find_key_recursive(v, key)
-            if r is not None:
-                return r
-    elif isinstance(obj, list):
-        for it in obj:
-            r = find_key_recursive(it, key)
-            if r is not None:
-                return r
-    return None
-
-
-def coerce_first(x):
-    return (x[0] if isinstance(x, list) and x else x)
-
-
-def iter_records(node):
-    if isinstance(node, dict):
-        if any(k in node for k in ("record.id", "product.repositoryId", "product.displayName", "product.eanPrincipal")):
-            yield node
-        for v in node.values():
-            yield from iter_records(v)
-    elif isinstance(node, list):
-        for it in node:
-            yield from iter_records(it)
-
-
-def fetch_coto_listprice(session: requests.Session, ean: str, sucursal: str = "200") -> str:
-    BASE = "https://www.cotodigital.com.ar"
-    SEARCH = f"{BASE}/sitios/cdigi/categoria"
-
-    session.headers.update({
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
-        "Accept": "application/json,text/plain,*/*",
-        "Accept-Language": "es-AR,es;q=0.9,en;q=0.8",
-        "Connection": "keep-alive",
-        "DNT": "1",
-        "Referer": BASE + "/",
-        "Origin": BASE,
-    })
-
-    # warm-up cookies
-    try:
-        session.get(BASE + "/", timeout=TIMEOUT)
-    except Exception:
-        pass
-
-    params = {"Dy": "1", "Ntt": ean, "Ntk": "product.eanPrincipal", "idSucursal": sucursal, "format": "json"}
-    r = session.get(SEARCH, params=params, timeout=TIMEOUT)
-    if r.status_code == 403:
-        return ""
-    r.raise_for_status()
-    data = r.json()
-
-    record_id = None
-    for rec in iter_records(data):
-        e = coerce_first(find_key_recursive(rec, "product.eanPrincipal"))
-        if str(e) == str(ean):
-            record_id = coerce_first(find_key_recursive(rec, "record.id"))
-            break
-    if not record_id:
-        return ""
-
-    product_url = f"{BASE}/sitios/cdigi/productos/_/R-{record_id}"
-    detail_url = f"{product_url}?Dy=1&idSucursal={sucursal}&format=json"
-
-    headers_detail = dict(session.headers)
-    headers_detail["Referer"] = product_url
-
-    r2 = session.get(detail_url, headers=headers_detail, timeout=TIMEOUT)
-    if r2.status_code == 403:
-        return ""
-    r2.raise_for_status()
-
-    det = r2.json()
-    raw_list = coerce_first(find_key_recursive(det, "sku.activePrice"))
-    lp = cast_price(raw_list)
-    return format_ar_price_no_decimals(lp)
-
-
-def fetch_jumbo_listprice(session: requests.Session, ean: str) -> str:
-    BASE = "https://www.jumbo.com.ar"
-    SC = "32"
-    VTEX_SEGMENT = (
-        "eyJjYW1wYWlnbnMiOm51bGwsImNoYW5uZWwiOiIzMiIsInByaWNlVGFibGVzIjpudWxsLCJyZWdpb25JZCI6bnVsbCwidXRtX2NhbXBhaWduIjpudWxsLCJ1dG1fc291cmNlIjpudWxsLCJ1dG1pX2NhbXBhaWduIjpudWxsLCJjdXJyZW5jeUNvZGUiOiJBUlMiLCJjdXJyZW5jeVN5bWJvbCI6IiQiLCJjb3VudHJ5Q29kZSI6IkFSRyIsImN1bHR1cmVJbmZvIjoiZXMtQVIiLCJjaGFubmVsUHJpdmFjeSI6InB1YmxpYyJ9"
+    with st.expander("Lotes VTEX (productos por request)"):
+        lotes = {
+            cadena: st.number_input(cadena, min_value=1, max_value=vtex.MAX_LOTE, value=n, key=f"lote_{cadena}")
+            for cadena, n in vtex.LOTE_DEFAULT.items()
+        }
+    refresco_completo = st.checkbox(
+        "Refresco completo",
+        value=False,
+        help="Releva todas las celdas. Si no, las de precio estable dentro de su TTL se toman del historial.",
     )
-    headers = {
-        "User-Agent": "Mozilla/5.0",
-        "Accept": "application/json,text/plain,*/*",
-        "Cookie": f"vtex_segment={VTEX_SEGMENT}",
-    }
-    url = f"{BASE}/api/catalog_system/pub/products/search"
-
-    for fq in (f"alternateIds_Ean:{ean}", f"ean:{ean}"):
-        r = session.get(url, headers=headers, params={"fq": fq, "sc": SC}, timeout=TIMEOUT)
-        r.raise_for_status()
-        data = r.json()
-        if data:
-            prod = data[0]
-            item = pick_item_by_ean(prod.get("items") or [], ean)
-            if not item:
-                return ""
-            sellers = item.get("sellers") or []
-            if not sellers:
-                return ""
-            co = sellers[0].get("commertialOffer") or {}
-            pwd = safe_float(co.get("PriceWithoutDiscount"))
-            price = safe_float(co.get("Price"))
-            lp = pwd if (pwd and pwd > 0) else price
-            return format_ar_price_no_decimals(lp)
-    return ""
-
-
-def fetch_vea_listprice(session: requests.Session, ean: str) -> str:
-    BASE = "https://www.vea.com.ar"
-    SC = "34"
-    VTEX_SEGMENT = (
-        "eyJjYW1wYWlnbnMiOm51bGwsImNoYW5uZWwiOiIzNCIsInByaWNlVGFibGVzIjpudWxsLCJyZWdpb25JZCI6IlUxY2phblZ0WW05aGNtZGxiblJwYm1GMk56QXdZMjl5Wkc5aVlUY3dNQT09IiwidXRtX2NhbXBhaWduIjpudWxsLCJ1dG1fc291cmNlIjpudWxsLCJ1dG1pX2NhbXBhaWduIjpudWxsLCJjdXJyZW5jeUNvZGUiOiJBUlMiLCJjdXJyZW5jeVN5bWJvbCI6IiQiLCJjb3VudHJ5Q29kZSI6IkFSRyIsImN1bHR1cmVJbmZvIjoiZXMtQVIiLCJhZG1pbl9jdWx0dXJlSW5mbyI6ImVzLUFSIiwiY2hhbm5lbFByaXZhY3kiOiJwdWJsaWMifQ"
+    forzar_descarga = st.checkbox(
+        "Forzar descarga (ignorar cache HTTP)",
+        value=cache_http.BYPASS_ENV,
+        help="No usa las respuestas de catálogo guardadas en disco; las nuevas se guardan igual.",
     )
-    headers = {
-        "User-Agent": "Mozilla/5.0",
-        "Accept": "application/json,text/plain,*/*",
-        "Cookie": f"vtex_segment={VTEX_SEGMENT}",
-    }
-    url = f"{BASE}/api/catalog_system/pub/products/search"
-
-    r = session.get(url, headers=headers, params={"fq": f"alternateIds_Ean:{ean}", "sc": SC}, timeout=TIMEOUT)
-    r.raise_for_status()
-    data = r.json()
-    if not data:
-        return ""
-    prod = data[0]
-    item = pick_item_by_ean(prod.get("items") or [], ean)
-    if not item:
-        return ""
-    sellers = item.get("sellers") or []
-    if not sellers:
-        return ""
-    co = sellers[0].get("commertialOffer") or {}
-    pwd = safe_float(co.get("PriceWithoutDiscount"))
-    price = safe_float(co.get("Price"))
-    lp = pwd if (pwd and pwd > 0) else price
-    return format_ar_price_no_decimals(lp)
-
-
-def fetch_coope_listprice(session: requests.Session, cod_coope: str) -> str:
-    url = "https://api.lacoopeencasa.coop/api/articulo/detalle"
-    params = {"cod_interno": cod_coope, "simple": "false"}
-    headers = {"User-Agent": "Mozilla/5.0", "Accept": "application/json,text/plain,*/*"}
-
-    r = session.get(url, params=params, headers=headers, timeout=TIMEOUT)
-    r.raise_for_status()
-    j = r.json() if "application/json" in (r.headers.get("content-type") or "").lower() else {}
-    datos = (j or {}).get("datos") or {}
-    lp = safe_float(datos.get("precio_anterior"))
-    return format_ar_price_no_decimals(lp)
-
-
-def fetch_libertad_listprice(session: requests.Session, ean: str) -> str:
-    BASE = "https://www.hiperlibertad.com.ar"
-    headers = {
-        "User-Agent": "Mozilla/5.0",
-        "Accept": "application/json,text/plain,*/*",
-        "Content-Type": "application/json",
-    }
-
-    url = f"{BASE}/api/catalog_system/pub/products/search"
-    r = session.get(url, headers=headers, params={"fq": f"alternateIds_Ean:{ean}", "sc": "1"}, timeout=TIMEOUT)
-    if r.status_code != 200:
-        return ""
-    data = r.json()
-    if not data:
-        return ""
-    prod = data[0]
-    item = pick_item_by_ean(prod.get("items") or [], ean)
-    if not item:
-        return ""
-    sku_id = str(item.get("itemId") or "").strip()
-    if not sku_id:
-        return ""
-
-    sim_url = f"{BASE}/api/checkout/pub/orderForms/simulation"
-    payload = {"items": [{"id": sku_id, "quantity": 1, "seller": "1"}], "country": "ARG"}
-    rs = session.post(sim_url, headers=headers, params={"sc": "1"}, json=payload, timeout=TIMEOUT)
-    if rs.status_code != 200:
-        return ""
-    sim = rs.json()
-    items = sim.get("items") or []
-    if not items:
-        return ""
-    lp_cents = items[0].get("listPrice")
-    try:
-        lp = float(lp_cents) / 100.0 if lp_cents else None
-    except Exception:
-        lp = None
-    return format_ar_price_no_decimals(lp)
+    panel_trabajos.panel(mercado.PAGINA)
 
 
 # =========================
-# Runner
+# Estilos
 # =========================
-CHAIN_ORDER = ("Carrefour", "Día", "ChangoMas", "Coto", "Jumbo", "Vea", "Cooperativa", "Hiperlibertad")
-
-
-def compute_dispersion_row(row: dict):
-    vals = []
-    for k in CHAIN_ORDER:
-        n = parse_price_int(row.get(k))
-        if n is not None and n > 0:
-            vals.append(n)
-    if len(vals) < 2:
-        return {"min": None, "max": None, "delta": None}
-    mn, mx = min(vals), max(vals)
-    return {"min": mn, "max": mx, "delta": mx - mn}
-
-
 # ✅ FIX: sin type-hint interno (evita AttributeError al cargar el script)
 def style_white_base(sty):
     """Fondo blanco para todo (header + celdas)."""
@@ -453,28 +83,18 @@ def style_white_base(sty):
     )
 
 
-def style_prices_table_white(df: pd.DataFrame, chain_cols: list[str]):
+def style_prices_table_white(df: pd.DataFrame, chain_cols: list[str], matriz: pd.DataFrame = None):
     """Fondo blanco + negrita mínimo por fila (solo cadenas)."""
-    def _bold_min(row: pd.Series):
-        nums = []
-        for c in chain_cols:
-            n = parse_price_int(row.get(c))
-            if n is not None and n > 0:
-                nums.append(n)
-        mn = min(nums) if nums else None
-
-        styles = ["background-color: #FFFFFF;"] * len(row)
-        if mn is None:
-            return styles
-
-        for i, col in enumerate(row.index):
-            if col in chain_cols:
-                n = parse_price_int(row.get(col))
-                if n is not None and n == mn:
-                    styles[i] += " font-weight: 700;"
+    if matriz is None:
+        matriz = mercado.matriz_precios(df, chain_cols)
+    negrita = mercado.minimos(matriz[chain_cols]).to_numpy()
+
+    def _bold_min(data: pd.DataFrame):
+        styles = pd.DataFrame("background-color: #FFFFFF;", index=data.index, columns=data.columns)
+        styles[chain_cols] = styles[chain_cols].mask(negrita, "background-color: #FFFFFF; font-weight: 700;")
         return styles
 
-    sty = df.style.apply(_bold_min, axis=1)
+    sty = df.style.apply(_bold_min, axis=None)
     return style_white_base(sty)
 
 
@@ -483,75 +103,6 @@ def style_white_only(df: pd.DataFrame):
     return style_white_base(df.style)
 
 
-def build_pct_vs_carrefour_table(df_prices: pd.DataFrame, chain_cols: list[str]) -> pd.DataFrame:
-    base_cols = ["Categoría", "Marca", "EAN", "Nombre"]
-    out_rows = []
-
-    def fmt_pct(x):
-        if x is None:
-            return ""
-        try:
-            return f"{x:+.1%}"
-        except Exception:
-            return ""
-
-    for _, r in df_prices.iterrows():
-        car = parse_price_int(r.get("Carrefour"))
-        out = {k: r.get(k, "") for k in base_cols}
-
-        for c in chain_cols:
-            if c == "Carrefour":
-                out[c] = ""
-                continue
-            p = parse_price_int(r.get(c))
-            if car is None or car <= 0 or p is None:
-                out[c] = ""
-            else:
-                out[c] = fmt_pct((p / car) - 1.0)
-
-        out_rows.append(out)
-
-    return pd.DataFrame(out_rows, columns=base_cols + chain_cols)
-
-
-def build_resumen_por_categoria_psp(df_prices: pd.DataFrame, chain_cols: list[str]) -> pd.DataFrame:
-    """
-    Resumen por Categoría: índice vs PSP (precio sugerido).
-    Salida: enteros tipo 108 (= 1.08 * 100). Vacío si no hay datos.
-    """
-    psp_map = {}
-    for _, meta in productos.items():
-        meta = meta or {}
-        ean = str(meta.get("ean") or "").strip()
-        psp = parse_price_int(meta.get("psp"))
-        if ean:
-            psp_map[ean] = psp
-
-    df = df_prices.copy()
-    df["_psp"] = df["EAN"].map(psp_map)
-
-    for c in chain_cols:
-        def _idx(row):
-            p = parse_price_int(row.get(c))
-            s = row.get("_psp")
-            if p is None or s is None or s <= 0:
-                return None
-            return p / float(s)
-        df[f"_idx_{c}"] = df.apply(_idx, axis=1)
-
-    rows = []
-    cats = sorted([x for x in df["Categoría"].dropna().unique().tolist() if str(x).strip() != ""])
-    for cat in cats:
-        dcat = df[df["Categoría"] == cat]
-        out = {"Categoría": cat}
-        for c in chain_cols:
-            vals = dcat[f"_idx_{c}"].dropna()
-            out[c] = "" if len(vals) == 0 else str(int(round(vals.mean() * 100)))
-        rows.append(out)
-
-    return pd.DataFrame(rows, columns=["Categoría"] + list(chain_cols))
-
-
 def decorate_index_with_dot(df_cat: pd.DataFrame, chain_cols: list[str]) -> pd.DataFrame:
     """
     Agrega 🟢/🟡/🔴 a la izquierda del número según umbral:
@@ -582,100 +133,80 @@ def decorate_index_with_dot(df_cat: pd.DataFrame, chain_cols: list[str]) -> pd.D
     return df2
 
 
-def run_market_scan():
-    s = requests.Session()
-    base_cols = ["Categoría", "Marca", "EAN", "Nombre"]
-
-    chain_funcs = [
-        ("Carrefour", lambda meta: fetch_carrefour_listprice(s, meta["ean"])),
-        ("Día", lambda meta: fetch_dia_listprice(s, meta["cod_dia"])),
-        ("ChangoMas", lambda meta: fetch_chango_listprice(s, meta["ean"])),
-        ("Coto", lambda meta: fetch_coto_listprice(s, meta["ean"])),
-        ("Jumbo", lambda meta: fetch_jumbo_listprice(s, meta["ean"])),
-        ("Vea", lambda meta: fetch_vea_listprice(s, meta["ean"])),
-        ("Cooperativa", lambda meta: fetch_coope_listprice(s, meta["cod_coope"])),
-        ("Hiperlibertad", lambda meta: fetch_libertad_listprice(s, meta["ean"])),
-    ]
-    chain_cols = [name for name, _ in chain_funcs]
-
-    total_steps = len(productos) * len(chain_funcs)
-    prog = st.progress(0, text="Iniciando relevamiento…")
-    done = 0
-
-    rows = []
-    t0 = time.time()
-
-    for nombre, meta in productos.items():
-        meta = meta or {}
-        ean = str(meta.get("ean") or "").strip()
-        cod_dia = str(meta.get("cod_dia") or "").strip()
-        cod_coope = str(meta.get("cod_coope") or meta.get("cod_coop") or "").strip()
-
-        row = {
-            "Categoría": str(meta.get("categoría") or "").strip(),
-            "Marca": str(meta.get("marca") or "").strip(),
-            "EAN": ean,
-            "Nombre": str(nombre or "").strip(),
-            "ean": ean,
-            "cod_dia": cod_dia,
-            "cod_coope": cod_coope,
-        }
-
-        for chain_name, fn in chain_funcs:
-            val = ""
-            try:
-                val = fn({"ean": ean, "cod_dia": cod_dia, "cod_coope": cod_coope})
-                if val == "NO_ENCONTRADO":
-                    val = ""
-            except Exception:
-                val = ""
-            row[chain_name] = val
-
-            done += 1
-            prog.progress(min(done / max(1, total_steps), 1.0), text=f"Relevando… {done}/{total_steps}")
-
-        rows.append(row)
-
-    elapsed = time.time() - t0
-    prog.progress(1.0, text=f"Relevamiento completado en {elapsed:.1f}s")
-
-    df = pd.DataFrame(rows)
-    df_out = df[base_cols + chain_cols].copy()
-
-    # alerta de dispersión
-    deltas = []
-    for _, r in df_out.iterrows():
-        d = compute_dispersion_row(r.to_dict())
-        deltas.append(d["delta"] if d["delta"] is not None else 0)
-    max_delta = max(deltas) if deltas else 0
-    if max_delta and max_delta > DISPERSION_THRESHOLD_ARS:
-        st.warning(f"⚠️ Dispersión alta detectada en al menos 1 ítem: Δ máx = {max_delta} ARS (umbral {DISPERSION_THRESHOLD_ARS})")
-
-    return df_out, chain_cols
+def lanzar_market_scan(concurrencia: int = motor.DEFAULT_CONCURRENCIA, lotes: dict = None, completo: bool = False):
+    """Releva el mercado en segundo plano (sigue aunque la página se vuelva a correr)."""
+    op = Opciones(concurrencia=concurrencia, lotes=lotes, completo=completo, forzar_descarga=forzar_descarga)
+    panel_trabajos.lanzar(
+        mercado.PAGINA,
+        mercado.PAGINA,
+        lambda on_progress: mercado.relevar(productos=productos, op=op, on_progress=on_progress),
+        "Mercado",
+        op.clave(),
+    )
 
 
-# =========================
-# UI
-# =========================
-if st.button("🔍 Relevar Mercado"):
-    with st.spinner("⏳ Ejecutando relevamiento…"):
-        df_result, chain_cols = run_market_scan()
+def mostrar_market_scan(corrida):
+    st.progress(
+        1.0, text=f"Relevamiento completado en {corrida.segundos:.1f}s ({corrida.detalle['consultas']} consultas)"
+    )
+    lotes_vtex = [texto for emoji, texto in corrida.notas if emoji == "📦"]
+    for emoji, texto in corrida.notas:
+        if emoji != "📦":
+            st.caption(f"{emoji} {texto}")
+        elif texto == lotes_vtex[0]:
+            with st.expander("📦 Lotes VTEX"):
+                for linea in lotes_vtex:
+                    st.caption(linea)
+    if corrida.reusados:
+        with st.expander(f"♻️ Celdas desde el historial ({len(corrida.reusados)})"):
+            st.dataframe(pd.DataFrame(corrida.reusados), use_container_width=True)
+    for aviso in corrida.avisos:
+        st.warning(aviso)
+
+    chain_cols = corrida.detalle["cadenas"]
+    # Precios como números (EAN x cadena): todo lo de abajo sale de acá; el texto es solo para mostrar
+    matriz = corrida.detalle.get("precios")
+    if matriz is None:
+        matriz = mercado.matriz_precios(corrida.df(), chain_cols)
+    df_result = mercado.vista_precios(corrida.df(), chain_cols)
 
     st.success("✅ Relevamiento finalizado")
 
     # ✅ Resumen por categoría (Index vs PSP) con círculos + fondo blanco
     st.markdown("### Resumen por Categoría (Index vs PSP)")
-    df_cat_raw = build_resumen_por_categoria_psp(df_result, chain_cols=chain_cols)
+    indices_psp = mercado.indices_psp(df_result, chain_cols=chain_cols, productos=productos, matriz=matriz)
+    df_cat_raw = mercado.resumir_indices(indices_psp, chain_cols=chain_cols)
     df_cat = decorate_index_with_dot(df_cat_raw, chain_cols=chain_cols)
     st.dataframe(style_white_only(df_cat), use_container_width=True)
+    # Abrir el resumen por un nivel más: mismo índice por fila, otro groupby
+    nivel = st.selectbox("Abrir cada categoría por", ("—",) + mercado.NIVELES_PSP[1:], key="mercado_psp_nivel")
+    if nivel != "—":
+        df_nivel = mercado.resumir_indices(indices_psp, chain_cols=chain_cols, por=("Categoría", nivel))
+        st.dataframe(style_white_only(decorate_index_with_dot(df_nivel, chain_cols=chain_cols)), use_container_width=True)
 
     # ✅ Precios (fondo blanco + mínimos en negrita)
     st.markdown("### Precios (ListPrice)")
-    st.dataframe(style_prices_table_white(df_result, chain_cols=chain_cols), use_container_width=True)
-
-    # ✅ % vs Carrefour (fondo blanco)
-    st.markdown("### Diferencia % vs Carrefour")
-    df_pct = build_pct_vs_carrefour_table(df_result, chain_cols=chain_cols)
+    st.dataframe(style_prices_table_white(df_result, chain_cols=chain_cols, matriz=matriz), use_container_width=True)
+
+    disp = mercado.dispersion(matriz)
+    altos = disp["delta"] > mercado.DISPERSION_THRESHOLD_ARS
+    if altos.any():
+        with st.expander(f"⚠️ Dispersión mayor a {mercado.DISPERSION_THRESHOLD_ARS} ARS ({int(altos.sum())} productos)"):
+            df_disp = pd.concat([df_result[["Nombre"]].reset_index(drop=True), disp.reset_index()], axis=1)[altos.to_numpy()]
+            st.dataframe(
+                df_disp.sort_values("delta", ascending=False).style.format("{:.0f}", subset=["min", "max", "delta"]),
+                use_container_width=True,
+            )
+
+    # ✅ % vs una cadena (fondo blanco)
+    base = st.selectbox(
+        "Comparar contra",
+        chain_cols,
+        index=chain_cols.index("Carrefour") if "Carrefour" in chain_cols else 0,
+        key="mercado_pct_base",
+    )
+    st.markdown(f"### Diferencia % vs {base}")
+    df_pct = mercado.build_pct_vs_table(df_result, chain_cols=chain_cols, base=base, matriz=matriz)
     st.dataframe(style_white_only(df_pct), use_container_width=True)
 
     # ✅ CSVs
@@ -694,10 +225,20 @@ if st.button("🔍 Relevar Mercado"):
         mime="text/csv",
     )
     st.download_button(
-        label="⬇ Descargar CSV (Mercado - % vs Carrefour)",
+        label=f"⬇ Descargar CSV (Mercado - % vs {base})",
         data=df_pct.to_csv(index=False).encode("utf-8"),
-        file_name=f"relevar_mercado_pct_vs_carrefour_{fecha}.csv",
+        file_name=f"relevar_mercado_pct_vs_{clave_cadena(base)}_{fecha}.csv",
         mime="text/csv",
     )
-else:
+
+
+# =========================
+# UI
+# =========================
+if st.button("🔍 Relevar Mercado", disabled=panel_trabajos.en_curso(mercado.PAGINA, mercado.PAGINA)):
+    lanzar_market_scan(concurrencia, lotes=lotes, completo=refresco_completo)
+
+if panel_trabajos.actual(mercado.PAGINA, mercado.PAGINA) is None:
     st.info("Presioná **Relevar Mercado** para consultar el ListPrice en todas las cadenas.")
+else:
+    panel_trabajos.seguir(mercado.PAGINA, mercado.PAGINA, mostrar_market_scan)
@@ -0,0 +1,87 @@
+# panel_trabajos.py
+# Streamlit: lanzar relevamientos como trabajos (trabajos.py) y volver a engancharse en cada rerun.
+#
+# La sesión guarda qué trabajo corresponde a cada página + cadena; mientras corre se muestra
+# el avance en un fragmento que se refresca solo (con botón Cancelar) y, al terminar, se
+# vuelve a correr la página para mostrar el resultado con la función de cada pestaña.
+
+import streamlit as st
+
+import concurrencia
+import trabajos
+
+CLAVE = "trabajos"  # st.session_state[CLAVE] = {(pagina, cadena): id de trabajo}
+REFRESCO_S = 1.0
+
+# st.fragment (>= 1.37) / st.experimental_fragment (1.36)
+_fragmento = getattr(st, "fragment", None) or st.experimental_fragment
+
+
+def _ids() -> dict:
+    return st.session_state.setdefault(CLAVE, {})
+
+
+def lanzar(pagina: str, cadena: str, fn, etiqueta: str, opciones=None) -> trabajos.Trabajo:
+    """
+    fn(on_progress) -> Corrida corre en segundo plano; queda asociado a esta sesión.
+    Si ya corre con otras opciones, avisa y la sesión sigue el trabajo que está en curso.
+    """
+    try:
+        trabajo = trabajos.compartido().lanzar(pagina, cadena, fn, etiqueta, opciones)
+    except trabajos.EnCurso as e:
+        st.warning(f"⚠️ {e}")
+        trabajo = e.trabajo
+    _ids()[(pagina, cadena)] = trabajo.id
+    return trabajo
+
+
+def actual(pagina: str, cadena: str):
+    """Último trabajo de la sesión para la página + cadena (None si no hay o ya se descartó)."""
+    id_ = _ids().get((pagina, cadena))
+    return trabajos.compartido().get(id_) if id_ else None
+
+
+def en_curso(pagina: str, cadena: str) -> bool:
+    trabajo = actual(pagina, cadena)
+    return trabajo is not None and trabajo.en_curso
+
+
+def seguir(pagina: str, cadena: str, mostrar):
+    """Avance + Cancelar mientras corre; al terminar, mostrar(corrida)."""
+    trabajo = actual(pagina, cadena)
+    if trabajo is None:
+        return
+    if trabajo.en_curso:
+        _avance(trabajo.id)
+    elif trabajo.estado == trabajos.CANCELADO:
+        st.info(f"⏹️ {trabajo.etiqueta}: cancelado ({trabajo.hecho}/{trabajo.total} consultas en {trabajo.segundos:.1f}s)")
+    elif trabajo.estado == trabajos.ERROR:
+        st.error(f"❌ {trabajo.etiqueta}: {trabajo.error}")
+        with st.expander("Detalle del error"):
+            st.code(trabajo.traceback)
+    else:
+        mostrar(trabajo.corrida)
+
+
+@_fragmento(run_every=REFRESCO_S)
+def _avance(id_: str):
+    trabajo = trabajos.compartido().get(id_)
+    if trabajo is None or not trabajo.en_curso:
+        # Terminó: la página entera vuelve a correr y seguir() muestra el resultado
+        st.rerun()
+    texto = "Cancelando…" if trabajo.cancelando else f"Procesando… {trabajo.hecho}/{trabajo.total}"
+    st.progress(trabajo.fraccion, text=f"{texto} ({trabajo.segundos:.0f}s)")
+    ventanas = concurrencia.compartido().activas()
+    if ventanas:
+        st.caption("🎚️ " + " · ".join(v.resumen() for v in ventanas))
+    st.button("⏹️ Cancelar", key=f"cancelar_{id_}", on_click=trabajo.cancelar, disabled=trabajo.cancelando)
+
+
+def panel(pagina: str):
+    """Resumen de los trabajos de la sesión en esta página (para el sidebar)."""
+    lista = trabajos.compartido().de(id_ for (p, _c), id_ in _ids().items() if p == pagina)
+    if not lista:
+        return
+    with st.expander(f"🧵 Trabajos ({sum(t.en_curso for t in lista)} en curso)"):
+        for trabajo in lista:
+            st.caption(trabajo.resumen())
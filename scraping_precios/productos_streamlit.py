@@ -1,237 +0,0 @@
-productos = {
-    "CLIGHT LIMO ROSA VITC+D 16X20X7,5G":{"ean": "7622201682026", "cod_dia": "139870", "cod_maso": "211288627", "cod_coope": "290249", "cod_lib": "485693"},
-    "CLIGHT ANANA 2022 16X20X7G":{"ean": "7622201702625", "cod_dia": "274279", "cod_maso": "205713645", "cod_coope": "293968", "cod_lib": "497220"},
-    "CLIGHT LIMONADA 2022 16X20X8G":{"ean": "7622201702656", "cod_dia": "274273", "cod_maso": "205713578", "cod_coope": "293975", "cod_lib": "497204"},
-    "CLIGHT NAR MANGO 2022 16X20X7G":{"ean": "7622201702687", "cod_dia": "274275", "cod_maso": "205713648", "cod_coope": "293974", "cod_lib": "497227"},
-    "CLIGHT NAR DURA 2022 16X20X7.5G":{"ean": "7622201702717", "cod_dia": "274274", "cod_maso": "205713650", "cod_coope": "293969", "cod_lib": "497188"},
-    "CLIGHT MAN VER 2022 16X20X7.5G":{"ean": "7622201703059", "cod_dia": "274277", "cod_maso": "205713654", "cod_coope": "", "cod_lib": "497189"},
-    "CLIGHT MANZ DELI 2022 16X20X7G":{"ean": "7622201703080", "cod_dia": "274216", "cod_maso": "205713641", "cod_coope": "284852", "cod_lib": "497228"},
-    "CLIGHT LIMO MARACUYA 16X20X7,5G":{"ean": "7622201733834", "cod_dia": "", "cod_maso": "102940397", "cod_coope": "", "cod_lib": "512082"},
-    "CLIGHT NARANJA 2022 16X20X8G":{"ean": "7622201703110", "cod_dia": "274217", "cod_maso": "205713576", "cod_coope": "293972", "cod_lib": "497205"},
-    "CLIGHT NAR DUL 2022 16X20X7.5G":{"ean": "7622201703141", "cod_dia": "274215", "cod_maso": "205713643", "cod_coope": "293971", "cod_lib": "497259"},
-    "CLIGHT POM ROSA 2022 16X20X8G":{"ean": "7622201703172", "cod_dia": "282436", "cod_maso": "205713577", "cod_coope": "284377", "cod_lib": "497206"},
-    "CLIGHT PERA 2022 16X20X7G":{"ean": "7622201703202", "cod_dia": "", "cod_maso": "205713652", "cod_coope": "", "cod_lib": "497208"},
-    "CLIGHT MANDARINA 2022 16X20X8G":{"ean": "7622201704148", "cod_dia": "274276", "cod_maso": "214180657", "cod_coope": "284862", "cod_lib": "497260"},
-    "CLIGHT LIMONADA ARANDANOS 16X20X8G":{"ean": "7622202236846", "cod_dia": "305575", "cod_maso": "103880452", "cod_coope": "", "cod_lib": "534034"},
-    "CLIGHT POMELADA HIBISCUS 16X20X8G":{"ean": "7622202359934", "cod_dia": "309744", "cod_maso": "", "cod_coope": "", "cod_lib": ""},
-    "TANG FRUTILLA 12X20X15G":{"ean": "7622201746490", "cod_dia": "181248", "cod_maso": "214180673", "cod_coope": "", "cod_lib": "497170"},
-    "TANG NARANJA 12X20X15G":{"ean": "7622201705961", "cod_dia": "274179", "cod_maso": "214180674", "cod_coope": "294290", "cod_lib": "497171"},
-    "TANG MANZANA 12X20X15G":{"ean": "7622201705992", "cod_dia": "274181", "cod_maso": "214180676", "cod_coope": "284869", "cod_lib": "497172"},
-    "TANG NAR DULCE 12X20X15G":{"ean": "7622201735340", "cod_dia": "274180", "cod_maso": "214180677", "cod_coope": "294291", "cod_lib": "497173"},
-    "TANG NAR MANGO 12X20X15G":{"ean": "7622201735371", "cod_dia": "274182", "cod_maso": "214180678", "cod_coope": "284371", "cod_lib": "497174"},
-    "TANG LIMO DULCE 12X20X15G":{"ean": "7622201735685", "cod_dia": "274212", "cod_maso": "214180680", "cod_coope": "284372", "cod_lib": "497256"},
-    "TANG MULTIFRUTA 12X20X15G":{"ean": "7622201735715", "cod_dia": "274183", "cod_maso": "214180681", "cod_coope": "294293", "cod_lib": "497175"},
-    "TANG POM ROSA 12X20X15G":{"ean": "7622201735746", "cod_dia": "274211", "cod_maso": "214180682", "cod_coope": "294294", "cod_lib": "497176"},
-    "TANG NAR BANANA 12X20X15G":{"ean": "7622201735777", "cod_dia": "274184", "cod_maso": "214180685", "cod_coope": "294295", "cod_lib": "497177"},
-    "TANG NAR DURAZ 12X20X15G":{"ean": "7622201745707", "cod_dia": "", "cod_maso": "214180687", "cod_coope": "294296", "cod_lib": "497178"},
-    "TANG PERA 12X20X15G":{"ean": "7622201745738", "cod_dia": "", "cod_maso": "214180647", "cod_coope": "", "cod_lib": "497179"},
-    "TANG DURAZNO 12X20X15G":{"ean": "7622201745936", "cod_dia": "", "cod_maso": "214180688", "cod_coope": "", "cod_lib": "497257"},
-    "TANG MIX NAR LIM 12X20X15G":{"ean": "7622201746018", "cod_dia": "", "cod_maso": "213889542", "cod_coope": "", "cod_lib": "497180"},
-    "TANG UVA 12X20X15G":{"ean": "7622201746117", "cod_dia": "274214", "cod_maso": "214180648", "cod_coope": "", "cod_lib": "497182"},
-    "TANG ANANA 12X20X15G":{"ean": "7622201745967", "cod_dia": "274213", "cod_maso": "214180649", "cod_coope": "294302", "cod_lib": "497183"},
-    "TANG MANDARINA 12X20X15G":{"ean": "7622201733865", "cod_dia": "305576", "cod_maso": "103910385", "cod_coope": "315170", "cod_lib": "534033"},
-    "TANG GALACTICO 12X20X15G":{"ean": "7622202311482", "cod_dia": "309745", "cod_maso": "", "cod_coope": "", "cod_lib": ""},
-    "VERAO NARANJA 2022 16X20X7G":{"ean": "7622201717414", "cod_dia": "203847", "cod_maso": "214180659", "cod_coope": "", "cod_lib": "497142"},
-    "VERAO MANZANA 2022 16X20X7G":{"ean": "7622201717445", "cod_dia": "203850", "cod_maso": "214180660", "cod_coope": "", "cod_lib": "497274"},
-    "VERAO NARANJA DURAZNO 2022 16X20X7G":{"ean": "7622201717476", "cod_dia": "203849", "cod_maso": "214180661", "cod_coope": "", "cod_lib": "497275"},
-    "VERAO ANANA 2022 16X20X7G":{"ean": "7622201717506", "cod_dia": "203848", "cod_maso": "16541255", "cod_coope": "", "cod_lib": "497276"},
-    "ANILLOS CLASICOS 24X170G":{"ean": "7622201808884", "cod_dia": "274903", "cod_maso": "205576785", "cod_coope": "283896", "cod_lib": "473105"},
-    "ANILLOS CLASICOS 24X300G":{"ean": "7622201504007", "cod_dia": "", "cod_maso": "210779659", "cod_coope": "290099", "cod_lib": "486020"},
-    "BOCA DE DAMA 20X170G":{"ean": "7622201808860", "cod_dia": "274904", "cod_maso": "205576784", "cod_coope": "283897", "cod_lib": "473106"},
-    "DUQUESA TOONIX 36 PQ. X 115 GR":{"ean": "7622300742645", "cod_dia": "73265", "cod_maso": "3061867", "cod_coope": "186498", "cod_lib": "271938"},
-    "DUQUESA 12X345G ":{"ean": "7622202218729", "cod_dia": "3909", "cod_maso": "103825314", "cod_coope": "312520", "cod_lib": "528089"},
-    "DUQUESA PETIT 24X4x63G ":{"ean": "7622202220531", "cod_dia": "", "cod_maso": "", "cod_coope": "", "cod_lib": "0"},
-    "EXPRESS CLASICAS 45X103G":{"ean": "7622201388461", "cod_dia": "73911", "cod_maso": "102530372", "cod_coope": "", "cod_lib": "512163"},
-    "EXPRESS CLASICAS 15X309G":{"ean": "7622201388485", "cod_dia": "79047", "cod_maso": "102530381", "cod_coope": "", "cod_lib": "509622"},
-    "MELBA 12X360G TRIPACK":{"ean": "7794600004539", "cod_dia": "52289", "cod_maso": "208796339", "cod_coope": "100652", "cod_lib": "154091"},
-    "MELBA ANGRY BIRDS 36X120G":{"ean": "7622300829728", "cod_dia": "73264", "cod_maso": "3061740", "cod_coope": "219280", "cod_lib": "331887"},
-    "MELBA PETIT 24X4X65,5G ":{"ean": "7622202220517", "cod_dia": "", "cod_maso": "", "cod_coope": "", "cod_lib": "0"},
-    "GALLETA MILKA VAI 36X124G":{"ean": "7622202210051", "cod_dia": "", "cod_maso": "", "cod_coope": "", "cod_lib": "539857"},
-    "GALLETA MILKA CHOCO 36X124G":{"ean": "7622202210075", "cod_dia": "25357", "cod_maso": "0", "cod_coope": "316315", "cod_lib": "539858"},
-    "MINI OREO 54X50G ":{"ean": "7622201761288", "cod_dia": "175320", "cod_maso": "102535145", "cod_coope": "226274", "cod_lib": "527592"},
-    "MINI OREO WE 12X150G":{"ean": "7622202219337", "cod_dia": "", "cod_maso": "103705354", "cod_coope": "312234", "cod_lib": "528440"},
-    "OREO GOLDEN QI 12X354G":{"ean": "7622201806538", "cod_dia": "175319", "cod_maso": "205576609", "cod_coope": "284284", "cod_lib": "473556"},
-    "OREO GOLDEN QI 36X118G":{"ean": "7622201806552", "cod_dia": "283177", "cod_maso": "205576780", "cod_coope": "288807", "cod_lib": "473555"},
-    "OREO REGULAR 42X182,5G":{"ean": "7622201735821", "cod_dia": "271631", "cod_maso": "214300230", "cod_coope": "290492", "cod_lib": "503404"},
-    "OREO REG SINGLE 36X118G":{"ean": "7622201735296", "cod_dia": "271629", "cod_maso": "214300229", "cod_coope": "290324", "cod_lib": "503403"},
-    "OREO MILKSHAKE FRU 36X118G L13":{"ean": "7622202049057", "cod_dia": "", "cod_maso": "214300237", "cod_coope": "313958", "cod_lib": "533058"},
-    "OREO REG TRIPACK 12X354G":{"ean": "7622201735258", "cod_dia": "271630", "cod_maso": "214300231", "cod_coope": "290325", "cod_lib": "503405"},
-    "PEPITOS REG SINGLE 60X119G":{"ean": "7622201735906", "cod_dia": "271628", "cod_maso": "214300238", "cod_coope": "290331", "cod_lib": "503406"},
-    "TERRA CCC 24X144G ":{"ean": "7622201385279", "cod_dia": "276517", "cod_maso": "102530388", "cod_coope": "285272", "cod_lib": "507326"},
-    "TERRABUSI SCONS 36X160G":{"ean": "7622201491611", "cod_dia": "276518", "cod_maso": "207046866", "cod_coope": "", "cod_lib": "476897"},
-    "GALLETA TERRABUSI VAINILLA 60X120G":{"ean": "7622202220555", "cod_dia": "304513", "cod_maso": "103825313", "cod_coope": "", "cod_lib": "529175"},
-    "GALLETA TERRABUSI MIEL 60X120G":{"ean": "7622202220579", "cod_dia": "304512", "cod_maso": "103825312", "cod_coope": "", "cod_lib": "529176"},
-    "MINI PEPITOS 54X50G":{"ean": "7622201740399", "cod_dia": "176893", "cod_maso": "214300240", "cod_coope": "267151", "cod_lib": "507763"},
-    "PEPITOS REG TRIPACK 20X357G":{"ean": "7622201735883", "cod_dia": "271632", "cod_maso": "214300239", "cod_coope": "290330", "cod_lib": "505125"},
-    "LINCOLN CLASICAS 2023 PN 60X153G":{"ean": "7622201386719", "cod_dia": "", "cod_maso": "103705353", "cod_coope": "", "cod_lib": "529333"},
-    "LINCOLN CLASICAS 2023 60X153G":{"ean": "7622201745523", "cod_dia": "169935", "cod_maso": "", "cod_coope": "", "cod_lib": "0"},
-    "LINCOLN CLASICA TRIPACK 2023 20X459":{"ean": "7622201745547", "cod_dia": "170177", "cod_maso": "214300243", "cod_coope": "219298", "cod_lib": "507787"},
-    "LINCOLN CHOCO 60X153G":{"ean": "7622300742676", "cod_dia": "27042", "cod_maso": "3040904", "cod_coope": "186094", "cod_lib": "271825"},
-    "LINCOLN COCO 60X153G":{"ean": "7622300742713", "cod_dia": "131020", "cod_maso": "102985267", "cod_coope": "", "cod_lib": "271829"},
-    "VARIEDAD NUEVO MIX 2023 16X590G":{"ean": "7622201745585", "cod_dia": "284655", "cod_maso": "214300244", "cod_coope": "290328", "cod_lib": "503407"},
-    "CEREALITAS ARROZ RS 24X160G":{"ean": "7622201753061", "cod_dia": "105628", "cod_maso": "103265193", "cod_coope": "190250", "cod_lib": "509619"},
-    "OREO CHOCO 36X118G L13":{"ean": "7622202049033", "cod_dia": "", "cod_maso": "", "cod_coope": "313957", "cod_lib": "533059"},
-    "VARIEDAD CHOCO 24X300G":{"ean": "7622201503987", "cod_dia": "274330", "cod_maso": "214300246", "cod_coope": "296347", "cod_lib": "505127"},
-    "VARIEDAD DORADA 24X300G":{"ean": "7622201503963", "cod_dia": "289523", "cod_maso": "214300228", "cod_coope": "296348", "cod_lib": "501810"},
-    "LINCOLN CLASICAS 2023 36X219G":{"ean": "7622201735319", "cod_dia": "218419", "cod_maso": "214300242", "cod_coope": "286194", "cod_lib": "507894"},
-    "MANON L7 45X182G":{"ean": "7622201385255", "cod_dia": "290952", "cod_maso": "102530346", "cod_coope": "290907", "cod_lib": "509625"},
-    "VARIEDAD NUEVO MIX 2023 36X170G":{"ean": "7622201745639", "cod_dia": "117456", "cod_maso": "214300227", "cod_coope": "", "cod_lib": "0"},
-    "VARIEDAD NUEVO MIX 2023 20X390G":{"ean": "7622201745561", "cod_dia": "284571", "cod_maso": "214300226", "cod_coope": "290329", "cod_lib": "501808"},
-    "BELD BLUEBERRY X7 20X15X13.3G ":{"ean": "7622201448325", "cod_dia": "", "cod_maso": "205765514", "cod_coope": "284389", "cod_lib": "473670"},
-    "OREO SIN TACC 24X95G":{"ean": "7622202038099", "cod_dia": "4522", "cod_maso": "103690648", "cod_coope": "312235", "cod_lib": "525902"},
-    "CEREALITAS AVENA CACAO24 48X170G":{"ean": "7622202241505", "cod_dia": "73339", "cod_maso": "103940402", "cod_coope": "315409", "cod_lib": "531325"},
-    "CEREALITAS GRANOLA24 48X170G":{"ean": "7622202241567", "cod_dia": "6273", "cod_maso": "103940401", "cod_coope": "315408", "cod_lib": "531276"},
-    "CEREALITAS SALVADO X3 15X624G ":{"ean": "7622201746032", "cod_dia": "", "cod_maso": "102530377", "cod_coope": "308766", "cod_lib": "509621"},
-    "CEREALITAS SALVADO 45X208G":{"ean": "7622201745981", "cod_dia": "138111", "cod_maso": "102530378", "cod_coope": "298810", "cod_lib": "509620"},
-    "CEREALITAS CLASICAS X3 15X636G":{"ean": "7622201745905", "cod_dia": "147685", "cod_maso": "102530379", "cod_coope": "296346", "cod_lib": "507328"},
-    "CEREALITAS CLASICAS 45X212G":{"ean": "7622201736033", "cod_dia": "147689", "cod_maso": "102530380", "cod_coope": "296345", "cod_lib": "507327"},
-    "BUBBA GOMITA C BLUEBERRY 14X82,5GR":{"ean": "7622202216473", "cod_dia": "", "cod_maso": "104140416", "cod_coope": "315407", "cod_lib": "534159"},
-    "BUBBA GOMITA FRUTILLA CIT 14X82,5GR":{"ean": "7622202216510", "cod_dia": "", "cod_maso": "104135431", "cod_coope": "315406", "cod_lib": "534160"},
-    "BELD INF QI BLUEBERRY 14 12X12X26.6G ":{"ean": "7622201457457", "cod_dia": "", "cod_maso": "205765518", "cod_coope": "", "cod_lib": "473674"},
-    "BELD INF QI CITRUS 14 12X12X26.6G ":{"ean": "7622201457426", "cod_dia": "", "cod_maso": "205765517", "cod_coope": "", "cod_lib": "473673"},
-    "BELD INF QI SPEARM 14 12X12X26.6G ":{"ean": "7622201457396", "cod_dia": "", "cod_maso": "205765516", "cod_coope": "", "cod_lib": "473672"},
-    "BELD MANDARINA X7 20X15X13.3G ":{"ean": "7622201448288", "cod_dia": "", "cod_maso": "205765513", "cod_coope": "", "cod_lib": "473669"},
-    "BELD SPEARMINT X7 20X15X13.3G ":{"ean": "7622201448226", "cod_dia": "", "cod_maso": "205765512", "cod_coope": "284388", "cod_lib": "473668"},
-    "Beldent Botella Frutilla-Lima x 54g":{"ean": "7622202012037", "cod_dia": "", "cod_maso": "103500256", "cod_coope": "", "cod_lib": "0"},
-    "Beldent Botella Menta x 54g":{"ean": "7622202012204", "cod_dia": "", "cod_maso": "103500255", "cod_coope": "", "cod_lib": "0"},
-    "BELDENT FRUTILLA QI POSEIDON 20X20":{"ean": "77969118", "cod_dia": "271838", "cod_maso": "14995404", "cod_coope": "282569", "cod_lib": "468233"},
-    "BELDENT INF QI MENTA 14 12X12X26.6G ":{"ean": "7622201457334", "cod_dia": "", "cod_maso": "205765515", "cod_coope": "284382", "cod_lib": "473671"},
-    "BELDENT MENTA FUERTE QI POSEI 20X20":{"ean": "77969088", "cod_dia": "269579", "cod_maso": "2976561", "cod_coope": "282573", "cod_lib": "468230"},
-    "BELDENT MENTA QI POSEIDON 20X20":{"ean": "77969071", "cod_dia": "269580", "cod_maso": "13604383", "cod_coope": "282568", "cod_lib": "468229"},
-    "BELDENT MENTA X7 20X15X13.3G ":{"ean": "7622201421496", "cod_dia": "", "cod_maso": "205765510", "cod_coope": "284387", "cod_lib": "473667"},
-    "BELDENT MENTOL QI POSEIDON 20X20":{"ean": "77969095", "cod_dia": "", "cod_maso": "2976446", "cod_coope": "282572", "cod_lib": "468231"},
-    "BELDENT SANDIA 20X20 ":{"ean": "77987686", "cod_dia": "", "cod_maso": "102985266", "cod_coope": "308767", "cod_lib": "510645"},
-    "BELDENT TROPICAL MIX 20X20":{"ean": "7622202273131", "cod_dia": "", "cod_maso": "104385787", "cod_coope": "315876", "cod_lib": "537674"},
-    "BUBBA CRACKUPS  12X12X72G":{"ean": "7622202228469", "cod_dia": "", "cod_maso": "104135432", "cod_coope": "317957", "cod_lib": "534154"},
-    "BUBBA CRACKUPS  18X18X24G":{"ean": "7622202228490", "cod_dia": "305305", "cod_maso": "104430835", "cod_coope": "317958", "cod_lib": "534155"},
-    "ALFAJOR TERRABUSI X 50 GRS.":{"ean": "77939234", "cod_dia": "149060", "cod_maso": "2976528", "cod_coope": "888397", "cod_lib": "271860"},
-    "ALF TERRA GLACEADO 48 x 38gr":{"ean": "7622300202859", "cod_dia": "12481", "cod_maso": "3040963", "cod_coope": "163312", "cod_lib": "281832"},
-    "BUBBA FRUTILLA 32DX60UX5G SC":{"ean": "77982360", "cod_dia": "288530", "cod_maso": "", "cod_coope": "", "cod_lib": "524230"},
-    "BUBBA GOMITA FRUTILLA 12DX12UX15G":{"ean": "7622202216589", "cod_dia": "", "cod_maso": "104385786", "cod_coope": "", "cod_lib": "534161"},
-    "ALF. MILKA MOUSSE LECHE  54x42GR.":{"ean": "7622300759506", "cod_dia": "110564", "cod_maso": "2981248", "cod_coope": "165419", "cod_lib": "296822"},
-    "ALF SHOT PASTA DE MANI 54X44G":{"ean": "7622202304705", "cod_dia": "", "cod_maso": "", "cod_coope": "317353", "cod_lib": "541005"},
-    "ALFAJOR TERRABUSI CLÁSICO X 70 GRS.":{"ean": "77903792", "cod_dia": "23423", "cod_maso": "2976427", "cod_coope": "101765", "cod_lib": "122549"},
-    "ALFAJOR TERRABUSI TORTA X 70 GRS.":{"ean": "77903860", "cod_dia": "23426", "cod_maso": "2976449", "cod_coope": "101781", "cod_lib": "122553"},
-    "ALFAJOR MILKA MOUSSE TRIPLE X 55 GRS.":{"ean": "77903785", "cod_dia": "21721", "cod_maso": "2976555", "cod_coope": "117966", "cod_lib": "163429"},
-    "ALFAJOR MILKA TRIPLE DULCE DE LECHE X 70 GRS.":{"ean": "77903778", "cod_dia": "23428", "cod_maso": "10319627", "cod_coope": "117967", "cod_lib": "206678"},
-    "ALF MILKA TRIMOUSSE BCO 36x55G":{"ean": "7622300457303", "cod_dia": "", "cod_maso": "213959186", "cod_coope": "165423", "cod_lib": "283556"},
-    "ALFAJOR TRIPLE SHOT X 60 GRS.":{"ean": "77956699", "cod_dia": "23431", "cod_maso": "2976613", "cod_coope": "104055", "cod_lib": "122552"},
-    "ALFAJOR TRIPLE PEPITOS X 57 GRS.":{"ean": "77915481", "cod_dia": "23430", "cod_maso": "2976374", "cod_coope": "101766", "cod_lib": "163557"},
-    "ALFAJOR MILA OREO DDL":{"ean": "7622300835620", "cod_dia": "182539", "cod_maso": "15158190", "cod_coope": "231895", "cod_lib": "342794"},
-    "Alf Triple Oreo 2020 36 X 56 Gr":{"ean": "77976307", "cod_dia": "274632", "cod_maso": "205916656", "cod_coope": "286345", "cod_lib": "482971"},
-    "ALF SIMPLE TITA 54X36G":{"ean": "77908308", "cod_dia": "303490", "cod_maso": "103705352", "cod_coope": "101767", "cod_lib": "206679"},
-    "BUBBA GOMITA FRUTILLA CIT 12DX12UX16,5G":{"ean": "7622202217296", "cod_dia": "305306", "cod_maso": "104390882", "cod_coope": "315403", "cod_lib": "534153"},
-    "BUBBA GOMITA MIX CIT 12DX12UX16,5G":{"ean": "7622202217265", "cod_dia": "305304", "cod_maso": "104385785 ", "cod_coope": "315404", "cod_lib": "534152"},
-    "ALFAJOR TERRA SIN GLUTEN 42X55G":{"ean": "7622202296291", "cod_dia": "", "cod_maso": "", "cod_coope": "318464", "cod_lib": "545232"},
-    "BUBBA MENTA 32DX60UX5G  ":{"ean": "77982346", "cod_dia": "288528", "cod_maso": "", "cod_coope": "", "cod_lib": "457650"},
-    "BUBBA TUTTI 32DX60UX5G SC":{"ean": "77982353", "cod_dia": "288529", "cod_maso": "", "cod_coope": "", "cod_lib": "457651"},
-    "BUBBA UVA 32DX60UX5G SC":{"ean": "77982377", "cod_dia": "288531", "cod_maso": "", "cod_coope": "", "cod_lib": "524252"},
-    "TAB CADBURY YOG FRUT 2021 28X82G":{"ean": "7622201818715", "cod_dia": "274637", "cod_maso": "205916320", "cod_coope": "284439", "cod_lib": "473751"},
-    "TAB CADBURY TRES SUENOS 2021 28X82G":{"ean": "7622201818739", "cod_dia": "", "cod_maso": "3050242", "cod_coope": "284444", "cod_lib": "473752"},
-    "TAB CADBURY ALMENDRAS 28X82G":{"ean": "7622201807405", "cod_dia": "274636", "cod_maso": "3050311", "cod_coope": "284442", "cod_lib": "473750"},
-    "TAB CADBURY INTENSE 24X162G":{"ean": "7622201800505", "cod_dia": "", "cod_maso": "205916321", "cod_coope": "284441", "cod_lib": "473753"},
-    "TAB CADBURY YOG FRUT 2021 24X162G":{"ean": "7622201818692", "cod_dia": "", "cod_maso": "3050201", "cod_coope": "284443", "cod_lib": "473754"},
-    "CADBURY INTENSE 2021 12X12X25G":{"ean": "7622201818609", "cod_dia": "", "cod_maso": "205916664", "cod_coope": "284447", "cod_lib": "473845"},
-    "MINI RHODESIA 54X60G":{"ean": "7622300335090", "cod_dia": "20667", "cod_maso": "3040988", "cod_coope": "145355", "cod_lib": "267906"},
-    "CAR CLIGHT FRAMBUESA 30X12X26,55G EXP AR":{"ean": "7622202288319", "cod_dia": "", "cod_maso": "", "cod_coope": "317959", "cod_lib": "542815"},
-    "CAR CLIGHT NARANJA 30X12X26,55G EXP ARG":{"ean": "7622202288197", "cod_dia": "", "cod_maso": "", "cod_coope": "", "cod_lib": "542814"},
-    "CAR HALLS CHERRY 30X12X25.2G":{"ean": "7622202247286", "cod_dia": "", "cod_maso": "102535146", "cod_coope": "315921", "cod_lib": "537644"},
-    "CAR HALLS FREE MENTA 30X12X26,1G EXP ARG":{"ean": "7622202288258", "cod_dia": "", "cod_maso": "", "cod_coope": "", "cod_lib": "542817"},
-    "CAR HALLS MENTALYPTUS 30X12X25.2G":{"ean": "7622202247316", "cod_dia": "", "cod_maso": "208590488", "cod_coope": "316074", "cod_lib": "537645"},
-    "HABANITOS 54X60G":{"ean": "7622300335076", "cod_dia": "20014", "cod_maso": "3040962", "cod_coope": "144397", "cod_lib": "267907"},
-    "SNACKY 54X60G":{"ean": "7622300335052", "cod_dia": "", "cod_maso": "3041024", "cod_coope": "", "cod_lib": "268131"},
-    "MILKA BIS MILK EXP 65UNX105,6G ":{"ean": "7622210788207", "cod_dia": "249908", "cod_maso": "62535677", "cod_coope": "270578", "cod_lib": "421215"},
-    "MILKA BIS OREO 65UNX105,6G EXP":{"ean": "7622210719829", "cod_dia": "275197", "cod_maso": "142762859", "cod_coope": "277561", "cod_lib": "448194"},
-    "CAR HALLS MENTHO 30X12X25.2G":{"ean": "7622202247392", "cod_dia": "", "cod_maso": "", "cod_coope": "318402", "cod_lib": "537646"},
-    "CAR HALLS MIEL C LIM 30X12X25.65G EXP AR":{"ean": "7622202271328", "cod_dia": "", "cod_maso": "", "cod_coope": "317585", "cod_lib": "0"},
-    "LILA GO OREO 36CSEX37GR ARG":{"ean": "7622210828606", "cod_dia": "", "cod_maso": "210920373", "cod_coope": "272202", "cod_lib": "423193"},
-    "CAR HALLS SANDIA 30X12X25.2G":{"ean": "7622202247361", "cod_dia": "", "cod_maso": "102535147", "cod_coope": "316076", "cod_lib": "537643"},
-    "MILKA DDL 30X67,5G":{"ean": "7622300844943", "cod_dia": "", "cod_maso": "3041027", "cod_coope": "229924", "cod_lib": "343548"},
-    "MILKA DDL BLANCO 30X 67,5G":{"ean": "7622300844967", "cod_dia": "", "cod_maso": "7833970", "cod_coope": "229932", "cod_lib": "343549"},
-    "MILKA DDL LECHE 24X135G":{"ean": "7622300846565", "cod_dia": "", "cod_maso": "15346765", "cod_coope": "241761", "cod_lib": "347328"},
-    "CAR HALLS ST MIEL C M 30X12X25.65G EXPAR":{"ean": "7622202271298", "cod_dia": "", "cod_maso": "", "cod_coope": "318243", "cod_lib": "542812"},
-    "CAR HALLS XTRA STRONG 30X12X24,75G EXP":{"ean": "7622202271267", "cod_dia": "", "cod_maso": "", "cod_coope": "317587", "cod_lib": "542819"},
-    "MILKA CHOCO SWING 12 X 300GR":{"ean": "9012200872739", "cod_dia": "", "cod_maso": "3097442", "cod_coope": "145356", "cod_lib": "247338"},
-    "CH BELDENT GLOBO QI POSEIDON 20X20":{"ean": "77969101", "cod_dia": "270871", "cod_maso": "2976765", "cod_coope": "282571", "cod_lib": "468232"},
-    "CREMA CHANTILLY 2022 6X6X50G":{"ean": "7622201705480", "cod_dia": "297541", "cod_maso": "102565246", "cod_coope": "296332", "cod_lib": "507329"},
-    "FLAN LIGHT VAINILLA 2022 6X10X16G ":{"ean": "7622201705299", "cod_dia": "", "cod_maso": "102565247", "cod_coope": "296330", "cod_lib": "504992"},
-    "MILKA OREO 22UNX100G":{"ean": "7622300631574", "cod_dia": "", "cod_maso": "17555529", "cod_coope": "245590", "cod_lib": "540503"},
-    "FLAN VAINILLA 2022 6X6X60G ":{"ean": "7622201705268", "cod_dia": "146743", "cod_maso": "102565248", "cod_coope": "296329", "cod_lib": "503412"},
-    "Milka Oreo 300g":{"ean": "7622210277503", "cod_dia": "", "cod_maso": "20732513", "cod_coope": "271348", "cod_lib": "0"},
-    "MILKA 95G WHOLE NUTS 17CA":{"ean": "7622202257599", "cod_dia": "", "cod_maso": "104235772", "cod_coope": "316434", "cod_lib": "539315"},
-    "TAB MILKA LEG B LECH 2021 28X50G":{"ean": "7622201818937", "cod_dia": "274642", "cod_maso": "205916325", "cod_coope": "284448", "cod_lib": "473755"},
-    "TAB MILKA LEG B COMB 2021 28X50G":{"ean": "7622201818951", "cod_dia": "274863", "cod_maso": "205916327", "cod_coope": "284450", "cod_lib": "473757"},
-    "TAB MILKA LEG ALMEN 2021 28X50G":{"ean": "7622201818975", "cod_dia": "", "cod_maso": "205916326", "cod_coope": "284449", "cod_lib": "473756"},
-    "TAB MILKA LEG B LECH 2021 24X110G":{"ean": "7622201812744", "cod_dia": "274864", "cod_maso": "205916317", "cod_coope": "284436", "cod_lib": "473758"},
-    "TAB MILKA LEG B COMB 2021 24X110G":{"ean": "7622201812775", "cod_dia": "274865", "cod_maso": "205916318", "cod_coope": "284437", "cod_lib": "473759"},
-    "TAB MILKA LEG ALM 2021 24X110G":{"ean": "7622201812805", "cod_dia": "274641", "cod_maso": "205916319", "cod_coope": "284438", "cod_lib": "473760"},
-    "GEL LIGHT CEREZA 2022 12X8X25G":{"ean": "7622201819736", "cod_dia": "178684", "cod_maso": "214300222", "cod_coope": "296339", "cod_lib": "501820"},
-    "GEL LIGHT FRUT ROJOS 2022 12X8X25G":{"ean": "7622201820565", "cod_dia": "199616", "cod_maso": "214300224", "cod_coope": "296340", "cod_lib": "501826"},
-    "MKA 300G STRAWB CHEESECAKE 12CA":{"ean": "7622210678171", "cod_dia": "", "cod_maso": "103570256", "cod_coope": "", "cod_lib": "523593"},
-    "MILKA CAR Y AVELL ENT 12X300G":{"ean": "7622300134532", "cod_dia": "", "cod_maso": "103570254", "cod_coope": "", "cod_lib": "0"},
-    "MKA 100G COOKIES 22CA":{"ean": "7622201424848", "cod_dia": "", "cod_maso": "104235776", "cod_coope": "", "cod_lib": "539314"},
-    "MKA 300G TABLET ALMOND CARAMEL 12CA.":{"ean": "7622210732507", "cod_dia": "", "cod_maso": "104235775", "cod_coope": "316432", "cod_lib": "539317"},
-    "MKA 100G RASPB 22CA RO":{"ean": "7622300590062", "cod_dia": "", "cod_maso": "104235774", "cod_coope": "", "cod_lib": "539316"},
-    "MKA 250G LUFLEE CARAMEL 10CA":{"ean": "7622300757717", "cod_dia": "", "cod_maso": "104235773", "cod_coope": "316429", "cod_lib": "539313"},
-    "TAB MILKA DDL LECHE 36X29G":{"ean": "7622202322068", "cod_dia": "", "cod_maso": "104430839", "cod_coope": "317588", "cod_lib": "542127"},
-    "TAB MILKA DDL BLANCO 36X29G":{"ean": "7622202322129", "cod_dia": "", "cod_maso": "104430838", "cod_coope": "317589", "cod_lib": "542128"},
-    "GEL LIGHT FRUTILLA 2022 12X8X25G":{"ean": "7622201820596", "cod_dia": "167647", "cod_maso": "214300225", "cod_coope": "296342", "cod_lib": "501807"},
-    "GEL REG CEREZA 12X8X25G":{"ean": "7622201819699", "cod_dia": "", "cod_maso": "214223860", "cod_coope": "296338", "cod_lib": "501817"},
-    "GEL REG DURAZNO 12X8X25G":{"ean": "7622201820534", "cod_dia": "199614", "cod_maso": "214300223", "cod_coope": "296344", "cod_lib": "501818"},
-    "SHOT 20UNX170G 2020 ":{"ean": "7622300424084", "cod_dia": "121964", "cod_maso": "16277085", "cod_coope": "238785", "cod_lib": "281837"},
-    " TABLETA SHOT 36X90G VC":{"ean": "7791249451656", "cod_dia": "168862", "cod_maso": "12819370", "cod_coope": "266726", "cod_lib": "324683"},
-    "GEL REG FRAMBUESA 12X8X25G":{"ean": "7622201819668", "cod_dia": "125578", "cod_maso": "214223858", "cod_coope": "296337", "cod_lib": "501816"},
-    "GEL REG FRUTILLA 12X8X25G":{"ean": "7622201819620", "cod_dia": "146577", "cod_maso": "214300221", "cod_coope": "296336", "cod_lib": "501806"},
-    "GEL REG NARANJA 12X8X22G":{"ean": "7622201820473", "cod_dia": "", "cod_maso": "214223861", "cod_coope": "296343", "cod_lib": "501819"},
-    "GEL SIN SABOR NEW HS 16X8X14G ":{"ean": "7622201106034", "cod_dia": "", "cod_maso": "212102217", "cod_coope": "245082", "cod_lib": "358786"},
-    "HALLS FREE CHERRY 30X12X26,1G EXP ARG":{"ean": "7622202288227", "cod_dia": "", "cod_maso": "", "cod_coope": "317584", "cod_lib": "542816"},
-    "BIZCOCHUELO ROYAL VAINILLA 10X500G ":{"ean": "7622201806651", "cod_dia": "274849", "cod_maso": "103690652", "cod_coope": "296334", "cod_lib": "507895"},
-    "BIZCOCHUELO ROYAL CHOCOLATE 10X500G ":{"ean": "7622201806668", "cod_dia": "115464", "cod_maso": "103690651", "cod_coope": "296335", "cod_lib": "507572"},
-    "MILKA AIREADO COMBINADO 12X16X25G":{"ean": "7622202322181", "cod_dia": "", "cod_maso": "104430836", "cod_coope": "317591", "cod_lib": "542130"},
-    "MILKA AIREADO LECHE 12X16X25G":{"ean": "7622202322150", "cod_dia": "", "cod_maso": "104430837", "cod_coope": "317590", "cod_lib": "542129"},
-    "MILKA ALMENDRAS 4DSX21UNX55G VC ":{"ean": "7622210745620", "cod_dia": "249905", "cod_maso": "60445493", "cod_coope": "271351", "cod_lib": "423184"},
-    "MILKA ALMENDRAS 4X12X155G":{"ean": "7622300990152", "cod_dia": "224115", "cod_maso": "3040949", "cod_coope": "265279", "cod_lib": "379547"},
-    "MILKA BLANCO 4DSX21UNX55G EXP":{"ean": "7622210745583", "cod_dia": "264649", "cod_maso": "14787967", "cod_coope": "271464", "cod_lib": "423186"},
-    "MILKA CASTANA 4DSX21UNX55G EXP":{"ean": "7622210745293", "cod_dia": "283399", "cod_maso": "60445494", "cod_coope": "271466", "cod_lib": "423185"},
-    "MILKA CASTAÑAS 4X12X155G":{"ean": "7622300990183", "cod_dia": "", "cod_maso": "3040901", "cod_coope": "265280", "cod_lib": "379548"},
-    "MILKA CHOCOPAUSE OREO 4x24x45GR":{"ean": "7622201492465", "cod_dia": "260584", "cod_maso": "209671472", "cod_coope": "277562", "cod_lib": "479490"},
-    "MILKA CHOCOPAUSE REGULAR 4x24x45GR":{"ean": "7622201492717", "cod_dia": "278032", "cod_maso": "20757456", "cod_coope": "257094", "cod_lib": "479491"},
-    "MILKA LECHE 4DSX21UNX55G VC":{"ean": "7622210745224", "cod_dia": "249906", "cod_maso": "23372534", "cod_coope": "271350", "cod_lib": "423183"},
-    "MILKA LECHE 4X12X150 GRS":{"ean": "7622300990114", "cod_dia": "222262", "cod_maso": "3042832", "cod_coope": "265277", "cod_lib": "379545"},
-    "MILKA MILK 12DSX20UNX20G EXP":{"ean": "7622210795625", "cod_dia": "252365", "cod_maso": "12306371", "cod_coope": "272200", "cod_lib": "423189"},
-    "MILKA OREO BLANCO 12DSX20UNX20G EXP":{"ean": "7622210795908", "cod_dia": "252368", "cod_maso": "59357222", "cod_coope": "272201", "cod_lib": "423190"},
-    "MILKA OREO BLANCO 4DSX21UNX55G EXP":{"ean": "7622210745132", "cod_dia": "249907", "cod_maso": "60445496", "cod_coope": "271463", "cod_lib": "423188"},
-    "Milka Oreo Blanco 4X12x155g":{"ean": "7622300990213", "cod_dia": "", "cod_maso": "126462900", "cod_coope": "265278", "cod_lib": "379546"},
-    "MILKA OREO BOMBON 30DX11UX19G ARG":{"ean": "77971630", "cod_dia": "272322", "cod_maso": "201356300", "cod_coope": "282560", "cod_lib": "470566"},
-    "MOUSSE CHOCOLATE 2022 6X6X65G ":{"ean": "7622201706029", "cod_dia": "23402", "cod_maso": "102565245", "cod_coope": "296331", "cod_lib": "507762"},
-    "POLVO HORNEAR X 100 GR.":{"ean": "7622300148119", "cod_dia": "", "cod_maso": "211004651", "cod_coope": "144395", "cod_lib": "265211"},
-    "Polvo para hornear Royal 50G":{"ean": "7622201464882", "cod_dia": "48303", "cod_maso": "3057979", "cod_coope": "310873", "cod_lib": "480335"},
-    "POSTRE CHOCOLATE 2022 6X6X65G ":{"ean": "7622201705169", "cod_dia": "242463", "cod_maso": "102565249", "cod_coope": "296327", "cod_lib": "503436"},
-    "POSTRE DDL 2022 6X6X75G ":{"ean": "7622300871949", "cod_dia": "", "cod_maso": "12172493", "cod_coope": "296323", "cod_lib": "503410"},
-    "POSTRE FRUTILLA 2022 6X6X75G ":{"ean": "7622201704674", "cod_dia": "", "cod_maso": "102565254", "cod_coope": "296322", "cod_lib": "503409"},
-    "POSTRE LIGHT CHOCO 2022 6X6X50G ":{"ean": "7622201705107", "cod_dia": "", "cod_maso": "102565251", "cod_coope": "296326", "cod_lib": "503411"},
-    "POSTRE LIGHT VAINILLA 2022 6X6X43G ":{"ean": "7622201705077", "cod_dia": "", "cod_maso": "102565252", "cod_coope": "296324", "cod_lib": "507343"},
-    "POSTRE VAINILLA 2022 6X6X75G ":{"ean": "7622201704643", "cod_dia": "151420", "cod_maso": "102565255", "cod_coope": "296321", "cod_lib": "503408"},
-    "RHODESIA 12 EST. x 36U. x 22GR.":{"ean": "77995681", "cod_dia": "17932", "cod_maso": "2976708", "cod_coope": "232356", "cod_lib": "125102"},
-    "RHODESIA CHOCOLATE 12X36X22G ":{"ean": "7622201142223", "cod_dia": "262129", "cod_maso": "156386079", "cod_coope": "", "cod_lib": "451724"},
-    "SHOT 6X25X35G":{"ean": "77914217", "cod_dia": "110388", "cod_maso": "2976531", "cod_coope": "232463", "cod_lib": "202527"},
-    "SHOT BLANCO 6DSX25UNX35G EXP":{"ean": "77983992", "cod_dia": "296637", "cod_maso": "102530362", "cod_coope": "310874", "cod_lib": "499754"},
-    "TAB CADBURY TRES SUEN 2021 12X12X25":{"ean": "7622201818579", "cod_dia": "", "cod_maso": "205916663", "cod_coope": "284446", "cod_lib": "473749"},
-    "TAB CADBURY YOG FRUT 2021 12X12X29":{"ean": "7622201818654", "cod_dia": "21637", "cod_maso": "205916662", "cod_coope": "284445", "cod_lib": "473748"},
-    "TITA 12X36X19G":{"ean": "77976291", "cod_dia": "274902", "cod_maso": "205916658", "cod_coope": "284434", "cod_lib": "482973"},
-    "TOBLERONE LECHE 20x100GR.":{"ean": "7614500010013", "cod_dia": "", "cod_maso": "35251595", "cod_coope": "451171", "cod_lib": "18915"},
-    "ALF CHOC TOONIX 16PQX6X300GR":{"ean": "7622300742584", "cod_dia": "53354", "cod_maso": "3061843", "cod_coope": "186009", "cod_lib": ""},
-    "ALF. MILKA MOUSSE LECHE 24x6x42GR.":{"ean": "7622300759490", "cod_dia": "", "cod_maso": "17380472", "cod_coope": "191741", "cod_lib": ""},
-    "ALFAJOR GLACE TOONIX 16X6X38G":{"ean": "7622300742621", "cod_dia": "121965", "cod_maso": "3040960", "cod_coope": "185977", "cod_lib": ""},
-    "CLUB ORIGINAL 44PKX6UNX24G VSA SC":{"ean": "7622300990749", "cod_dia": "226391", "cod_maso": "13547439", "cod_coope": "270205", "cod_lib": ""},
-    "CLUB SC JAMON 44MPX6UNX23,5G NEW":{"ean": "7622210691835", "cod_dia": "", "cod_maso": "3061804", "cod_coope": "270204", "cod_lib": ""},
-    "MINI ALFAJOR MILKA MOUSSE 16X114G":{"ean": "7622202220074", "cod_dia": "", "cod_maso": "103830401", "cod_coope": "313146", "cod_lib": ""},
-    "MINI ALFAJOR SHOT 16X114G":{"ean": "7622202223372", "cod_dia": "", "cod_maso": "103830400", "cod_coope": "313147", "cod_lib": ""},
-    "OREO BANADAS BCO 16X119G":{"ean": "7622201745608", "cod_dia": "", "cod_maso": "214300235", "cod_coope": "", "cod_lib": ""},
-    "OREO BANADAS CHOCO 16X119G":{"ean": "7622201740368", "cod_dia": "", "cod_maso": "214300234", "cod_coope": "", "cod_lib": ""},
-    "RHODESIA TOONIX 62AGRX4PZX22GR":{"ean": "7622300742935", "cod_dia": "", "cod_maso": "2981331", "cod_coope": "186684", "cod_lib": ""},
-    "TITA 2021 AG 69X5X19G":{"ean": "7622201803285", "cod_dia": "", "cod_maso": "205916315", "cod_coope": "186008", "cod_lib": ""},
-}
-
-
-
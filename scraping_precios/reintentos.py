@@ -0,0 +1,163 @@
+# reintentos.py
+# Reintentos de transporte con backoff exponencial + jitter y un presupuesto por cadena (host).
+#
+# AdaptadorCache (cache_http) reintenta lo que sale a la red cuando falla de forma transitoria
+# (error de conexión, timeout o 5xx), solo si es idempotente: GET / HEAD y las simulaciones de
+# checkout (POST que no modifica nada). Los POST de orderForm no se reintentan acá.
+#   - hasta MAX_INTENTOS intentos; entre uno y otro, "full jitter": uniform(0, min(TOPE_S, BASE_S * 2^n)).
+#     Un Retry-After ya pone al host en pausa (concurrencia.py) y el reintento la espera antes de salir
+#   - cada reintento gasta del Presupuesto de la corrida para ese host: max(MINIMO, FRACCION x requests
+#     al host). Una cadena caída no multiplica la carga: agotado el presupuesto, falla de una.
+#   - sin presupuesto (fuera de una corrida) no se reintenta
+# Cada request que termina fallando suma a fallos() del thread: run_jobs (motor) lo usa para saber
+# qué jobs (filas) fallaron y darles una segunda pasada al final, y los memos no guardan esas
+# respuestas (si no, la segunda pasada leería el mismo fallo). Los status que el que llama sabe
+# recuperar (recuperable(): CotoClient re-bootstrapea ante un 403) no suman: si el reintento del
+# que llama también falla, ese sí cuenta.
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+MAX_INTENTOS = 3
+BASE_S = 0.5
+TOPE_S = 8.0
+MINIMO = 20
+FRACCION = 0.2
+
+# POST idempotentes: la simulación no toca ningún carrito
+POST_REINTENTABLES = ("/api/checkout/pub/orderForms/simulation",)
+
+_local = threading.local()
+
+
+def reintentable(method: str, url: str) -> bool:
+    method = (method or "").upper()
+    if method in ("GET", "HEAD"):
+        return True
+    return method == "POST" and urlsplit(url).path.rstrip("/") in POST_REINTENTABLES
+
+
+def transitorio(status: int = None) -> bool:
+    """status None = error de conexión / timeout."""
+    return status is None or status >= 500
+
+
+def espera(intento: int) -> float:
+    """Segundos antes del reintento n (1 = el primero)."""
+    return random.uniform(0, min(TOPE_S, BASE_S * 2 ** (intento - 1)))
+
+
+def dormir(segundos: float, chequeo=None):
+    """time.sleep en tramos cortos, con chequeo() (cancelación) entre tramos."""
+    hasta = time.time() + segundos
+    while True:
+        falta = hasta - time.time()
+        if falta <= 0:
+            return
+        if chequeo is not None:
+            chequeo()
+        time.sleep(min(falta, 0.25))
+
+
+class Presupuesto:
+    """Reintentos permitidos en una corrida, por host; también cuenta la segunda pasada."""
+
+    def __init__(self, minimo: int = MINIMO, fraccion: float = FRACCION):
+        self.minimo = minimo
+        self.fraccion = fraccion
+        self.requests = {}
+        self.reintentos = {}
+        self.recuperadas = {}   # requests que salieron bien después de reintentar
+        self.agotados = set()
+        self.segunda = {}       # host -> [jobs de la segunda pasada, recuperados]
+        self._lock = threading.Lock()
+
+    def _cupo(self, host: str) -> int:
+        return max(self.minimo, int(self.fraccion * self.requests.get(host, 0)))
+
+    def request(self, host: str):
+        with self._lock:
+            self.requests[host] = self.requests.get(host, 0) + 1
+
+    def gastar(self, host: str, segunda: bool = False) -> bool:
+        """
+        Toma un reintento del presupuesto del host (una request reintentada o un job de la segunda
+        pasada); False si ya no queda.
+        """
+        with self._lock:
+            usados = self.reintentos.get(host, 0) + self.segunda.get(host, [0, 0])[0]
+            if usados >= self._cupo(host):
+                self.agotados.add(host)
+                return False
+            if segunda:
+                self.segunda.setdefault(host, [0, 0])[0] += 1
+            else:
+                self.reintentos[host] = self.reintentos.get(host, 0) + 1
+            return True
+
+    def recuperada(self, host: str):
+        with self._lock:
+            self.recuperadas[host] = self.recuperadas.get(host, 0) + 1
+
+    def recuperado(self, host: str):
+        """Un job de la segunda pasada que esta vez salió bien."""
+        with self._lock:
+            self.segunda.setdefault(host, [0, 0])[1] += 1
+
+    def resumen(self) -> str:
+        partes = []
+        with self._lock:
+            hosts = sorted(set(self.reintentos) | set(self.segunda) | self.agotados)
+            for h in hosts:
+                txt = f"{h} {self.reintentos.get(h, 0)} reintentos ({self.recuperadas.get(h, 0)} ok)"
+                if h in self.segunda:
+                    n, ok = self.segunda[h]
+                    txt += f" · 2da pasada {ok}/{n}"
+                if h in self.agotados:
+                    txt += " · presupuesto agotado"
+                partes.append(txt)
+        return ("Reintentos: " + " · ".join(partes)) if partes else ""
+
+
+@contextmanager
+def presupuesto(p: Presupuesto = None):
+    """Las requests de este thread (y de los workers de run_jobs) usan el presupuesto `p`."""
+    anterior = actual()
+    _local.presupuesto = p if p is not None else Presupuesto()
+    try:
+        yield _local.presupuesto
+    finally:
+        _local.presupuesto = anterior
+
+
+def actual() -> Presupuesto:
+    return getattr(_local, "presupuesto", None)
+
+
+def fijar(p: Presupuesto):
+    """Para los workers del motor: heredan el presupuesto del thread que los lanzó."""
+    _local.presupuesto = p
+
+
+def fallos() -> int:
+    """Requests de este thread que terminaron fallando (contador que solo crece)."""
+    return getattr(_local, "fallos", 0)
+
+
+def fallo(status: int = None):
+    if status is None or status not in getattr(_local, "recuperables", ()):
+        _local.fallos = fallos() + 1
+
+
+@contextmanager
+def recuperable(*status):
+    """Las requests de este thread que terminen en `status` no cuentan como fallo (las recupera el que llama)."""
+    anterior = getattr(_local, "recuperables", ())
+    _local.recuperables = tuple(status)
+    try:
+        yield
+    finally:
+        _local.recuperables = anterior
@@ -0,0 +1,782 @@
+# relevamiento.py
+# Relevamiento de precios de lista por cadena (página 1_Relevamiento), sin Streamlit.
+#
+#   corrida = relevamiento.relevar("coto", op=Opciones(sucursal="200"), on_progress=...)
+#   corrida.df()  # EAN, Nombre, Precio (ChangoMás agrega RefId; HiperLibertad usa ListPrice)
+#
+# Cada cadena: refresco incremental (lo estable sale del historial), lookup en lote cuando
+# la cadena es VTEX, fan-out por producto en el motor y registro de lo relevado.
+
+from urllib.parse import urljoin
+
+import requests
+
+import cache_http
+import coto
+import metricas
+import motor
+import reintentos
+import resolucion
+import vtex
+from corrida import Corrida, Opciones, cargar_catalogo, clave_cadena
+from resultados import REVISAR, celdas
+
+PAGINA = "Relevamiento"
+CATALOGO = "relevamiento"  # lista del catálogo: {"Nombre": {"ean": "...", "cod_dia": "...", "cod_maso": "...", "cod_coope": "..."}}
+
+
+# ============================================
+# 🛒 Carrefour (por EAN)
+# ============================================
+COOKIE_SEGMENT_CARR = (
+    "eyJjYW1wYWlnbnMiOm51bGwsImNoYW5uZWwiOiIxIiwicHJpY2VUYWJsZXMiOm51bGwsInJlZ2lvbklkIjpudWxsLCJ1dG1fY2FtcGFpZ24iOm51bGws"
+    "InV0bV9zb3VyY2UiOm51bGwsInV0bWlfY2FtcGFpZ24iOm51bGwsImN1cnJlbmN5Q29kZSI6IkFSUyIsImN1cnJlbmN5U3ltYm9sIjoiJCIsImNvdW50"
+    "cnlDb2RlIjoiQVJHIiwiY3VsdHVyZUluZm8iOiJlcy1BUiIsImFkbWluX2N1dHR1cmVJbmZvIjoiZXMtQVIiLCJjaGFubmVsUHJpdmFjeSI6InB1YmxpYyJ9"
+)
+HEADERS_CARR = {
+    "User-Agent": "Mozilla/5.0",
+    "Cookie": f"vtex_segment={COOKIE_SEGMENT_CARR}",
+    "Accept": "application/json,text/plain,*/*",
+}
+
+
+def buscar_carrefour(session: requests.Session, ean: str):
+    url = f"https://www.carrefour.com.ar/api/catalog_system/pub/products/search?fq=alternateIds_Ean:{ean}"
+    r = session.get(url, headers=HEADERS_CARR, timeout=12)
+    return r.json()
+
+
+def relevar_carrefour(lote: vtex.VtexBatchLookup, nombre, datos):
+    ean = str(datos.get("ean") or "").strip()
+    try:
+        if not ean:
+            return {"EAN": "", "Nombre": nombre, **celdas(estado=REVISAR)}
+
+        # Buscar por EAN en VTEX (lote; individual si el lote no lo trajo)
+        data = lote.lookup(ean)
+
+        if not data:
+            return {"EAN": ean, "Nombre": nombre, **celdas(estado=REVISAR)}
+
+        prod = data[0]
+        items = prod.get("items") or []
+
+        # Elegimos el item que matchee el EAN (ean o referenceId.Value). Si no, el primero.
+        item_sel = None
+        for it in items:
+            if str(it.get("ean") or "").strip() == ean:
+                item_sel = it
+                break
+            for ref in (it.get("referenceId") or []):
+                if str(ref.get("Value") or "").strip() == ean:
+                    item_sel = it
+                    break
+            if item_sel:
+                break
+        if not item_sel and items:
+            item_sel = items[0]
+
+        if not item_sel or not item_sel.get("sellers"):
+            return {"EAN": ean, "Nombre": nombre, **celdas(estado=REVISAR)}
+
+        offer = item_sel["sellers"][0].get("commertialOffer", {})
+        price_list = float(offer.get("ListPrice") or 0)
+        price = float(offer.get("Price") or 0)
+        final_price = price_list if price_list > 0 else price
+
+        if final_price and final_price > 0:
+            nombre_prod = prod.get("productName") or nombre
+            return {"EAN": ean, "Nombre": nombre_prod, **celdas(final_price)}
+        return {"EAN": ean, "Nombre": nombre, **celdas(estado=REVISAR)}
+
+    except Exception:
+        return {"EAN": ean, "Nombre": nombre, **celdas(estado=REVISAR)}
+
+
+def _carrefour(productos: dict, op: Opciones, on_progress=None) -> Corrida:
+    corrida = Corrida(PAGINA, "Carrefour", ["EAN", "Nombre", "Precio"], op)
+    session_carr = motor.build_session(op.concurrencia)
+    lote_carr = vtex.VtexBatchLookup(
+        session_carr,
+        "https://www.carrefour.com.ar",
+        single=lambda ean: buscar_carrefour(session_carr, ean),
+        headers=HEADERS_CARR,
+        batch_size=op.lote("Carrefour"),
+        timeout=12,
+    )
+    plan = corrida.separar_incremental("Carrefour", productos.items())
+    lote_carr.prefetch((d.get("ean") for _, d in plan["pendientes"]), op.concurrencia)
+    fila_revisar = lambda nombre, datos: {"EAN": str(datos.get("ean") or "").strip(), "Nombre": nombre, **celdas(estado=REVISAR)}
+    relevadas = motor.map_ordered(
+        lambda nombre, datos: relevar_carrefour(lote_carr, nombre, datos),
+        plan["pendientes"],
+        host="www.carrefour.com.ar",
+        concurrencia=op.concurrencia,
+        fallback=fila_revisar,
+        on_progress=on_progress,
+    )
+    corrida.filas = corrida.combinar_incremental(plan, relevadas, fila_revisar, lista="Precio")
+    corrida.tiempo(len(relevadas))
+    corrida.nota("📦", lote_carr.resumen())
+    corrida.guardar_historial("Carrefour", relevadas, lista="Precio")
+    return corrida
+
+
+# ============================================
+# 🟥 Día (por cod_dia = skuId)
+# ============================================
+HEADERS_DIA = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept": "application/json,text/plain,*/*",
+}
+
+
+def buscar_dia(session: requests.Session, cod_dia: str):
+    url = f"https://diaonline.supermercadosdia.com.ar/api/catalog_system/pub/products/search?fq=skuId:{cod_dia}"
+    r = session.get(url, headers=HEADERS_DIA, timeout=12)
+    r.raise_for_status()
+    return r.json()
+
+
+def relevar_dia(lote: vtex.VtexBatchLookup, nombre, datos):
+    cod_dia = str(datos.get("cod_dia") or "").strip()
+    ean = datos.get("ean")
+    try:
+        if not cod_dia:
+            return {"EAN": ean, "Nombre": nombre, **celdas(estado=REVISAR)}
+
+        # VTEX search por skuId (cod_dia), en lote; se mapea de vuelta por itemId
+        data = lote.lookup(cod_dia)
+
+        if not data:
+            return {"EAN": ean, "Nombre": nombre, **celdas(estado=REVISAR)}
+
+        prod = data[0]
+        items = prod.get("items") or []
+
+        # Elegimos el item cuyo itemId == cod_dia; si no aparece, usamos el primero
+        item_sel = None
+        for it in items:
+            if str(it.get("itemId") or "").strip() == cod_dia:
+                item_sel = it
+                break
+        if not item_sel and items:
+            item_sel = items[0]
+
+        if not item_sel:
+            return {"EAN": ean, "Nombre": nombre, **celdas(estado=REVISAR)}
+
+        offer = (item_sel.get("sellers") or [{}])[0].get("commertialOffer", {}) if item_sel.get("sellers") else {}
+        list_price = offer.get("ListPrice", 0) or 0
+
+        if list_price > 0:
+            nombre_prod = prod.get("productName") or nombre
+            return {"EAN": ean, "Nombre": nombre_prod, **celdas(list_price)}
+        return {"EAN": ean, "Nombre": nombre, **celdas(estado=REVISAR)}
+
+    except Exception:
+        return {"EAN": ean, "Nombre": nombre, **celdas(estado=REVISAR)}
+
+
+def _dia(productos: dict, op: Opciones, on_progress=None) -> Corrida:
+    corrida = Corrida(PAGINA, "Día", ["EAN", "Nombre", "Precio"], op)
+    session_dia = motor.build_session(op.concurrencia)
+    lote_dia = vtex.VtexBatchLookup(
+        session_dia,
+        "https://diaonline.supermercadosdia.com.ar",
+        single=lambda cod: buscar_dia(session_dia, cod),
+        headers=HEADERS_DIA,
+        field="skuId",
+        batch_size=op.lote("Día"),
+        timeout=12,
+    )
+    plan = corrida.separar_incremental("Día", productos.items())
+    lote_dia.prefetch((d.get("cod_dia") for _, d in plan["pendientes"]), op.concurrencia)
+    fila_revisar = lambda nombre, datos: {"EAN": datos.get("ean"), "Nombre": nombre, **celdas(estado=REVISAR)}
+    relevadas = motor.map_ordered(
+        lambda nombre, datos: relevar_dia(lote_dia, nombre, datos),
+        plan["pendientes"],
+        host="diaonline.supermercadosdia.com.ar",
+        concurrencia=op.concurrencia,
+        fallback=fila_revisar,
+        on_progress=on_progress,
+    )
+    corrida.filas = corrida.combinar_incremental(plan, relevadas, fila_revisar, lista="Precio")
+    corrida.tiempo(len(relevadas))
+    corrida.nota("📦", lote_dia.resumen())
+    corrida.guardar_historial("Día", relevadas, lista="Precio")
+    return corrida
+
+
+# ============================================
+# 🟢 ChangoMás (por RefId)
+# ============================================
+DEFAULT_SEGMENT_CM = (
+    "eyJjYW1wYWlnbnMiOm51bGwsImNoYW5uZWwiOiIxIiwicHJpY2VUYWJsZXMiOm51bGwsInJlZ2lvbklkIjoidjIuNDdERkY5REI3QkE5NEEyMEI1ODRGRjYzQTA3RUIxQ0EiLCJ1dG1fY2FtcGFpZ24iOm51bGwsInV0bV9zb3VyY2UiOm51bGwsInV0bWlfY2FtcGFpZ24iOm51bGwsImN1cnJlbmN5Q29kZSI6IkFSUyIsImN1cnJlbmN5U3ltYm9sIjoiJCIsImNvdW50cnlDb2RlIjoiQVJHIiwiY3VsdHVyZUluZm8iOiJlcy1BUiIsImFkbWluX2N1bHR1cmVJbmZvIjoiZXMtQVIiLCJjaGFubmVsUHJpdmFjeSI6InB1YmxpYyJ9"
+)
+BASE_CM = "https://www.masonline.com.ar"
+TIMEOUTS_CM = (3, 7)  # (connect, read)
+
+
+def first_listprice_or_price(item: dict) -> float:
+    best_price = 0.0
+    for seller in (item.get("sellers") or []):
+        co = seller.get("commertialOffer") or {}
+        lp = float(co.get("ListPrice") or 0)
+        if lp > 0:
+            return lp  # 🎯 early exit
+        p = float(co.get("Price") or 0)
+        if p > best_price:
+            best_price = p
+    return best_price
+
+
+def vt_search_by_refid(session: requests.Session, refid: str, sc: str, headers: dict, corrida: Corrida = None):
+    url = f"{BASE_CM}/api/catalog_system/pub/products/search"
+    params = {"fq": f"alternateIds_RefId:{refid}", "sc": sc}
+    r = session.get(url, headers=headers, params=params, timeout=TIMEOUTS_CM)
+    if corrida is not None:
+        corrida.log(f"SEARCH {sc}: {r.url} | {r.status_code} | {r.headers.get('content-type')}")
+    r.raise_for_status()
+    return r.json()
+
+
+def vt_variations_price(session: requests.Session, product_id: str, refid: str, sc: str, headers: dict,
+                        corrida: Corrida = None):
+    url = f"{BASE_CM}/api/catalog_system/pub/products/variations/{product_id}"
+    params = {"sc": sc}
+    r = session.get(url, headers=headers, params=params, timeout=TIMEOUTS_CM)
+    if corrida is not None:
+        corrida.log(f"VARIATIONS {sc}: {r.url} | {r.status_code}")
+    r.raise_for_status()
+    data = r.json()
+    name = data.get("name")
+    for sku in (data.get("skus") or []):
+        refids = [str(x.get("Value")) for x in (sku.get("referenceId") or []) if isinstance(x, dict)]
+        if str(refid) in refids or not refids:
+            lp = float(sku.get("listPrice") or 0)
+            if lp > 0:
+                return name, lp
+            bp = float(sku.get("bestPrice") or 0)
+            return name, (bp if bp > 0 else None)
+    return name, None
+
+
+def relevar_chango(session: requests.Session, lote: vtex.VtexBatchLookup, headers: dict, sc: str, nombre, datos,
+                   corrida: Corrida = None):
+    refid = str(datos.get("cod_maso", "")).strip()  # ⚠️ clave esperada
+    ean   = str(datos.get("ean", "")).strip()
+    if not refid:
+        return {"EAN": ean, "RefId": "", "Nombre": nombre, **celdas(estado=REVISAR)}
+
+    row = {"EAN": ean, "RefId": refid, "Nombre": nombre, **celdas(estado=REVISAR)}
+    try:
+        found_price = None
+        found_name = None
+
+        data = lote.lookup(refid)
+        prod = data[0] if data else None
+        items = (prod.get("items", []) or []) if prod else []
+        if prod and items:
+            # Item cuyo RefId coincida; si no, el primero
+            item_sel = None
+            for it in items:
+                for rfi in (it.get("referenceId") or []):
+                    if str(rfi.get("Value", "")).strip() == refid:
+                        item_sel = it
+                        break
+                if item_sel:
+                    break
+            if not item_sel and items:
+                item_sel = items[0]
+
+            price_num = first_listprice_or_price(item_sel) if item_sel else 0.0
+            found_name = prod.get("productName") or nombre
+
+            if price_num <= 0:
+                pid = str(prod.get("productId") or "").strip()
+                if pid:
+                    v_name, v_price = vt_variations_price(session, pid, refid, sc, headers, corrida)
+                    if v_price:
+                        price_num = v_price
+                        found_name = v_name or found_name
+
+            if price_num > 0:
+                found_price = price_num
+
+        if found_price is not None:
+            # 👇 Nuevo: si el precio supera 1.000.000, marcar "Revisar"
+            if float(found_price) > 1_000_000:
+                row.update(celdas(estado=REVISAR))
+                row["Nombre"] = found_name or nombre
+            else:
+                row.update(celdas(found_price))
+                row["Nombre"] = found_name or nombre
+
+    except Exception:
+        pass  # dejamos "Revisar"
+
+    return row
+
+
+def _changomas(productos: dict, op: Opciones, on_progress=None) -> Corrida:
+    corrida = Corrida(PAGINA, "ChangoMás", ["EAN", "RefId", "Nombre", "Precio"], op)
+    s = motor.build_session(op.concurrencia)
+    headers_cm = {
+        "User-Agent": "Mozilla/5.0",
+        "Cookie": f"vtex_segment={op.vtex_segment or DEFAULT_SEGMENT_CM}",
+        "Accept": "application/json,text/plain,*/*",
+    }
+    sc = op.sc
+    lote_cm = vtex.VtexBatchLookup(
+        s,
+        BASE_CM,
+        single=lambda refid: vt_search_by_refid(s, refid, sc, headers_cm, corrida),
+        headers=headers_cm,
+        params={"sc": sc},
+        field="alternateIds_RefId",
+        batch_size=op.lote("ChangoMás"),
+        timeout=TIMEOUTS_CM,
+    )
+
+    plan = corrida.separar_incremental("ChangoMás", productos.items(), ubicacion=sc)
+    lote_cm.prefetch((d.get("cod_maso") for _, d in plan["pendientes"]), op.concurrencia)
+    fila_revisar = lambda nombre, datos: {
+        "EAN": str(datos.get("ean", "")).strip(),
+        "RefId": str(datos.get("cod_maso", "")).strip(),
+        "Nombre": nombre,
+        **celdas(estado=REVISAR),
+    }
+    relevadas = motor.map_ordered(
+        lambda nombre, datos: relevar_chango(s, lote_cm, headers_cm, sc, nombre, datos, corrida),
+        plan["pendientes"],
+        host="www.masonline.com.ar",
+        concurrencia=op.concurrencia,
+        fallback=fila_revisar,
+        on_progress=on_progress,
+    )
+    corrida.filas = corrida.combinar_incremental(plan, relevadas, fila_revisar, lista="Precio")
+    corrida.tiempo(len(relevadas))
+    corrida.nota("📦", lote_cm.resumen())
+    corrida.guardar_historial("ChangoMás", relevadas, lista="Precio", ubicacion=sc)
+    return corrida
+
+
+# ============================================
+# 🏷️ Coto (por EAN)
+# Flujo: búsqueda (Ntk=product.eanPrincipal) → record.id → detalle (format=json) → sku.activePrice
+# ============================================
+SEARCH_CATEGORIA = "/sitios/cdigi/categoria"
+DEFAULT_SUCURSAL = "200"
+
+
+def get_record_id_by_ean(cliente: coto.CotoClient, ean: str, sucursal: str):
+    params = {"Dy": "1", "Ntt": ean, "Ntk": "product.eanPrincipal", "idSucursal": sucursal, "format": "json"}
+    r = cliente.get(urljoin(coto.BASE, SEARCH_CATEGORIA), params=params, timeout=20)
+    r.raise_for_status()
+    idx = coto.IndiceEndeca(r.json(), ean=ean)
+
+    rec = idx.record_por_ean(ean)
+    if rec is not None:
+        rid  = idx.valor("record.id", rec)
+        name = idx.valor("product.displayName", rec) or idx.valor("record.title", rec)
+        return rid, (str(name) if name else None)
+    return None, None
+
+
+def cast_price(val):
+    if val is None:
+        return None
+    if isinstance(val, (int, float)):
+        return float(val)
+    s = str(val).strip()
+    if s.count(",") == 1 and s.count(".") > 1:  # '1.795,00' -> 1795.00
+        s = s.replace(".", "").replace(",", ".")
+    try:
+        return float(s)
+    except Exception:
+        return None
+
+
+def fetch_detail_by_record_id(cliente: coto.CotoClient, record_id: str, sucursal: str):
+    product_url = f"{coto.BASE}/sitios/cdigi/productos/_/R-{record_id}"
+    detail_url = f"{product_url}?Dy=1&idSucursal={sucursal}&format=json"
+
+    headers = dict(cliente.session.headers)
+    headers["Referer"] = product_url  # ayuda en algunos entornos
+    r = cliente.get(detail_url, headers=headers, timeout=20)
+    r.raise_for_status()
+    idx = coto.IndiceEndeca(r.json(), hasta=coto.CLAVES_DETALLE)
+
+    ean   = idx.valor("product.eanPrincipal")
+    name  = idx.valor("product.displayName")
+    price = idx.precio(cast_price)  # sku.activePrice y fallbacks
+
+    return {
+        "ean": ean,
+        "name": name,
+        "price": price,
+        "detail_url": detail_url,
+    }
+
+
+def relevar_coto(cliente: coto.CotoClient, sucursal: str, nombre_ref, ean):
+    ean = str(ean).strip()
+    nombre_ref = str(nombre_ref).strip()
+    row = {"EAN": ean, "Nombre del Producto": nombre_ref, **celdas(estado=REVISAR)}  # default pedido
+    dbg = None
+
+    def _resolver():
+        record_id, name_hint = get_record_id_by_ean(cliente, ean, sucursal)
+        return {"recordId": record_id, "nombre": name_hint} if record_id else None
+
+    def _detalle(ids):
+        det = fetch_detail_by_record_id(cliente, ids["recordId"], sucursal)
+        # record.id que ya no apunta a este EAN (detalle vacío o de otro producto)
+        if not (det.get("ean") or det.get("name")) or (det.get("ean") and str(det.get("ean")) != ean):
+            return None
+        return det, ids.get("nombre")
+
+    try:
+        res = resolucion.cache_identificadores().usar_o_resolver("Coto", ean, sucursal, _resolver, _detalle)
+        if res:
+            det, name_hint = res
+            row["EAN"] = det.get("ean") or ean
+            row["Nombre del Producto"] = det.get("name") or name_hint or nombre_ref
+            if det.get("price") is not None:
+                row.update(celdas(det["price"]))
+            dbg = {"EAN": row["EAN"], "detail_url": det.get("detail_url")}
+        # si no hay record_id, dejamos "Revisar" y nombre_ref tal cual
+    except Exception:
+        pass  # dejamos "Revisar"
+
+    return row, dbg
+
+
+def scrape_coto_by_items(items, sucursal: str, cliente: coto.CotoClient, concurrencia: int, on_progress=None):
+    pares = motor.map_ordered(
+        lambda nombre_ref, ean: relevar_coto(cliente, sucursal, nombre_ref, ean),
+        items,
+        host="www.cotodigital.com.ar",
+        concurrencia=concurrencia,
+        fallback=lambda nombre_ref, ean: (
+            {"EAN": str(ean).strip(), "Nombre del Producto": str(nombre_ref).strip(), **celdas(estado=REVISAR)},
+            None,
+        ),
+        on_progress=on_progress,
+    )
+    out = [row for row, _ in pares]
+    debug_rows = [dbg for _, dbg in pares if dbg]
+    return out, debug_rows
+
+
+def _coto(productos: dict, op: Opciones, on_progress=None) -> Corrida:
+    corrida = Corrida(PAGINA, "Coto", ["EAN", "Nombre del Producto", "Precio"], op)
+    sucursal = op.sucursal or DEFAULT_SUCURSAL
+
+    # Construimos [(nombre_ref, ean), ...]
+    items = []
+    for nombre, meta in productos.items():
+        ean = str((meta or {}).get("ean", "")).strip()
+        if ean:
+            items.append((nombre, ean))
+    if not items:
+        corrida.avisos.append("No hay EANs válidos en el catálogo")
+        return corrida
+
+    ids_cache = resolucion.cache_identificadores()
+    marca_ids = ids_cache.marca()
+    # Un cliente por corrida: el bootstrap de cookies se comparte entre todos los productos
+    cliente = coto.CotoClient(motor.build_session(op.concurrencia, headers=coto.HEADERS_COTO), sucursal, timeout=20)
+    plan = corrida.separar_incremental("Coto", items, ubicacion=sucursal, ean_de=lambda nombre, ean: ean)
+    relevadas, corrida.urls = scrape_coto_by_items(plan["pendientes"], sucursal, cliente, op.concurrencia, on_progress)
+    corrida.filas = corrida.combinar_incremental(
+        plan, relevadas, lambda nombre, ean: {"EAN": ean, "Nombre del Producto": nombre, **celdas(estado=REVISAR)}, lista="Precio"
+    )
+    ids_cache.guardar()
+    corrida.tiempo(len(relevadas))
+    corrida.nota("🗂️", ids_cache.resumen(marca_ids))
+    corrida.nota("🍪", cliente.resumen())
+    corrida.guardar_historial("Coto", relevadas, lista="Precio", ubicacion=sucursal)
+    return corrida
+
+
+# ============================================
+# 🟢 Jumbo / 🟢 Vea (por EAN, Installments[].Value)
+# ============================================
+HEADERS_CENCOSUD = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept": "application/json,text/plain,*/*",
+}
+
+
+def buscar_cencosud(session: requests.Session, base: str, ean: str):
+    url = f"{base}/api/catalog_system/pub/products/search?fq=alternateIds_Ean:{ean}"
+    r = session.get(url, headers=HEADERS_CENCOSUD, timeout=12)
+    return r.json()
+
+
+def relevar_cencosud(lote: vtex.VtexBatchLookup, nombre, datos):
+    ean = str(datos.get("ean") or "").strip()
+    try:
+        if not ean:
+            return {"EAN": "", "Nombre": nombre, **celdas(estado=REVISAR)}
+
+        # VTEX search por EAN (lote; individual si el lote no lo trajo)
+        data = lote.lookup(ean)
+
+        if not data:
+            return {"EAN": ean, "Nombre": nombre, **celdas(estado=REVISAR)}
+
+        prod = data[0]
+        items = prod.get("items") or []
+
+        # Elegimos el item que matchee el EAN (ean o referenceId.Value). Si no, el primero.
+        item_sel = None
+        for it in items:
+            if str(it.get("ean") or "").strip() == ean:
+                item_sel = it
+                break
+            for ref in (it.get("referenceId") or []):
+                if str(ref.get("Value") or "").strip() == ean:
+                    item_sel = it
+                    break
+            if item_sel:
+                break
+        if not item_sel and items:
+            item_sel = items[0]
+
+        # Obtenemos Installments[].Value del primer seller
+        installments = []
+        try:
+            installments = (item_sel.get("sellers") or [])[0].get("commertialOffer", {}).get("Installments") or []
+        except Exception:
+            installments = []
+
+        # Tomamos el mayor Value disponible (suele ser 1 cuota, p.ej. American Express)
+        vals = [float(x.get("Value") or 0) for x in installments if isinstance(x, dict)]
+        price_val = max(vals) if vals else 0.0
+
+        if price_val > 0:
+            nombre_prod = prod.get("productName") or nombre
+            return {"EAN": ean, "Nombre": nombre_prod, **celdas(price_val)}
+        return {"EAN": ean, "Nombre": nombre, **celdas(estado=REVISAR)}
+
+    except Exception:
+        return {"EAN": ean, "Nombre": nombre, **celdas(estado=REVISAR)}
+
+
+def _cencosud(cadena: str, base: str, productos: dict, op: Opciones, on_progress=None) -> Corrida:
+    corrida = Corrida(PAGINA, cadena, ["EAN", "Nombre", "Precio"], op)
+    session = motor.build_session(op.concurrencia)
+    lote = vtex.VtexBatchLookup(
+        session,
+        base,
+        single=lambda ean: buscar_cencosud(session, base, ean),
+        headers=HEADERS_CENCOSUD,
+        batch_size=op.lote(cadena),
+        timeout=12,
+    )
+    plan = corrida.separar_incremental(cadena, productos.items())
+    lote.prefetch((d.get("ean") for _, d in plan["pendientes"]), op.concurrencia)
+    fila_revisar = lambda nombre, datos: {"EAN": str(datos.get("ean") or "").strip(), "Nombre": nombre, **celdas(estado=REVISAR)}
+    relevadas = motor.map_ordered(
+        lambda nombre, datos: relevar_cencosud(lote, nombre, datos),
+        plan["pendientes"],
+        host=motor.host_of(base),
+        concurrencia=op.concurrencia,
+        fallback=fila_revisar,
+        on_progress=on_progress,
+    )
+    corrida.filas = corrida.combinar_incremental(plan, relevadas, fila_revisar, lista="Precio")
+    corrida.tiempo(len(relevadas))
+    corrida.nota("📦", lote.resumen())
+    corrida.guardar_historial(cadena, relevadas, lista="Precio")
+    return corrida
+
+
+def _jumbo(productos: dict, op: Opciones, on_progress=None) -> Corrida:
+    return _cencosud("Jumbo", "https://www.jumbo.com.ar", productos, op, on_progress)
+
+
+def _vea(productos: dict, op: Opciones, on_progress=None) -> Corrida:
+    return _cencosud("Vea", "https://www.vea.com.ar", productos, op, on_progress)
+
+
+# ============================================
+# 🟡 Cooperativa Obrera (por cod_coope)
+# ============================================
+HEADERS_COOPE = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept": "application/json,text/plain,*/*",
+}
+
+
+def relevar_coope(session: requests.Session, nombre, datos):
+    ean = str(datos.get("ean", "")).strip()
+    cod = str(datos.get("cod_coope", "")).strip()
+
+    row = {"EAN": ean, "Nombre": nombre, **celdas(estado=REVISAR)}
+    if not cod:
+        return row
+
+    try:
+        url = f"https://api.lacoopeencasa.coop/api/articulo/detalle?cod_interno={cod}&simple=false"
+        r = session.get(url, headers=HEADERS_COOPE, timeout=12)
+        r.raise_for_status()
+        j = r.json() if r.headers.get("content-type","").startswith("application/json") else {}
+
+        datos_node = (j or {}).get("datos") or {}
+        precio_ant = datos_node.get("precio_anterior")
+
+        # precio_anterior viene como string ("919.00")
+        val = float(precio_ant) if precio_ant not in (None, "") else 0.0
+
+        if val > 0:
+            row.update(celdas(val))
+
+    except Exception:
+        pass  # dejamos "Revisar" si falla algo
+
+    return row
+
+
+def _cooperativa(productos: dict, op: Opciones, on_progress=None) -> Corrida:
+    corrida = Corrida(PAGINA, "Cooperativa Obrera", ["EAN", "Nombre", "Precio"], op)
+    session_coope = motor.build_session(op.concurrencia)
+    plan = corrida.separar_incremental("Cooperativa", productos.items())
+    fila_revisar = lambda nombre, datos: {"EAN": str(datos.get("ean", "")).strip(), "Nombre": nombre, **celdas(estado=REVISAR)}
+    relevadas = motor.map_ordered(
+        lambda nombre, datos: relevar_coope(session_coope, nombre, datos),
+        plan["pendientes"],
+        host="api.lacoopeencasa.coop",
+        concurrencia=op.concurrencia,
+        fallback=fila_revisar,
+        on_progress=on_progress,
+    )
+    corrida.filas = corrida.combinar_incremental(plan, relevadas, fila_revisar, lista="Precio")
+    corrida.tiempo(len(relevadas))
+    corrida.guardar_historial("Cooperativa", relevadas, lista="Precio")
+    return corrida
+
+
+# ============================================
+# 🔴 HiperLibertad (ListPrice por EAN)
+# ============================================
+BASE_HIPER = "https://www.hiperlibertad.com.ar"
+SC_HIPER = "1"  # política comercial usual (?sc=1)
+HEADERS_HIPER = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) PythonRequests/2.x",
+    "Accept": "application/json, text/plain, */*",
+}
+TIMEOUT_HIPER = (3, 8)  # (connect, read) — timeouts optimizados
+
+
+def _fetch_catalog_by_ean(session: requests.Session, ean: str, sc: str = SC_HIPER):
+    if not ean:
+        return None
+    url = f"{BASE_HIPER}/api/catalog_system/pub/products/search"
+    params = {"fq": f"alternateIds_Ean:{ean}", "sc": sc}
+    r = session.get(url, headers=HEADERS_HIPER, params=params, timeout=TIMEOUT_HIPER)
+    if r.status_code != 200:
+        return None
+    try:
+        js = r.json()
+        return js if isinstance(js, list) and js else None
+    except Exception:
+        return None
+
+
+def _extract_list_price_only(js) -> float:
+    try:
+        # Prioridad: primer ListPrice > 0
+        for prod in js:
+            for item in (prod.get("items") or []):
+                for seller in (item.get("sellers") or []):
+                    co = seller.get("commertialOffer") or {}
+                    lp = co.get("ListPrice")
+                    if isinstance(lp, (int, float)) and lp > 0:
+                        return float(lp)
+        # Si no hubo >0, devolver 0 si hay numérico
+        for prod in js:
+            for item in (prod.get("items") or []):
+                for seller in (item.get("sellers") or []):
+                    co = seller.get("commertialOffer") or {}
+                    lp = co.get("ListPrice")
+                    if isinstance(lp, (int, float)):
+                        return float(lp)  # probablemente 0.0
+    except Exception:
+        pass
+    return 0.0
+
+
+def relevar_hiper(lote: vtex.VtexBatchLookup, nombre, meta):
+    ean = str(meta.get("ean", "")).strip()
+    try:
+        js = lote.lookup(ean) if ean else None
+        if js:
+            precio = celdas(_extract_list_price_only(js), columna="ListPrice")  # 0.0 -> precio_cero
+        else:
+            precio = celdas(estado=REVISAR, columna="ListPrice")
+    except Exception:
+        precio = celdas(estado=REVISAR, columna="ListPrice")
+
+    return {"EAN": ean, "Nombre": nombre, **precio}
+
+
+def _hiperlibertad(productos: dict, op: Opciones, on_progress=None) -> Corrida:
+    corrida = Corrida(PAGINA, "HiperLibertad", ["EAN", "Nombre", "ListPrice"], op)
+    session_hiper = motor.build_session(op.concurrencia)
+    lote_hiper = vtex.VtexBatchLookup(
+        session_hiper,
+        BASE_HIPER,
+        single=lambda ean: _fetch_catalog_by_ean(session_hiper, ean, sc=SC_HIPER),
+        headers=HEADERS_HIPER,
+        params={"sc": SC_HIPER},
+        batch_size=op.lote("HiperLibertad"),
+        timeout=TIMEOUT_HIPER,
+    )
+    plan = corrida.separar_incremental("HiperLibertad", productos.items(), ubicacion=SC_HIPER)
+    lote_hiper.prefetch((m.get("ean") for _, m in plan["pendientes"]), op.concurrencia)
+    fila_revisar = lambda nombre, meta: {
+        "EAN": str(meta.get("ean", "")).strip(),
+        "Nombre": nombre,
+        **celdas(estado=REVISAR, columna="ListPrice"),
+    }
+    relevadas = motor.map_ordered(
+        lambda nombre, meta: relevar_hiper(lote_hiper, nombre, meta),
+        plan["pendientes"],
+        host="www.hiperlibertad.com.ar",
+        concurrencia=op.concurrencia,
+        fallback=fila_revisar,
+        on_progress=on_progress,
+    )
+    corrida.filas = corrida.combinar_incremental(plan, relevadas, fila_revisar, lista="ListPrice")
+    corrida.tiempo(len(relevadas))
+    corrida.nota("📦", lote_hiper.resumen())
+    corrida.guardar_historial("HiperLibertad", relevadas, lista="ListPrice", ubicacion=SC_HIPER)
+    return corrida
+
+
+# ============================================
+# Entrada
+# ============================================
+_CADENAS = {
+    "carrefour": _carrefour,
+    "dia": _dia,
+    "changomas": _changomas,
+    "coto": _coto,
+    "jumbo": _jumbo,
+    "vea": _vea,
+    "cooperativa": _cooperativa,
+    "hiperlibertad": _hiperlibertad,
+}
+
+
+def relevar(cadena: str, productos: dict = None, op: Opciones = None, on_progress=None) -> Corrida:
+    """Releva una cadena sobre el catálogo (por defecto, la lista CATALOGO)."""
+    if productos is None:
+        productos = cargar_catalogo(CATALOGO)
+    op = op or Opciones()
+    with reintentos.presupuesto(), metricas.registro(), cache_http.descarga(op.forzar_descarga):
+        return _CADENAS[clave_cadena(cadena)](productos, op, on_progress)
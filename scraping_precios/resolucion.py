@@ -0,0 +1,182 @@
+# resolucion.py
+# Cache en disco de identificadores resueltos por cadena.
+#
+# Clave: (cadena, EAN, sucursal / sales channel). Valor: lo que cuesta una búsqueda
+# conseguir y casi nunca cambia (skuId, productId, sellerId, linkText, record.id de Coto).
+# Cada entrada vence a los `ttl` segundos; si la cadena confirma que un id cacheado ya no existe
+# (404 / 410, o la consulta no lo encuentra), la entrada se invalida y se vuelve a resolver. Un error
+# de red o un 5xx no dice nada del id: se conserva y el error sigue hasta el que llamó.
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+
+import requests
+
+CACHE_DIR = os.environ.get(
+    "SCRAPING_PRECIOS_CACHE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"),
+)
+IDS_PATH = os.path.join(CACHE_DIR, "identificadores.json")
+
+# 7 días: los ids de catálogo cambian muy de vez en cuando
+TTL_DEFAULT = 7 * 24 * 3600
+
+# Status con los que la cadena dice que el id ya no existe
+AUSENTE = (404, 410)
+
+CAMPOS = ("skuId", "productId", "sellerId", "linkText", "recordId", "nombre")
+
+
+def ids_vtex(prod: dict, item: dict) -> dict:
+    """Ids a cachear de un producto/item de catalog_system."""
+    prod = prod or {}
+    item = item or {}
+    seller0 = (item.get("sellers") or [{}])[0] or {}
+    return {
+        "skuId": str(item.get("itemId") or "").strip(),
+        "productId": str(prod.get("productId") or "").strip(),
+        "sellerId": str(seller0.get("sellerId") or "").strip(),
+        "linkText": str(prod.get("linkText") or "").strip(),
+        "nombre": str(prod.get("productName") or "").strip(),
+    }
+
+
+class CacheIdentificadores:
+    def __init__(self, path: str = IDS_PATH, ttl: float = TTL_DEFAULT):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data = {}
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.invalidados = 0
+        self._cargar()
+
+    @staticmethod
+    def _clave(cadena: str, ean: str, ubicacion: str = "") -> str:
+        return f"{cadena}|{str(ubicacion or '').strip()}|{str(ean or '').strip()}"
+
+    def _cargar(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._data = data
+        except (OSError, ValueError):
+            self._data = {}
+
+    # --------------------------------------------
+    # API
+    # --------------------------------------------
+    def get(self, cadena: str, ean: str, ubicacion: str = "", contar: bool = True):
+        """Ids cacheados (dict) o None si no hay / vencieron. contar=False no toca los contadores."""
+        k = self._clave(cadena, ean, ubicacion)
+        with self._lock:
+            ent = self._data.get(k)
+            if ent and time.time() - float(ent.get("ts") or 0) <= self.ttl:
+                if contar:
+                    self.hits += 1
+                return {c: ent[c] for c in CAMPOS if ent.get(c)}
+            if ent:
+                del self._data[k]
+                self._dirty = True
+            if contar:
+                self.misses += 1
+        return None
+
+    def put(self, cadena: str, ean: str, ubicacion: str = "", **ids):
+        ent = {c: str(ids[c]) for c in CAMPOS if ids.get(c)}
+        if not ent:
+            return
+        ent["ts"] = time.time()
+        with self._lock:
+            self._data[self._clave(cadena, ean, ubicacion)] = ent
+            self._dirty = True
+
+    def invalidar(self, cadena: str, ean: str, ubicacion: str = ""):
+        with self._lock:
+            if self._data.pop(self._clave(cadena, ean, ubicacion), None) is not None:
+                self.invalidados += 1
+                self._dirty = True
+
+    def limpiar(self, cadena: str = None):
+        """Borra todo (o solo una cadena)."""
+        with self._lock:
+            if cadena is None:
+                self._data = {}
+            else:
+                self._data = {k: v for k, v in self._data.items() if not k.startswith(f"{cadena}|")}
+            self._dirty = True
+
+    def usar_o_resolver(self, cadena: str, ean: str, ubicacion: str, resolver, usar):
+        """
+        usar(ids) con los ids cacheados; si devuelve None (el id ya no apunta al producto) o falla
+        con 404 / 410, invalida y re-resuelve. Cualquier otro error sale tal cual y el id se conserva.
+        resolver() -> dict de ids (o None si no se encontró el producto).
+        Devuelve el resultado de usar(ids), o None.
+        """
+        ids = self.get(cadena, ean, ubicacion)
+        if ids is not None:
+            try:
+                res = usar(ids)
+            except requests.HTTPError as e:
+                if getattr(e.response, "status_code", None) not in AUSENTE:
+                    raise
+                res = None
+            if res is not None:
+                return res
+            self.invalidar(cadena, ean, ubicacion)
+
+        ids = resolver()
+        if not ids:
+            return None
+        self.put(cadena, ean, ubicacion, **ids)
+        return usar(ids)
+
+    def guardar(self):
+        """Escritura atómica (tmp + replace); no hace nada si no hubo cambios."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = dict(self._data)
+            self._dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except OSError:
+            with self._lock:
+                self._dirty = True
+
+    def marca(self) -> tuple:
+        """Contadores actuales, para resumir solo una corrida con resumen(desde=...)."""
+        with self._lock:
+            return self.hits, self.misses, self.invalidados
+
+    def resumen(self, desde: tuple = (0, 0, 0)) -> str:
+        hits, misses, invalidados = (a - b for a, b in zip(self.marca(), desde))
+        return (
+            f"Identificadores: {hits} desde cache · {misses} resueltos"
+            f" · {invalidados} invalidados"
+        )
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def cache_identificadores() -> CacheIdentificadores:
+    """Instancia compartida por todas las páginas (sobrevive a los reruns de Streamlit)."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = CacheIdentificadores()
+            atexit.register(_cache.guardar)
+        return _cache
@@ -0,0 +1,186 @@
+# resultados.py
+# Esquema tipado de los resultados de Relevamiento y Dinámicas (todas las pestañas).
+#
+# Los fetchers de cada cadena arman filas tipadas: el precio de lista como float (NaN sin precio) con
+# su estado / motivo (celdas()) y la oferta como float (precio) o texto (promo). tabla() las pasa a
+# columnas tipadas y vista() es el único lugar que vuelve al texto de siempre ("1795,00", "Revisar"):
+#   - cadena, Empresa, Categoría, Subcategoría, Marca: category (las de catálogo salen del catálogo
+#     por EAN si la pestaña no las trae, como Relevamiento)
+#   - EAN, Nombre: string
+#   - precio_lista, precio_oferta: float (NaN sin dato)
+#   - oferta_tipo / oferta_valor: precio | porcentaje | nxm | segunda_unidad | texto, con el % de
+#     descuento equivalente por unidad (3x2 = 33.3, 2da al 70% = 35); oferta_texto queda tal cual
+#   - estado (ESTADOS) y motivo (MOTIVOS): por qué una fila no tiene precio; vista() lo muestra como
+#     lo mostraba la página ("Revisar", "Sin Precio", "0,00", vacío)
+# Las columnas propias de una cadena (RefId de ChangoMás) siguen al final como texto.
+
+import math
+import re
+
+import numpy as np
+import pandas as pd
+
+import catalogo
+import historial
+from corrida import format_ar_price_no_thousands
+
+ESTADOS = ("ok", "sin_precio", "revisar", "no_encontrado")
+MOTIVOS = (
+    "",                     # ok
+    "marcado_sin_precio",   # la cadena tiene el producto sin precio ("Sin Precio")
+    "marcado_revisar",      # el fetcher no pudo resolverlo ("Revisar")
+    "sin_dato",             # sin precio ni marca
+    "precio_cero",
+)
+OFERTAS = ("", "precio", "porcentaje", "nxm", "segunda_unidad", "texto")
+CATEGORICAS = ("Empresa", "Categoría", "Subcategoría", "Marca")
+
+ESQUEMA = {
+    "cadena": "category",
+    "EAN": "string",
+    "Nombre": "string",
+    **{c: "category" for c in CATEGORICAS},
+    "precio_lista": "float64",
+    "precio_oferta": "float64",
+    "oferta_tipo": pd.CategoricalDtype(OFERTAS),
+    "oferta_valor": "float64",
+    "oferta_texto": "string",
+    "estado": pd.CategoricalDtype(ESTADOS),
+    "motivo": pd.CategoricalDtype(MOTIVOS),
+}
+REVISAR, SIN_PRECIO = "revisar", "sin_precio"  # estados que marca un fetcher
+
+# Columna de la página -> columna del esquema (el resto de las de la página va como extra)
+LISTA = ("ListPrice", "Precio")
+NOMBRE = ("Nombre", "Nombre del Producto")
+OFERTA = "Oferta"
+
+RE_NXM = re.compile(r"\b(\d+)\s*x\s*(\d+)\b", re.I)
+RE_SEGUNDA = re.compile(r"\b(2da|2do|segunda)\b", re.I)
+RE_PCT = re.compile(r"(\d+(?:[.,]\d+)?)\s*%")
+
+
+# --------------------------------------------
+# Celdas
+# --------------------------------------------
+def precio_lista(precio=None, estado: str = None) -> tuple:
+    """(precio, estado, motivo) de un precio de lista (float o None) o de una marca del fetcher."""
+    if estado == REVISAR:
+        return math.nan, REVISAR, "marcado_revisar"
+    if estado == SIN_PRECIO:
+        return math.nan, SIN_PRECIO, "marcado_sin_precio"
+    if precio is None or precio != precio:
+        return math.nan, "no_encontrado", "sin_dato"
+    precio = float(precio)
+    return (precio, "ok", "") if precio > 0 else (math.nan, "no_encontrado", "precio_cero")
+
+
+def celdas(precio=None, estado: str = None, columna: str = "Precio") -> dict:
+    """Las celdas de precio de una fila: {columna: float o NaN, "estado", "motivo"}."""
+    precio, estado, motivo = precio_lista(precio, estado)
+    return {columna: precio, "estado": estado, "motivo": motivo}
+
+
+def oferta(valor) -> tuple:
+    """(precio_oferta, tipo, valor) de una oferta: 1234.5 (precio), '3x2', '2da al 70%', '25% off', ..."""
+    if valor is None or isinstance(valor, bool):
+        return math.nan, "", math.nan
+    if isinstance(valor, (int, float)):
+        return (float(valor), "precio", math.nan) if valor > 0 else (math.nan, "", math.nan)  # NaN > 0 es False
+    s = str(valor).strip()
+    if not s or s.lower() in ("revisar", "sin precio"):
+        return math.nan, "", math.nan
+    m = RE_NXM.search(s)
+    if m and int(m.group(1)) > int(m.group(2)) > 0:
+        return math.nan, "nxm", 100 * (1 - int(m.group(2)) / int(m.group(1)))
+    m = RE_PCT.search(s)
+    if m:
+        pct = float(m.group(1).replace(",", "."))
+        if RE_SEGUNDA.search(s):
+            return math.nan, "segunda_unidad", pct / 2
+        return math.nan, "porcentaje", pct
+    return math.nan, "texto", math.nan
+
+
+# --------------------------------------------
+# Tabla tipada / vista
+# --------------------------------------------
+def _texto(valor) -> str:
+    """Texto de una celda de oferta; los precios (float) van en precio_oferta."""
+    return "" if valor is None or isinstance(valor, (int, float)) else str(valor).strip()
+
+
+def _columna(columnas, opciones):
+    return next((c for c in opciones if c in columnas), None)
+
+
+def tabla(filas: list, columnas, cadena: str) -> pd.DataFrame:
+    """Filas de una corrida (con sus columnas de página) -> DataFrame con ESQUEMA + extras."""
+    df = pd.DataFrame(filas, columns=[*columnas, "estado", "motivo"])
+    lista, nombre = _columna(columnas, LISTA), _columna(columnas, NOMBRE)
+    n = len(df)
+
+    out = pd.DataFrame(index=df.index)
+    out["cadena"] = historial.cadena_canonica(cadena)
+    out["EAN"] = df["EAN"].fillna("").astype(str).str.strip() if "EAN" in df else ""
+    out["Nombre"] = df[nombre].fillna("").astype(str) if nombre else ""
+
+    # Empresa / Categoría / ...: de la fila o, si la pestaña no las trae, del catálogo por EAN
+    faltan = [c for c in CATEGORICAS if c not in df]
+    if faltan:
+        cat = catalogo.compartido()
+        metas = [cat.por_ean(e) or {} for e in out["EAN"]]
+    for c in CATEGORICAS:
+        valores = df[c] if c in df else pd.Series([m.get(c.lower()) for m in metas], index=df.index, dtype=object)
+        out[c] = valores.fillna("").astype(str).str.strip()
+
+    # estado / motivo vienen de celdas(); una fila sin ellos se clasifica por el precio
+    listas = [
+        (precio_lista(p)[0], e, m) if isinstance(e, str) else precio_lista(p)
+        for p, e, m in zip(df[lista] if lista else [None] * n, df["estado"], df["motivo"])
+    ]
+    out["precio_lista"] = [x[0] for x in listas]
+    ofertas = [oferta(v) for v in (df[OFERTA] if OFERTA in df else [None] * n)]
+    out["precio_oferta"] = [x[0] for x in ofertas]
+    out["oferta_tipo"] = [x[1] for x in ofertas]
+    out["oferta_valor"] = [x[2] for x in ofertas]
+    out["oferta_texto"] = df[OFERTA].map(_texto) if OFERTA in df else ""
+    out["estado"] = [x[1] for x in listas]
+    out["motivo"] = [x[2] for x in listas]
+    out = out.astype(ESQUEMA)
+
+    extras = [c for c in df.columns if c not in ESQUEMA and c not in (lista, nombre, OFERTA)]
+    for c in extras:
+        out[c] = df[c].fillna("").astype(str)
+    return out
+
+
+def _precio(serie: pd.Series) -> pd.Series:
+    return serie.map(lambda v: "" if pd.isna(v) else format_ar_price_no_thousands(v))
+
+
+def vista(t: pd.DataFrame, columnas) -> pd.DataFrame:
+    """
+    Tabla tipada -> columnas de la página con el formato de siempre ('1795,00'); las filas sin precio
+    muestran su marca ('Revisar', 'Sin Precio', '0,00' si la cadena dio cero, vacío sin dato).
+    """
+    lista, nombre = _columna(columnas, LISTA), _columna(columnas, NOMBRE)
+    marcas = {
+        "marcado_revisar": "Revisar",
+        "marcado_sin_precio": "Sin Precio",
+        "precio_cero": format_ar_price_no_thousands(0),
+    }
+    out = pd.DataFrame(index=t.index)
+    for c in columnas:
+        if c == lista:
+            sin_precio = t["motivo"].astype(object).map(marcas).fillna("")
+            out[c] = np.where(t["estado"] == "ok", _precio(t["precio_lista"]), sin_precio)
+        elif c == nombre:
+            out[c] = t["Nombre"].astype(object)
+        elif c == OFERTA:
+            out[c] = np.where(t["precio_oferta"].notna(), _precio(t["precio_oferta"]), t["oferta_texto"].astype(object))
+        elif c in t:
+            out[c] = t[c].astype(object)
+        else:
+            out[c] = ""
+    return out.reset_index(drop=True)
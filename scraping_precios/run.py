@@ -0,0 +1,184 @@
+# run.py
+# Relevamientos sin Streamlit (cron, batch): la misma lógica de cada cadena que usan las páginas.
+#
+#   python run.py --pagina relevamiento --cadena carrefour,dia --salida precios.csv
+#   python -m scraping_precios.run --page dinamicas --chain coto --sucursal 200 --out results.parquet
+#   python run.py --pagina mercado --concurrencia 16 --salida mercado.xlsx
+#
+# Sin --salida, el CSV va a stdout; notas y avisos de cada corrida van a stderr.
+# Con varias cadenas (Relevamiento / Dinámicas) se escribe un archivo por cadena (<salida>_<cadena>.<ext>).
+# Junto a cada archivo queda <nombre>.metricas.json: latencias, errores y bytes por cadena y endpoint.
+# Con --tipado se escriben precios numéricos en vez del texto de la página (mejor en .parquet):
+# Relevamiento / Dinámicas, el esquema de resultados.py (estado / motivo, tipo de oferta); Mercado,
+# el precio float por cadena.
+
+import os
+import sys
+
+# Módulos planos (import motor, vtex, ...): también al correr como python -m scraping_precios.run
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import argparse
+import importlib.util
+import logging
+
+import pandas as pd
+
+import metricas
+import motor
+import vtex
+from corrida import CADENAS, Opciones, cargar_catalogo, clave_cadena
+
+PAGINAS = ("relevamiento", "dinamicas", "mercado")
+FORMATOS = ("csv", "parquet", "json", "xlsx")
+# Formato -> paquete que necesita pandas para escribirlo (están en requirements.txt)
+DEPENDENCIAS = {"parquet": "pyarrow", "xlsx": "openpyxl"}
+
+
+def ejecutar(pagina: str, cadenas=None, op: Opciones = None, catalogo: str = None, on_progress=None) -> list:
+    """
+    Corre una página sin interfaz y devuelve sus Corridas: una por cadena en Relevamiento / Dinámicas,
+    una sola (todas las cadenas como columnas) en Mercado.
+    """
+    import dinamicas
+    import mercado
+    import relevamiento
+
+    op = op or Opciones()
+    productos = cargar_catalogo(catalogo) if catalogo else None
+    if pagina == "mercado":
+        return [mercado.relevar(cadenas, productos, op, on_progress=on_progress)]
+    modulo = relevamiento if pagina == "relevamiento" else dinamicas
+    return [modulo.relevar(c, productos, op, on_progress=on_progress) for c in (cadenas or CADENAS)]
+
+
+def escribir(df: pd.DataFrame, ruta: str, formato: str):
+    if formato == "parquet":
+        df.to_parquet(ruta, index=False)
+    elif formato == "json":
+        df.to_json(ruta, orient="records", force_ascii=False, indent=2)
+    elif formato == "xlsx":
+        df.to_excel(ruta, index=False)
+    else:
+        df.to_csv(ruta, index=False)
+
+
+def _resultado(corrida, tipado: bool = False) -> pd.DataFrame:
+    """Lo que se escribe de una corrida: la vista de la página o, con --tipado, la tabla tipada."""
+    if corrida.pagina.lower() == "mercado":
+        import mercado
+
+        # Las filas de Mercado ya son precios float por cadena (NaN sin precio)
+        return corrida.df() if tipado else mercado.vista_precios(corrida.df(), corrida.detalle["cadenas"])
+    return corrida.tabla() if tipado else corrida.vista()
+
+
+def _cadenas(valor: str):
+    if not valor or valor.strip().lower() == "todas":
+        return None
+    return [clave_cadena(c) for c in valor.split(",") if c.strip()]
+
+
+def _lotes(pares):
+    """['Carrefour=50', 'dia=40'] -> {"Carrefour": 50, "Día": 40} (claves de vtex.LOTE_DEFAULT)."""
+    por_clave = {clave_cadena(k): k for k in vtex.LOTE_DEFAULT}
+    lotes = {}
+    for par in pares or []:
+        cadena, _, n = par.partition("=")
+        clave = clave_cadena(cadena)
+        if clave not in por_clave or not n.strip().isdigit():
+            raise ValueError(f"Lote inválido: {par!r} (ej.: Carrefour=50)")
+        lotes[por_clave[clave]] = min(int(n), vtex.MAX_LOTE)
+    return lotes
+
+
+def _progreso(done, total):
+    print(f"\rProcesando… {done}/{total}", end="" if done < total else "\n", file=sys.stderr, flush=True)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Relevamiento de precios sin Streamlit")
+    ap.add_argument("--pagina", "--page", choices=PAGINAS, default="relevamiento")
+    ap.add_argument("--cadena", "--chain", default="todas", help=f"Lista separada por comas o 'todas' ({', '.join(CADENAS)})")
+    ap.add_argument("--catalogo", "--catalog", help="Lista del catálogo (coto, relevamiento, ...) o .json; por defecto, la de cada página")
+    ap.add_argument("--salida", "--out", help="Archivo de salida (.csv, .parquet, .json, .xlsx); sin esto, CSV a stdout")
+    ap.add_argument("--formato", "--format", choices=FORMATOS, help="Fuerza el formato (por defecto, la extensión de --salida)")
+    ap.add_argument("--concurrencia", type=int, default=motor.DEFAULT_CONCURRENCIA, help="Requests simultáneos por host al arrancar (la ventana AIMD la ajusta)")
+    ap.add_argument("--lote", action="append", metavar="CADENA=N", help="Productos por request VTEX (repetible)")
+    ap.add_argument("--sucursal", default="200", help="idSucursal de Coto")
+    ap.add_argument("--sc", default="1", help="Sales channel de ChangoMás")
+    ap.add_argument("--vtex-segment", help="vtex_segment de ChangoMás (por defecto, el de la página)")
+    ap.add_argument("--sin-4x2", action="store_true", help="Dinámicas ChangoMás: no detectar ofertas 4x2")
+    ap.add_argument("--completo", action="store_true", help="Relevar todo (sin reusar precios estables del historial)")
+    ap.add_argument("--forzar-descarga", action="store_true", help="Ignorar el cache HTTP de catálogo")
+    ap.add_argument("--sin-historial", action="store_true", help="No guardar la corrida en el historial")
+    ap.add_argument("--tipado", action="store_true", help="Precios numéricos (Relevamiento / Dinámicas: estado y tipo de oferta, ver resultados.py)")
+    ap.add_argument("--debug", action="store_true", help="Traza de requests y cambios de ventana a stderr")
+    args = ap.parse_args(argv)
+
+    try:
+        cadenas = _cadenas(args.cadena)
+        op = Opciones(
+            concurrencia=max(1, min(args.concurrencia, motor.MAX_CONCURRENCIA)),
+            lotes=_lotes(args.lote),
+            completo=args.completo,
+            forzar_descarga=args.forzar_descarga,
+            guardar_historial=not args.sin_historial,
+            sucursal=args.sucursal,
+            sc=args.sc,
+            vtex_segment=args.vtex_segment,
+            try_4x2=not args.sin_4x2,
+            debug=args.debug,
+        )
+    except ValueError as e:
+        ap.error(str(e))
+    if args.debug:
+        logging.basicConfig(level=logging.INFO, stream=sys.stderr, format="%(asctime)s %(name)s %(message)s")
+
+    formato = args.formato
+    if args.salida and not formato:
+        formato = os.path.splitext(args.salida)[1].lstrip(".").lower()
+        if formato not in FORMATOS:
+            ap.error(f"No se reconoce el formato de {args.salida!r}; usá --formato ({', '.join(FORMATOS)})")
+    # Antes de relevar: que no falle recién al escribir, después de toda la corrida
+    paquete = DEPENDENCIAS.get(formato)
+    if args.salida and paquete and importlib.util.find_spec(paquete) is None:
+        ap.error(f"El formato {formato} necesita {paquete}, que no está instalado: pip install {paquete}")
+
+    corridas = ejecutar(
+        args.pagina, cadenas, op, catalogo=args.catalogo, on_progress=_progreso if sys.stderr.isatty() else None
+    )
+
+    for corrida in corridas:
+        print(f"== {corrida.pagina} · {corrida.cadena}: {len(corrida.filas)} filas", file=sys.stderr)
+        for emoji, texto in corrida.notas:
+            print(f"{emoji} {texto}", file=sys.stderr)
+        for aviso in corrida.avisos:
+            print(aviso, file=sys.stderr)
+        for linea in corrida.traza:
+            print(linea, file=sys.stderr)
+
+    if not args.salida:
+        if len(corridas) == 1:
+            df = _resultado(corridas[0], args.tipado)
+        elif args.tipado:
+            df = pd.concat([_resultado(c, True) for c in corridas], ignore_index=True)  # ya trae la columna cadena
+        else:
+            df = pd.concat([_resultado(c).assign(Cadena=c.cadena) for c in corridas], ignore_index=True)
+        df.to_csv(sys.stdout, index=False)
+        return 0 if any(c.filas for c in corridas) else 1
+
+    base, ext = os.path.splitext(args.salida)
+    for corrida in corridas:
+        ruta = args.salida if len(corridas) == 1 else f"{base}_{clave_cadena(corrida.cadena)}{ext}"
+        escribir(_resultado(corrida, args.tipado), ruta, formato)
+        print(f"⬇ {ruta}", file=sys.stderr)
+        if corrida.metricas:
+            # Resumen de requests (latencias, errores, bytes) al lado del resultado
+            doc = metricas.documento(corrida.pagina, corrida.cadena, corrida.metricas, corrida.segundos)
+            metricas.escribir(doc, os.path.splitext(ruta)[0] + ".metricas.json")
+    return 0 if any(c.filas for c in corridas) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
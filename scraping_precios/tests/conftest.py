@@ -0,0 +1,17 @@
+# conftest.py
+# Los módulos de la app son planos (import vtex, corrida, ...): se importan desde la carpeta de arriba.
+# Cache, historial y métricas van a una carpeta temporal: los tests no tocan los de la app.
+#
+#   cd scraping_precios && python -m pytest -q tests
+
+import os
+import sys
+import tempfile
+
+_TMP = tempfile.mkdtemp(prefix="scraping_precios_tests_")
+os.environ.setdefault("SCRAPING_PRECIOS_CACHE", os.path.join(_TMP, "cache"))
+os.environ.setdefault("SCRAPING_PRECIOS_HISTORIAL", os.path.join(_TMP, "historial.sqlite"))
+os.environ.setdefault("SCRAPING_PRECIOS_METRICAS", os.path.join(_TMP, "metricas"))
+os.environ.setdefault("SCRAPING_PRECIOS_CATALOGO_SNAPSHOT", "0")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,84 @@
+# test_cache_http.py
+# La descarga forzada es de la corrida (thread y workers), no del cache HTTP compartido.
+
+import os
+import tempfile
+import threading
+
+import requests
+from requests.models import Response
+
+import cache_http
+import motor
+
+URL = "https://www.carrefour.com.ar/api/catalog_system/pub/products/search?fq=alternateIds_Ean:7790580143527"
+
+
+class _Adaptador(cache_http.AdaptadorCache):
+    """Sin red: cada request que llega a _a_la_red responde 200 y se cuenta."""
+
+    def __init__(self, cache):
+        super().__init__(cache)
+        self.red = 0
+        self._lock_red = threading.Lock()
+
+    def _a_la_red(self, request, **kw):
+        with self._lock_red:
+            self.red += 1
+        r = Response()
+        r.status_code = 200
+        r._content = b"[]"
+        r.url = request.url
+        r.request = request
+        return r
+
+
+def _pedir(adaptador):
+    return adaptador.send(requests.Request("GET", URL).prepare())
+
+
+def _adaptador():
+    path = os.path.join(tempfile.mkdtemp(prefix="cache_http_"), "http.sqlite")
+    adaptador = _Adaptador(cache_http.CacheHTTP(path))
+    _pedir(adaptador)  # queda guardada
+    adaptador.red = 0
+    return adaptador
+
+
+def test_descarga_forzada_no_pisa_otra_corrida():
+    adaptador = _adaptador()
+    adentro = threading.Barrier(2)
+    desde_cache = {}
+
+    def corrida(forzar):
+        with cache_http.descarga(forzar):
+            adentro.wait()  # las dos corridas abiertas a la vez
+            desde_cache[forzar] = getattr(_pedir(adaptador), "from_cache", False)
+
+    hilos = [threading.Thread(target=corrida, args=(f,)) for f in (True, False)]
+    for h in hilos:
+        h.start()
+    for h in hilos:
+        h.join()
+
+    assert desde_cache == {True: False, False: True}
+    assert adaptador.red == 1
+    assert cache_http.forzada() == cache_http.BYPASS_ENV  # fuera de una corrida
+
+
+def test_workers_del_motor_heredan_la_descarga_forzada():
+    adaptador = _adaptador()
+    jobs = [("www.carrefour.com.ar", lambda: getattr(_pedir(adaptador), "from_cache", False), None)] * 3
+
+    with cache_http.descarga(True):
+        assert motor.run_jobs(jobs, 2) == [False] * 3
+    with cache_http.descarga(False):
+        assert motor.run_jobs(jobs, 2) == [True] * 3
+    assert adaptador.red == 3
+
+
+def test_resumen_de_la_corrida():
+    cache = cache_http.compartido()
+    marca = cache.marca()
+    assert "descarga forzada" in cache.resumen(marca, descarga_forzada=True)
+    assert "descarga forzada" not in cache.resumen(marca)
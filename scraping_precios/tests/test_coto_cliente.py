@@ -0,0 +1,67 @@
+# test_coto_cliente.py
+# CotoClient.get: el 403 que se recupera con un re-bootstrap no es un fallo de la corrida.
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.models import Response
+
+import cache_http
+import coto
+import reintentos
+
+URL = coto.BASE + "/sitios/cdigi/categoria?Ntt=7790580143527&format=json"
+
+
+class _Red(HTTPAdapter):
+    """Sin red: responde los status de la lista (después, 200) y anota lo pedido."""
+
+    def send(self, request, **kw):
+        self.pedidos.append(request.path_url)
+        r = Response()
+        r.status_code = 200 if request.path_url == "/" or not self.status else self.status.pop(0)
+        r._content = b"{}"
+        r.url = request.url
+        r.request = request
+        return r
+
+
+class _Adaptador(cache_http.AdaptadorCache, _Red):
+    def __init__(self, status):
+        super().__init__()
+        self.status = list(status)
+        self.pedidos = []
+
+
+def _cliente(*status):
+    sesion = requests.Session()
+    adaptador = _Adaptador(status)
+    sesion.mount("https://", adaptador)
+    cliente = coto.CotoClient(sesion, "200", ttl=3600)
+    cliente._expira = float("inf")  # cookies vigentes: sin bootstrap inicial
+    return cliente, adaptador
+
+
+def test_403_recuperado_no_cuenta_como_fallo():
+    cliente, adaptador = _cliente(403)
+    antes = reintentos.fallos()
+
+    assert cliente.get(URL).status_code == 200
+    assert adaptador.pedidos[1] == "/"  # re-bootstrap entre los dos intentos
+    assert cliente.reintentos_403 == 1 and cliente.bootstraps == 1
+    assert reintentos.fallos() == antes
+
+
+def test_403_que_sigue_despues_del_bootstrap_cuenta():
+    cliente, _ = _cliente(403, 403)
+    antes = reintentos.fallos()
+
+    assert cliente.get(URL).status_code == 403
+    assert reintentos.fallos() == antes + 1
+
+
+def test_429_sin_recuperacion_cuenta():
+    cliente, _ = _cliente(429)
+    antes = reintentos.fallos()
+
+    assert cliente.get(URL).status_code == 429
+    assert reintentos.fallos() == antes + 1
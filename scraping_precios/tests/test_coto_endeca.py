@@ -0,0 +1,57 @@
+# test_coto_endeca.py
+# coto.IndiceEndeca: un solo recorrido de la respuesta, con corte temprano que se completa si hace falta.
+
+import coto
+from relevamiento import cast_price
+
+
+def _record(record_id, ean, nombre, precio=None, **extra):
+    attrs = {"record.id": [record_id], "product.eanPrincipal": [ean], "product.displayName": [nombre], **extra}
+    if precio is not None:
+        attrs["sku.activePrice"] = [precio]
+    return {"attributes": attrs, "records": [{"attributes": {"sku.listPrice": ["9999.00"]}}]}
+
+
+def _busqueda():
+    return {
+        "contents": [{
+            "Main": [{"records": [
+                _record("prod1", "7790580143527", "ARCOR POLVO", "1795.00"),
+                _record("prod2", "7622201735258", "OREO", "1259.00"),
+            ]}],
+        }],
+        "pie": {"record.title": ["al final"]},
+    }
+
+
+def test_record_por_ean_y_corte():
+    idx = coto.IndiceEndeca(_busqueda(), ean="7790580143527")
+
+    rec = idx.record_por_ean("7790580143527")
+    assert idx.valor("record.id", rec) == "prod1"
+    assert len(idx._records) < 4 and not idx._completo  # cortó al cerrar el primer record
+
+    otro = idx.record_por_ean("7622201735258")  # más adelante: completa el recorrido
+    assert idx.valor("product.displayName", otro) == "OREO"
+    assert idx.record_por_ean("0000000000000") is None
+    assert idx.valor("record.title") == "al final"
+
+
+def test_records_en_orden_y_primera_aparicion_en_el_documento():
+    idx = coto.IndiceEndeca(_busqueda())
+    assert [idx.valor("record.id", r) for r in idx.records] == ["prod1", "prod2"]
+    assert idx.valor("product.displayName") == "ARCOR POLVO"
+    assert idx.valor("sku.listPrice") == "9999.00"  # sub-records sin ids: no son records
+
+
+def test_detalle_hasta_y_precio_con_fallback():
+    detalle = _record("prod1", "7790580143527", "ARCOR POLVO", "1795.00")
+    idx = coto.IndiceEndeca(detalle, hasta=coto.CLAVES_DETALLE)
+    assert idx.valor("product.eanPrincipal") == "7790580143527"
+    assert idx.precio(cast_price) == 1795.0
+
+    # sku.activePrice que no castea: sigue con CLAVES_PRECIO en orden (sku.listPrice antes que price)
+    sin_active = _record("prod3", "7622210745224", "MILKA", "sin precio", price=["1999.50"])
+    assert coto.IndiceEndeca(sin_active, hasta=coto.CLAVES_DETALLE).precio(cast_price) == 9999.0
+    sin_active["records"] = []
+    assert coto.IndiceEndeca(sin_active, hasta=coto.CLAVES_DETALLE).precio(cast_price) == 1999.5
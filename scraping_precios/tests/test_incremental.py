@@ -0,0 +1,54 @@
+# test_incremental.py
+# Corrida.separar_incremental / combinar_incremental: filas relevadas + reusadas del historial.
+
+import historial
+from corrida import OBSERVADO, Corrida, Opciones
+from resultados import REVISAR, celdas
+
+PAGINA = "Relevamiento"
+COLUMNAS = ["EAN", "Nombre", "Precio"]
+PRODUCTOS = {
+    "ARCOR POLVO": {"ean": "7790580143527"},
+    "OREO": {"ean": "7622201735258"},
+    "MILKA": {"ean": "7622210745224"},
+}
+
+
+def _revisar(nombre, datos):
+    return {"EAN": datos["ean"], "Nombre": nombre, **celdas(estado=REVISAR)}
+
+
+def _relevar(cadena, op):
+    """Como un fetcher de relevamiento.py: releva los pendientes y combina con lo reusado."""
+    corrida = Corrida(PAGINA, cadena, COLUMNAS, op)
+    plan = corrida.separar_incremental(cadena, PRODUCTOS.items())
+    relevadas = [{"EAN": d["ean"], "Nombre": n, **celdas(999.9)} for n, d in plan["pendientes"]]
+    corrida.filas = corrida.combinar_incremental(plan, relevadas, _revisar, lista="Precio")
+    return corrida, relevadas
+
+
+def test_reusadas_quedan_marcadas_y_en_orden():
+    historial.compartido().registrar(PAGINA, [historial.observacion("Vea", "7622201735258", lista=1259.0)])
+
+    corrida, relevadas = _relevar("Vea", Opciones())
+
+    assert [f["EAN"] for f in relevadas] == ["7790580143527", "7622210745224"]
+    assert corrida.columnas == COLUMNAS + [OBSERVADO]
+    v = corrida.vista()
+    assert list(v.columns) == COLUMNAS + [OBSERVADO]
+    assert v["Nombre"].tolist() == list(PRODUCTOS)
+    assert v["Precio"].tolist() == ["999,90", "1259,00", "999,90"]
+    assert v.loc[0, OBSERVADO] == "" and v.loc[2, OBSERVADO] == ""
+    assert v.loc[1, OBSERVADO] == corrida.reusados[0][OBSERVADO] != ""
+    assert corrida.tabla().loc[1, "estado"] == "ok"
+    assert corrida.notas[-1] == ("♻️", "Incremental: 2 relevados (2 sin historial) · 1 reusados del historial")
+
+
+def test_sin_reusadas_no_cambian_las_columnas():
+    historial.compartido().registrar(PAGINA, [historial.observacion("Coto", "7622201735258", lista=1795.0)])
+
+    corrida, relevadas = _relevar("Coto", Opciones(completo=True))
+
+    assert len(relevadas) == 3 and not corrida.reusados
+    assert corrida.columnas == COLUMNAS
+    assert list(corrida.vista().columns) == COLUMNAS
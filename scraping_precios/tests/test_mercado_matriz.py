@@ -0,0 +1,80 @@
+# test_mercado_matriz.py
+# Matriz de precios de Mercado (EAN x cadena, float) y lo que sale de ella.
+
+import math
+
+import numpy as np
+import pandas as pd
+
+import mercado
+
+CADENAS = ["Carrefour", "Día", "Coto"]
+
+
+def _filas():
+    return pd.DataFrame({
+        "Categoría": ["Biscuits", "Chocolates", "Biscuits"],
+        "Marca": ["OREO", "MILKA", "TERRABUSI"],
+        "EAN": ["7622201735258", "7622210745224", "7622300742645"],
+        "Nombre": ["OREO", "MILKA", "TERRABUSI"],
+        "Carrefour": [1259.0, 1999.5, math.nan],
+        "Día": [1130.0, 0.0, 899.0],
+        "Coto": [1795.0, 1999.5, math.nan],
+    })
+
+
+def test_precio():
+    assert mercado.precio("1795.4") == 1795.4
+    assert math.isnan(mercado.precio(None))
+    assert math.isnan(mercado.precio(""))
+    assert math.isnan(mercado.precio(0))
+    assert math.isnan(mercado.precio(math.nan))
+
+
+def test_matriz_float_por_ean_sin_precio_nan():
+    m = mercado.matriz_precios(_filas(), CADENAS)
+
+    assert list(m.index) == ["7622201735258", "7622210745224", "7622300742645"]
+    assert m.index.name == "EAN"
+    assert list(m.columns) == CADENAS
+    assert (m.dtypes == float).all()
+    assert m.loc["7622210745224", "Carrefour"] == 1999.5  # sin redondear
+    assert np.isnan(m.loc["7622210745224", "Día"])  # 0: sin precio
+    assert np.isnan(m.loc["7622300742645", "Coto"])
+
+
+def test_matriz_desde_texto_exportado():
+    texto = mercado.vista_precios(_filas(), CADENAS)
+    m = mercado.matriz_precios(texto, CADENAS)
+    assert m.loc["7622201735258"].tolist() == [1259.0, 1130.0, 1795.0]
+    assert np.isnan(m.loc["7622300742645", "Carrefour"])
+
+
+def test_vista_precios_solo_formatea():
+    filas = _filas()
+    texto = mercado.vista_precios(filas, CADENAS)
+
+    assert texto["Carrefour"].tolist() == ["1259", "2000", ""]
+    assert texto["Día"].tolist() == ["1130", "", "899"]
+    assert texto[["EAN", "Nombre"]].equals(filas[["EAN", "Nombre"]])
+    assert filas["Carrefour"].dtype == float  # no toca las filas de la corrida
+
+
+def test_dispersion_minimos_y_pct():
+    m = mercado.matriz_precios(_filas(), CADENAS)
+
+    disp = mercado.dispersion(m)
+    assert disp.loc["7622201735258", "delta"] == 1795.0 - 1130.0
+    assert np.isnan(disp.loc["7622300742645", "delta"])  # una sola cadena con precio
+
+    mins = mercado.minimos(m)
+    assert mins.loc["7622201735258"].tolist() == [False, True, False]
+    assert mins.loc["7622210745224"].tolist() == [True, False, True]  # empate
+
+    pct = mercado.pct_vs(m, "Carrefour")
+    assert round(pct.loc["7622201735258", "Coto"], 4) == round(1795 / 1259 - 1, 4)
+    assert pct["Carrefour"].isna().all()
+
+    tabla = mercado.build_pct_vs_table(_filas(), CADENAS, base="Carrefour", matriz=m)
+    assert tabla.loc[0, "Coto"] == f"{1795 / 1259 - 1:+.1%}"
+    assert tabla.loc[2, "Día"] == ""
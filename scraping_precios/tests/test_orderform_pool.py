@@ -0,0 +1,65 @@
+# test_orderform_pool.py
+# vtex.OrderFormPool: crece con la ventana del host y no deja colgado a un worker si la corrida se cancela.
+
+import threading
+
+import pytest
+
+import motor
+import vtex
+
+
+class _Resp:
+    status_code = 200
+
+    def __init__(self, data):
+        self._data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._data
+
+
+class _Sesion:
+    def __init__(self):
+        self.n = 0
+        self._lock = threading.Lock()
+
+    def post(self, url, headers=None, json=None, timeout=None):
+        with self._lock:
+            self.n += 1
+            return _Resp({"orderFormId": f"of-{self.n}"})
+
+
+def test_crece_a_demanda_hasta_la_ventana():
+    pool = vtex.OrderFormPool(_Sesion(), "https://www.masonline.com.ar")
+    assert pool.size == motor.MAX_CONCURRENCIA
+
+    carritos = [pool._acquire() for _ in range(12)]  # más que motor.DEFAULT_CONCURRENCIA en vuelo
+    assert len({c["id"] for c in carritos}) == 12
+    for c in carritos:
+        pool._libres.put(c)
+    with pool.carrito() as cart:
+        assert cart["id"] in {c["id"] for c in carritos}
+    assert pool.creados == 12  # con carritos libres no crea más
+
+
+def test_espera_un_carrito_libre():
+    pool = vtex.OrderFormPool(_Sesion(), "https://www.masonline.com.ar", size=1)
+    ocupado = pool._acquire()
+    threading.Timer(0.1, pool._libres.put, args=(ocupado,)).start()
+
+    assert pool._acquire() is ocupado
+    assert pool.creados == 1
+
+
+def test_cancelada_no_queda_esperando():
+    pool = vtex.OrderFormPool(_Sesion(), "https://www.masonline.com.ar", size=1)
+    pool._acquire()  # el único carrito queda tomado y nadie lo devuelve
+    cancelar = threading.Event()
+    threading.Timer(0.1, cancelar.set).start()
+
+    with motor.cancelacion(cancelar), pytest.raises(motor.Cancelado):
+        pool._acquire()
@@ -0,0 +1,71 @@
+# test_resolucion.py
+# CacheIdentificadores.usar_o_resolver: cuándo un id cacheado se descarta y cuándo se conserva.
+
+import os
+import tempfile
+
+import pytest
+import requests
+
+import resolucion
+
+
+def _cache():
+    cache = resolucion.CacheIdentificadores(os.path.join(tempfile.mkdtemp(prefix="ids_"), "ids.json"))
+    cache.put("Coto", "7790580143527", "200", recordId="viejo")
+    return cache
+
+
+def _http_error(status):
+    resp = requests.Response()
+    resp.status_code = status
+    return requests.HTTPError(f"{status}", response=resp)
+
+
+def _resolver(llamadas):
+    def resolver():
+        llamadas.append("resolver")
+        return {"recordId": "nuevo"}
+    return resolver
+
+
+def _usar(falla_con):
+    def usar(ids):
+        if ids["recordId"] == "viejo" and falla_con is not None:
+            raise falla_con
+        return ids["recordId"]
+    return usar
+
+
+def test_id_vigente_no_resuelve():
+    cache, llamadas = _cache(), []
+    assert cache.usar_o_resolver("Coto", "7790580143527", "200", _resolver(llamadas), _usar(None)) == "viejo"
+    assert llamadas == []
+
+
+@pytest.mark.parametrize("status", [404, 410])
+def test_id_que_ya_no_existe_se_re_resuelve(status):
+    cache, llamadas = _cache(), []
+    res = cache.usar_o_resolver("Coto", "7790580143527", "200", _resolver(llamadas), _usar(_http_error(status)))
+
+    assert res == "nuevo" and llamadas == ["resolver"]
+    assert cache.get("Coto", "7790580143527", "200")["recordId"] == "nuevo"
+    assert cache.invalidados == 1
+
+
+def test_usar_sin_resultado_se_re_resuelve():
+    cache, llamadas = _cache(), []
+    usar = lambda ids: None if ids["recordId"] == "viejo" else ids["recordId"]
+    assert cache.usar_o_resolver("Coto", "7790580143527", "200", _resolver(llamadas), usar) == "nuevo"
+    assert cache.invalidados == 1
+
+
+@pytest.mark.parametrize("error", [_http_error(503), requests.ConnectionError("caída"), requests.Timeout("lenta")])
+def test_error_de_red_o_5xx_conserva_el_id(error):
+    cache, llamadas = _cache(), []
+    with pytest.raises(type(error)):
+        cache.usar_o_resolver("Coto", "7790580143527", "200", _resolver(llamadas), _usar(error))
+
+    assert llamadas == []
+    assert cache.get("Coto", "7790580143527", "200")["recordId"] == "viejo"
+    assert cache.invalidados == 0
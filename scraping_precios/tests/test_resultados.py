@@ -0,0 +1,104 @@
+# test_resultados.py
+# Esquema tipado de Relevamiento / Dinámicas: filas tipadas de los fetchers, tabla() y vista().
+
+import math
+
+import pandas as pd
+
+import catalogo
+import resultados
+from resultados import REVISAR, SIN_PRECIO
+
+COLUMNAS_DINAMICAS = ["Empresa", "Categoría", "Subcategoría", "Marca", "Nombre", "EAN", "ListPrice", "Oferta"]
+
+
+def _fila(precio=None, oferta="", estado=None, ean="7790580143527"):
+    """Como dinamicas.fila_base(): ListPrice float / NaN con su estado y la oferta como float o texto."""
+    return {
+        "Empresa": "ARCOR", "Categoría": "Beverages", "Subcategoría": "Pbs", "Marca": "ARCOR",
+        "Nombre": "ARCOR POLVO", "EAN": ean, **resultados.celdas(precio, estado, columna="ListPrice"), "Oferta": oferta,
+    }
+
+
+def test_precio_lista():
+    assert resultados.precio_lista(1795.0) == (1795.0, "ok", "")
+    assert resultados.precio_lista(1054) == (1054.0, "ok", "")
+    assert resultados.precio_lista(estado=REVISAR)[1:] == ("revisar", "marcado_revisar")
+    assert resultados.precio_lista(1795.0, SIN_PRECIO)[1:] == ("sin_precio", "marcado_sin_precio")
+    assert resultados.precio_lista(None)[1:] == ("no_encontrado", "sin_dato")
+    assert resultados.precio_lista(math.nan)[1:] == ("no_encontrado", "sin_dato")
+    precio, estado, motivo = resultados.precio_lista(0.0)
+    assert math.isnan(precio) and (estado, motivo) == ("no_encontrado", "precio_cero")
+
+
+def test_celdas():
+    assert resultados.celdas(1795.0) == {"Precio": 1795.0, "estado": "ok", "motivo": ""}
+    c = resultados.celdas(estado=REVISAR, columna="ListPrice")
+    assert math.isnan(c["ListPrice"]) and (c["estado"], c["motivo"]) == ("revisar", "marcado_revisar")
+
+
+def test_oferta():
+    assert resultados.oferta(1234.5)[:2] == (1234.5, "precio")
+    assert resultados.oferta(0.0)[1] == ""
+    assert resultados.oferta("25% off")[1:] == ("porcentaje", 25.0)
+    assert resultados.oferta("2do al 70%")[1:] == ("segunda_unidad", 35.0)
+    tipo, valor = resultados.oferta("Llevando 3x2")[1:]
+    assert tipo == "nxm" and round(valor, 1) == 33.3
+    assert resultados.oferta("Precio especial socios")[1] == "texto"
+    assert resultados.oferta("Revisar")[1] == ""
+    assert resultados.oferta("")[1] == ""
+
+
+def test_tabla_tiene_el_esquema():
+    filas = [_fila(1795.0, "25% off"), _fila(estado=REVISAR), _fila(0, "2do al 70%")]
+    t = resultados.tabla(filas, COLUMNAS_DINAMICAS, "Día")
+
+    for col, tipo in resultados.ESQUEMA.items():
+        assert str(t[col].dtype) == str(pd.Series(dtype=tipo).dtype), col
+    assert t["cadena"].tolist() == ["Día"] * 3
+    assert t["estado"].tolist() == ["ok", "revisar", "no_encontrado"]
+    assert t["motivo"].tolist() == ["", "marcado_revisar", "precio_cero"]
+    assert t.loc[0, "precio_lista"] == 1795.0 and pd.isna(t.loc[1, "precio_lista"])
+    assert t["oferta_tipo"].tolist() == ["porcentaje", "", "segunda_unidad"]
+
+
+def test_fila_sin_estado_se_clasifica_por_el_precio():
+    filas = [{"EAN": "7790580143527", "Nombre": "ARCOR POLVO", "Precio": 1795.0}, {"EAN": "", "Nombre": "OREO"}]
+    t = resultados.tabla(filas, ["EAN", "Nombre", "Precio"], "Día")
+    assert t["estado"].tolist() == ["ok", "no_encontrado"]
+    assert t["motivo"].tolist() == ["", "sin_dato"]
+
+
+def test_vista_da_el_formato_de_la_pagina():
+    filas = [
+        _fila(1795.0, 1500.5),
+        _fila(estado=REVISAR, oferta="Revisar"),
+        _fila(estado=SIN_PRECIO, oferta="Sin Precio"),
+        _fila(0, "Llevando 3x2"),
+        _fila(None, None),
+        _fila(1054.0, "25% off"),
+    ]
+    t = resultados.tabla(filas, COLUMNAS_DINAMICAS, "Jumbo")
+    v = resultados.vista(t, COLUMNAS_DINAMICAS)
+
+    assert list(v.columns) == COLUMNAS_DINAMICAS
+    assert v["ListPrice"].tolist() == ["1795,00", "Revisar", "Sin Precio", "0,00", "", "1054,00"]
+    assert v["Oferta"].tolist() == ["1500,50", "Revisar", "Sin Precio", "Llevando 3x2", "", "25% off"]
+    assert v["Nombre"].tolist() == ["ARCOR POLVO"] * 6
+
+
+def test_categoricas_del_catalogo_y_columnas_extra():
+    cat = catalogo.compartido()
+    ean = next(iter(cat.vista("relevamiento").values()))["ean"]
+    meta = cat.por_ean(ean)
+    columnas = ["EAN", "RefId", "Nombre", "Precio"]
+    filas = [{"EAN": ean, "RefId": "R-1", "Nombre": "Algo", **resultados.celdas(999.9)}]
+
+    t = resultados.tabla(filas, columnas, "ChangoMás")
+    assert t.loc[0, "Empresa"] == meta["empresa"]
+    assert t.loc[0, "Categoría"] == meta["categoría"]
+    assert t.loc[0, "RefId"] == "R-1"
+    assert list(t.columns[-1:]) == ["RefId"]
+
+    v = resultados.vista(t, columnas)
+    assert v.iloc[0].tolist() == [ean, "R-1", "Algo", "999,90"]
@@ -0,0 +1,41 @@
+# test_run.py
+# run.py: los formatos que necesitan un paquete aparte fallan antes de relevar, diciendo cuál.
+
+import importlib.util
+import os
+
+import pytest
+
+import run
+
+
+def _sin(paquete, monkeypatch):
+    find_spec = importlib.util.find_spec
+    monkeypatch.setattr(importlib.util, "find_spec", lambda nombre, *a: None if nombre == paquete else find_spec(nombre, *a))
+
+    def ejecutar(*a, **kw):
+        raise AssertionError("no debería relevar")
+    monkeypatch.setattr(run, "ejecutar", ejecutar)
+
+
+@pytest.mark.parametrize("salida, paquete", [("precios.xlsx", "openpyxl"), ("precios.parquet", "pyarrow")])
+def test_formato_sin_su_paquete(salida, paquete, monkeypatch, capsys):
+    _sin(paquete, monkeypatch)
+    with pytest.raises(SystemExit) as e:
+        run.main(["--pagina", "mercado", "--salida", salida])
+
+    assert e.value.code == 2
+    assert f"pip install {paquete}" in capsys.readouterr().err
+
+
+def test_formato_forzado_sin_su_paquete(monkeypatch, capsys):
+    _sin("pyarrow", monkeypatch)
+    with pytest.raises(SystemExit):
+        run.main(["--salida", "precios.dat", "--formato", "parquet"])
+    assert "necesita pyarrow" in capsys.readouterr().err
+
+
+def test_requirements_tiene_los_paquetes_de_los_formatos():
+    with open(os.path.join(os.path.dirname(run.__file__), "requirements.txt"), encoding="utf-8") as f:
+        paquetes = {linea.strip() for linea in f}
+    assert set(run.DEPENDENCIAS.values()) <= paquetes
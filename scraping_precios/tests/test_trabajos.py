@@ -0,0 +1,56 @@
+# test_trabajos.py
+# Trabajos.lanzar: relanzar la misma página + cadena mientras corre.
+
+import threading
+
+import pytest
+
+import trabajos
+from corrida import Opciones
+
+
+def _bloqueado(suelta):
+    def fn(on_progress):
+        suelta.wait(5)
+        return "corrida"
+    return fn
+
+
+def test_mismas_opciones_devuelve_el_trabajo_en_curso():
+    registro = trabajos.Trabajos()
+    suelta = threading.Event()
+    op = Opciones(sucursal="200")
+    primero = registro.lanzar("Relevamiento", "coto", _bloqueado(suelta), "Coto", op.clave())
+    otra_vez = registro.lanzar("Relevamiento", "coto", _bloqueado(suelta), "Coto", Opciones(sucursal="200").clave())
+    suelta.set()
+
+    assert otra_vez is primero
+
+
+def test_otras_opciones_no_devuelve_el_trabajo_viejo():
+    registro = trabajos.Trabajos()
+    suelta = threading.Event()
+    primero = registro.lanzar("Dinamicas", "changomas", _bloqueado(suelta), "ChangoMás", Opciones(try_4x2=True).clave())
+
+    with pytest.raises(trabajos.EnCurso) as e:
+        registro.lanzar("Dinamicas", "changomas", _bloqueado(suelta), "ChangoMás", Opciones(try_4x2=False).clave())
+    assert e.value.trabajo is primero
+    assert "otras opciones" in str(e.value)
+
+    otra_sucursal = Opciones(sucursal="91").clave()
+    assert registro.lanzar("Dinamicas", "coto", _bloqueado(suelta), "Coto", otra_sucursal) is not primero
+    suelta.set()
+
+
+def test_terminado_se_relanza():
+    registro = trabajos.Trabajos()
+    suelta = threading.Event()
+    suelta.set()
+    primero = registro.lanzar("Relevamiento", "dia", _bloqueado(suelta), "Día", Opciones().clave())
+    for _ in range(100):
+        if not primero.en_curso:
+            break
+        threading.Event().wait(0.01)
+
+    assert primero.corrida == "corrida"
+    assert registro.lanzar("Relevamiento", "dia", _bloqueado(suelta), "Día", Opciones(completo=True).clave()) is not primero
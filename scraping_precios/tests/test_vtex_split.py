@@ -0,0 +1,104 @@
+# test_vtex_split.py
+# VtexBatchSimulation.split: qué parte de una simulación en lote le toca a cada SKU.
+
+from vtex import VtexBatchSimulation
+
+
+def _item(idx, sku, *tags):
+    return {"id": sku, "requestIndex": idx, "priceTags": [{"identifier": t, "value": -100} for t in tags]}
+
+
+def _sim(items, idents=(), messages=()):
+    return {
+        "items": list(items),
+        "messages": list(messages),
+        "ratesAndBenefitsData": {"rateAndBenefitsIdentifiers": [{"id": i} for i in idents]},
+    }
+
+
+def test_identifier_de_un_solo_item_es_de_ese_sku():
+    sim = _sim([_item(0, "10", "promo-a"), _item(1, "20"), _item(2, "30")], idents=["promo-a"])
+    partes = VtexBatchSimulation.split(sim, ["10", "20", "30"])
+
+    assert partes["10"]["ratesAndBenefitsData"]["rateAndBenefitsIdentifiers"] == [{"id": "promo-a"}]
+    assert partes["20"]["ratesAndBenefitsData"]["rateAndBenefitsIdentifiers"] == []
+    assert [it["id"] for it in partes["30"]["items"]] == ["30"]
+
+
+def test_promo_cruzada_en_algunos_items_solo_re_simula_esos():
+    items = [_item(0, "10", "combo"), _item(1, "20", "combo"), _item(2, "30", "propia")]
+    partes = VtexBatchSimulation.split(_sim(items, idents=["combo", "propia"]), ["10", "20", "30"])
+
+    assert partes["10"] is None and partes["20"] is None
+    assert partes["30"]["ratesAndBenefitsData"]["rateAndBenefitsIdentifiers"] == [{"id": "propia"}]
+
+
+def test_promo_cruzada_sin_identifier_en_el_carrito_igual_se_detecta():
+    items = [_item(0, "10", "combo"), _item(1, "20", "combo"), _item(2, "30")]
+    partes = VtexBatchSimulation.split(_sim(items), ["10", "20", "30"])
+
+    assert partes["10"] is None and partes["20"] is None
+    assert partes["30"] is not None
+
+
+def test_item_partido_en_varias_lineas_queda_junto():
+    items = [_item(0, "10", "promo-a"), _item(0, "10"), _item(1, "20")]
+    partes = VtexBatchSimulation.split(_sim(items, idents=["promo-a"]), ["10", "20"])
+
+    assert len(partes["10"]["items"]) == 2
+    assert partes["10"]["ratesAndBenefitsData"]["rateAndBenefitsIdentifiers"] == [{"id": "promo-a"}]
+
+
+def test_mensajes_por_item_y_del_carrito():
+    items = [_item(0, "10"), _item(1, "20")]
+    msg_item = {"code": "withoutStock", "fields": {"itemIndex": "1"}}
+    partes = VtexBatchSimulation.split(_sim(items, messages=[msg_item]), ["10", "20"])
+    assert partes["20"]["messages"] == [msg_item] and partes["10"]["messages"] == []
+
+    msg_carrito = {"code": "cartLevel", "fields": {}}
+    assert VtexBatchSimulation.split(_sim(items, messages=[msg_carrito]), ["10", "20"]) is None
+
+
+def test_beneficio_sin_price_tags_es_del_carrito():
+    items = [_item(0, "10"), _item(1, "20")]
+    assert VtexBatchSimulation.split(_sim(items, idents=["total-carrito"]), ["10", "20"]) is None
+
+
+def test_simulacion_fallida():
+    assert VtexBatchSimulation.split(None, ["10"]) is None
+
+
+class _Resp:
+    def __init__(self, data):
+        self.status_code = 200
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+class _Sesion:
+    """Lote: combo entre los dos primeros SKUs; cada SKU solo: sin promo."""
+
+    def __init__(self):
+        self.pedidos = []
+
+    def post(self, url, headers=None, params=None, json=None, timeout=None):
+        skus = [it["id"] for it in json["items"]]
+        self.pedidos.append(skus)
+        if len(skus) == 1:
+            return _Resp(_sim([_item(0, skus[0])]))
+        items = [_item(i, s, "combo") if i < 2 else _item(i, s) for i, s in enumerate(skus)]
+        return _Resp(_sim(items, idents=["combo"]))
+
+
+def test_simulate_re_simula_solo_los_de_la_promo_cruzada():
+    sesion = _Sesion()
+    sims = VtexBatchSimulation(sesion, "https://tienda.example", batch_size=10)
+    sims.simulate(["10", "20", "30", "40"], concurrencia=1)
+
+    assert sesion.pedidos == [["10", "20", "30", "40"], ["10"], ["20"]]
+    assert sims.skus_cruzados == 2 and sims.lotes_carrito == 0
+    assert sims.get("10")["ratesAndBenefitsData"]["rateAndBenefitsIdentifiers"] == []
+    assert sims.get("30")["items"][0]["id"] == "30"
+    assert len(sesion.pedidos) == 3  # get() de lo ya simulado no vuelve a pedir
@@ -0,0 +1,163 @@
+# trabajos.py
+# Relevamientos en segundo plano, fuera del thread del script de Streamlit.
+#
+# Un rerun (tocar cualquier widget, cambiar de pestaña o de página) corta el script, y con
+# él la corrida que estaba dentro del st.spinner. Acá cada relevamiento corre en su propio
+# thread y queda registrado con un id:
+#   - la página guarda los ids en st.session_state y vuelve a engancharse en cada rerun
+#   - varias cadenas pueden correr a la vez (una corrida activa por página + cadena); relanzar
+#     con las mismas opciones se engancha a la activa, con otras levanta EnCurso
+#   - lo terminado queda disponible (las últimas MAX_TERMINADOS) hasta que se relance
+#   - cancelar() corta el despacho del motor (motor.Cancelado); lo que está en vuelo termina
+
+import itertools
+import threading
+import time
+import traceback
+
+import motor
+
+MAX_TERMINADOS = 30
+
+EN_CURSO = "en curso"
+TERMINADO = "terminado"
+CANCELADO = "cancelado"
+ERROR = "error"
+
+
+class EnCurso(Exception):
+    """La página + cadena ya tiene un trabajo en curso, lanzado con otras opciones."""
+
+    def __init__(self, trabajo: "Trabajo"):
+        self.trabajo = trabajo
+        super().__init__(
+            f"{trabajo.etiqueta}: ya hay un relevamiento en curso con otras opciones."
+            " Cancelalo o esperá a que termine para relanzar."
+        )
+
+
+class Trabajo:
+    """Un relevamiento lanzado en segundo plano; la página lo consulta en cada rerun."""
+
+    def __init__(self, id_: str, pagina: str, cadena: str, etiqueta: str, opciones=None):
+        self.id = id_
+        self.pagina = pagina
+        self.cadena = cadena
+        self.etiqueta = etiqueta
+        self.opciones = opciones
+        self.estado = EN_CURSO
+        self.hecho = 0
+        self.total = 0
+        self.corrida = None
+        self.error = None
+        self.traceback = None
+        self.creado = time.time()
+        self.terminado = None
+        self._cancelar = threading.Event()
+
+    @property
+    def en_curso(self) -> bool:
+        return self.estado == EN_CURSO
+
+    @property
+    def cancelando(self) -> bool:
+        return self.en_curso and self._cancelar.is_set()
+
+    @property
+    def fraccion(self) -> float:
+        return min(self.hecho / max(1, self.total), 1.0)
+
+    @property
+    def segundos(self) -> float:
+        return (self.terminado or time.time()) - self.creado
+
+    def cancelar(self):
+        self._cancelar.set()
+
+    def resumen(self) -> str:
+        avance = f" · {self.hecho}/{self.total}" if self.total else ""
+        estado = "cancelando" if self.cancelando else self.estado
+        return f"{self.etiqueta}: {estado}{avance} · {self.segundos:.0f}s"
+
+    def _on_progress(self, done, total):
+        self.hecho, self.total = done, total
+
+    def _correr(self, fn):
+        with motor.cancelacion(self._cancelar):
+            try:
+                self.corrida = fn(self._on_progress)
+                self.estado = TERMINADO
+            except motor.Cancelado:
+                self.estado = CANCELADO
+            except Exception as e:
+                self.error = f"{type(e).__name__}: {e}"
+                self.traceback = traceback.format_exc()
+                self.estado = ERROR
+            finally:
+                self.terminado = time.time()
+
+
+class Trabajos:
+    """Registro de trabajos del proceso (compartido entre sesiones y reruns)."""
+
+    def __init__(self, max_terminados: int = MAX_TERMINADOS):
+        self.max_terminados = max_terminados
+        self._trabajos = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def lanzar(self, pagina: str, cadena: str, fn, etiqueta: str = None, opciones=None) -> Trabajo:
+        """
+        Corre fn(on_progress) -> Corrida en un thread propio. Si la misma página + cadena ya
+        está corriendo con las mismas `opciones` (Opciones.clave()), devuelve ese trabajo en vez
+        de lanzar otro; si corre con otras, levanta EnCurso.
+        """
+        with self._lock:
+            activo = self._activo(pagina, cadena)
+            if activo is not None:
+                if activo.opciones != opciones:
+                    raise EnCurso(activo)
+                return activo
+            trabajo = Trabajo(f"{pagina}-{cadena}-{next(self._ids)}", pagina, cadena, etiqueta or cadena, opciones)
+            self._trabajos[trabajo.id] = trabajo
+            self._podar()
+        threading.Thread(target=trabajo._correr, args=(fn,), name=f"trabajo-{trabajo.id}", daemon=True).start()
+        return trabajo
+
+    def get(self, id_: str):
+        with self._lock:
+            return self._trabajos.get(id_)
+
+    def activo(self, pagina: str, cadena: str):
+        with self._lock:
+            return self._activo(pagina, cadena)
+
+    def de(self, ids) -> list:
+        """Trabajos (todavía registrados) de una lista de ids, en ese orden."""
+        with self._lock:
+            return [self._trabajos[i] for i in ids if i in self._trabajos]
+
+    def _activo(self, pagina, cadena):
+        for t in self._trabajos.values():
+            if t.pagina == pagina and t.cadena == cadena and t.en_curso:
+                return t
+        return None
+
+    def _podar(self):
+        terminados = [t for t in self._trabajos.values() if not t.en_curso]
+        terminados.sort(key=lambda t: t.terminado or 0)
+        for t in terminados[: max(0, len(terminados) - self.max_terminados)]:
+            del self._trabajos[t.id]
+
+
+_trabajos = None
+_trabajos_lock = threading.Lock()
+
+
+def compartido() -> Trabajos:
+    """Instancia compartida por todas las páginas (sobrevive a los reruns de Streamlit)."""
+    global _trabajos
+    with _trabajos_lock:
+        if _trabajos is None:
+            _trabajos = Trabajos()
+        return _trabajos
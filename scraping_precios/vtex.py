@@ -0,0 +1,650 @@
+# vtex.py
+# Helpers compartidos para las cadenas VTEX (Carrefour, Día, ChangoMás, Jumbo, Vea, HiperLibertad).
+#
+# Búsqueda en lote: catalog_system/pub/products/search acepta varios `fq` del mismo
+# campo (se combinan como OR) y una ventana `_from/_to` (máx. 50 productos).
+# Se resuelven N identificadores por request, se reparte la respuesta por
+# identificador y solo se cae a la búsqueda individual para lo que el lote no devolvió.
+#
+# Simulación en lote: orderForms/simulation acepta muchos items por POST; la
+# respuesta se reparte por SKU (items, messages, ratesAndBenefitsData).
+#
+# Promos en lote (Cencosud): /_v/search-promotions recibe una lista de `skus` y
+# responde indexado por SKU dentro de cada bucket (generic, sgc, jumbo_prime).
+#
+# Pool de orderForms: carritos de checkout reutilizables entre productos.
+
+import queue
+import threading
+from contextlib import contextmanager
+
+import motor
+import reintentos
+
+SEARCH_PATH = "/api/catalog_system/pub/products/search"
+
+# Ventana máxima que acepta VTEX en _from/_to
+MAX_LOTE = 50
+
+# Tamaño de lote por cadena (1 = sin lote, búsqueda individual)
+LOTE_DEFAULT = {
+    "Carrefour": 40,
+    "Día": 50,
+    "ChangoMás": 30,
+    "Jumbo": 40,
+    "Vea": 40,
+    "HiperLibertad": 30,
+}
+
+
+def item_keys(item: dict, field: str) -> list:
+    """
+    Claves por las que un item responde a un `fq`:
+    - alternateIds_Ean / ean: item.ean o referenceId[].Value (mismas reglas que pick_item_by_ean)
+    - alternateIds_RefId: referenceId[].Value
+    - skuId: itemId
+    """
+    keys = []
+    if field == "skuId":
+        keys.append(str(item.get("itemId") or "").strip())
+    else:
+        if field != "alternateIds_RefId":
+            keys.append(str(item.get("ean") or "").strip())
+        for ref in (item.get("referenceId") or []):
+            if isinstance(ref, dict):
+                keys.append(str(ref.get("Value") or "").strip())
+    return [k for k in keys if k]
+
+
+class VtexBatchLookup:
+    """
+    Lookup en lote contra el catálogo VTEX.
+
+    lookup(key) devuelve lo mismo que la búsqueda individual: una lista de productos
+    ([prod] si el lote lo resolvió). Si el lote no lo trajo, llama a `single(key)`.
+    """
+
+    def __init__(self, session, base: str, single=None, headers: dict = None, params: dict = None,
+                 field: str = "alternateIds_Ean", batch_size: int = 40, timeout=(4, 18)):
+        self.session = session
+        self.base = base.rstrip("/")
+        self.single = single
+        self.headers = headers or {}
+        self.params = dict(params or {})
+        self.field = field
+        self.batch_size = max(1, min(int(batch_size or 1), MAX_LOTE))
+        self.timeout = timeout
+
+        self._index = {}
+        self._singles = {}
+        self._lock = threading.Lock()
+        self.keys_total = 0
+        self.requests_batch = 0
+        self.requests_single = 0
+
+    # --------------------------------------------
+    # Prefetch
+    # --------------------------------------------
+    def _fetch_chunk(self, chunk: list):
+        url = f"{self.base}{SEARCH_PATH}"
+        window = len(chunk)
+        desde = 0
+        while True:
+            params = [("fq", f"{self.field}:{k}") for k in chunk]
+            params += list(self.params.items())
+            params += [("_from", desde), ("_to", desde + window - 1)]
+            r = self.session.get(url, headers=self.headers, params=params, timeout=self.timeout)
+            with self._lock:
+                self.requests_batch += 1
+            r.raise_for_status()
+            data = r.json()
+            if not isinstance(data, list):
+                return
+
+            wanted = set(chunk)
+            with self._lock:
+                for prod in data:
+                    for it in (prod or {}).get("items") or []:
+                        for k in item_keys(it, self.field):
+                            if k in wanted and k not in self._index:
+                                self._index[k] = prod
+
+            # Página completa y con claves sin resolver: puede haber más productos
+            if len(data) < window or wanted.issubset(self._index):
+                return
+            desde += window
+            if desde >= MAX_LOTE * 4:
+                return
+
+    def prefetch_jobs(self, keys):
+        """Jobs (host, fn, fallback) para combinar varios lotes en una sola corrida del motor."""
+        uniq = list(dict.fromkeys(str(k).strip() for k in keys if str(k or "").strip()))
+        self.keys_total += len(uniq)
+        if self.field == "skuId":
+            # Placeholders tipo "NO_ENCONTRADO" harían fallar el lote entero
+            uniq = [k for k in uniq if k.isdigit()]
+        if self.batch_size <= 1:
+            return []
+        host = motor.host_of(self.base)
+        chunks = [uniq[i:i + self.batch_size] for i in range(0, len(uniq), self.batch_size)]
+        # Si un lote falla, sus claves quedan para la búsqueda individual
+        return [(host, (lambda c=c: self._fetch_chunk(c)), None) for c in chunks]
+
+    def prefetch(self, keys, concurrencia: int = motor.DEFAULT_CONCURRENCIA):
+        motor.run_jobs(self.prefetch_jobs(keys), limite_por_host=concurrencia)
+        return self
+
+    # --------------------------------------------
+    # Lookup
+    # --------------------------------------------
+    def cached(self, key):
+        """Como lookup, pero sin caer a la búsqueda individual."""
+        prod = self._index.get(str(key or "").strip())
+        return [prod] if prod is not None else []
+
+    def lookup(self, key):
+        key = str(key or "").strip()
+        prod = self._index.get(key)
+        if prod is not None:
+            return [prod]
+        if self.single is None or (self.field == "skuId" and not key.isdigit()):
+            return []
+        with self._lock:
+            if key in self._singles:
+                return self._singles[key]
+            self.requests_single += 1
+        fallos = reintentos.fallos()
+        data = self.single(key)
+        if reintentos.fallos() == fallos:
+            # Un fallo de red no se memoiza: la segunda pasada del motor lo vuelve a pedir
+            with self._lock:
+                self._singles[key] = data
+        return data
+
+    # --------------------------------------------
+    # Resumen
+    # --------------------------------------------
+    @property
+    def requests_total(self) -> int:
+        return self.requests_batch + self.requests_single
+
+    @property
+    def requests_saved(self) -> int:
+        return max(0, self.keys_total - self.requests_total)
+
+    def resumen(self) -> str:
+        return (
+            f"Catálogo: {self.requests_total} requests ({self.requests_batch} en lote de hasta {self.batch_size}"
+            f" + {self.requests_single} individuales) para {self.keys_total} productos"
+            f" · ahorro {self.requests_saved} requests"
+        )
+
+
+# ============================================
+# Simulación de checkout en lote
+# ============================================
+SIMULATION_PATH = "/api/checkout/pub/orderForms/simulation"
+
+
+def _message_index(msg):
+    """requestIndex del item al que apunta un message de checkout (o None si es del carrito)."""
+    if not isinstance(msg, dict):
+        return None
+    fields = msg.get("fields") or {}
+    idx = fields.get("itemIndex")
+    try:
+        return int(idx)
+    except (TypeError, ValueError):
+        return None
+
+
+class VtexBatchSimulation:
+    """
+    orderForms/simulation con muchos SKUs por POST (un POST por lote y por cantidad).
+
+    get(sku, qty) devuelve un json con la misma forma que la simulación individual
+    ({"items": [...], "messages": [...], "ratesAndBenefitsData": {...}}), pero solo con
+    lo que corresponde a ese SKU:
+    - items[]: por requestIndex (VTEX puede partir un item en varias líneas)
+    - messages[]: por fields.itemIndex
+    - rateAndBenefitsIdentifiers[]: por los priceTags[].identifier de sus items, solo si
+      apuntan a un único requestIndex
+
+    Un identifier en los priceTags de varios items es una promo cruzada (2do al 50% en la
+    colección, llevando A + B, ...): se disparó por tenerlos juntos en el carrito, así que solo
+    esos SKUs se re-simulan solos. Si el lote trae algo que no apunta a ningún item (beneficio
+    o mensaje del carrito), se re-simula entero, SKU por SKU.
+    """
+
+    def __init__(self, session, base: str, headers: dict = None, params: dict = None,
+                 seller: str = "1", country: str = "ARG", batch_size: int = 30, timeout=(4, 18)):
+        self.session = session
+        self.base = base.rstrip("/")
+        self.headers = headers or {}
+        self.params = dict(params or {})
+        self.seller = str(seller)
+        self.country = country
+        self.batch_size = max(1, min(int(batch_size or 1), MAX_LOTE))
+        self.timeout = timeout
+
+        self._sims = {}
+        self._lock = threading.Lock()
+        self.keys_total = 0
+        self.requests_batch = 0
+        self.requests_single = 0
+        self.lotes_carrito = 0
+        self.skus_cruzados = 0   # re-simulados solos por una promo cruzada del lote
+
+    # --------------------------------------------
+    # Requests
+    # --------------------------------------------
+    def _post(self, skus: list, qty: int):
+        url = f"{self.base}{SIMULATION_PATH}"
+        payload = {
+            "items": [{"id": str(sku), "quantity": int(qty), "seller": self.seller} for sku in skus],
+            "country": self.country,
+        }
+        r = self.session.post(url, headers=self.headers, params=self.params, json=payload, timeout=self.timeout)
+        with self._lock:
+            if len(skus) > 1:
+                self.requests_batch += 1
+            else:
+                self.requests_single += 1
+        if r.status_code != 200:
+            return None
+        try:
+            return r.json()
+        except Exception:
+            return None
+
+    def _simulate_one(self, sku: str, qty: int):
+        fallos = reintentos.fallos()
+        sim = self._post([sku], qty)
+        if reintentos.fallos() == fallos:
+            with self._lock:
+                self._sims[(sku, qty)] = sim
+        return sim
+
+    # --------------------------------------------
+    # Reparto por SKU
+    # --------------------------------------------
+    @staticmethod
+    def split(sim: dict, skus: list):
+        """
+        Reparte una simulación de varios SKUs. Devuelve {sku: sim_json}, con None para los
+        SKUs con una promo cruzada (identifier de varios requestIndex: hay que simularlos
+        solos), o None si hay beneficios/mensajes de carrito que no apuntan a ningún item.
+        """
+        if not isinstance(sim, dict):
+            return None
+        n = len(skus)
+        items_por_idx = {i: [] for i in range(n)}
+        for pos, it in enumerate(sim.get("items") or []):
+            if not isinstance(it, dict):
+                continue
+            idx = it.get("requestIndex")
+            if not isinstance(idx, int):
+                # Sin requestIndex: por id (primer pedido con ese SKU)
+                sku = str(it.get("id") or "")
+                idx = skus.index(sku) if sku in skus else None
+            if idx is None or idx not in items_por_idx:
+                return None
+            items_por_idx[idx].append(it)
+
+        # identifier -> requestIndex de los items que lo llevan en priceTags
+        tags_por_id = {}
+        for idx, its in items_por_idx.items():
+            for it in its:
+                for tag in (it.get("priceTags") or []):
+                    ident = str((tag or {}).get("identifier") or "")
+                    if ident:
+                        tags_por_id.setdefault(ident, set()).add(idx)
+
+        # Promo cruzada: sus priceTags (y el precio del item) dependen de los otros items del lote
+        cruzados = set().union(*(idxs for idxs in tags_por_id.values() if len(idxs) > 1))
+
+        rbd = sim.get("ratesAndBenefitsData") or {}
+        ids_por_idx = {i: [] for i in range(n)}
+        for ident in (rbd.get("rateAndBenefitsIdentifiers") or []):
+            idxs = tags_por_id.get(str((ident or {}).get("id") or ""), set())
+            if not idxs:
+                return None
+            if len(idxs) == 1:
+                ids_por_idx[next(iter(idxs))].append(ident)
+
+        msgs_por_idx = {i: [] for i in range(n)}
+        for msg in (sim.get("messages") or []):
+            idx = _message_index(msg)
+            if idx not in msgs_por_idx:
+                return None
+            msgs_por_idx[idx].append(msg)
+
+        out = {}
+        for idx, sku in enumerate(skus):
+            if idx in cruzados:
+                out[sku] = None
+                continue
+            out[sku] = {
+                "items": items_por_idx[idx],
+                "messages": msgs_por_idx[idx],
+                "ratesAndBenefitsData": {"rateAndBenefitsIdentifiers": ids_por_idx[idx]},
+            }
+        return out
+
+    def _simulate_chunk(self, chunk: list, qty: int):
+        partes = self.split(self._post(chunk, qty), chunk)
+        if partes is None:
+            # Promo de carrito (o lote fallido): se resuelve SKU por SKU
+            with self._lock:
+                self.lotes_carrito += 1
+            for sku in chunk:
+                self._simulate_one(sku, qty)
+            return
+        solos = [sku for sku, sim in partes.items() if sim is None]
+        with self._lock:
+            self.skus_cruzados += len(solos)
+            for sku, sim in partes.items():
+                if sim is not None:
+                    self._sims[(sku, qty)] = sim
+        for sku in solos:
+            self._simulate_one(sku, qty)
+
+    def simulate_jobs(self, skus, qtys=(1,)):
+        """Jobs (host, fn, fallback): un POST por lote y por cantidad."""
+        uniq = list(dict.fromkeys(str(k).strip() for k in skus if str(k or "").strip()))
+        self.keys_total += len(uniq) * len(qtys)
+        if self.batch_size <= 1:
+            return []
+        host = motor.host_of(self.base)
+        chunks = [uniq[i:i + self.batch_size] for i in range(0, len(uniq), self.batch_size)]
+        # Un lote que falla deja sus SKUs para la simulación individual de get()
+        return [(host, (lambda c=c, q=q: self._simulate_chunk(c, q)), None) for q in qtys for c in chunks]
+
+    def simulate(self, skus, qtys=(1,), concurrencia: int = motor.DEFAULT_CONCURRENCIA):
+        motor.run_jobs(self.simulate_jobs(skus, qtys), limite_por_host=concurrencia)
+        return self
+
+    # --------------------------------------------
+    # Lookup
+    # --------------------------------------------
+    def get(self, sku, qty: int = 1):
+        sku = str(sku or "").strip()
+        if not sku:
+            return None
+        with self._lock:
+            if (sku, qty) in self._sims:
+                return self._sims[(sku, qty)]
+        return self._simulate_one(sku, qty)
+
+    # --------------------------------------------
+    # Resumen
+    # --------------------------------------------
+    @property
+    def requests_total(self) -> int:
+        return self.requests_batch + self.requests_single
+
+    @property
+    def requests_saved(self) -> int:
+        return max(0, self.keys_total - self.requests_total)
+
+    def resumen(self) -> str:
+        return (
+            f"Simulación: {self.requests_total} requests ({self.requests_batch} en lote de hasta {self.batch_size}"
+            f" + {self.requests_single} individuales, {self.lotes_carrito} lotes con promo de carrito,"
+            f" {self.skus_cruzados} SKUs con promo cruzada)"
+            f" para {self.keys_total} simulaciones · ahorro {self.requests_saved} requests"
+        )
+
+
+# ============================================
+# search-promotions en lote (Jumbo / Vea)
+# ============================================
+PROMOTIONS_PATH = "/_v/search-promotions"
+
+
+def split_promotions(resp_json, skus) -> dict:
+    """
+    Reparte una respuesta de search-promotions por SKU en una sola pasada por los buckets.
+    Cada SKU recibe un json con la misma forma que la respuesta individual:
+    {"promotions": {bucket: {"promotions": {sku: {...}}}}} (solo los buckets donde aparece).
+    """
+    out = {str(sku): {"promotions": {}} for sku in skus}
+    promotions = (resp_json or {}).get("promotions") if isinstance(resp_json, dict) else None
+    if not isinstance(promotions, dict):
+        return out
+    for bucket_name, bucket in promotions.items():
+        bpromos = (bucket or {}).get("promotions") if isinstance(bucket, dict) else None
+        if not isinstance(bpromos, dict):
+            continue
+        for sku, promo in bpromos.items():
+            sku = str(sku)
+            if sku in out:
+                out[sku]["promotions"][bucket_name] = {"promotions": {sku: promo}}
+    return out
+
+
+class VtexBatchPromotions:
+    """
+    search-promotions con muchos SKUs por POST.
+
+    lookup(sku) devuelve el json de promos de ese SKU (ver split_promotions), así los
+    parsers que ya indexan por SKU (parse_promo / _extract_offer_from_promotions_json)
+    siguen igual. Si el lote no lo cubrió, llama a `single(sku)`.
+    """
+
+    def __init__(self, session, base: str, seller: str, single=None, headers: dict = None,
+                 batch_size: int = 40, timeout=(4, 18)):
+        self.session = session
+        self.base = base.rstrip("/")
+        self.seller = seller
+        self.single = single
+        self.headers = headers or {}
+        self.batch_size = max(1, min(int(batch_size or 1), MAX_LOTE))
+        self.timeout = timeout
+
+        self._promos = {}
+        self._lock = threading.Lock()
+        self.keys_total = 0
+        self.requests_batch = 0
+        self.requests_single = 0
+
+    # --------------------------------------------
+    # Prefetch
+    # --------------------------------------------
+    def _fetch_chunk(self, chunk: list):
+        url = f"{self.base}{PROMOTIONS_PATH}"
+        payload = {"seller": self.seller, "skus": list(chunk)}
+        r = self.session.post(url, headers=self.headers, json=payload, timeout=self.timeout)
+        with self._lock:
+            self.requests_batch += 1
+        r.raise_for_status()
+        partes = split_promotions(r.json(), chunk)
+        with self._lock:
+            self._promos.update(partes)
+
+    def prefetch_jobs(self, skus):
+        """Jobs (host, fn, fallback) para combinar con otros lotes en una corrida del motor."""
+        uniq = list(dict.fromkeys(str(k).strip() for k in skus if str(k or "").strip()))
+        self.keys_total += len(uniq)
+        if self.batch_size <= 1:
+            return []
+        host = motor.host_of(self.base)
+        chunks = [uniq[i:i + self.batch_size] for i in range(0, len(uniq), self.batch_size)]
+        # Si un lote falla, sus SKUs quedan para la consulta individual
+        return [(host, (lambda c=c: self._fetch_chunk(c)), None) for c in chunks]
+
+    def prefetch(self, skus, concurrencia: int = motor.DEFAULT_CONCURRENCIA):
+        motor.run_jobs(self.prefetch_jobs(skus), limite_por_host=concurrencia)
+        return self
+
+    # --------------------------------------------
+    # Lookup
+    # --------------------------------------------
+    def lookup(self, sku):
+        sku = str(sku or "").strip()
+        with self._lock:
+            resp = self._promos.get(sku)
+        if resp is not None:
+            return resp
+        if self.single is None:
+            return {}
+        with self._lock:
+            self.requests_single += 1
+        return self.single(sku)
+
+    # --------------------------------------------
+    # Resumen
+    # --------------------------------------------
+    @property
+    def requests_total(self) -> int:
+        return self.requests_batch + self.requests_single
+
+    @property
+    def requests_saved(self) -> int:
+        return max(0, self.keys_total - self.requests_total)
+
+    def resumen(self) -> str:
+        return (
+            f"Promos: {self.requests_total} requests ({self.requests_batch} en lote de hasta {self.batch_size}"
+            f" + {self.requests_single} individuales) para {self.keys_total} SKUs"
+            f" · ahorro {self.requests_saved} requests"
+        )
+
+
+# ============================================
+# Pool de orderForms (checkout)
+# ============================================
+ORDERFORM_PATH = "/api/checkout/pub/orderForm"
+# Cada cuánto un worker que espera un carrito libre mira si la corrida se canceló
+ESPERA_CARRITO_S = 0.25
+
+
+class OrderFormPool:
+    """
+    Carritos de checkout reutilizables (uno por request en vuelo, hasta `size`). Se crean a demanda:
+    el pool acompaña a la ventana AIMD del host, que puede crecer hasta motor.MAX_CONCURRENCIA.
+
+    - set_item(cart, sku, seller, qty): deja el carrito con ESE item solamente.
+      En un carrito usado hace PUT /items (reemplaza lo que había); en uno nuevo, POST.
+    - update_qty(cart, index, qty): POST /items/update.
+    - Un carrito que responde error o que no quedó limpio (vencido, roto) se recicla:
+      se crea un orderForm nuevo en su lugar y se reintenta una vez.
+    """
+
+    def __init__(self, session, base: str, headers: dict = None, size: int = motor.MAX_CONCURRENCIA,
+                 timeout=(3, 20)):
+        self.session = session
+        self.base = base.rstrip("/")
+        self.headers = headers or {}
+        self.size = max(1, int(size or 1))
+        self.timeout = timeout
+
+        self._libres = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._vivos = 0
+        self.creados = 0
+        self.reciclados = 0
+        self.usos = 0
+
+    # --------------------------------------------
+    # Carritos
+    # --------------------------------------------
+    def _crear(self) -> str:
+        r = self.session.post(f"{self.base}{ORDERFORM_PATH}", headers=self.headers, json={}, timeout=self.timeout)
+        with self._lock:
+            self.creados += 1
+        r.raise_for_status()
+        of_id = (r.json() or {}).get("orderFormId")
+        if not of_id:
+            raise ValueError("orderForm sin orderFormId")
+        return of_id
+
+    def _reciclar(self, cart: dict):
+        with self._lock:
+            self.reciclados += 1
+        cart["id"] = self._crear()
+        cart["usado"] = False
+
+    def _acquire(self) -> dict:
+        while True:
+            try:
+                return self._libres.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                crear = self._vivos < self.size
+                if crear:
+                    self._vivos += 1
+            if crear:
+                try:
+                    return {"id": self._crear(), "usado": False}
+                except Exception:
+                    with self._lock:
+                        self._vivos -= 1
+                    raise
+            # Todos en uso: esperar uno, sin quedar colgado si la corrida se cancela
+            motor.chequear_cancelacion()
+            try:
+                return self._libres.get(timeout=ESPERA_CARRITO_S)
+            except queue.Empty:
+                pass
+
+    @contextmanager
+    def carrito(self):
+        cart = self._acquire()
+        with self._lock:
+            self.usos += 1
+        try:
+            yield cart
+        except Exception:
+            # Carrito en estado dudoso: el próximo uso lo recrea
+            cart["roto"] = True
+            raise
+        finally:
+            self._libres.put(cart)
+
+    # --------------------------------------------
+    # Items
+    # --------------------------------------------
+    def _post_items(self, cart: dict, method: str, payload: dict):
+        url = f"{self.base}{ORDERFORM_PATH}/{cart['id']}/items"
+        r = self.session.request(method, url, headers=self.headers, json=payload, timeout=self.timeout)
+        r.raise_for_status()
+        return r.json()
+
+    def set_item(self, cart: dict, sku_id: str, seller_id: str, qty: int):
+        payload = {"orderItems": [{"id": str(sku_id), "quantity": int(qty), "seller": str(seller_id)}]}
+        if cart.pop("roto", False):
+            self._reciclar(cart)
+
+        if cart["usado"]:
+            try:
+                of = self._post_items(cart, "PUT", payload)
+                ids = {str(it.get("id") or "") for it in (of.get("items") or [])}
+                if ids <= {str(sku_id)}:
+                    return of
+            except Exception:
+                pass
+            # Vencido / roto / con restos de otro producto
+            self._reciclar(cart)
+
+        of = self._post_items(cart, "POST", payload)
+        cart["usado"] = True
+        return of
+
+    def update_qty(self, cart: dict, index: int, qty: int):
+        url = f"{self.base}{ORDERFORM_PATH}/{cart['id']}/items/update"
+        payload = {"orderItems": [{"index": int(index), "quantity": int(qty)}]}
+        r = self.session.post(url, headers=self.headers, json=payload, timeout=self.timeout)
+        r.raise_for_status()
+        return r.json()
+
+    # --------------------------------------------
+    # Resumen
+    # --------------------------------------------
+    def resumen(self) -> str:
+        return (
+            f"Checkout: {self.usos} productos con {self.creados} orderForms creados"
+            f" (pool de {self._vivos}, {self.reciclados} reciclados)"
+            f" · ahorro {max(0, self.usos - self.creados)} requests"
+        )
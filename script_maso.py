@@ -1,10 +1,15 @@
 # changomas_ean_to_refid.py
+import os
+import sys
 import requests
 import csv
 from datetime import datetime
 
-# Carga tus productos ({"Nombre": {"ean": "...", ...}, ...})
-from ean_mercado import productos_mercado
+# Carga tus productos ({"Nombre": {"ean": "...", ...}, ...}) desde el catálogo único
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "scraping_precios"))
+from catalogo import compartido
+
+productos_mercado = compartido().vista("ean_mercado")
 
 BASE = "https://www.masonline.com.ar"
 HEADERS = {